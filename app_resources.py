@@ -0,0 +1,47 @@
+"""Runtime registration of the compiled Qt resources."""
+
+import logging
+import os
+import sys
+
+from version import NAME
+
+# binary resources compiled from resources.qrc, see the Makefile res target
+RESOURCE_FILE = 'resources.rcc'
+
+_registered = set()
+
+
+def resource_path(filename):
+    """Return the path of a file shipped next to the application, or in
+    the PyInstaller bundle directory.
+
+    Args:
+        filename (str): file name
+
+    Returns:
+        str: the absolute path
+    """
+    base = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base, filename)
+
+
+def register_resources(filename=RESOURCE_FILE):
+    """Register a binary .rcc file so that its files are available as
+    ":alias" paths, PySide6 is only imported here.
+
+    Args:
+        filename (str, optional): the .rcc file. Defaults to RESOURCE_FILE.
+
+    Returns:
+        bool: True if the resources are registered
+    """
+    path = resource_path(filename)
+    if path in _registered:
+        return True
+    from PySide6.QtCore import QResource
+    if not QResource.registerResource(path):
+        logging.getLogger(NAME).warning(f"Unable to register the Qt resources {path}")
+        return False
+    _registered.add(path)
+    return True
@@ -0,0 +1,73 @@
+"""Headless batch simulation of mooring designs, never imports PySide6."""
+
+import logging
+import os
+
+from library_cache import LibraryCache
+from library_model import ComponentLibrary
+from design_file import open_design
+from mooring_design import DesignError
+from simulation import simulate
+from solver import ACCURACY, SolverError
+from version import NAME
+
+
+def run_batch(library_file, design_files, output_dir=None, cache=None, accuracy=ACCURACY,
+              workers=1):
+    """Load the library once, then simulate each design and write its
+    results as <design>.csv.
+
+    Args:
+        library_file (str): the Excel library file
+        design_files (list): the toml, .mdf or JSON design files
+        output_dir (str, optional): directory of the csv files. Defaults to
+        the directory of each design file.
+        cache (LibraryCache, optional): on-disk cache of converted
+        libraries. Defaults to the user cache.
+        accuracy (float, optional): target shape error of the rope
+        segments, in m. Defaults to ACCURACY.
+        workers (int, optional): processes converting the library
+        worksheets. Defaults to 1.
+
+    Returns:
+        int: the process exit status, 0 if every design was simulated and
+        passed its checks, 1 if one failed, 2 if none could be run
+    """
+    logger = logging.getLogger(NAME)
+    try:
+        library = ComponentLibrary.from_file(
+            library_file, cache=cache if cache is not None else LibraryCache(), workers=workers)
+    except Exception as ex:
+        logger.error(f"Unable to load library {library_file}: {ex}")
+        return 2
+    # excel2json logs an unreadable workbook and returns no sheet
+    if not len(library):
+        logger.error(f"Unable to load library {library_file}: no component")
+        return 2
+    if output_dir is not None:
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+        except OSError as ex:
+            logger.error(f"Unable to create the output directory {output_dir}: {ex}")
+            return 2
+
+    status = 0
+    for design_file in design_files:
+        directory = output_dir if output_dir is not None else os.path.dirname(design_file)
+        csv_file = os.path.join(
+            directory, os.path.splitext(os.path.basename(design_file))[0] + '.csv')
+        try:
+            result = simulate(open_design(design_file, library), accuracy=accuracy)
+            result.write_csv(csv_file)
+        except (DesignError, SolverError) as ex:
+            logger.error(str(ex))
+            status = 1
+            continue
+        except OSError as ex:
+            logger.error(f"Unable to write {csv_file}: {ex}")
+            status = 1
+            continue
+        logger.info(f"{result.summary()} -> {csv_file}")
+        if not result.ok:
+            status = 1
+    return status
@@ -52,6 +52,15 @@ class ConfigWindow(QWidget):
         # Create the stacked layout
         # self.stackedLayout = QStackedLayout()
 
+    @property
+    def config_dir(self):
+        """Getter to the user config directory
+
+        Returns:
+            str: the directory holding the toml file and the library cache
+        """
+        return self.__config_dir
+
     # overloading operators
     def __getitem__(self, key):
         ''' overload r[key] '''
@@ -143,6 +152,7 @@ class ConfigWindow(QWidget):
         echo    = true
         screen_width = 800
         screen_height = 600
+        recent_files = []  # last opened mooring designs
 
         [tools]
         name = 'tools/Angulate.xls'
@@ -151,6 +161,20 @@ class ConfigWindow(QWidget):
         reference = 'surface'  # or bottom
         bottom_depth = 0
         library = 'library/example.xls'
+
+        [library]
+        workers = 1  # processes converting the worksheets, 1 is sequential
+        release_after = 0  # seconds before a hidden worksheet table is released, 0 keeps them
+
+        [solver]
+        accuracy = 0.1  # m, target shape error of the adaptive rope segments
+
+        [theme]  # library spreadsheet colours
+        background = 'white'
+        text = 'black'
+        grid = 'black'
+        first_row = 'green'
+        first_column = 'red'
         """
         return toml.loads(toml_string)
 
@@ -1,5 +1,34 @@
 """
     This module defined some Qt styles
 """
+# object name of the worksheet tables and dynamic property of the
+# spreadsheet labels, the selectors of the application stylesheet
+SPREADSHEET_TABLE = 'spreadsheetTable'
+SPREADSHEET_PROPERTY = 'spreadsheet'
+
+# mooring design file dialogs, the binary format is written by default
+DESIGN_FILTER = "Mooring design (*.mdf *.toml *.json)"
+SAVE_FILTER = "Mooring design (*.mdf);;JSON export (*.json);;Mooring design toml (*.toml)"
+# designs listed in the Open Recent menu
+RECENT_FILES = 5
+
+# spreadsheet colours, cells are painted from the table model role data
+SPREADSHEET_THEME = {
+    'background': 'white',
+    'text': 'black',
+    'grid': 'black',
+    'first_row': 'green',
+    'first_column': 'red',
+}
+
+# style templates, formatted with a theme by theme.spreadsheet_stylesheet()
 STYLE_SPREADSHEET_TEXT = \
-    "QLabel { font: bold; background-color : white; color : black;border: 2px solid black }"
+    "QLabel[spreadsheet=\"true\"] {{ font: bold; background-color : {background}; " \
+    "color : {text};border: 2px solid {grid} }}"
+
+STYLE_SPREADSHEET_TABLE = \
+    "QTableView#spreadsheetTable {{ background-color : {background}; " \
+    "gridline-color : {grid}; border: 1px solid {grid} }}"
+STYLE_SPREADSHEET_HEADER = \
+    "QTableView#spreadsheetTable QHeaderView::section {{ font: bold; " \
+    "background-color : {background}; color : {text}; border: 1px solid {grid} }}"
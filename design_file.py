@@ -0,0 +1,404 @@
+"""Binary mooring design file, versioned and memory mappable.
+
+A .mdf file holds a design as references into the component library
+plus the attributes overridden by the design, and the solver inputs
+precomputed from the library, so it is simulated without converting the
+Excel library. Extra arrays, ie the results of a large sweep, are stored
+next to them and mapped on read instead of being loaded.
+
+Layout, little endian:
+
+    header      MAGIC, major and minor version, metadata length (HEADER)
+    metadata    utf-8 JSON: design, element references and array table
+    arrays      raw C ordered arrays, each aligned on ALIGNMENT bytes
+
+save_design() and open_design() also read and write the toml design
+files and the JSON interchange export of the .mdf files.
+"""
+
+import os
+import json
+import mmap
+import struct
+import logging
+import numpy as np
+import toml
+
+from mooring_design import (MooringDesign, Element, DesignError, load_design,
+                            LINEAR_SHEETS)
+from mooring_line import ComponentChain, ELEMENT_PROPERTIES
+from solver import CurrentProfile
+from version import NAME
+
+MAGIC = b'MOORDSGN'
+# a file of a newer major version can not be read, a newer minor version
+# only adds metadata keys or arrays, 1.1 scales the area of the elements
+# by their count, as their buoyancy
+FORMAT_VERSION = (1, 1)
+HEADER = struct.Struct('<8sHHQ')
+ALIGNMENT = 64
+
+DESIGN_EXTENSION = '.mdf'
+JSON_EXTENSION = '.json'
+TOML_EXTENSION = '.toml'
+
+# the precomputed solver inputs, component codes and chain properties
+CHAIN_ARRAYS = ('component',) + tuple(ELEMENT_PROPERTIES)
+CURRENT_ARRAYS = ('current_depth', 'current_speed')
+
+
+class DesignFileError(DesignError):
+    """Raised when a binary design file is invalid."""
+
+
+def _aligned(offset):
+    """Return the next multiple of ALIGNMENT"""
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _to_list(array):
+    """Return an array as a JSON list, non finite floats as 'inf' or 'nan'
+    strings read back by np.array()"""
+    if array.dtype.kind != 'f' or np.all(np.isfinite(array)):
+        return array.tolist()
+    data = array.astype(object)
+    data[~np.isfinite(array)] = array[~np.isfinite(array)].astype(str)
+    return data.tolist()
+
+
+class DesignFile:
+    """This class is the content of a binary design file: the JSON
+    metadata and the named arrays, memory mapped when read from a file.
+    """
+
+    def __init__(self, metadata, arrays, filename=None):
+        """DesignFile constructor, see from_design() and read()
+
+        Args:
+            metadata (dict): 'mooring', 'components' and 'elements' keys
+            arrays (dict): array name -> np.ndarray
+            filename (str, optional): the file read. Defaults to None.
+        """
+        self.metadata = metadata
+        self.arrays = arrays
+        self.filename = filename
+
+    def __repr__(self):
+        return (f"DesignFile({self.name!r}, {len(self.metadata['elements'])} elements, "
+                f"{len(self.arrays)} arrays)")
+
+    @property
+    def name(self):
+        """Getter to the design name"""
+        return self.metadata['mooring']['name']
+
+    @property
+    def version(self):
+        """Getter to the (major, minor) format version"""
+        return tuple(self.metadata.get('version', FORMAT_VERSION))
+
+    @property
+    def chain(self):
+        """Getter to the precomputed solver inputs as a ComponentChain"""
+        arrays = self.arrays
+        chain = ComponentChain(capacity=len(arrays['component']))
+        components = self.metadata['components']
+        chain.extend([components[code] for code in arrays['component'].tolist()],
+                     **{key: arrays[key] for key in ELEMENT_PROPERTIES})
+        return chain
+
+    def design(self, library=None):
+        """Build the mooring design
+
+        Args:
+            library (ComponentLibrary, optional): resolve the component
+            references in the library, as a toml design file. Defaults to
+            None, the elements then get their attributes from the
+            precomputed solver inputs.
+
+        Returns:
+            MooringDesign: the design
+        """
+        if library is not None:
+            return MooringDesign.from_dict(self.to_design_dict(), library, self.filename)
+        arrays = self.arrays
+        # the per element totals back to library attributes
+        per_unit = np.where(arrays['linear'], arrays['length'], arrays['count'])
+        per_unit = np.where(per_unit > 0, per_unit, 1.0)
+        elements = []
+        for row, item in enumerate(self.metadata['elements']):
+            attributes = {
+                'sheet': item['sheet'],
+                'name': item['component'],
+                'mass': float(arrays['buoyancy'][row] / per_unit[row]),
+                'projected_area': float(arrays['area'][row] / per_unit[row]),
+                'nl_drag_cf': float(arrays['normal_cf'][row]),
+                'tl_drag_cf': float(arrays['tangential_cf'][row]),
+                'breaking_strength': float(arrays['breaking_strength'][row]),
+            }
+            overrides = item.get('overrides', {})
+            attributes.update(overrides)
+            elements.append(Element(item['component'], item['sheet'], float(arrays['length'][row]),
+                                    int(arrays['count'][row]), attributes, overrides))
+        current = None
+        if 'current_speed' in arrays:
+            current = CurrentProfile(np.array(arrays['current_depth']),
+                                     np.array(arrays['current_speed']))
+        mooring = self.metadata['mooring']
+        return MooringDesign(mooring['name'], mooring['bottom_depth'], elements,
+                             self.filename, current)
+
+    def to_design_dict(self):
+        """Return the design as written in a toml design file"""
+        elements = []
+        for row, item in enumerate(self.metadata['elements']):
+            element = {'component': item['component']}
+            if item['sheet'] in LINEAR_SHEETS:
+                element['length'] = float(self.arrays['length'][row])
+            count = int(self.arrays['count'][row])
+            if count != 1:
+                element['count'] = count
+            element.update(item.get('overrides', {}))
+            elements.append(element)
+        design = {'mooring': dict(self.metadata['mooring']), 'element': elements}
+        if 'current_speed' in self.arrays:
+            design['current'] = {'depth': self.arrays['current_depth'].tolist(),
+                                 'speed': self.arrays['current_speed'].tolist()}
+        return design
+
+    def to_dict(self):
+        """Return the metadata and the arrays as lists, the JSON export"""
+        content = dict(self.metadata)
+        content['arrays'] = {key: {'dtype': array.dtype.str, 'data': _to_list(array)}
+                             for key, array in self.arrays.items()}
+        return content
+
+    @classmethod
+    def from_dict(cls, content, filename=None):
+        """Build a design file from its JSON export, see to_dict()"""
+        if not isinstance(content, dict):
+            raise DesignFileError(f"Invalid design export {filename}: not a JSON object")
+        try:
+            metadata = {key: value for key, value in content.items() if key != 'arrays'}
+            arrays = {key: np.array(array['data'], dtype=array['dtype'])
+                      for key, array in content['arrays'].items()}
+        except (KeyError, TypeError, ValueError) as ex:
+            raise DesignFileError(f"Invalid design export {filename}: {ex}") from ex
+        design_file = cls(metadata, arrays, filename)
+        design_file.check()
+        design_file.upgrade()
+        return design_file
+
+    @classmethod
+    def from_design(cls, design, arrays=None):
+        """Build the design file of a design
+
+        Args:
+            design (MooringDesign): the design
+            arrays (dict, optional): extra named arrays stored with the
+            design, ie sweep results. Defaults to None.
+
+        Returns:
+            DesignFile: the design file
+        """
+        chain = ComponentChain.from_design(design)
+        components = list(dict.fromkeys(chain.names))
+        codes = {name: code for code, name in enumerate(components)}
+        stored = {'component': np.array([codes[name] for name in chain.names], dtype=np.int32)}
+        stored.update((key, np.array(chain[key])) for key in ELEMENT_PROPERTIES)
+        if design.current is not None:
+            stored['current_depth'] = design.current.depths
+            stored['current_speed'] = design.current.speeds
+        for key, array in (arrays or {}).items():
+            if key in CHAIN_ARRAYS + CURRENT_ARRAYS:
+                raise DesignFileError(f"Array {key} is reserved for the design")
+            stored[key] = np.asarray(array)
+        metadata = {
+            'version': list(FORMAT_VERSION),
+            'mooring': {'name': design.name, 'bottom_depth': design.bottom_depth},
+            'components': components,
+            'elements': [{'component': element.name, 'sheet': element.sheet,
+                          'overrides': element.overrides} for element in design],
+        }
+        return cls(metadata, stored, design.filename)
+
+    def check(self):
+        """Raise DesignFileError if the version, the metadata or the arrays
+        are invalid"""
+        metadata = self.metadata
+        if not isinstance(metadata, dict):
+            raise DesignFileError(f"Design file {self.filename} metadata is not a JSON object")
+        if self.version[0] != FORMAT_VERSION[0]:
+            raise DesignFileError(
+                f"Design file {self.filename} version {self.version[0]}.{self.version[1]} "
+                f"is not supported, expected {FORMAT_VERSION[0]}.x")
+        mooring = metadata.get('mooring')
+        if not isinstance(mooring, dict) or not {'name', 'bottom_depth'} <= mooring.keys():
+            raise DesignFileError(
+                f"Design file {self.filename} misses the mooring name or bottom_depth")
+        components, elements = metadata.get('components'), metadata.get('elements')
+        if not isinstance(components, list) or not isinstance(elements, list):
+            raise DesignFileError(f"Design file {self.filename} misses its components or elements")
+        for position, item in enumerate(elements, start=1):
+            if not isinstance(item, dict) or not {'component', 'sheet'} <= item.keys():
+                raise DesignFileError(
+                    f"Design file {self.filename} element {position} misses its component or sheet")
+        missing = [key for key in CHAIN_ARRAYS if key not in self.arrays]
+        if missing:
+            raise DesignFileError(f"Design file {self.filename} misses {', '.join(missing)}")
+        count = len(elements)
+        if any(len(self.arrays[key]) != count for key in CHAIN_ARRAYS):
+            raise DesignFileError(f"Design file {self.filename} arrays are not of "
+                                  f"{count} elements")
+        codes = self.arrays['component']
+        if count and (codes.min() < 0 or codes.max() >= len(components)):
+            raise DesignFileError(f"Design file {self.filename} has unknown component codes")
+
+    def upgrade(self):
+        """Convert the arrays of an older minor version to FORMAT_VERSION"""
+        if self.version >= FORMAT_VERSION:
+            return
+        arrays = self.arrays
+        if self.version < (1, 1):
+            arrays['area'] = np.where(arrays['linear'], arrays['area'],
+                                      arrays['area'] * arrays['count'])
+        self.metadata['version'] = list(FORMAT_VERSION)
+
+    def write(self, filename):
+        """Write the binary design file
+
+        Args:
+            filename (str): the .mdf file
+        """
+        table, offset = {}, 0
+        arrays = {key: np.ascontiguousarray(array) for key, array in self.arrays.items()}
+        for key, array in arrays.items():
+            if array.dtype.hasobject:
+                raise DesignFileError(f"Array {key} of {array.dtype} can not be stored")
+            table[key] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+            offset = _aligned(offset + array.nbytes)
+        metadata = dict(self.metadata, arrays=table)
+        metadata['version'] = list(FORMAT_VERSION)
+        text = json.dumps(metadata, separators=(',', ':')).encode('utf-8')
+        start = _aligned(HEADER.size + len(text))
+        with open(filename, 'wb') as fid:
+            fid.write(HEADER.pack(MAGIC, FORMAT_VERSION[0], FORMAT_VERSION[1], len(text)))
+            fid.write(text)
+            for key, array in arrays.items():
+                fid.seek(start + table[key]['offset'])
+                fid.write(array.tobytes())
+            # a trailing empty array still lies in the file
+            fid.truncate(max(fid.tell(), start + offset))
+        self.filename = filename
+
+    @classmethod
+    def read(cls, filename, mmap_mode=True):
+        """Read a binary design file
+
+        Args:
+            filename (str): the .mdf file
+            mmap_mode (bool, optional): map the arrays, read-only, instead
+            of reading them. Defaults to True.
+
+        Returns:
+            DesignFile: the design file
+        """
+        try:
+            with open(filename, 'rb') as fid:
+                magic, major, minor, size = HEADER.unpack(fid.read(HEADER.size))
+                if magic != MAGIC:
+                    raise DesignFileError(f"{filename} is not a mooring design file")
+                metadata = json.loads(fid.read(size).decode('utf-8'))
+                if not isinstance(metadata, dict):
+                    raise DesignFileError(f"{filename} metadata is not a JSON object")
+                start = _aligned(HEADER.size + size)
+                if mmap_mode:
+                    buffer = mmap.mmap(fid.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    fid.seek(0)
+                    buffer = fid.read()
+        except (OSError, struct.error, ValueError) as ex:
+            raise DesignFileError(f"Unable to read design file {filename}: {ex}") from ex
+        metadata['version'] = [major, minor]
+        arrays = {}
+        try:
+            for key, item in metadata.pop('arrays').items():
+                dtype = np.dtype(item['dtype'])
+                count = int(np.prod(item['shape']))
+                arrays[key] = np.frombuffer(buffer, dtype, count,
+                                            start + item['offset']).reshape(item['shape'])
+        except (KeyError, TypeError, ValueError) as ex:
+            raise DesignFileError(f"Invalid array table in {filename}: {ex}") from ex
+        design_file = cls(metadata, arrays, filename)
+        design_file.check()
+        design_file.upgrade()
+        logging.getLogger(NAME).debug(f"Design file {filename} read, {len(arrays)} arrays")
+        return design_file
+
+    def export_json(self, filename):
+        """Write the JSON interchange export of the design file
+
+        Args:
+            filename (str): the .json file
+        """
+        with open(filename, 'w', encoding='utf-8') as fid:
+            json.dump(self.to_dict(), fid, indent=1, allow_nan=False)
+
+
+def read_design_file(filename):
+    """Read a .mdf design file or its JSON export
+
+    Args:
+        filename (str): the .mdf or .json file
+
+    Returns:
+        DesignFile: the design file
+    """
+    if os.path.splitext(filename)[1].lower() != JSON_EXTENSION:
+        return DesignFile.read(filename)
+    try:
+        with open(filename, encoding='utf-8') as fid:
+            content = json.load(fid)
+    except (OSError, ValueError) as ex:
+        raise DesignFileError(f"Unable to read design file {filename}: {ex}") from ex
+    return DesignFile.from_dict(content, filename)
+
+
+def open_design(filename, library=None):
+    """Read a mooring design from a toml, .mdf or JSON export file
+
+    Args:
+        filename (str): the design file
+        library (ComponentLibrary, optional): the component library,
+        required by the toml files. Defaults to None.
+
+    Returns:
+        MooringDesign: the design
+    """
+    if os.path.splitext(filename)[1].lower() == TOML_EXTENSION:
+        if library is None:
+            raise DesignError(f"Design file {filename} needs a component library")
+        return load_design(filename, library)
+    design = read_design_file(filename).design(library)
+    design.filename = filename
+    return design
+
+
+def save_design(filename, design, arrays=None):
+    """Write a mooring design, its format is given by the file extension
+
+    Args:
+        filename (str): the .mdf, .json or .toml file
+        design (MooringDesign): the design
+        arrays (dict, optional): extra named arrays of the .mdf and JSON
+        files. Defaults to None.
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == TOML_EXTENSION:
+        with open(filename, 'w', encoding='utf-8') as fid:
+            toml.dump(design.to_dict(), fid)
+    elif extension == JSON_EXTENSION:
+        DesignFile.from_design(design, arrays).export_json(filename)
+    else:
+        DesignFile.from_design(design, arrays).write(filename)
+    design.filename = filename
@@ -0,0 +1,304 @@
+"""Undo and redo of the edits of a mooring design.
+
+The history records each edit of the editor ElementList as a small
+command holding only what the edit changed: the id, position and element
+of an insertion or deletion, the old and new positions of a move, the old
+and new values of the updated attributes. The elements themselves are
+shared with the list, never copied, so the history of a long session
+stays within a memory budget, the oldest commands being dropped first.
+"""
+
+import sys
+import logging
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager
+
+from version import NAME
+
+# default memory budget of the undo history, in bytes
+MEMORY_BUDGET = 4 * 1024 * 1024
+# the value of an attribute missing before an update
+MISSING = object()
+
+
+def _sizeof(value):
+    """Estimate the bytes held by a value, one container level deep"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(sys.getsizeof(key) + sys.getsizeof(item) for key, item in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(sys.getsizeof(item) for item in value)
+    return size
+
+
+class Command(ABC):
+    """An edit of an ElementList, applied and reverted in place."""
+
+    # estimated size when recorded, added and removed as is by the history
+    # even if a shared element grows with later updates
+    __slots__ = ('size',)
+    label = ''
+
+    @abstractmethod
+    def apply(self, elements):
+        """Do the edit"""
+
+    @abstractmethod
+    def revert(self, elements):
+        """Undo the edit"""
+
+    @property
+    def nbytes(self):
+        """Getter to the estimated memory held by the command"""
+        return sys.getsizeof(self)
+
+
+class Insert(Command):
+    """Insertion of an element below another one."""
+
+    __slots__ = ('element_id', 'after', 'data')
+    label = 'insert'
+
+    def __init__(self, element_id, after, data):
+        self.element_id = element_id
+        self.after = after
+        self.data = data
+
+    def apply(self, elements):
+        elements.insert(self.data, self.after, self.element_id)
+
+    def revert(self, elements):
+        elements.delete(self.element_id)
+
+    @property
+    def nbytes(self):
+        """Getter to the estimated memory held by the command, with the
+        element shared with the list until it is deleted"""
+        return sys.getsizeof(self) + _sizeof(self.data)
+
+
+class Delete(Insert):
+    """Deletion of an element, the insertion reverted."""
+
+    __slots__ = ()
+    label = 'delete'
+
+    def apply(self, elements):
+        Insert.revert(self, elements)
+
+    def revert(self, elements):
+        Insert.apply(self, elements)
+
+
+class Move(Command):
+    """Move of an element below another one."""
+
+    __slots__ = ('element_id', 'before', 'after')
+    label = 'move'
+
+    def __init__(self, element_id, before, after):
+        self.element_id = element_id
+        self.before = before
+        self.after = after
+
+    def apply(self, elements):
+        elements.move_after(self.element_id, self.after)
+
+    def revert(self, elements):
+        elements.move_after(self.element_id, self.before)
+
+
+class Update(Command):
+    """Change of some attributes of an element."""
+
+    __slots__ = ('element_id', 'old', 'new')
+    label = 'update'
+
+    def __init__(self, element_id, old, new):
+        self.element_id = element_id
+        self.old = old
+        self.new = new
+
+    def __set(self, elements, values):
+        data = elements[self.element_id]
+        for key, value in values.items():
+            if value is MISSING:
+                data.pop(key, None)
+            else:
+                data[key] = value
+
+    def apply(self, elements):
+        self.__set(elements, self.new)
+
+    def revert(self, elements):
+        self.__set(elements, self.old)
+
+    @property
+    def nbytes(self):
+        """Getter to the estimated memory held by the command"""
+        return sys.getsizeof(self) + _sizeof(self.old) + _sizeof(self.new)
+
+
+class Group(Command):
+    """Several commands undone and redone as one, ie a paste."""
+
+    __slots__ = ('commands', 'label')
+
+    def __init__(self, commands, label):
+        self.commands = commands
+        self.label = label
+
+    def apply(self, elements):
+        for command in self.commands:
+            command.apply(elements)
+
+    def revert(self, elements):
+        for command in reversed(self.commands):
+            command.revert(elements)
+
+    @property
+    def nbytes(self):
+        """Getter to the estimated memory held by the commands"""
+        return _sizeof(self.commands) + sum(command.nbytes for command in self.commands)
+
+
+class EditHistory:
+    """This class edits an ElementList and records the undo history.
+
+    The elements are dictionaries, as the [[element]] array of a design
+    file. Every edit goes through the history, a new edit clears the redo
+    commands.
+    """
+
+    def __init__(self, elements, budget=MEMORY_BUDGET):
+        """EditHistory constructor
+
+        Args:
+            elements (ElementList): the edited elements
+            budget (int, optional): memory budget of the undo and redo
+            commands in bytes. Defaults to MEMORY_BUDGET.
+        """
+        self.__logger = logging.getLogger(NAME)
+        self.elements = elements
+        self.budget = budget
+        self._undo = deque()
+        self._redo = []
+        self._nbytes = 0
+        self._group = None
+
+    def __len__(self):
+        return len(self._undo)
+
+    @property
+    def nbytes(self):
+        """Getter to the estimated memory held by the history, in bytes"""
+        return self._nbytes
+
+    @property
+    def can_undo(self):
+        """Getter, True if an edit can be undone"""
+        return bool(self._undo)
+
+    @property
+    def can_redo(self):
+        """Getter, True if an undone edit can be redone"""
+        return bool(self._redo)
+
+    def __push(self, command):
+        """Record an applied command, drop the redo and the oldest commands"""
+        if self._group is not None:
+            self._group.append(command)
+            return
+        for redo in self._redo:
+            self._nbytes -= redo.size
+        self._redo.clear()
+        command.size = command.nbytes
+        self._undo.append(command)
+        self._nbytes += command.size
+        while self._nbytes > self.budget and len(self._undo) > 1:
+            self._nbytes -= self._undo.popleft().size
+        if self._nbytes > self.budget:
+            self.__logger.warning(f"The {command.label} edit exceeds the undo budget")
+
+    @contextmanager
+    def group(self, label):
+        """Record the edits of the block as one undo step
+
+        Args:
+            label (str): name of the step, ie 'paste'
+        """
+        if self._group is not None:
+            yield
+            return
+        self._group = []
+        try:
+            yield
+        finally:
+            commands, self._group = self._group, None
+            if commands:
+                self.__push(Group(commands, label))
+
+    def insert(self, data, after=None):
+        """Insert an element below another one, None inserts at the top,
+        return its id."""
+        element_id = self.elements.insert(data, after)
+        self.__push(Insert(element_id, after, data))
+        return element_id
+
+    def append(self, data):
+        """Insert an element at the bottom, return its id."""
+        return self.insert(data, self.elements.last())
+
+    def delete(self, element_id):
+        """Remove an element, return it."""
+        after = self.elements.previous(element_id)
+        data = self.elements.delete(element_id)
+        self.__push(Delete(element_id, after, data))
+        return data
+
+    def move(self, element_id, after=None):
+        """Move an element below another one, None moves to the top."""
+        before = self.elements.previous(element_id)
+        if after == element_id or after == before:
+            return
+        self.elements.move_after(element_id, after)
+        self.__push(Move(element_id, before, after))
+
+    def update(self, element_id, **values):
+        """Change some attributes of an element, only the changes are
+        recorded."""
+        data = self.elements[element_id]
+        old = {key: data.get(key, MISSING) for key, value in values.items()
+               if data.get(key, MISSING) != value}
+        if not old:
+            return
+        new = {key: values[key] for key in old}
+        command = Update(element_id, old, new)
+        command.apply(self.elements)
+        self.__push(command)
+
+    def undo(self):
+        """Undo the last edit, return its label, None if there is none."""
+        if not self._undo:
+            return None
+        command = self._undo.pop()
+        command.revert(self.elements)
+        self._redo.append(command)
+        return command.label
+
+    def redo(self):
+        """Redo the last undone edit, return its label, None if there is
+        none."""
+        if not self._redo:
+            return None
+        command = self._redo.pop()
+        command.apply(self.elements)
+        self._undo.append(command)
+        return command.label
+
+    def clear(self):
+        """Forget the history, ie when the design is saved"""
+        self._undo.clear()
+        self._redo.clear()
+        self._nbytes = 0
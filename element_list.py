@@ -0,0 +1,228 @@
+"""Linked list of the elements of a mooring line, for interactive editing.
+
+The production version of tools/dll.py Sentinel_DLL: a circular doubly
+linked list with a sentinel whose nodes have __slots__, so a drag and drop
+moves an element by relinking two nodes. Every element gets an id and a
+dict from id to node gives O(1) handle lookup. ComponentChain, the array
+backed line of the solver, is built from the list with to_chain().
+"""
+
+from mooring_line import ComponentChain, ELEMENT_PROPERTIES
+
+
+class ElementNode:
+    """A node of an ElementList, without per instance __dict__."""
+
+    __slots__ = ('id', 'data', 'prev', 'next')
+
+    def __init__(self, element_id, data):
+        self.id = element_id
+        self.data = data
+        self.prev = None
+        self.next = None
+
+    def __repr__(self):
+        return f"ElementNode({self.id}, {self.data!r})"
+
+
+class ElementList:
+    """This class is a circular doubly linked list with a sentinel, its
+    elements are addressed by the ids returned when they are inserted.
+    """
+
+    def __init__(self, iterable=()):
+        """ElementList constructor
+
+        Args:
+            iterable (iterable, optional): the initial elements, from the
+            top of the line. Defaults to ().
+        """
+        self._sentinel = ElementNode(None, None)
+        self._sentinel.prev = self._sentinel.next = self._sentinel
+        self._nodes = {}
+        self._next_id = 0
+        for data in iterable:
+            self.append(data)
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, element_id):
+        return element_id in self._nodes
+
+    def __getitem__(self, element_id):
+        ''' overloading operators elements[id]'''
+        return self._nodes[element_id].data
+
+    def __setitem__(self, element_id, data):
+        self._nodes[element_id].data = data
+
+    def __iter__(self):
+        sentinel = self._sentinel
+        node = sentinel.next
+        while node is not sentinel:
+            yield node.data
+            node = node.next
+
+    def __reversed__(self):
+        sentinel = self._sentinel
+        node = sentinel.prev
+        while node is not sentinel:
+            yield node.data
+            node = node.prev
+
+    def __repr__(self):
+        return f"ElementList({self.to_list()!r})"
+
+    def __str__(self):
+        # formatted as a Python list in one pass, as Sentinel_DLL does
+        return str(self.to_list())
+
+    def ids(self):
+        """Return an iterator over the element ids, from the top"""
+        sentinel = self._sentinel
+        node = sentinel.next
+        while node is not sentinel:
+            yield node.id
+            node = node.next
+
+    def items(self):
+        """Return an iterator over the (id, element) pairs, from the top"""
+        sentinel = self._sentinel
+        node = sentinel.next
+        while node is not sentinel:
+            yield node.id, node.data
+            node = node.next
+
+    def node(self, element_id):
+        """Return the node of an element, raise KeyError if unknown."""
+        try:
+            return self._nodes[element_id]
+        except KeyError:
+            raise KeyError(f"Unknown element id {element_id}") from None
+
+    def first(self):
+        """Return the id of the top element, None if the list is empty."""
+        node = self._sentinel.next
+        return None if node is self._sentinel else node.id
+
+    def last(self):
+        """Return the id of the bottom element, None if the list is empty."""
+        node = self._sentinel.prev
+        return None if node is self._sentinel else node.id
+
+    def __link_after(self, node, before):
+        """Link a detached node after the node before"""
+        node.prev = before
+        node.next = before.next
+        before.next.prev = node
+        before.next = node
+
+    def __unlink(self, node):
+        """Detach a node from its neighbours"""
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = node.next = None
+
+    def __insert_after(self, before, data, element_id=None):
+        """Insert a new node after the node before, return its id"""
+        if element_id is None:
+            element_id = self._next_id
+        elif element_id in self._nodes:
+            raise KeyError(f"Element id {element_id} already used")
+        self._next_id = max(self._next_id, element_id + 1)
+        node = ElementNode(element_id, data)
+        self._nodes[node.id] = node
+        self.__link_after(node, before)
+        return node.id
+
+    def insert_before(self, element_id, data):
+        """Insert a new element above an element, return its id."""
+        return self.__insert_after(self.node(element_id).prev, data)
+
+    def insert_after(self, element_id, data):
+        """Insert a new element below an element, return its id."""
+        return self.__insert_after(self.node(element_id), data)
+
+    def append(self, data):
+        """Insert a new element at the bottom, return its id."""
+        return self.__insert_after(self._sentinel.prev, data)
+
+    def prepend(self, data):
+        """Insert a new element at the top, return its id."""
+        return self.__insert_after(self._sentinel, data)
+
+    def insert(self, data, after=None, element_id=None):
+        """Insert an element below another one, with a given id to restore
+        a deleted element.
+
+        Args:
+            data: the element
+            after (int, optional): the element above, None inserts at the
+            top. Defaults to None.
+            element_id (int, optional): the id of the element, an unused
+            one. Defaults to a new id.
+
+        Returns:
+            int: the id of the element
+        """
+        before = self._sentinel if after is None else self.node(after)
+        return self.__insert_after(before, data, element_id)
+
+    def previous(self, element_id):
+        """Return the id of the element above, None for the top one."""
+        return self.node(element_id).prev.id
+
+    def delete(self, element_id):
+        """Remove an element, return its data."""
+        node = self.node(element_id)
+        self.__unlink(node)
+        del self._nodes[element_id]
+        return node.data
+
+    def move_after(self, element_id, target_id=None):
+        """Move an element below another one, the drop of a drag and drop.
+
+        Args:
+            element_id (int): the moved element
+            target_id (int, optional): the element above the new position,
+            None moves to the top. Defaults to None.
+        """
+        node = self.node(element_id)
+        target = self._sentinel if target_id is None else self.node(target_id)
+        if target is node:
+            return
+        self.__unlink(node)
+        self.__link_after(node, target)
+
+    def find(self, data):
+        """Return the id of the first element equal to data, None if the
+        list does not hold it, an O(n) scan, prefer the ids.
+        """
+        for element_id, item in self.items():
+            if item == data:
+                return element_id
+        return None
+
+    def to_list(self):
+        """Return the elements as a list, from the top"""
+        return list(self)
+
+    def to_chain(self):
+        """Build the array backed line of the solver
+
+        The elements are dictionaries with a 'component' name and the
+        element properties of mooring_line.ELEMENT_PROPERTIES.
+
+        Returns:
+            ComponentChain: the elements, from the top to the anchor
+        """
+        elements = self.to_list()
+        unknown = set().union(*elements).difference(ELEMENT_PROPERTIES, ('component',))
+        if unknown:
+            raise KeyError(f"Unknown element properties {', '.join(sorted(unknown))}")
+        chain = ComponentChain(capacity=len(elements))
+        chain.extend([element['component'] for element in elements],
+                     **{key: [element.get(key, default) for element in elements]
+                        for key, (_, default) in ELEMENT_PROPERTIES.items()})
+        return chain
@@ -1,21 +1,178 @@
 from xlrd import open_workbook, XLRDError
 from collections import OrderedDict
+from collections.abc import Mapping
 import json
 import os
 import logging
 
+from logger import get_trace
 from version import NAME
 
 
+def worksheet2columns(worksheet):
+    """Read an xlrd worksheet as a columnar header and columns pair.
+
+    Values are read in bulk column by column, so no Cell object is
+    created for each value.
+
+    Args:
+        worksheet (Sheet): xlrd worksheet instance
+
+    Returns:
+        tuple: (header, columns), the list of the first row values and
+        the list of the values of each column, header excluded
+    """
+    # store row 1 (column headers)
+    header = worksheet.row_values(0)
+    # read each column except header
+    columns = [worksheet.col_values(col, 1) for col in range(len(header))]
+    return header, columns
+
+
+def columns2dict(header, columns):
+    """Build the ordered dictionary of rows from a columnar worksheet.
+
+    Each row is stored under its row number as a string key.
+
+    Args:
+        header (list): column headers
+        columns (list): the values of each column
+
+    Returns:
+        OrderedDict: an ordered dictionary containing the data
+    """
+    ws_dict = OrderedDict({})
+    for row, values in enumerate(zip(*columns), start=1):
+        ws_dict[str(row)] = dict(zip(header, values))
+    return ws_dict
+
+
+def worksheet2dict(worksheet):
+    """Convert an xlrd worksheet to an ordered dictionary of rows.
+
+    The first row holds the column headers, each following row is stored
+    under its row number as a string key.
+
+    Args:
+        worksheet (Sheet): xlrd worksheet instance
+
+    Returns:
+        OrderedDict: an ordered dictionary containing the data
+    """
+    return columns2dict(*worksheet2columns(worksheet))
+
+
+def read_columns(abspath, sheet_name):
+    """Process pool task: open the Workbook and read one worksheet.
+
+    The columnar result is pickled back to the parent process, which is
+    cheaper than pickling one dictionary per row.
+
+    Args:
+        abspath (str): path to the Workbook Excel file
+        sheet_name (str): worksheet name
+
+    Returns:
+        tuple: (header, columns) as returned by worksheet2columns()
+    """
+    workbook = open_workbook(abspath, on_demand=True)
+    try:
+        return worksheet2columns(workbook.sheet_by_name(sheet_name))
+    finally:
+        workbook.release_resources()
+
+
+class LibraryView(Mapping):
+    """Read-only view over the nested library dictionaries.
+
+    Nested dictionaries are wrapped on access, nothing is copied.
+    """
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        value = self._data[key]
+        if isinstance(value, dict):
+            return LibraryView(value)
+        return value
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f"LibraryView({self._data!r})"
+
+
+class SheetDiff:
+    """Differences of one worksheet between two loads of a library."""
+
+    __slots__ = ('sheet', 'added', 'removed', 'changed')
+
+    def __init__(self, sheet, added=(), removed=(), changed=()):
+        self.sheet = sheet
+        self.added = list(added)
+        self.removed = list(removed)
+        self.changed = list(changed)
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    def __repr__(self):
+        return (f"SheetDiff({self.sheet!r}, added={self.added}, "
+                f"removed={self.removed}, changed={self.changed})")
+
+
+def diff_library(old, new):
+    """Compare two converted libraries sheet by sheet and row by row.
+
+    Args:
+        old (Mapping): previous worksheet -> row -> {header: value}
+        new (Mapping): current worksheet -> row -> {header: value}
+
+    Returns:
+        OrderedDict: worksheet -> SheetDiff, only for the worksheets that
+        differ. All the rows of an added or removed worksheet are reported
+        as added or removed.
+    """
+    diffs = OrderedDict()
+    for sheet in old:
+        if sheet not in new:
+            diffs[sheet] = SheetDiff(sheet, removed=old[sheet] or ())
+    for sheet, rows in new.items():
+        previous = old.get(sheet) or {}
+        rows = rows or {}
+        diff = SheetDiff(
+            sheet,
+            added=[row for row in rows if row not in previous],
+            removed=[row for row in previous if row not in rows],
+            changed=[row for row in rows if row in previous and rows[row] != previous[row]])
+        if diff or sheet not in old:
+            diffs[sheet] = diff
+    return diffs
+
+
 class excel2json:
     """This class convert Mooring instrument in Workbook Excel
      file to an ordered JSON dictionary """
 
-    def __init__(self, abspath):
+    def __init__(self, abspath, cache=None, progress=None, workers=1):
         """excel2json constructor from Workbook Excel file name.
 
         Args:
             abspath (str): absolute path string to Workbook Excel file
+            cache (LibraryCache, optional): on-disk cache of converted
+            libraries. Defaults to None.
+            progress (callable, optional): called as progress(sheet, rows,
+            worksheets) each time a worksheet is converted. Defaults to None.
+            workers (int, optional): number of processes converting the
+            worksheets concurrently, 1 to convert them one after another.
+            Defaults to 1.
         """
         # protected properties with decorators
         self._worksheets = []
@@ -24,6 +181,9 @@ class excel2json:
         self.__logger = logging.getLogger(NAME)
         self.__logger.debug("Pass in excel2json.init()")
         self.__abspath = abspath
+        self.__cache = cache
+        self.__progress = progress
+        self.__workers = workers
         # call methods
         self.read()
 
@@ -61,34 +221,43 @@ class excel2json:
         """
         return self._hash
 
-    def __get_sheet_names(self):
-        """Get the list of sheets found in the Workbook.
+    def __open_workbook(self):
+        """Open the Workbook once, sheets are loaded on demand.
+
+        Returns:
+            Book: An instance of the ~xlrd.book.Book class, None in case of failure.
         """
+        # python module 'xlrd' supports .xls & .xlsx both
         try:
-            workbook = open_workbook(self.__abspath)
-            self._worksheets = workbook.sheet_names()
-        except Exception as e:
-            self.__logger.error(f"{e}, unable to open worksheet file")
+            return open_workbook(self.__abspath, on_demand=True)
+        except FileNotFoundError as ex:
+            self.__logger.error(
+                f"Something wrong with the path {self.__abspath}. Error: {ex}.")
+            return None
+        except XLRDError as ex:
+            self.__logger.error(
+                f"Something wrong happened while reading the Excel file. Error: {ex}"
+            )
+            return None
+        except Exception as ex:
+            self.__logger.error(
+                f"{ex}, unable to open worksheet file")
+            return None
 
-    def __read_sheet(self, sheet_name):
+    def __read_sheet(self, workbook, sheet_name):
         """Read the Workbook sheet and return it.
 
         Args:
+            workbook (Book): the Workbook handle shared by all sheets
             sheet_name (str): target Workbook sheet name string
             to be opened
 
         Returns:
-            Book: An instance of the ~xlrd.book.Book class.
+            Sheet: An instance of the ~xlrd.sheet.Sheet class.
         """
-        # python module 'xlrd' supports .xls & .xlsx both
         try:
-            workbook = open_workbook(self.__abspath)
             # return the specified worksheet
             return workbook.sheet_by_name(sheet_name)
-        except FileNotFoundError as ex:
-            self.__logger.error(
-                f"Something wrong with the path {self.__abspath}. Error: {ex}.")
-            return None
         except XLRDError as ex:
             self.__logger.error(
                 f"Something wrong happened while reading the Excel file. Error: {ex}"
@@ -104,52 +273,121 @@ class excel2json:
         """Read an Workbook worksheet as a ordered dictionary
 
         Args:
-            worksheet (str): worksheet name
+            worksheet (Sheet): xlrd worksheet instance
 
         Returns:
             OrderedDict: an ordered dictionary containing the data
         """
-        ws_dict = OrderedDict({})
-        row_dict = OrderedDict({})
-
         if worksheet is None:
             self.__logger.info("Empty worksheet found.")
             return None
+        return worksheet2dict(worksheet)
 
-        # store row 1 (column headers)
-        header = [cell.value for cell in worksheet.row(0)]
-        key = 0
+    def toDict(self, copy=False):
+        """Return the library as a dictionary
 
-        # read each row except header, create dict per row and append to the list
-        for row in range(1, worksheet.nrows):
-            row_dict = {value: worksheet.cell(
-                row, col).value for col, value in enumerate(header)}
-            ws_dict[str(row)] = row_dict
-            row_dict = {}
-        return ws_dict
-
-    def toDict(self):
-        """Return python ordered dictionary from JSON string
+        Args:
+            copy (bool, optional): return an independent mutable copy instead
+            of a read-only view. Defaults to False.
 
         Returns:
-            OrderedDict: a JSON string representing the worksheet data
+            Mapping: a read-only view of the worksheets data, or an OrderedDict
+            copy when copy is True
         """
-        return OrderedDict(json.loads(self.__str__(), object_pairs_hook=OrderedDict))
+        if not copy:
+            return LibraryView(self._hash)
+        return OrderedDict(
+            (sheet, None if rows is None else OrderedDict(
+                (row, dict(values)) for row, values in rows.items()))
+            for sheet, rows in self._hash.items())
 
     def read(self):
         """Read an Workbook (Excel) file, store each worksheet
-        in a hash
+        in a hash. The file is parsed only once, each sheet is loaded
+        on demand then unloaded after conversion.
 
         Returns:
             OrderedDict: an ordered dictionary containing the data
         """
-        self.__get_sheet_names()
-        for sheet in self._worksheets:
-            ws = self.__read_sheet(sheet)
-            self._hash[sheet] = self.__worksheet2json(ws)
-            # self.__logger.debug(self._hash[sheet])
+        fingerprint = None
+        if self.__cache is not None:
+            # taken once, before the conversion, and stored with its result
+            try:
+                fingerprint = self.__cache.fingerprint(self.__abspath)
+            except OSError:
+                # the workbook open below reports the missing file
+                cached = None
+            else:
+                cached = self.__cache.load(self.__abspath, fingerprint)
+            if cached is not None:
+                self._worksheets, self._hash = cached
+                if self.__progress is not None:
+                    for sheet in self._worksheets:
+                        self.__progress(sheet, self._hash[sheet], self._worksheets)
+                return self._hash
+        workbook = self.__open_workbook()
+        if workbook is None:
+            return self._hash
+        self._worksheets = workbook.sheet_names()
+        if self.__workers > 1 and len(self._worksheets) > 1:
+            # each worker process opens the file for itself
+            workbook.release_resources()
+            self.__read_parallel()
+        else:
+            self.__read_sequential(workbook)
+        if fingerprint is not None:
+            self.__cache.store(self.__abspath, self._worksheets, self._hash, fingerprint)
         return self._hash
 
+    def __read_sequential(self, workbook):
+        """Convert the worksheets one after another with a shared Workbook"""
+        try:
+            trace = get_trace('excel2json')
+            for sheet in self._worksheets:
+                with trace.span(sheet) as span:
+                    ws = self.__read_sheet(workbook, sheet)
+                    self._hash[sheet] = self.__worksheet2json(ws)
+                    if trace and ws is not None:
+                        span.add('rows', ws.nrows)
+                        span.add('cells', ws.nrows * ws.ncols)
+                workbook.unload_sheet(sheet)
+                if self.__progress is not None:
+                    self.__progress(sheet, self._hash[sheet], self._worksheets)
+                # self.__logger.debug(self._hash[sheet])
+        finally:
+            workbook.release_resources()
+
+    def __read_parallel(self):
+        """Convert the worksheets concurrently in a process pool"""
+        # only imported when workers > 1, excel2json is also used as a library
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        results = {}
+        with ProcessPoolExecutor(
+                max_workers=min(self.__workers, len(self._worksheets)),
+                mp_context=multiprocessing.get_context('spawn')) as executor:
+            futures = {executor.submit(read_columns, self.__abspath, sheet): sheet
+                       for sheet in self._worksheets}
+            trace = get_trace('excel2json')
+            for future in as_completed(futures):
+                sheet = futures[future]
+                try:
+                    with trace.span(sheet) as span:
+                        header, columns = future.result()
+                        results[sheet] = columns2dict(header, columns)
+                        if trace and columns:
+                            span.add('rows', len(columns[0]) + 1)
+                            span.add('cells', (len(columns[0]) + 1) * len(header))
+                except Exception as ex:
+                    self.__logger.error(
+                        f"Something wrong happened while reading the worksheet {sheet}. Error: {ex}")
+                    results[sheet] = None
+                if self.__progress is not None:
+                    self.__progress(sheet, results[sheet], self._worksheets)
+        # keep the Workbook order
+        for sheet in self._worksheets:
+            self._hash[sheet] = results[sheet]
+
     def write(self, filename, path):
         """Write the Workbook as a JSON file
 
@@ -181,6 +419,10 @@ class excel2json:
 
 if __name__ == '__main__':
 
+    import multiprocessing
+    # the parallel conversion spawns its workers, needed in a frozen executable
+    multiprocessing.freeze_support()
+
     from logger import configure_logger
     logger = configure_logger('INFO')
     logger = logging.getLogger(NAME)
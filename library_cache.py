@@ -0,0 +1,163 @@
+"""Persistent on-disk cache of converted Excel libraries."""
+
+import os
+import pickle
+import hashlib
+import logging
+from time import perf_counter
+from appdirs import AppDirs
+
+from version import NAME, APPNAME, AUTHOR
+
+# bump when the layout of the cached structure changes
+CACHE_VERSION = 1
+
+
+class CacheStats:
+    """Counters reported by the library cache."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.load_time = 0.0
+
+    def __str__(self):
+        return (f"hits: {self.hits}, misses: {self.misses}, "
+                f"read: {self.bytes_read} bytes, written: {self.bytes_written} bytes, "
+                f"load time: {self.load_time * 1000:.1f} ms")
+
+
+class LibraryCache:
+    """This class store converted libraries as pickle files under the
+    user config directory. Each entry is keyed by the library path and
+    validated against the file mtime, size and content hash.
+    """
+
+    def __init__(self, cache_dir=None):
+        """LibraryCache constructor
+
+        Args:
+            cache_dir (str, optional): cache directory. Defaults to the 'cache'
+            sub directory of the user config directory.
+        """
+        self.__logger = logging.getLogger(NAME)
+        if cache_dir is None:
+            cache_dir = os.path.join(AppDirs(APPNAME, AUTHOR).user_config_dir, 'cache')
+        self._cache_dir = cache_dir
+        self._stats = CacheStats()
+
+    @property
+    def cache_dir(self):
+        """Getter to protected cache directory property
+
+        Returns:
+            str: the directory where the cache files are written
+        """
+        return self._cache_dir
+
+    @property
+    def stats(self):
+        """Getter to protected cache statistics
+
+        Returns:
+            CacheStats: hits, misses, bytes and load time counters
+        """
+        return self._stats
+
+    @staticmethod
+    def fingerprint(abspath):
+        """Compute the fingerprint of a library file.
+
+        Args:
+            abspath (str): path to the library file
+
+        Returns:
+            tuple: (normalized path, mtime in ns, size, blake2b content hash)
+        """
+        abspath = os.path.normcase(os.path.abspath(abspath))
+        stat = os.stat(abspath)
+        with open(abspath, 'rb') as fid:
+            digest = hashlib.blake2b(fid.read(), digest_size=20).hexdigest()
+        return (abspath, stat.st_mtime_ns, stat.st_size, digest)
+
+    def entry_path(self, abspath):
+        """Return the cache file name used for a library path."""
+        key = hashlib.blake2b(
+            os.path.normcase(os.path.abspath(abspath)).encode('utf-8'),
+            digest_size=16).hexdigest()
+        return os.path.join(self._cache_dir, f"{key}.pickle")
+
+    def load(self, abspath, fingerprint=None):
+        """Return the cached library for abspath, None when missing or stale.
+
+        Args:
+            abspath (str): path to the library file
+            fingerprint (tuple, optional): the fingerprint of the file, see
+            fingerprint(). Defaults to None, computed.
+
+        Returns:
+            tuple: (worksheets list, OrderedDict hash) or None
+        """
+        start = perf_counter()
+        entry = self.entry_path(abspath)
+        try:
+            if fingerprint is None:
+                fingerprint = self.fingerprint(abspath)
+            with open(entry, 'rb') as fid:
+                payload = fid.read()
+            version, cached_fingerprint, worksheets, data = pickle.loads(payload)
+        except FileNotFoundError:
+            self._stats.misses += 1
+            return None
+        except Exception as ex:
+            self.__logger.warning(f"Invalid library cache entry {entry}: {ex}")
+            self._stats.misses += 1
+            return None
+        if version != CACHE_VERSION or cached_fingerprint != fingerprint:
+            self._stats.misses += 1
+            return None
+        self._stats.hits += 1
+        self._stats.bytes_read += len(payload)
+        self._stats.load_time += perf_counter() - start
+        self.__logger.debug(f"Library cache hit for {abspath}")
+        return worksheets, data
+
+    def store(self, abspath, worksheets, data, fingerprint):
+        """Write the converted library to the cache.
+
+        Args:
+            abspath (str): path to the library file
+            worksheets (list): the list of sheets found in the Workbook
+            data (OrderedDict): the converted library
+            fingerprint (tuple): the fingerprint of the file taken before
+            it was converted, so a file changed meanwhile is converted again
+
+        Returns:
+            str: the cache file name, None in case of failure
+        """
+        entry = self.entry_path(abspath)
+        try:
+            payload = pickle.dumps(
+                (CACHE_VERSION, fingerprint, worksheets, data),
+                protocol=pickle.HIGHEST_PROTOCOL)
+            os.makedirs(self._cache_dir, exist_ok=True)
+            # write then rename, a concurrent reader never sees a partial file
+            tmp = f"{entry}.{os.getpid()}.tmp"
+            with open(tmp, 'wb') as fid:
+                fid.write(payload)
+            os.replace(tmp, entry)
+        except (OSError, pickle.PickleError) as ex:
+            self.__logger.warning(f"Unable to write library cache {entry}: {ex}")
+            return None
+        self._stats.bytes_written += len(payload)
+        return entry
+
+    def clear(self):
+        """Remove all cache entries."""
+        if not os.path.isdir(self._cache_dir):
+            return
+        for name in os.listdir(self._cache_dir):
+            if name.endswith('.pickle'):
+                os.remove(os.path.join(self._cache_dir, name))
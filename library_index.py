@@ -0,0 +1,336 @@
+"""Name and category index over the components of a library."""
+
+import logging
+import re
+from bisect import bisect_left, bisect_right, insort
+from difflib import get_close_matches
+from math import isnan, inf
+
+from library_model import parse_worksheet, to_float, NAME_ATTRIBUTE, NUMERIC_ATTRIBUTES
+from version import NAME
+
+CATEGORY_ATTRIBUTE = 'category'
+
+# a numeric condition of a query such as "mass < 5 kg", the unit is ignored
+CONDITION = re.compile(
+    r'(?P<attribute>[A-Za-z_]\w*)\s*(?P<operator><=|>=|==|!=|<|>|=)\s*'
+    r'(?P<value>[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)'
+    r'(?:\s*(?:kg|g|t|mm|cm|m2|m|kn|dan|n)\b)?', re.IGNORECASE)
+
+
+class IndexEntry:
+    """A library component found by the index."""
+
+    __slots__ = ('sheet', 'row', 'name', 'category', 'attributes')
+
+    def __init__(self, sheet, row, name, category, attributes):
+        self.sheet = sheet
+        self.row = row
+        self.name = name
+        self.category = category
+        self.attributes = attributes
+
+    def __repr__(self):
+        return f"IndexEntry({self.sheet!r}, {self.row!r}, {self.name!r})"
+
+
+class LibraryIndex:
+    """This class index the excel2json output by component name and
+    category. The index is updated incrementally: only the rows changed
+    since the previous update are removed or added.
+
+    A name defined several times is indexed from its first row in the
+    library order, as ComponentLibrary does, the other rows are kept as
+    its duplicates.
+    """
+
+    def __init__(self, library=None):
+        """LibraryIndex constructor
+
+        Args:
+            library (Mapping, optional): worksheet -> row -> {header: value},
+            as returned by excel2json.toDict(). Defaults to None.
+        """
+        self.__logger = logging.getLogger(NAME)
+        self._by_name = {}
+        self._by_category = {}
+        self._by_sheet = {}
+        # sorted (lower case name, name) pairs for prefix search
+        self._sorted = []
+        # numeric attribute -> sorted (value, name) pairs for range search
+        self._numeric = {}
+        # snapshot of the indexed rows, used to detect changes
+        self._rows = {}
+        # name -> [(sheet, row)] of the duplicates hidden by the indexed row
+        self._shadowed = {}
+        # position of each worksheet in the library and of each of its rows
+        self._sheet_order = {}
+        self._row_order = {}
+        if library is not None:
+            self.update(library)
+
+    def __len__(self):
+        return len(self._by_name)
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def __getitem__(self, name):
+        ''' overloading operators index[name]'''
+        return self._by_name[name]
+
+    def get(self, name, default=None):
+        """Return the entry of a component by exact name."""
+        return self._by_name.get(name, default)
+
+    @property
+    def categories(self):
+        """Getter to the list of indexed categories"""
+        return list(self._by_category)
+
+    def by_category(self, category):
+        """Return the names of the components of a category."""
+        return list(self._by_category.get(category, ()))
+
+    def by_sheet(self, sheet):
+        """Return the names of the components of a worksheet."""
+        return list(self._by_sheet.get(sheet, ()))
+
+    def locations(self, name):
+        """Return the (sheet, row) of every row defining a component, the
+        indexed row first then its duplicates in the library order.
+        """
+        entry = self._by_name.get(name)
+        if entry is None:
+            return []
+        return [(entry.sheet, entry.row)] + sorted(self._shadowed.get(name, ()),
+                                                   key=self.__rank)
+
+    def prefix(self, text, limit=None):
+        """Return the names starting with text, case insensitive, sorted.
+
+        Args:
+            text (str): the prefix
+            limit (int, optional): maximum number of names. Defaults to None.
+
+        Returns:
+            list: the matching component names
+        """
+        text = text.lower()
+        names = []
+        for key, name in self._sorted[bisect_left(self._sorted, (text, '')):]:
+            if not key.startswith(text) or (limit is not None and len(names) >= limit):
+                break
+            names.append(name)
+        return names
+
+    def search(self, text, limit=10, cutoff=0.6):
+        """Search names for the library panel: prefix matches first, then
+        names containing text, then close matches.
+
+        Args:
+            text (str): the searched text
+            limit (int, optional): maximum number of names. Defaults to 10.
+            cutoff (float, optional): similarity threshold of the fuzzy
+            matches, between 0 and 1. Defaults to 0.6.
+
+        Returns:
+            list: the matching component names
+        """
+        names = self.prefix(text, limit)
+        text = text.lower()
+        for key, name in self._sorted:
+            if len(names) >= limit:
+                return names
+            if text in key and name not in names:
+                names.append(name)
+        keys = {key: name for key, name in self._sorted}
+        for key in get_close_matches(text, keys, n=limit, cutoff=cutoff):
+            if len(names) >= limit:
+                break
+            if keys[key] not in names:
+                names.append(keys[key])
+        return names
+
+    def range(self, attribute, low=-inf, high=inf, include_low=True, include_high=True):
+        """Return the names whose numeric attribute lies between low and high.
+
+        Args:
+            attribute (str): name from NUMERIC_ATTRIBUTES
+            low (float, optional): lower bound. Defaults to -inf.
+            high (float, optional): upper bound. Defaults to inf.
+            include_low (bool, optional): low is a match. Defaults to True.
+            include_high (bool, optional): high is a match. Defaults to True.
+
+        Returns:
+            set: the matching component names
+        """
+        values = self._numeric.get(attribute, [])
+        # '' and the largest character bound the names sharing a value
+        start = (bisect_left if include_low else bisect_right)(
+            values, (low, '' if include_low else '\U0010ffff'))
+        stop = (bisect_right if include_high else bisect_left)(
+            values, (high, '\U0010ffff' if include_high else ''))
+        return {name for _, name in values[start:stop]}
+
+    def query(self, text):
+        """Filter the components as the library search box does: numeric
+        conditions such as "mass < 5 kg" or "buoyancy > 20" use the range
+        index, other words must be found in the name or the category.
+        All the terms must match.
+
+        Args:
+            text (str): the query
+
+        Returns:
+            list: the matching component names, sorted
+        """
+        names = None
+        for match in CONDITION.finditer(text):
+            found = self.__condition(match['attribute'].lower(), match['operator'],
+                                     float(match['value']))
+            names = found if names is None else names & found
+        for word in CONDITION.sub(' ', text).lower().split():
+            found = {name for key, name in self._sorted if word in key}
+            found.update(name for category, members in self._by_category.items()
+                         if word in category.lower() for name in members)
+            names = found if names is None else names & found
+        if names is None:
+            return [name for _, name in self._sorted]
+        return [name for _, name in self._sorted if name in names]
+
+    def __condition(self, attribute, operator, value):
+        """Return the names matching one numeric condition"""
+        if operator in ('=', '=='):
+            return self.range(attribute, value, value)
+        if operator == '!=':
+            return (self.range(attribute, high=value, include_high=False) |
+                    self.range(attribute, low=value, include_low=False))
+        if operator == '<':
+            return self.range(attribute, high=value, include_high=False)
+        if operator == '<=':
+            return self.range(attribute, high=value)
+        if operator == '>':
+            return self.range(attribute, low=value, include_low=False)
+        return self.range(attribute, low=value)
+
+    def update(self, library):
+        """Synchronize the index with a library.
+
+        Args:
+            library (Mapping): worksheet -> row -> {header: value}
+
+        Returns:
+            set: the names of the worksheets whose index changed
+        """
+        changed = set()
+        self._sheet_order = {sheet: position for position, sheet in enumerate(library)}
+        for sheet in list(self._rows):
+            if sheet not in library or library[sheet] is None:
+                self.__remove_rows(sheet, list(self._rows[sheet]))
+                del self._rows[sheet]
+                del self._row_order[sheet]
+                changed.add(sheet)
+        for sheet, rows in library.items():
+            parsed = parse_worksheet(rows) if rows is not None else None
+            if parsed is None:
+                # a worksheet no longer parsed drops its stale rows
+                if sheet in self._rows:
+                    self.__remove_rows(sheet, list(self._rows[sheet]))
+                    del self._rows[sheet]
+                    del self._row_order[sheet]
+                    changed.add(sheet)
+                continue
+            attributes, _, data = parsed
+            new = {row: tuple((attributes[key], value) for key, value in values.items())
+                   for row, values in data}
+            old = self._rows.get(sheet, {})
+            removed = [row for row, values in old.items() if new.get(row) != values]
+            added = [row for row, values in new.items() if old.get(row) != values]
+            if not removed and not added:
+                continue
+            self.__remove_rows(sheet, removed)
+            self._rows[sheet] = new
+            self._row_order[sheet] = {row: position for position, row in enumerate(new)}
+            for row in added:
+                self.__add_row(sheet, row, dict(new[row]))
+            changed.add(sheet)
+        return changed
+
+    def __rank(self, location):
+        """Return the sort key of a (sheet, row) in the library order"""
+        sheet, row = location
+        return self._sheet_order.get(sheet, len(self._sheet_order)), self._row_order[sheet][row]
+
+    def __add_row(self, sheet, row, attributes):
+        """Index one component row, a duplicate name is indexed from the
+        row coming first in the library.
+        """
+        name = str(attributes[NAME_ATTRIBUTE])
+        entry = self._by_name.get(name)
+        if entry is not None:
+            self.__logger.warning(
+                f"Component \"{name}\" defined in {entry.sheet} and {sheet}")
+            if self.__rank((sheet, row)) > self.__rank((entry.sheet, entry.row)):
+                self._shadowed.setdefault(name, []).append((sheet, row))
+                return
+            # the indexed row is now hidden by the new one
+            self.__remove_entry(entry)
+            self._shadowed.setdefault(name, []).append((entry.sheet, entry.row))
+        category = str(attributes.get(CATEGORY_ATTRIBUTE, ''))
+        self._by_name[name] = IndexEntry(sheet, row, name, category, attributes)
+        self._by_category.setdefault(category, []).append(name)
+        self._by_sheet.setdefault(sheet, []).append(name)
+        insort(self._sorted, (name.lower(), name))
+        for attribute, value in self.__numeric_values(attributes):
+            insort(self._numeric.setdefault(attribute, []), (value, name))
+
+    def __remove_rows(self, sheet, rows):
+        """Remove the components of the given rows from the index."""
+        for row in rows:
+            name = str(dict(self._rows[sheet][row])[NAME_ATTRIBUTE])
+            entry = self._by_name.get(name)
+            shadowed = self._shadowed.get(name, [])
+            if entry is None or entry.sheet != sheet or entry.row != row:
+                if (sheet, row) in shadowed:
+                    shadowed.remove((sheet, row))
+                    if not shadowed:
+                        del self._shadowed[name]
+                continue
+            self.__remove_entry(entry)
+            # the first duplicate hidden by the removed row takes its place
+            if shadowed:
+                other_sheet, other_row = min(shadowed, key=self.__rank)
+                shadowed.remove((other_sheet, other_row))
+                if not shadowed:
+                    del self._shadowed[name]
+                self.__add_row(other_sheet, other_row,
+                               dict(self._rows[other_sheet][other_row]))
+
+    def __remove_entry(self, entry):
+        """Remove an indexed component, its duplicates are left as they are."""
+        name = entry.name
+        del self._by_name[name]
+        self._by_category[entry.category].remove(name)
+        if not self._by_category[entry.category]:
+            del self._by_category[entry.category]
+        self._by_sheet[entry.sheet].remove(name)
+        pos = bisect_left(self._sorted, (name.lower(), name))
+        del self._sorted[pos]
+        for attribute, value in self.__numeric_values(entry.attributes):
+            values = self._numeric[attribute]
+            del values[bisect_left(values, (value, name))]
+
+    @staticmethod
+    def __numeric_values(attributes):
+        """Return the (attribute, value) pairs of the range index of a row,
+        the library mass being the signed buoyancy it is indexed as both
+        """
+        values = {}
+        for attribute in NUMERIC_ATTRIBUTES:
+            value = to_float(attributes.get(attribute))
+            if not isnan(value):
+                values[attribute] = value
+        if 'mass' in values and 'buoyancy' not in values:
+            values['buoyancy'] = values['mass']
+        return values.items()
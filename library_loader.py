@@ -0,0 +1,62 @@
+"""Background loading of a library, part of Mooring simulator PySide6 application."""
+
+import logging
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from excel2json import excel2json
+from library_index import LibraryIndex
+from library_model import ComponentLibrary
+from version import NAME
+
+
+class LoaderSignals(QObject):
+    """Signals emitted by LibraryLoader, QRunnable is not a QObject.
+
+    sheet_loaded (str, list, object): worksheet, list of worksheets, rows
+    finished (object, object, object): excel2json, LibraryIndex, ComponentLibrary
+    error (str): the error message
+    """
+    sheet_loaded = Signal(str, list, object)
+    finished = Signal(object, object, object)
+    error = Signal(str)
+
+
+class LibraryLoader(QRunnable):
+    """This class parse an Excel library and build its index and typed
+    model in a QThreadPool worker, reporting progress per worksheet.
+    """
+
+    def __init__(self, filename, cache=None, workers=1):
+        """LibraryLoader constructor
+
+        Args:
+            filename (string): The Excel .xls library file
+            cache (LibraryCache, optional): on-disk cache of converted
+            libraries. Defaults to None.
+            workers (int, optional): number of processes converting the
+            worksheets. Defaults to 1.
+        """
+        super(LibraryLoader, self).__init__()
+        self.__logger = logging.getLogger(NAME)
+        self.file_name = filename
+        self.cache = cache
+        self.workers = workers
+        self.signals = LoaderSignals()
+
+    def run(self):
+        """Worker thread entry point, widgets must not be created here."""
+        try:
+            library = excel2json(self.file_name, cache=self.cache,
+                                 progress=self.__progress, workers=self.workers)
+            data = library.toDict()
+            index = LibraryIndex(data)
+            components = ComponentLibrary.from_dict(data)
+        except Exception as ex:
+            self.__logger.error(f"Unable to load library {self.file_name}: {ex}")
+            self.signals.error.emit(str(ex))
+            return
+        self.signals.finished.emit(library, index, components)
+
+    def __progress(self, sheet, rows, worksheets):
+        """excel2json progress callback, forwarded to the GUI thread."""
+        self.signals.sheet_loaded.emit(sheet, list(worksheets), rows)
@@ -0,0 +1,398 @@
+"""Typed, columnar model of a component library.
+
+Each worksheet of the library (Floats, Ropes, Instruments, Releases,
+Anchors, Terminals) becomes a ComponentTable: numeric attributes are
+stored as NumPy arrays, text attributes as interned categories and
+components are looked up by name.
+"""
+
+import sys
+import logging
+from collections import OrderedDict
+import numpy as np
+
+from excel2json import excel2json
+from version import NAME
+
+# worksheets describing mooring components
+SHEETS = ('Floats', 'Ropes', 'Instruments', 'Releases', 'Anchors', 'Terminals')
+
+# attributes stored as float64 arrays, missing values are NaN
+NUMERIC_ATTRIBUTES = ('mass', 'buoyancy', 'length', 'diameter', 'projected_area',
+                      'nl_drag_cf', 'tl_drag_cf', 'breaking_strength',
+                      'poly_1', 'poly_2', 'poly_3')
+
+# the attribute row of a worksheet holds these keys
+ATTRIBUTE = 'attribute'
+NAME_ATTRIBUTE = 'name'
+
+
+def to_float(value):
+    """Convert an Excel cell value to float, NaN when empty or invalid."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def parse_worksheet(rows):
+    """Locate the attribute row of an excel2json worksheet.
+
+    The attribute names ('category', 'name', 'mass', ...) are either the
+    header row of the worksheet or the first data row, the other header
+    row holds the column titles.
+
+    Args:
+        rows (Mapping): row number -> {header: value}
+
+    Returns:
+        tuple: (attributes, descriptions, data) where attributes maps each
+        header key to its attribute, descriptions maps each attribute to its
+        column title and data is the list of (row number, row) components,
+        None if the worksheet has no attribute row
+    """
+    rows = list(rows.items())
+    if not rows:
+        return None
+    header = list(rows[0][1])
+    if NAME_ATTRIBUTE in header:
+        attributes = {key: key for key in header}
+    else:
+        for first, (_, row) in enumerate(rows):
+            if NAME_ATTRIBUTE in row.values():
+                break
+        else:
+            return None
+        attributes = {key: str(value) for key, value in row.items()}
+        rows = rows[first + 1:]
+    key_of = {attribute: key for key, attribute in attributes.items()}
+    descriptions = {attribute: str(key) for key, attribute in attributes.items()}
+
+    data = []
+    for number, row in rows:
+        if row.get(key_of.get(ATTRIBUTE)) in (0, 0.0):
+            # description row, with the attribute row as header
+            descriptions = {attribute: str(row[key]) for key, attribute in attributes.items()}
+            continue
+        if str(row[key_of[NAME_ATTRIBUTE]]).strip():
+            data.append((number, row))
+    return attributes, descriptions, data
+
+
+class Categorical:
+    """Text column stored as integer codes into a tuple of interned labels."""
+
+    __slots__ = ('codes', 'categories')
+
+    def __init__(self, values):
+        labels = {}
+        codes = np.empty(len(values), dtype=np.int32)
+        for i, value in enumerate(values):
+            value = sys.intern(str(value))
+            codes[i] = labels.setdefault(value, len(labels))
+        self.codes = codes
+        self.categories = tuple(labels)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, index):
+        return self.categories[self.codes[index]]
+
+    def tolist(self):
+        """Return the column as a list of strings."""
+        return [self.categories[code] for code in self.codes]
+
+
+class ComponentTable:
+    """This class store one library worksheet as typed columns."""
+
+    def __init__(self, sheet, names, columns, descriptions=None):
+        """ComponentTable constructor
+
+        Args:
+            sheet (str): worksheet name
+            names (list): component names, one per row
+            columns (dict): attribute -> np.ndarray or Categorical
+            descriptions (dict, optional): attribute -> column title
+        """
+        self._sheet = sheet
+        self._names = tuple(sys.intern(str(name)) for name in names)
+        self._index = {name: row for row, name in enumerate(self._names)}
+        self._columns = OrderedDict(columns)
+        self._descriptions = descriptions or {}
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __getitem__(self, attribute):
+        ''' overloading operators table[attribute]'''
+        return self._columns[attribute]
+
+    def __repr__(self):
+        return f"ComponentTable({self._sheet!r}, {len(self)} components)"
+
+    @property
+    def sheet(self):
+        """Getter to the worksheet name"""
+        return self._sheet
+
+    @property
+    def names(self):
+        """Getter to the component names"""
+        return self._names
+
+    @property
+    def attributes(self):
+        """Getter to the list of column attributes"""
+        return list(self._columns)
+
+    @property
+    def descriptions(self):
+        """Getter to the column titles, keyed by attribute"""
+        return self._descriptions
+
+    def index(self, name):
+        """Return the row of a component, raise KeyError if unknown."""
+        return self._index[name]
+
+    def get(self, name, attribute):
+        """Return one attribute value of a component.
+
+        Args:
+            name (str): component name
+            attribute (str): attribute name, ie 'mass'
+
+        Returns:
+            float or str: the attribute value
+        """
+        return self._columns[attribute][self._index[name]]
+
+    def component(self, name):
+        """Return all the attributes of a component as a dictionary.
+
+        Args:
+            name (str): component name
+
+        Returns:
+            dict: attribute -> value, with 'sheet' and 'name' keys
+        """
+        row = self._index[name]
+        component = {'sheet': self._sheet, 'name': name}
+        for attribute, column in self._columns.items():
+            value = column[row]
+            component[attribute] = float(value) if isinstance(column, np.ndarray) else value
+        return component
+
+    @classmethod
+    def from_rows(cls, sheet, rows):
+        """Build a table from an excel2json worksheet dictionary.
+
+        Args:
+            sheet (str): worksheet name
+            rows (Mapping): row number -> {header: value}
+
+        Returns:
+            ComponentTable: the table, None if the worksheet has no attribute row
+        """
+        parsed = parse_worksheet(rows)
+        if parsed is None:
+            return None
+        attributes, descriptions, data = parsed
+        data = [row for _, row in data]
+
+        columns = OrderedDict()
+        for key, attribute in attributes.items():
+            if attribute in (ATTRIBUTE, NAME_ATTRIBUTE, ''):
+                continue
+            values = [row[key] for row in data]
+            if attribute in NUMERIC_ATTRIBUTES:
+                columns[attribute] = np.fromiter(
+                    (to_float(value) for value in values), dtype=np.float64, count=len(values))
+            else:
+                columns[attribute] = Categorical(values)
+        # the library mass is the signed wet weight, positive upward as a buoyancy
+        if 'mass' in columns and 'buoyancy' not in columns:
+            columns['buoyancy'] = columns['mass']
+        name_key = next(key for key, attribute in attributes.items()
+                        if attribute == NAME_ATTRIBUTE)
+        names = [row[name_key] for row in data]
+        return cls(sheet, names, columns, descriptions)
+
+
+class ComponentLibrary:
+    """This class hold the typed tables of a component library and
+    resolve components by name across worksheets.
+    """
+
+    def __init__(self, tables):
+        """ComponentLibrary constructor
+
+        Args:
+            tables (dict): worksheet name -> ComponentTable
+        """
+        self.__logger = logging.getLogger(NAME)
+        self._tables = OrderedDict(tables)
+        self.__index_names()
+
+    def __index_names(self):
+        """Map each component name to its worksheet."""
+        self._where = {}
+        for sheet, table in self._tables.items():
+            for name in table.names:
+                if name in self._where:
+                    self.__logger.warning(
+                        f"Component \"{name}\" defined in {self._where[name]} and {sheet}")
+                    continue
+                self._where[name] = sheet
+
+    def __getitem__(self, sheet):
+        ''' overloading operators library[sheet]'''
+        return self._tables[sheet]
+
+    def __contains__(self, name):
+        return name in self._where
+
+    def __len__(self):
+        return len(self._where)
+
+    def __iter__(self):
+        return iter(self._tables)
+
+    @property
+    def worksheets(self):
+        """Getter to the list of worksheets"""
+        return list(self._tables)
+
+    def sheet_of(self, name):
+        """Return the worksheet defining a component, raise KeyError if unknown."""
+        return self._where[name]
+
+    def find(self, name):
+        """Return (table, row) of a component, raise KeyError if unknown."""
+        table = self._tables[self._where[name]]
+        return table, table.index(name)
+
+    def get(self, name, attribute):
+        """Return one attribute value of a component."""
+        return self._tables[self._where[name]].get(name, attribute)
+
+    def component(self, name):
+        """Return all the attributes of a component as a dictionary."""
+        return self._tables[self._where[name]].component(name)
+
+    def update(self, library, sheets):
+        """Rebuild only the tables of the given worksheets.
+
+        Args:
+            library (Mapping): worksheet -> row -> {header: value}
+            sheets (iterable): names of the changed worksheets
+        """
+        for sheet in sheets:
+            rows = library.get(sheet)
+            table = None if rows is None else ComponentTable.from_rows(sheet, rows)
+            if table is None:
+                self._tables.pop(sheet, None)
+            else:
+                self._tables[sheet] = table
+        # keep the worksheets order of the library
+        self._tables = OrderedDict(
+            (sheet, self._tables[sheet]) for sheet in library if sheet in self._tables)
+        self.__index_names()
+
+    def share(self):
+        """Copy the numeric columns into one shared memory block, so worker
+        processes map the library instead of unpickling a copy each.
+
+        Returns:
+            tuple: (SharedMemory, layout), the block is owned by the caller
+            who closes and unlinks it, the small picklable layout is given to
+            attach() in the workers
+        """
+        # only imported by the process pool sweeps
+        from multiprocessing.shared_memory import SharedMemory
+        arrays = [column for table in self._tables.values()
+                  for column in table._columns.values() if isinstance(column, np.ndarray)]
+        shm = SharedMemory(create=True, size=max(1, sum(array.nbytes for array in arrays)))
+        offset, tables = 0, []
+        for sheet, table in self._tables.items():
+            columns = []
+            for attribute, column in table._columns.items():
+                if not isinstance(column, np.ndarray):
+                    columns.append((attribute, column))
+                elif column is table._columns.get('mass') and attribute == 'buoyancy':
+                    # the buoyancy alias of the mass shares its array
+                    columns.append((attribute, 'mass'))
+                else:
+                    np.ndarray(column.shape, np.float64, shm.buf, offset)[:] = column
+                    columns.append((attribute, (offset, len(column))))
+                    offset += column.nbytes
+            tables.append((sheet, table.names, columns, table.descriptions))
+        return shm, {'name': shm.name, 'tables': tables}
+
+    @classmethod
+    def attach(cls, layout):
+        """Build a library on the shared memory block of share(), its
+        numeric columns are read-only views on the block
+
+        Args:
+            layout (dict): the layout returned by share()
+
+        Returns:
+            tuple: (ComponentLibrary, SharedMemory), the block must stay
+            open while the library is used
+        """
+        from multiprocessing.shared_memory import SharedMemory
+        shm = SharedMemory(name=layout['name'])
+        tables = OrderedDict()
+        for sheet, names, columns, descriptions in layout['tables']:
+            arrays = OrderedDict()
+            for attribute, column in columns:
+                if isinstance(column, tuple):
+                    offset, count = column
+                    column = np.ndarray((count,), np.float64, shm.buf, offset)
+                    column.flags.writeable = False
+                elif isinstance(column, str):
+                    column = arrays[column]
+                arrays[attribute] = column
+            tables[sheet] = ComponentTable(sheet, names, arrays, descriptions)
+        return cls(tables), shm
+
+    @classmethod
+    def from_dict(cls, library):
+        """Build the model from the excel2json dictionary
+
+        Args:
+            library (Mapping): worksheet -> row -> {header: value}
+
+        Returns:
+            ComponentLibrary: the typed library
+        """
+        logger = logging.getLogger(NAME)
+        tables = OrderedDict()
+        for sheet, rows in library.items():
+            table = None if rows is None else ComponentTable.from_rows(sheet, rows)
+            if table is None:
+                logger.info(f"Worksheet {sheet} has no component attributes, skipped.")
+                continue
+            tables[sheet] = table
+        return cls(tables)
+
+    @classmethod
+    def from_file(cls, abspath, cache=None, workers=1):
+        """Read an Excel library and build the model
+
+        Args:
+            abspath (str): path to the Excel library file
+            cache (LibraryCache, optional): on-disk cache of converted
+            libraries. Defaults to None.
+            workers (int, optional): processes converting the worksheets,
+            see excel2json. Defaults to 1.
+
+        Returns:
+            ComponentLibrary: the typed library
+        """
+        return cls.from_dict(excel2json(abspath, cache=cache, workers=workers).toDict())
@@ -0,0 +1,144 @@
+"""Qt table model exposing a library worksheet to a QTableView."""
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from PySide6.QtGui import QBrush, QColor
+
+
+class LibraryTableModel(QAbstractTableModel):
+    """This class expose the rows of one library worksheet to a QTableView.
+    Nothing is copied and no widget is created per cell, the view only
+    asks for the visible cells.
+
+    The spreadsheet colour scheme is given as role data: the first
+    column in red, the first row (attributes or titles) in green, other
+    cells in black on a white background. The brushes are shared by all
+    the models and replaced by set_colors() when the theme changes.
+    """
+
+    FIRST_COLUMN_COLOR = 'red'
+    FIRST_ROW_COLOR = 'green'
+    TEXT_COLOR = 'black'
+    BACKGROUND_COLOR = 'white'
+
+    # role -> brush, shared by all the worksheets
+    _brushes = {
+        'first_column': QBrush(QColor(FIRST_COLUMN_COLOR)),
+        'first_row': QBrush(QColor(FIRST_ROW_COLOR)),
+        'text': QBrush(QColor(TEXT_COLOR)),
+        'background': QBrush(QColor(BACKGROUND_COLOR)),
+    }
+
+    def __init__(self, rows=None, parent=None):
+        """LibraryTableModel constructor
+
+        Args:
+            rows (Mapping, optional): row number -> {header: value}. Defaults to None.
+            parent (QObject, optional): the Qt parent. Defaults to None.
+        """
+        super(LibraryTableModel, self).__init__(parent)
+        self._keys = []
+        self._rows = []
+        self._header = []
+        self.set_rows(rows)
+
+    @classmethod
+    def set_colors(cls, colors):
+        """Replace the cell colours of every model, the views pick them up
+        when they are repainted.
+
+        Args:
+            colors (dict): colour name of 'first_column', 'first_row',
+            'text' and 'background', other keys are ignored
+        """
+        cls._brushes = {
+            key: QBrush(QColor(colors.get(key, brush.color().name())))
+            for key, brush in cls._brushes.items()}
+
+    def set_rows(self, rows):
+        """Replace the worksheet rows and reset the attached views.
+
+        Args:
+            rows (Mapping): row number -> {header: value}
+        """
+        rows = rows or {}
+        self.beginResetModel()
+        self._keys = list(rows)
+        self._rows = [rows[key] for key in self._keys]
+        self._header = list(rows[self._keys[0]]) if self._keys else []
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        """Qt override, number of worksheet rows"""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        """Qt override, number of worksheet columns"""
+        return 0 if parent.isValid() else len(self._header)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Qt override, return the value or colours of a cell"""
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            return str(self._rows[row][self._header[col]])
+        if role == Qt.ForegroundRole:
+            if not row:
+                return self._brushes['first_row']
+            return self._brushes['text' if col else 'first_column']
+        if role == Qt.BackgroundRole:
+            return self._brushes['background']
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Qt override, column headers and worksheet row numbers"""
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return str(self._header[section])
+        return self._keys[section]
+
+    def row_values(self, row):
+        """Return the values of a row as a header -> value dictionary."""
+        return dict(self._rows[row])
+
+    def row_key(self, row):
+        """Return the worksheet row number of a model row."""
+        return self._keys[row]
+
+
+class LibraryFilterModel(QSortFilterProxyModel):
+    """This class show the rows of a LibraryTableModel found by a library
+    search, the first row (attributes or titles) is always shown. The
+    source model and its view are left untouched by a new search.
+    """
+
+    def __init__(self, parent=None):
+        """LibraryFilterModel constructor
+
+        Args:
+            parent (QObject, optional): the Qt parent. Defaults to None.
+        """
+        super(LibraryFilterModel, self).__init__(parent)
+        self._accepted = None
+
+    def set_accepted(self, rows):
+        """Show only the given worksheet rows.
+
+        Args:
+            rows (set): worksheet row numbers, None to show every row
+        """
+        if hasattr(self, 'beginFilterChange'):
+            # Qt >= 6.9, invalidateRowsFilter() is deprecated
+            self.beginFilterChange()
+            self._accepted = None if rows is None else set(rows)
+            self.endFilterChange(QSortFilterProxyModel.Direction.Rows)
+        else:
+            self._accepted = None if rows is None else set(rows)
+            self.invalidateRowsFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        """Qt override, keep the first row and the accepted ones"""
+        if self._accepted is None or source_row == 0:
+            return True
+        return self.sourceModel().row_key(source_row) in self._accepted
@@ -9,30 +9,60 @@
 """A class that allows to display a library of components in table panel."""
 
 import logging
+from time import monotonic
+from collections import OrderedDict
+from PySide6.QtCore import Qt, Signal, QThreadPool, QTimer
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QLabel,
+    QLineEdit,
     QMdiArea,
-    QScrollArea,
-    QGridLayout,
+    QTableView,
+    QHeaderView,
 )
 
-from excel2json import excel2json
-from constants import STYLE_SPREADSHEET_TEXT
+from excel2json import excel2json, diff_library
+from library_index import LibraryIndex
+from library_model import ComponentLibrary
+from library_loader import LibraryLoader
+from library_table_model import LibraryTableModel, LibraryFilterModel
+from logger import get_trace
+from constants import SPREADSHEET_TABLE, SPREADSHEET_PROPERTY
 from version import NAME
 
+# number of rows used to size the columns of a worksheet
+RESIZE_PRECISION = 100
+SEARCH_HINT = 'Search: name, category, mass < 5 kg, buoyancy > 20 ...'
+
 
 class LibraryWidget(QWidget):
     """This class display a library in a table panel.
+    The table of a worksheet is only built when its tab is first activated.
     """
 
-    def __init__(self, filename):
+    # emitted as (loaded worksheets, total worksheets) during a background load
+    progress = Signal(int, int)
+    # emitted when a background load is finished
+    loaded = Signal()
+    # emitted with the error message when a background load failed
+    failed = Signal(str)
+
+    def __init__(self, filename, cache=None, background=False, workers=1, release_after=0):
         """LibraryWidget constructor
 
         Args:
             filename (string): The Excel .xls library file
+            cache (LibraryCache, optional): on-disk cache of converted
+            libraries. Defaults to None.
+            background (bool, optional): parse the library in a worker thread,
+            worksheets are displayed as they are loaded. Defaults to False.
+            workers (int, optional): number of processes converting the
+            worksheets. Defaults to 1.
+            release_after (int, optional): release the table of a worksheet
+            whose tab has been hidden for more than release_after seconds,
+            0 to keep them. Defaults to 0.
         """
         #super(QWidget, self).__init__()
         super(LibraryWidget, self).__init__()
@@ -40,18 +70,137 @@ class LibraryWidget(QWidget):
         self.__logger = logging.getLogger(NAME)
 
         self.file_name = filename
+        self.cache = cache
+        self.workers = workers
+        self.release_after = release_after
         self.library_layout = QVBoxLayout(self)
+        self.library = None
+        self.index = None
+        self.components = None
+        # MDI subwindow of each worksheet, table model of the built ones
+        self.subwindows = OrderedDict()
+        self.models = {}
+        # search filter of each built worksheet table
+        self.filters = {}
+        # worksheet -> rows found by the current search, None shows all
+        self.__matches = None
+        self.__loader = None
+        # subwindow showing the error of the last background load
+        self.__error_window = None
+        self.__loaded_sheets = set()
+        # rows received from a background load which is not yet finished
+        self.__pending_rows = {}
+        # time when each built worksheet tab was hidden
+        self.__hidden_since = {}
+        # Qt activates a subwindow when it is added, these activations must
+        # not build the worksheet tables
+        self.__building = False
+        # a build of the active worksheet is queued in the event loop
+        self.__build_pending = False
 
-        # convert Excel to JSON to python dict
-        self.library = self.read()
-
-        # Initialize tab screen
-        #self.tabWidget = QTabWidget()
-        self.library_area = self.display()
+        if background:
+            self.library_area = QMdiArea(self)
+            self.library_area.setViewMode(QMdiArea.ViewMode.TabbedView)
+            self.library_area.subWindowActivated.connect(self.__sheet_activated)
+            self.load()
+        else:
+            # convert Excel to JSON to python dict
+            self.library = self.read()
+            # name and category index and typed model, updated on refresh
+            self.index = LibraryIndex(self.library.toDict())
+            self.components = ComponentLibrary.from_dict(self.library.toDict())
+            # Initialize tab screen
+            self.library_area = self.display()
+        # the search filters the worksheet tables as the user types
+        self.search = QLineEdit(self)
+        self.search.setPlaceholderText(SEARCH_HINT)
+        self.search.setClearButtonEnabled(True)
+        self.search.textChanged.connect(self.filter)
+        self.library_layout.addWidget(self.search)
         self.library_layout.addWidget(self.library_area)
         self.setLayout(self.library_layout)
         self.resize(400, 201)
-        #sheet_names = library.worksheets
+
+        if self.release_after > 0:
+            self.__release_timer = QTimer(self)
+            self.__release_timer.timeout.connect(self.release_hidden_sheets)
+            self.__release_timer.start(max(1, int(self.release_after * 500)))
+
+    def is_loaded(self):
+        """Return True once the library has been read"""
+        return self.library is not None
+
+    def is_loading(self):
+        """Return True while a background load is running"""
+        return self.__loader is not None
+
+    def load(self):
+        """Parse the library and build its models in a QThreadPool worker,
+        each worksheet tab is added when it is converted
+        """
+        self.library = None
+        self.index = None
+        self.components = None
+        self.__clear_sheets()
+        self.__loader = LibraryLoader(
+            self.file_name, cache=self.cache, workers=self.workers)
+        self.__loader.signals.sheet_loaded.connect(self.__sheet_loaded)
+        self.__loader.signals.finished.connect(self.__loaded)
+        self.__loader.signals.error.connect(self.__load_error)
+        QThreadPool.globalInstance().start(self.__loader)
+
+    def __sheet_loaded(self, worksheet, worksheets, rows):
+        """A worksheet has been converted by the background load"""
+        for name in worksheets:
+            if name not in self.subwindows:
+                self.subwindows[name] = self.__add_sheet(
+                    self.library_area, name, self.__placeholder(f"Loading {name}..."))
+        self.__pending_rows[worksheet] = rows
+        self.__set_sheet_widget(worksheet, self.__placeholder(worksheet))
+        active = self.library_area.activeSubWindow()
+        if active is None:
+            self.library_area.setActiveSubWindow(self.subwindows[worksheets[0]])
+        elif active is self.subwindows[worksheet]:
+            self.__sheet_activated(active)
+        # worksheets may be converted out of order by a process pool
+        self.__loaded_sheets.add(worksheet)
+        self.progress.emit(len(self.__loaded_sheets), len(worksheets))
+
+    def __loaded(self, library, index, components):
+        """Background load finished, keep the library and its models"""
+        self.library = library
+        self.index = index
+        self.components = components
+        self.__loader = None
+        self.__pending_rows = {}
+        self.filter(self.search.text())
+        self.loaded.emit()
+
+    def __load_error(self, message):
+        """Background load failed, the worksheets received so far are
+        removed so that the library can be loaded again
+        """
+        self.__loader = None
+        self.__clear_sheets()
+        self.__error_window = self.library_area.addSubWindow(QLabel(message))
+        self.__error_window.show()
+        self.failed.emit(message)
+
+    def __clear_sheets(self):
+        """Remove the worksheet tabs and the error of a previous load"""
+        windows = list(self.subwindows.values())
+        if self.__error_window is not None:
+            windows.append(self.__error_window)
+        for cate in windows:
+            self.library_area.removeSubWindow(cate)
+            cate.deleteLater()
+        self.subwindows = OrderedDict()
+        self.models = {}
+        self.filters = {}
+        self.__error_window = None
+        self.__loaded_sheets = set()
+        self.__pending_rows = {}
+        self.__hidden_since = {}
 
     def read(self):
         """Read and convert Excel file to JSON Python dictionary
@@ -59,52 +208,226 @@ class LibraryWidget(QWidget):
         Returns:
             dict: a dictionary description of the library file
         """
-        return excel2json(self.file_name)
+        return excel2json(self.file_name, cache=self.cache, workers=self.workers)
 
     def display(self):
-        """Display library inside MDI window in table panel
+        """Display library inside MDI window in table panel, each
+        worksheet table is built when its tab is activated
 
         Returns:
             QMdiArea: an instance of a QMdiArea object
         """
         library_area = QMdiArea(self)
-        library = self.library.toDict()
+        self.library_area = library_area
+        # display each subwindows with tab layout
+        library_area.setViewMode(QMdiArea.ViewMode.TabbedView)
+        library_area.subWindowActivated.connect(self.__sheet_activated)
+        self.subwindows = OrderedDict()
+        self.models = {}
         for worksheet in self.library.worksheets:
-            library_widget = QWidget()
-            cate = library_area.addSubWindow(library_widget)
+            self.subwindows[worksheet] = self.__add_sheet(
+                library_area, worksheet, self.__placeholder(worksheet))
+        # only the first worksheet table is built
+        if self.subwindows:
+            library_area.setActiveSubWindow(next(iter(self.subwindows.values())))
+        return library_area
+
+    @staticmethod
+    def __placeholder(text):
+        """Return the widget shown in place of a worksheet table"""
+        placeholder = QLabel(text)
+        placeholder.setProperty(SPREADSHEET_PROPERTY, True)
+        placeholder.setAlignment(Qt.AlignCenter)
+        return placeholder
+
+    def __add_sheet(self, library_area, worksheet, widget):
+        """Add a worksheet subwindow to the MDI area, its content is held
+        by a container so that it can be replaced without activating the
+        subwindow
+
+        Returns:
+            QMdiSubWindow: the worksheet subwindow
+        """
+        container = QWidget()
+        container_layout = QVBoxLayout(container)
+        container_layout.setContentsMargins(0, 0, 0, 0)
+        container_layout.addWidget(widget)
+        active = library_area.activeSubWindow()
+        self.__building = True
+        try:
+            cate = library_area.addSubWindow(container)
             cate.setWindowTitle(worksheet)
             cate.setWindowIcon(QIcon('exit24.png'))
-            # display each subwindows with tab layout
-            library_area.setViewMode(QMdiArea.ViewMode.TabbedView)
+            cate.show()
+            if active is not None:
+                library_area.setActiveSubWindow(active)
+        finally:
+            self.__building = False
+        return cate
+
+    def __set_sheet_widget(self, worksheet, widget):
+        """Replace the content of a worksheet subwindow"""
+        container_layout = self.subwindows[worksheet].widget().layout()
+        while container_layout.count():
+            old_widget = container_layout.takeAt(0).widget()
+            if old_widget is not None:
+                old_widget.deleteLater()
+        container_layout.addWidget(widget)
+
+    def __sheet_rows(self, worksheet):
+        """Return the rows of a worksheet, None if not yet loaded"""
+        if self.library is not None:
+            return self.library.toDict()[worksheet]
+        return self.__pending_rows.get(worksheet)
+
+    def __sheet_activated(self, cate):
+        """A worksheet tab is activated, its table is built from the event
+        loop: Qt activates each subwindow in turn when the area is shown,
+        only the tab active at the end is built
+        """
+        if self.__building or self.__build_pending:
+            return
+        self.__build_pending = True
+        QTimer.singleShot(0, self.__build_active_sheet)
+
+    def __build_active_sheet(self):
+        """Build the table of the active worksheet the first time it is shown"""
+        self.__build_pending = False
+        cate = self.library_area.activeSubWindow()
+        for worksheet, subwindow in self.subwindows.items():
+            if subwindow is cate:
+                break
+        else:
+            return
+        now = monotonic()
+        for name in self.models:
+            if name != worksheet:
+                self.__hidden_since.setdefault(name, now)
+        self.__hidden_since.pop(worksheet, None)
+        if worksheet in self.models:
+            return
+        rows = self.__sheet_rows(worksheet)
+        if rows is None:
+            return
+        self.__set_sheet_widget(worksheet, self.display_sheet(worksheet, rows))
+
+    def release_hidden_sheets(self):
+        """Release the tables of the worksheets hidden for more than
+        release_after seconds, they are built again when shown
+
+        Returns:
+            list: the released worksheets
+        """
+        now = monotonic()
+        released = [worksheet for worksheet, since in self.__hidden_since.items()
+                    if now - since >= self.release_after]
+        for worksheet in released:
+            del self.__hidden_since[worksheet]
+            self.models.pop(worksheet, None)
+            self.filters.pop(worksheet, None)
+            self.__set_sheet_widget(worksheet, self.__placeholder(worksheet))
+            self.__logger.debug("Worksheet %s released", worksheet)
+        return released
+
+    def display_sheet(self, worksheet, rows=None):
+        """Build the table panel of one worksheet
+
+        Args:
+            worksheet (str): worksheet name
+            rows (Mapping, optional): the worksheet rows. Defaults to the
+            rows of the loaded library.
+
+        Returns:
+            QWidget: the widget holding the table view
+        """
+        if rows is None:
+            rows = self.library.toDict()[worksheet]
+        trace = get_trace('table')
+        with trace.span(worksheet) as span:
+            library_widget = QWidget()
             group_layout = QVBoxLayout()
-            scroll_area = QScrollArea()
-            group_layout.addWidget(scroll_area)
-            scrolled_widget = QWidget()
-            # display the first layout grid with desciption (names) of each column
-            grid = QGridLayout(scrolled_widget)
-            names = list(library[worksheet]['1'].keys())
-            for col, name in enumerate(names):
-                label = QLabel(name)
-                label.setStyleSheet(STYLE_SPREADSHEET_TEXT)
-                grid.addWidget(label, 0, col)
-            # for each row
-            rows = list(library[worksheet].keys())
-            for ind_row, row in enumerate(rows):
-                # display column value
-                columns = list(library[worksheet][row].keys())
-                for col, name in enumerate(columns):
-                    self.__logger.debug(
-                        "col: %d, %s, name: %s, %s", col, type(col), name, type(name))
-                    label = QLabel(str(library[worksheet][row][name]))
-                    color = 'black' if col else 'red'
-                    if not ind_row:
-                        color = 'green'
-                    style_sheet = \
-                        f"background-color : white; color : {color}; border: 1px solid black"
-                    label.setStyleSheet(style_sheet)
-                    grid.addWidget(label, 1+ind_row, col)
-            grid.setSpacing(0)
-            scroll_area.setWidget(scrolled_widget)
-            library_widget.setLayout(group_layout)
+            # only the visible cells are painted by the view
+            table_view = QTableView()
+            model = LibraryTableModel(rows, table_view)
+            self.models[worksheet] = model
+            self.filters[worksheet] = LibraryFilterModel(table_view)
+            self.filters[worksheet].setSourceModel(model)
+            if self.__matches is not None:
+                self.filters[worksheet].set_accepted(self.__matches.get(worksheet, ()))
+            table_view.setModel(self.filters[worksheet])
+            table_view.setShowGrid(True)
+            # styled by the application stylesheet, see theme.apply_theme()
+            table_view.setObjectName(SPREADSHEET_TABLE)
+            table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+            # size the columns on a sample of rows, not on the whole worksheet
+            table_view.horizontalHeader().setResizeContentsPrecision(RESIZE_PRECISION)
+            table_view.resizeColumnsToContents()
+            if trace:
+                span.add('rows', model.rowCount())
+                span.add('cells', model.rowCount() * model.columnCount())
+        group_layout.addWidget(table_view)
+        library_widget.setLayout(group_layout)
+        return library_widget
 
-        return library_area
+    def refresh(self):
+        """Read the library file again and update only the worksheets
+        that changed since the previous read. Worksheets never shown are
+        built from the new rows when their tab is activated.
+
+        Returns:
+            OrderedDict: worksheet -> SheetDiff of the changed worksheets
+        """
+        previous = self.library.toDict()
+        self.library = self.read()
+        library = self.library.toDict()
+        diffs = diff_library(previous, library)
+        if not diffs:
+            return diffs
+        self.index.update(library)
+        self.components.update(library, diffs)
+        for worksheet in diffs:
+            if worksheet not in library:
+                cate = self.subwindows.pop(worksheet)
+                self.models.pop(worksheet, None)
+                self.filters.pop(worksheet, None)
+                self.__hidden_since.pop(worksheet, None)
+                self.library_area.removeSubWindow(cate)
+                cate.deleteLater()
+            elif worksheet in self.models:
+                # the view repaints its visible rows only
+                self.models[worksheet].set_rows(library[worksheet])
+            elif worksheet not in self.subwindows:
+                self.subwindows[worksheet] = self.__add_sheet(
+                    self.library_area, worksheet, self.__placeholder(worksheet))
+            self.__logger.debug("Worksheet %s refreshed: %s", worksheet, diffs[worksheet])
+        self.filter(self.search.text())
+        return diffs
+
+    def filter(self, text):
+        """Show the components found by a search in every worksheet, see
+        LibraryIndex.query(). Only the filters of the built tables are
+        updated, the tables themselves are not rebuilt.
+
+        Args:
+            text (str): the query, empty to show all the components
+
+        Returns:
+            list: the names of the components found, None when not filtering
+        """
+        if self.index is None or not text.strip():
+            self.__matches = None
+            names = None
+        else:
+            names = self.index.query(text)
+            self.__matches = {}
+            # the duplicates of a component found are shown with it
+            for name in names:
+                for sheet, row in self.index.locations(name):
+                    self.__matches.setdefault(sheet, set()).add(row)
+        for worksheet, proxy in self.filters.items():
+            proxy.set_accepted(None if self.__matches is None
+                               else self.__matches.get(worksheet, ()))
+        for worksheet, cate in self.subwindows.items():
+            cate.setWindowTitle(worksheet if self.__matches is None else
+                                f"{worksheet} ({len(self.__matches.get(worksheet, ()))})")
+        return names
@@ -2,6 +2,7 @@
 
 import logging
 import sys
+from time import perf_counter
 
 from version import NAME
 
@@ -22,6 +23,9 @@ LOG_FORMATS = {
     'LOG': '%(levelname)-5s %(asctime)s [%(filename)s:%(lineno)d]  %(message)s',
 }
 
+# subsystems whose hot paths can be traced, see enable_trace()
+TRACE_SUBSYSTEMS = ('excel2json', 'table')
+
 
 def configure_logger(stream_level='INFO', debug_file=None):
     """Configure logging with the given level.
@@ -61,3 +65,123 @@ def configure_logger(stream_level='INFO', debug_file=None):
     logger.addHandler(stream_handler)
 
     return logger
+
+
+class Span:
+    """Aggregate counters and elapsed time of one traced unit of work,
+    a worksheet for instance, logged once when the span is closed.
+    """
+
+    __slots__ = ('trace', 'name', 'counters', 'start')
+
+    def __init__(self, trace, name):
+        self.trace = trace
+        self.name = name
+        self.counters = {}
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.trace.record(self.name, self.counters, perf_counter() - self.start)
+        return False
+
+    def add(self, counter, value=1):
+        """Increment a counter of the span"""
+        self.counters[counter] = self.counters.get(counter, 0) + value
+
+
+class Trace:
+    """Hot path instrumentation of an enabled subsystem."""
+
+    __slots__ = ('subsystem', 'logger')
+
+    def __init__(self, subsystem):
+        self.subsystem = subsystem
+        self.logger = logging.getLogger(NAME)
+
+    def __bool__(self):
+        return True
+
+    def span(self, name):
+        """Return a context manager collecting the counters of name"""
+        return Span(self, name)
+
+    def record(self, name, counters, elapsed):
+        """Log the aggregate counters of a closed span"""
+        values = ', '.join(f"{counter}={value}" for counter, value in counters.items())
+        self.logger.info("trace %s %s: %s in %.3f ms",
+                         self.subsystem, name, values, elapsed * 1000)
+
+
+class NullSpan:
+    """Span of a disabled subsystem, every call is a no-op."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def add(self, counter, value=1):
+        """Nothing is counted"""
+
+
+class NullTrace:
+    """Trace of a disabled subsystem, false in a boolean context so that
+    a hot loop can skip its instrumentation with a single test.
+    """
+
+    __slots__ = ()
+
+    def __bool__(self):
+        return False
+
+    def span(self, name):
+        """Return the shared no-op span"""
+        return NULL_SPAN
+
+    def record(self, name, counters, elapsed):
+        """Nothing is logged"""
+
+
+NULL_SPAN = NullSpan()
+NULL_TRACE = NullTrace()
+
+# enabled subsystem -> Trace
+_traces = {}
+
+
+def enable_trace(*subsystems):
+    """Enable the hot path instrumentation of the given subsystems.
+
+    Args:
+        subsystems (str): names from TRACE_SUBSYSTEMS
+    """
+    for subsystem in subsystems:
+        if subsystem not in TRACE_SUBSYSTEMS:
+            raise ValueError(f"Unknown trace subsystem {subsystem}, "
+                             f"expected one of {', '.join(TRACE_SUBSYSTEMS)}")
+        _traces[subsystem] = Trace(subsystem)
+
+
+def disable_trace(*subsystems):
+    """Disable the instrumentation of the given subsystems, all if none."""
+    for subsystem in subsystems or list(_traces):
+        _traces.pop(subsystem, None)
+
+
+def get_trace(subsystem):
+    """Return the Trace of a subsystem, NULL_TRACE when it is disabled.
+
+    Args:
+        subsystem (str): name from TRACE_SUBSYSTEMS
+
+    Returns:
+        Trace: the subsystem instrumentation
+    """
+    return _traces.get(subsystem, NULL_TRACE)
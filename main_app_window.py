@@ -26,8 +26,10 @@ from PySide6.QtWidgets import (
     QDockWidget,
 )
 
-from library_widget import LibraryWidget
+from app_resources import register_resources
+from library_cache import LibraryCache
 from config_window import ConfigWindow
+from constants import DESIGN_FILTER, SAVE_FILTER, RECENT_FILES
 from version import NAME, APPNAME, VERSION
 
 class MainAppWindow(QMainWindow, QObject):
@@ -48,13 +50,30 @@ class MainAppWindow(QMainWindow, QObject):
         """
         super(MainAppWindow, self).__init__()
         self.setWindowTitle(f"{NAME} v{VERSION}")
+        # icons of the actions and toolbars, ":name" paths
+        register_resources()
 
         # we use same name for directory and toml configuration file
         self.cfg = ConfigWindow(APPNAME, VERSION)
         self.resize(self.cfg['global']['screen_width'],
                     self.cfg['global']['screen_height'])
         self.file_name = file_name
+        # the opened mooring design, None until its file is read
+        self.design = None
+        # the library panel, created by load_library()
+        self.library = None
         self.library_file_name = library_file_name
+        # number of processes converting the library worksheets
+        library_cfg = self.cfg['library'] or {}
+        self.library_workers = library_cfg.get('workers', 1)
+        self.library_release_after = library_cfg.get('release_after', 0)
+        # target shape error of the rope segments, in m
+        self.solver_accuracy = (self.cfg['solver'] or {}).get('accuracy', 0.1)
+        # solves each version of the design from the previous solution
+        self.solver = None
+        # converted libraries are cached in the user config directory
+        self.library_cache = LibraryCache(
+            os.path.join(self.cfg.config_dir, 'cache'))
 
         # The window’s central widget is a QLabel object that you’ll use to show
         # messages in response to certain user actions. These messages will display
@@ -369,12 +388,66 @@ class MainAppWindow(QMainWindow, QObject):
         self.central_widget.setText("<b>File > New mooring</b> clicked")
 
     def open_file(self):
-        """ Logic for opening an existing file goes here"""
-        self.central_widget.setText("<b>File > Open a mooring...</b> clicked")
+        """ Pick a mooring design file and open it"""
+        (file_name, _) = QFileDialog.getOpenFileName(
+            self, ("Open File"), "designs", DESIGN_FILTER)
+        if file_name:
+            self.open_design_file(file_name)
+
+    def open_design_file(self, file_name):
+        """ Read a mooring design file, a toml one waits for the library"""
+        # the design formats and their numpy arrays are imported on first use
+        from mooring_design import DesignError
+        from design_file import open_design, TOML_EXTENSION
+        self.file_name = file_name
+        self.design = None
+        self.add_recent_file(file_name)
+        components = getattr(self.library, 'components', None)
+        if components is None and os.path.splitext(file_name)[1].lower() == TOML_EXTENSION:
+            self.statusbar.showMessage(f"Load a library to read {file_name}", 3000)
+            return
+        try:
+            self.design = open_design(file_name, components)
+        except DesignError as ex:
+            self.central_widget.setText(f"<b>Unable to open {file_name}:</b> {ex}")
+            return
+        rows = ''.join(
+            f"<tr><td>{element.name}</td><td>{element.sheet}</td><td>{element.length:.1f}</td>"
+            f"<td>{element.count}</td><td>{element.buoyancy:.1f}</td></tr>"
+            for element in self.design)
+        self.central_widget.setText(
+            f"<b>{self.design.name}: bottom depth {self.design.bottom_depth:.1f} m</b>"
+            "<table cellpadding=3><tr><th>Element</th><th>Sheet</th><th>Length (m)</th>"
+            f"<th>Count</th><th>Buoyancy (kg)</th></tr>{rows}</table>")
 
     def save_file(self):
-        """ Logic for saving a file goes here"""
-        self.central_widget.setText("<b>File > Save mooring</b> clicked")
+        """ Save the opened mooring design, its format is given by the
+        file extension, binary by default"""
+        if self.design is None:
+            self.statusbar.showMessage("Open a mooring design before saving it", 3000)
+            return
+        from mooring_design import DesignError
+        from design_file import save_design, DESIGN_EXTENSION
+        (file_name, _) = QFileDialog.getSaveFileName(
+            self, ("Save File"), self.file_name or "designs", SAVE_FILTER)
+        if not file_name:
+            return
+        if not os.path.splitext(file_name)[1]:
+            file_name += DESIGN_EXTENSION
+        try:
+            save_design(file_name, self.design)
+        except (OSError, DesignError) as ex:
+            self.central_widget.setText(f"<b>Unable to save {file_name}:</b> {ex}")
+            return
+        self.file_name = file_name
+        self.add_recent_file(file_name)
+        self.statusbar.showMessage(f"{file_name} saved", 3000)
+
+    def add_recent_file(self, file_name):
+        """ Put a design file on top of the Open Recent menu"""
+        recent = [name for name in self.cfg['global'].get('recent_files', [])
+                  if name != file_name]
+        self.cfg['global']['recent_files'] = [file_name] + recent[:RECENT_FILES - 1]
 
     def copy_content(self):
         """ Logic for copying content goes here"""
@@ -410,7 +483,16 @@ class MainAppWindow(QMainWindow, QObject):
     def load_library(self):
         """ Load library from file"""
         self.edit_toolbar.setDisabled(False)
-        self.library = LibraryWidget(self.library_file_name)
+        # the library is parsed in a worker thread, the dock is filled
+        # in as each worksheet is converted
+        # the library panel and its numpy models are imported on first use
+        from library_widget import LibraryWidget
+        self.library = LibraryWidget(
+            self.library_file_name, cache=self.library_cache, background=True,
+            workers=self.library_workers, release_after=self.library_release_after)
+        self.library.progress.connect(self.library_progress)
+        self.library.loaded.connect(self.library_loaded)
+        self.library.failed.connect(self.library_failed)
         self.library.setMinimumWidth(
             floor(self.cfg['global']['screen_width']/2))
         self.library.setMinimumHeight(200)
@@ -423,17 +505,34 @@ class MainAppWindow(QMainWindow, QObject):
         # send a signal to statusbar for testing only
         self.trigger.emit()
 
+    def library_loaded(self):
+        """ Read the toml design file waiting for the library"""
+        self.statusbar.showMessage("Library loaded", 3000)
+        if self.file_name and self.design is None:
+            self.open_design_file(self.file_name)
+
+    def library_failed(self, message):
+        """ Display the error of the library load in the status bar"""
+        self.statusbar.showMessage(f"Unable to load the library: {message}", 5000)
+
     def refresh_library(self):
-        """ insert doc here"""
+        """ Reload the library file, only the changed worksheets are rebuilt"""
         if self.edit_toolbar.isEnabled():
-            self.library.read()
-            self.library.library_layout.removeWidget(self.library.library_area)
-            self.library.library_area.close()
-            self.library.display()
-            self.library.library_layout.addWidget(self.library.library_area)
+            if not self.library.is_loaded():
+                # a failed load is started again, a running one is awaited
+                if not self.library.is_loading():
+                    self.library.load()
+                return
+            diffs = self.library.refresh()
+            self.statusbar.showMessage(
+                f"Library refreshed, {len(diffs)} worksheet(s) updated", 3000)
         else:
             self.load_library()
-            self.library.display()
+
+    def library_progress(self, loaded, total):
+        """ Display the library loading progress in the status bar"""
+        self.statusbar.showMessage(
+            f"Loading library: {loaded}/{total} worksheets")
 
     def open_excel_library(self):
         """ insert doc here"""
@@ -456,10 +555,38 @@ class MainAppWindow(QMainWindow, QObject):
             "<b>setenv Configuration</b> clicked")
 
     def start_simulate(self):
-        """ insert doc here"""
-        # Logic for pasting content goes here...
+        """ Solve the static equilibrium of the mooring design file with
+        the loaded library and display the per element results"""
+        if not self.file_name:
+            (file_name, _) = QFileDialog.getOpenFileName(
+                self, ("Open File"), "designs", DESIGN_FILTER)
+            if not file_name:
+                return
+            self.open_design_file(file_name)
+        elif self.design is None:
+            self.open_design_file(self.file_name)
+        if self.design is None:
+            return
+        # the solver and its numpy arrays are imported on first use
+        from solver import IncrementalSolver, SolverError
+        from simulation import simulate
+        if self.solver is None:
+            self.solver = IncrementalSolver(self.solver_accuracy)
+        try:
+            result = simulate(self.design, solver=self.solver)
+        except SolverError as ex:
+            self.central_widget.setText(f"<b>Simulation failed:</b> {ex}")
+            return
+        rows = ''.join(
+            f"<tr><td>{name}</td><td>{depth:.1f}</td><td>{x:.1f}</td><td>{angle:.1f}</td>"
+            f"<td>{knock_down:.1f}</td><td>{tension:.1f}</td></tr>"
+            for name, depth, x, angle, knock_down, tension in zip(
+                result['name'], result['depth_top'], result['x_top'], result['angle'],
+                result['knock_down'], result['tension_bottom']))
         self.central_widget.setText(
-            "<b>Simulate > Start simulation</b> clicked")
+            f"<b>{result.summary()}</b><table cellpadding=3>"
+            "<tr><th>Element</th><th>Depth (m)</th><th>Offset (m)</th><th>Angle (deg)</th>"
+            f"<th>Knock-down (m)</th><th>Tension (kg)</th></tr>{rows}</table>")
 
     def generate_report(self, action=None):
         """ insert doc here"""
@@ -485,7 +612,7 @@ class MainAppWindow(QMainWindow, QObject):
         self.open_recent_menu.clear()
         # Step 2. Dynamically create the actions
         actions = []
-        filenames = [f"File-{n}" for n in range(5)]
+        filenames = self.cfg['global'].get('recent_files', [])
         for filename in filenames:
             action = QAction(filename, self)
             action.triggered.connect(partial(self.open_recent_file, filename))
@@ -494,9 +621,13 @@ class MainAppWindow(QMainWindow, QObject):
         self.open_recent_menu.addActions(actions)
 
     def open_recent_file(self, filename):
-        """ insert doc here"""
-        # Logic for opening a recent file goes here...
-        self.central_widget.setText(f"<b>{filename}</b> opened")
+        """ Open a design file of the Open Recent menu"""
+        if not os.path.isfile(filename):
+            self.cfg['global']['recent_files'] = [
+                name for name in self.cfg['global'].get('recent_files', []) if name != filename]
+            self.statusbar.showMessage(f"{filename} not found", 3000)
+            return
+        self.open_design_file(filename)
 
     def get_word_count(self):
         """ insert doc here"""
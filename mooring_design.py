@@ -0,0 +1,205 @@
+"""Mooring design description, independent of the Qt user interface."""
+
+import logging
+import os
+import toml
+
+from solver import CurrentProfile, SolverError
+from version import NAME
+
+# worksheets whose components are sold by the metre, their length is given
+# by the design and their library mass is per metre
+LINEAR_SHEETS = ('Ropes',)
+
+
+class DesignError(Exception):
+    """Raised when a mooring design file is invalid."""
+
+
+class Element:
+    """One component of a mooring line, from the library or overridden
+    by the design file. The overrides are the attributes given by the
+    design, already merged into attributes.
+    """
+
+    __slots__ = ('name', 'sheet', 'length', 'count', 'attributes', 'overrides')
+
+    def __init__(self, name, sheet, length, count, attributes, overrides=None):
+        self.name = name
+        self.sheet = sheet
+        self.length = length
+        self.count = count
+        self.attributes = attributes
+        self.overrides = overrides or {}
+
+    def __repr__(self):
+        return f"Element({self.name!r}, length={self.length}, count={self.count})"
+
+    @property
+    def is_linear(self):
+        """Getter, True if the library attributes are given per metre"""
+        return self.sheet in LINEAR_SHEETS
+
+    def get(self, attribute, default=0.0):
+        """Return a numeric attribute, default when empty or unknown"""
+        value = self.attributes.get(attribute, default)
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return default
+        return default if value != value else value
+
+    @property
+    def buoyancy(self):
+        """Getter to the net buoyancy of the element in kg, positive upward"""
+        mass = self.get('mass')
+        return mass * self.length if self.is_linear else mass * self.count
+
+
+class MooringDesign:
+    """This class describe a mooring line, its elements are given from
+    the top (surface) to the anchor.
+    """
+
+    def __init__(self, name, bottom_depth, elements, filename=None, current=None):
+        """MooringDesign constructor
+
+        Args:
+            name (str): design name
+            bottom_depth (float): water depth at the anchor, in m
+            elements (list): Element instances from top to bottom
+            filename (str, optional): the design file. Defaults to None.
+            current (CurrentProfile, optional): the current profile,
+            none if omitted. Defaults to None.
+        """
+        self.name = name
+        self.bottom_depth = bottom_depth
+        self.elements = list(elements)
+        self.filename = filename
+        self.current = current
+
+    def __len__(self):
+        return len(self.elements)
+
+    def __iter__(self):
+        return iter(self.elements)
+
+    def __repr__(self):
+        return f"MooringDesign({self.name!r}, {len(self)} elements)"
+
+    @property
+    def length(self):
+        """Getter to the total length of the line, in m"""
+        return sum(element.length for element in self.elements)
+
+    def to_dict(self):
+        """Return the design as written in a toml design file"""
+        elements = []
+        for element in self.elements:
+            item = {'component': element.name}
+            if element.is_linear:
+                item['length'] = element.length
+            if element.count != 1:
+                item['count'] = element.count
+            item.update(element.overrides)
+            elements.append(item)
+        design = {'mooring': {'name': self.name, 'bottom_depth': self.bottom_depth},
+                  'element': elements}
+        if self.current is not None:
+            design['current'] = self.current.to_dict()
+        return design
+
+    @classmethod
+    def from_dict(cls, design, library, filename=None):
+        """Build a design from its dictionary description
+
+        Args:
+            design (dict): [mooring] table and [[element]] array, see load_design()
+            library (ComponentLibrary): the component library
+            filename (str, optional): the design file. Defaults to None.
+
+        Returns:
+            MooringDesign: the design
+        """
+        mooring = design.get('mooring', {})
+        try:
+            bottom_depth = float(mooring['bottom_depth'])
+        except (KeyError, TypeError, ValueError) as ex:
+            raise DesignError(f"[mooring] bottom_depth missing or invalid: {ex}") from ex
+        elements = []
+        for position, item in enumerate(design.get('element', []), start=1):
+            name = item.get('component')
+            if name not in library:
+                raise DesignError(f"Element {position}: unknown component \"{name}\"")
+            attributes = library.component(name)
+            # the design may override the library attributes, ie an anchor mass
+            overrides = {key: value for key, value in item.items()
+                         if key not in ('component', 'length', 'count')}
+            attributes.update(overrides)
+            sheet = attributes['sheet']
+            if sheet in LINEAR_SHEETS and 'length' not in item:
+                raise DesignError(f"Element {position}: {name} needs a length")
+            try:
+                count = int(item.get('count', 1))
+                if sheet in LINEAR_SHEETS:
+                    length = float(item['length'])
+                else:
+                    length = float(item.get('length', attributes.get('length', 0.0))) * count
+                    if length != length:
+                        length = 0.0
+            except (TypeError, ValueError) as ex:
+                raise DesignError(
+                    f"Element {position}: {name} invalid count or length: {ex}") from ex
+            elements.append(Element(name, sheet, length, count, attributes, overrides))
+        if not elements:
+            raise DesignError("The design has no [[element]]")
+        current = None
+        if 'current' in design:
+            try:
+                current = CurrentProfile.from_dict(design['current'])
+            except SolverError as ex:
+                raise DesignError(str(ex)) from ex
+            if current.shape:
+                raise DesignError("[current] speed must be a single profile")
+        return cls(mooring.get('name', ''), bottom_depth, elements, filename, current)
+
+
+def load_design(filename, library):
+    """Read a toml mooring design file
+
+    A design file holds a [mooring] table and an [[element]] array, from
+    the top of the line to the anchor:
+
+        [mooring]
+        name = "PIRATA"
+        bottom_depth = 4000.0  # m
+
+        [[element]]
+        component = "FSAB 1200"
+        [[element]]
+        component = "Nylon 18mm"
+        length = 3500.0  # m, ropes only
+        [[element]]
+        component = "1 Rain train"
+        mass = -900.0  # kg, overrides the library attribute
+
+        [current]  # optional
+        depth = [0.0, 200.0, 1000.0]  # m
+        speed = [1.0, 0.5, 0.1]  # m/s
+
+    Args:
+        filename (str): the design file
+        library (ComponentLibrary): the component library
+
+    Returns:
+        MooringDesign: the design
+    """
+    try:
+        design = toml.load(filename)
+    except (OSError, toml.TomlDecodeError) as ex:
+        raise DesignError(f"Unable to read design file {filename}: {ex}") from ex
+    design = MooringDesign.from_dict(design, library, filename)
+    if not design.name:
+        design.name = os.path.splitext(os.path.basename(filename))[0]
+    logging.getLogger(NAME).debug("Design %s loaded from %s", design.name, filename)
+    return design
@@ -0,0 +1,255 @@
+"""Array backed chain of the components of a mooring line.
+
+The elements of a line are stored from the top to the anchor as
+contiguous NumPy arrays: an element id array, a component code array and
+one array per physical property, so the solver takes the whole line
+without walking linked nodes. An id -> position index gives the linked
+list operations of tools/dll.py Sentinel_DLL on stable element ids.
+"""
+
+import numpy as np
+
+# per element property arrays: dtype and default value
+ELEMENT_PROPERTIES = {
+    'length': (np.float64, 0.0),  # m
+    'count': (np.int64, 1),
+    'buoyancy': (np.float64, 0.0),  # kg, positive upward
+    'area': (np.float64, 0.0),  # m2, frontal area facing the current
+    'normal_cf': (np.float64, 0.0),
+    'tangential_cf': (np.float64, 0.0),
+    'breaking_strength': (np.float64, np.inf),  # kg, unknown when not positive
+    'linear': (np.bool_, False),  # rope sold by the metre
+}
+
+
+class ComponentChain:
+    """This class store the ordered elements of a mooring line as arrays.
+
+    Every element gets an id when inserted, the id stays valid until the
+    element is deleted while its position changes with the insertions
+    above it. Inserting or deleting moves the tail of the arrays, a single
+    memmove, and the arrays grow by doubling so appending is amortized O(1).
+    """
+
+    def __init__(self, capacity=16):
+        """ComponentChain constructor
+
+        Args:
+            capacity (int, optional): initial number of elements the arrays
+            hold before growing. Defaults to 16.
+        """
+        capacity = max(1, capacity)
+        self._size = 0
+        self._next_id = 0
+        self._ids = np.empty(capacity, dtype=np.int64)
+        self._component = np.empty(capacity, dtype=np.int32)
+        self._columns = {key: np.empty(capacity, dtype=dtype)
+                         for key, (dtype, _) in ELEMENT_PROPERTIES.items()}
+        # component name <-> code of the component array
+        self._names = []
+        self._codes = {}
+        # element id -> position, rebuilt on demand after a structural change
+        self._position = {}
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return iter(self._ids[:self._size].tolist())
+
+    def __contains__(self, element_id):
+        return element_id in self.__index()
+
+    def __getitem__(self, key):
+        ''' overloading operators chain[property], a view on the array'''
+        if key == 'component':
+            return self._component[:self._size]
+        return self._columns[key][:self._size]
+
+    def __repr__(self):
+        return f"ComponentChain({len(self)} elements)"
+
+    def __str__(self):
+        return str(self.names)
+
+    @property
+    def ids(self):
+        """Getter to the element ids, from the top to the anchor"""
+        return self._ids[:self._size]
+
+    @property
+    def names(self):
+        """Getter to the component names, from the top to the anchor"""
+        names = self._names
+        return [names[code] for code in self._component[:self._size].tolist()]
+
+    def __index(self):
+        """Return the id -> position index, rebuilt when invalidated"""
+        if self._position is None:
+            self._position = dict(zip(self._ids[:self._size].tolist(), range(self._size)))
+        return self._position
+
+    def position(self, element_id):
+        """Return the position of an element, raise KeyError if unknown."""
+        try:
+            return self.__index()[element_id]
+        except KeyError:
+            raise KeyError(f"Unknown element id {element_id}") from None
+
+    def component(self, element_id):
+        """Return the component name of an element."""
+        return self._names[self._component[self.position(element_id)]]
+
+    def properties(self, element_id):
+        """Return the properties of an element as a dictionary.
+
+        Args:
+            element_id (int): the element id
+
+        Returns:
+            dict: property -> value, with a 'component' key
+        """
+        position = self.position(element_id)
+        properties = {'component': self._names[self._component[position]]}
+        properties.update((key, column[position].item()) for key, column in self._columns.items())
+        return properties
+
+    def __code(self, name):
+        """Return the code of a component name, added if new"""
+        code = self._codes.get(name)
+        if code is None:
+            code = self._codes[name] = len(self._names)
+            self._names.append(name)
+        return code
+
+    def __reserve(self, size):
+        """Grow the arrays to hold size elements"""
+        capacity = len(self._ids)
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity)
+        self._ids = np.resize(self._ids, capacity)
+        self._component = np.resize(self._component, capacity)
+        self._columns = {key: np.resize(column, capacity) for key, column in self._columns.items()}
+
+    def __insert(self, position, name, properties):
+        """Insert an element at position, return its id"""
+        unknown = set(properties).difference(ELEMENT_PROPERTIES)
+        if unknown:
+            raise KeyError(f"Unknown element properties {', '.join(sorted(unknown))}")
+        size = self._size
+        self.__reserve(size + 1)
+        arrays = [self._ids, self._component] + list(self._columns.values())
+        if position < size:
+            for array in arrays:
+                array[position + 1:size + 1] = array[position:size]
+            self._position = None
+        element_id = self._next_id
+        self._next_id += 1
+        self._ids[position] = element_id
+        self._component[position] = self.__code(name)
+        for key, (_, default) in ELEMENT_PROPERTIES.items():
+            self._columns[key][position] = properties.get(key, default)
+        self._size = size + 1
+        if self._position is not None:
+            self._position[element_id] = position
+        return element_id
+
+    def insert_before(self, element_id, name, **properties):
+        """Insert a new element above an element.
+
+        Args:
+            element_id (int): id of the element below the new one
+            name (str): component name
+            **properties: element properties, see ELEMENT_PROPERTIES
+
+        Returns:
+            int: the id of the new element
+        """
+        return self.__insert(self.position(element_id), name, properties)
+
+    def insert_after(self, element_id, name, **properties):
+        """Insert a new element below an element, see insert_before()."""
+        return self.__insert(self.position(element_id) + 1, name, properties)
+
+    def append(self, name, **properties):
+        """Insert a new element at the anchor end, return its id."""
+        return self.__insert(self._size, name, properties)
+
+    def prepend(self, name, **properties):
+        """Insert a new element at the top of the line, return its id."""
+        return self.__insert(0, name, properties)
+
+    def extend(self, names, **columns):
+        """Append many elements at once.
+
+        Args:
+            names (list): component names
+            **columns: property -> array_like of len(names) values
+
+        Returns:
+            np.ndarray: the ids of the new elements
+        """
+        unknown = set(columns).difference(ELEMENT_PROPERTIES)
+        if unknown:
+            raise KeyError(f"Unknown element properties {', '.join(sorted(unknown))}")
+        start, count = self._size, len(names)
+        self.__reserve(start + count)
+        stop = start + count
+        ids = np.arange(self._next_id, self._next_id + count, dtype=np.int64)
+        self._ids[start:stop] = ids
+        self._component[start:stop] = [self.__code(name) for name in names]
+        for key, (_, default) in ELEMENT_PROPERTIES.items():
+            self._columns[key][start:stop] = columns.get(key, default)
+        self._next_id += count
+        self._size = stop
+        self._position = None
+        return ids
+
+    def delete(self, element_id):
+        """Remove an element from the line."""
+        position = self.position(element_id)
+        size = self._size
+        for array in [self._ids, self._component] + list(self._columns.values()):
+            array[position:size - 1] = array[position + 1:size]
+        self._size = size - 1
+        if position < size - 1:
+            self._position = None
+        else:
+            del self._position[element_id]
+
+    def find(self, name):
+        """Return the id of the first element of a component, from the top,
+        None if the line does not hold it.
+        """
+        code = self._codes.get(name)
+        if code is None:
+            return None
+        hits = np.flatnonzero(self._component[:self._size] == code)
+        return int(self._ids[hits[0]]) if hits.size else None
+
+    @classmethod
+    def from_design(cls, design):
+        """Build the chain of the elements of a design
+
+        Args:
+            design (MooringDesign): the design
+
+        Returns:
+            ComponentChain: the elements, from the top to the anchor
+        """
+        elements = design.elements
+        chain = cls(capacity=len(elements))
+        chain.extend(
+            [item.name for item in elements],
+            length=[item.length for item in elements],
+            count=[item.count for item in elements],
+            buoyancy=[item.buoyancy for item in elements],
+            area=[item.get('projected_area') * (item.length if item.is_linear else item.count)
+                  for item in elements],
+            normal_cf=[item.get('nl_drag_cf') for item in elements],
+            tangential_cf=[item.get('tl_drag_cf') for item in elements],
+            breaking_strength=[item.get('breaking_strength', np.inf) for item in elements],
+            linear=[item.is_linear for item in elements],
+        )
+        return chain
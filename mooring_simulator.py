@@ -12,11 +12,11 @@ import sys
 from os import path
 from pathlib import Path
 import argparse
-from PySide6.QtGui import QIcon, QPixmap
-from PySide6.QtWidgets import QApplication
+import multiprocessing
 
-from logger import configure_logger
-from main_app_window import MainAppWindow
+# PySide6 and the main window are imported after the arguments are parsed,
+# a --batch run never loads Qt
+from logger import configure_logger, enable_trace, TRACE_SUBSYSTEMS
 
 
 def process_args():
@@ -27,14 +27,29 @@ def process_args():
     """
     parser = argparse.ArgumentParser(
         description='Mooring simulator program ',
-        usage='\npython MooringSimulator.py --file <file> --lib <file> -d -h\n'
+        usage='\npython MooringSimulator.py --file <file> --lib <file> -w <workers> -t <subsystem> -d -h\n'
+        'python MooringSimulator.py --batch --lib <file> --file <file> [<file> ...] -o <dir> -a <m>\n'
+        'python MooringSimulator.py --sweep --lib <file> --file <file> -o <file> -w <workers>\n'
         ' \n',
         formatter_class=argparse.RawTextHelpFormatter,
         epilog='J. Grelet IRD US191 - March 2021 / April 2021')
-    parser.add_argument('--file',
-                        help='Mooring design file')
+    parser.add_argument('--file', nargs='+',
+                        help='Mooring design file, toml, mdf or json, several ones with --batch')
     parser.add_argument('--lib',
                         help='Libray definition file, Excel or JSON')
+    parser.add_argument('-b', '--batch', action='store_true',
+                        help='simulate the design files without user interface and exit')
+    parser.add_argument('--sweep', action='store_true',
+                        help='simulate every combination of the [sweep] table of the design\n'
+                        'file in a process pool and exit')
+    parser.add_argument('-o', '--output',
+                        help='directory of the --batch results or csv file of the --sweep,\n'
+                        'default is next to each design')
+    parser.add_argument('-a', '--accuracy', type=float, default=0.1,
+                        help='target shape error of the rope segments in m, default is 0.1')
+    parser.add_argument('-w', '--workers', type=int,
+                        help='number of processes converting the library worksheets,\n'
+                        'also with --batch, or running the --sweep designs')
     parser.add_argument('-s', '--size',
                         nargs='+', type=int, default=[],
                         help='select screen size, default is 800 x 600')
@@ -42,6 +57,9 @@ def process_args():
                         action='store_true')
     parser.add_argument('-d', '--debug', help='display debug informations',
                         action='store_true')
+    parser.add_argument('-t', '--trace', action='append', default=[],
+                        choices=TRACE_SUBSYSTEMS,
+                        help='log per worksheet counters of a subsystem hot path')
     parser.add_argument('-l', '--log', help='save log informations',
                         action='store_true')
     return parser
@@ -49,14 +67,23 @@ def process_args():
 # Mooring simulator main program entry point
 if __name__ == "__main__":
 
-    # Create the application handler
-    app = QApplication([])
+    # the sweep and library conversion pools spawn workers, which re-enter here
+    # in a frozen executable
+    multiprocessing.freeze_support()
 
     appName = Path(__file__).with_suffix('').stem
 
     # Recover and process optionnal line arguments
     p = process_args()
     args = p.parse_args()
+    if args.batch and (args.lib is None or not args.file):
+        p.error('--batch needs --lib and --file')
+    if args.sweep and (args.lib is None or not args.file or len(args.file) != 1):
+        p.error('--sweep needs --lib and one --file')
+    if args.accuracy <= 0:
+        p.error('--accuracy must be positive')
+    if args.workers is not None and args.workers < 1:
+        p.error('--workers must be at least 1')
 
     # start logging
     #logger = configure_logger(stream_level='DEBUG' if args.debug else 'INFO', 
@@ -64,6 +91,25 @@ if __name__ == "__main__":
     #global logger
     logger = configure_logger(stream_level='DEBUG' if args.debug else 'INFO',
                               debug_file=Path(appName).with_suffix('.log') if args.log else None)
+    enable_trace(*args.trace)
+
+    # headless simulation of the design files
+    if args.batch:
+        from batch import run_batch
+        sys.exit(run_batch(args.lib, args.file, args.output, accuracy=args.accuracy,
+                           workers=args.workers or 1))
+    if args.sweep:
+        from sweep import run_sweep
+        sys.exit(run_sweep(args.lib, args.file[0], args.output, args.workers,
+                           accuracy=args.accuracy))
+
+    from PySide6.QtGui import QIcon
+    from PySide6.QtWidgets import QApplication
+    from main_app_window import MainAppWindow
+    from theme import apply_theme
+
+    # Create the application handler
+    app = QApplication([])
     logger.info("The program starts")
 
     # Create and show the main application window
@@ -77,6 +123,14 @@ if __name__ == "__main__":
     else:
         main_app_window.library = args.lib
 
+    # open the command line given design, a toml one once the library is loaded
+    if args.file:
+        main_app_window.open_design_file(args.file[0])
+
+    # override the configuration workers setting
+    if args.workers is not None:
+        main_app_window.library_workers = args.workers
+
     # reset config file
     if args.reset:
         main_app_window.cfg.save_default_config()
@@ -90,6 +144,7 @@ if __name__ == "__main__":
 
     # print(QStyleFactory.keys())
     app.setStyle("Fusion")
+    apply_theme(app, main_app_window.cfg['theme'])
 
     # Setting the Application Icon on Windows
     app.setWindowIcon(QIcon(":windows-main.ico"))
@@ -125,6 +180,7 @@ if __name__ == "__main__":
     # Save current config
     main_app_window.cfg.save_config()
     logger.debug(main_app_window.cfg)
+    logger.debug("Library cache %s", main_app_window.library_cache.stats)
 
     # Exit
     logger.info("End of the program ...")
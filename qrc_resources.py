@@ -1,10168 +0,0 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 6.6.2
-# WARNING! All changes made in this file will be lost!
-
-from PySide6 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x06\x1b\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\x00\x00\x00\
-\x09pHYs\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7o\
-\xa8d\x00\x00\x05\xb0IDATXG\xe5\x96iL\
-TW\x14\xc7'6mm4\xb1iU\x5c\x1aM\x1b\
-E\xd9a\x90M\x86\x19fc\x95U\x16e\x15\x95E\
-\x16q\x10\x18\x18\x18`\x18P\x91\xc5%nP\xdbZ\
-\x02%\x1a\x0bbm\xb0Z4hmp\x94]Y\x86\
-uX\x86\x10P,\x14D\xab\xfc{q\xdeGeq\
-\xe1C\xfbKN\xee\xbb\xffs\xee9\xf7\xbe\x99\xbc{\
-h\xff9\x8c\xfc/\xac\xb0\x8d\xa9(\xa2-a}N\
-I\xf3\x0b/\xa2\xdc\xc3\xf7\x0c\xc0\x0e\xfd\xe5\x04%\xcd\
-/\xd6BY\x01O2\x8c-)\xad0\xf68\xc6\xa6\
-\xe4\x0f\xc6\x02C\x9ep\xc9Fn\xdc\x974\x9a\xcd\xa7\
-4\xda\xb2\xc5\xfc\xf8:%3N\x01\xbed\x00v\xf1\
-\x95\xcd$f\x91*\xf4=\xe1\xba\xe7\xe27^)\xf7\
-\x04n\xc9u\x97\x9d\xc4\x0d\xcdv\x09\x0d\x03\xd6\x09\xf5\
-C|Q\xbd\x82/\xaaj\xe1\x8b\xe5`\x09[\xc1\x8c\
-k\x85s\xd60x\xe1\xa5\xd9\xd4\xd2w\xc3\xda;g\
-\xa5\x9f\xb4:\xd7M\xd2<\xee \x1d\x00O\xdc\x0f\xcb\
-\xf8n\xb0\xe2:\xc9\xd8\x05vb\x0f8I}\xb0 \
-\x85\x19B9\x18dd\x8a\xbba/i\x9b4t\xce\
-bPi\xde\x0e\x8f\xd82\xeb\xed\xd2\xe6>{\xc9 \
-6\x0bZa\xb6\xaf\xf1\x95\x19G6\x82\x1e\xde\x08\xfd\
-\xb0F\xe8\x12\xd3\x09k\x82Nx3t\xf7\xb6@/\
-\x92\xd8>9\xcc\x92\x86\xc0\x89\xbe\xdb@\xd2,Te\
-\x9b#n1e\xeen\x12\xf9$+\xb6\x1bF\xe1\x0f\
-`\x10\xfa\x10\x9aAM\xd8\x10\xd8\x8c\xf5\x81-P\x0f\
-j\xc6\xc6\x90Fh\x85\x92\xe2\x11\xcd\xa4\xb0\x1c\x06Q\
-\xad\xa0G\xb7aSl;\x0c\x85\x1d\xe0g\x8c\x80\x19\
-r\xe5\x00\x95r\xf6\xb8G]fxH\xe4/L\x22\
-\xdb\xa1\x15\xd8\x04\xcd\x90.h\x05\xc9\xa1\x15p\x0f\xda\
-\x01\x95\xe3:\xbbd\x13\xba!\x0d\xa0G\xf5\x92\xa2\x0a\
-\xe8\x0bZ`H\x156\x8e\xef\x80IB'\xcc\x12\xbb\
-`\x9e\xda\x0f\x9bt\xc5\x0bS\xdf\x1fYT\xea\x99\x09\
-\x12\xe6.q\x15\xd5t\x1bD\xf4A3\xb0\x03\xda~\
-\x7f\x8c\xe9z\x95\x16k;\x9d\x0eVgD\x9b\xaf5\
-\xf0\xd4X\xa3\x1f\xa0\xa9\xce\x932\xb4\xb7\x15\x87\xe8\x87\
-U5\x19'(a\x1c\xd7\x01\xd3\xa9\xc2bR8Y\
-\x01\x0bi/\xd8\x87\x87a\x9f\x070\x22\xca\x8b\xa9\xf4\
-3c\xb3\xf7\xe61\xb3\xd8Qh\xfa\xfd\xf9\x82\xbe\xed\
-\xfc\x99\xaf\xe9^:\x94\xeb\xb5l\x12T\x95\x9bK\x1f\
-\xabNL\x0a3\xd3\xfa\xc0\xcd\x19\x057{\x04f\xf1\
-\x0d\x0am\xff\x12\xe9R\xfd\xe0\xf5T\xf8\xf4\xd8\x86\xfd\
-\xaan\x15\xdb\x0a=\xdf\xf2:-n\xa4%%\xbf\x91\
-\x0d\x8egW\x99\x88\xe4\xe3\xe6\x12%,\xd2\x94\xa4\xf0\
-\x18\xd8\x19C0\x89\xa9\xa9\xd7\xd8^\x18IB\xd4T\
-\x91\xb3\x84\x1dR&f\xee\xbct\x95<~\xa1R\xa6\
-\x87\x1ez\xdb\x83\x9d\xf978\xd9\xe3`\xa6\xf6\xc2X\
- \xabX\xe7\x92\xe7M\x5c\x8bU\x11sd\xa5a\xd0\
-R2\x90/\xdb\xec0\x8b\xa9\xfb\xd9\xf2\xe00\xe8a\
-\xb7.\xaf\xe5e\xd8\x11\xe9#\x95g\x9e\xd0\x0b\xb8\xe2\
-\xb3\xc6RdOM\xff\x1f,\xe0%\xd4\xfa\xb2\xa2\xef\
-\x88\xa9\xf9<\xa1\xe6\xb3\xc8^$\x0br:\xd4^\xeb\
-W\x08p\x85\xb7\xaeQ\x9eY\xe0\xbf\x90\x19u\xc7\x80\
-\x9a\xcc\x0dm\xceQ\xb5-\x09\xd5q.\x07\xdb:<\
-N\x8e\xc2\x99\x98{\xee\x18\x0c}\xcf\x86P!\xd3\xb2\
-H7\x7fyX\xe1\xe3J'\xf1\xed<J\x9a\x1d\xa6\
->\xf9\xeb\x1cE5\x99N\xd2\xd6A\x97\xa3#\xb0\xcb\
-\x1a\x82\xf5\xa1^8\x1c\x1b\x82Kf\xfb\xc4ru\x07\
-]*\xf4\x8d\xb8\xa4\xd69\x0a~\x1b\xed\xda_\xf6\x0c\
-\xab\xf5\x03\xf4(yz8a\xbf\xd3]\xc55\xdf9\
-$\xb7\x8c;\x90\xcf(O\xaa\x04G\xd2\x05\xeb\x03\x0a\
-\xd8d\xf4\xc2\xe3\xdb\xa7\xb0O\xaa\x94Q\xe1\xaf\xc5F\
-x\x9f\xb1\xbb`\xa0d\x7f\x05\x90*\x07l\xe3\xaf\x9e\
-\xa4\x5c3c\x19Z\x9e\xebzd\x12\x16\xa2.0E\
-m\xe0$w\x82\x97J6p\xb0\x1b\xb6\x87\xfb\xb0\xf5\
-\xd4#x\x1eW\x0c:\xa47\x9e\xb6N\xbc\xbf\x83\x1b\
-'\xe3Y\xc6\xc8X\x9c\xe4\x07n\xceG:\xd2\xfd\xf3\
-\x87d\x91\xd7^\x22\xf6>\x10_\x0f\xf8\x9f\xed\xec \
-\xdd\xd2\x0a*\xfd\xcc,\xa5\x8bVn\x8e\xa8\xeag'\
-\x93\xa6#Q\xb5\x01\xbeTA6\xd0\x03\xfb\xac>8\
-\x1cQ\xc2-\xf7\x09|\x8b@\xec%\xbc\x0b&\xe0]\
-4\x81\x1d\xa5\xc0\x9e\x1b@\xc4m \xb8\x1c\x88\xbcK\
-\xc6\xe2G\xe3\x1b81s\xef\x0d5]\x0a\xdd\xd9\x89\
-\xe4&K\xea\x027\xa5\x13Vi\x0a\xd8f\xf4\x90\xff\
-A\x1f\xecr\xfaa{\x94\xf4|'\x86\xe0\x90;\x0c\
-\xd7s\xa3\xf0,z\x0a\xef\x8b\xcf\xe0_\xfa\x0fv]\
-\x05\x04\xe4\xf4A\xc5\x83\xe3\xfa.\x99nT\xca\xb9c\
-\xb8\xbb\xfc\x82\xd5\xc1'\xe0I:\xc1%o\xc02\x95\
-\xb4`i=`\x1fR\x82\x9f\xad\xda\x80c\xde0\xb6\
-\x9e\x1b\x81\xe7Oc\xf0)~\x8e`\xf2\x06\xa2*\x01\
-\xbfs\x1dM\xea\xec\x04\x0e\x95\xea\xedXn\xb2W\xcd\
-LP?h\x912\xf0\xaa\xc1\x98\xba\xe3\xa7\xaeY\xeb\
-\xe3\xe3\xb0\xcf}\x06\xa7\xef\x9f\xc3\xbd`\x92\x9c\x1c\x08\
-\xb8\x02\xec$?\x81\xf7\x0f\xca^\x1b\xd1\xf5\xf4\xa9\xe5\
-\xaa,\xef\xc8:\xb7\xf3^F\xf1\xfd0\x16)`\x9e\
-\xd2\x03\x86D\x01z\xe8\x8d\x9b\x8c\xb8\xea\x9b\x96\xe2\xfa\
-Z~JC\xb5Uj\xddu\xae\xe8\xce)#\xff|\
-r\x03~\xb6\x8aZ\xfa\xfe\xd0\xd9]Q\xb2Y\xfa\x17\
-\xb9\xeb\x07a\x1cS;H\xa4e*\x0f\xed\x13b\x1f\
-\xab\x1e? _\x99\x8aV\x1b\x0a\x1e>f\xe7\xbc\x84\
-~\xe0\xb5\x12J\x9e_4\xbc/\xedde<\x87\xba\
-\xeb\x99=\x944\xffhz_\xcaXa\xb0K\x83\x9a\
-\xbe\x07h\xb4\x7f\x01\x1c\xaa\x09\x5c\xce\x82>0\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x08(\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00+\x00\x00\x00(\x10\x06\x00\x00\x007Y\xdf-\
-\x00\x00\x00\x06bKGD\xff\xff\xff\xff\xff\xff\x09X\
-\xf7\xdc\x00\x00\x00\x09pHYs\x00\x00\x00V\x00\x00\
-\x00V\x00\xabT7\x0a\x00\x00\x00\x09vpAg\x00\
-\x00\x00+\x00\x00\x00(\x00%\xe4\xe6V\x00\x00\x07\x85\
-IDATh\xde\xedZKl\x1bU\x17\xfe\xc63\
-\xe3\xf13\xf1#\xb6c\xc7\xa5\x8e\x1b\x9c\x00\x0d%\xd0\
-R\x16\x15\x82*B\x85\x22\xa2Vl\xba\x02!$\x10\
-H\xa8\xc0\xa2\x12\x12H\xec\x90X!$\x04(\x1b^\
-\x0b\xc4\x06\xa1R\x84\x22\xa1\x18Q*\xa5\xa0BE\x15\
-\xd7\x84\x92\xd4\xc98M\xb0\xc7\xcf\x19\xcfx\x1e\xffb\
-~+\xcd\xa3\xf1#\xce8\xa9\xfa-l\xdd\xf1\x9d{\
-\xe7|>\xf7\xdc\xef\x9c;\x84\xa6i\x9a\xa6\xfd\xf6\x1b\
-\xee\xa0\xad0u\xfa\x01nW\xdc!v\x9b@u\xfa\
-\x01j\xb8~}y\xb9P0\x9bS\xa9\xa5\xa5B\x81\
-a2\x99b\xb1R\xa1(\x8e+\x97\x05\x81\xa2\x8a\xc5\
-rY\x14I\xd2j5\x9b)JU].\x87\x83a\
-d\xd9\xe5r8,\x16Y\xf6z\x9dN\xabU\x96\x87\
-\x87\xfb\xfb\xfd~\x9e'I\x93\xc9\xd4A\xb71\x9cX\
-EQ\x14U%\x88\x8f?\xfe\xf1\xc7?\xff\x0c\x04&\
-&.]\x9a\x9b\xf3z\xd3\xe9L\xa6T\xb2X\x00@\
-\xd3\xf4O\xfd{m\xfbV\xd7\xf5v8\xec\xf5:\x9d\
-\x82\xf0\xdcsO<q\xe0@:\xfd\xf4\xd3\x87\x0f\x0f\
-\x0dq\x9c\xd14\x13Fo^\xa7O\x8f\x8fONF\
-\xa3\x17.$\x12,\xebv7JX\xab\xfdb\xb1p\
-\xd8\xe3)\x95\xc6\xc7\xdf|\xf3\xc4\x89d\x92ah\x9a\
-$kwl\x1f\x0c\xfb\x17\xff\xfe\x9bes9\x8b\xe5\
-\xc2\x85D\x22\x9dv\xbbI\xd2d\x22\x08\xe0\xc3\x0f_\
-z\xe9\xe8Q\xe0\xbb\xef\xdey\xe7\xc4\x09\xe0\xc1\x07\xf7\
-\xed\x0b\x04\xda7o29?\x9f\xc98\x1c\x9f~z\
-\xf6\xec\xc5\x8b\xbd\xbdF\xd9k\x18\xb1ss\xcb\xcb\xf9\
-<\xc3\xd4\xda\x83\x83}}\x1e\x0f\xf0\xf0\xc3\xb1X0\
-\x08\x04\x02.\x97\xdd\x0e<\xf5\xd4\xc1\x83\xd1h\xfb\xe7\
-\xbftif\x86e\x9dN\xa3\xec5\x8c\xd8RI\x10\
-d\x99$k\xedDb~>\x9b\x05~\xfduzz\
-a\x01X\x5c\xe4\xb8r\x198{vj\xea\x9f\x7f\xda\
-?\x7f6[,\x0a\x02M\x1beo\xc7T\x81\xaa\xea\
-1\xf0\xf5\xd7\xc7\xc7''\x81\xf5\xb1rw\xe3\x8e\x8e\
-\xdd&\x18\xe6\xb1\xc7\x8f\x1f<\x18\x89p\xdcc\x8f\xed\
-\xdf\xdf\xd7\x97\xcf7{\xff\xd4\xd4\xd5\xab,\xebp\xbc\
-\xfd\xf6\xe7\x9f\xc7\xe3\x03\x03\xc6\xd2\xd4<Z&\xb6R\
-\xa9V\x15\x85 \xbe\xfc2\x1eO&}\xbe\xf3\xe7\x13\
-\x09\x96u\xb9n\xdc\xc8\xe7y\x9ea\xaaUIR\x14\
-\x82\x00V\x96v\xab2\x0a\x00dYQd\xb9\x1dZ\
-\xb4RYX0\x9b\x81d\xf2\xe5\x97\x87\x86n\x9e\xff\
-\xff\x94Pnw\xb5\x0a8\x9d##\x85\x02\xb0g\xcf\
-\xab\xaf\xb2,`21L\xe3A\xaaibs\xb9R\
-I\x14I\xf2\xc5\x17?\xfa(\x1e\x1f\x1cL\xa5\xb2\xd9\
-b\xd1jm\x97\xee\xac\xdfo\xebP\x14\x00\x90\xe5b\
-\x91\xa6\xd7\xcf/\xcb\xf9<M\x03\x82p\xed\x9a\xcd\x06\
-\x08\xc2\xdc\x9c\xc5\x02\x0c\x0d}\xf0A\xe3\xdbj\xd3\x1e\
-p\xe6\xccW_MME\xa3\xa9T6[.[\xad\
-\xed1u'\xa3P\xb8x\xd1\xe5\x02\xca\xe5\xe9\xe9\xc6\
-\xedm\x98\xd8\xe9\xe9\xf9\xf9\x5c\xcej\xfd\xe3\x8f\xd9\xd9\
-L\xa6\xab\xab\xd3\xe66\x0b\x92$\x08\x93I\xd3\x00M\
-SU=D5\x07\x96\xfd\xec\xb3\xc6S\x97\x86\x89\x9d\
-\x98\xb8|y~\xde\xe5\xea4A\xb7\xc6\xe6\x81\xa2\xaf\
-\xaf\xa7\xa7\xab\xabR\x01x>\x99le\xa5q\xdc/\
-\xbfx<\x80\xaa\xd6\xf6\x8e\xcd\xd00\xb1\xa9T&S\
-*\xaddN\xbb\x0d\xa3\xa3\x0f=\x14\x8dr\x1cP,\
-\xfe\xfe{k+N'T\x14S)\xb3\xb9^\xdf\x86\
-\x89]X\xc8fy^\xaf>\xed&\x1c;v\xe8\xd0\
-\xc0\xc0\xf2\xf23\xcf\x1c8\xa0\xaa\xa2\x08d\xb3?\xfd\
-\xd4\xd3\xd3\xfa\x88\x82\xf0\xef\xbf\xf5\x1d\xacaU\x90N\
-s\x5c\xb9\xdc~b\x19\x86\xa2HRU#\x11\xbf\xdf\
-\xe9\xe4y\x8bE\xaf\xb7\xea\xb1\x10X\xaf\x066\xce\xd0\
-\x08Bo\x07\x83^\xaf\xc3!\x8aG\x8e\xec\xdf\xbfw\
-o>?:z\xf7\xdd\x85\x82,\x03\xd7\xae\xbd\xfb\xae\
-^\x85hd)oF\xec\xdc\x5c\x1b\x88UU\xdd<\
-I\xaaVUu\xb5\x8elE\xfe\xb8\x5cv;\xc3T\
-\xabo\xbc1662r\xfd\xfa\xe8\xe8\xf0poo\
-\xb1H\x92\xd5\xaa\xee\x09\x8a\xc2\xf3+5\x85\xcd\xe6\xd1\
-\x9fL\xff\x5c\x81(\xa6R\x0c\x03\x94\xcb?\xff\xecv\
-\x0333\xe7\xcf{<\x80\xa6m\x8d\xd0\x1a$iy\
-\xb9~(\xa8Kl\xad@\xec\xf7ww[\xad\xa2\xc8\
-\xb2\x1c\xd7JH\xd0+\xfc\x92\xf4\xc5\x17\xa7O\x1f=\
-\x9aHx\xbd\x82\xf0\xcd7>\x1f03\xf3\xc3\x0f7\
-{R\xcdS\xeb\xeb\xdc\xb5\x1e\xbd\xb6\xff\xeaq\xda\x05\
-\x8b%\x14\x12\xc5\xba\xbc5:\x5c(\xe4v\xdbl\xf5\
-\x07\xbc\x15\xdez\xeb\xd9g\x0f\x1d\x9a\x9d\xf5zy\xfe\
-\xeb\xaf\xfd~\x80\xe3\xce\x9d\x0b\x06\x01\xa05\xf9\xd3)\
-X\xad\xfb\xf6U*\xf5z5Ll_\x9f\xc7c\xb7\
-\xeb\x036\xe3\x01\x1e\x8f\xd3i\xb1H\xd2\x91#\xb1\x98\
-\xcd&\x08@.71\xd1\xceR\xb6\xd1\xb0\xdbc\xb1\
-6\x12{\xff\xfd\x91\x88\xc7S.\xd7\xef\xb9\x9a\xf6\x81\
-\x81\xde\xde\xeen\x9e\x07\x04\xe1\xeaU\x9b\x0d \x08M\
-\xdbM\x1eZ\x03\xc3\x84\xc3\x82\x00\xd0\xb4\xc7#\xcb\xf5\
-z7L\xec\x93O\x8e\x8c\xec\xd9\xc3q\xe1\xb0\xd7k\
-\xb7\x0bB\xa3\xf7\xd9l\x0cCQ\x8a\x02\xa8j\xa9D\
-\xed\x98S\xe1\xe6\x11\x0c\x9e:\xb5\xb8\xd8h\xef\x86\x89\
-\xad\x1d'?\xff\xfc\xe3\x8f\xc7b\xe9t\xa7\xcd4\x0e\
-fs  \x8a@O\xcf\xd8\x18\xc75zW\xd3E\
-\x98\xe3\xc7GF\x22\x11\x8e;y\xf2\xf0\xe1\xfe\xfe\xc5\
-E\x82\xa8)\xc8\xdb\x0d\x14\xe5t\xca2\x10\x89\x9c9\
-3;\x0b\x98L\xcd\x9c\xeen\xf9\xf8;\x9d\xce\xe5x\
-\x9e\xa6/_\x9e\x9d\xfd\xef?\x9bM/+\xae,\xf9\
-\xbd{}>\xa7S\x14\x1fy\xa4\xb7\xf7\xca\x15\xb3\x19\
-X\x5c\xfc\xe4\x93\xfe\xfe\xcd\xe4\xd2\xc6r\x8b\xa2|\xbe\
-J\x05\xf0z\xc7\xc6\xf4%\xb9\xb1\x99\xeb\xcb\x8b\xab\x95\
-\xee\xfa\xdfkm=\xf2\xd3t  I\x80\xd39<\
-\xcc\xf3\x00Euw\xeb\x85\xc6\xa6\xfe\x96V\x09\xad!\
-\x18t\xb9l\xb6j5\x18|\xe0\x81\xbb\xee\xda\xecd\
- \x9f\xbfr\xc5\xe3i}&U\xadTHR\xdf\x04\
-\xed\xf6\x8d2\xb0\xd5\x05\xeb\xb5\xbfS\x94\xcb%\xcb@\
-8\xfc\xca+,\xbbU\xbb\xb7\x9dX\xe3\xa0(\x85\x02\
-M\x03\xf9|<\xee\xf35\x9f P\x94\xdf_\xa9\x18\
-E\xecmt\x98h\xb3\xdds\x0f\x00\xf8|'O\x02\
-\x00Iv\xb2jl\xa0\xc7\x12\x04M\xaf\xcd\xeb\xdb\x01\
-\x92t8\x00 \x1a}\xef=@?\x9b\x02\x00\x86\x89\
-D\x00 \x95z\xff\xfd\xda\xf5\xed\x98\x7fc\x18\xe8\xb1\
-\x0c30\xc0\xf3\xed\x1fW\xd3\xf4\xad\xa5\xf6\xbdr]\
-\x92nn[\xad\xfd\xfd\xdb1\xff\xc60\xd0c\x19&\
-\x14\x92$\xa0\xab\xeb\xd1G\x97\x96\x80|~r\xd2\xef\
-\xdf\xfa\xb8\xaa\xaa\xa7+33\xaf\xbd\x06\x00V\xeb\xe0\
- \x00p\x5c<\x0e\x00\x04a\xb1(\x0a\x10\x08\x9c:\
-u\xe3\x86Q\xd6\x1a\xfe\xb6!P\xabbe2\xe7\xce\
-y\xbd@6\xfb\xed\xb7\xc1  \xcb\x1cg6\xb7\xaf\
-\xbae\xb3\x0d\x0f\xe7\xf3@(\xf4\xc2\x0b,\x0b\xd8\xed\
-\xf7\xdek\x9c\xc7v\x84\xd8\xd5PUQ$\x08 \x9b\
-\xfd\xfe\xfb\x9e\x1e\xa0\x5c\xfe\xeb/\xa7\x13\x90$\x96\xb5\
-X\x00IZZ\xb2X\x00M\xabV\xf5ddE>\
-I\x92\x9e\x19U*\x80\xd9\x1c\x0aU*\x80\xc7s\xec\
-X&\x03\xd8\xed\xf7\xddg\x1c\x91;\x90\xd8z\xa8\x1d\
-\xdeU\xabKK4\xad\x17A\xaa\xd5f_\xa00\x1a\
-\xbb@\xc7\xd6RI\x86\x09\x06WoG;\x19\xb7\x91\
-\x8e\xddY\xf8\x1f\xae\x06Qu\x8e\x9c\xd8\xe9\x00\x00\x00\
-\x22zTXtSoftware\x00\x00x\
-\xda+//\xd7\xcb\xcc\xcb.NN,H\xd5\xcb/\
-J\x07\x006\xd8\x06X\x10S\xca\x5c\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00\x05D\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
-\x00\x00\x00\x04gAMA\x00\x00\xaf\xc87\x05\x8a\xe9\
-\x00\x00\x00\x19tEXtSoftware\
-\x00Adobe ImageRead\
-yq\xc9e<\x00\x00\x04\xd6IDATx\xdab\
-\xfc\xff\xff?\xc3@\x02\x80\x00bb\x18`\x00\x10@\
-\x03\xee\x00\x80\x00bA\x17X\xb7\xfe\xc8\xff\xdf\xbf\xff\
-0\xfc\xfe\xf5\x97\x81\x91\x91\x81\xe1\xcf\x9f\xbf@\x0c\xe4\
-\xffF\xd0\xa8\xec?`5\x08\x1aU\x0c\xc4\x7f\xf5\xe6\
-#\xc3\xfbw\x9f\x19.\x9c\x9f\xc9\x88n\x1f@\x00\xa1\
-8`\xfd\xfa\xa3\xffm\xed\xf5\x81\x9a\xff1\xfc\xfd\xf7\
-\x8fAFB\x10,~\xf9\xe6\x13\x14M\xba\xea2$\
-\xf9r\xfb\xc1\xcb\x0c\x7f~\xfdfpr.\xf9\xbfo\
-o\x0f\x8a#\x00\x02\x08\xc5\x01\xbf\x81\xbe\xfa\xf1\xf37\
-\xc3\xd7o?\x19\xfe\xfcE8\xc0\xd4\xbf\x91ART\
-\x80\x81\x83\x83\x95\x81\x83\x9d\x95\xe1\xfc\x96F\x92\x1cp\
-\xe7\xe1+\x86\xbf\x7f\xff28\xb9\x9a0HJ\x86\xfe\
-\x7f\xfe|5\xdc\x11\x00\x01\x84\xea\x00`p\xfd\x05Z\
-\xfc\xfb\x0f\x84\x86\x01n.v\x06#\x1dy\x06A>\
-.\x06\x01~.\x92\xe3\xf9\x0f\xd4\xbc_\xbf~1\xb0\
-\xb0\xa0&;\x80\x00bAW\x08\xf29\x18\x03\xd90\
-\xc0\xc6\xca\xc2 )&\xc0 \x00r\x00\x1fy\x0e\x00\
-\x99\xf9\xe1\xc3'\x86\x7f\xff\xfe\xa1\xc8\x01\x04\x10Z\x08\
-\xfc\x01\xc7=8$\x90\x14J\x88\xf2\x03\x1d\xc0\x0fu\
-\x007\xc9\x0e\x00\x85\xe8\xa7\x8f\x9f\x19\xbe\x7f\xfb\x01t\
-\x00j\xb9\x03\x10@\x18!\xf0\xf7\x0f(\x04P\xa3 \
-\xd0\xcd\x98A_S\x8e\x81\x07\x18\x15<\xdc\x1c$;\
-\x00\xe4\xf3o\x9f\xbf2\xfc\x04&D\xf4\x82\x0f \x80\
-0\x12!\xc8rX\x90\xc1@]\x9e\x1fYy\x1c\x14\
-\xdc\xaf^}`\xf8\xf2\xe9\x0b\xd8\xec\xdf@\x07\xa0G\
-\x01@\x00\xa1\x86\x008\x11\xfe\x07*\xfe\x07\x0e\x81\xdb\
-\x0f^\x82\x83\xec\x1f\xd0\xd5\xff\xa14\xc8\x00\x90' \
-\xe2\xff\xc0>\xfa\x07\x97\xfb\x0f\xe7\xff\xfe\xfd\x9b\xe1\xcd\
-\xeb\x0f\x0c_\xbf\xfe\x00&\xbe?\xe0r\xe3\x17\x96\x10\
-\x00\x08 \xcc\x5c\xf0\x0f\x92\x00A\xf4\xf5;\xcfQ\xf8\
-\x7f\xa1\x09\x14\x99\x86\xb0!\x0e\x07\xd1\xa0t\xf4\xf9\xd3\
-W\x86\xaf_\xbe\x22\x0a0P\x81\x04r\xc0\xef\xdf\x18\
-i\x00 \x800\xa3\x00\x1c\xfc\x7f\xe1\x85\x11.\x8b\xfe\
-\xa29\x04\x14\xbf_\xbf|c\xf8\xf6\xf5\x1b\xb4$\x84\
-\x94\xa6\x103\xa1\xfc\xdf\x98!\x00\x10@\x98Q\x00\xca\
-\x05\xe0(\xf8\x8b\xd5\xc7\x7f\x90\x1c\xf3\xf3\xe7/0\x06\
-\xa5\xee\x9f\xc0\x02\x0cn1\x88\xfe\x8d\xb0\x1c\xe6\xb1\xdf\
-\xc0\xa8@w\x00@\x00\xb1\xa0g\x17X\x19\x00\xb2D\
-X\x90\x07\x1c\xe7\x7f\xff\xfd\x87\xd3\xbf\x80\x16\xfd\xf8\x01\
-\xb4\xf4\xfb\x0f\x06VFV\x06vfF\x06.Vf\
-\x88%\xbf\xff\x22\xd5\x0bPK\x81\xf4\x83'\xaf\xc0\xd1\
-\xf0\x0bK\x08\x00\x04\x10f9\x00\xf5\x1d(\x0a\x5c\xac\
-\xb5\xe0r \xf1o\xc0\x22\x1a\xe4cH\x05\x05Q\x03\
-q\xec_$\xb1\xbf\x18\xf2=\xb3\xd6C\x1d\x86\x99\x0b\
-\x00\x02\x88\x05[\x91\x89^\x10\x81\x82\xf7\x1b0\x98\x91\
-\x0d\x85\xe1\xbf\x7f\xffB\x8b\xf0\xbfX\xe5\x91kJP\
-(\xa0\x87\x00@\x00a\xe4\x82?H\xf1\x0cR\x0c\xc9\
-F\xbf\xb1\x1a\x8c\xea\x10\xdc\xf2`\x07\xfc\x85D\x0b\xba\
-\x03\x00\x02\x08{\x14@5~\xf9\xf2\x9d\xe1\xf4\xe9\xc7\
-\x90\x1c\xf1\xf7/<a\xa2\xd2\x08\xcb\xb1\xc9\xc9\xcb\x0b\
-\x01\xd3\xc1o`\x09\x0bI\x0f\xe8\x0e\x00\x08 \x8cD\
-\x08\xab\x0d\xbf\x01}\xfe\xe3\xc7o\x0699~\xb4x\
-\xfe\x87\x16\xe7\xff0\xd2\x00\xb2'`9\xe2/\x8e\x10\
-\x00\x08 \xb4l\xf8\x07\x1c\xfc\xdf\xbf\xffd\xf8\xf6\xfd\
-\x07X\xc3\x87\x0f\xdf\x90|\x88j!.>\x8c\x0d\xc2\
-\xbc\xbc\xec@\xfeox\xcb\x0a\xdd\x01\x00\x01\x84\x11\x02\
-\xa0`\xfa\xf2\xe5\x1b\xbc9\xf5\xe1\xc3w\x94`E\x0e\
-j\xe4\xa8A\x15G\xb098\x98\xa1\xb5,v\x07\x00\
-\x04\x10F\x22\x04\x17*\xc0\x86\x03(\xd8@e\xb8\xac\
-,\x1f\xd6\xac\x85\x9e\x13p%JH\xc2\xfe\xc3\xf0\x0f\
-\xe4P,\x0e\x00\x08 T\x07\xfc\x02\x152?\x81\x85\
-\xcd\x1fxar\xf1\xe2s\xb0\x05\xff\xfe!\x07\xed?\
-\xb4PA\x84\x04\xb8\xc0B\x12\x93\x96\xe6\x07'@P\
-\x1a\x00a\x06\x06T\x07\x00\x04\x10\x8a\x03@\xe5\xf9o\
-\xb0\xcf\x7fC*\x10 \x96\x96\xe6\xc5\xc8\xe3\xc8>F\
-Np\xc8\xc1\x8f(#\xfe\x80\xd3\x00\xac\x80C\x0f\x01\
-\x80\x00\xc2\xc8\x86\xe0\x22\x13\x9c\xef!i\x80\x8d\x8d\x09\
-\xc8\xfe\x0fl\xa2\xc30#\x103A}\x02\x11c`\
-`\x04c\x90\x1c\x8c\xfd\xff?\x04C\xa2\x00\x182\x7f\
-`Q\xc0\x8c\xe2\x00\x80\x00Bq\xc0\xaf\xef\xbf\x18\xbe\
-\xbc}\xcf\xf0\xe9\xf9+pb\xbc{\xf7\x0eF\x1e\xff\
-\xf3\xe7\x1f\x96\xc4\xf6\x0fky\x00\x8b\x86\xaf\xaf^\x80\
-\xab\xe1??\x7f\x02\x1d\x80\xda\xa6\x04\x08 F\xf4 \
-10H\xfd\xff\xf1\xe3\x17p\x02\x14\x10\xe0\x827\xcd\
-@\xea \x98\x01\x1e\x8c\xa8|\x04\x1b]\xec\xe5\xcb7\
-P\xf5\xa0\xe2\xfe\x00J\xbf\x00 \x80\x18\x07\xbas\x0a\
-\x10@\x03\xde7\x04\x08\xa0\x01w\x00@\x80\x01\x00\x80\
-p\xef\x0c\xb7\x02\x84R\x00\x00\x00\x00IEND\xae\
-B`\x82\
-\x00\x00\x7f^\
-\x00\
-\x00\x01\x00\x05\x00\x80\x80\x00\x00\x00\x00\x00\x00(L\x00\
-\x00V\x00\x00\x00@@\x00\x00\x00\x00\x00\x00(\x16\x00\
-\x00~L\x00\x0000\x00\x00\x00\x00\x00\x00\xa8\x0e\x00\
-\x00\xa6b\x00\x00  \x00\x00\x00\x00\x00\x00\xa8\x08\x00\
-\x00Nq\x00\x00\x10\x10\x00\x00\x00\x00\x00\x00h\x05\x00\
-\x00\xf6y\x00\x00(\x00\x00\x00\x80\x00\x00\x00\x00\x01\x00\
-\x00\x01\x00\x08\x00\x00\x00\x00\x00\x00H\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xff\xff\xff\x00\x00\xbf\xbf\x00t]]\x00\xc1\xaf\xaf\
-\x00\x00lk\x00\x00\xff\xff\x00944\x00\x93\x89\x89\
-\x00\xde\xda\xda\x00\x00AA\x00\x00\x96\x96\x009de\
-\x00\x00!!\x00\x00\xe0\xdf\x00pzy\x00ULL\
-\x00,KK\x00\x1c++\x00\x0dXX\x00\x00\x81\x81\
-\x00\xca\xc3\xc3\x00\x00\xab\xab\x00Yaa\x00\x98\x9a\x9a\
-\x00\x17ii\x00\x10\x0b\x0c\x00\x00\xd0\xd0\x00>TT\
-\x00\x00\xf0\xf0\x00\x0000\x00\x17JI\x00,\x22\x22\
-\x00&88\x00(]]\x00\x00\x13\x13\x00\xd4\xcf\xcf\
-\x00\x00NN\x00bUU\x00\x1066\x00\x80tt\
-\x00\x15  \x00\x00``\x00bkk\x003AA\
-\x00PXX\x00\x8a\x82\x82\x00\x00\x8b\x8b\x00\x00\xb5\xb5\
-\x00\x00ww\x00\x0c**\x00\x00\xa0\x9f\x00tSS\
-\x00\x0f@@\x00\x9c\x91\x91\x00icc\x009KK\
-\x00\x00\x0b\x0b\x00\x00WW\x00INN\x00\xc3\xbc\xbc\
-\x00\x0099\x00\x08HH\x00jqq\x00\x00\xd7\xd8\
-\x00(SR\x00\x00\xe8\xe8\x00\x00\xc7\xc8\x00\x89\x8a\x8a\
-\x00\x17[[\x00\x0fPQ\x00\x00\xf8\xf8\x00\x00))\
-\x00\x92\x94\x94\x00\x0dgh\x005;;\x004TT\
-\x00\x0d\x1c\x1c\x00*DC\x00\x00\x1a\x1a\x00[QQ\
-\x00YXX\x00\x06RS\x00CYY\x00IUT\
-\x00\x0c\x22\x22\x00\x15&&\x00\x00ff\x00A12\
-\x003GG\x00\x0855\x00\x00GG\x00\x08aa\
-\x00AMM\x00\x17QQ\x00\x0fEF\x00+>>\
-\x00\x09==\x00\x01qr\x00\x00\x86\x86\x00\x00||\
-\x00\x00\xbb\xbb\x00\x00\xb0\xb0\x00\x00\xa6\xa5\x00\x00\x9b\x9b\
-\x00\x00\x91\x91\x00+''\x00\x1011\x00\x80yy\
-\x00\x1c00\x00\x10;;\x00\x0aMM\x00,YY\
-\x00\x00\x5c\x5c\x00\x00SS\x00\x00\xec\xeb\x00\x00\xc4\xc3\
-\x00\x00<=\x00\x00\xf4\xf3\x00\x00\xe3\xe3\x00\x00\xdc\xdb\
-\x00\x00\x04\x04\x00\x00\xd3\xd4\x00\x00\xcc\xcb\x00\x00\x10\x10\
-\x00\x89\x85\x85\x00\x00,,\x00\x0033\x00\x08AA\
-\x00[MM\x00\x05hg\x00lff\x004LL\
-\x00\x08XW\x00\x00\xfc\xfc\x00\x00\x1d\x1d\x00\x00$$\
-\x00\x0898\x00\x00KK\x00\x06NM\x00P[\x5c\
-\x00(OO\x00\x04EE\x00\x0e..\x00\x0aEE\
-\x00CPP\x00\x00\x16\x16\x00\x04\x8c\x8d\x00\x00ii\
-\x00\xc3\xbf\xbf\x00\x0d\x1f\x1f\x00\x1c))\x00\x00DD\
-\x00\x04uv\x009NN\x00\x00cc\x00>RR\
-\x00\x04bb\x00\x00\xae\xae\x00\x00\xa4\xa3\x00\x0d33\
-\x00\x00\x89\x88\x00(FF\x00\x00zz\x00\x00tt\
-\x00\x0aZZ\x00\x05>>\x00\x00\x8e\x8e\x00\x05CB\
-\x00\x00\x84\x84\x00-BB\x00\x00~~\x00\x04UT\
-\x00\x00\x0d\x0c\x00\x00\xbd\xbd\x00\x00\xb8\xb8\x00\x00\xb2\xb3\
-\x00\x00\xa8\xa8\x00\x00\x9e\x9d\x00pww\x00\x00\x98\x99\
-\x00\x00\x93\x94\x00\x06PP\x00\x00oo\x00\x05a`\
-\x00\x10>>\x00\x10BB\x00\x00?>\x00\x0d<<\
-\x00\x00QP\x00\x07UV\x00\x00\xf5\xf6\x00\x00\xe6\xe5\
-\x00\x00\xdd\xde\x00\x00\xd6\xd6\x00\x00\xcd\xce\x00\x0076\
-\x00\x00UU\x00\x00ZY\x00\x00^^\x00\x00\xd3\xd1\
-\x00\x00\xc9\xcb\x00\x16$%\x00\x00**\x00\x0d((\
-\x00\x00\xa1\xa2\x00ZOO\x00*<<\x00\x0dDD\
-\x00\x05GG\x00+FE\x00\x06JI\x00DWW\
-\x00\x06cd\x00\x00\xf9\xf9\x00\x00\xf2\xf2\x00\x00\xed\xed\
-\x00\x00\xea\xea\x00\x00\xe1\xe1\x00\x00\xda\xd9\x00\x00\x12\x11\
-\x00\x00\xc5\xc5\x00\x00\xc1\xc1\x00\x15\x22\x22\x00\x80ww\
-\x00\x00..\x00\x0023\x00\x1033\x00\x04<<\
-\x00\x08??\x00-DD\x00\xd6\xd0\xd0\x00\x0e++\
-\x00\x0e77\x00\x00;;\x00CNN\x004IH\
-\x00\x10GG\x00\x02\x87\x88\x00\x07ON\x00\x02VV\
-\x00\x07TT\x00\x00rq\x00\x00\xfe\xfe\x00\x00\xf7\xf5\
-\x00\x00\xe4\xe6\x00\x00\xda\xdc\x00\x00\xd9\xd7\x00\x00\xd5\xd3\
-\x00\x00\x09\x08\x00\x00\xd1\xd2\x00\x00\xcf\xcd\x00\x00\xca\xc9\
-\x00\x00\x15\x15\x00\x00\xc9\xc7\x00\x00\x18\x18\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00&\x97\xd3\xc6\xc6\xc6\xc6\
-\xc6qq\xc7\xc7\xc7****\x9b\x9b\x9b\x9b\x9bW\
-WWWWWWWWWWW\x94\x8a\xad\xad[\
-WWWWWWWWWWWWWWW\x9b\
-\x9b\x9b\x9b\x9b\x9b****\xc7\xc7q\xc7*\x8b\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00D)\xdc\xc7\x14ddd\
-\xab\xab\x14\x14\xa9\xa9cc\xa1\xa1\xa1\xa1///\xa7\
-\xa7\xa7\xa7\xa7\xa7\xa7\xa7\xa7\xa7\xa7i\xb5\x94#|\x9b\
-\xa7\xa7\xa7//\xa7\xa7\xa7\xa7\xa7\xa7\xa7\xa7\xa7\xa7/\
-////\xa1\xa1ccc\xa9\xa9\x14\xa9\xa1\x9b\xfd\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\xce\xca\x98\xc7\xf2\xa3\xa3dd\
-\xab\xab\x14\x14\x14\xa9\xa9cc\xa1\xa1\xa1////\
-////\xa7\xa7\xa7\xa7\xa7/\xa7\xb5\x94#|\x9b\
-\xa7\xa7\xa7///\xa7\xa7\xa7\xa7\xa7\xa7\xa7\xa7//\
-//\xa1\xa1\xa1\xa1ccc\xa9\xa9\x14\x14\x141W\
-\x8a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00D\xca\x92*\x14\xa3\xa3\xa3dd\
-\xab\x14\x14\x14\xa9\xa9cc\xa1\xa1//////\
-\xa7\xa7\xa7\xa7\xa7\xa7\xa7\xa7\xa7\xa7\xa7\xb5\x94#\xdc\x9b\
-\xa7\xa7\xa7\xa7\xa7\xa7\xa7\xa7\xa7\xa7\xa7\xa7\xa7\xa7\xa7/\
-////\xa1\xa1\xa1ccc\xa9\xa9\x14\x14\xa9/\
-\x94OV\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x07\xaa\xef\xc7\xa4dd\xa3d\xab\xab\
-\x14\xa9\xa9cc\xa1\xa1\xa1///\xa7\xa7\xa7\xa7\xa7\
-iiiiiiiiiii\x0b\x05#\xdcW\
-iii\xa7\xa7iiiiiiiiii\xa7\
-\xa7\xa7\xa7////\xa1\xa1cc\xa9\xa9\xa9\xa9c\
-dW\xf1\xe6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00|\x7f\x94\x14ddd\xab\xab\x14\x14\
-\xa9cc\xa1\xa1///\xa7\xa7\xa7iiiii\
-\xb5\xb5\xb5\xb5\xb5\xb5\xb5\xb5\xb5\xb5\x0b\xb4\xb7#\xdc\x94\
-\xb5\xb5\xb5iii\xb5\xb5\xb5\xb5\xb5\xb5\xb5\xb5ii\
-iiii\xa7\xa7///\xa1\xa1cc\xa9\xa9\xa9\
-c/\xf2=#\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x8f\x98\xbdr\xc7\xa4\xabdd\xab\xab\x14\xa9\xa9\
-c\xa1\xa1///\xa7\xa7\xa7iii\xb5\xb5\x0b\x0b\
-\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\xb4\xb2\xf2\xfd\xdc\x94\
-\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\
-\xb5\xb5\xb5iii\xa7\xa7\xa7//\xa1\xa1cc\xa9\
-ccdW\xc6:\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xe8H*\xa311\xa3d\xab\xab\x14\x14\xa9cc\
-\xa1//\xa7\xa7iiii\xb5\xb5\x0b\x0b\x0b\xb4\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4hh3\xa4\xfd#\x05\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\
-\x0b\x0b\x0b\x0b\xb5\xb5iii\xa7\xa7//\xa1\xa1c\
-cc\xa9\xab\xab\xa9\x94\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\xe3\x8a*\xf2\xa3\xa3\xa3d\xab\xab\x14\xa9\xa9c\xa1\xa1\
-//\xa7\xa7ii\xb5\xb5\x0b\x0b\x0b\xb4\xb4\xb4hh\
-hhhhhh\xb2h\xb2\xb23\x9f1\xfd#\x05\
-hhhhhhhhhhhhhhhh\
-\xb4\xb4\xb4\x0b\x0b\x0b\x0b\xb5\xb5ii\xa7\xa7//\xa1\
-\xa1cc\xa9\xa9\xa9d\x94\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa0\
-\xe2\x9b\xa3\xa3\xa3dd\xab\x14\x14\xa9cc\xa1//\
-\xa7\xa7ii\xb5\xb5\x0b\x0b\xb4\xb4hhh\xb2\xb2\xb2\
-\xb2\xb23\xb2333333\xcdg1\xfd#\xb7\
-\xb2\xb2\xb2\xb2\xb2\xb23\xb2\xb2\xb2\xb23\xb2\xb2\xb2\xb2\
-\xb2hhh\xb4\xb4\xb4\x0b\x0b\xb5\xb5ii\xa7\xa7/\
-/\xa1\xa1cc\xa9\xa9c\x05\xc4\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x005\xc5\
-W\xf21\xa3\xa3d\xab\x14\xa9\xa9c\xa1\xa1/\xa7\xa7\
-ii\xb5\xb5\x0b\x0b\xb4\xb4hh\xb2\xb23333\
-\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcdg\xb1\xa3\xfd#\xf2\
-\xcd\xcd\xcd33\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd\xcd33\
-33\xb2\xb2hhh\xb4\xb4\x0b\x0b\xb5\xb5ii\xa7\
-\xa7/\xa1\xa1c\xa9\xa9cd\x94r\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8f~:\
-bd\xab\xa3\xa3\xab\x14\xa9\xa9c\xa1\xa1/\xa7ii\
-\xb5\xb5\x0b\x0b\xb4hh\xb2\xb2\xb23\xcd\xcd\xcd\x9f\x9f\
-\x9f\x9fgggggggg\xb1\x9ed\x92#\xa4\
-ggg\x9f\x9f\x9fgggggg\x9f\x9f\x9f\x9f\
-\xcd\xcd\xcd3\xb2\xb2\xb2hh\xb4\xb4\x0b\x0b\xb5\xb5i\
-\xa7\xa7//\xa1cccc\xa9\x05\x0a\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1c'\xcb~=\
-\xc5\xab/\xabd\xab\xa9cc\xa1//\xa7i\xb5\xb5\
-\x0b\x0b\xb4\xb4h\xb2\xb23\xcd\xcd\xcd\x9fgggg\
-\xb1\xb1\xb1\xb1\xb1\xb1\xb1\xb1\xb1\xb1\x16f\xab\x92#1\
-\xb1\xb1\xb1gg\xb1\xb1\xb1\xb1\xb1\xb1\xb1\xb1\xb1gg\
-gg\x9f\xcd\xcd33\xb2\xb2hh\xb4\xb4\x0b\x0b\xb5\
-ii\xa7//\xa1cc\xa9\xa9d\xf2\xc7\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00T5=u\xea\xe1\
-\xbbW\xab\xa9\xa9\xa9\xa9c\xa1//\xa7i\xb5\xb5\x0b\
-\xb4\xb4hh\xb23\xcd\xcd\x9fggg\xb1\xb1\xb1\xb1\
-\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16\x9e\xb0\x14\x92\xfd1\
-\x16\x16\x16\x16\xb1\x16\x16\x16\x16\x16\x16\x16\x16\x16\xb1\xb1\
-\xb1\xb1gg\x9f\x9f\x9f\xcd3\xb2\xb2hh\xb4\x0b\x0b\
-\xb5ii\xa7//\xa1cc/cd\x9b\xea\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x0085r*W:=\
-\x1e=\xc5c\x0b\xa1\xa9\xa1//\xa7i\xb5\x0b\x0b\xb4\
-hh\xb233\xcd\x9fgg\xb1\xb1\x16\x16\x16\x16\x16\
-\x9e\x9e\x9e\x9e\x9e\x9e\x9e\x9e\x9e\x9ef0\x14\x92\xfd\xa3\
-\x9e\x9e\x9e\x9e\x9e\x16\x9e\x9e\x9e\x9e\x9e\x9e\x9e\x9e\x16\x16\
-\x16\x16\xb1\xb1\xb1g\x9f\x9f\xcd\xcd3\xb2\xb2h\xb4\x0b\
-\x0b\xb5ii\xa7\xa7/c/\x0b\xa1\x9b[\x7f\x7f_\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\xeb\xbc\x98\x9b1\xa3\xb7%\
-=\xcb\xea\x05\xa1/\xa7//\xa7i\xb5\x0b\x0b\xb4h\
-h\xb23\xcd\x9fgg\xb1\xb1\x16\x16\x9e\x9e\x9eff\
-ffffffffff\xb0\xaf\xa9\x92\xfdd\
-ffffffffffffff\x9e\x9e\
-\x9e\x9e\x16\x16\x16\xb1\xb1gg\x9f\xcd\xcd3\xb2h\xb4\
-\x0b\x0b\xb5\xb5i\xa7\xa7\xa7\xa7/\xa4\x8a\xea\x98%\xc5\
-\x13\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\xec\x1f\xac\x9b\xf2d\xab\xa3\xb7\
-q\xbb\x7f=:\xa7\xcdi/i\xb5\x0b\x0b\xb4h\xb2\
-\xb23\xcd\x9fg\xb1\xb1\x16\x16\x9e\x9e\x9efff\xb0\
-\xb0\xb00\xb0\xb0\xb0\xb0\xb0\xb00\xaf\xaec\xff\xfd\xab\
-\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0ff\
-ff\x9e\x9e\x9e\x16\x16\xb1\xb1g\x9f\x9f\xcd3\xb2h\
-h\xb4\x0b\x0bi\xa7\xb5\xcdi\x9b\x98\xc4\x0a\x05\x14\x14\
-\x99E\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x97a\xbdW\xa4\xa3d\xab\xab\x14\
-\xa4:\x0a~u\xf2\xa7\xb5\x0b\xb5\xb5\x0b\xb4h\xb2\xb2\
-3\xcd\x9fg\xb1\x16\x16\x9e\x9eff\xb0\xb0\xb000\
-0000\xaf\xaf\xaf0\xaf\xafe\x02\xa1\xff\xfd\xab\
-000000000000000\xb0\
-\xb0\xb0fff\x9e\x9e\x16\x16\xb1gg\x9f\xcd3\xb2\
-hh\xb4\x0b\x0b\x0b\x0b\xb5\xa3\x8a\xc4\x0a\xc7\xa1\xb2h\
-/\x05o\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x89Z\xa6\xf0W\xa4\xa3dd\xab\x14\xa9\
-\x141\x9b\x98\xc4=:\xb5\x16h\x0b\xb4h\xb23\xcd\
-\x9fg\xb1\xb1\x16\x16\x9eff\xb0\xb0000\xaf\xaf\
-\xaf\xaf\xaf\xafeeeeee\xae\xde/O\xfd\x14\
-\xaf\xaf\xaf\xaf\xaf\xaf\xaf\xaf\xaf\xaf\xaf\xaf\xaf\xaf\xaf0\
-00\xb0\xb0\xb0ff\x9e\x9e\x16\xb1\xb1gg\x9f\xcd\
-3\xb2h\x0bh\x16\xb4W[\xea[\x05\xa1h\x9f3\
-\x0b\xa1bR\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xa8[%:\x941d\xabdd\xab\x14c\
-\xa1\xa1d*[~\xbbd\xb4\xb4\xb4h\xb23\xcd\x9f\
-g\xb1\xb1\x16\x9e\x9ef\xb0\xb000\xaf\xafeee\
-ee\xae\xae\xae\xae\xae\xae\xae\xae\x02\xdd\xa7O\x92\xa9\
-e\xae\xaeeee\xae\xae\xae\xaeeeeeee\
-\xaf\xaf000\xb0\xb0f\x9e\x9e\x16\x16\xb1gg\x9f\
-\xcd\xb2\xb23\xb2h\xab\x8a\xc4[\x9b\xa7\xcd\x9f\x9f\xcd\
-\xb2\x0b/1\x94\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\xa6:\x94\xb7\xa41\xa3dd\xab\x14\x14\xa9c\
-\xa1//\x14\x05\x8a\x0a\x8a\x9b\xa7\xcd33\xcd\x9fg\
-\xb1\x16\x16\x9eff\xb000\xaf\xafee\xae\xae\xae\
-\x02\x02\x02\x02\x02\x02\xde\xde\x02\x02tC\xa7O\x92c\
-\xae\x02\x02\xae\xae\xae\x02\x02\x02\x02\xae\xae\xae\xae\xae\xae\
-eee\xaf\xaf00\xb0\xb0f\x9e\x9e\x16\xb1\xb1g\
-\xcd\xb2\x9f\xb03W[u\x8a\xa4i\xcd\xb1\xcd3\xb2\
-hh\xb4\x0bi/\xa4\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xa6%\x941\xab\xabddd\xab\x14\x14\xa9cc\
-/\xa7i\xb5c\x94[\x88\xea/\x9e\x9f3\x9fg\xb1\
-\x16\x16\x9eff\xb000\xafee\xae\xae\x02\x02\xde\
-\xde\xdetttttttt\xdd{iO\x92\xa1\
-\x02\xde\xde\xde\x02\xde\xde\xde\xde\xde\xde\xde\x02\x02\x02\x02\
-\xae\xae\xaeee\xaf\xaf00\xb0f\x9e\x9e\x16\xb1\xb1\
-g\x9f\x9f\x9fc\x8a=%\x05\xb5\xb1\x16\xb1\xcd\xb2\xb2\
-\xb2\xb23\x9f\xcd\xb2/\x05\x00\x00\x00\x00\x00\x00\x00\x00\
-\xe4:\x94\xa41\xa3dd\xab\x14\x14\xa9cc\xa1/\
-/\xa7i\xb4i\x14\xc5\xad\x0di\xae\xb13\x9f\xb1\xb1\
-\x16\x9ef\xb000\xaf\xafe\xae\xae\x02\x02\xde\xdet\
-t\xdd\xdd\xdd\xdd\xddCCC\xdd\xfc\xc3\xb5O\x92\xa1\
-tttttttttttttt\xde\xde\
-\xde\x02\xae\xae\xaeee\xaf\xaf0\xb0ff\x9e\x16\xb1\
-\xb1\x16\xb4\xf2:[\xc5d\x0b\xb1\x9e\xb1g\x9f\xcd\xcd\
-\xb2\xb2\xb2\xb2hh\x0b\xa71\x00\x00\x00\x00\x00\x00\xe5\
-%\x9411\xa3\xa3d\xab\x14\x14\xa9cc\xa1/\xa7\
-\xa7i\xb5h\xb4iWO\x0d1g\xb1\xb1\xb1\xb1\x16\
-\x9ef\xb000\xafee\xae\x02\x02\xdett\xddC\
-\xfeCCC\xfc\xfc\xfe\xfe\xfe\xfc{\xfa\x0b\x87\xff/\
-\xddCC\xdd\xdd\xdd\xddCC\xfeCC\xdd\xdd\xdd\xdd\
-t\xde\xde\x02\x02\xae\xaee\xaf\xaf0\xb0ff\x16\x16\
-\x9ee\x0b[\x1e%\xf2hf\xb0f\xb1gg\x9f\xcd\
-\xcd3\xb2hhhh\xb2\xa7\x05\x00\x00\x00\x00\x96\xbd\
-\x05\xa411\xa3d\xab\x14\x14\xa9c\xa1\xa1/\xa7i\
-i\xb5\x0b\xb4\xb4\x0bd\x8a=\x98\x94g\xaef\x16\x16\
-f\xb000\xafe\xae\xae\x02\xdett\xddC\xfe\xfc\
-\xfc{{{{{{{{{\xc3z\xb4\x87\xff\xa7\
-C\xc9\xfc\xfcC\xfc\xc9\xfc\xfc\xfc\xfc\xfc\xfc\xfcCC\
-\xdd\xddt\xde\xde\x02\xae\xaee\xaf\xaf0\xb0f\x9e\xb1\
-\xb0{h\x88|:\xa7\x9e\xaff\x16\x16\xb1\xb1g\x9f\
-\xcd\xcd3\xb2hhhh\xb4i\x94\x00\x00\x00|:\
-d\xa3\xa3\xa3d\xab\xab\x14\xa9c\xa1\xa1/\xa7ii\
-\xb5\xb5\x0b\xb4hh\xa71\xc6\xc4\x98c\xb1f\xb0f\
-f\xb00\xafe\xae\xae\x02\xdet\xddCC\xfc{{\
-\xc3\xc3\xc3\xc3\x1b\x1b\xfb\xfb\xc3\xc3\xfa@h\x87\xffi\
-{{{{{{\xc3{\xc3\xc3\xc3\xc3{{{\xfc\
-\xfcCC\xddt\xde\x02\x02\xaee\xaf00ff\xb0\
-00\xa9\x0dO\x0530\xae\xb0\x16\x16\x16\x16\xb1g\
-\x9f\xcd\xcd3\xb2hhh\xb2\xcd\xa4\x00\x00\x00#\xc5\
-1\xa3ddd\xab\x14\xa9c\xa1//\xa7i\xb5\xb5\
-\x0b\xb4\xb4h\xb233h\x14\xbdu\x8a\xb7\x16t\xaf\
-\xb00\xafe\xae\x02\xdett\xddC\xc9{{\xc3\xc3\
-\x1b\xfa\xfa\xfa\xfa\xfa\xc8\xc8\xfa\xfaz\xdb\xb2\x87Oi\
-\xc3\x1b\x1b\xfb\xfb\x1b\x1b\x1b\x1b\x1b\x1b\x1b\x1b\xc3\xc3{\
-{\xfc\xfcC\xdd\xddt\xde\x02\xaee\xaf0\xb0\xafC\
-\xb01\xbdu%\xa1\x160\xaf\xb0f\x9e\x9e\x16\xb1\xb1\
-g\x9f\x9f\xcd3\xb2\xb2\xb2hh\xb7\x00\x00\x00\xfd\xc5\
-1\xa3d\xab\xab\x14\xa9c\xa1//\xa7i\xb5\xb5\x0b\
-\xb4\xb4h\xb23\x9f\xb1\x9eh1\xc5=\x8a/\x9e\xaf\
-e\xaf\xaf\xae\xae\xdettC\xfe\xfc{\xc3\x1b\x1b\xfa\
-zzz\xc2\xc2\xc2\xf8\xf8zz@\xc13\x87O\xb5\
-\xfa\xfa\xfa\xfa\xc8\xfa\xc8zz\xfa\xfa\xfa\xfa\xfa\x1b\x1b\
-\xc3\xc3{\xfcCC\xddt\xde\x02\xaeeeee0\
-\xb5r\x0a*\x14\xcd\xb000\xb0ff\x9e\x9e\x16\x16\
-\xb1g\x9f\x9f\xcd3\xb2\xb2\xb2h\xb7\x00\x00\x00\xfd:\
-\xa3d\xab\xab\x14\xa9c\xa1/\xa7\xa7i\xb5\x0b\x0b\xb4\
-h\xb2\xb23\xcd\x9fg\x16\xb1gc\xbd\xbb%\xa4f\
-C\x02\xae\xae\x02\xdetC\xfc{\xc3\xc3\x1b\xfazz\
-\xc2\xc2@\xf7\xf7\xf7\xf7\xf7@@\xdb\x0e\xcd\x87O\x0b\
-zz\xc2zz\xf8\xc2\xc2\xc2\xc2\xc2\xc2zzz\xfa\
-\x1b\x1b\xc3\xc3\xc9\xfcC\xddt\xde\x02e\x02\xc3\xafd\
-:\x0a\xc5\xa7f\xaf\xae\xaf00\xb0\xb0f\x9e\x16\x16\
-\xb1\xb1gg\x9f\xcd33\xb2h\xb7\x00\x00\x00\x92:\
-d\xab\x14\x14\xa9c\xa1//\xa7i\xb5\x0b\x0b\xb4h\
-\xb2\xb2\xcd\xcd\x9fg\xb1\xb1f\xaf\xb1\xa3:u%\xa7\
-\xb0\xaet\xdett\xdd\xfc{\xc3\x1b\x1b\xfaz\xc2@\
-@\xdb\xdbxxxxx\xf6\xdb\xc1w\x9f\x87O\x0b\
-\xc2@@@\xc2\xf7@\xf7\xdb\xdb@@@@\xc2z\
-z\xfa\x1b\xc3\xc3{\xfcC\xddt\xdet\xdee\xb4:\
-\x0a:d\x9e\xddt\x02e\xaf000\xb0f\x9e\x9e\
-\x16\x16\xb1gg\xcd\xcd33\xb2\xf2\x00\x00\x00\x92\xc6\
-\xab\x14\x14\xa9c\xa1//\xa7i\xb5\x0b\x0b\xb4h\xb2\
-3\xcd\x9fgg\xb1\x16\x16\x9e\xb0\xb0fir\xbb\xc5\
-d\xb0\xc3CC\xddC\xc9\xc3\x1b\xfaz\xc2\xc2@\xdb\
-xx\xc1\xc1\xc1\xc1\xc1\xc1\xc1\xc1\x0e\xc0g\x87O\xb4\
-@\xdb\xdb\xdb\xdb\xdbxxxxxx\xdb\xdb@@\
-\xc2z\xfa\xfa\xc3\xc3{CCtCz\xae\xa9q\x0a\
-\xc5\xb50\xde\xdd\xde\xaee\xaf\xaf00\xb0\xb0f\x9e\
-\x16\x16\xb1\xb1g\x9f\xcd\xcd3\xb2\xf2\x00\x00\x00\x92q\
-\xab\x14\xa9cc//\xa7i\xb5\x0b\x0b\xb4h\xb23\
-\xcd\x9fgg\xb1\x16\x16\x9eff\xaf\xdd\xb0\xab:\x0a\
-\xc5i\xaf\xdd{\xc9\xc9\xc3\xc3\xfaz\xc2@@\xdbx\
-\xc1\x0e\x0e\x0e\xda\xda\x0e\x0e\x0e\x0ewBg\x87O\xb4\
-\xf6x\xc1xxx\xc1\xc1\x0e\x0e\xc1\xc1\xc1xx\xdb\
-\xf7\xc2zz\xfa\x1b\xc3\xc9\xfc{C\x02hq\x98\xc6\
-\xab\xaf\xc8\xfct\x02\xae\xaeee\xaf\xaf00\xb0f\
-\x9e\x9e\x16\xb1\xb1g\x9f\xcd\xcd3\xf2\x00\x00\x00\x92q\
-\x14\xa9cc\xa1/\xa7ii\xb5\x0b\xb4h\xb23\xcd\
-\x9fg\xb1\x16\x16\x9eff\xb0\xb00e\xaee\xb4\xc5\
-\x0a\xc6\x140\xfa\xfa\xfa\x1b\x1bz\xc2@\xdbx\xc1\x0e\
-\xda\xdawwwwwwww\xc0s\xb1\x0dOh\
-\xc1\x0e\x0e\xc1\xc1\x0e\x0e\xda\xda\xda\xda\x0e\x0e\xc1\xc1x\
-x\xdb@\xc2z\xfa\x1b\xc3\x1b@\xde/\x9b\x0a\xc5h\
-\xde\xfc{Ct\xde\x02\x02\xaeee\xaf\xaf0\xb0\xb0\
-f\x9e\x16\x16\xb1ggg\x9f\xcd\xa4\x00\x00\x00\x92\xc7\
-\xa9cc\xa1/\xa7ii\xb5\x0b\xb4h\xb23\xcd\x9f\
-g\xb1\x16\x16\x9eff\xb000\xaf\xaf\xde\xc8\xae\x14\
-\xc6[q\xb5e{zz\xf8\xc2@\xdbx\xc1\x0e\xda\
-w\xf5\xf5\xc0BB\xc0\xc0\xc0\xc0B\xd8\x16\x0dO\xb2\
-\x0e\xda\xda\xda\xdawwwwwww\xda\xda\x0e\x0e\
-\xc1x\xdb@\xc2zzz\xc3\xdd\xcd\x9b\x8a\xc6\x14t\
-\xc1\xfa\xfcCtt\xde\xde\x02\xaeee\xaf\xaf0\xb0\
-\xb0f\x9e\x16\x16\xb1ggg\xcd\xa4\x00\x00\x00\x92\xc7\
-\xa9c\xa1//\xa7i\xb5\x0b\xb4h\xb2\xb2\xcd\x9fg\
-\xb1\x16\x9e\x9ef\xb000\xaf\xafee\x02t\xddt\
-3\xc6\x98*ce\xc2\xdbx@@x\xc1\x0e\xdaw\
-\xf5BBB\xd9\xd9\xd9\xd9BBs\x1d\x16\x0dO3\
-\xdawwww\xc0\xc0BBBB\xc0\xc0w\xda\xda\
-\x0e\xc1x@@@\xdb\xc1\xdd\xb5W\x0a\xc5\x9f{\xfa\
-\xfa\xc3{\xfeC\xddt\xde\x02\x02\xaeee\xaf00\
-\xb0f\x9e\x9e\x16\xb1\xb1\xb1g\xcd\xa4\x00\x00\x00\x92\xc7\
-c\xa1//\xa7i\xb5\x0b\xb4h\xb2\xb2\xcd\x9fg\xb1\
-\x16\x9e\x9ef\xb000\xafee\xae\x02\x02\xaeC\xc1\
-Cc\xc7\x8a*\x0b\xae\xc8xxx\xc1\x0e\xdaw\xc0\
-B\xd9\xd9s\xd8\xd8ssss\xd8v\x9e\x0dO3\
-w\xc0\xc0\xc0BB\xd9\xd9\xd9\xd9\xd9\xd9B\xc0\xf5w\
-\xda\x0e\xc1xxx\xc2\xfcg\x94%\xc6\xa9\xc3\xd9@\
-\xc3\xc3{{\xfeC\xddt\xde\xde\x02\xaee\xaf\xaf0\
-0\xb0f\x9e\x16\x16\xb1\xb1g\x9f\xa4\x00\x00\x00\xff*\
-\xa1//\xa7ii\xb5\x0b\xb4h\xb23\x9fg\xb1\x16\
-\x9e\x9ef\xb000\xafe\xae\xae\x02\xde\xde\xde\xdd{\
-\xc3\xc3\xb1\xc7[\x9b/\xaex\xdaw\x0e\x0ew\xc0B\
-\xd9s\xd8\x1d\x1d\x1d\x1d\x1d\xd8\xd8\x1d\xbff\x0dO\xcd\
-\xc0BBB\xd9\xd9ss\xd8\xd8ss\xd9\xd9B\xc0\
-w\x0e\x0e\x0e\xda\xda\xfch\x05\x0a:\x16\xc2\xdb\xf7z\
-\x1b\x1b\xc3{{\xfcC\xddt\xde\x02\xae\xaee\xaf\xaf\
-0\xb0ff\x9e\x16\x16\xb1\xb1g1\x00\x00\x00\xff*\
-\xa1/\xa7\xa7i\xb5\x0b\xb4h\xb23\x9fg\xb1\xb1\x9e\
-\x9ef\xb00\xaf\xafe\xae\x02\x02\xdet\xdd\xdd\xdd\xdd\
-\xfaB\x1b/*\xbd\x9b\xb4\x02\xdb\xf5ww\xf5B\xd9\
-s\xd8\x1d\xd7vv\xd7\xd7\x1d\x1d\xd7Gf\x0dO\xcd\
-B\xd9\xd9\xd9s\xd8\xd8\x1d\x1d\x1d\x1d\xd8\xd8s\xd9B\
-\xc0www\xc1\xc3\xb1\x05r\xc6c\xc2v\xc1\xc8z\
-z\xfa\x1b\xc3{{\xfcC\xddt\xde\x02\xae\xaee\xaf\
-\xaf0\xb0f\x9e\x16\x16\x16\xb1g1\x00\x00\x00\xff*\
-\xa1/\xa7ii\x0b\xb4hh3\xcd\x9fg\xb1\x16\x9e\
-f\xb00\xaf\xafe\xae\x02\xdet\xddCC\xfc\xfc{\
-\xc3z\xc2\xc2f\x9b\x8a\x9b/\xde\x0e\xd9sBBs\
-\xd8\x1d\xd7v\xbf\xbf\xf4vv\xd7vG\xb0\x0d\x87\x9f\
-Bss\xd8\xd8\x1d\xd7\xd7v\xd7\xd7\x1d\x1d\xd8sB\
-B\xd9\xd9B\xc3\xb2\xb7\x98\xc6f\xc1\xda\x0e\xdb\xc2\xc2\
-zz\xfa\x1b\xc3{{\xfeC\xddt\xde\x02\xaee\xaf\
-\xaf00\xb0f\x9e\x16\x16\x16\xb11\x00\x00\x00\xff\x9b\
-/\xa7ii\xb5\x0b\xb4h\xb23\x9fg\xb1\x16\x9ef\
-\xb000\xafe\xae\x02\xdet\xddC\xfc\xc9{\xc3\x1b\
-\x1b{@\x1d\xdbiW\xc5Wh\xdd\x0es\xd9\xd9s\
-\x1d\xd7v\xbfGGG\xf4vv\xbf\xd6\xb0\x0d\x87\x9f\
-\xd9s\xd8\x1d\x1d\xd7v\xbf\xbf\xbf\xbfv\xd7\x1d\xd8s\
-ssw\x1b\x16\xf2:q/\x0e\xf3\xf5@\xdb\xdb@\
-\xc2\xc2z\xfa\x1b\xc3{\xfc\xfeC\xddt\xde\x02\xaee\
-\xaf00\xb0f\x9e\x9e\x16\x16\xb11\x00\x00\x00\xff\x9b\
-/\xa7i\xb5\xb5\x0bh\xb23\xcdg\xb1\x16\x9eff\
-\xb00\xafe\xae\x02\xdet\xddC\xfc{\xc3\x1b\x1b\xfa\
-\xfa\xfa\xc2x\xc1\xc10\x94\xbd\x94iCw\xd9\xd8\xd8\
-\x1d\xd7\xbfG\xd6\x86\x86G\xf4v\xbf\xd6\xb0\x0d\x87g\
-s\xd8\x1d\x1d\xd7v\xf4GGGG\xbfv\x1d\x1d\xd7\
-\xd7s\xfa3\xf2[\xc7\xaf\xc0\xd9B\x0ex\xf6x\xdb\
-@@\xc2z\xfa\x1b\xc3{\xfc\xfe\xddt\xde\x02\xaee\
-e\xaf0\xb0ff\x9e\x9e\x16\x16\xa3\x00\x00\x00\xff\x9b\
-\xa7ii\xb5\x0b\xb4h\xb2\xcd\x9fg\xb1\x16\x9ef\xb0\
-0\xafe\xae\x02\xdet\xddC\xfc{\xc3\x1b\xc8zz\
-\xc2\xc2\xc2z\xc1G\xdah\x05\xc5\x9bhC\xd9\xbf\xd7\
-\x1dv\xbfG\x86\x86\x86\xd6G\xbf\xbf\xd6\xb0\x0d\x87g\
-s\xd8\x1d\x1d\xd7\xbfG\xd6\xd6\xd6\xd6Gv\xd7\xd7v\
-\xd9\xc2\x9e\xa4\xc6*\xa7B\x06s\xc1\x0e\x0e\xc1x\xdb\
-\xdb@@\xc2z\xfa\x1b\xc3{\xfc\xfe\xddt\xde\x02\xae\
-e\xaf00\xb0f\x9e\x9e\x9e\x16\xa3\x00\x00\x00OW\
-\xa7i\xb5\xb5\x0b\xb4\xb23\xcdg\xb1\x16\x9ef\xb00\
-\xafe\xae\x02\x02t\xddC\xfc\xc3\xc3\x1b\xfa\xf8\xc2\xc2\
-\xf7\xf7\xdb\xdbx\xda\xc0B\xaf\xc6\xea*\xb4\xf5\x06v\
-\xd8\xd7\xbfG\x86\x86\x86\xd6\xbfv\xbf\xd6\xb0\x0d\x87g\
-s\xd8\x1d\x1d\xd7\xbfG\x86\x86\x86\x86G\xf4v\xd7\x1d\
-\xc2g\xa3%\x9be\xd9\xd8\xd8\xc0w\xda\xda\x0e\xc1x\
-\xdb\xdb@\xc2z\xfa\x1b\xc3{\xfc\xfeCt\xde\x02\xae\
-\xaee\xaf0\xb0ff\x9e\x9e\x16\xa3\x00\x00\x00OW\
-\xa7i\xb5\x0b\xb4h\xb2\xcd\x9fg\xb1\x16\x9ef00\
-\xafe\xae\x02t\xddC\xfc{\xc3\xfa\xfaz\xc2\xf7\xdb\
-xxx\xc1\xc1\xdbB\x06x\x9b\x7f[\x14\xf6\x06\xbf\
-\x1d\xd7vG\xd6\x86\x86\xd6G\xbfG\x860\x0d\x87\xb1\
-\xd8\xd7\xd7\xd7\xd7\xbfG\x86\x86\x86\xd6GG\xd6\x1d@\
-\x9e\xa4\xc6\x9b\xb5s\x06\x1d\xda\xc0\xc0ww\xda\x0e\xc1\
-x\xdb\xdb\xf7\xc2z\xfa\x1b\xc3{\xfc\xfe\xddt\xde\x02\
-\xaee\xaf0\xb0fff\x9e\x16\xa3\x00\x00\x00OW\
-\xa7\xb5\x0b\x0b\xb4h\xb2\xcd\x9f\xb1\x16\x9ef\xb00\xaf\
-e\xae\x02\xde\xddC\xfc{\xc3\xfazz\xc2\xf7\xdbx\
-x\xc1\x0e\x0e\x0e\xc1B\x86\xc21\x8ard\xfc\xd7\xf4\
-\xf4\xd7\xd7v\xbf\xbf\xd6\x86\xf3\x86\xf3\x06\xaf\x0d\x87\x16\
-vGGv\xd7v\xbfG\x86\xd6G\xbf\xd6\x06sf\
-\xa4=%0sv\xd7sBBB\xc0\xc0w\xda\x0e\
-\xc1xx\xf7@\xc2z\xfa\xfb{{\xfeCt\xde\x02\
-\xaee\xaf\xaf0\xb0ff\x9e\x16\xa3\x00\x00\x00OW\
-i\xb5\x0b\xb4\xb4\xb23\xcdg\xb1\x16\x9ef\xb00\xaf\
-e\xae\x02t\xddC{\xc3\x1bzz\xc2@xx\x0e\
-\x0e\xda\xdawwwB\xd7\xf6\x9fdW\xf23\xfeB\
-\xf4v\xd7\xd7v\xbfv\xd7\x1d\x1d\xd7Gf\x0dO\x9f\
-Bs\xd8\x1d\xd7v\xbf\xf4GG\xbf\xbf\xd6\x06w\xb4\
-\xc6H\xc5\x0e\x06\xbf\xd9sss\xd9B\xc0\xc0w\xda\
-\x0e\xc1x\xdb@\xc2z\xfa\x1b\xc3{\xfeC\xddt\x02\
-\xae\xaee\xaf0\xb0ff\x9e\x9e\xa3\x00\x00\x00OW\
-i\xb5\x0b\xb4h\xb23\x9fg\xb1\x16\x9ef0\xafe\
-\xae\x02\xdetC\xfc\xc3\x1b\xfaz\xc2@\xf6\xc1\x0e\xda\
-ww\xc0\xc0\xc0BBB\xd9s\xfc\x14qq\x14\xc3\
-\xbf\xbfv\xd7\xd7vs@\x1b\xfa\xc2\xdbhO\x92i\
-\xfb\xc3@B\xd7vvvvvvG\xd6\x86\xf7\xb5\
-*\x0a\x05\xc1\x06G\xd8\x1d\x1d\xd8s\xd9BB\xc0w\
-\xda\x0exx\xdb@z\xfa\x1b\xc3{\xfcC\xddt\xde\
-\x02\xaee\xaf0\xb0fff\x9ed\x00\x00\x00OW\
-i\x0b\x0b\xb4h\xb2\xcd\x9fg\x16\x9ef\xb00\xafe\
-\xae\x02t\xddC{\xc3\x1b\xf8\xc2@\xf6\xc1\x0e\xdaw\
-\xc0BBB\xd9\xd9\xd9\xc0\x1d\x06\x1d\x9e\xa3r\xc7h\
-\xfcB\xbfv\x1dB{h\xa1\xa7\xb5\x0b\x05\x92#W\
-/ch\xfc\xc0\x1dv\xd7\xd7\xd7vG\x1d\xc2fd\
-\x94\xa4\xb2\xc0\x06\xf4\xd7\xd7\x1d\x1d\xd8s\xd9BB\xc0\
-\xda\x0e\xc1\xf6\xdb@\xc2z\x1b\xc3{\xfcC\xddt\xde\
-\x02\xaee\xaf0\xb0\xb0\xb0f\x9ed\x00\x00\x00O\x94\
-i\x0b\xb4hh\xb2\xcdg\xb1\x16\x9ef\xb00\xafe\
-\xae\xdetC\xfc\xc3\x1b\xc8z@\xdbx\x0e\xdaw\xf5\
-B\xd9ss\xd8\xd8\xd8ss\x1d\xd7\xd8\xfcc\xc7r\
-1\xc3G\xbfB\xc3\xb5u\x92\x0dHH\x0d\xfd\xfd\x0d\
-\x0d\x92u\xb5\xc3\xd9\xbf\xd7\x1d\xd7\xbf\xd6\xdb\xb5\x94:\
-1t\xd8\xbfG\xf4vv\xd7\x1d\x1d\xd8s\xd9B\xc0\
-w\xda\xc1\xc1x\xdb\xc2z\xfa\x1b\xc3{\xfc\xddt\xde\
-\x02\xae\xae\xaf00\xb0\xb0f\x9ed\x00\x00\x00O\x94\
-\xb5\x0b\xb4h\xb23\xcdg\xb1\x16\x9ef\xb00e\xae\
-\x02t\xddC{\xc3\xfa\xc8\xc2@x\xc1\x0ew\xf5B\
-\xd9s\xd8\x1d\x1d\x1d\x1d\x1dsB\x1d\x06\xd7\xaf\x14%\
-:h\xfc\xc1\xc3\xb4\x05\x0a\x1e=u\xea\x98r\xc5\x98\
-=\x1e\x0a\x94\x0bCw\xd8v\xbfsz\xb1\x05:\xb7\
-\xcd\x1d\x06\x86v\xbf\xf4\xbfv\xd7\x1d\xd8ssB\xc0\
-w\xda\x0e\xc1x\xdb@\xf8\xfa\x1b\xc3{\xfc\xddt\xde\
-\x02\xae\xaee\xaf0\xb0\xb0f\x9ed\x00\x00\x00O\x94\
-\xb5\x0b\xb4h\xb23\x9fg\xb1\x16\x9ef0\xafe\xae\
-\x02t\xdd\xfe{\xfb\xc8\xf8\xc2\xdb\xc1\x0e\xdawB\xd9\
-s\xd8\x1d\xd7vvv\xd7\x1d\xd8\xd8\x1d\x1ds{\xa7\
-W\xc5\x05\x16\xb2\x8a%\xb1\xc2\x1b{{\xc3zz\x1b\
-\x1b\xc2\x16%\x98/\x02wG\x86\xc2c\xc7:\xa3t\
-\xd8G\x86\xd6\xd6\xd6\xd6G\xf4v\xd7\x1d\xd8s\xd9B\
-\xc0\xda\x0e\xc1x\xdb@\xf8\xc8\x1b\xc3{\xc9C\xdd\xde\
-\x02\xae\xaee\xaf0\xb0\xb0f\x9ed\x00\x00\x00O\x94\
-\x0b\x0b\xb4h\xb23\x9fg\xb1\x16f\xb00\xafe\xae\
-\xdetC\xfc{\x1b\xc8\xf8\xf7\xf6\xc1\xdaw\xf5Bs\
-\xd8\x1d\xd7\xbf\xbf\xf4\xf4v\xd7\x1d\xd8B\xd8\xf3\x1d\xde\
-\xa7r\x8a11\xbd1B\x06\x06\x06\x06\x06\x06\x06\x06\
-\x06\x06\xd91\x8a\x9b\xa7C\xc1\xfa\xb1*\xbd1\x9e\xd7\
-\x06\x86\xbf\xd6\x86\x86\x86\xd6G\xbfv\x1d\xd8s\xd9B\
-\xc0w\x0e\xc1x\xdb@\xf8\xc8\x1b\xc3{\xc9C\xdd\xde\
-\x02\xae\xaee\xaf0\xb0\xb0f\x9ed\x00\x00\x00O\x94\
-\x0b\xb4hh\xb23\x9fg\xb1\x16\x9e\xb00\xafe\xae\
-\xdetC\xfc{\x1b\xc8\xc2@x\xc1\xdawB\xd9s\
-\x1d\xd7vG\xd6\xd6G\xf4vv\x1dss\xd8\xd8B\
-\xfci\x9b\x0a\xc6fB\xf3\x06\x06\x06\x06\x06\x06\x06\x06\
-\x06\x06\xf3B\x9er\x8a\x0bg1**\xa9\xfc\xd7G\
-\xd6GG\x86\xf3\xf3\xf3\xd6G\xf4v\x1d\x1ds\xd9B\
-\xc0w\xda\xc1x\xdb@\xc2z\x1b\xfb{\xfcC\xdd\xde\
-\x02\xae\xaee\xaf0\xb0\xb0f\x9ed\x00\x00\x00O\x94\
-\x0b\xb4hh\xb23\x9fg\x16\x9ef\xb00\xafe\xae\
-\x02tC\xc9{\x1b\xc8\xc2\xf7x\x0e\x0ewB\xd9\xd8\
-\x1dv\xf4\xd6\x86\x86\xd6G\xf4v\x1d\xd8ssB\xda\
-ti\x05\xc5\xab\xd9\x06\x06\xf3\xf3\x06\x06\x06\x06\x06\x06\
-\xf3\xf3\x06\x06\xd9\xab:1\xa4r:\xa9\xafv\x06G\
-\xd7\xbfG\x86\x86\xf3\xf3\xd6G\xf4v\x1d\x1ds\xd9B\
-\xc0w\xda\xc1x\xdb@\xc2z\x1b\xfb{\xfcC\xdd\xde\
-\x02\xae\xaee\xaf0\xb0\xb0f\x9ed\x00\x00\x00O\x94\
-\x0b\x0b\xb4h\xb23\x9fg\x16\x9ef\xb00\xafe\xae\
-\x02tC\xc9{\x1b\xc8\xc2\xf7x\x0e\xdawB\xd9\xd8\
-\x1dv\xbf\xd6\x86\x86\x86G\xbfv\x1d\xd8\x1dG\xda\x16\
-\xa3%*0B\xf3\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\
-\x06\x06\x06\x06\xf3\xd90*\x98*\xa7\xfb\x1dvv\xd7\
-\xd7\xbfG\xd6\x86\x86\x86\xd6Gvv\x1d\xd8s\xd9B\
-ww\xda\xc1\xf6\xdb@\xc2z\x1b\xc3{\xfcC\xddt\
-\xde\xae\xae\xaf\xaf0\xb0\xb0f\x9ed\x00\x00\x00O\x94\
-\xb5\x0b\xb4h\xb23\x9fg\x16\x9ef\xb00\xafe\xae\
-\xdetC\xfc{\x1b\xc8\xf8@x\xc1\x0ewB\xd9s\
-\x1d\xd7\xbf\xd6\x86\x86\x86G\xbfv\xd7vs\x0e\xafd\
-\xc7q/\xd8\x06\x06\xf3\x06\x06\x06\x06\x06\x06\x06\x06\x06\
-\x06\x06\x06\xf3\x06\x06\x0e:\x1eW\xb1\x1d\x06v\xd9\x1d\
-\xd7v\xbfG\xd6\xd6GG\xf4v\xd7\x1d\xd8s\xd9\xc0\
-ww\xda\xc1\xf6\xdb@\xc2z\x1b\xc3{\xfcC\xddt\
-\xde\xae\xae\xaf\xaf0\xb0\xb0f\x9ed\x00\x00\x00O\x94\
-\x0b\x0b\xb4h\xb23\x9fg\x16\x9ef\xb00\xafe\xae\
-\xdetC\xfc{\x1b\xfa\xc2\xf7\xdb\xc1\x0ewB\xd9s\
-\xd8\xd7v\xbfG\xd6G\xbfv\xd7v\x06\xda\xb2\xb7r\
-\x05es\xf3\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\
-\x06\x06\x06\xf3\x06\x06@\xc6\x7fW\xcdB\x06\xd7s\x1d\
-\xd7v\xbf\xbf\xbf\xbf\xf4vv\xd7\x1d\xd8\xd8sB\xf5\
-w\xda\x0e\xc1x@\xc2z\xfa\x1b\xfb{\xfcC\xdd\xde\
-\x02\xaee\xaf\xaf0\xb0\xb0f\x9ed\x00\x00\x00O\x94\
-\xb5\x0b\xb4h\xb23\xcdg\xb1\x16f\xb00\xafe\xae\
-\x02t\xdd\xfc{\xfb\xfaz@\xdbx\x0ew\xf5B\xd9\
-\xd8\x1d\xd7v\xbf\xbf\xbf\xbf\xd7\x1d\xbf\x06x\x14%\x0a\
-\xa4\xc0\x06\x06\xf3\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\
-\x06\x06\x06\x06\x06\x06\xda/\x9b\x94c\xae\x0es\x1d\x1d\
-\x1d\xd7\xd7vvvvv\xd7\x1d\x1d\xd8s\xd9B\xf5\
-w\xda\x0e\xc1\xf6@\xc2z\xfa\x1b\xfb{\xfcC\xdd\xde\
-\x02\xaee\xaf\xaf0\xb0\xb0f\x9ed\x00\x00\x00O\x94\
-\xb5\xb4\xb4hh3\xcdg\xb1\x16f\xb00\xafe\xae\
-\x02t\xdd\xfc{\xc3\xfaz@\xdbx\x0e\xdawB\xd9\
-s\xd8\x1d\xd7vv\xd7\xd7\x1d\xd8\xd7\x06\xc1\xa1\xc5\x98\
-\xa4\x0e\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\
-\x06\x06\x06\x06\x06\x06\x86s\xae\xb7:\xf23\xda\x86\xd7\
-\xd8\x1d\xd7\xd7\xd7\xd7\xd7\xd7\x1d\x1d\xd8s\xd9BB\xf5\
-w\xda\xc1\xc1\xdb@\xc2z\xfa\x1b\xfb{\xfe\xddt\xde\
-\x02\xaee\xaf0\xb0\xb0\xb0f\x9ed\x00\x00\x00O\x05\
-\x0bh\xb2\xb23\xcdg\xb1\x16f\xb00\xafe\xae\x02\
-t\xddC{\x1b\xfaz@\xdb\xc1\x0e\xdawB\xd9\xd8\
-\x1d\x1dvv\xbf\xbfvv\xd7\x1d\xbf\x06\x0e\xa7\xc6[\
-\xf2x\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\
-\x06\x06\x06\x06\x06\xf3\x06\x06\xc0\xf2\x0a\xbdc\x0e\x06\xbf\
-\x1d\xd7vvvvvvv\xd7\x1d\x1d\xd8s\xd9B\
-\xc0w\xda\x0e\xc1x\xdb@\xc2\xc8\x1b\xfb{\xfc\xfe\xdd\
-t\x02\xae\xae\xaf\xaf00\xb0f\xab\x00\x00\x00O\xb7\
-h3\xcd\x9fg\xb1\x16\x9e\xb00\xafe\xae\xdetC\
-\xfc\xc3\x1b\xfa\xc2\xdbx\xc1\xda\xf5B\xd9s\x1d\xd7v\
-\xbfG\xd6\xd6\x86\x86\x86\xd6\xd6\xf4\x86\x06\xc0iq[\
-\xf2x\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\
-\x06\x06\x06\x06\x06\x06\x06\x06\xc1\xf2[\xc6iB\x06\xf3\
-G\xd6\x86\x86\x86\x86\x86\x86\xd6\xd6G\xbf\xbfv\xd7\x1d\
-\xd8s\xd9B\xc0w\x0e\xc1x\xdb@\xc2z\x1b\xfb{\
-\xfcC\xdd\xde\x02\x02\xae\xaee\xaf\xa9\x00\x00\x00\xfd\xbd\
-\xf2\xa4\xa411\xa3dd\xab\x14\xa9c\xa1/\xa7\xa7\
-i\xb5\x0b\x0b\xb4h\xb23\xcd\x9fg\xb1\x16\x16\x9e\x9e\
-f\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0f0\x02\x9fW[[\
-1\xc1\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\
-\x06\x06\x06\x06\x06\x06\x06\x06\xc11[[\x94g\x020\
-f\xb0\xb0\xb00000\xb0\xb0\xb0ff\x9e\x9e\x16\
-\x16\x16\xb1g\x9f\x9f\xcd3\xb2\xb2h\xb4\xb4\x0b\xb5\xb5\
-i\xa7\xa7//\xa1\xa1cc\xa9\xc7\x00\x00\x00y\xad\
-##\xfd\xfd\xfd\xfd\xfd\xfd\x92\x92\x92\x92\x92\xff\xff\xff\
-OOOOOOOO\x87\x87\x87\x87\x87\x87\x87\x87\
-\x87\x0d\x0d\x0d\x0d\x87\x87\x0d\x87\x87\x0d\x0dO\xadO\x98\
-c\xda\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\
-\x06\x06\x06\x06\x06\x06\x06\x06\xdac\x98O\xadO\x0d\x0d\
-\x87\x87\x87\x87\x87\x0d\x0d\x0d\x87\x87\x87\x87\x87\x87\x87\x87\
-\x87\x87\x87\x87\x87OOOOOOOOOO\xff\
-\xff\xff\x92\x92\x92\x92\x92\x92\x92\xfd|\x00\x00\x00y|\
-\xfd\xfd\xfd\xfd\x92\x92\x92\x92\x92\x92\x92\xff\xff\xff\xffO\
-OOOOOOOO\x87\x87\x87\x87\x87\x87\x87\x87\
-\x87\x87\x87\x87\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x0dO\xadO\x98\
-c\xda\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\
-\x06\x06\x06\x06\x06\x06\x06\x06wc\x0a\x929\x87\x88\x0d\
-\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x0d\x87\
-\x87\x87\x87\x87\x87\x87\x87\x87\x87\x87\x87\x87\x87\x87\x87\x87\
-\x87OOOOOOOOO#\x00\x00\x00\xfd\xc5\
-11\xa3\xa3d\xab\x14\x14\xa9cc\xa1//\xa7i\
-\xb5\xb5\x0b\xb4hh\xb23\xcd\x9f\x9fg\xb1\x16\x16\x9e\
-\x9eff\xb0\xb00000\xb0\xaf\xde\xb1\x94[[\
-1\xc1\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\
-\x06\x06\x06\x06\x06\xf3\x06\x06B1\xbb\xbb\x9b\x16\xfc\xae\
-0\xaf\xaf\xaf\xaf\xaf\xaf0000\xb0\xb0\xb0ff\
-\x9e\x9e\x16\x16\x16\xb1\xb1gg\x9f\xcd\xcd33\xb2\xb2\
-hh\xb4\xb4\x0b\x0b\x0b\x0b\xb5\xb5\x94\x00\x00\x00\x871\
-g\xb1\xb1\x16\x16f\xb00\xafe\xae\x02\xde\xddC\xc9\
-\xc3\x1b\xfaz@\xdbx\x0e\xdaw\xc0Bs\xd8\x1d\xd7\
-v\xbfG\xd6\x86\x86\xf3\xf3\x86\xd6\x06\x06siq[\
-b\xc1\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\
-\x06\x06\x06\x06\x06\x06\xd6s\xae\xb7\xc6\xa3\x9e\xbf\x06\x06\
-\x06\x06\x06\x06\x06\x06\x06\x06\x06\xf3\x86\xd6\xd6GG\xbf\
-v\xd7\x1d\x1dss\xd9BB\xf5w\xda\x0e\xc1xx\
-\xdb@\xc2z\xfa\xfa\x1b\x1b\x1b\xc3\xb5\x00\x00\x00\x87\xf2\
-\xcd\x9fgg\xb1\x16\x9ef\xb00\xafe\xae\x02t\xdd\
-C\xc9\xc3\x1b\xfa\xf8@\xdbx\x0e\x0ew\xc0Bs\xd8\
-\x1d\xd7v\xbfGG\xd6\xd6G\xbf\xf3\x06\xc0\xa1\xbd\x0a\
-b\xc0\x06\x06\xf3\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\
-\x06\x06\x06\x06\x06\x06\xda/\x9b\x05\xa7Cs\xd6\x06\x86\
-\x86\x86\xf3\xf3\xf3\x86\x86\xd6\xd6G\xbfvv\xd7\xd7\x1d\
-\xd8s\xd9BB\xc0w\xda\xda\xc1\xc1x\xdb\xf7\xc2\xf8\
-\xf8\xfa\xfa\x1b\xc3{{{\xfcC\xa7\x88\x00\x00\x87\xf2\
-3\xcd\x9fgg\xb1\x16\x9ef\xb00\xafe\xae\x02t\
-\xddC\xc9\xc3\x1b\xfa\xf8@\xdbx\x0e\x0ew\xc0Bs\
-\xd8\x1d\xd7v\xbfGGGG\xbf\xd6\x06B\x9f\xf2r\
-\x05e\xd9\xf3\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\
-\x06\x06\x06\xf3\x06\x06@\xc6\x7fWg\xd8\x06\x86\xbfG\
-\xd6\xd6\x86\x86\x86\xd6\xd6G\xbf\xbfv\xd7\x1d\x1d\xd8s\
-\xd9BB\xf5w\xda\xda\x0e\xc1\xf6\xdb@@\xc2z\xc8\
-\x1b\x1b\xc3{\xfc\xfcCCC\xdd\xa7\x88\x00\x00\x87\xf2\
-\xb2\xcd\x9fgg\xb1\x16\x9ef\xb00\xafe\xae\x02\xde\
-\xdd\xfe\xfc\xc3\x1b\xfaz@\xdbx\xc1\xdaw\xc0Bs\
-\xd8\x1d\xd7\xbfG\xd6\x86\x86\xd6GGG\xd7w\xae\xab\
-\xc7q/s\x06\x06\xf3\x06\x06\x06\x06\x06\x06\x06\x06\x06\
-\x06\x06\x06\xf3\x06\x06\x0e:~\xc7\xb2\xd9\x06\x86\xbfG\
-\xd6\x86\x86\x86\x86\x86\xd6G\xbf\xbfv\xd7\x1d\x1d\xd8s\
-\xd9BB\xc0w\xda\x0e\xc1\xc1\xf6\xdb@\xc2\xc2\xf8\xfa\
-\x1b\x1b\xc3{\xfcCCCC\xdd\xa7\x88\x00\x00\x87\xf2\
-\xb2\xcd\x9f\x9fg\xb1\x16\x9ef\xb00\xafe\xae\x02\xde\
-t\xfe\xfc{\xc3\xfaz@\xdbx\xc1\xdawB\xd9s\
-\xd8\x1dv\xbfG\x86\x86\x86\x86\xd6\xbf\xd7\xbf\x06Bf\
-\xab\xbd*0B\xf3\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\
-\x06\x06\x06\x06\xf3B\xb0*\xbd\x140s\x06\xd6\xbfG\
-\xd6\x86\x86\x86\x86\x86\xd6G\xf4\xbfv\xd7\x1d\x1d\xd8s\
-\xd9BB\xc0w\xda\x0e\xc1\xc1\xf6\xdb@\xc2\xc2z\xfa\
-\x1b\x1b\xc3{\xfcCCCC\xdd\xa7\x88\x00\x00\x87\xf2\
-\xb2\xcd\x9f\x9fg\xb1\x16\x9ef\xb00\xafe\xae\x02\xde\
-t\xfe\xfc{\xfb\xc8z@\xdbx\x0e\xdawB\xd9s\
-\xd8\x1dv\xbfG\x86\x86\x86\x86\xd6\xbfv\xd7v\x1d\xd9\
-{\x0b\xb7\xc5d\xd9\x06\x06\xf3\xf3\x06\x06\x06\x06\x06\x06\
-\xf3\xf3\x06\x06\xd9d\xc5\xa4\xb2\xfa\x1dv\xbf\xbfGG\
-\xd6\x86\x86\xf3\xf3\x86\xd6G\xf4\xf4v\xd7\x1d\x1d\xd8s\
-\xd9BB\xf5w\xda\x0e\x0exx\xdb@\xc2\xc2z\xfa\
-\x1b\x1b\xc3{\xfcCCCC\xdd\xa7\x88\x00\x00\x87\xf2\
-\xb2\xcd\x9f\x9fg\xb1\x16\x9ef\xb00\xafe\xae\x02\xde\
-tC\xfc{\xfb\xc8\xf8\xc2\xdbx\x0e\xdaw\xc0\xd9s\
-\xd8\x1dv\xf4G\x86\x86\x86\x86\xd6\xbf\xd7\xd7\xf4\xf4\xd7\
-z\xb4\x94\x0a\xc6fB\xf3\x06\x06\x06\x06\x06\x06\x06\x06\
-\x06\x06\xf3\xc0f\xc6\x98\xb7\xcd\xdbGGG\xbf\xbfG\
-\xd6\x86\x86\xf3\x86\x86\xd6G\xf4\xf4v\xd7\x1d\x1d\xd8s\
-\xd9B\xc0\xc0w\xda\x0e\x0exx\xdb@\xc2\xc2z\xc8\
-\x1b\x1b\xc3{\xfcCCC\xdd\xdd\xa7\x88\x00\x00O\xf2\
-\xb2\xcd\x9f\x9fg\xb1\x16\x9ef\xb00\xafe\xae\x02\xde\
-tC\xfc\xc3\x1b\xfaz\xc2\xdbx\xc1\x0e\xda\xc0Bs\
-\xd8\x1d\xd7\xbfG\xd6\xd6\xd6\xd6Gv\x1d\xbf\x06G\xfc\
-\xb5:%1\xa3\xbd1B\x06\x06\x06\x06\x06\x06\x06\x06\
-\x06\x06B\xa4\xbd\xab\xabrqh\xc3G\x06\xd6vG\
-\xd6\xd6\x86\x86\x86\xd6\xd6G\xf4\xbfv\xd7\x1d\x1dss\
-\xd9B\xc0\xc0w\xda\x0e\x0exx\xdb@@\xc2z\xc8\
-\x1b\xc3{{\xfcCCCCt/\x88\x00\x00\x87\xf2\
-\xb2\xcd\x9f\x9fg\xb1\x16\x9ef\xb00\xafe\xae\x02\xde\
-t\xdd\xfc{\x1b\xfaz\xc2@\xf6\xc1\x0e\xdawB\xd9\
-\xd8\x1d\x1dv\xbf\xf4GG\xbfvv\xbf\xbfvz\x0b\
-\x05:\xb7\x9e\x9f\x8a%\xb1\xc2\x1b{{\xc3zz\x1b\
-\x1bz\xb1%%\x16\xaf\xa4q\xb7\xb4z\xbf\xd6\xd6G\
-G\xd6\xd6\xd6\xd6\xd6G\xf4\xf4v\xd7\x1d\x1d\xd8ss\
-\xd9B\xc0\xc0w\xda\x0e\x0exx\xdb@@\xc2z\xc8\
-\x1b\xc3{{\xfcCCCCt/\x88\x00\x00\x87b\
-\xb2\xcd\xcd\x9fg\xb1\x16\x9ef\xb00\xafe\xae\x02\xde\
-t\xdd\xfc{\xc3\xfaz\xc2@x\xc1\x0e\xdawB\xd9\
-s\xd8\x1d\x1d\xd7v\xbf\xbfv\x1dG\x06\xbf\xaec\xbd\
-\xc63\xc3w\xf8\xb2\x05\x0a\xe1\xc4\xea\xea\x0arr\x98\
-\xc4~\x0a\xb7\x9fxs\xc8\x9fqr/\xde\xbf\x06\xd6\
-vG\xd6GGG\xf4\xbf\xbfv\xd7\x1d\x1d\xd8ss\
-\xd9B\xc0\xf5w\xda\x0e\xc1xx\xdb@\xc2z\xfa\xfa\
-\x1b\xc3{{\xfcCCC\xdd\xdd/\x88\x00\x00\x87b\
-\xb2\xcd\xcd\x9fg\xb1\x16\x9ef\xb000\xaf\xae\x02\xde\
-t\xddC{\xfb\x1bzz@\xdbx\xc1\xdaw\xc0B\
-\xd9s\xd8\x1d\x1d\xd7\xd7\xd7\xd7\xd7\xd7\x1d\x1b\xa7W\xc5\
-1\x1b\x86\x86\x1dz\xb4\xbb\x92\x88\xcb\xcb\x0d\xfd\xfd\x88\
-\x88\x92\xbb\xb2\xdbv\x06\x06z\xa3\xc5W\xa7\xfb\xd7\xd6\
-\x86G\xbf\xf4\xf4\xf4\xf4\xbfv\xd7\xd7\x1d\xd8ss\xd9\
-\xd9B\xc0ww\xda\xc1\xc1x\xf6\xdb@\xc2z\xfa\xfa\
-\x1b\xc3{{\xfc\xfeC\xdd\xdd\xdd/\x88\x00\x00\x87\xb7\
-\xb23\xcd\x9f\x9f\xb1\x16\x16ff\xb00\xafe\xae\x02\
-t\xddC\xfc\xc3\x1b\xfaz@\xdbx\xc1\x0e\xdaw\xc0\
-B\xd9s\xd8\xd8\xd8\xd8\xd8v\x86\xc0fcW\xb73\
-\xfcs\xd6Gv\xd8\xfa\xcd/\xb5\xb4h\xb7\x92\xfd\x05\
-\x0bigz\x1d\xbf\xd6\x86s{\xb2*:\x140v\
-\x06\xd6\xd7v\xbfvvv\xd7\x1d\x1d\xd8\xd8ss\xd9\
-B\xc0\xc0w\xda\x0e\xc1\xc1\xf6\xdb@@\xc2z\xfa\xfa\
-\x1b\xc3{\xfcCC\xdd\xdd\xddt/\x0d\x00\x00O\xb7\
-\xb23\xcd\xcd\x9fg\xb1\x16\x9ef\xb00\xafe\xae\x02\
-\xdetC\xfc{\xc3\xfaz\xc2@\xdb\xf6\xc1\x0e\xdaw\
-\xc0B\xd9\xd9sss\xd9\xd7\x06w/:\x8a\xf2{\
-GGG\xbfG\xd6\xd7\x0e@\xdb\xc1w\xcdO\xffh\
-\xc1xw\xd7G\xbfv\xf4\xf4v\xc3\x14q*\xa9\xfc\
-\x1dG\xd6v\xd7vv\xd7\xd7\x1d\x1d\xd8ss\xd9B\
-B\xc0ww\xda\x0e\xc1xx\xdb@\xc2\xc2z\xfa\xfa\
-\x1b\xc3{\xfcC\xdd\xdd\xdd\xddt/\x0d\x00\x00O\xb7\
-h\xb23\xcd\x9fg\xb1\x16\x9ef\xb00\xafe\xae\x02\
-\xdet\xddC{\xc3\x1b\xfaz\xc2@\xdbx\xc1\xdaw\
-\xc0\xc0BB\xd9\xd9B\xc0\xd7\x06B\xab\x98u\x05@\
-\x06G\xd7\xbfG\xd6\xd6G\xbfG\xd6\x060\x0d\x87\x9e\
-GGG\xbfv\xd7\x1d\x1d\x1dv\xc0\xfe\xb2W\xc6\xa3\
-\x16\xd7\x06\xf4\xd8\xd7\xd7\x1d\x1d\xd8\xd8\xd8s\xd9\xd9B\
-\xc0\xc0w\xda\x0e\x0e\xc1xx\xdb\xf7\xc2\xc2z\xfa\x1b\
-\xc3\xc3{\xfcC\xdd\xdd\xdd\xddt/\x0d\x00\x00O\xb7\
-h\xb23\xcd\x9fg\xb1\x16\x9ef\xb0\xb00\xafe\xae\
-\xde\xde\xddC\xfc{\xc3\x1b\xc8z\xc2@\xdb\xc1\xc1\x0e\
-www\xc0\xc0\xc0B\xd8\x1d\x1dt\x05\x8a:/\xda\
-\x06G\xd7vG\x86\xf3\x06\x06\x06\x06\x06\x02\x0d\x0d0\
-\x06\x06\xf3\xbf\x1d\x1d\xd8ss\x1d\x1dsCc\x9b\xc6\
-\xa3\xdd\xd8\xf4\xf4\xd7\x1d\x1d\x1d\xd8sss\xd9B\xc0\
-\xc0ww\xda\x0e\xc1xx\xdb\xdb\xf7\xc2zz\xfa\x1b\
-\xc3{\xc9CC\xdd\xdd\xdd\xddt/\x0d\x00\x00O\xb7\
-h\xb233\xcdg\xb1\xb1\x16\x9ef\xb00\xafe\xae\
-\x02\xdet\xdd\xfe{\xc3\x1b\xc8z\xc2\xc2\xf7\xf6\xc1\xc1\
-\x0e\xda\xdaw\xda\x0es\x06\x1d\x161:\x9bhC\xd9\
-\xd6v\xd7\xbfG\x86\xf3\xf3\xf3\x86\x06\x06e\x0d\x87\x9e\
-\xbf\xbf\xbf\x1d\x1d\xd8s\xd9\xd9B\xd9\xd8\xdath\x94\
-\xc6\xf2\x9f\x1d\x06v\xd9s\xd8s\xd9\xd9\xd9BB\xc0\
-ww\xda\x0e\x0e\xc1xx\xdb@@zz\xfa\xfa\x1b\
-\xfb{\xfcCC\xdd\xdd\xdd\xddt/\x0d\x00\x00O\xb7\
-h\xb2\xb23\xcd\x9fg\xb1\x16\x9ef\xb00\xafe\xae\
-\xae\x02ttC\xfc{\xfb\x1b\xfaz\xf8\xc2@\xf6x\
-\xc1\xc1\x0e\x0e\xdaBsst1:W/{s\xd8\
-\x1d\xd7v\xbfG\x86\x86\x86\x86\xd6\x86\x06\xaf\x0d\x87\x16\
-\xd7\x1d\x1d\xd8ss\xd9\xd9Bw\xc0\xd9\xd9wt/\
-Wr\xf2\xde\xd8vv\xd8\xd9\xd9\xd9\xd9BB\xc0w\
-w\xda\xda\x0e\xc1xx\xdb\xdb@\xc2zz\xfa\x1b\xc3\
-\xc3{\xfc\xfe\xdd\xdd\xdd\xddtt/\x0d\x00\x00O\x05\
-\xb4h\xb233\x9fg\xb1\x16\x16ff\xb00\xafe\
-\xae\x02\xdet\xddC\xfc{\xc3\x1b\xc8\xc8\xf8@@\xdb\
-xxx\xdb\xc0\x06\xd9\xcd\xf2:Wh\xdd\xc0\xd7\xd8\
-\xd8\x1dv\xbfG\xd6\xd6\xd6\xd6G\x86\x06\xaf\x0d\x87\xb1\
-\x1d\x1d\xd8s\xd9\xd9BB\xc0w\xda\xdaw\xc0\xdb\xde\
-h\x94\xc6\x05\xb2\xd8\x06\xd7\xc0BBBB\xc0ww\
-\xda\xda\x0e\xc1\xc1x\xdb\xdb@\xc2\xc2z\xfa\x1b\x1b\xfb\
-{\xfc\xfe\xfe\xddtt\xddt\xde/\x0d\x00\x00O\x05\
-\xb4hh\xb23\xcd\x9fg\xb1\x16\x9ef\xb00\xaf\xaf\
-e\xae\x02\xdet\xddC\xfc{\xc3\x1b\xfa\xc8z@@\
-@@\xf6\xda\xc0\xc0\xae\xb7\xbd\x9b\xa1t\xc0\x1d\xd7s\
-s\x1d\xd7v\xbf\xbfGGG\xf4\xd6\x06\xaf\x0d\x87g\
-sss\xd9B\xc0\xc0\xf5w\xda\x0e\xc1\xc1wwx\
-\x02/W%\x05\x02s\x1d\x1d\xd9\xc0\xf5\xf5ww\xda\
-\xda\x0e\xc1\xc1x\xdb\xdb@@\xc2z\xfa\xfa\x1b\xc3{\
-{\xfcCC\xddtttt\xde\xa1\x0d\x00\x00O\x05\
-\x0b\xb4h\xb233\x9fg\xb1\x16\x9e\x9e\xb0\xb00\xaf\
-e\xae\x02\xdett\xddC\xfc{\xc3\x1b\xfa\xfaz\xc2\
-\xc2z\x0eG\xda\xb4\x05:W\xb4\xde\xc1s\xd9B\xd9\
-s\xd8\x1d\xd7vv\xbf\xbf\xbf\xbfG\xf30\x0d\x87g\
-\xd9\xd9\xd9B\xf5www\xda\x0e\x0e\xc1xxx\x0e\
-\xf8\xae\xb4W:\x94hs\x06\xd8\xdawww\xda\xda\
-\x0e\xc1\xc1xx\xdb\xf7@\xc2zz\xfa\xfa\x1b\xc3{\
-{\xc9C\xddtt\xdet\xde\xde\xa1\x0d\x00\x00O\x05\
-\x0b\xb4hh\xb23\xcd\x9f\xb1\xb1\x16\x9ef\xb000\
-\xafe\xae\x02\xde\xdet\xddC\xfc{\xc3\x1b\x1b\xfa\xfa\
-\xc2\xf6\xc1\xc10W%\x9b/\x02\x0eB\xd9\xc0wB\
-\xd9s\xd8\x1d\x1d\xd7\xd7\xd7\xd7\xd7\xbf\x860\x0dO\x9f\
-BBB\xc0w\xda\xda\xda\x0e\x0e\xc1x\xdb@@x\
-x\xc2e/W\x8aW\x02s\xd8sw\xda\x0e\x0e\x0e\
-\x0e\xc1\xc1x\xdb\xf7\xf7\xc2\xc2z\xfa\xfa\x1b\xc3\xc3{\
-\xfcCC\xddt\xde\xde\xde\xde\x02\xa1\x0d\x00\x00O\x94\
-\x0b\xb4\xb4h\xb2\xb2\xcd\x9fg\xb1\x16\x16\x9ef\xb00\
-\xafee\xae\x02\xdettCC\xfc{\xc3\xc3\xc3{\
-@\x1d@iWr\x9b\xb4\x02@w\xda\xdaww\xc0\
-B\xd9s\xd8\x1d\x1d\x1d\x1d\x1d\x1dv\xd6\xb0\x0dO\xcd\
-\xc0\xc0w\xda\xda\x0e\x0e\xc1\xc1\xc1x\xdb@@\xc2\xc2\
-\xc2@\xc3e\x0b\x9brW\x0b\xc0\x06\xd9\xc1\x0e\x0e\xc1\
-\xc1\xc1\xf6\xdb\xdb@@\xc2z\xfa\xfa\x1b\xc3\xc3{\xfc\
-\xfcCCtt\xde\xde\xde\xde\x02\xa1\x0d\x00\x00O\x94\
-\xb5\x0b\xb4hh\xb23\xcd\x9fg\xb1\x16\x9eff\xb0\
-0\xafee\xae\x02\xdett\xddCC\xc9{\xc3\xf8\
-\xc2\xc2f\x9b[\x9b/\xae\xdb\xdaw\xc1\xc1\x0eww\
-\xc0B\xd9ss\xd8\xd8\xd8\xd8\xd8\x1dG\xb0\x0dO3\
-ww\xda\x0e\xc1\xc1\xc1\xc1xx\xdb@\xc2\xc2z\xfa\
-\xfazz\xfa\xaf\xa1\x9b[\x9b\xaf\xc0B\xc0\x0exx\
-x\xf6\xf6\xdb@@\xc2zz\xfa\x1b\xc3\xc3{{\xfc\
-CC\xddtt\xde\xde\xde\x02\x02\xa1\x0d\x00\x00O\x94\
-\xb5\x0b\xb4\xb4hh3\xcd\x9fg\xb1\x16\x16\x9ef\xb0\
-00\xafee\xae\x02\xdett\xddCCC\xfa\xc0\
-\xfb/*%*\xb4\xae\xc8xx\xf6xx\x0e\xdaw\
-\xf5\xc0B\xd9\xd9\xd9\xd9\xd9ss\xd8\xbff\x0dO3\
-\xda\x0e\x0e\xc1xxx\xdb\xdb\xdb@\xc2\xf8\xf8\xfa\x1b\
-\xc3\xc3\xc3\x1b\xfc\xaf\x0b*%\x9b\xb5\x0e\xd6w\xdb\xdb\
-\xdb\xdb@@\xc2\xc2zz\xfa\x1b\x1b\xc3\xc3{\xfcC\
-C\xdd\xddt\xde\x02\x02\x02\x02\xae\xa1\x0d\x00\x00O\x94\
-i\xb5\x0b\x0b\xb4h\xb23\xcd\x9fg\xb1\x16\x16\x9ef\
-\xb0\xb00\xafee\xae\x02\xde\xdet\xddCC{\x1b\
-\x9e*[*ce\xc2\xdb\xdb\xc2\xc2\xdbx\xc1\x0e\xda\
-ww\xc0\xc0BBBBBBs\xd7\x9e\x0dO\xb2\
-\xc1\xc1\xc1x\xdb\xdb\xdb@@@\xc2\xf8\xc8\xc8\x1b\xc3\
-\xc3\xfc\xfc\xc3\xc3\xc30c*\x98*\xb0\xc1\xda\xda\xf6\
-@@@\xc2\xc2zz\xfa\xfa\x1b\xfb\xc3{\xfc\xfcC\
-C\xddt\xde\xde\x02\x02\x02\x02\xaec\x0d\x00\x00OW\
-i\xb5\xb5\x0b\xb4hh\xb23\x9fgg\xb1\x16\x9e\x9e\
-f\xb000\xaf\xafe\xae\xae\x02\xde\xde\xdd\xfc\xafi\
-\xb7\xbd\xc7\x0be{\xc2zz\xf8\xc2@\xdbx\xc1\xc1\
-\xda\xdaww\xc0\xc0\xc0\xc0\xc0\xc0B\x1d\x16\x0dOh\
-xxx@@@@\xc2\xc2z\xf8\xc8\x1b\x1b\xc3\xc3\
-{\xfcCCCCt\xaf\xb5\xc6\x8a\x9b\xb5@\xd7\x0e\
-@\xc2z\xf8\xf8\xc8\xc8\x1b\x1b\xc3\xc3{{\xfcCC\
-\xddtt\xde\x02\xae\xae\x02\xae\xaec\x0d\x00\x00OW\
-ii\xb5\x0b\x0b\xb4h\xb2\xb23\x9f\x9fg\xb1\x16\x9e\
-\x9ef\xb000\xaf\xafe\xae\xae\xae\x02\xdd\xfa\x9e\xc6\
-\xbb\xc6\x14\xaf\xc8\xfa\xfa\x1b\x1b\xc8\xf8\xc2@\xdbx\xc1\
-\xc1\x0e\x0e\xda\xda\xdawwww\xc0\xd8\x16\x0dOh\
-\xdb\xdb@\xc2\xc2\xc2zz\xc8\xfa\xfa\x1b\xfb\xc3{{\
-\xfcC\xddttt\xdd{\xb0\x14q\x98*\x9e@\xf6\
-\xf6@zz\xc8\xc8\x1b\x1b\xc3\xc3\xc3{\xfcCC\xdd\
-\xddt\xde\x02\x02\xae\xae\xae\xaeec\x0d\x00\x00OW\
-\xa7ii\xb5\x0b\x0b\xb4h\xb23\xcd\x9fg\xb1\xb1\x16\
-\x9e\x9ef\xb000\xaf\xafeee\xae\xfe\xc1\x16\xcb\
-O\xa3\xb0C\x1b{{\xc3\x1b\xfazz\xc2@\xdb\xdb\
-x\xc1\xc1\x0e\x0e\x0e\x0e\x0e\x0e\x0ews\xb1\x0dO\xb4\
-@@@zzz\xfa\xfa\x1b\x1b\x1b\xc3{{\xc9\xfc\
-C\xddtt\xde\x02\x02\xde\xae0i\xc5\x98\x9bi\x1b\
-B\xf6z\xfa\xfa\x1b\x1b\xc3\xc3{{\xfcCC\xdd\xdd\
-t\xde\xde\x02\x02\xae\xae\xaeeec\x0d\x00\x00O\x9b\
-\xa7\xa7ii\xb5\x0b\x0b\xb4h\xb23\xcd\x9fg\xb1\xb1\
-\x16\x16\x9ef\xb0\xb000\xaf\xafe\x02t\xdd\xa7\x0d\
-\x0d\xa7C{{C\xfe{\xc3\x1b\xfa\xfaz\xc2@@\
-\xdb\xdbxx\xc1\xc1\xc1\xc1\xc1\xc1\xdaB\xb1\x0dO\x0b\
-\xc2zz\xfa\x1b\x1b\x1b\xfb\xc3\xc3\xc3{\xfc\xfcCC\
-\xddtt\xde\x02\xae\xaee\x02Cf\xa3\xc5\x98*\xb1\
-\xc3\xc2@z\x1b\x1b\xc3\xc3{{\xfcCC\xdd\xddt\
-t\xde\x02\x02\xae\xaeeeeec\x0d\x00\x00\xff\x9b\
-/\xa7\xa7ii\xb5\x0b\xb4hh\xb23\xcd\x9fg\xb1\
-\xb1\x16\x16\x9eff\xb0\xb000\xae\xfc\xaf\xa1\xc7\xea\
-%\xb4\x02\xddCC\xfe\xfc{\xc3\x1b\x1b\xfaz\xc2\xc2\
-@@\xdb\xdbxxx\xf6\xf6\xf6\xc1\xc0g\x87O\x0b\
-zz\xfa\x1b\xfb\xfb\xc3\xc3\xc3{{\xc9C\xfeC\xdd\
-tt\xde\x02\xae\xaeeeee\xaff\xa7\xbd\x0a\x9b\
-iC\x0e@\xfa\xc3{{\xfc\xfcCC\xdd\xddt\xde\
-\xde\x02\x02\xae\xaeeeee\xaf\xa9\x0d\x00\x00\xff\x9b\
-//\xa7\xa7ii\xb5\x0b\xb4hh\xb23\xcd\x9fg\
-\xb1\xb1\x16\x16\x9efff0\xaf\xaf0\x0b\xc6[*\
-\x14g\xae\x02tt\xddC\xfc{\xc3\xc3\x1b\xfazz\
-\xc2\xc2\xc2\xf7\xf7\xf7@@@@xw\x9f\x87O\xb5\
-\x1b\x1b\x1b\xfb{{{\xc9\xfc\xfc\xfe\xfeC\xdd\xddt\
-\xde\xde\x02\xae\xaeee\xaf0\xb0\xaft\x9e\xa4\xbd\x98\
-*\xcd\xdd\x1bz\x1b{\xfcCCC\xdd\xddtt\xde\
-\x02\x02\xae\xae\xaeeee\xaf\xaf\xa9\x0d\x00\x00\xff*\
-\xa1//\xa7\xa7i\xb5\x0b\x0b\xb4hh\xb23\xcd\x9f\
-gg\xb1\xb1\x16\x16\x9ef0\x02\x9e\xa9\xc7\xea\x8ai\
-0e\xae\x02\x02\xdet\xddC\xfc{{\xc3\x1b\xfa\xfa\
-z\xf8\xf8\xf8\xf8\xc2\xc2\xc2\xc2\xc2\xdb\x0e\xcd\x87\xffi\
-\xc3\xc3\xc3{\xfc\xfc\xfcCCCC\xdd\xddtt\xde\
-\x02\x02\xae\xaee\xaf\xaf00\xb0\xb00\xb0\x9e/\x8a\
-\xbb\x9b\xa7\x02\xc2\xfa\xc3\xfcCC\xdd\xddtt\xde\x02\
-\x02\xae\xaeee\xaf\xaf\xaf\xaf0\xa9\x0d\x00\x00\x92*\
-\xa1////\xa7i\xb5\x0b\x0b\xb4hh\xb23\xcd\
-\x9f\x9fg\xb1\xb1\x16\x9eff\x16\xa7\xc6\x0a\x8a\xb7\x9e\
-C\x02\xae\xae\xae\x02\xdet\xddC\xfc\xfc{\xc3\xc3\x1b\
-\x1b\xfa\xc8\xc8\xc8zzzz\xf8\xc2\xc13\x87\xff\xa7\
-{{{\xfeCCC\xdd\xddtttt\xde\x02\x02\
-\xae\xaeee\xaf\xaf00\xb0ff\x16\xb0\x02\xb1\x05\
-\x8a\x98*h\xae{\x1b\xfcC\xdd\xddtt\xde\xde\x02\
-\xae\xae\xaee\xaf\xaf\xaf\xaf\xafe\xa9\x0d\x00\x00\xfd\x9b\
-\xa7/\xa1\xa1/\xa7ii\xb5\x0b\x0b\xb4hh\xb23\
-\xcd\xcd\x9fg\xb1\x16f0g\x14q\xc4[\xa1\x9e0\
-e\xaf\xafe\xae\xae\x02\xdet\xddC\xfe\xfc\xc9{\xc3\
-\xc3\xc3\x1b\x1b\x1b\x1b\x1b\x1b\x1b\xfaz\xdb\xb2\x87\xff\xa7\
-\xfe\xfc\xfe\xdd\xddtttt\xde\xde\xde\xde\x02\xae\xae\
-\xaeee\xaf000\xb0ff\x9e\x16\x16\x9e\x9e\xb1\
-c[\xea*\xa1\xaf\xc3\xc3{\xdd\xde\xde\xde\x02\x02\xae\
-\xae\xaee\xaf\xaf00\xafe\x02\xa1\x87\x00\x00Uq\
-\xabc/\xa1//\xa7\xa7i\xb5\x0b\x0b\xb4\xb4h\xb2\
-\xb23\xcd\x9f\xb1\x16\xb1\x9f\xa1:\x0a\x98\x94\x16\xdd\xaf\
-\xb00\xaf\xafe\xae\xae\x02\xdett\xddCC\xfc\xfc\
-{{\xc3\xc3\xc3\xc3\xc3\xc3\xc3\xc3\xfa@h\x87\xff/\
-CC\xddt\xde\xde\xde\xde\xde\x02\x02\x02\xae\xae\xaee\
-e\xaf\xaf000\xb0ff\x9e\x16\x16\xb1g\x16e\
-gW[\x98\xc7\xb50\xdd{Ct\xde\x02\x02\xae\xae\
-\xaeee\xaf000\xaf0\x9e\xab2\x00\x00,>\
-qd//\xa1\xa1/\xa7ii\xb5\xb5\x0b\xb4hh\
-\xb2\xb23\x9f\xb1\x16hd:\x7f\x0a\xa9\xb1f\xb0\xb0\
-\xb0\xb00\xaf\xafe\xae\xae\x02\xde\xdet\xdd\xddCC\
-\xfc\xfc\xfc\xfc{{{{{{\x1b\xc2\xb4\x87\x92/\
-ttt\xde\x02\x02\x02\x02\x02\xae\xae\xae\xaeee\xaf\
-\xaf000\xb0\xb0ff\x9e\x16\x16\xb1\xb1gg\xb1\
-\xb1\xcd\x14[=q\xa9fC\xc9C\xde\xae\xae\xaee\
-e\xaf\xaf00\xaf\xaf\xae\x16\xa9\x5cY\x00\x00\xb3\x11\
-\x8eWd\xa9\xa1//\xa7\xa7\xa7ii\xb5\x0b\xb4\xb4\
-hh\xb2\xcd3h\x14\xc5\x0a\x0a\x9bg\x02f\x16\x9e\
-f\xb0\xb00\xaf\xafee\xae\xae\x02\x02\xdett\xdd\
-\xddCCCCC\xfc\xfc\xfc\xfc{z\xb4\x87\x92\xa1\
-\xde\xde\xde\x02\xae\xae\xae\xae\xae\xaeeee\xaf\xaf0\
-00\xb0\xb0ff\x9e\x9e\x16\x16\xb1\xb1gg\xcd\xb2\
-g03\x9b\x98\x0a\xc6/\x9e\x02C\xde\xae\xaeee\
-\xaf\xaf\xaf\xaf\xaf\xaf0\x16\xa7\xb8p\x0f\x00\x00\x00\x83\
-\xcf\xd1q\xa3\xa1\xa7i\xa7\xa7\xa7\xa7ii\xb5\x0b\x0b\
-\xb4hhhi\xa3q\xe2\xbb\x14\x9f\x16\x9e\x16\x16\x16\
-\x9ef\xb0\xb000\xaf\xafe\xae\xae\x02\x02\xde\xdet\
-ttt\xdd\xdd\xdd\xdd\xdd\xdd\xdd\xfc\x1b\x0b\x87\x92c\
-\x02\x02\x02\xaeeeeeee\xaf\xaf\xaf\xaf00\
-\xb0\xb0\xb0ff\x9e\x16\x16\x16\xb1\xb1gg\x9f\xcd\xb2\
-\xb2\xcd3h\xab\x98=:d\x16\xde\xddt\xae\xaf\xaf\
-\xaf\xafe\x02\x02eg\xa9\x9dN\x83\x00\x00\x00\x00\x00\
-7\xa2\xd1W\xa3\xab\xa9\xa1//\xa7\xa7ii\xb5\xb5\
-\x0bhhi\xa3%\xeau*\xcde\xb1\xcdg\xb1\x16\
-\x16\x9ef\xb0\xb000\xaf\xafee\xae\xae\xae\x02\x02\
-\xde\xde\xdetttttttC\xc3\xb5O\x92c\
-\xae\xae\xaee\xaf\xaf\xaf\xaf\xaf\xaf0000\xb0\xb0\
-\xb0fff\x9e\x16\x16\x16\xb1gg\x9f\x9f\xcd3\xb2\
-h\xb4\xb2\x9eh*\x0a\x0a:c\xb1et\xaee\xaf\
-\xaf\xaf0\xb0\x9eg/\xb8A7\x00\x00\x00\x00\x00\x00\
-\x007`\x8b:\xc6W\xa3c/\xa7/\xa7\xa7ii\
-\x0b\xb2\xb4cqO\x881\xcd\x9fg\x9f\x9fg\xb1\xb1\
-\x16\x16\x9eff\xb0\xb000\xaf\xafee\xae\xae\xae\
-\x02\x02\x02\x02\x02\x02\x02\x02\xde\xdet\xfciO\x92\xa9\
-eee\xaf0000000\xb0\xb0\xb0\xb0f\
-f\x9e\x9e\x9e\x16\x16\xb1\xb1gg\x9f\xcd\xcd3\xb2h\
-h\xb4\xb4h\xb4\x0b\xa3\x98\xc4\xbd1\x9f\xae\x02\x02\xae\
-\xaf\xb0gi\x14d\x82\xd2\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x8d\x80a\xd3\x9b1c///\xa7\xa7i\
-\xb5\xb2\xb5\xa3\x8a9\x0d\xa7e\x9fh\xb2\xcd\x9fgg\
-\xb1\x16\x16\x9e\x9ef\xb0\xb0000\xaf\xafeee\
-e\xae\xae\xae\xae\xae\xae\xae\xae\x02\xdeCiO\x92\x14\
-\xaf\xaf\xaf00000\xb0\xb0\xb0ffff\x9e\
-\x9e\x9e\x16\x16\xb1\xb1gg\x9f\x9f\xcd\xcd3\xb2hh\
-\xb4\x0b\x0bi\x0bg\xb5*\x0au\xbd\xab\xcd0\x02\xae\
-\xb0\xcd\xee\xd5\xf1\x85\x22\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00Kj\x12\x90*1c/\xa7//i\
-\xb5\x0b\xa1\x94[\x0d\xc4\xa1\x16\xb2h\xb23\xcd\x9fg\
-g\xb1\xb1\x16\x9e\x9eff\xb0\xb0000\xaf\xaf\xaf\
-\xafeeeeeee\xae\xae\x02t\xa7O\x92\x14\
-000\xb0\xb0\xb0\xb0ffff\x9e\x9e\x9e\x9e\x9e\
-\x16\x16\x16\xb1\xb1gg\x9f\xcd\xcd33\xb2hh\xb4\
-\x0b\x0b\xb5ii\xb5\xb5i1[\xc4\x8a\xb7\xcdee\
-g\x14\xa5mjK\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x03P\x84^\x9d\xa4\xa9//\xa7i\
-\xa7\xa9\xb7\xbd\x0a\x98\xc7/\xb2h\xb4h\xb23\xcd\xcd\
-\x9fg\xb1\xb1\x16\x16\x9e\x9eff\xb0\xb0\xb0000\
-0\xaf\xaf\xaf\xaf\xaf\xaf\xafee\xae\xde/O\xfd\xab\
-\xb0\xb0\xb0fffff\x9e\x9e\x9e\x9e\x9e\x16\x16\x16\
-\x16\xb1\xb1gg\x9f\xcd\xcd33\xb2\xb2hh\xb4\x0b\
-\xb5\xb5\xb5i\xa7/i\xb2\xa7*\x0a=%\xabh\xb2\
-\x93\x19L\x814\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00<l\x91\xd0\xbd\xa4\xa1\xa7ii\
-\x14\x9b[~u1\x0b\xb5\x0b\x0b\xb4\xb4h\xb233\
-\x9f\x9fgg\xb1\x16\x16\x16\x9efff\xb0\xb0\xb0\xb0\
-\xb000000000\xafe\x02/O\xfdd\
-fff\x9e\x9e\x9e\x9e\x16\x16\x16\x16\x16\x16\xb1\xb1\xb1\
-\xb1gg\x9f\x9f\xcd33\xb2\xb2hh\xb4\xb4\x0b\xb5\
-\xb5iii\xa7//\xa7/\xa1\xf2\x8au%\xc7\x94\
-JS(\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x04\xe0\x9a_q\xf2c/\xab\
-W[\xc4\xc4\xc5ig\x0bi\xb5\x0b\xb4\xb4h\xb2\xb2\
-3\xcd\x9f\x9fg\xb1\xb1\x16\x16\x16\x9e\x9effff\
-\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb0\xb00\xaf\xae\xa1O\xfdd\
-\x9e\x9e\x9e\x16\x16\x16\x16\x16\x16\xb1\xb1\xb1\xb1\xb1gg\
-g\x9f\x9f\xcd\xcd3\xb2\xb2\xb2hh\xb4\x0b\x0b\xb5\xb5\
-iii\xa7//c\xa9\xa1\x0b\xa1*\x98=uF\
-\x0cl\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00.T5\x8a\xa4\xa3\xc7\
-\x98~\xea\xb7/iiiii\xb5\x0b\xb4\xb4h\xb2\
-\xb23\xcd\xcd\x9fgg\xb1\xb1\x16\x16\x16\x16\x9e\x9e\x9e\
-ffffffffff0ecO\xfd\xa3\
-\x16\x16\x16\x16\xb1\xb1\xb1\xb1\xb1\xb1\xb1gggg\x9f\
-\x9f\xcd\xcd3\xb2\xb2hhh\xb4\xb4\x0b\x0b\xb5ii\
-i\xa7\xa7//\xa1c\xa9c\xa1cd\x9b\xea\xe9T\
-}\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00.\x9c\xba\xbd\xbd\xbb\
-\xc4\xea:/\xb2\xa7\xa1/iii\xb5\x0b\x0b\xb4h\
-h\xb233\xcd\xcd\x9fgg\xb1\xb1\xb1\xb1\x16\x16\x16\
-\x9e\x9e\x9e\x9e\x9e\x9e\x9e\x9e\x9e\x9ef\xaf\xa9\xff\xfd1\
-\xb1\x16\xb1\xb1ggggggg\x9f\x9f\xcd\xcd\xcd\
-33\xb2\xb2\xb2hhh\xb4\xb4\x0b\x0b\xb5iii\
-\xa7\xa7//\xa1cc\xa9\xa9\xa9d\xf2*\xed\x9c\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00I-M\xf9\x87\
-\x0a\xb7\xa1//\xa1\xa1/\xa7\xa7ii\xb5\x0b\x0b\xb4\
-hh\xb2\xb233\xcd\x9f\x9fgg\xb1\xb1\xb1\xb1\xb1\
-\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16f0\xa9\xff#1\
-\xb1\xb1\xb1g\x9f\x9f\x9f\x9f\x9f\xcd\xcd\xcd\xcd\xcd33\
-\xb2\xb2hhhh\xb4\xb4\x0b\x0b\xb5\xb5ii\xa7\xa7\
-///\xa1c\xa9\xa9cc\xa9\x05\x0a\xbc\x8c\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08X\x1a\x92\
-\xbb\x14\xb4\xa1\x14c\xa1\xa1//\xa7ii\xb5\x0b\x0b\
-\xb4\xb4hh\xb2\xb233\xcd\xcd\x9f\x9fgggg\
-\xb1\xb1\xb1\xb1\xb1\xb1\x16\xb1\xb1\x16\x9e\xb0\xab\xff#\xa4\
-ggg\xcd\xcd\xcd\xcd\xcd\xcd3333\xb2\xb2h\
-hhh\xb4\xb4\xb4\x0b\x0b\xb5\xb5iii\xa7//\
-/\xa1\xa1cc\xa9\xa9cd\x94\xc5n]\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x006Q\xcc\
-\x1e\xb7/c\xa9ccc\xa1//\xa7ii\xb5\xb5\
-\x0b\x0b\xb4\xb4hh\xb2\xb233\xcd\xcd\x9f\x9f\x9fg\
-ggggggggg\xb1\x16f\xab\x92#\xf2\
-\xcd\xcd\xcd33\xb2\xb2\xb2\xb2\xb2\xb2\xb2\xb2hhh\
-\xb4\xb4\xb4\x0b\x0b\x0b\x0b\xb5\xb5ii\xa7\xa7//\xa1\
-\xa1cccc\xa9\xa9c\x05\xc4\xa0\x17\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd4\
-\xb9rWdc\xa9\xa9cc\xa1//\xa7\xa7ii\
-\xb5\xb5\x0b\x0b\xb4\xb4hhh\xb2\xb2333\xcd\xcd\
-\xcd\x9f\x9f\x9f\x9f\x9f\x9f\x9f\x9fg\xb1\x16d\x92#\xf2\
-333\xb2\xb2hhhhhhhh\xb4\xb4\xb4\
-\xb4\x0b\x0b\x0b\xb5\xb5\xb5ii\xa7\xa7///\xa1\xa1\
-cc\xa9\xa9\xa9\xa9d\x94r'\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-+\x8f\xe1\x05c\xab\xab\xa9c\xa1\xa1//\xa7\xa7i\
-ii\xb5\xb5\x0b\xb4\xb4\xb4hhh\xb2\xb2\xb233\
-333333\xcd\xcd\xcd\xcd\x9f\x16\xa3\x92#\xf2\
-\xb2\xb2\xb2hhhhhh\xb4\xb4\xb4\xb4\x0b\x0b\x0b\
-\x0b\xb5\xb5\xb5\xb5ii\xa7\xa7\xa7//\xa1\xa1cc\
-cc\xa9\xab\xabc\x94\xe1\x8f\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00;k\x8a\xc6\xc6W\xab\xa1cc\xa1\xa1//\xa7\
-\xa7iii\xb5\x0b\x0b\x0b\x0b\xb4\xb4\xb4hhh\xb2\
-\xb2\xb2\xb2\xb2\xb2\xb2\xb2\xb2\xb23\xcdg\xa3\xfd#\xb7\
-hhh\xb4\xb4\xb4\xb4\xb4\xb4\x0b\x0b\x0b\x0b\xb5\xb5\xb5\
-\xb5iiii\xa7\xa7\xa7//\xa1\xa1ccc\xa9\
-\xa9cdW\xc6:\x8ak\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00?\x96\x00#=\xa4\xa7\xa1\xa9c\xa1\xa1\xa1/\
-/\xa7\xa7ii\xb5\xb5\xb5\x0b\x0b\x0b\xb4\xb4\xb4\xb4h\
-hhhhhhhhhh3g1\xfd#\x05\
-\xb4\xb4\xb4\x0b\x0b\x0b\x0b\x0b\x0b\x0b\xb5\xb5\xb5iii\
-iii\xa7\xa7\xa7//\xa1\xa1\xa1cc\xa9\xa9\x14\
-c/\xf2=#\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10 \x07\xe6\xbe\x94\xabcccc\xa1\xa1\
-//\xa7\xa7\xa7iiii\xb5\xb5\x0b\x0b\x0b\x0b\xb4\
-\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb4\xb2\xcd\xa4\xfd\xdc\x94\
-\x0b\x0b\x0b\xb5\xb5\xb5\xb5\xb5\xb5\xb5\xb5iiii\xa7\
-\xa7\xa7\xa7////\xa1\xa1ccc\xa9\xa9\xa9c\
-dW\xf1\xe6\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x95DVO\x94\xa7c\xa9\xa9c\xa1\
-\xa1///\xa7\xa7iiiii\xb5\xb5\xb5\x0b\x0b\
-\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\xb4\xb4h3\xf2\xfd\xdc\x94\
-\xb5\xb5\xb5\xb5iiiiiiii\xa7\xa7\xa7\xa7\
-\xa7///\xa1\xa1\xa1cccc\xa9\xa9\x14\xa9/\
-\x94OVD\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x15\xceV\x8a\x94dcccc\
-\xa1\xa1//\xa7\xa7\xa7iiii\xb5\xb5\xb5\xb5\x0b\
-\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0bh\xb2\xf2\xfd\xdc\x94\
-\xb5\xb5\xb5iiiiiii\xa7\xa7\xa7\xa7\xa7\xa7\
-///\xa1\xa1\xa1\xa1ccc\xa9\xa9\xa9\xa9\xa3W\
-\x8aV\xce\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00$D\xdf\x92W\xa7\xa1c\xa1\
-\xa1///\xa7\xa7iii\xb5\xb5\xb5\xb5\xb5\x0b\x0b\
-\x0b\x0b\x0b\x0b\xb4\xb4\xb4\xb4\xb4\xb4h3\xa4\xfd\xdc\x94\
-\x0b\x0b\x0b\xb5\xb5\xb5\xb5iiiiiiii\xa7\
-\xa7/////\xa1\xa1ccc\xa9c/W\xfd\
-\xdf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\xe7&\x97\xb6\x9b***\
-\x9b\x9bWWWWW\x94\x94\x94\x94\x94\x94\x94\x94\x05\
-\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\xb7\xf2r|\xad\x8a\
-\x05\x05\x05\x94\x94\x94\x94\x94\x94WWWWWWW\
-WWW\x9b\x9b\x9b\x9b****\xc7**\xb6\x97\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x09\x18!9#\xff\xff\
-\xff\xff\xffOOOOOOOOOOOOO\
-OOOOOOOOOOO\x87\xfdyy#\
-OOOOOOOOOOOOO\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xf0\x00\x00\x00\x00\x00\x00\x00\x00?\xff\xff\xff\xff\xff\xff\
-\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xff\xff\xff\xff\xff\xff\
-\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xff\xff\xff\xff\xff\xff\
-\x80\x00\x00\x00\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xfe\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xf8\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xf0\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00?\xff\xff\xff\xff\xe0\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xff\xff\xff\xff\xc0\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xff\xff\xff\xff\x80\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xfc\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xf8\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xf0\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xff\xff\xe0\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xff\xff\xc0\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xff\xff\x80\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xff\xfe\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff\xfc\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xf8\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00?\xf0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xe0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xc0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xc0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xe0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xf0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xfc\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00?\xfe\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\x80\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xff\xff\xc0\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xff\xff\xf0\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xff\xff\xf8\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00?\xff\xff\xfc\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xfe\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xc0\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xff\xff\xff\xff\xe0\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xff\xff\xff\xff\xf0\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xff\xff\xff\xff\xf8\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\xff\xff\xff\xff\xfc\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff\xff\xff\xff\xff\xff\
-\x80\x00\x00\x00\x00\x00\x00\x00\x00\x03\xff\xff\xff\xff\xff\xff\
-\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xff\xff\xff\xff\xff\xff\
-\xe0\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xff\xff\xff\xff\xff\xff\
-\xf0\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff(\x00\x00\
-\x00@\x00\x00\x00\x80\x00\x00\x00\x01\x00\x08\x00\x00\x00\x00\
-\x00\x00\x12\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\x00\x00\xc0\xc0\
-\x00uzz\x00\x00YY\x00\x00\xff\xff\x00IOO\
-\x00\x00\x8d\x8d\x00\x16**\x00\x00\xdf\xe0\x00Dmm\
-\x00\x18EE\x00\x00\xa6\xa6\x00\x00rr\x00+XX\
-\x00\x0098\x00\x00\x1c\x1c\x00.88\x00\x0f~\x7f\
-\x00\x00\xcf\xd0\x00\x00IH\x00\x00\xf0\xef\x00\x0ded\
-\x00\x00**\x00G\x5c\x5c\x00\x0fPP\x00\x00\xb3\xb3\
-\x00\x00\x9a\x9a\x00'KK\x003cb\x00\x00\x82\x82\
-\x009YY\x00\x00hh\x00\x07AA\x00\x1bSS\
-\x00\x0c66\x00\x0fXY\x00\x00\xd8\xd7\x00\x00\xe7\xe8\
-\x00\x00\xc7\xc8\x00\x01PP\x00\x00\xf7\xf8\x00\x00zz\
-\x00\x00`_\x00(DD\x00\x00##\x00\x0011\
-\x00\x0dFF\x00\x00\xad\xad\x00\x00\x93\x93\x00\x1cKJ\
-\x00\x09KL\x00\x00\xba\xba\x00\x00\xa0\xa0\x00-_^\
-\x00\x00>>\x00\x00\x88\x86\x00$VV\x00\x06VV\
-\x00\x08\x7f~\x00\x00CD\x00\x00mm\x00\x06FF\
-\x00\x14II\x00\x06^^\x00\x00\xe4\xe3\x00\x00\xcc\xcb\
-\x00\x17PP\x00\x00TT\x00\x00\xf3\xf4\x00\x00\xeb\xec\
-\x00\x00\xdb\xdc\x00\x00\xd3\xd4\x00\x00\xc3\xc4\x00\x00dd\
-\x00\x08OO\x00,LL\x00\x0eML\x00\x00\xfb\xfc\
-\x00\x0056\x00\x00LL\x00\x00~~\x00\x00vv\
-\x00\x1fUU\x00\x02..\x00\x03[\x5c\x00\x03kk\
-\x00\x04JJ\x00\x00\xb7\xb7\x00\x00\xb0\xb0\x00\x00\xaa\xa9\
-\x00\x00\xa3\xa3\x00\x00\x97\x97\x00\x00\x90\x90\x00\x00''\
-\x00\x00\xbd\xbd\x00\x0fSS\x00\x00\x9d\x9d\x00\x1aNN\
-\x00\x00]^\x00\x00\x89\x89\x00\x00\x85\x85\x00\x03||\
-\x00\x0bOO\x00\x00;;\x00\x00AA\x00\x00FG\
-\x00\x00VW\x00\x00pp\x00\x03RR\x00.YY\
-\x00\x00\xfa\xf9\x00\x00\xf6\xf5\x00\x00\xea\xe9\x00\x00\xde\xdd\
-\x00\x00\xd1\xd1\x00\x00\xc6\xc5\x00+87\x00\x00jk\
-\x00\x13**\x00\x00-,\x00\x00JK\x00\x03VV\
-\x00\x00\xf1\xf2\x00\x00\xed\xee\x00\x00\xe5\xe6\x00\x00\xe2\xe1\
-\x00\x00\xd9\xda\x00\x00\xd6\xd5\x00\x00\xcd\xcd\x00\x0033\
-\x00\x00\xc9\xc9\x00\x00\xc1\xc1\x00\x00NO\x00\x00RR\
-\x00\x00[[\x00\x06``\x00\x00bb\x00\x00ff\
-\x00\x00xx\x00\x00||\x00\x02XX\x00\x02cc\
-\x00\x00\xfd\xfd\x00\x0000\x00\x0078\x00\x00\xbe\xbe\
-\x00\x00=<\x00\x00\xbb\xbb\x00\x00@?\x00\x00\xb8\xb8\
-\x00\x00\xb5\xb5\x00\x00\xb1\xb1\x00\x00\xae\xae\x00\x00\xab\xab\
-\x00\x00\xa8\xa8\x00\x00\xa4\xa4\x00\x00\xa1\xa1\x00\x02^^\
-\x00\x00\x9e\x9e\x00\x00\x9b\x9b\x00\x00\x98\x98\x00\x00\x95\x95\
-\x00\x00ll\x00\x00\x91\x91\x00\x00\x8e\x8e\x00\x00tt\
-\x00\x00\x8b\x8b\x00\x00\x87\x88\x00\x00\x83\x83\x00\x00\x80\x80\
-\x00\x00\xf3\xf2\x00\x00\xed\xec\x00\x00\xe2\xe3\x00\x00\xdb\xda\
-\x00\x00..\x00\x00\xcf\xce\x00\x00\xca\xcb\x00\x00CB\
-\x00\x00\xc3\xc2\x00\x00\xa9\xab\x00\x00__\x00\x02hh\
-\x00\x00\x89\x88\x00\x00\x86\x86\x00\x00\x80\x81\x00\x01GG\
-\x00\x10OO\x00\x02SS\x00\x04}}\x00\x00\xfe\xfe\
-\x00\x00\xfa\xfb\x00\x00\xf9\xfa\x00\x00\xf9\xf8\x00\x00\xf8\xf9\
-\x00\x00\xf8\xf7\x00\x00\xf6\xf7\x00\x00\xf5\xf6\x00\x00\xf5\xf4\
-\x00\x00\xf4\xf5\x00\x00\xf4\xf3\x00\x00\xf2\xf3\x00\x00\xf2\xf1\
-\x00\x00\xf1\xf0\x00\x00\xf0\xf1\x00\x00\xef\xf0\x00\x00\xef\xee\
-\x00\x00\xee\xef\x00\x00((\x00\x00\xee\xed\x00\x00))\
-\x00\x00\xec\xed\x00\x00++\x00\x00\xec\xeb\x00\x00\xeb\xea\
-\x00\x00\xea\xeb\x00\x00\xe9\xea\x00\x00\xe9\xe8\x00\x0022\
-\x00\x00\xe8\xe9\x00\x00\xe8\xe7\x00\x0044\x00\x00\xe6\xe7\
-\x00\x00\xe6\xe5\x00\x0066\x00\x00\xe4\xe5\x00\x00\xe3\xe4\
-\x00\x00::\x00\x00\xe1\xe2\x00\x00\xe1\xe0\x00\x00\xe0\xe1\
-\x00\x00\xdf\xde\x00\x00\xde\xdf\x00\x00\xdd\xde\x00\x00BC\
-\x00\x00\xdd\xdc\x00\x00\xdc\xdd\x00\x00EE\x00\x00\xdc\xdb\
-\x00\x00\xda\xdb\x00\x00HG\x00\x00\xda\xd9\x00\x00\xd9\xd8\
-\x00\x00\xd8\xd9\x00G[[\x00\x00\xd7\xd8\x00\x00KK\
-\x00\x00\xd7\xd6\x00\x00MM\x00\x00\xd5\xd6\x00\x00\xd5\xd4\
-\x00\x00\xd4\xd5\x00\x00OP\x00\x0aPO\x00\x00\xd4\xd3\
-\x00\x00\xd3\xd2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00<\xed\xba\x14\x14y\xf6\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x0bJR\x8b*\x8cQ\xb9\x1eee\xb8\xa8\
-\xa8\xa8\xa8\xa8\x1e^D\xa8\xa8\xa8888\xa8\xb8e\
-\xa9\x1e\xb9\xaa\x8c*\x8d\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x002J**Q\xaa\xa9e\xa8d\xa7\x07\x07\xa5\
-\xa5\xa5\xa5\xa5\xb7\xd0\x04\xa5\xa5\x07\xa5\xa5\xa5\xa5\x07\x07\
-\xa7d\xa8e\xa9\x1e\x8c\x8d\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00! \x8c\x8c\xaa\x1ee\xa8\xa7\x07\xa5]\xa411\
-1111\xa5\xd2\x871111111\xa4\xa4\
-]\xa5\x07d\xa8e\xa9QU\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00>\
-J\x0d*Q\xaa\xa98d\x07]\xa41\x5c\xa1\xa1\x1b\
-\x1b\x1b\x1b\xa01\xd4c\xa1\xa1\x1b\x1b\x1b\x1b\x1b\xa1\x5c\
-\xa21\xa4]\x07d\xa8eQ\x8b\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x003 \
-\x8b*Q\x1eed\x07]\xa4\xa2\x5c\x1b\xa0a\x9f5\
-555\x9d\x1bx\x89\x9f\x9f\x9f555\x9f\x9fa\
-\xa0\x1b\x5c\xa2\xa4]\x07d\xb8eQ \x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00#\x85R\
-\x8cQ\x1e\xb8d\xa5\xa4\xa2\x5c\x1ba5\x9d[\x9c\x9c\
-\x0c\x0c\x0c\x0c5\xaf\x8a\x9c\x9c\x9c\x9c\x9c\x9c\x9c[[\
-5\x9fa\x1b\x5c1\xa4\x07d\xb8eQ\x8a\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00M\xba\x93\x04\
-\xaae\xb8d\xa51\x5c\x1ba5[\x9c\x0cZZ\x9a\
-\x9a\x9a\x9a0\x9c\x90 ZZZZ\x9a\x9aZZ\x9b\
-\x0c\x9c\x9d\x9fa\x1b\xa2\xa4\xa5\xa7\xa8d\x0d\xba\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x19 lD7\
-c8\x07\xa51\x5c\xa0\x9f\x9d\x9c\x9bZ0\x99Y\x98\
-\x98\x98\x98\x1a\x9a\xda=YYYYYYY\x990\
-\x9aZ\x0c[5a\x1b\x5c1]]QD\x85\x8e\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfd\xa3*Q\x8b\x87\
-\xb2J]\x5c\x5c\xa05[\x0cZ0Y\x98\x1a\x97X\
-X\x96X\x96Y\xddl\x97XXXXX\x97\x1a\x1a\
-Y\x99\x9a\x9b\x9c[\x9f\xa0\x5c\xa1\xa9D(Q\xa2f\
-\x00\x00\x00\x00\x00\x00\x00\x00(\x87=*\x8c\xaae\xb9\
-\x89\xf0v1a5[\x0c\x9a\x99\x98\x97X4\x94_\
-_\x92\x92\x92XO\xa6\x94\x94\x94__\x9444\x96\
-X\x1a\x980Z\x0c[55d\x04D\xa955\x5c\
-\xa9\x00\x00\x00\x00\x00\x00m\xa3\x8b*Q\xaae\xa8\x07\
-d\x89\x91\xa8\x9c[\x0c0Y\x1aX4_\x92\x02\x84\
-\xb3\xb3II\x94\x91\x8b\x02\x02\x02\x84\x84\x02\x02\x92_\
-4\x96\x97\x98\x99\x9a\x0c\x9c]c\x04d\x9c\x9c\x9fa\
-a\xa1\xb8\x00\x00\x00K\xa3R*Q\x1eed\x07\xa4\
-\x5c\x8c\x93v[Z\x9aY\x1a\x96\x94\x92\x84It'\
-'\x83\x83\x83\x84\x0f*tttttttI\x84\
-\x02_4X\x1a\x99\x9aY\x89\x14\x070Z\x9c[5\
-a\x1b\x5c\xa9\x00\x08\x87\x8b*Q\x1e\xb8d\xa5\xa4\xa2\
-\x1b\xa2\x0d(RZ\x98\x1a\x96_\x02It\x83B\x81\
-\x13\xb0\x81\x13thQ\xb1BBB\x81BB\x83'\
-t\x84\x92\x94X\x98\x1aa\xf8\xb5\x9b\x1a0\x9b\x9c[\
-5a\xa01\x00wc*Q\x1e\xb8d\xa51\x5c\x1b\
-a[5\x8b\x86*Y4_\x02t'B\x81sH\
-\xfa\xfaH\xfbB\x93\x1e\x13sssss\x13\x81B\
-\x83'I\x02\x94\x94\x9d\x8a\x8a\x1b\x1a\x1aY0Z\x0c\
-[5a\xa2\x00\x00+Q\x1e\xb8d]1\x5c\xa0\x9f\
-[\x9cZ\x9b\xaak\xb9\x97II'\x81\x13H\x80\x7f\
-\x7fG\x7f\x7fs7e\x80\x80\xf7%%%\x80Hs\
-\x81\xb1'II\x0c \x8a\x9d\x92\x94X\x1aY0Z\
-\x0c[5\xa1\x00\x00J\x1eed\xa51\x5c\xa05[\
-\x0cZ0\x1a\x98\xb8\x04e_\xb1\x81\x13\x80%G\xe8\
-\x09\x09\x09\x09\x80\x95\xa8\x7fG\xeerrrG\x7f\x80\
-s\x13B\x83\x99=v\x9bt\x84_4X\x1aY0\
-\x9b\x9c[\x1b\x00\x00\x8ae\xa8\x07\xa4\x5c\xa05\x9c\x9b\
-\x9aY\x1aX\x94\x94\xa7cdI\xfe\x80\x7fr~\xe2\
-}}}}\xaeid\x09~~AAA\x09rG\
-\x80Hs\x1al=Y\x81'I\x02_4X\x1a\x99\
-\x9a\x0c\x9ca\x00\x00 \xa8\xa7\xa4\xa2\x1b\x9f[\x9b0\
-Y\x1a\x96\x94\x92II\xa4\x89\x07\x83\xeer~}q\
-FFFF\x09\xb2\x07A\xdf}&q&}\xadr\
-G\x7f4R\x0dX\x80\x81\x83tI\x02_4\x97\x98\
-\x99Z\x0c\x9f\x00\x00v\xa7\xa51\xa1\x9f[\x0c\x9a\x98\
-\x97\x96_\x02ItB\x81\xa1\x8a]\x81\xe2}q|\
-{{\x15\x15A<\xa5&\xd8F|\x15|F}A\
-\x09\x92\x8bR_GH\x13\x81\x83tI\x02\x94\x96\x1a\
-Y0Z\x9d\x00\x00\xa3\x07\xa4\x5c\xa0\x9d\x0c\x9aY\x1a\
-\x96_\x84t'B\x81H\x805v1\xfb\xdbF{\
-p\xc3pE}<]q|\x15\xc8\xc7\xc9|F&\
-\x84\x8c*I\xe2\x7f%Hs\x81\x83tI\x924X\
-\x1a\x99\x9a[\x00\x00=]1\x1b\x9f[Z\x99\x1a\x96\
-_\x84t\x83\x81s\xfe\xfa\xf1G\x0cJ1~{{\
-\xc3o)E}<\xa4F\x15E\xc3op{|'\
-\xaa\x8c'q\x09r\x7f%H\x13B\x83t\x84_\x96\
-\x1aY\x99\x9c\x00\x00l\xa4\x5c\xa0\x9d\x0c0\x98X\x94\
-\x02I\x83\x81s\x80\xf2GG~~\x0d\xb5\x81E{\
-p))p&\xed1\x15\xcb\xc9)opp\x81*\
-*B|}A~r\x7f%H\x13B'I\x92\x94\
-X\x98\x99\x0c\x00\x00l1\xa1a[\x9b\x99\x1a4\x92\
-I'\x81s\x80\x7fr\xe5~A}0\x0d\x5c\xeb\xab\
-{{q}\x7f\x95d\xe5F\xcaEp\xc5E\x9c\x85\
-\x99E\xd5q\xdc}~r\xf1\xf9s\x81\x83t\x02_\
-\x96\x1aY\x0c\x00\x00\x0d\xa2\x1b\x9f\x9cZY\x97\x94\x02\
-tBs\x80\x7f\xe8A}\xd9qq\xd5\x1al\xa4r\
-{\xf3\xa4*\x8b\x17\x85*Xq{{{\x83\xa9e\
-\x80p\xcb\xceF&A\x09G%H\x81\x83t\x84_\
-4\x1a\x98\x0c\x00\x00\x0d\x5c\xa05\x0c\x9a\x98X_\xb3\
-'\x81\xff%r\xad&F\x15\x15||FXl\xa5\
-'\xa5J\xb5J  +=\x1a&\x15IQes\
-)pp{|\xd6}~r\x7fH\x13B'\x84\x92\
-4\x97\x98\x9b\x00\x00\xa6\x5c\xa0\x9d\x0c0\x98\x96\x92I\
-\x83\xb0\xfa\x7f\x09}q\x15Ep\xab\xce\xac\xd64l\
- QBEEEE\x155=\x984*\xa8\x80)\
-)N\xc1E\x15\xd5&~r\x7f\xfasB'\x84\x92\
-4\x97\x98\x9b\x00\x00\xa6\x5c\xa0\x9d\x0c0\x98\x96\x92I\
-\x83\x13\x80G~\xdeF{)op\xca\xacF'\xaa\
-\x8c\x13\xbe\xbe\x05\x05\xbe\xbeE\x9cl \xa5\x7fpE\
-\xc2No\xc6\x15F}~\xe9\x7f\x80\x13B'\x84\x92\
-4\x97\x98\x9b\x00\x00\xa6\x5c\xa05\x0c0\x98\x96\x92I\
-\x83\xb0H\x7f\x09}F{\xc4o\xc5{\x15'\xaa\x1e\
-H\xbe\xbe\x05\x05\x05\x05\x05\xbe{RJ\x13{|{\
-p)p\xca|q}\xe4r%H\x13B'\x84\x92\
-4\x97\x98\x9b\x00\x00\xa6\x5c\xa05\x0c0\x98\x96\x92I\
-\x83\x81H\x7f\xe7\xe1\xd8|EE{\x15|\x07\x04'\
-\xbe\xbe\x05\x05\x05\x05\x05\x05\xbe)\x0cl\x0cA\x15\x15\
-{\xab\xca\x15F\xdb\xe1\xe5G%H\x13Bt\x84_\
-\x96\x1a\x98\x9b\x00\x00R\xa0\x9f[ZY\x97\x94\x84'\
-Bs\xf5\xe9~&|\xcbEE{{\x15\x07\x04\x81\
-\x05\x05\x05\x05\x05\x05\x05\x05\x05\xbeE\xa8\x89\x83p{\
-\xc8\xc6E{\x15F&A\x09G%H\xb0Bt\x84\
-_\x96\x97\x9a\x89\x00PJ vl\x0dR*Q\x1e\
-ed\x07]1\x5c\x1ba\x9f\x9faa\x1bck\x13\
-\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05)\x07\x14\xa95a\
-\x9f\x9f\x9fa\xa0\x1b\x5c\xa2\xa4]\x07d\xa8e\x1e\xaa\
-*\x8bRl\x95\x00-xx\xaf\x90.\xda\xddO\x91\
-\x0f\xe3h\x937\x95\x95\xb2\xb2\xea\xea\xb2<\xd2\xfcH\
-\x05\x05\x05\x05\x05\x05\x05\x05\x05\xbe)]\xd4\x0fj<\
-<<<<\xb2\xb2i\x95\x957\x93\x93h\xe3\xe3\x0f\
-\x0f\x91\x91O\x10\x00\xa6\xa1a\x9d\x0cZY\x1a4_\
-\x84'B\x13\xfa\x7fr~\xe1&&&A\xb8\x04\x13\
-\xbe\x05\x05\x05\x05\x05\x05\x05\x05\x8fH\x1eQBFq\
-F\xd7q&}A\xe5\xeb\xf1\xf7H\x13\x81B't\
-\x84\x02\x92\x97 \x00\x8c\x9d\x9cZY\x1a4\x92I'\
-\x81s%\xeb~}F\xcdE))){Z\x8aZ\
-p\xbe\x05\x05\x05\x05\x05\x05\xbep\x1e\x8a\x81)\xc3o\
-No)p{\x15\xd3q}A\x09G\x7f\x80\xff\x13\
-B\x83'\x02=\x00\x8c\x9d\x9cZ\x99\x1a\x96_\x84'\
-Bs\x80G\x09}\xd7\x15E\xc2\xc0\xc4E&\x9a\xa6\
-\x0cE\xbe\xbe\x05\x05\x05\xbe\xbe\x13R\xa8\x09))\xc0\
-No)E{|\xd7&}~r\xef\xf5Hs\x81\
-B''\x92\xa3\x00*\x9d\x9cZ\x99\x1a\x96_\x84'\
-Bs\x80\xee\x09}F\x15p\xc0o\xc4{p\xf1\xb8\
-J[E\xbe\x05\x05\xbe\x8f\x81\xaa \x94Ep)\xc0\
-N\xbf\xc3\xc6{|F\xdc}\xe4r\xae%Hs\x81\
-B't\x92\xa3\x00*5\x9c\x9b\x99\x1a\x96_\x84t\
-B\x13\xf9G\x09A\xd8|\xc9ppE\xc7\xe8\x5c\x0d\
-\xa2R\x5c44\x84\x92Y*\xa4\xa7*\x84E))\
-o)pE\xcc\xd1\xd6\xdcA~r\xae%Hs\x81\
-\x83't\x92v\x00*5[\x9b0\x98X_\x84t\
-B\x13\xfb\x7frA&F\xcf{{{\x7f\xa2R_\
-\xac_\x89<\x14x\x93\x14]\xe2A1\xa6\x94{)\
-ppE{\x15\xacq&\xe2\x09r\x7f%H\x13\x81\
-\x83't_v\x00*5[\x0c0Y\x97\x94\x02I\
-\x83\x81H%G\x09A&q\xd7F\x15\x5c+\x96{\
-p\x15\x13t_\xe3\x8c'AE\xc8r1\xa6\x97\x15\
-\xc6{\xca\x15|F&}~\x09G\x7f\x80H\x13\x81\
-\x83tt_ \x00*\x9f\x9d\x9cZY\x1a\x96\x92\xb3\
-'B\x13H%G\x09AA}|\xfe\xa6\xa3Hp\
-EoooF\xba\x1b)E\xcf\xd5\xac%\xa2lY\
-\xd1\xca||Fq}A\xe5rG\xf2\x80s\x13B\
-'tt_ \x00\x8ba5\x9c\x9b0\x98X\x94\x02\
-t\x83\x81s\xfa%Gr\x09qs\xa8R4F{\
-EoNoFj\x5c\x15|F&}}H1l\
-0F|q\xdb}A\xe4\x09G\x7f%H\x13\x81B\
-'tI\x94 \x00R\x1b\x9f[\x0c\x9aY\x974_\
-\x84t\x83\x81sH%\x7fAB\xa9\xa6X}\xac|\
-Ep\xc4)q\xed1Fq}A~\x09\x09\x81\xa4\
-\xa3\x9b\xd9q}A~\x09r\x7f%\x80s\x13B\x83\
-tII4 \x00R\xa1\xa05\x9cZ\x99\x98X\x94\
-\x92\x84t\x83\x81\x13HGIQ\x0d\x1a\x09\xdf&F\
-\x15{{E&\xed]}A\xe4\xe6rG\xf3\xf3'\
-]v\x0c}}\x09\x09\xe9G%\x80H\x13\x81B'\
-t\x84\x844\x8a\x00\x0d\x5c\x1ba[\x0cZY\x1aX\
-\x94\x02\xb3t'BH\x92\x8blY\x7f\x09\x09A&\
-\xd7F\xac|\xe2<\x07~\x09rG\x7f%\xfbss\
-I\x07 [\x09\xe5G\xef\xf3\x80Hs\x13B\x83'\
-I\x84\x02\x96J\x00\x0d1\x5c\xa05\x9c\x9b0Y\x1a\
-X\x94\x92\x84I'\x96R=0H%\x7fr\xe6\xe2\
-}&&\xd9r\xb2dr\x7f\x7f%\x80\xfes\x81B\
-B\x92dJ\x9f\x7f\xec%\x80\xfes\x13\x81\x83't\
-\x84\x02\x92XJ\x00l\xa41\xa1a\x9d\x9c\x9b0Y\
-\x1aX4_\x84\x92v \x9bB\x13s\x80\x7fG\x09\
-~~~A\x7fi\xa8%\x80HHs\x13\x81\x83'\
-tI4\xb8\x89\x1bH\xf5Hs\x13\x81\xb1'tI\
-\x02__\x97\x89\x00=]\xa4\xa2\x1ba\x9d\x9c\x9b0\
-Y\x1a\x97\x96\x02\x0c<et\x83B\x13s\x80%\x7f\
-G\xeb\xecr\x80\x95eHs\x13\x81\x81B\x83'I\
-\x84\x92_\x97\x1e\xb5\xa2\x13H\x13B\x83'tI\x84\
-\x02_\x94\x1a\x89\x00v\x07\xa5\xa4\x5c\x1b\x9f\x9d\x9c\x9b\
-\x9a\x99\x98X\x9cvJ[\x84I'B\x81sH\x80\
-\xf7%\xf5\x7f\x137\x1e\x13BB\x83\x83'tI\x02\
-_4\x96XYQc\xa4'\x13\x83'tI\x84\x02\
-_44\x98+\x00vd\xa7\xa51\x5c\x1ba\x9d\x9c\
-\x0c\x9aYa\x8a\xb5a4_\x02I'\x83\x81\x13s\
-sssHB\x93Q\x83'ttII\x84\x02_\
-4X\x1a\x98YZ*\x04\x07\x84\x83tI\x84\x02_\
-4XX\x98\xb5\x00\x8e\xb8d\xa7]1\x5c\x1ba5\
-\x9c\x9b\xa2\x89\x87\x5c\x97\x97\x96_\x02\xb3t'\x83B\
-\x81\x81\x81\x13th\x8ctI\x84\x84\x02\x02_\x94\x96\
-X\x1aY0ZZ\x9cRk\xa8\x94t\x84\x92_4\
-\x96\x97XZ\x88\x00S=\xb8d\x07]\xa4\xa2\x1ba\
-\x9f]ck]Y\x99\x98\x97\x96\x94\x92\x84Itt\
-'''\x83\x84\x0f\x8b\x02\x92___4\x96X\x1a\
-\x98Y0Z\x0c\x9c\x9c\x9flD\x1eX\x84_4\x96\
-\x96X\x9a;\x1d\x00\x00\x22=\xaa\xa8\x07\xa5\xa4\xa2\x1b\
-\xa8kD\xa7\x9b\x0cZ\x99\x98\x1aX4_\x92\x02\x84\
-\x84\x84II_\x91R_4\x96\x96X\x97\x1a\x98Y\
-\x99\x9a\x9b\x0c[\x9daa\xa1=\x86Q\x98_4X\
-\x98\x0c;6\x00\x00\x00\x00bK=\xb8\x07\x07\xa41\
-v\x90*[5[\x0cZ0Y\x1a\x97X4\x94_\
-_\x92\x92\x02X\xe0\x0d\x96\x97\x1a\x1a\x98\x98Y\x990\
-Z\x9b\x9c[5a\x1b\x5c\x5c\xa4v\xfcR\x9a\x94\x9b\
-\xbd\x16\x00\x00\x00\x00\x00\x00\x00\x069Ve\xa7\xa5\x8c\
-\x86yd\xa0\xa05[\x9c\x9b\x9a\x99\x98\x1a\x97XX\
-\x96\x9644\x98\xddl\x1a\x98YY\x990\x9a\xb4\x9b\
-\x0c\x9c\x9d\x9fa\x1b\x5c1]]\xa7 P\xa6\x1b\x12\
-\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x0e\xb6eR\x85\
-\xf8Q11\xa1\xa0\x9f\x9d\x9c\x0cZ0\x99YY\x98\
-\x1a\x1a\x1a\x97\x99\x82\xa3\x990\x9aZZ\x9b\x0c\x0c\x9c\
-[5a\xa0\xa1\xa21]\xa5dd\xb8J\x14$\x0a\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00n\xbc\x14\xf6\
-\x8b\xa5\xa5]1\x5c\xa0a5[\x9c\x0cZZ00\
-\x99\x99\x99YZ\xda Z\x9b\x0c\x0c\x9c\x9c[\x9d5\
-aa\x1b\x5c\xa2\xa4]\x07d\xb8eel\xbb\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x11Tl\
-\xb78d\x07]1\x5c\x1b\xa0\x9f5[\x9c\x0c\x0c\x9b\
-\x9bZZZ\x9c.\x8a\x9c[\x9d\x9d55\x9fa\xa0\
-\x1b\xa1\xa21\xa4\xa5\xa7d\xb8\xa9\xa9l`\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00L\x9e\
-Q\xa9ed\xa7]\xa4\xa2\x5c\x1b\xa0a5\x9d\x9d[\
-\x9c\x9c\x9c\x0c\x9f\xafJ5\x9faaa\xa0\x1b\xa1\x5c\
-\xa21\xa4]\x07d\xa8\xb8\xa9\x1elg\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1c\
-\xbc\x8aQ\xb88\xa7\xa5]\xa4\xa2\x5c\xa1\x1baa\x9f\
-\x9f\x9f\x9f5\x1bx+\xa0\x1b\xa1\xa1\x5c\x5c\xa21\xa4\
-\xa4]\x07d\xa8\xb8eelcW\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-u,@\xaae\xb8d\xa7\xa5]\xa41\xa2\x5c\xa1\xa1\
-\x1b\x1b\x1b\xa0\xa2\xd4c\x5c\xa2111\xa4]]\xa5\
-\x07\xa7d\xb8e\xa9\x1e=C\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x18zQe8d\xa7\xa5]]\xa41\xa2\xa2\
-\x5c\x5c\x5c\xa1\xa4\x17\x871\xa4\xa4\xa4]]]\x07\xa7\
-dd\xa8e\xa9\x1ev?\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xf4: v\xa3=ll\x0d\x0d\xa6\xa6R\
-RRRRl-j\xa6\xa6\xa6\xa6\x0d\x0d\x0d\x0dl\
-lll\xa3v /\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xff\xff\x01\xff\xff\xff\xff\xff\xff\xfc\x00\
-\x00\x00\x00?\xff\xff\xf8\x00\x00\x00\x00\x1f\xff\xff\xf0\x00\
-\x00\x00\x00\x0f\xff\xff\xc0\x00\x00\x00\x00\x07\xff\xff\x80\x00\
-\x00\x00\x00\x01\xff\xff\x00\x00\x00\x00\x00\x00\xff\xfe\x00\x00\
-\x00\x00\x00\x00\x7f\xfc\x00\x00\x00\x00\x00\x00?\xf8\x00\x00\
-\x00\x00\x00\x00\x1f\xe0\x00\x00\x00\x00\x00\x00\x0f\xc0\x00\x00\
-\x00\x00\x00\x00\x03\x80\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\
-\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x01\x80\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x01\x80\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x01\x80\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x01\x80\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x01\x80\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x01\x80\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x01\x80\x00\x00\x00\x00\x00\x00\x01\x80\x00\x00\
-\x00\x00\x00\x00\x01\x80\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\
-\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\
-\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\
-\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\
-\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\
-\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\
-\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\
-\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\
-\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\
-\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\
-\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\
-\x00\x00\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x00\x01\xe0\x00\x00\
-\x00\x00\x00\x00\x07\xf0\x00\x00\x00\x00\x00\x00\x0f\xf8\x00\x00\
-\x00\x00\x00\x00\x1f\xfe\x00\x00\x00\x00\x00\x00\x7f\xff\x00\x00\
-\x00\x00\x00\x00\xff\xff\x80\x00\x00\x00\x00\x01\xff\xff\xc0\x00\
-\x00\x00\x00\x03\xff\xff\xe0\x00\x00\x00\x00\x0f\xff\xff\xf8\x00\
-\x00\x00\x00\x1f\xff\xff\xfc\x00\x00\x00\x00?\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff(\x00\x00\x000\x00\x00\x00`\x00\x00\
-\x00\x01\x00\x08\x00\x00\x00\x00\x00\x80\x0a\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xff\xff\xff\x00\x00\xc0\xbf\x00Gaa\x00\x00\xff\xff\
-\x00\x00>>\x00\x00\x83\x83\x00\x02``\x00\x00\xdf\xe0\
-\x00\x00\xa2\xa2\x00@DD\x00\x22hi\x00\x19NN\
-\x00\x00''\x00\x00qr\x00\x00OO\x00\x1022\
-\x00\x00\xd0\xcf\x00\x00\xf0\xef\x00\x00\x17\x17\x00\x00\xb1\xb1\
-\x00\x00\x93\x93\x001LM\x00\x0022\x00\x0cDD\
-\x00\x01ii\x00\x00FG\x00\x00{{\x00\x00XX\
-\x00\x00\xc7\xc8\x00\x00\xe8\xe7\x00\x00\xd7\xd8\x00\x00\xf7\xf7\
-\x00\x00\xb8\xb8\x00\x00\xa9\xa9\x00\x00\x9a\x9a\x00\x00\x8b\x8b\
-\x00#LL\x00\x0e99\x00\x1amm\x00\x0bcc\
-\x00\x10LL\x00?^^\x00\x0089\x00\x08PP\
-\x00\x00,,\x00\x19SS\x00\x15II\x00\x06ll\
-\x00\x1bih\x00\x04JJ\x00\x00vv\x00\x00dd\
-\x00'gf\x00\x00\xeb\xec\x00\x00~\x7f\x00\x05ff\
-\x00\x00mm\x00\x00\xfb\xfc\x00\x00\xe4\xe3\x00\x00\xd4\xd3\
-\x00\x00\xcc\xcb\x00\x00\xc4\xc3\x00\x00BB\x00\x00SS\
-\x00\x00\x5c\x5c\x00\x00\x87\x87\x00\x00\xf2\xf4\x00\x00\xdc\xdc\
-\x00\x00\xbc\xbc\x00\x00\xb5\xb4\x00\x00\xad\xad\x00\x00\xa6\xa6\
-\x00\x00\x9e\x9e\x00\x00\x96\x97\x00\x00\x8f\x8f\x00\x08LL\
-\x00\x0f66\x00Edd\x00\x00//\x00\x0055\
-\x00\x00;;\x00\x00KK\x00\x04\x5c]\x00\x15NN\
-\x00\x03WV\x00\x00fg\x00\x1bLL\x00\x02tt\
-\x00\x00\xe5\xe6\x00\x00\xda\xd9\x00\x00\xd1\xd2\x00\x00\xcd\xce\
-\x00\x00\xc1\xc2\x00\x00ED\x00\x00IH\x00\x00\xb2\xb3\
-\x00\x00Z[\x00\x00\x95\x94\x00\x00oo\x00\x00\x8e\x8c\
-\x00\x00\x86\x84\x00\x00\x81\x80\x00\x00\xc7\xc5\x00\x00bb\
-\x00\x06dd\x00\x02\x99\x98\x00\x00\xfd\xfd\x00\x00\xf9\xf9\
-\x00\x00\xf5\xf5\x00\x00\xf4\xf2\x00\x00\xed\xee\x00\x00\xe9\xea\
-\x00\x00**\x00\x00\xe1\xe2\x00\x00\xd5\xd6\x00\x00@@\
-\x00\x00\xc9\xca\x00\x00NM\x00\x00QQ\x00\x00\xba\xba\
-\x00\x00UU\x00\x00\xab\xab\x00\x00\xa4\xa4\x00\x00kk\
-\x00\x00\x9c\x9c\x00\x00xx\x00\x00|}\x00\x00\x89\x89\
-\x00\x1101\x00\x0f43\x00\x14KJ\x00\x00__\
-\x00\x03hh\x00\x05kk\x00\x00\xf1\xf2\x00\x00\xf0\xf1\
-\x00\x00((\x00\x00\xde\xde\x00\x0076\x00\x00\xd3\xd1\
-\x00\x00\xc5\xc6\x00\x00\xbe\xbe\x00\x00\xb7\xb7\x00\x00WW\
-\x00\x00[Z\x00\x00\xaf\xaf\x00\x00\xa8\xa8\x00\x00hg\
-\x00\x00\xa0\xa0\x00\x00ts\x00\x00\x99\x99\x00\x00tu\
-\x00\x00\x91\x91\x00\x00\x8d\x8e\x00\x00\x85\x85\x00\x00\xed\xec\
-\x00\x00\xeb\xea\x00\x00\xe1\xe0\x00\x00\xd7\xd6\x00\x00CD\
-\x00\x00\xc9\xc8\x00\x00\xaf\xad\x00\x02mm\x00\x00no\
-\x00\x00\xa3\xa2\x00\x00yz\x00\x00\x98\x97\x00\x00~}\
-\x00\x0e77\x00\x00hh\x00\x01qp\x00\x00\xfe\xfe\
-\x00\x00\xfa\xfa\x00\x00\xf8\xf8\x00\x00\xf6\xf6\x00\x00\xf4\xf4\
-\x00\x00\xf3\xf3\x00\x00\xf2\xf1\x00\x00\xf1\xf0\x00\x00++\
-\x00\x00\xee\xef\x00\x00\xef\xee\x00\x00--\x00\x00\xee\xed\
-\x00\x00..\x00\x00\xec\xed\x00\x00\xea\xeb\x00\x0011\
-\x00\x00\xea\xe9\x00\x00\xe8\xe9\x00\x0044\x00\x00\xe7\xe8\
-\x00\x0f54\x00\x00\xe6\xe7\x00\x0067\x00\x00\xe4\xe5\
-\x00\x0d88\x00\x00\xe5\xe4\x00\x00\xe3\xe4\x00\x00\xe2\xe3\
-\x00\x00==\x00\x00\xe0\xe1\x00\x00\xe0\xdf\x00\x00AA\
-\x00\x00\xdd\xdd\x00\x01CC\x00\x00\xdb\xdb\x00\x00\xd9\xda\
-\x00\x00\xd8\xd9\x00\x00\xd9\xd8\x00\x00JJ\x00\x00\xd6\xd5\
-\x00\x00LL\x00\x00\xd4\xd5\x00\x00\xd5\xd4\x00\x19OO\
-\x00\x00\xd3\xd4\x00\x00NN\x00\x00PP\x00\x00\xd1\xd0\
-\x00\x00\xcf\xd0\x00\x00RR\x00\x00\xce\xcf\x00\x00\xcf\xce\
-\x00\x00TT\x00\x00\xce\xcd\x00\x00\xcc\xcd\x00\x00\xcd\xcc\
-\x00\x00\xcb\xcc\x00\x00YY\x00\x00\xca\xcb\x00\x00\xcb\xca\
-\x00\x01ZZ\x00\x00\xca\xc9\x00\x00\xc8\xc9\x00\x00]]\
-\x00\x00\xc8\xc7\x00\x00\xc6\xc7\x00\x00``\x00\x00\xc4\xc5\
-\x00\x00\xc5\xc4\x00\x01aa\x00\x00\xc3\xc4\x00\x00cc\
-\x00\x00\xc3\xc2\x00\x00\xc2\xc1\x00\x00ee\x00\x00\xc0\xc1\
-\x00\x00\xc1\xc0\x00\x00\xbf\xc0\x00\x00jj\x00\x00\xbd\xbd\
-\x00\x00\xbb\xbb\x00\x00ll\x00\x00\xb9\xb9\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00/Rv\x0fw@y\x90\
-\x1c\x1c\x1c\xe6\x91\x13\xd5aa\x91\x91\x91A\x91\xe6\x90\
-y\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00W|\x7f7f\x9bB\x80$\
-$\x9a\x9a\x9ad\x89\x98\x9a$dd$$\x80B\x9b\
-f\x7f\xe9\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x18\xab\x1b7\x06B$$K\x99\
-\x15\x15\x15\x15b\x89\xa6\x15\x15\x15\x15\x15\x99K\x9a$\
-B\x06fS\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x0043\x7ffe\x80\x9a\x99bJ\x97\
-###}}\xb47#####\x97Jb\x99\
-\x9a\x80B\x06\x1b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\xf2\x1b\x7f\x06B$\x99b\xa7}I\x95\
-\x09\x09{{{\xb7B\xa5\x09\x09\x09\x09\x95I#\x97\
-b\x99\x9a\x80\x9b\x1b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x83\xcc\xd5\xa8\x9bB\x9a\x15J}\x95{H\x93\
-\x22\x22zzGO$\x22\x22\x22\x22\x22\x93H\xa5I\
-}\x97\x15\x9a\x80\x803\xce\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xd8\x19\x0e_@BK\x15\x97I\x09H\x22G\x92\
-`````\x17\x15`\x14\x14\x14\x14\x92G\x22H\
-\x09I\x97b\x99By\x90\x86\x00\x00\x00\x00\x00\x00\x00\
-L\x19\x1b7\xa6w\x90\x9a\x97I{\x93G\x14F\x8f\
-!xx\xfd\xfd\xbf\x97x\xff\xff\xff\x8f\x8fF\x14G\
-\x93{IIK\x91hbbX\x00\x00\x00\x00\x00\xf7\
-3\x7f7\x9b$By\xef\x09\x09\x22G`\x8f\xfd\x8e\
-\xf9\xf6\xf6>>\x8bI\x02\x02\x02\x02\x8eEx\x8f`\
-G\x22H\x97\x84\x19I{}#\x15\x00\x00\x00\x073\
-\x1bf\x9b$K\x973vJGGF\xff\xfc]\xf1\
-\x1du\xeau\xe7+{\x1d\x1d\x1d\x1d\x8d>\x02\xfc\xff\
-`G`VwHGH\x09I#\x99\x00\x819\x1b\
-fB$\x99J#}\x98\x91#!\xff\x02>\xeb=\
-\x11[\x8c[[Qz\x11\xe0\x11\x11\x5cu\x1d\xf3\x02\
-\xff\x8f\x97\x90\x9bFG\x22H\x09I#V\x10\x0ef\
-B$\x15J}\x09H\x22\x7fA{]>u\x11<\
-\x1fZZZZ\xc9\x14s\xd4\x1fss[\x5cu\xf3\
->{hKE!`\x92\x22H\x09I\x94\x823\x9b\
-$\x99J}\x09Hz\x14!BV\x92\xe3\xddsZ\
-\x8arrr\x9e\x05\x8f\xcdD\x08\x8a\xcf\x1f<\xdf=\
-GVKg\x02\xfd\x8f`\x92\x22{\x09\xaa\xc1\xa6\x80\
-KJ}\x09\x93G`\x8fE\x02\x9a|`\xd2\xcf\x08\
-Y\xbepp\x1et\xfd;;YY;\x8aZ\x1f\x14\
-|\x97\x11u>\x02E!\x14G\x93{\xfbM\x7f\x9a\
-\x15#\x09\x93G`!\x8e]\x8d=J\xfb!\xc8Y\
-6\x12\x87\x12o?\x02p6oop;;\xfdc\
-\x93Z[\x5cu>\xfax\x8f\x14z\x93|M7\x99\
-\xa7IHG`!\x8e>\xeb\xe3\x11\xcfI\x98\xf3\xbb\
-\x12mlm\x87\xa0]o\x87mCo6]\x98\x93\
-\xc7Zs[\x5c\x1d\xf3\x8e!`Gz\xfe\xa9\x06b\
-}\x09\x22\x14\x8f\xfc\xf3u\x11<\x9fZ\x08b|;\
-\xb0\xaf\xad\xae\xb1^\x8d\x87C\xad \xb1]~zp\
-;\x8a\xcfs[=\x1d]E\x8f\x14G9\xa9\x9bJ\
-IHGF\xfd]\x1d\xdfsZ\x8arY\x1dc\x22\
-\xb3\xb1C\x126\xcc\x02\x12nmm\x12\x96J\xb1\x9d\
-\x1e;\x8aZ\xd6\x11\xea>\x8e!\x14G9&B\x97\
-I\x93G\x8f\x8e\xf1\xe4<Z\x08Y\xbdp\x12\x1d\x96\
-G6\xf33\x0e\xb9\x91Ip\x87\x12`f[ \xb3\
-6\x1erD\x1f[=\x8d\x02xF\x92\xa4&B#\
-\x09\x22\x14\xff\xf9\xed\x11\x9f\x8aY6\x87\x87\xb6\x87=\
-7\x99\x7fI\x22\x14Gf\x15\xcd{\x7f\x5c\xae\xaem\
-\x12\x9d;\x8a\x1f\x8c=\x8d\x02xF\x14\xa4\xc5B#\
-\x09\x22\x14\xff]\x1d\x11\x1f\x08\xc0\x12 \xaen\x9c6\
-\x09c\x5c\x04\x04\x04\x04\x87Kcfs\xafl: \
-\xb3\xbb;\x8a\x1f<\xe4\x8d\x02xF\x149&B#\
-\x09\x22\x14\xff]\x1d\x11\x1f\x08\x1eom\xaeC\xb1`\
-3[\x04\xac\x04\x04\x04\x04\x1eh\xf9\xb1\x12\xb0\xafn\
-op\xc7\x8a\x1f[=\x8d\x02x`\x149\x00\x9a\x95\
-H\x92\x8f\x8e\xee\xe2s\x8a;6\x87\xael \xad7\
-$k\xac\x04\x04\x04\x04\x04 {\x7f;\xae l \
-\xb1\xb5p;\xcd\x1f\x8c=g\x02x\x8fc\x00\xf4\x0e\
-3\x7f\x06B$\x99J}\x09HzGGGG\x84\
-K:\x04\x04\x04\x04\x04\x04\x04\x8d\xdaJ\x92GGG\
-z\x22H\x09}\x97bKdB\x06fv\x00\xbc\x8b\
-+Q\xc9t?^\x1a_R\xd5\x0f\xdbww\xe1\xbc\
-\x99:\x04\x04\x04\x04\x04\x04\xac\x8dQ_y@@\xde\
-\xdb\xdb\x0fvR\xd3_\x1a\x1a^\xa0^\x0d\x00\x15\x93\
-GF\xfd]u\xddsD;p\x12mll:$\
-\x9b\xae\x04\x04\x04\x04\x04\x04\x87\x9bI\x87kkk\xad\
-\xaf\xb1\xb6pYr\xcdZ\xd7\x11==\x1b\x00\x99{\
-\x22\x14\x8f\x8e\x8d\xe5[Z\xcb\xc2o\xb1llm\x1f\
-\x9b\x93\x04\x04\x04\x04\xac\x04uc\x11\xad\xae:\xad\xaf\
-\x87opYrD\xd1<\x11=\x1d\xee~\x00\x99{\
-\x22\x14\x8f\x8e>\xe8\x8cZ\x08\xc2o\xb0l\xaeC\x87\
-GV{\xb0\xaellu\x98$\xbe \xae:\xadm\
-\x87\xb8\xbdY\xcaD\xd2<\x11=\x1dg3\x00K{\
-\x22\x92\x8f\xfc\xf3\xe8[\x1f\x8a;\xbb\x88\xb0\xb1\x12\x14\
-f\xf9$\xa43\x0e\x0e\x98\x02#\x9a;\xad  \xb0\
-\x88\x9cp\xc4\x08D\x1f<\x11\xe8\x1d\x8d3\x00K\x09\
-\x93\x92FE]\xa1\x11s\xcf\xcaYp6\xb0G\xfb\
-[\xaf\xc6\x8f`Pb<\xb0\x1ebf\x08m\x87\x87\
-o6\x1e;\x08\xcf\x1f<\x11u\x8d\x8d\x98\x00d\x95\
-HG`x\x02\x8d=[\x1fDr;\x1e\xcb\x1bf\
-o\xb0\xad\xac\xad\x1a\x11\xafo\x9c;\x15\x06\x8a\xb2o\
-6\x1eY\x9eDZs[\x5c\xa1\x8d\x8d\x98\x00$I\
-{\x22\x14\x8fE\xf5\x1d\x5c\x8c\x1fZrZ$$D\
-\x12\xb1l\xad\xaf^\x8d\xba\x1e;;\x1f\x157s\x12\
-\x1eYr\x8a\xcf\x1f<\xdd=\xed>\xf3\x96\x00\x80#\
-\x95\x93G`\xff\x8e>u\x5c[\xd0[fBs\x1e\
-p\x12\x87\xb0\xb1\xa0\x02Yr\x08D\xd0\x11K\x98[\
-\x1e\x08\x08D\x1fs[\x5cu\x8d]]\x0e\x00B\x97\
-I{\x22\x92Fx\x02>\x1d\xe3\x1d\xa67\x5c\x8a\x08\
-Yp6oo?\xfd\x08DZ\x1f\xd9[=$~\
-\xdc\x9e\xcf\xd1s[\xdf=\x1d>]\x02c\x00\x9bb\
-#\x95Hz\x14Fx\x8e]\x02~fgs\x1fD\
-\x08;YYYt\x8fZss\x8c\x11uu\xf8B\
-\x96\xf0D<[\x11=u\x8d]\x8e\x8e\xa4\x00f\x99\
-J}\x09Hz\x14F\x8f]I\x1cx=\x5c[s\
-Z\xcd\x8a\x8a\x08\x05\x14<\x11\x5c=u\x8d]\x02x\
-\x06\x19\x8es\x11=u\x8d]\x02EE\xfe\x00\x7f\x9a\
-\x15\x97I\x09H\x22GF\x09hB\x8e>\xa1\x5c[\
-<\xd4\x9f\x1fZ\xc9G\x5cuu\x1d>]\xfc\xff\x8f\
-F\x7f|x\x5c\xeb\x8d\xf5\x02E\xff\xff|\x00\x1b$\
-\x9a\x15\xa7}\x95HzbAf\x8fx\x02>\x1d\xe7\
-\x5c\x11\x11[[QH\x1d>>]\x02E!F\x14\
-G\x223V\x92\xeb]\x02\xfc\xff\x8f!\xfb\x00(e\
-$K\x15J#\x95K\x90f\x92\x14F\xff\xfc\xf8>\
-\x8d\x1duu=+\x09\xf9\x8e\xfc\xfd!\x8f`\x92G\
-\x93H\x09\x0e\xecH>\xfd\xff!\x8f#5\x00\x00i\
-\x1b\x80\x9a\x99\x97\x80R\x98HHz\x14F!\xfd\x8e\
-\x02]]>>\xc3}x\x8f\x8fF`\x14GzH\
-{\x95}}9\xec\x09E!Gj1\x00\x00\x00\x00\
-%0Bd\x994\x05\xa7I\x09H\x22\xa2`F!\
-\xffxE\xfc\xfc\xbfJF`\x14\x92Gz\x93H\x09\
-I#J\x15\x99\xaa\x1c\x97H'\x00\x00\x00\x00\x00\x00\
-\x00N\x85B\x94_\x7fJ\xa7}\x95{\x93G\x92\x14\
-`FFF\x8f\x17\x99GG\x22\x22\x93H{I}\
-\x97b\x99K$BV\x0f\x0b\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00*2^3K\x9a\x15J#I\x09H\x93\x22\
-GGGG\x14\xbc$\x93H{{\x09II#J\
-bK\x9a$\x9b\x9bc\x0c\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x0a,\x06B\x80d\x99b\x97}I\x09{\
-{HH\x93\x93OB\x09III}#JJ\x15\
-K$BB\x9b\xa3T\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00Uc\x9bB$K\x15J\x97#I\
-III\x95\x09-f#\x97\x97JJb\x15K$\
-\x80BB~\xef\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x16\x86\x06B$dK\x15bJ\
-J\x97\x97##q\x7fbb\x15\x99K\x9a\x9a$B\
-e\x06\x98.\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x038\x1b\x1b7f\x06\x9b\x9b\
-BBB\x80\x80\x0d\xa4\x9b\x9b\x06\x06\x06f7\x7f\x1b\
-~\x0e)\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xe0\x00\
-\x00\x0f\xff\x00\x00\xff\xc0\x00\x00\x03\xff\x00\x00\xff\x80\x00\
-\x00\x01\xff\x00\x00\xff\x00\x00\x00\x00\xff\x00\x00\xfe\x00\x00\
-\x00\x00\x7f\x00\x00\xf8\x00\x00\x00\x00\x1f\x00\x00\xf0\x00\x00\
-\x00\x00\x0f\x00\x00\xe0\x00\x00\x00\x00\x07\x00\x00\xc0\x00\x00\
-\x00\x00\x03\x00\x00\x80\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\
-\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\
-\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\
-\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\
-\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\
-\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\
-\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\
-\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\
-\x00\x00\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\
-\x00\x00\x00\x00\x00\xc0\x00\x00\x00\x00\x01\x00\x00\xe0\x00\x00\
-\x00\x00\x07\x00\x00\xf0\x00\x00\x00\x00\x0f\x00\x00\xf8\x00\x00\
-\x00\x00\x1f\x00\x00\xfc\x00\x00\x00\x00?\x00\x00\xff\x00\x00\
-\x00\x00\xff\x00\x00\xff\x80\x00\x00\x01\xff\x00\x00\xff\xc0\x00\
-\x00\x03\xff\x00\x00\xff\xff\xff\xff\xff\xff\x00\x00(\x00\x00\
-\x00 \x00\x00\x00@\x00\x00\x00\x01\x00\x08\x00\x00\x00\x00\
-\x00\x80\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\x00\x00\xbf\xc0\
-\x00\x01_a\x00\x00\xff\xff\x00\x00\x90\x90\x000gg\
-\x00\x00@@\x00\x00\xdf\xdf\x00\x00\xa8\xa7\x00\x00xw\
-\x00\x14QQ\x00\x16rr\x00\x00\xef\xf0\x00\x00\xcf\xcf\
-\x00\x0c\x83\x82\x00\x00SR\x00\x00\xb3\xb4\x00\x00\x9c\x9b\
-\x00\x00ll\x00\x0eaa\x00\x00\x86\x86\x00\x0aqr\
-\x00\x10YY\x00\x00\xe7\xe7\x00\x00\xd7\xd7\x00\x04LK\
-\x00\x00\xf7\xf8\x00\x00\xc8\xc7\x00\x00\x7f\x7f\x00\x06XX\
-\x00\x00\xa1\xa2\x00\x00ff\x00\x00\xae\xad\x00\x00\x96\x95\
-\x00\x00\xba\xba\x00\x00rr\x00\x06ii\x00\x00[[\
-\x00\x07RQ\x00\x06]]\x00\x06dd\x00\x06\x9d\x9d\
-\x00\x00\x8a\x8b\x00\x00\xf3\xf4\x00\x00\xeb\xec\x00\x00\xe3\xe3\
-\x00\x00\xdb\xdb\x00\x00\xd3\xd3\x00\x00\xc3\xc4\x00\x0e\x80~\
-\x00\x03oo\x00\x00\xfb\xfb\x00\x00\xcc\xcb\x00\x00\x82\x83\
-\x00\x04vv\x00\x00z{\x00\x07UU\x00\x00\xb7\xb7\
-\x00\x00\xb1\xb0\x00\x00\xab\xaa\x00\x00\xa4\xa5\x00\x00\x9e\x9f\
-\x00\x00\x93\x92\x00\x00\x99\x98\x00\x07MM\x00\x01ij\
-\x00\x09oo\x00\x03yy\x00\x00dc\x00\x00\xbd\xbd\
-\x00\x00uu\x00\x00\x8d\x8d\x00\x00\xf6\xf5\x00\x00\xee\xed\
-\x00\x00oo\x00\x00\xfd\xfd\x00\x00\xf1\xf2\x00\x00\xe9\xea\
-\x00\x00\xe5\xe5\x00\x00\xe1\xe1\x00\x00\xdd\xdd\x00\x00YY\
-\x00\x06[[\x00\x00\xd9\xd9\x00\x00]]\x00\x00\xd5\xd5\
-\x00\x00\xd1\xd1\x00\x00\xca\xc9\x00\x00\xc5\xc6\x00\x00\xc1\xc2\
-\x00\x00}}\x00\x00\x88\x88\x00\x02ee\x00\x00hh\
-\x00\x00\xf9\xf9\x00\x00__\x00\x00aa\x00\x00\xce\xcd\
-\x00\x00pq\x00\x00st\x00\x00yy\x00\x00\xbc\xbb\
-\x00\x00\xb9\xb8\x00\x00\xb6\xb5\x00\x00\x81\x81\x00\x00\xb2\xb2\
-\x00\x00\x84\x84\x00\x00\xaf\xaf\x00\x00\xac\xac\x00\x00\xa9\xa9\
-\x00\x00\xa6\xa6\x00\x00\x91\x91\x00\x00\xa3\xa3\x00\x00\x94\x94\
-\x00\x00\xa0\xa0\x00\x00\x97\x97\x00\x00\x9d\x9d\x00\x00\x9a\x9a\
-\x00\x00\xf3\xf2\x00\x00\xf1\xf0\x00\x00ST\x00\x00\xca\xcb\
-\x00\x00\xc3\xc2\x00\x00\xc1\xc0\x00\x00\x8f\x8e\x00\x00\x95\x96\
-\x00\x00\xfe\xfe\x00\x00\xfa\xfa\x00\x00\xf7\xf6\x00\x00\xf5\xf6\
-\x00\x00\xf0\xf1\x00\x00\xe8\xe9\x00\x00\xe6\xe6\x00\x00\xe4\xe4\
-\x00\x00\xe2\xe2\x00\x00\xe0\xe0\x00\x01gf\x00\x00\xde\xde\
-\x00\x00gg\x00\x00\xdc\xdc\x00\x00jj\x00\x00\xda\xda\
-\x00\x00kk\x00\x00\xd8\xd8\x00\x00mm\x00\x00nn\
-\x00\x00\xd6\xd6\x00\x00\xd4\xd4\x00\x09rr\x00\x00\xd2\xd2\
-\x00\x00\xd0\xd0\x00\x00vv\x00\x00\xcd\xcc\x00\x02yz\
-\x00\x00||\x00\x00\xc9\xc8\x00\x00~~\x00\x00\xc7\xc8\
-\x00\x00\xc7\xc6\x00\x00\x80\x80\x00\x00\xc6\xc5\x00\x00\x85\x85\
-\x00\x00\xc0\xc1\x00\x00\xc0\xbf\x00\x00\x87\x87\x00\x00\xbe\xbe\
-\x00\x00\x89\x89\x00\x00\x8b\x8c\x00\x00\xb8\xb9\x00\x00\xb5\xb6\
-\x00\x00\xb5\xb4\x00\x00\xb4\xb5\x00\x00\x92\x93\x00\x00\xb0\xb1\
-\x00\x00\xad\xae\x00\x00\xa7\xa8\x00\x00\xa2\xa1\x00\x00\xf8\xf8\
-\x00\x00\xf7\xf7\x00\x00\xf5\xf5\x00\x00\xf4\xf4\x00\x00\xf3\xf3\
-\x00\x00\xf2\xf2\x00\x00\xf1\xf1\x00\x00\xf0\xf0\x00\x00\xee\xee\
-\x00\x01aa\x00\x00\xed\xed\x00\x00\xeb\xeb\x00\x00dd\
-\x00\x00\xea\xea\x00\x00ef\x00\x00\xe9\xe9\x00\x00\xe8\xe8\
-\x00\x00ih\x00\x00\xe7\xe6\x00\x00\xe5\xe6\x00\x00\xe4\xe5\
-\x00\x00\xe2\xe3\x00\x00pp\x00\x00\xe1\xe2\x00\x00\xe1\xe0\
-\x00\x00\xe0\xe1\x00\x00ss\x00\x00\xdf\xde\x00\x00tt\
-\x00\x00\xde\xdd\x00\x01uu\x00\x00\xdd\xde\x00\x00uv\
-\x00\x00wv\x00\x00\xdb\xdc\x00\x00ww\x00\x00\xdb\xda\
-\x00\x00\xda\xdb\x00\x00xx\x00\x00xy\x00\x00yz\
-\x00\x00\xd7\xd8\x00\x00zz\x00\x00\xd6\xd5\x00\x00\xd4\xd5\
-\x00\x00\xd4\xd3\x00\x00\xd3\xd4\x00\x00\x80\x7f\x00\x00\xd3\xd2\
-\x00\x00\xd2\xd1\x00\x00\x82\x81\x00\x00\x82\x82\x00\x00\xd1\xd0\
-\x00\x00\x83\x83\x00\x00\x84\x83\x00\x00\xce\xce\x00\x00\xcd\xcd\
-\x00\x00\x87\x86\x00\x00\xcc\xcc\x00\x00\x86\x87\x00\x00\xcb\xcb\
-\x00\x00\xca\xca\x00\x00\x89\x8a\x00\x00\xc9\xc9\x00\x00\x8a\x8a\
-\x00\x00\xc8\xc8\x00\x00\x8b\x8b\x00\x00\xc7\xc7\x00\x00\x8c\x8c\
-\x00\x00\x8d\x8c\x00\x00\x8c\x8d\x00\x00\xc6\xc6\x00\x00\x8e\x8d\
-\x00\x00\xc5\xc5\x00\x00\x8d\x8e\x00\x00\x8e\x8e\x00\x00\xc4\xc4\
-\x00\x00\x8f\x8f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xbe^\
-\x8fK\xc8\xc8 \x07\x8dc$\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x173\x9d\xe8\x5c\
-\xf6\xff\x05pk\x10\xa5\x05\x05\xffH\xf2\xa2\x9b\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbb\xcc\xa0\xa5H?\
-tv\x12\x12}Rp\x12\x12vtr\x05\xf2i\xd3\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a\xc3\xe5\xa7p@u\
-qo\xb0\x09@`\x12\x09\x09oq>vrH\xed\
-K\x00\x00\x00\x00\x00\x00\x00)\xc0U\xd5?v\x1f\x09\
-!\xae\x11\x11= \x09\x11j;!nq\x12\x22\x15\
-\x8dK\x00\x00\x00\x00\x00B86G \xf2q<;\
-:f\xa6\xa4l\x91;FFfg\x11!o?$\
-\x9dv\x05\x00\x00\x00\x92[\xa2\xf8pG\x98=\x11#\
-Z\xf9\xef\xee\xa9df\x9c\xf3\xf9ZF\xaa!\x1d\x1d\
-\x09=>\x22\x00Ae\xa2H~uu\xe5\xa8j\xfe\
-\xeeW\x93\x191\xdc\xfb\xdf\x94W\xecY#r\xe5o\
-j<=>\x00'\xa0H~>o!m\xff\xffZ\
-\x94\xd4P\xc7\xea\xe1\x0e\x8a\x08\xd4V\xees?j\x02\
-gj<=\x009\x15ruol:\xa6\xa6\x12\x1f\
-\x0e\xc6\xbdJ\x93k\xdb\xc1\xbfOTm@\x02\xea\xf9\
-\x02g;n\x00\x1e\xf4@=!:\x02\xf3\xe9\xee=\
->\xc7wI\x8c\x5c\xd1M\xb6\xc2h\x09\xee\x8e0\xec\
-\xfbF\xac!\xa7S\xff>n\x11\xa6\x9eW\x90\x8a\xe2\
-\x12Z\xb9-\xee\xe4\xdf\xb7\xb5\xf9v0\xc4\x88TW\
-\xf1|gl\xf4(?\x1fmg1b\x90\xc9\xc1\xbd\
-\xeanho\xfd\xce@\x99\x94\x09{xJ\x85Q\xde\
-\xec1#j\xf4\x00rql#\xa1\xe6\x8c\x18\xb8\xb6\
-\xbaF~fQ\x88\xf3\x1f\x12Z\xb8\xb3x\xc2\x08\x93\
-\xea\xfef\x11\xf6\x00~=;f\x1c0\x8aN,\x82\
-\xbf\x1fg\xb4\x7f\x044f\x22.\xb5Ix\x84\xcb\x19\
-\x0eYf\x11\xf6\x00Gi\xf2?\x12=\xafhfF\
-j\x1d\x96\x7f\x04\x04\x7f\x87\xa7\x09FF#h;\x09\
-\x1f\x12r\xfd\x91\x00E\x91\xcc\xda\xa0\xebH?@v\
-\x22\xceW\x7f\x04\x04\x7fQkpuuvt?\xfc\
-\xf0\xa2i\x9da\x00>mh\x02z\x94\xcd\xc2M\x1b\
-\x83lj\xbcLL\xb6j<\xb9\x80_\xb5\xba\xc2P\
-\xd7\x94\xe9\xf1u\x00\x12<h\xa6\xf3\x96\x8c\x85\x0d\xb4\
-\x83\x02vl\xfb\xf9\x11u;\xba\xb2\x81\xb8\xbdO\x08\
-\x90\x965\x9f\x12\x00\x12njF\x9f\x97T\x87\xc1\xba\
-\xefqbf@$n\xe3;F\xbfw\xba\xc1\x86\xcf\
-\x90W\xee\xf9v\x00@olg{\xec\xdf/P\x93\
-\x1f#\xb8\xb4\x8e\xf2Q\xbd\x93\x09l\x86\xbf\x85\x88\xd6\
-V\x0e\xf1\xfet\x00\x22\xb1<\xacF\xfb\x99\xe0\xf5q\
-!\xca\xba\xb6Q\x5c\xdb\x87\x8a\xea\x1fjQP\x8c\x19\
-\x96\xec\xf5Z~\x00puolhF\xfeF@n\
-\x94\x88\xc5\xc1V\xe7\x0eT\xddW\x02@\x1f0\x900\
-\xe9\xf11\x02?\x00\xf6@s\x09lh:\xff\x05\xf5\
-\x96\x90\x8c\x08\xec[\x9f\x97\xea\xf1\xfehp\x1f\xf1\xe9\
-\xf1\xfb\x02f\xff\x00\x15p@s\x09<p\x15!1\
-X\x0e\xe2\x94Z\xd8\xa6\xf5\xfbZf:\x09\x5cp\x02\
-\xfb\x02fg\xf7\x00D+?@\x12k\xd9u\xabf\
-\xa3\xfb\xf3\xefg$h\xa6fg\x11ln>\x1d\xff\
-hf:<\x0f\x00\x00C\xa5p\x1d\x8bpomj\
-:f\xa6\x02l\x13mh\x11;m\x09\x1fu\x05\xd2\
-\xa0<*2\x00\x00\x00\x00\x0c\x0a \xcet>=n\
-lj\x11ho qm<\xb0=sv\x22\xff\x15\
-\x8f\x16\x00\x00\x00\x00\x00\x00\x00\x0b\x89\xa5\xff\x22\x12s\
-=\x09<<uavq\x1f>\x12@\xad\xfc\x5c\xe5\
-%\x00\x00\x00\x00\x00\x00\x00\x00\x00\x147\xa5\xfa?t\
-v>>s?&?@@\x22?\xff\xf2\x15\x9a]\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x95\xe5\xeb\xf4\
-\xfcp??\x15y\x15H\xf6\xf2\xa5k\xa0\xd0\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xff\x00\x0f\xff\xfc\x00\x00\x7f\xf8\x00\x00\
-\x1f\xf0\x00\x00\x0f\xe0\x00\x00\x07\xc0\x00\x00\x03\x80\x00\x00\
-\x01\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x00\x80\x00\x00\
-\x00\x80\x00\x00\x00\x80\x00\x00\x00\x80\x00\x00\x00\x80\x00\x00\
-\x00\x80\x00\x00\x00\x80\x00\x00\x00\x80\x00\x00\x00\x80\x00\x00\
-\x00\x80\x00\x00\x00\x80\x00\x00\x00\x80\x00\x00\x00\xc0\x00\x00\
-\x01\xe0\x00\x00\x07\xf0\x00\x00\x0f\xf8\x00\x00\x1f\xfc\x00\x00\
-\x7f\xff\xff\xff\xff(\x00\x00\x00\x10\x00\x00\x00 \x00\x00\
-\x00\x01\x00\x08\x00\x00\x00\x00\x00@\x01\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xff\xff\xff\x00\x00\xc0\xc0\x00\x02ii\x00\x00\xf2\xf2\
-\x00\x00\x94\x94\x00\x00\xda\xd9\x00\x00\xaa\xaa\x00\x03\x80~\
-\x00\x00\xcd\xcd\x00\x10vx\x00\x00\xe5\xe6\x00\x09\x8a\x8a\
-\x00\x00tt\x00\x00\xb5\xb5\x00\x00\x9f\x9f\x00\x00\xc6\xc7\
-\x00\x00\x85\x85\x00\x00\xd3\xd3\x00\x00\x8b\x8b\x00\x00\xeb\xeb\
-\x00\x00\xe0\xe0\x00\x00zz\x00\x00oo\x00\x00\xbb\xbb\
-\x00\x00\x99\x99\x00\x00\xb0\xb0\x00\x00\xa4\xa4\x00\x00\x90\x8f\
-\x00\x00\xc4\xc3\x00\x00\x81\x81\x00\x00\xef\xef\x00\x00\xdd\xdd\
-\x00\x00\xd6\xd6\x00\x00}}\x00\x00\xd0\xd0\x00\x00\xca\xca\
-\x00\x00\x9c\x9c\x00\x00\xb8\xb8\x00\x00\xa7\xa7\x00\x00\xad\xad\
-\x00\x00\x97\x96\x00\x00\xbd\xbe\x00\x00kk\x00\x02xx\
-\x00\x01qq\x00\x00\xed\xed\x00\x00\x7f\x7f\x00\x00\x83\x83\
-\x00\x00\x89\x89\x00\x00\x92\x92\x00\x00\xb3\xb3\x00\x00\xa1\xa1\
-\x00\x00\xdb\xdb\x00\x00\xc8\xc8\x00\x00\xc2\xc2\x00\x00\x8e\x8e\
-\x00\x00\xba\xb9\x00\x00\xb6\xb7\x00\x00\xb2\xb1\x00\x00\xa9\xa8\
-\x00\x01{{\x00\x01\x80\x80\x00\x00\xea\xea\x00\x00\xe1\xe1\
-\x00\x00ss\x00\x00\xdf\xdf\x00\x00\xdc\xdc\x00\x00yy\
-\x00\x00\xd5\xd5\x00\x00~~\x00\x00\xd4\xd4\x00\x00\xd2\xd2\
-\x00\x00\x82\x82\x00\x00\xd1\xd1\x00\x00\x84\x84\x00\x00\xcf\xcf\
-\x00\x00\xce\xce\x00\x00\xcc\xcc\x00\x00\xcb\xcb\x00\x00\xc9\xc9\
-\x00\x00\x91\x91\x00\x00\x93\x93\x00\x00\xc1\xc1\x00\x00\xbf\xbf\
-\x00\x00\x9a\x9a\x00\x00\xbe\xbd\x00\x00\x9b\x9b\x00\x00\xbc\xbd\
-\x00\x00\x9d\x9d\x00\x00\xa0\xa0\x00\x00\xb7\xb6\x00\x00\xa2\xa2\
-\x00\x00\xb4\xb4\x00\x00\xa3\xa3\x00\x00\xa5\xa5\x00\x00\xaf\xaf\
-\x00\x00\xae\xae\x00\x00\xac\xac\x00\x00\xe6\xe6\x00\x00\xda\xda\
-\x00\x00\x81\x80\x00\x00\x8f\x8f\x00\x00\x90\x90\x00\x00\xc8\xc7\
-\x00\x00\xc7\xc7\x00\x00\x93\x92\x00\x00\xc4\xc4\x00\x00\xc3\xc3\
-\x00\x00\x96\x96\x00\x00\xc2\xc1\x00\x00\x97\x97\x00\x00\xbe\xbe\
-\x00\x00\xbd\xbd\x00\x00\xbc\xbc\x00\x00\xbc\xbb\x00\x00\xba\xba\
-\x00\x00\x9f\xa0\x00\x00\xb9\xb9\x00\x00\xb7\xb7\x00\x00\xb6\xb6\
-\x00\x00\xb5\xb6\x00\x00\xa7\xa6\x00\x00\xa8\xa8\x00\x00\xb1\xb1\
-\x00\x00\xa9\xa9\x00\x00\xaa\xa9\x00\x00\xae\xad\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x0d/KD+K0\x22\x00\x00\x00\x00\x00\x00\x00\
-\x168\x19ZRe\x0fYm1\x00\x00\x00\x00\x03\x17\
-F\x0fax<R\x0e3\x07m\x1e\x00\x00\x00If\
-\x13u\x02N*_O6w\x19U^\x00-R_\
-\x7f{r\x15J\x0e\x15E];r\x1aU=\x0f]\
-\x10NqGMx\x0bih!Pv4>zV\
-\x12c5&q&\x18N?@#p\x1bA\x05<\
-r\x09iw\x1f\x04v7H\x10&}2A2^\
-]k7y\x14.9\x1dO7:b)1(n\
-Ec \x18p]s\x06\x1fcdM\x0e\x11't\
-OM\x02E\x12wE\x02MBE$|FYa\
-\x0e~pCL\x1a#SaXNlb\x008U\
-R\x0f\x02$rZTv<\x19\x07w\x00\x00\x0a,\
-0\x5c`[}Q(}Zg0\x0c\x00\x00\x00\x00\
-\x08j%\x5cm\x1eWo\x1cI\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\x0f\x00\
-\x00\xe0\x07\x00\x00\x80\x03\x00\x00\x80\x01\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x01\x00\
-\x00\x80\x01\x00\x00\xe0\x07\x00\x00\xff\xff\x00\x00\
-\x00\x00\x07\x04\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00 \x00\x00\x00 \x08\x02\x00\x00\x00\xfc\x18\xed\xa3\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\x00\x00\x00\
-\x09pHYs\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7o\
-\xa8d\x00\x00\x06\x99IDATHK\x95ViP\
-SW\x14\xce\xf4O\xc7\x1dd\x11\x10YE\x01\xb1\xae\
-\xa1*\xae\xc8\x22\xb8PW6\x15\x08\x82\x10\xea\x82\x96\
-q\xb0\x94Em\xa9K\x81\xb0\x84\x00*\x04\x17$*\
-jA\xc4Z\xc7B\x8a\xca\x22\xa5\xb4\x80\x08A\x11A\
-\x86\x1d\xf2\xb2/\xaf'\xbc\x9b\x12\x9e\xe0\xe87g2\
-y\xf7\x9e\xf3}\xf7\xdd{\xee9\x8f\x82\x7f\x02\xca\xca\
-\xeb\xebj\xde\xc2\x9fc\xdcsv\xd7=.5\x14\xc0\
-\xff\x87\x0fk\x9b[:G\xe6?\x86\x8f\x09\xbc\xef\x1a\
-`e\x95\xacq\x8c\xa4\xd1\xd2\xfa\xfb\xf8!\xa5q\x06\
-\x97\xd6\x99\xb1]\x8c.oH\xab\xbf\xde\xd6\xd4\xb7\xc1\
-)z\xfb\x9e\xf8[\x05OE\x22\x09\x8a\xf9\x00\xe3\x0b\
-\x08\x04\xe2\x04\xc6\xbd\xc5\xf6\xe1_L\xda\xb1s\xe7y\
-\x91@\x12Z\x1e\xa7\x95\xb1bn\xae\x9bU\xae\x9b9\
-\xdbE;seV\x0b\xa7\x837h\xbb\xf0\xf0$-\
-\xcf\x0d.?\x80\x0c\x0a\x1e\x8bq\x04\xfe\xaamu\xd9\
-\x1c;C\xcfw\xaa\x8ew\xd0\x81t\xa9XFW\xb3\
-\xffo\xe6lW\xed\xccU\x17y\x9c\xee6\xfe\xda\xf5\
-Q\x93\xb5\xbdt\x8d\xf6\x07\x1eL\xed\xee\x19B,j\
-\x90\x05\x8a\x8a\xab\xe7\xd9\x85M\xd3\xf5\xf9j\xf9\xd1\x9c\
-\xec'B\x998\x98\x1b\xad\x95\xb1R\x93\x9d0B\x83\
-\xd9t\x9d? \x8e\x8e\xcd3\xb1\x0a\x82\xa8\xb5\x1b\xbf\
-\x7f\xd9\xf4\x0eq\x8d`\x8c@q\xc9\x0b\x93\xb9A3\
-\xf4}=v\xc5\xb7\xbd\xee\x81\x11\xef\xdf\xbe#\xad]\
-\xd3,\xd8\xae0\x1b_\x9b\x09\x9e\x7f\x94\xd6/[q\
-\x1c4\xa8\x0e\x11-\xbc\xf7#|*\x8c\x0a\xd4\xfd\xf3\
-\xc6\xca\x8e\x0e\xec~\x81\xc9\x12\x91\x5c\x81\xcbw?8\
-\x06{M\x22%\x99\x05{\x13\xf8\xc4U2\x81\x81\xc7\
-\xebZ\xed\x18\x09\x1aN\xee1CC\x02\x82\x16\x09\x08\
-\x85\x12\x97\xcdq0\xe7\xb1\xf3'\xb1H&\xc6%\x9f\
-\xc2N\x18\xa1\x11[\xa1\xd2x\xd5\xdc\x09{\x0b<\xc7\
-O\xe4\x10\xccH\x80\x91Z8]\xcfg\xe1\xb2#o\
-\xdbz\x84J\x91G\xd1\xa1\xa9,\xaaI\x8e\x93I\xb6\
-\x13\xe4\x0c\x89Q\xd3Ls\x9c\xc1\xcd8{\xe3\xe4\xf4\
-e\xd1\xcfS\x81\xaa\xb8\xa4\xc6\xd04\xc0\xd0\x8cV\xf6\
-g=<\xaa\x04\xba\xbb\x07\x17Q\xc3\xb5\x0d\xf6^\xca\
-\xf9\x1d\x1eyC\xedKo\xec^rc\xd7\xf2|O\
-{\x8e\xd7\xc2\xeb\xdb-s7\x91x\xff7p\xa3r\
-\xbc\xa8\xf9\x9e\xb6\xd7\xb6m\xbf\x7fX\xa6\x94\x03\x03\xfd\
-H\xc6\x94\x99^\xbb}\xce#\x01Vf\xc94\x1do\
-\xc8e\xb1X\x0a\x8f\x00\x81L\xd4+\x1a\xe8\x97\x0a\x07\
-\xa4Bf]\x9e\xde\xc5\xd5$^08a\xb3\x1c\xe7\
-\xb2\x8e\xaa~\x99\xb8_\xc2\x07\x7f\xa9\x02\x857\xbel\
-\xb7\xb0\x09\x99m\x1eXY\xd5\xac\x12\x80\x9c\x01\xc1\x14\
-\xe6}bz\x14\xfcN\x9c\xf7\xe0j\xcb#\xdd,\x07\
-\x12;\x98J\x80\xedZ\xdf\xdd\x807r\x90\xbf\x06\x02\
-\x82S\xe0\x02\xc6\xfd\x98Oim\xed\xb2Yt\xc8\xd2\
-:\x84\x94\xbf\x00\xf1\x03:^\x16\xc3n-\xfd\x88@\
-m_\x0b\xce\xd9*\xab\xcbE1j\xdc\xe0pg\xe8\
-\xf9\xec\xf0<KI\xcf,12\xa39\xbb\xc7\xca \
-35\xa0\x1cj\xc7\x18Fx\x15#\x9b\xf7d\x22\x01\
-S\xb6KM_3^\xb0Gx\xd5\x11W\xc8P\xe4\
-\x08^\xbd\xea\xb0\xb4\x09]\xb1\xe6\x04e\x1f-I\x7f\
-\x8e\x7f\x10]\x95d\x9a\x90\xd5\xe7a\xf1_\xe2\xd5)\
-W\xdf\x94OgQI\xec`\x90]\xb3\xb37\xd6\x0f\
-\xbe\xc5\xef\xfabIF\x8a\xdeF\x149\x02>_\xe4\
-\xb0!\x12\xf6\x86\xb2\xce)J\xdf\xd8?2\xea\x0a\x9a\
-QC\xc2=\x85\x9d\x9f./\xd8\xd3!\xe6\xaf\xbcC\
-\x9b\x96a\xaf\x93\xe5\xa0iSY\xf6\x01\xdcsR\xec\
-\xbd\xf8\xe2b,Q_\xdeL>B\xb7m\xa7-m\
-B(\xf0\x16\xf0\x06Q1\xd7\xd0\xb0\x1a\x92\xc7'\xb0\
-$\x03,\xd9\x18\xafH\xe8\x12\xf6\xddl\xaf\x00\xbb\xdd\
-^I\x18\xa7\xfdyQg\x8dX\xd0--\x0a\xc4\x92\
-\xe7\x80\xa7\xac\xf1&\x8aT\xc3\xdd\xe3\x8c\x85\xf5A\xca\
-F\xb7\x18x\x83\x88\x93l4\xac\x86\xf4\xe9Y\x08\x13\
-\xb0\xacACyk'\xfe\xfc\x02\xfe\x829j\xd5i\
-8\xf7\x94\xf4\xcaz\x98\x15\xb0l\xe0W\xde\xfa\x08E\
-\x8e@\xa9T\xban=ei\x1bJ\x09=\x9c\x01o\
-\xe0\x17\xc8@3j\xc8\x9a\xefcI\x86\x10\xac\xb2\x14\
-S\xf8O6\x86\xa1 \xcdB\xc0\xb2\x150\xe7\x092\
-\x16(\x87\xdaP\xe4\x08\xfa\x070{\x87\x08\xbb\xa5G\
-(y\x1c\xae\xb1\xc5\x815\x8e'\xa1\x1c\xa1\xc9\x11(\
-E\x03\xc2\xcb\xf6\x82Ts\xa41\xa1\xd9\x82\x98\xf8W\
-?\x14\xa6\xc6\xdfu\xaf\xa10\x03-\xa5\xb7ox1\
-5\x9c\xb8uhR\x0diM\x06\x96\xa0\xfb\x01\xe3X\
-cZ\xc1\x19(:*P\x8c\x1a\xac\xac\x87Sfz\
-\xfb\xfa'\xaan\xf2~\x1a\x03n]\xec\xe9\x1b\xc4\xdc\
-(\x14rQa\x00\x96\xa0\x03'A\xe6U\x19l\x8e\
-\x15\xf6\x8b\x8e\xb4\x22\x09\xf9\xab\x01\x07\xf0\xcd\xeexh\
-s\x8c\xd4\x22\x95\xc0\xed;O\xb5g\xed]\xf2\xf5\xf1\
-\x9e^r\xc3SJ\xf8\xe2\xe2\x10\xc8BX\xa6 }\
-\xbe\x9a\xda\x1a\xf6]u\x06\xc9&\xd2\x8a\x04\xe4\xaa\x81\
-R\xee\xbf\x86\xa6\xb4\xb9\x0bB\xa1\xf3\xa8\x04\x04B\xf1\
-z\xe7\xa8i\xba\xde\xd1\xa7\xf2\x08\x0f\x12d\x0d7E\
-\xf9[T\xebe\xcc&r\x17N\x15\xf6]\xde^\x8e\
-<4\xa0P(`\xf9P\xdc\xbe=\x9a\x05\x8f*\x01\
-@\xc1\xddg\xd0\xb5\xe1X\xca\xb8\xaa\x22>.\x14=\
-\x0dp\x9b \xdf!#\x15\x83crF\x13\xb0-\xda\
-\x06\xfb\xa09B\xf3\x81G$\x008\x10\x92\x06E\x1b\
-\xfa*\xafu\xb4\xa3~.\xa0\xab\xcf\xb1\x0c\xd2\x9a\xb5\
-\x97\xc9z@\x8c\x8c\x0a\xc0\x17\x07|\x13@\xb7[\xed\
-x\x12\x0a:\x1a\xfd\x1c\x14\x15WY-\x08\x05\x86\xe0\
-0&\x9c318*\x00hz\xd5A]\x15\x01\x1e\
-\xd0\xe0\xee\x15V\xa2\xd1O\x80\x5c\xaeHL.\x84\x1d\
-\x86XO\xdf\x0b\x18&B\x13$\x01\x00l\x9c\x93[\
-\x0c\xf8AS\xa5\x1f\xca\x80O\x0d41\x01`\xa5\x8f\
-\x1e\xd7\xc2\xa9\xce4\xd8\x07\xa9\x18Lgj\xb2\x03\xc8\
-\x02\x80\x81A,<\xe224\x09\xc8\x04\xa8\xe9\xfeA\
-\xc9\xd7\xf2J\x1b_\xbe\x1b\x1e\x16\x12\x0e\x0a\x85\xb2\xb7\
-w\xb8\xba\xa6%\x8dU\x0c\xdd\x10\x96\x02\x9e\xf3\xed\xc2\
-\x92\xd3>\xe8\x89\xe3\x0a\x10x\xfc\xa4n\x97\xf7\xb9\xd9\
-\x16\x81p\x07\xe1c\x09\x94\x1c\xd6GB\x05v\xf78\
-\xed\xba%\x0ev\x12\x0e\x13\xbe-\x81z\xee\x02z\xd8\
-\x91LX\x01\x8a\x1c\x8b\x09\x05\x08<\xabh\x8a=\x93\
-\xbfc\xcf\xcfP\xd5\xa1{XX\x87\x80A\x8d\x84*\
-\x06u\xc6\xd7/1)\xa5p\x22j\x15p\xfc?\x19\
-\x9cg\xf0\x93\xf6,\x9d\x00\x00\x00\x00IEND\xae\
-B`\x82\
-\x00\x00\x03\xb1\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\x00\x00\x00\
-\x09pHYs\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7o\
-\xa8d\x00\x00\x03FIDATXG\xed\x96]H\
-Sa\x18\xc7O\xd1e`\xab\xfb\xba\x0a\xa2\x92\xbe\xa0\
-\x88\xf2\xb2\xab.\x82n\xbb\x09\x22\xa8\xa0\xc2\xcc\x9cT\
-,2?r\x96\xc5\x96\x8a\xb6\xd2Llen5+\
-\xd3j\xa6\xce\xb6L\xe7\xfc\xa8\xb6\xd9t:\xa7n\xf3\
-p\xac\xb5\xb9\xedl\xff\xde\xf7lT\x8a\x90V\xc7\x10\
-\xfa\xb3?\xe7=\xe7<\xcfy~{\x9e\xf7\xc0a\xfe\
-\x8bJ&\x93-\x93\x16\x94m\x93\x16\xaavH\xe5\xe2\
-\xfb\xbc\xf2\xce\x8e3y\xa5\x1b\x12\xe5\x19&Uve\
-e\x86\x5c\xf5U\xa6\xa8\xc2\xb9\xc2\x0a\xd1\x9dU\xa2\x86\
-4\xbf\xac3Q\x9ea\xa4\xb9E\x12\xa9\xfc&w\xee\
-Z\x052\x0bT\xa2\xfb\x82\xb2\x0a\xa4\x9e)Q>\x0e\
-\x90!\xbf\xc9\x9e-,\xa77D\xb7Lq\x17\x19\xf9\
-e\xc6Dy\x86\xc9-\xaa\x92\xa4f\x17\xb3\xa99%\
-8~Q)\xba\xd3\xf3U8\x95]\xfc\x03`\xef\xde\
-\xa3\x922\xf5SV\xfb\xa2\x0d\xb5\x0d\xad\xa2[\xa77\
-AQ\xa9\xf9\x01\xc00I\x92>\xdb \x8b\x05TK\
-{\xf7\xcf\x00\xab%\x9d}\xf6\x05\x05x\xd9\xd6\xf9\x1f\
-`\x11\x00L\xf8\xa3\xf8\xe4\x89\x08\xeb`8\x86\xf7\xee\
-0>\x10\x7f\x1c\x9d\x9bi,\xcd\xa1\xb935'\x00\
-\x9a8\x19\x88\x0ak\x9e\x1cX\x02\xc4~\x9d\xa7IN\
-$\xfe\x88iZ\x1c#\xf8\x1c\x8c\xc2\xcd\xf1\xc2:\x14\
-\x89\xc19\x11\xc1\xd0<Msh\xeeL-\x0e\x001\
-\xb586\xe1?\x7f\x0d\xc5\xd4\x9c\x00h\xdb\xc3|\x9c\
->F\x0et3\x09&\xd7f5\xb9G\xe3\xc9\x0f\xb3\
-t}\x9a^\x18:~\x0d\xe0\xfd\xcc\xc3JZI\x15\
-\x08\xc5`\x19\x0e\xa1\x9b\xb8\xc75\xbb\xbb\x87B\xb0z\
-xx\xc9\xd4\xdc_Bp\x8e\xda\xf1\xc9a\x04;l\
-@\xd0gA8\xe0\x13\x9eE\xd5d4\x8b7\x02\xd6\
-\xd5\x0e\x9f\xed\x11\x8cm\xf5Pi\xf4(y\xd8\x82G\
-\xcf\x1b0\xfc\xbe\x0e\xe3\xf6zD#~\x8cx\x03\x7f\
-\x1f \xcaOa\xa8W\x0b\xcee\x80\xde<\x82\xd3w\
-Gp\xa9\x9eGnC\x0c'*\xbd\xb8\xaes\x82\xf3\
-\xf6\x83s>G\xaf\xa5\xb55Q\x9c\xea\xcf\x01\xf8p\
-\x00\x03]\xf7\xf1\xc5g#\xa3\x8b!\xbd\xc2\x8e\x82\xc6\
- \x8e\xe4<\xc4\xc1\xccR\x98]\xc0\xc5\xda1<6\
-y\xc8\x86\x8a\xc0aV\x8f\xdd\xce\x5c\xbe\xee\xaf\x00D\
-\xf90\x06\xbbk\xe0\xe7\x86\x85s\xbd\xd9\x8d\xf3\x1a\x0e\
-i\xca&\xac\xdf\xb2\x13\x9b\xb7\xa7\xa0R\xadE\xd1\xeb\
-\x10\xe4\xb5\xfdB\x0c\x95\xc3\xf2`\xe0;@\x8f\xd5\xe1\
-O\x5c\xff-\x8d\xdb\xea\x10\x9d\x22\xff\x8e\x88\xb6_\x00\
-\xb8\xd1\x84\xe4m\xbb\xb0n\xe3V\xec9 E^C\
-\x18W\xb5\xb3\x00l\xda\xb4o\x85\xa6\xd1\xe00\x7f\xe8\
-gi'\xe6\xe3w\xbdVv\xc05\xcez|\x13\xac\
-\xb9Y\xc5!4\x0a6\x00\xa4\x97\xdb\x84\x11\x1c\xcb\xd3\
-\xe0@\x9a\x02\xb9\xda\x11\xa4W\x8f\xe1I{\x1cr\xd0\
-R\xed\xfc>\x02r\xbe$\x89@0I\xc9\x12\xda\x8d\
-\xf9z7\xf9\xac\xafj\xe1$\x0a\x85b\x95A}\xe8\
-\x82\xdf\xd3\x81.g\x10\xd2{c\xb8\xf4\x8cG^#\
-\x90Y3\x09\xd5+\xfa\x1aN\xc2nR6g\xedg\
-\xd6\x08\xc5\xc5\x90\xe6\xf2\xda\x94\xf1\xbe[:\xd3\xdbf\
-\xef\xed\xc7o\x22\xa5Zc\xacN\xdf\xeaw[u\x16\
-\x8b\xee\xf0I\x12\xb24\x1e\xc90\xdf\x00\x1f\xdf\x96\xad\
-bR\xfd\xaf\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x04\x83\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00 \x00\x00\x00\x17\x08\x02\x00\x00\x00\xe5g\xda\xb6\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\x00\x00\x00\
-\x09pHYs\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7o\
-\xa8d\x00\x00\x04\x18IDATHK\x95UoL\
-VU\x18\x7f.\xd0\x02\xb6\x8a%\x05/\x82Q\xb40\
-x\x11\xd8j\xfda\xd9V\xb6\xb9\xd5\xd6\xc6\x12\x94\xde\
-\xb5>\x951i\xe6j\xd3\xb2\x0f\x91h\x0eE0\x1a\
-\xf4\xaa\xf4\x96\xb3\xe4\xbf\xf9\xc1h\x19\xb0R\xc7\x8aj\
-5\x03\x01\x9d_\xc8\xa1\xac\xa2x\xef\xff{\xce\xd3s\
-\xeey\xb9\xf0^E\xe8\xb7\xdf\xee}\xce\xb9\xcf\xfd\xfd\
-\xee\xf3\xdcs\xcf\x05\xcey4\x1a\xd5\x5c\xa8.dp\
-\xfd\x8c\x0c\x08\xba\xa6\xa3\x83\xc8\x10mqtL'\xaa\
-\xfa\x15d\xac\xeb:Huo\x96\xb00\xe3\x86\xc1l\
-t\xf6\xd2\xd4\xa5\x89\xc9\x89\x89\xc9\x8bc\x93c\xd33\
-\xd7HH^\xf5\xe0\xa6\x8b\x19\x90\xd1\xf2\xc1\x1d~\xe6\
-\xe2\xf7\xb9\x8d+\x1e<\x92Q\xd0\x16\x084\xa5n?\
-\xb5\x0d9\xca\xab\x0b\xd5%\xfe\xb7\x01\xf5\xa4\xff|\x7f\
-f$18\x9aT4rKf\x1fT\xf7\xbc\x22\x0d\
-\xd4\xb9\x1ad\xa6\x04\xc8\xb17Kgn\xa9\x88*r\
-\x97\x140q\xd1K \x83\x81\xdf\x07\xb2#\xc9\xc5\xa3\
-\xc9%#)+\xbf\x82\xad'\xb6 \xbd\x0e\xc3\xa6\x1c\
-\x0f2\x99\x02Q\x817E\x07f\xab\x17\xa6\xf4-'\
-\xccM\x9dVU\x97\x15:n\x1d\x1d\xd6\xb9\xad\x9a:\
-\x19;Wg\xfeX\xff\xc9\xda\x87\x9a\x0b\xf2{\xd2H\
-\xbd\xe4|\xca\xea\xc1\x94GZ\x0b\x9f>Tvt8\
-B\xdd\xf3\xa4<\xc4\x0c\xe4\xc06\xd4\xe9\x7f\xb5\xdc\x06\
-\x06\xaf#Ts\xc1\x1a\x0e;\xf9\xc8\x15\x0dm\x91c\
-\x99f\xf8lKNSb\xd1\x8fI%#\xa9\xc5\xbf\
-\xa6\x96^H]\xd5\x0e\xeb\xc2%\xe3W\xc7ms\xbe\
-\x08J\x96\xc7X\x8b$\xa8'\xdd\xbf\xe9\xb0\x13\x95\x87\
-\x99r\xab`B\x90A=\xcfmf\x85a\xe7\x81V\
-{u\xabSz\x04\xd3\xebO\xdew\xf8\xf6\xe2\x9f\x13\
-J\xc7S\x0a\xbf\x81;\xeb\xd6\x7f=\xfa\x17u)\xea\
-J\x13br.\xe2* \x83\xcf~2\xe9\x91\x95\x1c\
-\x06\xc0\x05\x13\xb8\xf2\x0c\x83\x10\x83J\x0e\x15\x1c6\xb8\
-\xac\xc0\xd4\xca\xd3\xf7\x1fXQ\xd4\x07\x81\xd7\xcaa\xb3\
-V\xd0\x8c\x86\xa1R\x95\x96\xe1w\x887@52\xac\
-\xc3;\x5c\xc9\x9d3\x10d\x908\xc7\x04\x97\x0a\x07\x05\
-\x93\x82\xfdi\xa1jH6a-\xc2.\xd6?\xa6]\
-\xf9S\x9b\x9e\xd1\x1c3\xa6'Oq\xab\x88\x0c\xda~\
-\xd0\xe1m\xae\xdc\xe3\x1a(<\xe19\x96\xb1\x8be\xbd\
-\xcf\xb3j\xfd\xcc|\x173w`\xe0=\xcc\xaa\xe3\x81\
-z\x9e\xdf\xc8\x82M,\xff\x80s\xee\xb2N+E8\
-\xb8\xb2\xc2@\xaa\x13\xc8 <d\x08\x83U\xaeA1\
-+9\xc6_\xfa\x12\xabzn\xcan\xac\xea\xc4\x17\xda\
-\xb1\xaa\x0b3\xf6\xe2\xa7\xc3\x06\xb5Z\xaa\x13\xe2>4\
-2h\x192a\x07W\xb2\x85A\xf2\xab\xac\xbc\x177\
-v\xe0\x86\xf6\xa5Y\xd1\x8e\xcf\x7f\x8e\x05\x07i)\x8b\
-\xd5\x18S\xf4\xaf\x22T\x9b\xce\x19\xb0\x9d+\xe9\x0cn\
-cy\x1f\xf2P\x8f_h1\xd2\xe3\x17}\x84\x9b{\
-\x0d\x12\x91j\xb1\x0a|\x06\x0dgM2\x80;\x18<\
-\xc1\x9e\xea\x10\xb7\xf9\x84\x16#ef\xef\xe3\x83\x13\x06\
-:\xf3\x8a\xc2@\x9e\xe4\x98\x0c\xf6\x9f1\xe0-\x0e\x01\
-\x96\xf6\x06\xab\xe8\x15\x85\xfb\x84n\xc8\xca\x0e\x5c\x17\xc1\
-\xc7?\xb6,#j\x88\x8du\x1e\xfe\x0a\xf6}g@\
-\x0dB\x99\xb3\xa6\x85\x87\xba\xfdB\x8b1\xd4\x85y\x8d\
-\xf8\xc1\x80I\x0a\x0b\x05E\x05>\x83\xbd\x83\xc2 \xa9\
-\x86=\xfb\x05n\xec\xf4\x0b\xdd\x84\xf76\xb0\xf1)\x8d\
-Y\xf3\xfd\x90\xf0\xb7h\xf7\x80\x05\xdbx`?\x7fq\
-\xd9\xdd\xdf\xd4\x89\x8f\x86\xb1\xfc\x98E\xfb\xae|\xb5R\
-M\x06\xb1\x0a\xe4\x91\x0cjO\x9b\xb0\x15\x9fl\xe3/\
-\xf7\x8a\xf7\xb6\x1cR\xe6\xcaz<\xfe\x8bI\xcb\xdf\x83\
-p\xf0Z\xe4\x8d\xe9\x11\xfaFux\x93\xafi\xc6\xb2\
-\xc3\xf8\xd8\xa1\xa5Iiy\x0d\x18<hG\xb5\xa8\xa9\
-K1\x01\xa9N\x88k\x91\xae\xa9\xf4\x95\xd7~k\xe4\
-\xeca\xe9\xbb\x9d\xbb\xf7,\xcd\xbb\xea\x9c\xd2&{\xe8\
-\xb2\x86\x0e\xe9\xc4D\xa5\x9a\x0cb?}\x09\x9a\xa1\xbf\
-7\xd5\xf1\xcf\xacvmF\xec\x5c\xd7Q\xf5\xcf\xfc\xad\
-\xd1\x0e\x8a\xb6\xb8\xd7U\x987 \xa8\xaa\xfa\x1f\x01\x01\
-\xa4\x83u[w\x00\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x07{\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
-\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
-\x00\x00\x00\x19tEXtSoftware\
-\x00www.inkscape.or\
-g\x9b\xee<\x1a\x00\x00\x07\x0dIDATX\x85\xc5\
-\x97Il\x1ce\x16\xc7\x7f\xef\xab\xea\xcdn\xdb\xe9\xb6\
-\xe3q\x1c\xdb11m\x07\x05\xc5\x09K4\xc9D\x80\
-f\xc4\xa2DB9p\xe4\x80\x10 \x84\x10R\x0e\x13\
-\x0e a\x09D\x16\x89\x1c\xb8\xc0\x81+B\x82\x03\x17\
-\x92\x81d2\x08ec\x11\x0e&\x13[J<\xce\x82\
-\xdbY\xecv\xa7\xbb\xdd]\xd5\xdd\xb5\xcc\xa1\xaa\xab\x17\
-[s\x8b\xe6\x93J_-\xaf\xde\xff_\xff\xf7\xbe\xf7\
-\xbd\x12\xd7u9(\xb2\x17\x98\x00\xc6\x810\xf7wT\
-\x80)`\xe2\xa8\xeb\x9e\x90\xbf\xc3\xde\xaeX\xec\xf8\xdf\
-\x1ez\x88\x1dCCDt\xfd\xbe\xa2\x97-\x8b\x8b7\
-orzf\x86\x9ca\xec\xd3\x81\x89\xbfn\xd9\xc2\xf8\
-\xc6\x8d\x5c\x99\x9fg>\x93\xa1jYk\xbe,\x22h\
-\x22(\xa5\xd0\xfcC)\x85&\x12\x9c+\xa5P\xbeM\
-\xeb\xac+E\x22\x1e\xe7\xd1\xa1!\x5c\xd7\xe5\xeb\x8b\x17\
-'t`||p\x90\xab\xe94\xf9\xe1aR\xaf\xbe\
-\x8a\x16\x89\xac\x85\x8e\x00J\x04DP\xfe=%\x82\xf8\
-\xcf\xa4\xe5\x9c\xc6\xfb\x00\xd5*\xa53g\xc8\xcd\xce2\
->8\xc8\xd7\x17/\x8e\xeb@8\xaci\xa43\x19R\
-\xaf\xbd\x86\x1e\x8f\xaf\xc6np\x12\xea\xea\x22\xdc\xddM\
-(\x91@\xeb\xea\xc2\xb2m\xccL\x06)\x14\xd0VV\
-pVV\x02\xb5\xa4u\x0e\x85\x88?\xf1\x04\xf9\xcb\x97\
-Y\xe7\xe1\x84u\x00\xd7u\xa9\xda6\xaemc\xf9\x0e\
-Z\xc1\xe3##$w\xedB\x8f\xc5V\x11\xec\xec\xef\
-\xaf\xc7\xb8X\xe4\xc6\xe9\xd3$\x0b\x05\x10\x09\xd4\x0bf\
-\xc7\x01\x11\x5c\xd7\x05  \x00`\x15\x8b\x88\xa65\xc7\
-<\x16\xa3\xf7\xa9\xa7\xe8\x18\x1d]3/ZG\xa4\xbd\
-\x9d\xd1\xe7\x9f\xe7\xc6\xe4$29I\xbbRup\x11\
-\xc4qP\xad\x04\x1c\xff\xc2.\x16\xc1' @|x\
-\x98\xfe\xfd\xfb\x095\x84\xc5\xb1m\x96\xe6\xe7\xb937\
-\xc7\xdd\xb99\xda\x22\x11\x12CCt\x0f\x0f\xd3=0\
-\x80\xf2\x017=\xf2\x08\xc5\xcd\x9b\xb9\xf6\xd5W\xf4W\
-*\x01\x01\xd7qPJ\x05\x98\x1e\x01\xc7\x01\xa0\x9a\xcf\
-#\xa1\x10J\x04=\x1e_\x05~\xed\xb7\xdf\xf8\xd7\xa7\
-\x9f\xb2)\x14b}<\xceH,\x86R\x0a\xb9q\x83\
-\xdc\xf7\xdfs+\x12\xa1o\xff~z\xb7l\x01\xa0}\
-\xdd:\x1ex\xe1\x05\xa6>\xfa\x88-\x89\x84\xa7\x80\xeb\
-\xa2D\x02L\x05`\xfb\x17\xb7N\x9e\xa4\xba\xbc\x8c]\
-*\xd1\xbfo_\x00^5M\xfe\xf1\xf1\xc7\x9c;r\
-\x84?\xb7\xb7\xf3@{;\x1d\x80k\x9a\xb8\x86\x81k\
-\x18D,\x8bd\xa9\x84\xf5\xc5\x17\x5c\xff\xf2K\xaa\xe5\
-\xb2G\x22\x91`\xfds\xcf\x91\xcbf\xc14\x11\xd3D\
-D\x02L\xd5\x14\x82\x5c\x8e\xa5\x1f~\xa0cd\x84u\
-\xdb\xb7\x07_~\xea\x93O\xa8^\xb8\xc0c==\x84\
-,\xcb\x035M\x22\x03\x03D\x06\x07q\x0d\xc3s\xee\
-\xcf\x91\xc9I\xf2\xdf|\x13\xbc\x9f\xda\xb3\x87tw7\
-\xf8d\x95H\x80\x19(\xa0\xc0\x93\xb3Ze\xe8\xc5\x17\
-\xeb\xb2\xff\xfa+7O\x9c`$\x16\xf3\x80K%\x1c\
-\xc3 \xf9\xec\xb3\xf4\xbf\xf1\x06}\xaf\xbfNa\xd7.\
-\x8c\x5c\x0e\xd74\xa1T\x02\xc3\xc0:s\x86\xc2\xccL\
-\xe0\xe7\xd1\x97_\xe6\xf2\xfc\xbc\xa7@\x83\xea\xaa\x96\x03\
-\xb5\x8a\xd6\x91J\x11N&\x83\x84;\xfe\xc1\x07\xec\xe8\
-\xec\xf4\xd8\x97J\x01\x89\xf8\xce\x9d\x81\xf3MO>\xc9\
-\xd5;w\xa0T\xf2H\x18\x06\x18\x06\xe5\xcf?\xc7\xb5\
-m\x00b]]d\xc3a\x9cL\x06Y\x95\x03\xae\x1b\
-\x94\xd3u\xdb\xb6\x05\x8e\xef^\xb9Bxf\x86h\x0b\
-8\xa6\x894T\xcbp,F\xaeP\x80\x1a\xb8i\x82\
-i\xe2\xcc\xcfSM\xa7\x03\xbb\xe8\x86\x0dT\xd3i\x94\
-\x08vc\x08\x1c\xc7\x09jyW\x03\x81\xf4\xd4\x14]\
-\x8eC5\x9d\xc6ZZ\xf2\xe4\xad\x814\x0e\xd7\x85J\
-\x05\xcae\xa4\x5c\x0e\x08\x88i\xe2\xcc\xcd\x05f\xbd\xa9\
-\x14\xf7,k\x0d\x05j!P\x8a\x8e\x87\x1f\x0e^X\
-\xf8\xfdw\x92\xa1\x90\xb7\xb6\x0d\x03{y\x19\xf7\xde=\
-\xdcb\xd1\x03m\x1c\x95J\xf0\xf5R*A>\x8f\x9b\
-\xcdb]\xba\x14\x98\xfci\xebV2\xd5*J\xa9 \
-\x07t\x00\xdb\xb6\xd1\x94BjU\xcb\x1f\x22B\x5c\xd7\
-\x83\xddL\x03\xc4\xb6\xbd\xafl\x19R.#\x86Q\xdf\
-\x90\xfc\x8d\xaa\xc5!+\xb6\xed-C?7\x14\x80\xe5\
-\x87@S\x0acz:\xb0\xdf8>N\xb1A\x9d\xc6\
-\xed\xb6u(\x1fP5\x80\x8b\x08\xa1\xb1\xb1\xc0f\xf1\
-\xf2e\x12\xe10J\x04\xab)\x04\xb6\x8d\xf8\xab\xa0\xd8\
-@\xa0\x7f\xdb6\x0a\xb5\xfch\xd9\xdbW)\xb0\x06\xb8\
-\x12AO\xa5\xea\x04\xa6\xa7Y\x1f\x89\xacV\xc0v\x9c\
-\xa0\xd10\x1a\xd6\xee\xfaT\x0a\xab\xafo\xcd\x06\xa3U\
-\x83F\xd0\xda\xa1\xf5\xf5\xa1\x86\x86\x02\x9b\xcc\xccL\x9d\
-@k\x12\x8a/o\xe5\xfau*\xd9\xac\xf7P\xd3x\
-\xfc\xfd\xf7)\xf8;X#\x89F\xa2w.]\x22\xa2\
-i\xcd!P\x8a\xb6\x03\x07\x82\xdd\xd5\xc8fQ\xe94\
-\xbaR\xab\x0b\x91e\xdbu\xe7\x22\xa4\x8f\x1e\x0d\x9c\x0f\
-\xef\xde\x8d\xb1o_\xd0\xfd\xd4\xecJ\x9f}\xc6\xad\x1f\
-\x7f\xe4\xe6\xf9\xf3\x9c?v\x8c\x91\xb6\xb6&\xf0\xf0\xde\
-\xbd\xe8\xe3\xe3\x81\x9fs\x87\x0e1\x16\x8f{\xca\x89`\
-\xf9!\xd0k\x0a\xa8Z_'B\xe9\xf4i\x16O\x9d\
-b\xfd\xd3O\x03\xb0\xfb\xed\xb7\xf9\xb7\xae\x938y2\
- a\xcf\xce\x22\xef\xbcC\xbeZeO(D[4\
-\xda\x04\x1ey\xe5\x95\x00|\xf6\xdbo)\x9f=\xcbX\
-oo\xd0\xa6\xad\x0aAk\xa2\xe5\x8e\x1d\xc3\xccd\x00\
-\x08\xc5b\xecx\xf7]\xc2\x87\x0fS\xee\xe9\xa9\xc7Y\
-)\xfa\xa2Q\xdat\xddk^6l\xa0\xfd\xc3\x0f\x89\
-\xbd\xf9&*\x1a\x05\xa0\xb4\xb8\xc8\xcfG\x8e\xf0\x97d\
-\xd2\x03o!\xa0\xd7B\x10\x0d\x87\x9bb\xec\xe6r\xdc\
-}\xef=z&&h\xeb\xe9\x01\xa0\x7f\xf7n\x9c\x9d\
-;)^\xbbF\xe5\xca\x15\xe4\xeaU\x22\x9a\x866:\
-\x8aJ\xa5\x08m\xda\xd4\xd4Q\x95\x16\x17\xf9\xe7\xc1\x83\
-l\xd74\xdaC\xa1\x00\xdcm\x0dAS\x0e4\xcc\xf6\
-\xd4\x14\x0b/\xbdD\xe4\xad\xb7\x18|\xe6\x19O2]\
-\xa7#\x95\x82\x86\xe5\xb5\xd6\xf8\xcfw\xdf1y\xf4(\
-\x8f\xe9:\x03\x1d\x1d\xf5\xce\xd8oJV\x13\x80\xb5{\
-\xf9\x95\x15\xd4\xe1\xc3\xcc\x9e=\xcb\xc6\x03\x07\x88%\x12\
-\xff\x13\xd8\xc8f9w\xe8\x10\xea\xc2\x05\xf6&\x12\x84\
-5\xad\x19\xdc\xb7k&\xe08\xb8\xb0\xe6z\xd7\x94B\
-D\xe88\x7f\x9e\xc5s\xe7\xb8\xdd\xdb\x8b\x1a\x1d%6\
-6F\xf7\xd6\xad\x80W\xe12\xd3\xd3Tfg\x89.\
-,0\x12\x8b1\xd0\xdd\xdd\x14\xf3\xc6\x7f\x84\xaam\x07\
-\x95P\x07*\xa6e\x85\x8b\xa6I\xb4\xb3sM\xf0Z\
-\xd2\xb5)\xc5\x83\xcb\xcb\xc8O?\xa1~\xf9\x05\xd3q\
-\xc8Y\x16\x09Mcs8\xec\xad\xf1d\xb2\x0e\xb8\x06\
-\xb8\x88\x90^Z\xc2\xf4\xfe\xbe*:0u\xbbPx\
-\x5c\xc3\xeb\x84\x93\x9d\x9d(\xd7E\xfc\xd6\xb9&Ym\
-\xefs\xfc\xbf\x22\xc7u\x89*E\x9b_\xd9\xc4\xbf'\
-\xae[\x07\xac\x9d\xfb\xfel\xdbf~q\x91\xab\x0b\x0b\
-\xdc.\x14\x00\xa6t`\xe2f>\x7f\xdc\x05\xca\xb6\xcd\
-\x82_\x05\xef\xd7\xb0]\x97\xc5R\x89?\xf2y\x80\x09\
-\xf9\x7f\xff\x9e\xff\x17\xc5\xd6=\x9a\xb0\xf3k\xe8\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x08\x16\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\x00\x00\x00\
-\x09pHYs\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7o\
-\xa8d\x00\x00\x00\x07tIME\x07\xdd\x0b\x07\x08.\
-\x0d\xf3\xd6\x88\xd0\x00\x00\x07\x98IDATXG\xbd\
-VYL[\xe9\x15&\xa3VU\xe7\xa1\x8d\xd4m4\
-\xed\xccC\xab\xd1Dj%B\xa3H\xd3\xa9\xfa\xd0*\
-\x1aEJ\xa2>t\x99(\x09\x9a\xe9K\xa6\xd3Q\xa4\
-i\x1b\xa4)\x13\x08LB\x08\x81\x84\xd5f\x0d\x18\xbc\
-a\xbc\x801x\xc1\xd8\x98=\x18\x03\xc1\x98\xc5a\x09\
-\x18\x8c1`\xf6\xc5\xeb\xfdz\xae\xb9S^\xc8\x04:\
-\xa5\x9ft\x10\xdc\xfb\xff\xe7\xfb\xfe\xef\x9c\xff\x5cb\x8e\
-\x82\x81\x81\x81\x93:\x8b\xe57\x12\xb9\xfc\xe7--\xb5\
-'\x01|\x93{u|hy\xd2\xfbGK\xf7\x80\xc4\
-\xfc\xc4\xee\xa4\xd8\xd6\xb6Z\x19\x8d\xa9+\xa8\xd0Y\xb6\
-U\x0d&\xafPQ/\x95\xc8\xd5\x7f&1\xdf\xe0\xb6\
-\xfco`4\x1a\xcf\xb6u\xdbZ\xed\xcf=p\xb8W\
-\xd01<\x07m\xf7\x18j[\x9eBn\xb4Af\xb0\
-Bl\xe8DMs7*Uz\xf0\x1eK\xfb\xca\x84\
-\xf2\xf7\xb8\xed_\x0f\xe6\xb6\xae\xc4>\xc78\x9e\x11\xb1\
-\xd1:\x0a\xa9\xa1\x1b\xd5z\x1b\x14\xcd\x0e\x120\x02e\
-\xf3\x10\xc4\x8d6\x14V\x9b\x91YV\x8f\x07\xa5J\xe4\
-\x0a\x1bp7\xaf\x14\xe9\xb9\xf9\xc9_\xcb\x0d:\xf9g\
-\xc3\x13\xd3\xe8\x19\x9fE\x8d\xbe\x13\x0d\xadv\xf4\x8d\xf9\
-06\x1b\xc4\xb8'\x82\x89\x85\x08\x9c\xee\x10F\xa6\xfd\
-\x18\x1c\xdd\x86\xf9\x89\x1b\xf9\x22\x13n\xdc+E\x0a\xaf\
-\x1ai9\x95\xb8\x9b\xc9\xcf\xe0\xd2\x1d\x0d\x1a\xbd\xf9\xaa\
-}\xdc\x8d'C.\xc8\x1a:`\x1b\xf5\x80L\x88\xc6\
-\xec2\xc5\xca.f|~\x0a`z9\x84Y\x0f\x89\
-\x9a\x0b\xc16\xe1G\xb6\xa4\x0b\x7f\xfbB\x80\xdb\x052\
-$\xe7\x94#\xb3\xa0\xf4\xef\x5c\xda\xc3a\xc4\xe5\xfaE\
-\xabup\xcd:\xe2\x82\xb4\xbe\x0dc\xd3k\xf0\xae\x13\
-\xe9R\x04sD8\xbf\x10\xc2\xea\xce66\x10\xc2F\
-\x18\xf0\xae\x05\xe0^\x0c\xc3\xb5\x04L,\x02\xad\xc3\x9b\
-\xc8\xaaj\xc3\x8d;eH\xe1K\x90\xfa\x90\x17\xe8\xe8\
-\xed\xfd-\x97\xfe\xe5\xd0\xb6v\x95\x0c>_\x82\xb4\xa1\
-\x15}#n,o\x02\xae\xc5\x08\x09`\xe0&\x01t\
-x\xe4\x96\x00W?\xa4\xf8\x00\xd0\x99\x19\xf8\xb6\x22\xb4\
-\x86\xdc\xa0\xf7c\x1ez\xd6\xe3EZi3\xfe\xf1@\
-\x80\xbb<!\xf2\xcb\xaal\x5c\xfa\x17\x83\x1a\xe6\x15\x9b\
-\xad\xfeU\x85\xde2\xa3\xee\x1a\x81\xc2h\xc5\x12\x91\xcf\
-\xd2\xc9&\xddaLP\xed\xa7\xe6#\xd8`\x18\xfc\xfe\
-}\x80\xdd\xc1F6\x89\xd9\x880\x98#\x01.*\xcf\
-\x0c\x85m\x22\x0ci\x8b\x077\xb3k\x90\x98+\xc4\xed\
-G%\xfe\xce\xfe\xa1\xb3\x1c\xd5\xc1 \x01'\x94j\xfd\
-ym\xfbS\x14+\xcd\xb0\x8d\xcday\x8b\xea\xee\x0b\
-\xc3Mu\x8e\xba\xe0\x09a'\x12F\xfc_\xf6\x05\x94\
-\x96\x87\xb1\x1b\x01\x16|\xe4\xd0r\x84\xca\x01\x8c\xce\x00\
--\xc3ad\x8a:\x90\x90U\x85{ER\x88\xe4\x9a\
-t\x8e\xea\xc5\x10\xd5\x18oi[\x9d(\xab\xd1b\x86\
-\x8e\xbf@\xb5_\x5c\x0f`yg\x17^\x06X\x0b\xd0\
-\x0f0\xf8\xe0\xfa\xbe\x80\xca\xea\x08\x82\x88\xc0\xe3\xf7\xc3\
-\x13\xd8\xa1=\x01\x8c\xbb\x82\xe8\x9fb 5\x8e#\xe1\
-\x81\x08\xa9yb\xe4\x16\x8a\x9a9\x9a\x17C\xa66\xab\
-E\xaa.\x94+\xf4X\xa4\xba.\x92\x00\x7f\x98A\xa5\
-\x1c\xf8\xe5\xbb\xc0\x19\x8aw(\xbe\xff\xda\xbe\x80\x9f\xbd\
-\x0d\x9c\xa5gq\xef\xd0\xfb_\x01%R*\xc7V\x10\
-\x83\xd3\x80\xa1\xdf\x87[95\xb8\xf5\xb0\x02\x8f\xf2\x1f\
-\xbbH\xfdw9\xaa\x83!V\xe8:y\x02=\xca\x95\
-z\xac\xf8\x01\xdf&\xb59u{F\xde>\xe1\xcb\x22\
-1\x9d\xc1\xbc?\x08;\x95\xc12\xbcM3A\x85\xcf\
-2JQP,b\xed\xfb)Gu0\xca\xa5\x9a\xee\
-L\xda\xc0\x17\xd5b-\x08\xacn\xb3{\x22\xc8\xe5\x1f\
-LvP\xa4fP/l0\xa0\x11\x82\xf6\xd1]\xdc\
-)\xaaG\xd2#\x01\x8a\x1eW\xbf\x5c@~\x91\xb8\x22\
-\x9d/CZ\x91\x08\xab\xbb!\xecRw\xed\xfa)!\
-]\xad\xde~\x066\x0a\xbb\x1d\xf8\xc3\x9f\xf6\x093\x1e\
-\x02\x83v\x06]V\x06\x9d\xbd\xc0\x803\x1c\x9d\x90\xc3\
-\xb3@\xdb\xc86\xee\x14khD\xabP*\xa8\x9ed\
-\x18\xe6;\x1c\xd5\xc1\xc8-\xa8\x88\xbfO\x1d\x9b\x90Y\
-\x84\xa99b\xa5\xeb\xe5\xa7\xc6\x8b\xd0\xd5c\x9bo/\
-\xc2\xb8~\x83\xf9\x8f\x00\x99\x86\x1e\xd1\xf3]\x8a\x8d\x10\
-;\x19\xe9\x16\xb8\x18\x8c\xb9i\x1eX=xP\xae\x03\
-O\xac\x83\xa2\xae\xa1\x9b\xa3y1\x9a\x9a,o\xa5\xe7\
-\x09\x82\xffL\xe3Amlc3#\x18b(\xa8\x13\
-\xa8\x1d\xd8\xeb\xc6\x92}\xf8\xd7}\x01U\xf2=a>\
-\xb2}\x8e\xc8\xc7=D>\x07<\xf3\x02\xc2\xc6\x01\xf0\
-\xa4\x06\x94\xcb\xb5\xe8\x1d\x18\xd4q4_\x0d~\x85\xac\
-\xe7^\x81\x14I\x19E\xf0\xael\xb0\x8c\x08\x93\x03\xac\
-\x0b\xc1\xa8\x13{S\xf0K\x01\xe5\xd1\xd2R\xc3\xae3\
-\xd1Y1N\xc6M\xd2,\xb0\x8eo\x80_\xdd\x02\x81\
-\xca\x04\x85F\x0f\xaf\xcf\xf7k\x8e\xe2\xaba\xb3?\xbb\
-}\x9f\xee\xed\xbf\xee\x97\xa2\xa8\xaa\x06\x0c\x13=6\x9d\
-\x91A\x80\x04\x84B\x118\x86\x03h4D\xa05\x80\
-J\x15\xc16Y\xb3\xb8\xb27\xac\xa6\xd9o\x02\x0d\x8d\
-*M/$:\x1b\xa4\x1a\x13Z\xda;\x1a(\xc5\x09\
-\x8e\xe2\xe5\xa8\x92\xa8\xb5\x8fJ\xe4\xb8y7\x0fU\xaa\
-z\xf8#\x9c\x08&\x88p$@\xbf\xb1\xb1w\xf2@\
-0\x82%\xfa*\xcd\xfb\x82XXe0\xbb\x18\x82R\
-\xdf\x8bjC\x0f\x04\xb5&\xd4j\x9b=\x81\xad\x95X\
-.\xf5\xe1\xb0\xb2\xb2\xf2f\xa1@f\xff\x22W\x80\x84\
-\xb4|\xe4<\x96\xe0\xf9\xdcB\x94\xf0K\xb0\x9a\x82\xa4\
-c{\x87>P4\xb2\xbdT\xad\xa1\xe7>T\xebz\
-\xe8\x1f\x15\x1b\x8a\x15\x06\x14\xcat$\xc62L\xcbO\
-\xd2\x0d\xf8\x16\x97\xfep\x98\x9c\x9c\xfcQ\xb1P\xe5\xca\
-\xe0I\xf1yzq4*\x15F<\x1dy\x06\xef\xf2\
-\x0aV\xb7v\xb1\xbcN\xff\x17\xcc\xaf\xa1\xcf1\x0b\x8d\
-i\x00\xc2\x86v\xd4\xb6\x0fAf\xec\xc1\xfb\x1f\xdd\xa4\
-\x11,@\xa7}\x02\xd9\xf9\x85\xf3\xc9\xc9\xc9\xb6\x99\x99\
-\x99\xd7\xb9\xf4\x87\x03\xa9\xfe\x89D\xd6\xa0\xc9\xe6\x0b\x91\
-\x9e/DJ6}Xxb\xe4\x09\x94(\xa9n\xa4\
-\x91m\xa0&k\x86X\xd3\x0e\x15}=\xeb\xcdV4\
-\x9a{(\xba\xfcye\x22\xeb\xd5\xeb\x9fBR\xa7\xc7\
-\xf5\x8f?\xc1\xb9s\xe7\x90\x94\x94\xe4\xf0z\xbd\xafq\
-\xe9\x0f\x07\xb2\xef\x95\xe1\xd1\xc9\xd4\xfa\xa6\xf6\xa9RI\
-=\xcaU\x16T\xd4u\xa0R\xdd\x0e\x81\xba\x0dJ\x93\
-\x0d\xea\x96n\x18\xda{\xd0\xa07\x87\x1c\x0eg\xd3\xce\
-\xfa\xce\xbb\xec^\xb1LY\xd5d\xb2\xe0\xda\xb5\xab\x88\
-\x8b;\x8d\x0b\x17.\x80\x9c\x18r8\x1cG\x13\xc1\x82\
-\xdc\xf86Y\xf8\x9e\xd9\xd2\xf3y\xa3\xaeU\xa7\xd5[\
-\xa6\x8d\xa6\xce5\xad\xc1\xd2Bht:\x9d\x09\x81@\
- \x8e[\xce\x0a?\xc1\xe7\xf3\x1b\xc5b1TJ%\
-\xe2\xe3\xe3ID\x1c.]\xba\xc4:1\xb8\xb9\xb9\xf9\
-Cn\xe9\x7f\x07\x22x\x95D}\x8f\xfb\xf3@\xf4\xf7\
-\xf7\xbf\x95\x92\x92\xd2,\x12\x89\xa0R\xa9\xc8\x89k8\
-}\xfa4.^\xbc\x08z\xfet~~\xfe\x07\xdc\xd2\
-\xe3\xc3\xd2\xd2\xd2\xeb\xd9\xd9\xd9N\x81@\x00%9q\
-\xe5\xca\x95\xa8\x08\xce\x89^\xbf\xdf\xff6\xb7\xf4\xf8@\
-\xe5\xf91\x89\x98`\xcb\xc1\x8a`\x9d\x88\x8d\x8d\x8d\x8a\
-HMM\x1d\xa0\x12\x1e\xbd'\x8e\x8a\xa9\xa9\xa9\xd8\xac\
-\xac,\x87P(\x84B\xa1\x88:q\xe6\xcc\x19\x9c?\
-\x7f\x1e\x89\x89\x892n\xd9\xf1\x82\xba\xff\xcd\xf4\xf4t\
-'\xebD]]\x1d._\xbe\x8cS\xa7N\x81\x9a\xb5\
-\x87[r\xfc\x18\x1a\x1az\x83l\xef,))a\xaf\
-$\x0a\x0a\x0a@}\xf21\xf7\xfa\xff\x03\xab\xd5\xfaF\
-NNN\x8dN\xa7\x93\xd3M\xfa]LLL\xcc\xbf\
-\x01\x01-\xf8\x1c\x87\xde\xe3\xf1\x00\x00\x00\x00IEN\
-D\xaeB`\x82\
-\x00\x00\x08y\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
-\x00\x00\x00\x04gAMA\x00\x00\xaf\xc87\x05\x8a\xe9\
-\x00\x00\x00\x19tEXtSoftware\
-\x00Adobe ImageRead\
-yq\xc9e<\x00\x00\x08\x0bIDATx\xdab\
-\xfc\xff\xff?\x03\x0c0222\x90\x036o>d\
-\xc8\xc5\xc5\xb1\x9e\x95\x95U\xfe\xce\x9d;>II\xa1\
-{\x80\xc2\xbf\x80\xf8?>} \xbb\x01\x02\x88\x89\x81\
-B\xb0j\xd5NEff\xe6}&&Z\xf2bb\
-\x82\x0c\xd7\xae]\x16\x07\x0a\xf3\x01131\xfa\x01\x02\
-\x88b\x07\xfc\xfe\xfd\xafASSA\x80\x8f\x8f\x1b\xc8\
-\xfe\xc3\xf0\xee\xdd;\x1e\xa00\x07(@\xd1\xd5\xee\xd9\
-sJ`\xf3\xe6\xfd\x82\xc8r\x00\x01D\xb1\x03\x80\xc0\
-^AA\x0a\xcc\xf8\xf3\xe7/\xc3\xaf_\xbf\xb1\xc6\xe3\
-\x86\x0d\x07\x04~\xfe\xfcu\x80\x95\x95}#\x90\x0br\
-$\x0bH\x1c \x80X(\xb5\x9d\x9b\x9bS\xfe\xef\xdf\
-\x7f`6\xd0r \xfe\x83\xa1f\xf1\xe2m`\xcb\x0d\
-\x0d\xd5\xf5\xdf\xbe\xfd\x08\x12\x92\x00\xe2\xe7@\xfc\x05 \
-\x80(\x0e\x81\x1f?~A-\xfe\xcd\x00\xb4\x04\x18\x0a\
-\xa8\x0e\x98>}-\xd8r`\x1a\xd1\x97\x93\x93`\x00\
-&V\x900(\x1a\xd8@\x0c\x80\x00\xa2\xd8\x01\xdf\xbf\
-\xff\x84;\x00\xe4\x18P:\x80\x81\xee\xee\xc5`\xcb\xad\
-\xad\xf5\xf5\x95\x94\xa4\xc1b\x8f\x1e\xbd\x80\x85<8\xaa\
-\x00\x02\x88\x85\x1a!\xf0\xf3\xe7o0\x1b\x14\x02\xb0(\
-HL,\x01Y\xbe\xdb\xc9\xc9\x04l\xf9\xbf\x7f\xff\x18\
->|\xf8\xccp\xeb\xd6\xbd\xcb@\xe9\xbf\xb0,\x0a\x10\
-@Tp\x00$\x04`\x8e\x01\x85\x80\xb6\xb6)\x9f\xb8\
-\xb8\xfc\x16{{#=ee\x19\xb0\xd8\x9b7\x1f\x19\
-\xb6m;\xf2u\xcb\x96\xd5\xd3\x81J\xbf\x812\x10H\
-\x0f@\x00\xb1P+\x0d\xc0\xd8\xcc\xccl<vvA\
-\xab\x1c\x1dM\xb4TTd\x81\x96\xff\x05Z\xfe\x01T\
-X}\xdd\xb4iy\xd9\xfe\xfd[\xce\x02\x95\xbe\x01)\
-\x07\xe9\x01\x08 \xaa\x84\x00(\xe8aQ %\xa5V\
-\xe1\xe6f\xc1\xa3\xaa*\x07N\x90\xaf_\xbfg\xd8\xb8\
-\xf1\xe0\xd7\x9d;W\x97\x1d9\xb2\x13d\xf93 ~\
-\x0f\xca\xb5 =\x00\x01D\xa5\x10\xf8\x03\xa6/^\xbc\
-\xcd\xe0\xeaj\xc1\xa3\xa6&\x0f\xb7|\xfd\xfa}_\xf7\
-\xef\xdfXv\xf2\xe4^\x90\xe5O\xa1\xbe\xff\x09K\x03\
-\x00\x01\xc4ByI\xf8\x87\xe1\xd3\xa7\xaf\x0c+W\xee\
-f02Rg\xd0\xd0P\x00[\xfe\xea\xd5;\x86\xb5\
-k\xf7~=zt[\xd9\xf9\xf3\x07\xb1Z\x0e\x02\x00\
-\x01D\x94\x03\x0e4h:\xfe\xfb\xff\x9f\x09XW1\
-:6\xdc8\x80\x9c\x8aA>_\xb1b\x17\x83\xae\xae\
-\x0a\x83\xba\xba<\xdc\xf2U\xabv}=sfw\xd9\
-\x95+\xc7pZ\x0e\x02\x00\x01\x84\xd3\x01[\xca4\x05\
-\x98\x99\x18&\xf0\x8a2\x07Hhs\xf0\xb3q21\
-\xfc\xff\xf5\x9f\xe1\xec\x04\x9dOo\xde\xfe\xaaro\xbe\
-5\xf7@\x93\x1a\xd7\x917\xb7\x19\xd8d\xec\xc0\x16\x7f\
-\xfd\xfa\x9d\xe1\xdb\xb7\x1f\x0ck\xd6\xec\xfdz\xfa\xf4\xae\
-\xb2[\xb7N\xe1\xb5\x1c\x04\x00\x02\x08\xab\x03V\xe6j\
-82\xb22\xae3\x0c\xe5\x13\x10\xd7bG\x91\x936\
-\xe7\xe4\xbb\xbb\xf9\xe3\x94\xd5\xc5\xca\x9c\x82\xdc,q\x82\
-\x7f\x98\x18\xa2\xd3\x02\xc1\x16\xf7\xf7/gx\xfa\xf4\x15\
-\xd0\xe7\xc4Y\x0e\x02\x00\x01\x84\xe1\x80E\x19\xea\x8e\xfc\
-\xe2\xcc\xfb\x9c\x92x\x19X9\x18\x19\xbe\xde\xfc\xc6\xf0\
-\xeb\xc3?\x06&6F\x06^\x05\x16\x06fVF\x06\
-egN\x86o\xaf\xfet\xcbXq0(=\xf9\xc0\
-\xb0z\xf5^pnx\xf1\xe4!\xc3\xef\xd7G\xfa\x80\
-\x96\x9f\x83\xa6v\xbc\x96\x83\x00@\x001\x227H\xe6\
-\xa6h\x0apq3\xde\x0f\xce\xe3\x02\x05?\xc3\x83\xa3\
-\xbf\x18n\x5c\xff\xbe\xe7\xf0\xb5/;\xe5E\xd9Dm\
-tx\xb2\xb4|9y\x98\x81\x8e\xf9\xf9\xe5\x1f\x03;\
-\x0f\xa4$\xbfq\x95\x9b\xe1\xf5\x95?\x0c\x92\x8a\xbf\x19\
-\xe6.~T\xd4\xb1\xfe\xc5\x16\xa8\xef\xbf\xe3\xb3\x1cd\
-7@\x00\xa1\x84\x000A\x17\x9a\xd81\x09\xb0\xfd\xfd\
-\xcdpy\xcf_\x86-\x87>\xf6W-{\x02\xaa>\
-\xdf\x01\xf1\xd79\x99\x8a\x1f\xc4\xd4\x99\xda\xc4\x15\x99\x18\
-\xd8A%\xf9W`\x91\xf6\xf1?\xc3\xff{\xdf\x19L\
-\x83y\x19>\xdc\xff\xcb`\xa3\xc1\xebv\xacU \xfc\
-\xdf\x7f\x86s\xdf~\xfc\xdb\xe8\xd6rk\x1f4\xcfc\
-u\x08@\x00\xa1TF\xccl\xff\xe3U\x15\xff2|\
-z\xf2\x8b\xe1\xd4\xf9\x1f{\xa0\x96\x83\x82\xf2\x11\xc8G\
-\xac\x8c\xcc\x0f?\xbf\x06\x9a\xf5\xe5\x17\x18\x7f}\xfe\x8b\
-\xe1\xd6\xb1\x7f\x0c\xf2N\x5c\x0c\x1c\xc0\x1a\x9e[\x98\x91\
-\xc1:\x98\xcf\xc32]\xc0\x5c\xdb\x83;SV\x85}\
-\xc7\x8ej\xf5i\xa0Z\x1bW\xc5\x07\x10@(\x82\x12\
-\xa2\xff\xe4\x19\xbe\xfeb\xf8\xf1\xe17\xc3\xc3\x97\xbf\xef\
-\x02\x85>\x00\xf1k \xfe\x0c\x8aKf\x06\xe6\x08\x11\
-~`\xb1\x0bT\xf3\xf9\xe5\x1f\x863\x07\x19\xbe2s\
-1\x02\xabX\xa0\xe7\xbe\xffa\xe0\x05V\xb2\x02\xe2\x8c\
-`6\x88\xd6pfgP\xd6fKY]\xa8\xda\x0e\
-\xd4\xcf\x8b\xcd\x11\x00\x01\x84\x22 \xcc\x0b\xcc\xde\xdf~\
-1\xfc\xfd\xfa\x87\x81\x89\x91Y\x14Z^\x83\xca\xd9\x7f\
-\xd3\xe25\x12e%\xfe\xf8\x0a\xb0\xfdd\xf8\xf4\xea/\
-\xc3\xf1c\xcc_\xa7n\x7fU\xf6\xe77\xd0\xf2\x1f\xbf\
-\xe1\xf8\xf3\xfd_\x0c\xef\xae\xfd\x02\xd3 \xbe\x8a)\x13\
-\x83\xb4$kN\xbc\xbd\xa8!\xd0\x1cN\xf4\xa6\x1a@\
-\x00\xa1\xa4\x81\x07\x8f\x18\x19\xac\xd4~1H\x02\x03\xcc\
-H\x91;\xa8\xc6G\x99\x85\x99\x99\xf1&\x17\x1b\x93\x85\
-\x96\xecw[s\xd5\x1f\x0c\x1f^13\x1c\xba\xcc\xfd\
-u\xc1\x81\xd7e\xebO\xbf;[\x1a\x01l\x83\xfe\x80\
-T\xc1\x8f\xaf00\x5c\xba\xfc\x0b\x98h?\xeft\xd0\
-\xe6u\xd1\xd6as\x97\xd5a`\x90Wg`0\xbc\
-\xca\xed\xbf\xf0\xe0\xeb\xebPO\xfd\x85\xd9\x09\x10@(\
-\x0e\xb8\xfd\x8c\xf9\xe8\xcbg\xff\xad\xc5\xf9~3\xf8\xe9\
-\xffb\xd0\x97b\xf5\x03\x89\x0bp\xffc\xe0\xe7\xfa\xcb\
-\xf0\xfe\x03+\xc3\xde\xeb\xfc_\x17\x1f}]\xb6\xe9\xec\
-;p>\x87\x84\x00\xb0\x10\x02F\xd2\xe5K\xff/\xfb\
-\xb4\xdf\x06\x05\xf7\xdb\xce\x0d/6l\xafV\x9f%$\
-\xce\xe0(\x0a\x0cK\x11^6G\xa0\xf8T \xfe\x88\
-\xec\x00\x80\x00B\x89\x82W\x1f\x7f\x95/:(\xf0\xf9\
-\xe5KP\x8d\xfd\x9bA\x9e\xfb\x1b\x18s\xfe\xf9\xc5p\
-\xee.\x17\xc3\xa6\xf3\x02/\xe7\x1f|\x03\xb2\xfc\x0c\xac\
-\x90\xf9\xf3\x0b\xe2\x80\x17\x0f\xff3\xec\xbb\xfcy=\xb4\
-\xa6\x03%\xdc'\xcf\xdf\xfdY\x00\x12g\xfd\xfb\x87\x01\
-\xd8h\x06\xb5\x03\xb9\x80\x98\x15\xd9N\x80\x00B\x09\x81\
-i\x07\x1e\x9c\x8a\xb1\x90\x09\x9a\xf0M\xb8FM\xe4\x9f\
-=\x17\xfb?\x06py\xf0\x81\xed\xde\xb3\x8f?v\xaf\
-?\xfbx\xeb\x83\xd7?@\x16\x83\x9c\xf8\x16\x940\xff\
-\xfc\xf9\xf7\x11\x18\xd7\xfc\xbf\x809\xfe\xfd\x97\x7f\xa0D\
-\xfb\x09\x9ah\x7f\x00\x13\xed\xf3_\xdf\xff\x82\xd3\x027\
-'3\xa8\xbf\xc0\x8en'@\x00\xa1\x97\x84\x7f\x96\x9c\
-xr\x04HG\x02\xb1\x10\xb4\xf9\x0c\xea`\xfc\x83\x96\
-h\x9f\xa09\xe33\xb4E\xf3\xff\xe1S\xa6\xcb\xc0\x10\
-\xb0\xe1\x0161e\x858\xf5\x81b\xeb\xa1\xea\x19\x80\
--t;6\xc6?\xe0\x10\xbav\xff\xdfel}\x05\
-\x80\x00B\xcf\x16\xff\xa1\x16\x81\x8a\xd0\x87\xa0d\x01\xc4\
-7\x81\xf8\x16\x10\xdf\x85\x06\xfb\x07\xe4n\x17\xd0s\x0f\
-\xdf\xbe\xfe\xcf \xce\xf5\x93AQ\x84%8\xccL\x1c\
-\x94\xda\xd9\xba\xc3U\x8d\x18\xfe\xfd\xcf\x95\xe5\xff\xc1\x00\
-\x92\xff\xf4\xed\xdf\x0b\xa8\xa3\xff![\x08\x10@\xd8*\
-\xa3\xffP\x85\xbf\x89\xa9\xaa\xdf\x7f\xf9\xbb\xe4\xe2m\xf6\
-h'\xadO\x0c\x9ez\x1fy~\xfc\xe0_\xa7#\xc5\
-w\x82\x87\xfd\xbf\xa6\x9f\xd1\x07~\xb6\xbf\x7f\x19.\xde\
-\xe6c\xb8\xf5\xfc\xfbQh\x0e@i\xb7\x03\x04\x10#\
-\x15:\xa7\xac=\x11j\x07\xc3\x8d\xdfY\xca\x08\xfc\xc4\
-\x90|\xfd\x85\x95a\xd6\x11\xc1\xcb5k\xeffCC\
-\xf5\x054\x04\xc1u\x01@\x00Q\xa3k\xf6\xe7\xc6\xb3\
-o\xe9\xeb\xce\x09~~\xfc\x92\x19R&@1\x88\xbf\
-\xec\xa4\xd0\xd7\xb5\xa7_uC\xb3\xdfG\xf4\x10\x00\x08\
- j\x84\x008\x14\x82\x8c$\x0c\xd4\xc4\xb9kUD\
-\xfe\xf9\x8aq\xffbx\xf5\x95\x8d\xe1\xdaK\x86={\
-\xaf\xbf]x\xf1\xf1\xa7\xeb\xd0\xf4\xf3\x169jAv\
-\x03\x04\x18\x00\x02%\xa9\xd2z*\xd4\xc0\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x03o\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
-\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\
-\xd4\x07\x19\x0d\x128\x82dk\x82\x00\x00\x02\xfcID\
-ATx\xda\xc5\x97Mo\xdbF\x10\x86\x9fY\xae\x12\
-@5\x10\xc7\x85\x95\x83|(\xe2\x9c\xe2\xc2@\xeb\xfe\
-\x82^\xdac\xaf\xedo\xf3!\xa7\xf6\xda\xbfaXA\
-\xdb{\x1c\xf4\xe0^\x13\xa4\x8d\xd3\x90\xdc\x99\xe9\x814\
-MZ\xa4%Z*\xb2\x80Da\xb9\x1f\xef\xce\xbe\xcf\
-\xecJ\xdc\x9dOY\x22\xc0\xeb\x8b\xbfF\xa98;_\
-\xf0\xd3\x8f?\xc8\xa6\x93\xbb{\xf5u\xf1\xea\xd2\xd7-\
-\x17\xaf.\xfd\xcd\x9b\xbf\xfd\xe7_~\xf5m\x08\x08w\
-\xbdL\xa5\x92\x7f,x\xff\xfe\x03o\xdf\xfe\xc3\xbbw\
-W\xcd\xfb\xe9tz\xb9\x0d\x11aU\x03\x09\x81\x98e\
-\xc4,\xeb\xd4\x1f\x7fyt\xb0\xb33}\xbd\xa9\x88A\
-\x01\x22\x82\x88\x10D@\x04i\xb5\xdc\xdd\xdda\xef\xf3\
-G|\xf3\xf5WO\x1f\xef>\xfas\x13\x11\xf1Nu\
-\x99\xa0\xc9\x11 f\x19\xaa\x89\xb3\xf3\x05g\xe7\x9df\
-_\xd4\xcf\x13\xe0\xe5V\x054\x91\x08\x01M\x09\x80\xef\
-\xbf\xfb\x16S\xe7\xea\xea\x8a\x0f\xff\xe6\x00\xfc\xf6\xfb\x1f\
-\xfc/\x11\xe8DC\x84,\x13\xcc \xcfs\xcaR\xab\
-\xfaP\xed\xcd\xe9\xe9\x8b\xc5\xd1\xf3cf\xb3\xd9(l\
-W\x9a0d7>Pu\x8a\xbc\xa4L\x89\x10\x02\x0f\
-&\x13&\xb1Z\xc3|\xfe\x84\xc3g\x07<=\x9cw\
->\xd7Q\x1b\xf2\xc9J\x01\x9a\x0cU%\xcfK\x8a\xa2\
-\xc0\xcc**b \x8b\x81\x18\xab!T\x9d\xfcc1\
-\x1a\xdb0\x94\x034\x19\x9a\x0cs\xa7L\x09S\xc5\xdd\
-+2B \xc6H\xcc2&\x93\xc9F\xd8\x86\xde\xf4\
-X\x87\xde\xdc)\x8a\x82\xb2T\xcc\xaa\xfd\x0e\x99\x90\xc5\
-P\xfd\x0e\x01\x11\xa9\xcd\xea\xf7\xc26\xf6\xb9\x1e\xa0(\
-\x12EQ\xa0\xea\xb5\xd1\x0c< \x04\xcc\x15\x82\x13\xa8\
-\x04\xdd\xee;\x06\xdb^\x0aR\xa9\xa4\x94\xea\x15\x81y\
-%\xc2\xcc\x08\xc1q\xab'\x0dN\x90\xac\x13\xfe\xb1\xd8\
-\xf6n\x81\xaa\xb6r\xc0R\x88\x90V\xb7\x9aB\xdc\xa5\
-\x17[\xe8\xc7vP\x80&\xc3\xeb\x01\xda\x83\xb5;\x87\
-p\x13\xee\x1b]>\x0a\xdbA\x0fx\x9f'\x82\x13\xac\
-2eSO\xa8&m\x09q\xb3AlM*\xa2\xc2\
--\xe1q\x88\x82\x95g9\xd6\x8d\x9c*f\xc3\xd8^\
-{(\xbb\x85\xe7\x92\x003\x03\xf7f\xb5\xee\x8e\x1b\x9d\
-\xd5\x0f\x9d\x19}\xd8\x82\x01\x82[\x97\x94^\x01\xcd\xea\
-E\xc0})\x1afV?;W\xaa&\x13\x96e9\
-\x0a\xdb%\x01\x22\xc2\xc3\x87\xdd\xccfz#\xc4\xdc\xab\
-07B\x8cX\x9bJU\x9bD\xb4.\xb6\x8d\x80*\
-Y,6\xbe\xe16\xd8\xea2\xb6\x8ev\xb0\xed\x08\xa8\
-\x8f\xca\x93u':=}\xb1\x98\xcf\x9f\x00P\x16\x09\
-5c\xef\xf1^s.,G\x01\xdc\xa4\xd7\xe0\xed-\
-X\xfb6s\xf4\xfc\x98\xc3g\x07\x98:EY\xa2\xaa\
-L\xe2\x03>\xdb\x99\x8e\xc2v\xd4\x85\xa4]f\xb3\x19\
-\xfb\xfb\xfb\xcd\x99\xd1&g\x08\xe3\xdb\xd8\xae}\x1fX\
-U\xee\x8b\xedV\x04t\xb0\xedIbwa\xbb\xd1\x16\
-l\x03\xdb\x8d\x04l\x0b[\x00\xb9\xce\xd7\xf7('\x9b\
-N\xee\xee/\xe5S\xff=\xff\x0f\x8c\xa9X\xb11\xf7\
-\xc6\x8b\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x09\xa3\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
-\x00\x00\x00\x04gAMA\x00\x00\xaf\xc87\x05\x8a\xe9\
-\x00\x00\x00\x19tEXtSoftware\
-\x00Adobe ImageRead\
-yq\xc9e<\x00\x00\x095IDATx\xdab\
-\xfc\xff\xff?\xc3@\x02\x80\x00b\xa4Ds\xe7\xb4\xa3\
-\x86\xcc\xcc,\xe7N\x1d\xdd,\xbdjQ\xcbk\xa0\xd0\
-oR\xcd\x00\x08 &J\x1c\xc0\xc4\xc4\xdc\xaf\xa2 \
-\xc8\xa0\xa0\xac\x9b\x0d\xe4\xf2\x0313\xa9f\x00\x04\x10\
-\x93\xe5\x94'\x0f\x8c\x9aN\x98\x03\xd9l\xa4\x84H\xf7\
-\x8c\xe3\x85:\xea\xa2\xf6\x1e\x0eJ\x0c\x82\xc2\x92I@\
-!A f%\xd5\x01\x00\x01\x04\x0c\x81\xff\x8cl\x82\
-\x92k\xc4m\xe3\x14\xcb\x1aW\xaa\xb6O>h\x04\x0d\
-\x19\x9c\x8e\xe9\x98rX\x91\x83\x9d\xb5\xde\xd1J\x9e\x81\
-\x9d\x8d\x99\xc1@[Z\x22\x22\xa1\xce\x11(\xc5Ej\
-\xb4\x02\x04\x10\xd3\x9f\xef\x9f\xa7\x0b\xf3\xb2\xcb\xc4\xa5\xd6\
-\xdc\x10\x15\x97;\xcd\xc2\xca\xbe\xaf\xb8v\xa9\x0fP\x8e\
-\x1d\x97a\xcc,\xac\xfd@\x9f\xf3\x83,\xff\xf7\xef?\
-\x03(\x1a\x94\xd4\x8c\x02\x80R\xdc@\xcc\x02R#\x97\
-z$P6\xf9\xf0F\xe9\xf8=S\x80\x5c\x0e\x5c\xd1\
-\x0d\x10@\xcc|J&\xb7\x19\x84\x94J|\x8d\x04\x19\
-\xbe>\x7f\xc7\xce\xc8\xc8\xc8\xc1\xc9\xc5c\xff\xf1\xc3\xeb\
--\xcf\x1e\xdf\xfa\x04T\xf3\x17YC\xd7\xf4\xe3\x81\xf2\
-2\x02\xf5\xb6f\xb2\x0c\xa0\x0c\x04r\x80\x90\x00'\xc3\
-\xfd\xa7?U\xd9\xd9y\x8e\xc5\xa5\xb5\xc4x\x04\xe7\xac\
-y\xfb\x8b9^ZZ@\xfd\xc5\x9b\x9ff\x0cLl\
-;\x7f=?\xfb\x06\xa8\xfd\x0f\xba\x03\x00\x02\x88\xf9\xcd\
-\xd9\x8d?\xa4\x9c\xd3\xd4EE\xf8t\x04\xff|c\xe0\
-`eb\xe0\xe4d\xe7\x95\x94\xd1\xd2>\xb0k\xc9f\
-\xa0\x9a\x9f@\xfc\x0f\xa4\xb8g\xe6I\x01\x0ev\x96\x03\
-\xc1\x9e\xea\x1c\xec\xec,\x0c\xa0,\x0cr\xc0\xdf\xbf\xff\
-\x80\xf8?\x83\xbc\xb2v\x98\xbb\x83\x9a\x8d\xb4\x18\x0f\x07\
-\xeb\xd7\xcf\x0c\xd6V\x8a\x0cW\xef\x7fb\xf8\xfc\x83\xe5\
-\xff\xb7\xdb\x9b\x8e\x02\x8d\xf8\x013\x0b\x06\x00\x02\x08\x14\
-,\x7f\xff\xfe\xfc\xb6\xf1\xe4\xfdo\x0cR*\x12\x0c?\
-\x7f\xfea\xe0\xe7eg\xb0\xb3\xd2t(\xaa]R\x0c\
-\x94\xe7\x81\x05\xdf\xff\xff\xff\x1a\xac\x8c\xa5\xf9\xf9\x80\xf2\
-0\xcba\x0e\xd0P\x11f\xf8\xf2\xe57\x83\x10?\x07\
-\x83\x92,?\x03\xd0\x1f\x0c/\xaf\xdecp4\x97f\
-`\xe4\x96\xf4\x06j\xe7\xc3\x96H\x01\x02\x08\x9cm\x9e\
-\xef\x9dyK\xc8!;QY\x86\x8f\x8f\xf3\xfb\x17\x06\
-6\x16&\x06a\x01\x0e\x06\x11Q1\xeb\x7fL\xfc\xc7\
-\xaf^<\xf4\xb8k\xfa1\x1by\x19\xc1\xe9.\xb6\x0a\
-`\x8d0\xcba\x18\x94\x1e\x9e\xbe\xfc\xc2\xc0\xc7\xcd\xc6\
-\xc0\xc1\xce\xcc\xf0\xf3\xf7?\x86\xe7\xcf?1\xc8\xaaI\
-2\x1c\xbd\xf0\x96\xe7?\xb7\xe2\xa3\x9f\x8f\x0f\x5c\x81\x86\
-(\xbc\xf4\x03\x08 X\xbe\xfd/n\x97\x22\xfe\x8f\x99\
-\xddZ\x89\xf7?\xc3\xd7\x8f\xdf\x18~\xfe\xfa\xcb\xe0\xe3\
-\xac\xc2\xf0\xe1\x07\x9f\x03\x0b+\xcfAy%\x9d%\xfe\
-\xeej\xfc\xdc\x5c\xacP\xdf3@}\x0fq\xc0o\xa0\
-\x85<@\xcb\xaf\xdez\xc3 '\xc5\xc7 \x08\x0c\x89\
-\xcb7\xdf00\x03C\xe2\xe3\x7f6\x86\xc7/\xffp\
-\xfd\xb8\xb3v+\xd0\xaeo\xc8\xe9\x0a \x80`)\xf3\
-\xdf\x8f7\x0f\xe6_|\xf0\x95\x81IH\x00\x1e<\x8f\
-\x9f}b\x08\xf2\xd4\x96\xb4v\x0c\xdbim\x22+'\
-&\xcc\x85\xe4\xfb\x7f`\x1a\xe4\x18\x88\x83\xfe1\xc8H\
-\xf00<\x7f\xfd\x15\xe8\xf8?\x0c\x1c\xc0\x10\x11\x11\xe2\
-d\xf8\xf6\xfa=\x83\x83\x99\x14\x030\xaf\xdb\xb0\x88\x1a\
-ICs\x17\x1c\x00\x04\x10<k\x5c\xeb\xf3\xbd\xf3\xf7\
-\xfb\x97\x1d\xd7\xdf\x81\xc2\x05\x120w\x1e\xbcg\x00Y\
-jc*\xcb\xfb\xe3\xd7_\xacA\x8f\x8c\xbf\x7f\xff\xcd\
-\xa0\xaa(\xc4\xf0\xf0\xe9'\xb0\x83t\xd4D\x18\xfe\xfd\
-\xf9\xcb \xcc\xfa\x17\x1c\x22\xec\xaaQa\xd0\xb2\x02^\
-b\x02\x04\x10r\xde\xfc\xfb\xfb\xeb\x87\xc5\xc7o~b\
-\x10\x94\x15ax\xf5\xe6+\xc3\xa7/\xbf\xc0Q\xa1\x0d\
-4\xe8\xea\xcd\xd7\xe0l\x07\xf31r\x22\x84\xe1\x1f?\
-~3\xe8k\x8a2\xdc~\xf0\x01\x1cER\xa2\xdc\xe0\
-\xb4\xf1\xe9\xf1\x0b\x06g[y`bT\x08GO\x8c\
-\x00\x01\x84\xec\x80\xffW;m\xd7\xbc~\xff\xed\xc9\xd3\
-\xbf@\xd7\x02\xb3\x19(G\x80,\x06\xa5zY`\xbc\
-\xdey\xf0\x0e\xc5Bd\xc7\xc00\x130}\xb1\xb22\
-3|\xf9\xfa\x0bXW00(\x02s\xc4\xef/\xdf\
-\x18LuEA2\x12lZy(%&@\x00\xa1\
-\x97N\x7f\xfe|\xff\xb2\xec\xd4\xed\xcf\x0cL\xdc\x90\xf8\
-\xbe\xf3\xf0\x03\x98\x06\x87\x020\x81\xe1\x8b\x02\x10\xfe\x0a\
-\xb4\x18\xa4\xf6\xda\x9dw\xe0\x10SW\x14\x84\x04\xef\xdb\
-w\x0c\x96f2\x0cL\xfcZ(%&@\x00\xa1;\
-\xe0\xdf\xcf\xb7\x0f\xe7_\xb8\xf3\x91\x81A\x80\x9f\x01\x16\
-\xef\xaf\xde~\x03\x17\xb7O\x9e\x7ff\xf8\xf4\xf9'^\
-\x07\xfc\xfe\xfd\x97AQ\x86\x0f\x9c%A|.\x0e\x16\
-p\x08~\x7f\xf1\x9a\xc1\xca\x5c\x8e\xe1?\xab\x88'\x93\
-\xa0!<1\x02\x04\x10F\xf9|oN\xd8\x9d??\
-\xbf\xed\xb8\xfe\x16\x18\xa7\xd0\xccr\xee\xf2\x0b0\x0d\xac\
-\xfd\x18n\xdc}\x8b5\xe8aQ\x02\x09\xc6\x7f\x0c\x9c\
-@\x8b_\xbe\xf9\x06N\x8c\xa0P\x00%FY`\xec\
-\x0b\x09r20\xca\x04E@C\x81\x19 \x80\xb0U\
-\x10\x7f\xff\x02\x13\xe3\xb1+o\x19\x84dD\x18>\x02\
-}\x0cJ\x88 l\xa4#\x0e\xce\x19\xd8|\x0eq\x08\
-0\x5c\x81\x85\xd8\x8b7\xdf\xc0\x06\x89\x02\xb3!H\x0c\
-\x14\x22 \xf0\xe3\xcd{\x06\x17'\x15`\xd5$\x07O\
-\x8c\x00\x01\x84\xcd\x01\xff\xef\xcep_\xf3\xea\xed\xd7'\
-\xaf\xff\xb3\x83\x13\x22(\xd8A\x16\x83\x82\x92\x9f\x8f\x1d\
-\x5c>`s\x04\x08\xf0\xf2q2\x1c?\xf7\x94\xc1\x5c\
-_\x1cQW\x00}\xaf\xae$\xc4\xf0\xf3\xed{\x06\x0b\
-c)`e\xc0*\xc1 \x9f\x0eN\x8c\x00\x01\x84\xab\
-E\xf4\xe7\xdf\x8f/\xcb\xce\x00\x13#\x8f0\x1f8G\
-\x80\x12 \x08h\xa9\x8a0<{\xf5\x05#\xf8A\x80\
-\x87\x87\x9d\xe1\xdc\xd5W\x0c\x12\x22\x5c\xc0\xb8g\x85\xcb\
-\x83\x00H\x0c\xdc\x06\xfc\xfc\x11XI\x01\x8bs^\x0d\
-pb\x04\x08 \x5c\x0e\xf8\xf7\xf3\xfd\x93\xf9G/\x02\
-\xf3>\x1f/\xb8L\x00gI\xa0#\x14\xe5\x04\x19\x9e\
-\xbd\xfc\xcc\xf0\xeb\xf7?\x94\xe0gbbd\xf8\xf6\xf3\
-\x1f\xc3\xc3\xc7\x1f\x18tT\x85\xe1Q\x02\x03\x12\x22\x9c\
-\xe0\x10\xfc\xf9\xea\x0d\x83\xb5\xad\x12\xb0\xfd%\xea\xc9\xc0\
-\xa7/\x0d\x10@8\xdb\x84\xcfV\xc5\xdd\xf9\xf7\xeb\xc7\
-\xb1\xb3O~3\xb0\x09\xf2\x01\x0b\xa5\x9f\x0c'\xcf?\
-\x05\x17\xb3\x8a\xb2\x02\x0cO^|B\x09z\x11\x11\x1e\
-\x86\xe3g\x1f3\x98\xe9\x89\xa3\x84\x0e,d^\x7f\xf8\
-\x09\xf6\x047\xb0\x08R\x14c\x03\xaa\x07\xa6A\xc9\x80\
-\x08\x80\x00\xc2\xd7\x88\xfc\xcf\xa9\xe0p\xe3\xf63\xc6P\
-#S9v\xae?\xdf\x19\xfe\x02-\x7f\x0d\xcc\x92\xa6\
-\xfa\xd2\x0c\xe7\xae<c\x90\x11\xe7\x03[\xc2\xc5\xc5\xc6\
-p\xf7\xd1\x07\x86\xff@\xc7\xc8J\xf2\x81}\x0el\xd8\
-0pp\xb22\xdc\x7f\xf2\x99\xe1\xc8\xd9g\xc0\xdc\xf3\
-\x8e\x81\x05X3}\x03\x16\xd7\xa0\x12\x8aUX\x90\xe1\
-\xca\xd5\x0f\x22\x00\x01\x84\xb7\x15\xfb\xe5\xfa\x86\x17\xecr\
-\xb6\xcf/?\xf8\xefoe!\xcf\xc0\xf4\xe53\xd4g\
-\xff\x18~\xff\xf9\xc3\xc0\x09L\x1b\xa0\xec\xc6\xc2\xc6\xc2\
-p\xfa\xc2S\x06C-qp.`\x02\xd6%\x17\x81\
-5\xe1\xd13O\x81Y\xf1+\xc4Rp\xf6\x02V\xdb\
-b\x22\x0c\x7f\xf9\x85\x18.^~\xc9p\xef\xfeG!\
-\x80\x00b$\xa2\xdf\xc0!\x1a\xbcn\x8a\x9c\xbcLR\
-\xa1\x1f\xb0q\xf1\xee-\xb8\xae\x12\x03\x06!(o\x9b\
-\x1a\xc8\x02S\xfdc\x06%`\xda`\x02\xfa\xec\xfa\x9d\
-\xb7\x0c\xb7\xee\xbfg`\x03\x16\xc7?\xa1\x05\x19#\x0b\
-3\x03\xa7\x94\x04\xc3\x8b\xef\xcc\x0c{\x0f\xdeg8z\
-\xf8\x1e\x03\xc3\xaf7'\x18>\x9c^\x0b\x10@\x8cD\
-\xf6\x1d\xb8E\x826\xed\xb16S2\x0b7\xe4`\xf8\
-\xfb\xe5\x0b\xd07\x7f\x19XY\x18\x19t5$\x81Y\
-\xf4-\xd8\xf2\x97\xaf\xbf\x01}\xcf\xc4\xf0\xf5\xdb\x1f\x86\
-\xbf\xc0\xe8`bgg\xe0\x92\x93f8u\xf5=\xc3\
-\xee\xbd\xb7\x19\x1e=\x00\x06\xc7\x8f'{\x18^n]\
-\xcd\xf0\xee\xd8\x03\xa0\xb9\x9f\x00\x02\x88\xd8&4\x13\xa7\
-f\x94<\xa7z\xcc\xc5\xc4Pm^c\x9eO\x0cL\
-\xc0h\x00E\x050\xaa\xc1\x09\x91\x91\x09\x14\xbf\x7f\x19\
-\xfe\x00\x83\xf9?\x17\x0f\xc3\x07&n\x86\xfd\xa7^2\
-\x1c>t\x8f\xe1\xdb\xe7\x0f\xf7\x18>_\xdb\xc0po\
-\xc2\x16\xa0Y_A\x16\x03\xf1G\x10\x1b \x80Hi\
-\xc3\xb3p[6\xdb\xf3\xc9\x98\xef)N\xd0b\x90\xf8\
-\xf1\x0a\x1c\xff\xff\xfe\xfd\x05W\xbd \x8b\xff\xf1\x091\
-\xdcx\xcb\xcc\xb0s\xdf=\x863\xa7\x1f\x03\x1b_/\
-\xf60\xbc9\xb0\x96\xe1\xe5\x96\xab\xa0$\x05\xb5\xf4\x13\
-\xb4U\xf4\x0b\x94,\x00\x02\x88\xd4\xbe!;\x8f\xc3\xdc\
-J\x11)\xf9\xfa\x86\x02S\x06.6&p\xe3\xee\xdb\
-\xa7\xaf\x0c\x07\xcf\xbfc\xd8\xbe\xeb.\xc3\xeb\x17o^\
-\xfd\xff\xfah\xf7\xffG\x0bV3|\xbb\xff\x0a\xc9\xb7\
- \x07|\x87\xf6\x1f\xe1-c\x80\x00\x22\xd5\x01 \xf5\
-\x5c\x5c\xf6\x8b\x16\xfdg\xe6\x0d\xfa\x0fj\x96\x01[\xc4\
-\xa0\xec\xf7\xff\xc7\xfb\xcb\x7f\xdf\x9d[\xff\xff\xfe\xcc}\
-\xe8\xc1\x0cm\x88\xfeAn\x8c\xc2\x00@\x00\x91\xd3;\
-\x06%J^ \x16\x07b\x01X\xbd\x0emh~\x87\
-Z\xfc\x09\xca\xfe\x85\xde\xb1A\x07\x00\x01\x06\x00MU\
-x_,\x92\xe0`\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x07G\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\x00\x00\x00\
-\x09pHYs\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7o\
-\xa8d\x00\x00\x06\xdcIDATXG\xadWiL\
-\x15g\x14\x9d\x1fM\x13\x1b\xd1\xb8\xfd\xa8&D\xe2\x06\
-\xb4\xfc\xb0\x89yV\x0d!\x08\x9a\x88\x10\xa2\x89\xfe\xf1\
-\x0f\xa411jM\xcb\xa6\xe2\x13\x1e\xb2\xc8\xf2\x1e\x15\
-\x08\xa8h4\x88\x84\xc5%1JX\xb4Uq\xd7\xe2\
-\x8e\x8a\x80\x8a,\xf2\xd8\x5cXD\x96\xd39\x977v\
-@\x9e@\xda\x9b\xdc\xcc\x9b;\xccw\xcfw\xee\xb9\xf7\
-\x1b\x14\xcd\xee\xdc\xb9\xf3]cc\xe3\xdf\x1d\x1d\x1dh\
-ii\x19\xb7\xb7\xb6\xb6\xe2\xc3\x87\x0f\xa8\xac\xacL\xb4\
--9>;s\xe6\xccO\xbd\xbd\xbd\xa0\x0d\x0c\x0c\x8c\
-\xdb\xfb\xfb\xfb\xd1\xd7\xd7\x07u\x03\xbd\xe5\xe5\xe5\xdbl\
-\xcb\x8e\xddrss\x17k\x00\xb8\xd8x\xfd\xd3\xa7O\
-\xe8\xec\xec\x14\x16\x9a\x9b\x9bQVV\xb6\xc5\xb6\xf4\xd8\
-,''\xc7\xc0E\xfe\x93\xf5\x01\xad\xcd\xad\xe8\xea\xee\
-Bmm-.\x5c\xb8\x10h[~t\xcb\xca\xca2\
-\xf4\xf4\xf4\xc8:\xe5\xcf\xca\x91X\x98\x08s\xb1\x19\x96\
-\x12\x8b\x5c\xf3.\xe5!\xb54\x15qEq\x88/\x8e\
-\x87\xb9\xc4\x8cc\x7f\x1d\x83\xb9\xc8\x8c\xc8s\x910\x9d\
-3!\xb38\x13e\xb7\xca\xa4$d\xf3\xe5\xcb\x97(\
---\x1d\x1b\x08=\x80\xf8\xc2x(\xbf*P\xc2l\
-\x1e\xa2`e\xf2J(;\x15\xcc6\xce\xc6\x0c\xe3\x0c\
-\x899F9B\xd9\xae\xc0-\xca\x0d\x8b\xa3\x16C\x09\
-R`<e\x945hd\xb4\xa6\xa6\x06\x85\x85\x85\xa3\
-\x838|\xf8\xb0\xe1\xe3\xc7\x8f\xf2bRI\x12\x94P\
-5q\x84\xcd\x8d\x0a\xfc\xd2\xfd\x06\xaf\x16?,\xda\xbb\
-H\x809F\xab\x00\xc2\x15x$y`\xady-\x94\
-\xdf\x14\x84\x14\x84\xc8\x1a\x9a\x91\x8dW\xaf^\xa1\xa8\xa8\
-\xe8\xeb \xf4\x00\xf2/\xe5\xc3\xff\x0f\x7f\xf8\xa6\xfb\xc2\
-?\xdd\x1fk\xd3\xd7\x22\xeaX\x14\x22\x0a\x22\x10V\x10\
-\x86\x1d\x05;\xb03\x7f'\xf6\xe4\xee\xc1\xae\xbc]\x12\
-\x0b\xc9\x0bAhv(\x0e\x9d>$\xbb\xae\xaf\xaf\x17\
-\x7f\xf3\xe6\x0d^\xbf~\x8d{\xf7\xee\xe1\xe4\xc9\x93\x01\
-\xb6t_\x9a\x1e@Ji\x0a&\xee\x98\x08\xb7\x047\
-\xcc\x8c\x9d\x09\x87p\x07\x98N\x98\xe4\x99\xdeZ\xea[\
-\x80\xc1W\x06\xad\x1f\xa8\xa9\xacAEE\x85\xd4_\x9d\
-\x09x\xfe\xfc9n\xdc\xb8!\xb1\xeb\xd7\xaf\x0f$$\
-$\xcc\xb1\xa5\x1cj\xfb\xf7\xef7tww\xcb:\x14\
-\x99\xf2\xbb\x02o\x8b7f\xc5\xcd\x92\xdar\x97\xc3M\
-\x1d\x5c\x226\xbd\xd5\xd5\xd5\xc1j\xb5JK\xb6\xb7\xb7\
-\x8b?y\xf2\x04\xcf\x9e=\x93\xbf\xcf\xc8\xc8XjK\
-9\xd4\xf4\x00\xb2/f\xc3#\xc1\x03\x9e)\x9eX\x91\
-\xba\x02\x9e\x16O\x98\x0b\xccB\xa5\xe6LDZ\xab\xab\
-\xab\x87\xc4\xee\xdf\xbf\x8fG\x8f\x1e\xc9\xce\xb9k&\xbf\
-v\xed\x9a0B\x00j\x9e\x9fm)\x87\x1a\x01tu\
-u\x09\x80\xcc\xf3\x99p\xde\xe3\x8c%\x96%pKr\
-\x83K\xac\x0bb\x0ab\xd0\xd6\xd6\xf6y\xf4\xf27\x13\
-444\x0c\x89\x91v\x8a\x8e\xc3\x88\x09\xa9\x01\x02\xa2\
-\x1e8\xaeSSSG\x06\x90\x96\x96f m4\xf6\
-\xba\x12\xac`C\xf2\x06L\x8e\x9c,\xbfC\x0bB\xe5\
-\x99\xdeF*\x81F\xbf\xde\x98\x98\x00\x19ONN\xb6\
-\x0f\x80\x07\x11\xed\xe0\xf9\x83\x98\x175\x0f\xeb\xd2\xd6a\
-a\xd2B,\x88^\x80\xe8\xfch\xb4\xb4\xb6\xc8\xce\x98\
-\x84\x8b>~\xfcXv\xa6\x8f=}\xfaT\xe8fB\
-\xc6\x19c9x%\xc3\xaa\x08G\x07p\xe4\xc2\x11x\
-&zby\xdarx\xa5y\xc1+\xd9\x0b\xe6\x13f\
-\xd4\xd7\xd5K\xad9f\x99\xf8\xee\xdd\xbb\x9f5\xa0\xc5\
-\x1e<x \x82\xa3\x1e\xf41\x8d\x81\xaf\x02\xe0AB\
-\xdb}v\xb7\xd0\x1e\x94\x19\x84)\xa6)\xd2\x05!\xf9\
-C\x07\x0c\x8dI\xb4\xe9\xa9YSS\x93\x1cHzc\
-\x8c\x00\xb8\xc1\xd8\xd8\xd8\x91\x01\xa8\xb51\xbc\x7f\xff^\
-^8Pz\x00\xd3\x22\xa6a\xf5\xbe\xd5p\x8as\xc2\
-\xd4\x88\xa90\xe6\x19\xd1\xf9~\xb0\xb5(\xb6w\xef\xde\
-\x09\xdd\x14\x99\x16\xe3\xfb\xa4\x9b\xc0\xde\xbe}+\xb43\
-\xce\x18KD`c\x02\x90\xf3g\x0e\x5c\xf6\xb8\xc0q\
-\xaf#\x5c\x13\x5c\xe1\x1a\xe3\x0a\xd3q\x13j\xabke\
-1:\xa9\xbfu\xeb\x96t\x82>\xa6~\xd8\x08\xe5\xbc\
-'@v\xc5\xed\xdb\xb7\x05\x00A\x9bL&\xfb\x00\xf8\
-\x07\xb4\xd8s\xb1R\x02\x7f\x8b?\xbe\x8f\xf9^\x0e\x9e\
-\x90\xdc\xc1\x12\xf0\xa3CS>\xc5FZ\xf51\xee\x9e\
-t\xf3 \xe2de\x9c1\x96\x81l\xd8\x05\x90\x98\x98\
-h m\xb4\x94\xe2\x148\x18\x1d\xb0&y\x0d\xe6\xee\
-\x9d\x8bI\xc6I\x08\xcf\x0dGoW\xaf\xd0H\xa6(\
-(\xeeN\xab\xad\x16\xe3\xce\x99\x90\xf7\x5c\x8f\xcfx6\
-h:0\x1a\x8d\xa3\x03\xc8*\xc9\x82o\x92/\xdc\xf7\
-\xb9\xc3'\xd5G\x0e&s\x8e\x19\x95\x15\x95\xd2z\x1c\
-,\x9cpW\xae\x5c\x91i\xc8{\xd2\xce+c,\xcd\
-\xc3\x87\x0f%\xc6\xeb\xd5\xabWE+,\xc3\xf6\xed\xdb\
-\xed\x03\xa0\x980\xa0\x9e\x05g\xd5\xb3@=nW&\
-\xae\xc4\x94(\xb5\x0b\xd4\xa398'\x18P\x05\xcf^\
-\xe6\xae8\xb6\xc9\x00{]c\x85\xcf\xa8\x03NG=\
-+/^\xbc\x90\xa1E\xb7\x0b@U\xa7\x815\x82Z\
-\xca\x8c\xa2\x0c(;\x14\xac\xb7\xac\xc7\xf4\xa8\xe9\xf2\xd1\
-\x11\x94\x1d\x04\xa8\x03\x8e\xc9\xa8\x15&\xa0\xc84uk\
-\x00\xaa\xaa\xaa\xa4\xf7\x87\x03`\x8c\x1e\x1c\x1c\xfcu\x00\
-}=}8^|\x1c>I>\xf0\xda\xe7\x85U)\
-\xab\xe0\x97\xec\x87\xf8c\xf1\xa8\xb8_!\x94\xd3I\xef\
-\xc5\x8b\x17E\xe1\xfa\xd8\xe5\xcb\x97\xe5\xf8\xe5\xa1\xc4\x18\
-\xaf,\x0b\x93s`m\xdb\xb6\xcd>\x00\xf6\xed\xc0\xa7\
-\x01\x98N\x9b\xe4\x1b\xc0\xb0\xd7\x80Y\xb1\xb3D\x90a\
-\xd9a\xe8\xb0v\x88\x98XOR\xcf\xc5y\xf0\xe8c\
-\xd4\x01Y 3Z\x8cz\xa10\xd95\x9b7o\xb6\
-\x0f\x80*e\x9d\xc3O\x85K\x1bnI\xda\x82I\x91\
-\x93\xe4\xf7\xd6\xac\xadR\x02\xd2\xca\x12\x90Z.\xccD\
-\xfa\x98\xd6\x05Z\xa9\x18c\x17p\xf7\xd4\x87]\x00j\
-\x7f\x0a\x80\xde\xee^d\x16fbY\xdc2\xf8\xa4\xf8\
-\xc0\xc3\xe2\x01\xf7\x04w\xc4d\xc7\xa0\xf2Q\xe5gu\
-s\xa7\xea\xb7?\xd4\x7fB\x86\xc4\xa8\xf8\xe1]\xa0~\
-\x09\x09(\x82\xdb\xb8q\xa3}\x00\xa4\xab\xfdm;\xac\
-\x8dV\xb4\xd5\xb7\xc1Z7xmohGCm\x03\
-\xaa\xaa\xabd\x17\x9aS\x5c\xdc\xddh1\xde\xb3\xc38\
-5\x03\x03\x03\xed\x03 \x9d\xd4\x81\xb5\xc9*\xb5k\xb6\
-\xfe\xeb|6\x16\x97\xf7Fp\x02 \x1bv\x01\xf0\x90\
-`\xbdX;v\xc3\xff\xe5LLg[R3\x01\x01\
-\x01\xcbl)\x87\x9a\xb7\xb7\xf7\x8fj\x0b}\xa4XX\
-+\x0e\x19\x9e\xeb\xecuR\xa7M@\xad\xb6l1~\
-\x0fP\x03<\x80\xd8\x8e\xac=[\x905\xe7w \xf5\
-\xc0\x16\xa4Vn\xde\xbc\x89\xa3G\x8fv.]\xba\xf4\
-\x07[\xca/\xec\xdb\x09\x13&\xf8\xba\xb8\xb8lrv\
-v\xfee\xb8\xcf\x9f?\x7fD\x9f3g\xce\x88\xee\xe4\
-\xe44\xdc7988\xacR\xf3|3\x98\x8e\xa6(\
-\xff\x00\xd5`@\x13\xee18\x86\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x087\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\x00\x00\x00\
-\x09pHYs\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7o\
-\xa8d\x00\x00\x00\x07tIME\x07\xdd\x0b\x07\x08/\
-\x09\xed\xa0}\x88\x00\x00\x07\xb9IDATXG\xbd\
-ViL[\xd9\x19e\xd4vZ\xa9U5\xd3\xf6W\
-\xd5\x1fU\xd5\x9f\x9dQ\x12e\xda&\xa8\xfd5\x93P\
-u\xbai2M\xd5,RT\x8dTM\xab\xe9\xb4\x0a\
-\x9d\xb4\x99\x92!$\x81\x84\x01B\xd8W/\x84\xcdx\
-\x07/\x801\x9b\x17\x0c\x18\xb0\x09\xe0\x98\xcd\x0b6;\
-\xd8\x06\x1b\xbc\xbd\xd3\xefy^\xfa\xa7\xd0\x92\xa8\xf4H\
-\x9f\xee\xf3}\xf7\xdds\xee\xf9\xbe{\xaf\xd3\x8e\x0a\x00\
-_\xb9u\xeb\xd6+f\xeb\xc4od]\xaa\xd7\xb0\xbd\
-\xfd\x0a\xf7\xea\xf8`2\x99\xbe\xd6g\x1e}\xbf\xdb0\
-\xa2\xd3[l\xc1N\x835\xdce\x1c\x83\xbc\xdb\x18\x97\
-\xa8{\xc3\x12\x95\xce%lS>\xea\x1d\xb0\xbc\xcd}\
-\xf2\xbf\xc3\xd0\xf0\xe8\x1fLc\x93\xfe\x19\xdf&\xc6]\
-\xeb\xd0\x8f-@e\x9c\x86Xg\x85\xa8s\x04\xcd\xda\
-!<\xee4@\xd4e\x04O\xa4By]s\x87q\
-\xd8\xf8=\xee\xf3\x17\xc7\x13\x91\xe8\xe5~\xd3\x88\xc2\xe1\
-Z\xc1\xe4\xe2\x1a\x94\x03\x13h\xd2\x0c\xa1U;\x0ei\
-\xcf\x14d\xfa)\x88\xbb\xed\x10(\x86P\xda\xd8\x8d\xfb\
-\xd5R\xe4\xd7JQ\xc0\x93\xe1nq\xf9\x1e\xbf\xa9\xed\
-\xd7\xdcT\xcf\x0f\xa7\xd3\xf9\xc5\xbe\xbe\x81\x8e\xb9\x95-\
-\xe8\xc7\x1dhQ\x1b\xa0\x1b\x9a\x85m>\x84\xa7\xbe8\
-\xe6V\x18\xcc-'\xe1\xa0\xe7\xa9\x85}\x8cM\x86\xa0\
-\xea\x9fGN\x85\x14\x7f\xba_\x87\x9c\xb2fd\xe7W\
-3U\xbc\x96w\xb9)\x9f\x0fj\x9dA8\xeb\x0b\xa2\
-\xcb8\x05i\xa7\x053\x9e\x10\xfc\xdb\xc0\xd2&\xe0\xdd\
-d\xe0\xd9\x0a\xc3\xbd\x19\x87k\x0bp\xafE\xe1\xf1\xc7\
-\xf1\xd4\x9b@\xafm\x1b\x1f\x97\xa9\xf1\xc1]>n\x97\
-\x8bp3\xbf|\xa7A\x22y\x83\x9b\xf6h0\x8c\xda\
-\xde\x1b\x9d^@\xcf\xf04\xa4Z\x0b\x966\x12)r\
-\xefF\x12\xbe\x0d\x06+D\xe8\xdd\x88\xc0EB\x5c\xab\
-\xd4\xb7\x1e\x85\x7f\x9d\x81{\x1dp\xac\x00\xed\xe6ed\
-\x95(\xf1\xe1\xbd:d\x97\x09QT\xc9s1\x0c\xf3\
--n\xfa\xff\x0c\xdab\x9f\xd3\xf4[\x5c\xa6)7\x9a\
-\xda\xfb\xb0\xb8\xb2\x87\x95\x00\xe0YK\x92\x10\xc0\xcf9\
-\xe0\xa6g\xef\xb3 r\xef\xdag\x02XG&\x5cQ\
-\x88\xf4.|T(\xc6\x8dB\x01\xee\x95\x09\xa0\xd4\xe8\
-\xcb9\x8a\xc3A*\xbf*\xee\x90\xffXm\x9a@\x03\
-\x15[\xbf\xd5\x89\xcd0YL\xab\x9a\xf5R\xde\x97\xe2\
-X\xa4\xbc/\x10\xe1\xe2j\x02\xee\xe5\x049@\xb5@\
-\xc4\xac\x88%j\xdd$p\x81\xc4\x0c<\x89\xa1R1\
-\x8d\x0f\x1f4\xe0f\x11\x0f\x05\x95B\x9a\x05\xdf\xe0\xa8\
-\x0e\x06\x0d\xf8B\xab\x5cS\xa4\x1d~\x8ajI\x0f\x5c\
-\xeb\xec\xea\x19Zu<e\xbf{\x95\x9c R\xef\x1a\
-\xb7rj}~J\x07\x89Y&b\x1f9\xc3\xf6{\
-\x88jb\x01P\x8d\x06q\xb3LIN\x08\x90W\xd1\
-\x00\x9bm\xea'\x1c\xd5\xe1hU\x0c\x8c\xb5\xaaF!\
-\xd2\xf6cs\x17X&\x01\x1b\xc1\x08|Q\xb27\x09\
-\xac\xee\x13\xf1\x1e\xad2FD\x09`-\xf2\xd9\xefE\
-j\xe7i\xcc\x22\xc5\xd2F\x0c3\xee\x04,\xb3q<\
-j1!\xf3\x81\x00\xb9\xe5Mh\x16w\xdc\xe0h\x0e\
-\x06\x9b\x82\x16Y\xdfn)_\x03\xd5\xe0(\x02D\xb6\
-\x16\x04V\x88h\xeb\xa3,D\xce\x9eE\xf4l:\xf6\
-\xcf\x9cE\x84b/\xfd\xd9\xeft\x84\xbfO}?L\
-G$\xfdGpM{0I\xa9\x19w\x01M\xddN\
-\xfc5_\x88\x9cb\x01\x1a\x9a\xe4b\x8e\xea`\x90\x80\
-\xaf\xd77\xab\xf7\xf2J\xdb\xd0e\x9e@\x88V\xb9\xb9\
-\x1b\x079\x8fp\xc6\xcf\x006KG\x08\xa7y\x06v\
-J\x85\xcd\x0d\xc8\x0c\x1e\xdc\xf8\xb4\x01\xd9T\x07\xcd\xad\
-\xed#\x1c\xd5\xc1`\x05T\xf0e\xb1\xac\xfb|t\x0c\
-X\x10f\x80@$\x09*l\x84\x7f\xf9.\x98\x03\xc8\
-\x9e\xc5\xbf\xde\xbdD\x02\x0c\xb3\xb0S}\xd8\xbd\x80\xc2\
-\xe4\xc3\xc7\xc5-\xb4\x13\x1a\xd1&\xd5\x0csT\x07\x83\
-x\xbeTP\x22\x9c\xfb{~=\x1a:z@\xce#\
-B\x02\xc2\xfb\x0cvf\xdd\x08Zm\x08S\xecZ\xed\
-\xa962jCt\xc4\x86 \xb5\x9b\x16\x1b\xd6-v\
-\xac\x9a\xedp\xba\xc2\x98\xf6&1\xe5\x03$\x03n|\
-R&A1\x1d\xcf\x0a\xa5F\xc4Q\x1d\x8e\x82\x12\xbe\
-,\xbb\xec1\xf2j\x9a\x10\x8d\xc5\x91\x88%\x11\x8d2\
-\xa0\xda\x02\x95\x04\xa8\xd6\x10\xa2`]\xa1\xb3)\x15\xec\
-3\x1b\xb4\x13\xe1\xa5\x81N\xda\x05\x0e\x0f\x83i? \
-TO\xe2S\x9e\x1au\x22-\x8cF\xe3\x1d\x8e\xe6p\
-\xd4\x0b\xc5\x7f|P\xd5\x82\xebwK0=\xef\xa1i\
-\x81X\x9cA<N-YB\x86 \x94L\x22@\xcf\
-A\x8a\x00\xc3`\x8b\xdeo\xef0X\x0f\xd2aDg\
-\x80\x93\x88\x1dK\x94\x02\xda&\xa5M\xbd\xa8h\xd6\xa0\
-M\xa5\x87\xdf\xef\xff\x0bGs8V\xb6\xb6^/\xa9\
-\x17\xe1o\xb9U(\xe5\xb5\x81\x16\x95B\x82\x88\x92\x14\
-\xfb\x14,1+&A\x11%1\xdb\xf1$\x82;\xb4\
-c\xb6\xd9\x03*\x09\xe72mG*B\xb5\xd9\x85J\
-Q/\xea\xdb\xd4Pu\xf5\xb0\xc6\xbd\xca\xd1\x1c\x0ev\
-\x90\x5c3\xa8\xcb)z\x8c\xeb9\xa5\xd0\x0d\x98R\x02\
-\x98\x94\x14\x06{I\x86\x1c\x89!\x9ed\x83R\x93`\
-\x10\x8a&\x10\x081X\xde\xa0\xcb\x89\x1c\xf0\xd0\xa14\
->\xbf\x83\x1a\x89\x01\xcd\x9aa\xb4*;1\xe3p\xdc\
-\xe3(\xfe;\x02\x81\xc0\xab\xe5\xb5\xcd\x81\xec\x22!\x89\
-(D\xdf\x885%\x82\x15\x90d\xa2\xe4F\x14\xfb\x89\
-\x18\x221\x12D\x85\x11\x0a'\xe9\xbcH\xd0E\x15M\
-\x9d\x1b\x8e\xc5 \x84\xb2~\x88\xf5VT4*`\x1c\
-\xb6.\xd1\x0e\xfb27\xfd\xd1`\xb2\x8c\xfe\xaa\xa8\xba\
-\x11\xff(\xa8C\xe6\x9db4+\xbb\xb0\x1d\xa2\x8b\x81\
-\x03\xeb\x07\x9b\x82}\x12\xb0C\xdd\x9b\x94\x02\xdfv\x12\
-\xa6I/\x84\x0a\x03d\xfd\xe3(\xe0K\xd1\xa8\xea\x87\
-Jo\x94\xb0[\x9c\x9b\xfa\xe8\x18\xb6MeV\x08\xe5\
-\xc8.\xe0\xe1\xc6\x9dr\xdc.\xe2C\xd1m\x82s\xd1\
-\x83\x8d\xc0\x0e\xb6w\xf7(\xef\x11\xcc\xb9\xb7`\xb2.\
-@LWw\xa3\xda\x84\xf6\xa1\x19<jP\xe0\xa7\x97\
-\xdf\x87@\xd9\x8b.\x835z\xe7^\xdez^^\x9e\
-\x80t\xbf\xc4M\x7f4<qx2\xf8\x0dROa\
-\xf9c\xdc~(\xc0-J\xcb\xfd\xca&\x945\xc8Q\
-#R\x83'\xe9\x82@\xd6C\xff\x98L\x90\xeb\x86\xa1\
-\xd0\x0d\xd1\x8a\x87\xa03\x8cl|\xf2\xe0Q\xe0\xf7\xd7\
-\xb3\xd0\xd6\xde\x897\xcf\x9d\xc7\xc5\x8b\x17QTT\xc4\
-\xe7\xa6>:\xc8\xbe\xd7L\xc3\x13\xaa\xc7\x12M\x98/\
-\xe9D\x9d\xa4\x1f\xf5\xb2\x01\xf0(\xcfB\xe5 Z;\
-MP\xe8\x8d\xe8\x1a\xb4@\xd7k\x0c-\xcc\xba\xa5\xf4\
-\xcdw\xe7=\xfe7\xda\xb5:{K\x9b\x04o\xbd\xf5\
-&N\x9e<\x89K\x97.\xa1\xb0\xb0\xb0\x96\x9b\xfa\xf9\
-@\xf6}{\xca\xe1\xf8\x9dNo\xae\xeb\xd6\x0fY\xb5\
-\xdd\x83\x81n\xbd)\xd0\xd7ozj6\x9b\xe5.\x97\
-\xeb\x03\x1a\xf3\x1dnx\x9a{f\xe6\x9b\x0f\x1f>\xdc\
-\x91H$\xa8\xa9\xa9AFF\x06N\x9d:\x85\xcb\x97\
-/\x83\xfay\xdc\xb0\x17\x07[Xl\x10\xe9\xcb\x5c\xd7\
-\xbfA.\x91\xfc<;;{S.\x97\xa3\xb6\xb66\
-%\xe2\xc4\x89\x13\xb8z\xf5*+\xa2\x92\x1bv\xbc\xd0\
-j\xb5\xef\x14\x14\x14$\xc4b1\xaa\xab\xabq\xee\xdc\
-\xb9T:\xae\x5c\xb9\x82\xe2\xe2\xe2\xea\x17\xda!\xcf\x8b\
-\x8e\x8e\x8e_\xe4\xe7\xe7C*\x95\xa6D\x9c?\x7f>\
-\xe5\xc4\xb5k\xd7X\x11\xb5\xe4\xe2\xe7\xb9\xa1\xc7\x07r\
-\xe2jnnnL&\x93\xa1\xaa\xaa*\xe5\xc4\xe9\xd3\
-\xa7q\xe1\xc2\x05\xf0\xf9\xfc?s\xc3\x8e\x17D\xfe\x0e\
-\x89\x88*\x14\x0a\xd4\xd7\xd7\xe3\xcc\x993\xa9\xba\x18\x1c\
-\x1c,\xe4\x86\x1c?\x94J\xe5o\xb3\xb2\xb2v**\
-*\x90\x99\x99\x09\xda%t\xa92?\xe0^\xff\x7f \
-\x10\x08\xde\xa6Z\x18\xb2\xdb\xed\x22\x22\x7f=---\
-\xed\x9f\x9b\xff'\xdd\x92\x10\x92u\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x01q\xb1\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x02\x80\x00\x00\x01\xdd\x08\x06\x00\x00\x00\x8d5\xc8\x97\
-\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
-\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95+\x0e\x1b\x00\x00\xff\xb2IDATx^\xec\
-\x9d\x07`\x1c\xc5\xf5\xc6?\x9d\xa4S\xef\xb2\xdc{\xef\
-\xd8\xc6\x9d\xdeK(\x09%\x10\x08\xf0'\x09\xa4\x03!\
-@ \xf4\x1aJ\x08\x84P\x03I\xe8\xa6\x1a\x03\xc6T\
-c0.\xe0\x82{\xef\xb2-\xd9V\xef\xba\xa6\xff\xfb\
-\xde\xdeJg\xb9\xc9\xb6\x5cy?{uw\xbb\xb33\
-\xb3\xb3\xb33\xdf\xbc)\x1bU'\xe0\x87\x0eS@\x92\
-!$_<\x88\xd2\x9f\xfe\x80\x1f>?7\x1f\xaak\
-jPVV\x86\x92\x8a2\x94\x96\x96\xca\xf7\x0a\x94W\
-q\xabD\x95\x1c\x0b\x06Cr\x1e\x10\x15\x15%\x1b?\
-\xe9\xa9a\x18\x86a\x18\xcdM\xa8N\xeai\xa9\xb3\xa5\
-\xc6\x95\xefuRg\xd7!6&\x1a)\xc9)H\x8c\
-\x8bGJB\x22\x92\x93\x92\x90\xc8M\xbeg\xa4\xa7\x22\
-%)\x19^\xaf\x17\xf1\xde8D\x8b\xdb\x98\xe8\x18D\
-E\xaa\x1f\xcf\x0f\xaf\xe2\xfe\xe1\x09@\xbd\xda\x86K\xe6\
-7n\xbeZ\x1fJ\xcaKQ\x5cZ\x82\xf2\x8arl\
-.,@Ii\x19**+QVY\xe18\x92\xfc\
-\xc1L\x93\x14\x9f\x80\xf8\x84x$'&!!.\x0e\
-q\xb2%\xc43S\xc5 .6N\x85\xa0a\x18\x86\
-a\x18\xcdO\x8d\xaf\x06\xc1@@E`\xad?\x80`\
-0\xa8\xc6\x98\xea\xeajT\xd7T\xcb>\x1f\xaa\xab\xaa\
-\x10\x08\x85P\x17r\x04\xa276\x16)Rg\xa7\xa7\
-\xa5#5%\x19\x19\xf2\x99\x9e\x9a\x82\xb4\xd4t\xa4\x89\
-p\x8c\x13q\x18\xae\xe6\x1d+\x0e\xa5\xd1a^\x97\xff\
-`\x04 /\x93\xad\x85\xf0/\x04$\xc3T\x88\xb0[\
-\xb7~\x036\x16\xe4\xa3\xb0\xa8\x18\x9bD\xf41\x03\x05\
-%\xd3$\x8a\xc0KKJ\x91\x96C\x06\xb2\xb32\x91\
-!\x99$5%E\x84^\x82\xb44b\x10#-\x08\
-o\xac\x17\xd1\xd1\xd1\xd2p\x88\x82\xc7\xe3\xd1\x9c\xe3\x89\
-\xa2-\xd00\x0c\xc30\x8c}AH\xeah\xc2z]\
-\xb7\xf0\xbe\x80\x88B\xddBA\xf9\xf4\xc3\x17\x10a(\
-B\xb0\xb4\xbc\x14E\xc5\xc5(\x96msQ\x11\xaak\
-k\xb5\x97/\xc6\x13\x85\x84\xc4d\xb4\xcc\xceB\xfb\xd6\
-m\xd0&\xa7%Zd\xb5@Jrr\xbd\x00t\xb4\
-\x83p\x18\x8a\xc1\xc3Z\x00R\xf9+Qu\x22\xecj\
-PY]\x85\xc2\xc2\x22,Y\xb5\x02y[\xf2QR\
-Z\x8eP]\x08Iq\xf1HMME\x9bV\xad\xd0\
-Rn~vV\x16\xb222\x11\x1f\x1f\xef\x9c\xae\x9b\
-\xfc\xe5\x17\xb6&$#H\xc2\xe9\xb1\xadP\x87\x87_\
-&1\x0c\xc30\x8c\x83\x06\xd6\xbf\xdb\xa9\x82\xeb\xc2\xd5\
-/\xbbv)\x0b\xa3\xc2\x06\x19~w\x9d\xd7I\x9d_\
-QQ\x89\xb2\xf2rl*\xdc\x8c\x8d\x9b6!\x7fs\
-\x01\x8aJ\x0a\xe1\x0f\x06\x11\x1f\x1b\x8b\x9699\xe8\xd8\
-\xb6-:\xb5\xeb\x80\xcc\xf4L$\x88\x16\x88\x89\x8ev\
-\xc2<\x8c\xba\x8a\x0f/\x01X\x7f%\xce\x17\x8e\xdd+\
-\x10\xb5\xbfqs\x1e\xd6\xac_\x8f\xcd\x05\x05j\xf5K\
-\x88ODvF:Z\xb6\xc8A[\x11}\x19i\x19\
-H\xa3u/1\xb1!\xe3\xa8\x9a#N\xc6q~\xc9\
-\xdf\xc3\xe7\xde\x1b\x86a\x18\xc6\xe1\x8dH\x1cW\x1ah\
-\xf5\x1d6\xd2P\xfa\xb8\xfb9\xd4\xab\xa0\xa8\x00\x85\xc5\
-E\x22\x0a\x0b\x91\x9f\x9f\x8f\xe2\xb2\x12\xda{\xd0:\xa7\
-\xa5Z\x07\xdb\xb5j\xad\xdf\x93\x92\x92\xc5\x9f\xb0.8\
-\xc4\x0d>\x87\x85\x00t/\xc1\x19\x10\x1a\x12%_\x8c\
-5k\xd7b\xd9\xeaU\xc8\xdb\xb2\x19\x955\xd5\xda\xd7\
-\xdf&\xa7\x15\xba\xb4\xef\x806\xad\xda\x88\xd8K@\x22\
-U}L\xacf\x90\xfa\x8c!^\xd5\x0b\xc0C\xfb\xde\
-\x1a\x86a\x18\x86\xb1\x1d\xeau\x83\xd6\xfb\x0db\xd0\x1f\
-\x08\xa0\xa2\xaa\x12\xa5eeX\x9d\xbb\x16+V\xad\xc2\
-\x16\xd1\x14\xd1\x1e\x0fZe\xb7D\xf7\xce\x9d\xd0\xa3s\
-7\x1d\x1a\xc6s\xe9\xcf\xa1*\x04\x0fm\x01\xc8\xa8\xcb\
-\x7f_\xc0\x8f\xf2\xca\x0al\xd8\x94\x8f\xb9\x8b\x17`C\
-\xfe&\x84d_ff6:\xb5i\x8bn\x9d:\xa1\
-}\x9bv\x88\x8d\xf5\xaa\xf5V/X\xfe\xe8-\xfb\x01\
-\xce\xfc1\x0c\xc30\x0c\xa3\x11\x14\x07\xa2+\xb8\x22H\
-\x14\xc7\xf5\xcbw\x8e)d\xef\xe1\xeauk\xb0|\xed\
-jl\xdc\xbcY\xc5`\x8f\xce\x9d\xd1\xafg\x1f\xb4j\
-\xd1\x02\xc9\xb4\x0a\x8a\x08<\xd4\x84\xe0!'\x00\x19Y\
-&1\xa3\xed\xf3\xf9\x90\xb79\x1fKV\xae\xc2*\xb9\
-9%\xa2\xd8\xd3S\x92\xd1\xa1]{tn\xdf\x1em\
-[\xb6\xd1\xd9>\x9e\xa8\xe8\xf0y\xe1K=D\xd5\xba\
-a\x18\x86a\x18\xfb\x01\x95\x0b\xae<r\xd4CEe\
-9r7n\xc0\xca\xb5k\xb1b\xcdj\xd4\xfa\xfdh\
-\x99\x9d\x8d\xfe\xbd{\xa3k\xa7\xceHON=\xa4D\
-\xe0\xa1#\x00%\x9a\x1aQI\x5cN\xf9^\xber\x85\
-\x08\xbf\xe5X\x99\x9b\x8bZ_\xad\xf6\xcf\xf7\xee\xdeC\
-\xbbx\xb9\xdeO\xac\xd7\xab\xa7\xa9*\xe7\x89\xa6\xf9\x0c\
-\xc30\x0c\xc3\xd8]\xeaU\x92\xf3\xa5F4\xc7\x96\xa2\
-\x22\xacX\xb5R'\x95\x16\x94\x94\xa0M\xcb\x96\x18(\
-B\xb0_\xf7\xde\xce\x04RJ\xab\x83\x5c\x0c\x1e\x12\x02\
-\x90Q\xe4\xc6\xa9\xdc\xab\xd7\xad\xc3\xec\x85\xf3\x91\xb7y\
-\x0bR\x93\x93\xd1\xbdKg\x1c\xd1\xbb\xafN\xdd\xd6Y\
-:a\x0e\xd5>y\xc30\x0c\xc30\x0e^\xa8G\xa8\
-1\xf8I\x03\xd4\x82\xa5\x8b1g\xd1Bl\xdeR\x80\
-\xcc\x8ct\x0c\xee;\x00\xdd\xbatAFj\x9ac{\
-:H\xf5\xc8A/\x00\x1d\xe1W\x8e\x15kWa\xee\
-\xc2\x05:C'-5\x15\x03{\xf6A\xb7N\x9dE\
-\xf8e\xe9Z|zCx\x82\x09?\xc30\x0c\xc30\
-\xf61\xae|rtJ\x19V\xad]\x83Y\xf3\xe7c\
-KI!\xda\xb5h\x85a\x83\x07\xa3s\xfb\x8e\xba\xc8\
-49\xd8\x0cS\x07\xa7\x00\xd4(\xb1\xab7\x80\x85\xcb\
-\x97\xe2{Q\xd6\xb9y\x1b\x90\x9d\x9e\x81\x81\xbd\xfa\xa2\
-K\xa7N\xf2=S\x84\x9f\xbe\x80M\xff\x1b\x86a\x18\
-\x86a\xeco\x5c\x19\xc5\xc5\xa8\x0b\x8b\x8b\xb1x\xe52\
-\xccY0O\xdfR\xd2\xb7[\x0f\x0c?b0\xb2\xb2\
-\xb2\xc2R\xe5\xe0\xd1,\x07\x99\x00\xac\x93\x04\xa4I\xd5\
-\x87\xb5\xebs\xf1\xed\x9c\xd9X\x97\xb7\x11Y\x22\xfc\x8e\
-\xec\xdf\x1f\xfd{\xf5A\x5c\x5c<<\x8e>\x94\xcd\x94\
-\x9fa\x18\x86a\x18\x07\x03\x22NB\xfc[\x87\xe2\xd2\
-RL\x995\x13\x8bV,\xd5\xe1iG\x0d\x19\x8a\xbe\
-={#)1A\xa4\xcb\xc1\xf1\xc6\xb0\x83B\x00\xaa\
-\x9ec\xbaIT6n\xca\xc3\xcc\xf9s\xb1x\xc5r\
-$'$b`\x9f>\xe8\xd3\xa3'2\xd32\xea\xcd\
-\xa76\xbe\xcf0\x0c\xc30\x8c\x83\x92p/&_7\
-\xb7|\xd5J\xcc\x9a?\x0f\xb9yy\xba\x86\xe0\xf0\xc1\
-C\xd0\xb6UkD{\x1a\xe6,\x1c(\x0e\xbc\x00\x94\
-\xe0\xf9j\xb5\x9a\xeaj\x1dH\xf9\xdd\xbc9:\xe6\xaf\
-O\xb7\xee\x18:p\x10r\xb2\x1b&w\x98\xf03\x0c\
-\xc30\x0c\xe3P\x81\xdd\xc2\xd443E\xdb\xcc\x9a?\
-\x17)\xc9I8v\xd8H\xf4\xed\xd1\x8b\xa2\xe6\x80\xea\
-\x9a\x03+\x00%d.\xb2\xb8>\x7f#\xbe\xf8\xe6\x1b\
-\xe4\x17lF\xdb\xd6\xadp\xec\xd0\x91h\xdf\xae-b\
-\xa2D\xf81mL\xf8\x19\x86a\x18\x86q\xa8!:\
-\x87\xef\x1f\x0e\x8a\x10\x5c\xbdn-\xbe\x9e1\x1d\x9b\x0a\
-\x0a0\xa0go\x8c\x182\x04\x19\xa9\xe9:\x91\xf5@\
-p\xe0\x04`\xa8\x0e\xe5U\x15\x98\xbfx1\xa6\xcf\x99\
-\x0dO\xb4\x07C\xfa\x0e\xc0\xc0>}\x91\x92\x92\xc2\x88\
-\x99\xf03\x0c\xc30\x0c\xe3\x90\xc7\x91ZQ(,*\
-\xc2\x94\x99\xdfb\xf1\xca\xe5h\xdb\xb2%\x8e\x1bq\x14\
-\xda\xb7i\xa3\xc7\xd4\xe0\xb5\x1f\xd9\xff\x020\x1c\xda\xa6\
-\xc2-\x984m\x0aV\xae]\x83V998i\xf4\
-\xd1h\x9d\xd3\x0a\xb111&\xfc\x0c\xc30\x0c\xc38\
-\xbc\x10\xfd\xc3\x09\x22\x95UU\xfa\xda\xda)\xb3f \
--)\x05\xa7\x1cw\x1c:\xb6\xed\x00\x9d\x1a\xb2\x1f\xf5\
-\xcf\xfe\x15\x80\xa1:\xf8\x82\x01,[\xb9\x02\x9f}\xf3\
-\xb5\x9aD\x87\xf4\xef\x8f\x11G\x0cqV\xce\x16l\x9c\
-\x9fa\x18\x86a\x18\x87+\x1c\x17X'\xdb\x8a\xb5\xab\
-\xf1\xb9h\xa1\xda\x80\x1fG\x1f9\x0c\x03\xb8\xd2\x897\
-n\xbf\x89\xc0\xfd'\x00%\x98\xca\xea*\xcc\x98;G\
-\xb7\xb4\xd4\x14\x1c7b4:w\xe8\x88X\xb7\xff\xdb\
-\xc4\x9fa\x18\x86a\x18\x87;\xa2\x898\x01v\xed\xfa\
-u\x988e\x8a\xf6\x8a\x8e\x1ar$F\x0c\x1a\x02o\
-\xacw\xbf\x18\xc3\xf6\x8b\x00d\x10e\x15\x15\x984\xed\
-\x1b\xcc_\xba\x04\x9d\xda\xb4\xc3\x09G\x1d\xa5]\xbeQ\
-\x07\xa0\xdf\xdb0\x0c\xc30\x0c\xe3@B\xf1\x15\x0a\x06\
-\xb1\xb9\xa0\x00_};\x15kD\x0c\x1e=l$\x86\
-\xf4\x1f\xa8o\x0f\xd9\xd7\x22p\x9f\x0b\xc0P0\xa4k\
-\xfb}1e2\xf2\x0b\x0b0\xa4o\x7f\x0c\x17\x85\x9b\
-\x92\x98\x04xL\xf9\x19\x86a\x18\x86\xf1\xc3\x852\xac\
-\xbc\xb2\x02\x1f\x7f\xf5\x05V\xae]\x8bA\xbd\xfb\xe3\xa8\
-a\xc3\x91\x94\x98\xb8OE\xe0>\x13\x80\xea\xa9x\xbd\
-Z.\xe6\xb3o\xbeBiE\x19\x8e\x1d>Z\x94\xed\
-\x00\x9d\xf2lc\xfd\x0c\xc30\x0c\xc3\xf8\xa1\xe3\xca0\
-\xbeO\xf8\xd3\xaf\xbfT\x118\xb8\xef\x00\x1c3b$\
-\xe2\xe3\xe2\xf6\x99^\xda7\xef#\xe1\xc5\xc8\xb6f\xfd\
-ZQ\xb4\x13Q^]\x85\x13G\x1f\x8d\xc1\x22\xfe\xb8\
-\xa8\xb3\x89?\xc30\x0c\xc30\x0cN\x7fp\x16\x84N\
-KN\xc5I\xa3\x8fA\xaf\xae\xdd0k\xe1<\xcc\x9a\
-;\x07~\xbf\xdf\xd1T\xfb\x80\xe6\xb7\x00\x8aw\xec\xf6\
-]\xb0b\x09>\x9f2\x19\xf1\xb1q8\xe5\xd8\xe3\xd0\
-\xb9}G\x88\xf4\xb3n_\xc30\x0c\xc30\x8c\xed@\
-I\xc6eb&|\xf99V\xe7rL\xe0\x08\x1d\x13\
-\xe8\x8d\x8d\xa5R\x0c\xbbj\x1e\x9a\xd7\x02H))\xdb\
-\xb2u\xab1q\xda\x14\x9d\xc9r\xc6\x09'\xa2k\x87\
-N\xa2\xfbL\xfc\x19\x86a\x18\x86a\xec\x08N\x8cM\
-JL\xc2\xc9G\x1d\x87\x96-r0y\xc6wX\xb4\
-|\xa9c\x04lfC`3w\x01\xd7a\xcd\xc6\xf5\
-\xf8\xf4\xebI\x88\xf1D\xe3\x94\xa3\x8fE\xfb\xd6m\xeb\
-\xcd\x9b\x86a\x18\x86a\x18\xc6\x0e\x10\xa9D\xb9\x94\x9a\
-\x9a\x82\x13F\x1e\x85\xcc\xb44L\x9a6\x15k6\xac\
-C\xa8\x99\x15`\xb3u\x01\xb3\xdbwe\xee\x1aL\x98\
-4Q\xc4_\x0c\xce8\xfe\x04\xb4o\xdb\x0e\xd1\x9e}\
-3\xcc\xd00\x0c\xc30\x0c\xe3p\x85\x0bF\xaf\xcf\xdf\
-\x88\xf7?\xfb\x14q1\xb1\xda\xa3\xda\xbae+x\x9a\
-IW5\x8b/\xd4\x90\x1b7o\xc2\x17\x93'#\x10\
-\xf0\xe3\xf4c\x8fG\xc7v\xed\x9dn_\xc30\x0c\xc3\
-0\x0cc\xb7`\xcf){QO\x18=\x1a\xc5\xe5e\
-\x98<\xf3;\x94W\x94St\x85]\xec\x1d{/\x00\
-%\x22U\xd5\xd5\x988e2J+\xcbq\xdc\xc8Q\
-\x22\xfe\xdaY\xb7\xafa\x18\x86a\x18\xc6\x1e\xa2:J\
->\xbbw\xea\x8a#\xfb\x0f\xc0\xaauk\xf0\xed\x9c\xd9\
-\x08\x85D\x006\x83\x06\xdc;\x01(\x91\xa8\xa8\xaa\xc2\
-\x17S\xbf\xc6\x86M\xf98n\xf8(\xf4\xef\xd9\x17\x9e\
-\xa8\x83\xbb\xdb\x97\xe9\xb6\xbdm\x7f\x12\x92m\x7f\x86\xe9\
-\x86\x15y\xad\x8c\x037\xc30\x0c\xc30\x0eBD\x04\
-\xc6z\xa21t\xe0 \xf4\xeb\xde\x0b\xb3\x17.\xc0\x82\
-e\x8b\x11\x08\x05\xc3\x0e\xf6\x9c=\x1f\x03(\xa7\xf9|\
-~|3\xfb;L\x9d1\x03#\x06\x0d\xc21#F\
-\xc3\x1b\x13\xa3\x11\x8e\xc4\x0d\x80{#\x03\xdb\x9f\xf6A\
-7\xdc\xa0\x88\xd6\xaa@\x00U\xc1\x90\xe8\xd7:\x89C\
-\x1d\x92$\xce\xc9\xb1\xd1\xfb\x5c\xb82\x0e\x9a\x06\x12\xae\
-_6\x86\xc61\x92n\xba\xec\xab\xf4\xa0\xdfU~^\
-s\x00\x01\xf9\xc1\xdf1\x12\x98W2UBt4\xbc\
-\xd1\xceu\xef\xebx\x18\xc6\xae`\xfes\xb1|h\x18\
-\x86\xe1@\xddPX\x5c\x82w?\xfe\x10\xc1`\x10g\
-\x9f|\x0a\xda\xe6\xb4\xde\xab\xd5U\xf6L\x00\x86\xcfX\
-\xbc|\x19>\x98\xf8\x19\xda\xb6l)\x919\x0d\xc9I\
-I\xf5\xdd\xbe\xae\x90\xa0\xf7\xd5\x22\xb6jC!Q\xac\
-!\x11=Q\x22z\xa2\x10/\xa2#^\xc4\x87\x22n\
-\xf8R\xe4}Q\xe0\xbb\xf1\x08H\x18%\xb5~\x94\xf8\
-\xfd\xa8\x94\xcd_G\xdb\x17\xe5_\x9d\xa8k\x0f\xb2\xe3\
-\xe2\xd0.!>\x5c\xeb4_L\x22\xd3\xa1L\x84g\
-\x99\x08\xb1 \xd3C~Sv\xc5\x8a\xe8\x8c\x8d\x91\xf0\
-\xbd^\xc4\x85\x85X\xb3!a\xd4\x8a\xe0\xdd\x5c[\x83\
-\x12\x11\xeb5\x12n$\xd1\x92\xe6\x14\x80\xbc\x0f\x89\x12\
-vV\xbcW\xf65\xc4a_\xdc\x0f\xe3\xe0\xa3\xa9\x05\
-\xc0\xbe\xcc\x0f\xdb\x8b\x83>7\xceW\xcb\x8b\x86a\xfc\
-\xb0\x09\x17\x86KV.\xc7\xd8O&\xa0w\xd7\xae8\
-\xe5\x98\xe3\x91\x90\x90\xb0\xc7\xc3\xed\xf6P\x00\x8a\x98*\
--\xc5\xcb\xef\xbd\x8d8o,\xce<\xe9\x14\xb4\xcen\
-Y?3\x85\x1e\x06DxT\x8a\xe0\xd9\x5cS\x8b\xf2\
-\x80\x9f\xa7\xe8~7\x9a\x14\x1a\x891\xd1\xc8\x8e\x8fC\
-\x8a|R\x8cD\xeb\xc1\xe6-\xea\x83\x12\xb0O\xd4\xf2\
-\xea\xcaj\xb5\x801\x1e\x9c\x9c\xc2\xfd\x8cm\x1d\x83\x93\
-\xef\xa1\x00\xd0.%\x01\xadD\x04\xf2x\xf3\xc4\xa2N\
-\xc2\x01\xaa\x03Al\xae\xaeE\xb1\xa4\x03\xad\x8e\x8c\x83\
-\xde0&\x88\xfcah\x09\x22\x02\xdbH\xd8\xa9\x92\x9e\
-\xcd\x13~\x9d\x0a\xbe\xdcJG\xfc\xc9\x9d\xd6}L_\
-\xfa\xad\xf2\x97\xfb\xea4\x15t_\x9c\x08\xc1\xac\xb8X\
-d\x8a\x18\xa5(v'\xf1\xec}\x5c\x8c\x83\x15\xa7\x19\
-$\x9f|\x06\x987u\xaf\x03\xf7\xbby\x91\x7f\x99\x1d\
-\x5c\xf7\xdc\x9a\x13\x86\xed\x93\x06b\x95<+,;\xf8\
-|$\xc93\xc1|\xc8\xb2\xc1\xcd\x8b\xc6\xde\x11\xd9\x04\
-l\xe6\xe6\xa6a\x18\xfb\x1a)'\xfd\xa2g\xbe\x9c\xf6\
-\x0df\xce\x9b\x8b\x13F\x8e\xc6\xb0\x81\x83\x1d\xed\xb5\x07\
-E\xe4n\x0b@:\xaf\xaa\xaa\xc6g\x93\xbf\xc4\xd2\xd5\
-\xabp\xd6\x89\xa7\xa0W\xd7\xee\x12\x81(\xb5\xe2\x91b\
-\x11\x1c\x9b\xaakD\x00\x06\xa5\xc0\x91\x22GT\x16\xc5\
-\x86#u\xdc\xe0\x1c\xeb\x9b\xc8\x0c\xed\x82L\x8d\x89A\
-\x96\x88\x9f\xa4\xd8\x18-\xfc\xf7\xb6\xb8g(\xb5\xa1\xa0\
-\xc4\xa3\x16\x85\xb5>\x04\xeaB\xea/\x0fPx\xa6\xc4\
-F#):V\xc4i\x00\x05\x22R)\x90\xa4\x9aA\
-\x97\xa4D\xa4\xc7y\xf7*|\xf7\x0ak\xe4\xfa\xf3k\
-j4=\xd8\xf5L\xe3Z\x9d\xa4\x05+\xb38I/\
-\x8aP\xbf\xec\x97\xaa\xd7\x09O\xc4XK\x11\xc4\xad\x12\
-\xe3\x11#\xc7\xf74\x0e\x0c\x9f\xf7iey%\x8a\xfd\
->\xad\xb8\x99\xce\xe9\xb1\xb1H\x96t\xa6\xdd\x95\xe2\xb0\
-J2R\xb5\x88b\x9fF\x98\x7f\x9c\xfb\xc3J7M\
-\xdcf\xc8\xfdH\x96\xfb\xd1<\x82tk\xdc4jL\
-s\x87\xb3?qR\xd0aG\xd7\xe7r \xaf\xd3\x89\
-\x9b\xd3\x10a\xfe\xa7\xe8\xaa\x91\xbc\xc0\xe75\xa8\xfb\xe5\
-\xb9\x94\xcc\xca|B\xeb\xb07,\xc2\x12\xe49\x8d\x91\
-\xef\xb4T\xc7\xc8o\xe6\x0b\xf7:#\xaf{w\xae\x8d\
-\xee9\xa0ycu5\x0a\xe49\xf1\xab\x95Z\xf6\x8a\
-\xdf\xb1\xf2\x0c\xd0B\xae\x8d\x92\xb88\x8d\xc7\xa1\x9c?\
-\x0e$n:WK\x99(\x1f\xda\xd8\x8e\x0b\xdfW-\
- \xc2X\xfa\x1a\x91\xec\xee\xf3l\xec{\xea\xa4\xa1\x5c\
-\x5c^\x8a\x0f?\xff\x14\x05\xc5\xc5\xb8\xe4\x9c\x9f '\
-\xab\x85\xe8\x8b\xdd\xbfS\xbb'\x00)X\xa4\xc2\x985\
-\x7f\xae\xbe\xe9ch\xbf\x018v\xe4Q\xe1W\x94@\
-[\xf0\xc55~l\xac\xa9v\x04\x97\xfccq\x1e\xcf\
-JC6WHp1CvMr,\x9e\xd3\xb2w\
-\xa4!\x07:\xa6\x89\xe0\xc8\x14\x01\x96\x14\xb6\x0a\xba\x91\
-k\xea\xa5\xd1=/\x89\x15\xdb\xe6\xdaZ\x94\xd6\xfae\
-\x9f\xe3\x0b\xfd\xcf\x14Q\xd3B*\x93\xf8\x18\xb6\x7f\xa3\
-D\x80\x85\xb0\xae\xb2JE\x1aEj\x967\x0e\xed\x13\
-\x13\xa5\xa2\xe3\x19\xbb\x9f\xa0\x0c\x89\xd6\x0cZ\xdd\x5c\xeb\
-g\x94Tb\x8cS\xbc|\xa6xc\x90\xe6\xf5je\
-JQH+)\x05*+_7<\x8a\xc0\xd6\x22\x02\
-Y\x01\xee.\xee\xf5\x17\x88\x9f\xbc.\xfef\x12\xb7\x93\
-kj!\xe9\xaa\x05~\x18^;\x85`\xb9?\x80R\
-\xbf\x1f\x15\x12\x17\x8d\x03\x9d\xc8\xfd\xe3\x18A\x15\x82r\
-^*\x859w;.\xf6\x0a\x86[\xe1\x0b\xa8\xf1\x91\
-=\xf1\x14\xc6\xf4\x98\x97\x9b\x14\x13\xbb\xd5u3<\xb2\
-\xb7a\xee+\x22\xe3\xe7\xa4\x8dc\xf5\xad\xf2\x07\xe5y\
-\x08\xee\xf0\xa1L\x14a\xc5g\xc25\xdd;\xe7\xee{\
-\x18\x0e\xf3'\xefw\xa9\xcf'\xf9\x94\xe3B\x9d\xabp\
-\xe3\xbf5\xce\x95\xf1/\x1b\x11l\xe81\xde^\xf9L\
-\x91\xbc\xc1\xe7\x97y\x8a\xf9\xc3yd\xb6n,D\xfa\
-\xd6\xf8\xfa\xdc\xb8\xac\xaf\xac\xc6\x16\xc9\xafL\x0a>\x13\
-\x8e\xb5\xda\x0d\x97B\x13\xd2p\x89EN\xbcW\xf3\xa3\
-\x93\xa4\x8d}3\xb6\x8fS\xfa\x15s\xf8\x8bl\xe5\xec\
-\x05\x91\xdf|-'\xefc\xb2\xe4\xc3\x04i\x0c\xa7\xb0\
-a(e\x92\x8b\xa5\xee\xe1\x8f\xfb\x94\xb9\xb0\xde\xe0>\
-\xc2\xfd\xdc\x22\x87f5vo\x1c \xe4F\x04\xa5\xe2\
-\x5c\xb6b\x85\x0e\xc1\xeb\xdb\xad\x1bN8\xfaX$\x88\
-v\xd1Bt7\xd8m\x01\xb8>?\x0fo\x7f\xf4\x81\
-\xaeR\xfd\xd3\x1f\xfd\x18Iq\x1c7\x17\x85\xea`\x10\
-\xb9U\xd5(\x13\xc1\xc3\x182\xdb\xb0\x9b\xb7uB<\
-2XhK\xa9\x1d\x195Z\xbf\xcaD$Q\xa8\xd0\
-\x12E\xcb\x03+\x1f\xd7B\x96\x14\x1d\xa3\x22\x88c\xd3\
-\xdcVjC\xf1\xb4-z\x11\xe2g\x8d\x88\x0bv\xb7\
-\xd2_\xda\x1f\x19&\xfd\xcb\x8c\x89CNb\x9c\x0a\xaf\
-\xc8\x0a\x84\x02\x95\x96\xba\x95\x15\x95*\x86bew\x97\
-\xe4$\xed\x8a\xdd]\x18\x07v_\xe5UW\xab\xf8s\
-\x1e\x98:)lEx\x8a\x88j\x9d\x10\xa7\x96=\xc6\
-\x87\xe1\x8a,\x94\x7f\x8e\x08\xddXU\x83\x02_\xads\
-\x86\x5c\x07\xc7\x04\xb6M\xa2\x08\xd47(7\x19\x86I\
-\x13\xf1\xd2\xf2\x0a\xb9\x1e\xa7\xe2n\x9f\x94\x80\x1cZ5\
-\x99\x8e\x11\xb8q\x08I\x9aS\x94W\x8ahQ\xcb\xad\
-\x9cO\x01\xcf4\x97\x0c\x22n\xa2D\xb4\xc6\xa2\x95\xc4\
-\x9f\xdd\xc4\xb4\xfe\xec>\x8e0*\x92J\x88V\xd1Z\
-\x09\xc3\xd9\xeb\xde\x09\x07\xa6O\xaaT\xf6\x19q\xb1j\
-\xa9e\x1er\x1a\x09\x8c\xeb\xc1\x03\xe3\xcd\x8dy\x8e\xd7\
-\xc5\x07\x92\xe3;)\xa2\xcb%\x1d\x03u\x92\xa3\xd5\x81\
-\x83\xfb\xd5\xbdV^\x13\xad\xb1\xb4n\xd1\xcaJKW\
-sX\xbew\x06\xe3\xc0\xfc\x99+\x0d\x83\x22y\xf6h\
-y\xf6\x88\x0a\x0f\xa9\xf5\xdb\x19\x13Z\x7fk%Oh\
-u \xbfy\x0e\xcf\xe5!\xc6\x9b\xbf\xf8\x9c\xd2G\xd7\
-9-\x83\x89\x92W\x93\xa5\x81\xc3\xc6\x1b\xc7\x96\x12\xba\
-w\xcf\xe3'\xf3\x1ca\xbe\xe2D(>'\xf9\x92\xe7\
-\xf8t\xd7I<(\xf0(&}\xf2,\x96\x06|\xa8\
-\x0dH\xced\x5c\xe4d>\xb7Y\xf2\x5c\xb0\x5c\xa0x\
-1v\x0e\xefYH\xf2e\x9e\x94\x87\xec\x09a\xdaG\
-E\xf1I\x97\x84\xd4[\xcb;BW\x9c\x10\xe6\x0cA\
-a\xfa\xeb\xe2\xfdLo=b\x1c\xae\xb0\xf1\xc5\x1e(\
-\xd6\xd94XT\xc9\xb3\xe6\xe6\x07\xe6\x8dd\xc9\x07\x09\
-\xf2,\xa6\xcb3\xcd<\xe1\x94\x0fN\xae\xe1f\x1c@\
-\xe46\x05\xa4\x0e\xfd|\xf2$\xcc]\xb2\x18\xc7\x1du\
-\x0c\x06\xf5\xea\x03\xaf\xdc\xaf\xdd\xa1\xe9\x02P\x5c\xf9$\
-\xa3\x8c\xfbx\x02\xd6\xe5\xad\xc79\xa7\x9c\x86.\x1d;\
-k%G\x0b\xd2\xda\xaa*\xa9\xd4EpI\xa9A\xc9\
-\x92-\x82\xa3\xa5\x14(,X\xb6\x87\x9b\x81(\x04Y\
-\xd8\xd3\x02P\xe2\xf3\xc9w\xf1P\x0e2R4\x04\xb0\
-{\x98\x95d\xba\x08\x10\x8a\x8fH\x0b\x96\x0b\xe3P\x13\
-\x0aJ\x0b\xd7\xa7\x15\x0a35OfVM\x14!I\
-\xe1\xc2\xeeL\x154\xe1s\x22a\x12l\x90J\x88\xdd\
-P<\xde:>A\xc4W\x82\x1e\xdb\x9e\xfb\xedQ'\
-aVH\xeb\x9ac\xee*\xe5SjU\x11\xbdu\xda\
-\xa5\xdd.!Ag\x1a3\xeaz]\xce)\x0a\x7f\x13\
->\x8c\xb4\x04n\x10\x11M1\xccK`\x1avLL\
-\x0c\x0b\xe0\xb0\xc3\x9d@\xbfx-yr-y\x22\xb2\
-\xb8\x83V\x9a\xce\xc9\x89\xf0\xaa\x1f\xdb\xf7\xc4\x8d\x03\x8f\
-2\x1e\x14g\x055~\x15\x09>\x0a\x199B\x89\xc8\
-nAZ\x0ar8nS\xae\xcb\xad\xd4w\x85\xeb\xff\
-\xc6\xcaj\xad\x8cX\xd1\xf3<g\xbf\xfb\xad!\x16\xbc\
-\x9f\xf4\x9b\x15>\xc3\xe3\xbdgx\xbc\xff\x8e\x8b\x03\x87\
-\x1bKNh\xa2\xd8\xa3\xe8+\xf7\x05tR\x11-i\
-*\x95\xa8V\x98y\xb5\xc6\x95k\xe1#\xa0\x82*\x22\
-\xeer\x9c\xc2\x86\xbfy\x7f[H\x9aR\xdc\xc4\x89x\
-\xe2\xbezw\xcd\x85\xc4\xad\x5c\xeeknE\xb5\xe4O\
-\x8e\x09u\xd29I\x22\xc7\xc6\x0e\xf3\x09\x85[$\x8c\
-/\xc5\x1f\xaf\x93\xcfiM( \x8d\xa5:\xbdv\x9f\
-\xfcf^q\xe3\xd9\xf0\x8a\x22\xa7\x81\xa3>\xc9A>\
-\x7f\x1c\xee\xe0\x95\xcf\x04\x09K\x0e)l0\x16I~\
-\xe7'\xcf\xe4U\xb3\x91\xd4^\x1a=\xeel|\x86\xc3\
-\xf4\xdd$y\xb9R\xca\x08\xc6\x88\xed\x12\xc6\xb3]b\
-\x82Z\xd3=\x9a\xd6\xea|\xbf\xd1p\xa5\xce\xf3\xa2\xdf\
-\xdd\x0b\x13\xf8\x8d{\xf7s\xb4\xb6\x82\xe1s\xdb\x22\xe5\
-!\x1b\xe6Nv\xacSa\xce\xfc\xc6c,k\xfdu\
-\xb4\xfa\xbbpr\x1e{I\xbc\x92\x1f\xbd;-3\x8c\
-C\x13'_r|x\x9d\x94\xf15\x92?\xfc\xdax\
-\x95\xea\xaa>\xdfrc\x1ea\xe3!J\x9e/\x1ao\
-\xf8|\xa6\xc9\xf3\xc6g\x94\xbd\x17l\xf0\x1d\x0c9\x83\
-q\xad\x87\xcfb8\xbf\xee\x8f\xb89i\xb95\x91\xf1\
-\xd9\x97q`=C\xc3Y\xee\xe6-\xf8\xe8\xc3q\xf0\
-\xc6\xc5\xe3G\xa7\x9f\x89\x8e\xd9\xd9[\x95E\xbb\xa2\xc9\
-\x02\x90\xce\x96\xaeZ\x86w>\xfe\x18C\xfa\xf6\xc3\xf1\
-#G#:\xc6\x8b\xfc\xdaZ\xb5\xb89\xc5sH-\
-V\xedE\xf0\xb0R\xa15\x87\xec*:\x8c\x00\xfd\xe7\
-laZ\xee\xca\xfd\xd2\x1a\x11\x11\xc5\xeaQ\xc7\x0eJ\
-&d\x8b\x9f\x95\x14-\x82\xbc@\x16d,|i\xf1\
-cE\xc1.\x5c\x9e\xef\xb8\x970\xe5\xb3e\x5c\x82\x8a\
-(V\xaa\xbbj\xcd\x96\xca\xf9K\xcb*T\xc0&D\
-E\xa3Oz\x8aVd\xbb\xc2\xcd\x04\x05\x92\x0e\xb4d\
-\xb8q\x88\xaa\xf3 ;>\x16-\xe3\xe3\x1bf;\xef\
-\x04\xf7&\xe4W\xd5\x88\x08\x14\xf1\xc6\x12[<n-\
-\xe7SH\xf3\x81lJ:r\xb9\x97U\x95\x95\x9a.\
-\xec\x94\xeb$B6M\xd2`W\xd7\x1f\x89\xc6E\x12\
-\xb1\xc2/\x95\xb4\xdf\x87R\xf1\x93c\xc4\xf4v\xca\xc1\
-\x18I$\x8e'\xa4\x95\xce\x15\x82t\x1f\xd9]\x10\x09\
-\xefm\x91\x88\xfb5\x95Ur\xcf\x1cOh\xe5\x89\x93\
-\xbc\xc2\xf1d\x14\x17\x9c%N\xca\xb4K\xd2\x91\x13t\
-\xe9\x143\xac\xb8\x9c\x96(\xef;\xcfu_1\xe8\xba\
-\xdb\x17h:\x08\xae\xff\x8c'\x1b;\xcc\x9b\x15\xf2Y\
-\x11p\xc6\xb8\xcanqKA\xc5\xb1sQ\x9a>\xc9\
-*\xe4\xf8]\xb6h\x0eo\xf0\xa8\x98\xe20\x09R.\
-\xf9\xad6|\x9d\x1e\xdekI\x17\xe6\x93,\xb9W\xac\
-\x80#\x97\xe6\xd9+$N\x8c\x1b\xd3\x9f\xf9\x93q\xa7\
-\xaf\xccO\xb4\xea\xb6\xd1\xfc\xc9\xb0\xf8\xac\xe9\x19[\xe1\
-\xa6\x01\xe1\xf3\xc64`\x03\xcb\x99\xb0!\xf9\x22|=\
-|~x5l\xb8\xf0$>GL\x17Gj\xa8\xef\
-\xf5\x7f\x09c\xe5@\x17u*\x80\xdbH\xb9\xc1\xae\xe5\
-\x86#N\xf8\xcc{[\x1aY\xf59<\x81\x0d\x11\x0e\
-kp'\x9fm'\xfa\xcd\x86s-\x92\x07$F\xbc\
-\xf7\xbcnM\x0b}\xde\x9d\x09TD\xbbU\x99?e\
-\xa7\x1b\x7f\xb2/\xe3\xb6=\x18n\xb5\xdc\x9fU\x15U\
-*\xb29\xe6\x8f\xd6\xbd\xd6\x92\xc6,\x97y=|\xe6\
-\xca\xe4\xf9.\x97|\xcck\x22,\xbb\x98\x17\xf9\x5cs\
-8\x0c\x9fqW0\xee\xefk0\x9a\x1b\xa7,`\xcf\
-[\xbe4\x0c\xd8\xb8r\x9a\x05\xce\x9de\xb9\x15\x1f~\
-\xfe8D\x8bcF\xd9X\xe7y\x9a\x97%\x1f\xc4\xca\
-\xc6\x9e\x0b\xb7\xf7\x82\xf5=]\x90\xfd\x91?\x22\xc3b\
-y\xc4\xf2\xd8iD\xb2L\xe2\xf8u\xa7\xfcM\x95\xbc\
-\xee\xae\xaa\xd1\x5c\xf1\xaa\x0f[\x0b\x83\x86g\x82\xe5>\
-\xfb\xb3\xf8\xda6i\x1f\xebo\xaetB\x91\x1cYo\
-\xbb\xee\xf7\x147|>\xbc\x9bk|\xdac\xc8\xf1\xdb\
-\xb9K\x16b\xe9\xdc\xd9\x18\xd0\xff\x08\x9c1\xfah\x89\
-\x9a\x84\xd2\xc4\x80\x9a$\x00i\xdd*,-\xc6\xfb\x9f\
-|\x0c\x7f\xc0\x87\x1f\x9f~\x16\x12S\xd3\xd4\xdaU\x11\
-\xf4k+\x9c\xf5:[\xe6l\xc1s\x1c\x17\xd9\x9d\x8b\
-u#\xc1\xe8\xb0k\x88\x15\x0a\xady,\xfc\xb5\xb2p\
-k\x940\x92\xbe\x8aV8\x02\xafY}\x91\x88$J\
-\xe6l\x93(\x22\xd4\x15~\xce\xc1\x1dB/\xb8-)\
--\x97J\x9d]\xd8@\xb7\x94ddHELvt\
-6\xab>\xde\xf4M\xec\xc6\x92\xd6T\xd8x\xa9\x0fI\
-{\x09_\xcf\x97\x88:\xd9p\xd70\x0e\xcc\xd4\x9b\xc5\
-/v\x09\xf3\x81\xf3\xc8NZ;Z$\xc4\xed4=\
-y.\xa1\x05\x91]\xd0\x1c`\xc7n\xdf\x0e\xc9\x89\xbb\
-\xba\xfc\x9d\xe0T\xe8\xb4\xec\xf2\x1a)\x22\xd8Zd\x06\
-\xd3\xaezq\xc1\xee\xda\x9c\x04\xafZ:\xf9\x9b\x02\xc8\
-\x91\x04\x0e\xdcW,\xe7\xad\x15\xf1\xa7\xdd\xca\x12/Z\
-\xf4:\x88\xa8\x8d\x09\x8by\xdeV\xbd\xc7\x02\xc7\x80\x95\
-I\x03\x80\xd6G\xd7\xf2\xc4#\x14Iu!\xba\xafS\
-\xa1\xc4\xf1`\xe9\xb1\xac\xfc\x1d1C\xf6\xf82\x1b\xc1\
-\xf0\xe8\x17\xe3\xc5\xe2Q\xc7\xb6J|x\x1dZ\xd8\xd4\
-;\x90?\xf2\x83\xc1{\xa3b\x90\x1a\x17\x8d\x14\x89[\
-\x8a\x5c_\xe38\xe9C\x19\xf6\x8fP\x0cr\x1c\xde\x16\
-i8p\x968\xaf\x92E\x05\x8f\xb2\xeb\x9b\xf9\x87V\
-c\xc7\x92\xe6\xfa\xb2{\xd0/\xc6\x95\xe3L\x97\x96\x95\
-\xeb}a\x18\x14Y\xccS\xbc\x0f\x8cWS\xf3'q\
-\xfcp6\xe6\x8d\xfa\xfb&\x01\xf9\x02\x22(D`\xf2\
-z\xd8x\xe0U1\xbf4 \xa1\xf3>2\xdd\xc2\xe7\
-y\xe5\xb9f\x03\x87\x16'7\xcd\xb6\xc5\xc9\x87,\x13\
-\xd6\x8b\x88\xad\x91p\xa2\xf8`\x88?\x19\xd2(\xe8\x98\
-\x9c\xb4UA\xdb\xdc\xf0\x0aX.1?\xe6i\x99\xe7\
-\x8c\xa3s\xae\xc2\xb9\x0e\xe7\x97\x93\xdfc%_gJ\
-\xde\xe4\xf3\x1f\x17\x13\x1e\xc2\x22\xec\xab\xf85\xc6\x8d\x11\
-\x87s\xac\xab\xaa\x92p=\x92\x97<R\xa6%I\xa5\
-\xd4\xd0\x18u\x86\x7f8\xd7\xc71\xb9\xb9\xd5N/\x8e\
-\xa6\xb7\x1e\xe7\xd8NyV\xa5\x11\xc9\x9e\x1c\xa7\xcc\xdd\
-_Wa47\xcc\x17\x14\xfa\xcb\xca*\xe4\xfe:9\
-\x98%\x0e\x87[\xb5\xd42\x5c\xca\xad\xf0\xfde\x0e\xf7\
-\xc9s\xcc2\xaaD\xceq\x86\xec8\xf5<}\xa2.\
-d\xa3\x96\xe3\xd5\x99\xcf\xdd\xa1Md_\xe6\x10\xc6\x9a\
-eM%\x1b\xb4\xb5RGH\xfc\xb4\x84\x91@\xf9\x8c\
-\xd2b\xc9\xef\xcc\xaf\xec=Ke/\xc1\x0e\xcb\x95]\
-\xc3\xf0\xb8\xf1\xb9f\xdd\xaca\xc9\x0e.\xc2\xec\x1aF\
-\xb8\xa60\xeb\x85\xf0\xa1p\xaf\x84S\x9esu\x0f\xf6\
->\xa6Iy\xc04\xdaq\x19\xb7kX\xd6Pc\xe4\
-I\x1d\xcf\xfa\x98aH\x94\x10\xac\xac\xc0\x82\xe9SP\
-Q^\x81\x9f\x9fw>\xb2\xd2\xd2\xe5X\xd3\xc2\xd9\xb5\
-\x00\x94\xc3\xd5R\xf0~\xf1\xed\x14\xcc\x997\x07G\x8e\
-8\x06]z\xf4TK\x8dF@/9\x0a\xd9\xd2Z\
-l)\x22\x85\x95\xd7\xde\xe0F\x86\xd1\xa7\xa5\x81\x03\xd5\
-9\xa1\x83\x85/+b\xde\x04\x07'\xf3\xba\xbf\xa8\xfa\
-Ya\xb2\x1b\x8d\x16\x22\x16\xc2N\xccv\x8d\xebG\x91\
-T\xc6\xab+\xaa\xd5W\x16|]Y`n'!]\
-\xf7\xb4\x80\xb0K\xb3DZ\xd1\xce^)0\xa3)\x88\
-\xe2\xb4rmj\xf8\x91\xf0\x1cv\x89\xaf\x17\x11\xc7\x81\
-\xdb<\x9f\x16\xa4\x0e\xd2r\xdf\xd9\xecd\x9eGK\xe8\
-\xb2\xd2\x0aTI\xe6$\xbdD\xc4&\xb3\x92\xd7_{\
-\x86{\x0dN\x05\x18T\x11T*\xf7\x9e\xddG!\x8e\
-'\x12\x07\xac\xd4S%\x83\xb3k\x80\x96\x03Z\xe94\
-\xd9\xe4\x18\xef\x1d\xbb\xd6\xf9\xa0p_fl\x9c\x8a\x0f\
-\xaf\x5c\x13\x1f\x91\xc6\x84O\xd3\xf0($\xd8\xc2\xe3\xbd\
-\xa7?\xeed\x05\xba\xe2=\xa2\xb5\x85a\xd1\x92\xc5\x16\
-)-Y\x91\x85\x90\x1b\xf7\x9d\xe1\xbaq}&LG\
->\xd4,\x5ch\xe9a\x1c8\xa1\x83\x85\x00E9\x1d\
-\xf3Af\x83\x87yM'\xcbH\x1c\x22\xf3J\xa4\x7f\
-\xc4=\xe2\xeew\x7f\xf3\x9a\xcaj}(\xe4\x00}\xb9\
-F\x8a&\xc2\xc2\x95\x02\xb7Mb\x9c~'\x0d\xbe7\
-\x01\xf1\x86\x85<\xc7\x5cn\x94\x02\xc3\x17\xb662\xbd\
-\xba\x89`\x8a\x97\xb8\xf3\xf7n\xf9\xb9\x1d\x1a_\x8f\xeb\
-'\x0bi\x9di.\xd7\xe4\xc2Y\xf9>)Ay\xf7\
-\x12=1\xda\xa6\xe3\x12Pj!\x97\xb4\xdbi\x5c\xc2\
-\xf7\x9e\xdd\x1e|\xe6\x98\x0f\x99\xdc\x140\xccs\x1c\xbf\
-\xc6\x09\x0d\xcd\xf5\x92\xf4z$\xdc\x0a\x09\x93\xd6SV\
-\x86\xbc.\xc6\xd4\xc9\xbdl\x90\x84\xa3\x16.\x8c\x89[\
-\xb9r\xda\x14\xad\x81)\xd2HJ\x8bc\xfet\xaa\xd7\
-\x9d^g3\xc0\xd0YN\xb2A\xcb\xf4bl\xbbH\
-Y\xc6\x8ah{a;\xb1u\xf2=\xd7I\xe5P\x14\
-\xc7:\xc4\xbduZ\x99\xb2'\x85e\xabW\xeeW3\
-\xa7\xf0N\x09'\xe9v\xd9\xd7\xe9x\xb8\xa0i(\xf9\
-\x81\x8dj\x0e\x07\xe0}\xe6>\x96\x9f|n\xd2\xc3\x02\
-n{\xd0]P\xdcs\x0d\xdb\x1a\xbf4\x84Y&\xb2\
-\xc1\xca\xfc.\xa70\xcf\xc7K\xf9G\xa1\xc5<\xc2:\
-\x80\x8d\xca\xe6\xbe7\x8c\x87\xdb\xd3W\xaa\xf9S\x1a\x98\
-R\xff0\x17\xe8\xb3(a\xb2\xc1\xc2z\x83O&\xff\
-\xf2\xf9\xe3x\xe1\x9c\xb885\x14\xec\x0a\x86AW\xfc\
-t\xe1\xf3\xae\x93%\xa5\xd1\xc9\x09\x9d,\xd3h\xc8\xa0\
-\xe5\x8d\xee\x18\x8e\x9b\x13\xebC\x90/\xea\x8f\x1cb\xf9\
-\xc42\x82\xbd]\x5cy\x84b\x99\xe5\xd5\xee6Xi\
-\x84\xe3=\xd8(\xe5\x10\xebC\xb7\xdca\xbd\xc7\x9e\x90\
-\xf5kV\xe2\xa3/\xbe\xc0\xd0\x01\xfdp\xec\xf0\xd1\x88\
-\xa5\x11\xae\x09\x01\xec\x5c\x00\x86\x8f\xac\xdc\x94\x87\xf7>\
-\x1c\x87\x94\xe4d\x1cq\xfc\xe9T[\xba\x9f\x97\xe0\x16\
-\x0e\x8c\xc4\xbe\x18\x17\xc0(0\x8a\xac\x889\xb3\x92\xd6\
-\x0c\x8a\x09\x9a\xa8y0!\xd6\x11\x01\xacHh\xf9c\
-\x1c\xc8\xee\xc6\x83\xe1p\xbd@N\x06a\xa5\xc5\xc9\x07\
-\x9d\xa5\xa2d\xc5\x1e\xe9\x17\xdd\xb1p\xa5\x95jcU\
-\xad\x8e\xf7c\x88\xdc\xcf\x02\xb6\xad\x88\x1b\x8eu\xd2;\
-\xb4\x87h\x5c\xe4zs%.,\x90\xe9W\x9c\xc4\xa7\
-kj\xb2#\xae\x1cg\xf5\xd0=\xe1r6\xab++\
-\xf5x\x8a\xb4\xeaz\xa6\xa5\xe8\xb9{\x1e\x93\xada8\
-\xcc-\xcc\xfc\xec\xf2\xa6\xf0\xa5\xd9\xdd\xf1\x9fG\x9d\xe5\
-Ahzw\xd3\xa4Z\x1e\x1c\xda\x82XZ\xd0J\xd8\
-1)Q\x1b\x09;\x8b\x13\xcf\xe3q~\x12G\x90\x05\
-QX\xe3S\xeb\x8b/@\xf1\xd9\x10.gYs\xbc\
-R\xb2\x88v\x0a2g\x8c\x8a\xd3\xed\xba\xabkg\x18\
-\xbc&v\x87q\xcc\x0b\xc5\xadv\xefJ8\x0d\xd6+\
-\xb9\x1aqD?y[\xd9\x95F\x81\xcf\x87oO\xf3\
-[$\x8c\x03\xaf\xb1@\xae\x8f\xa6}\xde{\xb5\x94\xc9\
-~\xe6?\x16`\xbc.\xb5\x22\x0a\xbb\x0cK\xe2\xca\xd4\
-\xe1\x18;6$8\x8e\x93C\x12\xd8-\xcd\x09A|\
-N\xf6&\xbe;\x83qv\xfd\xe6\xf7\xad\x90x\xb1\x03\
-\x97\xc5\xb3\x16\xd6\x11\x91hj|\xe8'\xd3\x87C%\
-\x98^\x1c\xbb\xc4\xbd|.\xdaJe\xc6.\xcb\xbd\xbb\
-\x1b\x0d0,\x16\xb6k\xe49d\x0b_\xe3,\xfbX\
-\xe69\xdd`\x1c\xc2\xe04xy\x9c\xe5\x06\xf3)\xad\
-\xbb\xdaX\x91h\xa8EB`\xe3\x84\x8b\xcd3~\xcc\
-\xab\xbc\x97\xf4\xabyb\xda\x00\xfd$\x1cO\xbd\xbc\xdc\
-)\x0b\x986\xbd\xd3S\xf5\x99\xdcUx<\xdf\x99\x94\
-&\x0dP\xa9l\xd5j/g\xb9\xfe\xb0|cC\x9b\
-]m\xfb\x22\xfe$\xd2_\x96\xb5:\xa6[\xe0_n\
-N\xd9\xe2\x08\xd3\xbd\xb1\xee\xfc\x10pR\xce\xc9\x0f\xec\
-\x85a\xef\x1aw\xf2^\xb6\x97\xb28MD\xc9\xce\xee\
-\x22\xcf\xe7Q\xd7\x9fZ)\xfb9a\xa4P\xfcc\x03\
-\xdd\x1d;\xc8\x06\x907*\x1a\xe9\x22<\xb2\x13\xe24\
-\xbfS\xe4\xb8\xe7\xef\x09\xee\xb9j\xf1\x93\xb06I}\
-[\x16\xe4Z\xban\xb9\xcc2\x9e]\xd2N\xb9\xcfz\
-\xa7VD*\xe3\xe6\x8a$\x1a\x86(\x02[\xc6{\xc5\
-\xbf\xad\xebB\xf7\x9a\x08\xf7\xebo\x09\x8buZ\xe4\xa4\
->\x8a>\x969\xda\xf8\x13G*|\xe9V\xe0\x15j\
-\x1d\x10\xde\xc10\xf9\xcck\xd7\xb9\xfc\xa7%\x95\xd9\xd7\
-\x09\x97]\xc3\xd2\xb0g\xaf\x99\xe8%\xd6\x83\xcc\xbf<\
-52^[!a\xd2\x9c\xc3\xb2\x9c\xe2\x8f\xf1 \xbc\
-\x12\xea.\x1a\xdd\xb8\xcaJ\x8d\xd4\xc7c?\x9e\x80\xc2\
-\x92B\xfc\xe4\xd4\xd3\xd1\xb6e\x1byPv\xe8k=\
-\xbb\x14\x80<<n\xe2\xa7X\xb4t\x19\xfa\x8f8\x06\
-m:u\xd0\xc2\x8b\x95+/B\xfb\xda\x19\x90\xecs\
-\xaa\xc2}\x83S\x0c9\xf1a\x82:m\x18^\xa3\x13\
-ns\xb4:x\x83\xb9$\x05\xdf\x9c\xc1\x81\xe8\x5c\x92\
-\xa6\x83<$jw\xa3\xe7\x12\x063C\xbeT\xaa\xcc\
-dJHB\x97\x9b\xad-\x0d\x8a`q\xd3<8\xe3\
-\xe2V\x96Wi\xc5\xc2\xebeF\xef\x94,\x15\xb8<\
-h[\xdf\x5cg\xfc$\x0b|\x9a\xea\x99&\xdd\x92\xe5\
-\xe1\x96\xd6\xc6\xbe\xc11E\xb3\xa2`%A1\xc8\xae\
-#W\x92Q\xbc\xe8\xdd\xd0\xfbDX8x\xd0C\x04\
-,\x97\xdf\xd9\xdd;\xc5;\xad\x1b\x1f\x06\xd9(@9\
-<\x80\xe2\x9b\x95-o\x0e\x93\x9d\xe5\x02\xc3\xe6\xf5s\
-\x19\x1f\xae\xf3\xc8\x82\xcey\xcd\x1f+\x0e\xa7\x95\xa8\x1d\
-\xae\xe1|\xc4\xb5\xe7hqU\x13\xbe\xfcfJ;\xdd\
-\x94Nn\xd6\x07\x5c\xe2\xce1\x8f|S\x0a\x0b\x19\x16\
-l\xee\x83\xdb\x5cy\xde\xbd>Vv\xec\xc2\xa7EP\
-\xd7\xd0d\x9c%\xee\x19\xba<Q\xe4\xfa\x90;JC\
-\xe7\xba\xd8\xda_+\xc2\x85>\xb0\xb2L\x89\xf6\xa2#\
-\xf3\x0e\x0b\xab\xad\xf2\xce\xa1\x88\x93\xffX\x11\xd1\xa2\xc1\
-|\xe8\xa6S+y\x06\xd9-\xa5\x12w\x0f\xaf\x93\xf7\
-\x82\x7f8\xc6\x86C*\x9c\xa1\x0b\xf4+J\x04P\xbc\
-\x8e\xd1\xe4}`\x1eh \x5c.\xe9=\x8c\x98\xd4&\
-;\xe9J\xfd\x14(Z\xd8x\xd0\x09r\x92\xaf\xe8\xc5\
-\x9e\xc5r\xc70\xac\xe5\xe5\x15\xda\x98a\x12t\x922\
-\x8ccK\x9b\x0a\xcfg^\xa4\x15\x9c\xddM\xda\x08\x95\
-\xbdN\x5c\xa5\xc2\x95\xc6%\x85\xa06\xe4\xc2i\xb0\xb7\
-\xd7\xe0\xa6\x0f\xe13\xcer\x8c\xf7\x97V\x0f~g\xda\
-F\xc2\xe7\x8e\x0d\x19\x0e\x05a\x1d\xe4\xdc\xea\xbd\x8d\xc5\
-\xce\xd1tq\xbe\xee\x10\xc6`\xdf\xc6b7\x90\xc82\
-\xbe\xecY`~\xe0w\x8a'6^:&%!\x81\
-\x02D\x1d6\x1d}\xd2\xe4\xfe\xb0\x81\xc3z\x89\x0dV\
-v\x85\xf2\xa2\xe5\x09\xd02\x98\xda\x80C\x83(\x04\xd9\
-K\xc2:\x91a7=]\x1c\xd7*\xfc$\x0fsB\
-#\xcbz\xcd\x03\x0cG\xf6\xd3\xea\xc8q\xc3|\x96\x18\
-\x9e[\x1eSwqB\xde\xfa\x8aj\x14p\x0d\x5c\xfd\
-\x07\xb4\x91\xb8\xd0\xbdk\xa4\xa2[\xad\x03\xc2\x9f\x14V\
-\xbc\x0e\x8a>\x1a\x98\xf8\x1c\xb3Fc\x98\xd1\xf2\xec\xd3\
-\xe0\xc0\xb3\xe8\x9b\x8e\xef\x93g\x97\x06\x1f\x1a\x1b\x5c!\
-\xb7=(\x5c)\xdeh0b/\x0cS\x9c1\xe5s\
-\xc3|Ka\xca|\xect\x0d3L\xc7\x1f\xd77\xd6\
-u\x14~\xec\x09uK\x12\xba\xed(\xf5;\xeb$\xfa\
-\xc3\xd10$w\xe3z\xbc\xf2\xde\xbb8\xa2o?]\
- :\x8e\xf5\xff\x0e\xe2\xe5\xb2S\x01\xc8C[\x0a\x0a\
-\xf0\xe2\xd87\xd1\xbeM{\x1c\x7f\xf4\xb1\xf0&$\xd4\
-w\xbdEz\xbe\xf3`\x9a\x87\x1dFTh\x9e\xf0\x9d\
-\x96\xc6*\x11]\xb5j5qT6\xdfV\xc2\xb1~\
-\x14d\x1c<\xab\xdd**r(2b\xa4\xd2a\xf7\
-\xec\xee\x8f{\xdc\x15\xbc^Z\xa3VKE\xce\x09\x03\
-\xcc\x83\x5cR\x87\x0bE\xbbV\x1c\xba\xe1}b\xbc\xd8\
-j\xe7\x1e\x1e\xeb\x9a\x92\xac\xf7i_\xc1p\xddke\
-\x85\xc7\xcaN\xbb0\xe5\x89\xa2\x98\xe2\x83\xc5\xd0\xdd\x16\
-\x9a\xce\x1e\xdb\x03\xf1\x17\xc9V\xf7_\xae\x99Vav\
-\x93sb\x03\x050\xbb\xa5\x9d\xf6\x92S\x188\xee\xe5\
-/\xc5\x9c$\x9ecvwf\xb7Q\x04\xd2*\x86(\
-']Y\xbf3f\xba\xc9\xc3\x9d$\xf9\x9b\x85\x0c\x97\
-\x0dJ\x93{\xebN\xe4q\xe3\xb0\xe7W\xb1c\x5c\xbf\
-\x19\xbf\xc2\x1ag\x89$Z\xbc\x19A\x1e\xa3\xa0\xcd\xd6\
-\x0a\xcf\xe9N$\x91\xf1`\x9as\xdc\x0e\xc5\x07\x1b1\
-\x8e qfRs\xfc\x17\x87E\xec\x8bx\x1f\x08\x9c\
-\xb4r\x86%pfs5_\xe5#\xbf9\xbe\x90\xdd\
-,l\x8c\xb1\xabeO`\xeb\x7fs\xb5O+\x1e\xb5\
-6H\xa21\xed\xe9'\xf3\xb1K\xe3\xb4t\xef\x9f\xbb\
-\x9f\x15\x09\x1bH\x9c\xd4\xa6\x13\x86\xc4/\xba\xe1\xc6\xbc\
-\xc5.U\xc6\x91\xb3\x99yVs\xdc\x1b\xfa\xcd\x8ay\
-\x854\x06Y\xa9\xb1\xc2\xeb)e\xc1\x9e\x0c\xcd\xa1_\
-\xac\xec\xf3\xa4l\xa1\x18s\xac*N\x1a\xb3\xf4Q\x8b\
-&+Ai`\xed\xae\x10T\xbf#>Y\x86\xb0\xec\
-\xadfY\x22\x0dJ.I\xe2\xa4\x16\x8f;\xf9\x7f\x1b\
-d'K\xe1\x16\xf2|r\xa1p\xe6sw\xdd\xcd\xa6\
-\xc4\xc3\xf5\xb3\xb1\xdb\xc8\xb0\xdc8R\x10p|\xb2+\
-\x0a\xb6\x07\xcb\x176\x0c\xf8\xd9\xd8\x0f\xb2\xa3\xf0\xf6\x09\
-\x12\x18\xads\xcc{l\xc40\xff1\x5c\xd6\xdb]\x93\
-E\xfcIY 7\xcdq\xbb\x9b\xe8uHz\xf0\x9e\
-3]\x987\x8a8!A\xca`\x0e\xf3p\xcaX\xba\
-\x92gQ\xea+\xe6\x116\x9cY/\xb9B)2\xe4\
-\xc8\xb4\x22|nX\x87p\xcc/\xcbw-\xab\xc3\xf9\
-\x8e~\xd00\xc3e\xd2\xdca,.\xf4\xd3\xfd\xcd1\
-z\xab+\xaaT\xd4q?\xcbF6\x5ch\x81\xe7R\
-o\x14ZlXp\xd2$M9\x0c3|aN\x1e\
-\x92\xf8s\xb8\x0f\xc7\xf3\xb9z\x87qg\xd8\x5c7\x93\
-V77\xcf\x93\xc6\xd7\xb0\x15\xe2\x17\xeb\xa7M5\xd5\
-\xdau\xcd\xbcN\xf7\xfc\xcb\x12\xb9\x05\xcb\x01)\x03\xd8\
-M\xec\xa4\x8fc\x85\xa4\xce\xd8\x22\x02\xbbV\xca6\xa6\
-)\xa3\x95,\xe5\x10\xad~\x14\x7f\x8a\x1b\x05\x09\x83\xfe\
-\xbe;\xe1\x03\xe4\xe5o\xc2\xf9g\x9e\x8dv\xadZ\xed\
-\xf2\x1e\xefX\x00\xcanvKM\xfc\xe6k\xccZ8\
-\x1fg\x9ft*zu\xef\xb1\xd5\x0d\xe4\x89;\xf7\xfe\
-\xd0\x83\xd7\xc4V\xef\xfa*Z\x01\x9d\xabc\xe6\xe5\x8c\
-(v\xa598\x19\x9c3|\xdd\xb5\xf1\xf6E:0\
-.\xdc\xb8\xbc\x0d\x97\xd9\xe1\xfd`\xd8\xac4\xd8=\xcd\
-\x8c\xc9\xe3\x95\x92\x89W\x89Hd\x0b\x83\x19\x85\x13\x08\
-(Z\xf7\x9d\xfc\xdb\x16\x8d\x99\xa4\x89\xd3zwmW\
-Nk\x903Z\x9b3}\xdc|\xe7~2LZf\
-\xab%\x1dJ\xa5\x92bE\xc5\xcaO\x8f\xcb\x1f\x8dK\
-8\x02\xe2Tq\x0b\x14\xe7Y\xaf\x93B!Z\xc7%\
-\xb2U\xc6\xaej\x0a@N\x96pO\x0c\x9f\xbe_\xe1\
-5\xb1\xf0\xe6\xdb\x5c\x18G\x168\x8c3\xe3\xc6\x86\x09\
-\x0b\x0d\xb7 b\x1a\xb0 V\xcbhX4\xba\xe2\xcf\
-m\xed\x1f\x88k\xd8\xd7\xf0\xdeR\xf4n\xa8\xaeV\xab\
-'\xef\x14\xe5B\xbc\xa4I\x07\x0e\xe1\x90{\x19YP\
-\xef\x0cf\x0d\xe6\x8f\xcd\x22@\xd6\xeb\x22\xea\xfc\xe7L\
-tbO\x00\xd3\x9045\x1dy.\xdd\xb2`f\xe3\
-\x88K\xb2\xe8\xd8:=@\xe9\xc2.\xaah\x9d\xc9\xcc\
-\xe7\x95\xe5\x0cq\xcf\xdbS8\x86o\x8d\x88b\x9ac\
-8\x06\x98\xcb@5e8\xc4\xce\xe03\xcd!&\x14\
-\xc5\x0d\xf1s&\x14Qp3?\xb2B\xe6~\x1ew\
-q\xc3l\xbc/\x9c\x04\xea/\xc7\x95\x95J\x1e\xaf\xf4\
-\xb3a\xc6;\xda\x10\x02\xbfQP\xb1\xacs\xcb\x11>\
-\x17Z\xc6\xa88\x97\x12O<\xe2\x144\x0aR\x96\xc7\
-\x91V\x9e\xa6\xe0\xc6\x91\xf09c\xe5\xcb\xf2\xc3\xb5r\
-\xb1\xdb\x94A\xb1|\xa558R\x00r?=`\x16\
-s\x86\xbfH\x99\x22\xff\x98W\xd8\x0dJ+/?\xf5\
-\xd9uN\xd9\x8a\xc8\xb0\x9b\x0dfb\x81\x82\x8c\xc6\x03\
-wE\x8dx\x11@\x1d\x93\xe2\xb5L\xd0\x087#\xac\
-\x0fY\xee\xb0\xd1Z\x5c\x1b\x00G3\x13\x86\xc2\xb0\x99\
-\xff8\x1e\x96\xc3gh5\xa3\xa0r\xa3\xc0\xd8r\xf8\
-\x15\xc7\xd9q\x9c-g\xa5s\xc9)\x15\x91\xe2\x86\x1f\
-\xbc\xbf\x9c\x08\xe9\x0a?\xb2\xab+\xa0\xc0\xcb\xadt\x86\
-2H\xb1)>8y\xc5\xb9\x7f\xfc.7OT\xb2\
-\x8eg\xd43\x04\xf9\x12+q\x8b\x93\xc8\xb1\x9e\xa5\x05\
-\x93\x8dmG\x9c\xc9\xf1p\xa4w\x15\xb6\x0b\xfd\xa5[\
-~2o\xb1\x91S(\xcf\x11\xad\x93\x8c\x87s\xcc\xe9\
-\xb5\xe2Z\xb0\xae\x00dO\x10{9X\xc2\xf1\x83\xfb\
-[\xc59\x93\xe5\x18\xbf\xed\xd5\xed\xf4\x7f\xc9\xca\x95\x18\
-\xf7\xd9\x04\x0c\xea\xdd\x0f\xa7\x1cs\x9cDW\xfc\xdbI\
-dw,\x00%\x02\xeb7\xe5\xe1\xed\x09\x1f\xa2\xad(\
-\xc9\xb3N:\x0dqR\x10\xee\xc9\xebF\x0e%\x98\x18\
-\xacL9\x0b\x97\x95)-D\xa1:\xde\x18\xc9,\xcc\
-E\x82\xbe\x95@2#+\x17.\xaf\xb0\xd3\x14\xde[\
-$B\x8c\x13\x1f\x8c\x95\x15\x9c\xbd\xc5}\x9c\x00\xc15\
-\x99\x9c.N\x8e\x87\xaaR\x0b\x883\xc9\xa2\x93\x14\xf8\
-4S\x1f\x08\x18\xd7\xc6\x19j_\x0bQ'<V\xa8\
-\x8e\x10RA(\x0f\x1a?\xf9\x90Q\x10j\x17/\x09\
-'\x0b\x1f\x0c\x8a'\x0a>'==j!S+\xa1\
-l\xf4s\x7f\x0a\xe8\xed\xc2B@>\xd8}\xc0\x89\x0f\
-\xce=\xd6\xe2\x82\xd9R\xad\xab\xda\xa5.\xf1e\xe3@\
-g\x13\xb3V\x95|\xca\xf8\xb3+\x94\xf9\x94\x93T\x0e\
-\xf8\xb5\xecCx\xad\x1c\xa8^(\x05=\x87p\xd4I\
-\xe20\x8dXM\xa4\xc9\xb3\xda&\x89\xe3d\x1ck \
-\xcb\xc3\xed\x22y\x80\x15?\xd7\x03\xe5lw\xe6\x1bV\
-\x10<\xbf\x93\x08IV`{\x0a\xe3G(\x1eh\xd1\
-\xe7\xd8EZ&\xb8\xdfi\x888]\xc3\x14Rl\xdd\
-;]\xc3zT\xcfk*,\x1bh\xa5ZSY\xa9\
-\x82\x8a\x15\x9e\xbe\x01H\xf2As\x94\x06\xac\x90Y9\
-\x17\x8a@f\xa5\xca4r\x85\xac\x8e\x8b\x94\xb2\x88\xd7\
-\xc0\xb1\xb8n\xb9\xa8\xe9\x1dN\x00\xde\x15\xfa\xc1|Z\
-&\x1b\xc5\x15\xd7o\xa5\x98SO\xd4\x1d\x05\x943h\
-\x9e\x13\x0b8\xb6\x9b\xc2\x8f\xfeke&\xd0\x0f\x0a\x06\
-\xa6!\x87\x9f\xb0\xb2\xe4\x11^?\xcbCZ\x9c\xf8\xc6\
-'V\x94\xdc\xcfr\xc1\xc1\xa9\xe85\xde\xf2\x8d\xe1R\
-\xe8\xb1g\x87e\x84#\xe6\x9c\xc6\xa4\x9f\x93\xdcxc\
-$2\xce=\xe2\x17\x86#\x9b>_\xe2'\xff\xcb9\
-|\xe6\xb8/\x14\x9e\x99N\xf4\x1cy\x5c\xbd\xf2|2\
-ND'\xc9yEP\x88\x00c9\xc3\xebt+|\
-\xa7\xe9\xae^\xee\x1d\x8c\x82|p5\x0bZ\xc0h\x91\
-\xe3EP\x84vLL\xd0\x06\xc1\x9e\xe7\xe4\x9d\xc3p\
-\x99f\xbc\xaf\x5c\x05\x80+\x1c0myU\x8e\xf0r\
-,^\xac\x9b\xdc\x1e,\xc2\xf38\xb6\xd0\xb1\x8cq\xaf\
-\xf3\xc9o\xb4\xa8\xba\x96f\x0a1\xa6WS\xd3\x88\xfe\
-\xb2\x5c\xe4$>\x8e\xd7g\xaf\x9e\xde\xd30\xf4\x87\xbe\
-\xb1\x1ce\xfe\xe2:\x87\x0c\x83B,r\xa8\x0f\xaf\xa0\
-\xb9\xd2\xccM#\x8aeN\xd0\xe3d6644.\
-\x12\x16s\xa8s\x85L/I+\xf9\xc6\xe7\xa0E<\
-\x85\xbbk!\xdc>\xec\xa5\xac\x94\x86\xf0\x84\x89\x9f#\
-w\xe3\x06\x5c\xf9\xd3\x8b\x91\xb1\x8b\x19\xc1\xdb\x15\x80\xdc\
-\x11\x94V\xc3\xe4o\xa7c\xea\xac\x19\xb8\xf4\xc7\xe7\xa1\
-C\xdb\xf6z\xcc}\x08\x0fw\xd8\x0dTT\xe3\x0cv\
-\xe5\x0db\x9aP$p\xfc\x0f\x07\xe6\xef\xcbA\xd0\xdb\
-\x10\x0e\x9f\x16\x0eZ\x84\x9c\x87\x9a\x193\x9cq\xc2\x7f\
-\xd9\x1agW_\xe4\xc3\xf5Cc\x9b\xcc\x1c\xc6M\x8f\
-\xc8{\x16\xe9\x96\xfb\xdc\xdf\x07c\xda\xb1b\xe7\x82\xc8\
-\xcc\x03\xce\x1a]r\xf7\xb5b\x92\x83\x12a\xe6\x01\xcd\
-\x91Rh\xb0\x85\xcc1_\x9c\xe1\x17y\xbd\x87;L\
-\x0b\x0eE\xe0\x12\x09\xb4\xb8\xb1\xa8be\xcf*\x8fc\
-\xf7h\x81p\xad1n\x9a0}X S\x0cp<\
-!\xc7\xda\xc8c.8\x93\xdb\x98\x86j\x09n\x86T\
-t\xef\x05\xc3\xe3\xb8:60\x1d\x11\xc2#\xc4\x99\xd8\
-\xa0\x93~\xa4\xd0\xe7\xda\x97\xbc\x06\x9e\xe3\x9e\xbb3X\
-Q\xb1\xdb\x8c\x15?'^q\xa6\xb5\x0e\x05\xe15;\
-N\xf6\x12'\x16\x8c?\xc5\x17\x97\xabbW\xad\x8eP\
-\xd6Kp\xca\xa3\xb8(\x0a\x1dN\x14a\xc3\xd9\xb9\x07\
-\x84\xe3\x99(\xf8\xd4:\x1f\x14\x7fD=\xf1\xfa\x98\xdc\
-\xbc'<\x8f\x15p\xb64l)T\xdc\xb1c\xdb\x83\
-\xe1\xf0\x18\xc5${k(x\x9cI[N%\xca\x09\
-\x09l\xd0\xb1\xab\x93iJ8^\x98oI\xaa\x96O\
-V{,?9^L\x1e#\xc5\x9d\xe1O\xb1\xc2\x14\
-\xe3q\x1eb\xa5\xcb\xb8pb \xc3u\xe1q7'\
-\xb9\xfbYWPthL4\x92\x0c+|T\xfc\xe5\
-7Z(9\x04@\xdfG/e\xb5k\xf9\xa1\xd0U\
-\xa9\xa8'6\xf8\xe9\xb2\xa3\xb4 \x1a\x94ll\xf4R\
-T\xf0e\x00\xb4\x80q\x1f\xf3\x11\xd7\x83\xa50o\xec\
-gs\xc3\xf0\xdc\xb8P\xd0\xb1\xa1\xc0W\x10\xd2z\xca\
-\xf8\xf0\x08SA\xafE\xff\x84\xcf\x09\xa7\x0d\xcff\xbe\
-a\x9a\xa4I\xdad'x5O\x10\xd7\xef\xdd\x85\xe7\
-1\xcf2\xaf\xe8[\xae$^\xbc\x97\xeeD\x15\x1a\x02\
-(4#\xd3=\x1c\xb5=\x0aoW\xd4_\x87|\xa1\
-a\x82e:{\xf1\x98F\xe1\xdd\x0a{z8\xe4\xc4\
-\x1d\xe3Z\x7f\xdeN\xe0l\xe1E+\x96\xe2\x83\xcf?\
-\xc5\xd1G\x0e\xc3\xc8!C\xe1\x09\xa7\xdf\xf6\xd8\xbe\x05\
-Pv\x95\x94\x95\xe1\xcd\x0f\xc7ia\xf8\xf3\xf3.\xd2\
-\xf7\xfd\xfeP\xc4_$\xcc\xc4*\x00%\x95X\x900\
-\xa34\xe5F47z\x93$\x12l\xa9r\xa1h\x0e\
-\x8e\x0e\xefU\xf8\xc6\x05\xbeq\xc4\x1d\x8b\xf8C\xa7q\
-\xa6v\xefW\xe4\xbd\x8bts(\xe4lV\xa4\x5c\x8e\
-\x86\xaf\xec\xa3\x80\xe0\x18\x11\xfe\xae\x0b9\xadXN\xc6\
-\xa2\xe5#9\xdcM\xd2\x5c\xad\xd6C\x06I\x1f\xdeS\
-Z\x87\xb6H%\x98/\xad~\xd7:\xc3\x02\x94\x82\x80\
-\x16\xbd\xf48g![\xa6\x0f-ZLK\x0a']\
-\xc4]<\xa00\xe1\xa2\xd4\xb4\xa0\xb2\x22\xda\x17\x99\x83\
-E=\xad\x96\x14E\x5c\xaf\xaf4\xbc\xfe(\x03\xe3?\
-\x8a\xceLo\x9c\x8a!V\x80\xae\x86 \xdb\x8d\x8e\x94\
-\x0d\xf4se9\xad\x7f\xce\xa41\x8eYd\xd7\xf5\xbe\
-\xc9\x07\x8e\xc5\x94]Z\xac\xe4\x9d\xb1Z\x8e\x95\xdd\x8d\
-\x9f[\xa5\xbb8\xd2L\xf6\x85\x1f<~\xb0Q\xcd\xae\
-6\xae\xe7\xc8.J\x0e\xc3`\xe5Lx6\xddl\xf7\
-z\x05\x1e\xe3\xc6\xc6\x11\x17V\xe7K\x09X\x91\xaa\x15\
-\x5c\xcer\xc2\x13\x01'\x89\xa7\x8d\xa5\xfa}\x0dq\xd0\
-\x1b.\xffy\x84\xe9\xc7\xf2]{\x03(\x0c$\x8fp\
-ad\xce\xdc\xd4\xb2_\xf6EV\x81\x14\x15<\x8f\x1e\
-\xb8u#\xc5\x85Z\x10yo%\x1f\xba\xd6D\xe7\x8e\
-\xb8\x81\xba\xd7\xc4ku\xacL\x8e\x10\xe1\x84\x02\x8fZ\
-\x0a)\x06\xddqg.\x0dgo\x0b\xaf\x8bb<\x8f\
-u\x03'\xc7\xf1\x0dNr\x02\xc5\x1f\xd7q\xa4\x98\xda\
-*\xf2;\x80a\xb8\xae\x22\xbf\xef.n\x5cy\xbev\
-\xa73\xaf\xc8\xbd\xd1I=\xf2\x9b\xe9\xc3\xb2\x8b\xf0U\
-\xa9\xb1r\xdf\x99\xe7\xd9E\xccnW.0\xed\x0e\x89\
-\xd8\xd38\xb8D\xa6[\xa4_\x8d\xf7G\xc6y\x7f\xe1\
-\xa61\x17\x94\xa7\xce\xe0\x0f~\x90\xc6\x8d\xd5\xa6@9\
-WQU\xa9\xaf\xeb\xa5\x18<\xef\xf43\x91\x9a\x92\xba\
-C\xed\xb6\xad\x00\x0c\xff\x9a\xbbx\x01>\xfer\x22\x8e\
-\x1fu\x14\x86\x1e1\xc8\x89D\x132\xd0\xe1\x06\x93\xc3\
-M ^\xfd\xc1\x90\x02|xh>\xa6\x18$\xac\xfc\
-\xd9\xcd\xc3\xb1\x88\xfb\xa6\xb07\x0e\x06\x9c|\xe8T:\
-,,X\x01\xa9\xb5A*\xb8X\xb9\xf1\xae\xa5\x82\xcf\
-\xe9\x0f\xefI\x8d\x80i#\x1f*\x0a\xaaku\x1d?\
-\xa7[XRE\xc42\xbb\xa0X\xa1\xb3\xc7\xae\x96\xb2\
-E\x8b@'u\xb9\x14.-\x7f\x9c\xd5/\xce\x84}\
-\x97\x92n\xb9B!\xe8vg\xead\x11)\xb8\xdd\x85\
-\xae)\x04\xd8\xad\x9a*\x158\xc7\xa6R(\xb8\xe7\xb9\
-h\x0ce'\xc7\x80\xf2m;\xb4\xfbP\xd7p\xd6=\
-\xadL\xfb\xee\x1a\x1c1\xc5|\xc8n?v\xc1\xd3\xca\
-\xc3\xee-\xb9\x04\xb9\x0d\x8e\xf0\x22\xba8\xae\x5c\x13\xe3\
-\xcf\xc6*\x05\x16+\xfat^\x93\x94[\xeeu\xedi\
-\xf9\xc5s]\x8b\x13\xbb\xd9)\xbc8\x8eLom\x04\
-\x12\x8c\xa6\x06\xadL:\x0eM\xfe1L~\xe7B\xc8\
-1\x12_\xe7\xfd\xe3\xce\xf3\xe4\x0a0z\xd3\xc8\xab\xed\
-B\xd7\xdc\x18.\xef\x83\xfb\x8cr9,\x8a\x1f\xe65\
-Z\xa2\xd8\x1dI\x0f\x99,[\xdfQ\x89\x91\xfcT\xd1\
-I+\x95\x08BZ\x82\xdc\x0a\x9c6H\xe6_\xc6\x99\
-~q\xe3\xd9\x14\xe2\xbc\xff\x14~z\x91\xb2\x93k\xd2\
-\xf2}\xf2\x89\x92\xc6MIW\xc6\x99i\xc8\x8d\xe5\x08\
-\x17\xea\xe7}\xd9[\x18?n\xf4\x89\xe9\xc1\x8dy\xde\
-\xa9\xbd\x9c{N\xab\xa8{mL\x0f\xa7\x94\xdb\x1a\x8a\
-\xc8byFJj\x03:\xf1\x88\xe3=\xdd7B\x1d\
-\xf2H\x02i:E\x5c\xf4\x9e\x5c\x19\xe5\x1c\xfd\x995\
-g6>\x9b2\x19g\x9cx2\x06\xf4\xec\xbd\xc3\xf5\
-Q\xb7+\x00\x83\xa2\xcc_\x19\xfb&\xaa\xa45\xc1\xd9\
-$Y\x99\x99\xf5\x0f\x82qp\xc1\x9bgw\xe6\x87\x87\
-\xfb\xd0F\xde{\xcb\x0b\x0d\xb8i\xc1\x0a\x92\xdd\xc2\x9c\
-\xc0\xc0\x19\xa6\xee\xb2A\xac\x84\x08\x8b5V5R\xcf\
-JE\x1b\xa3k\x09r\x08\x85\xd6\xc2\xfb)5\xdd\x90\
-X\x14S\xc0\x14\xd5\xf8P)\xe2\x85\xdd\x93\x8c\xa6\x8e\
-\x0f\x93O\xceb\xcc\x8a\x8f\xd5\xf8\xb1b\xa6\x88\xe1y\
-l\x0cp\x9c\xe8\x06N\x14\x93\xef\x14\x0b-\xe3\xe2\xd1\
-.i\xf7\xdeg\xbe\xa7\xd4\xc7_\x7f8\xcbW9K\
-+\x89\x98\x90kP1!\x15;\xadQ\x14~l\xb0\
-2\xe1\xddx\xb9\xe77\x17\xac\x029\x80\x9eBFg\
-\xeeJ\x9c(\xc6\xb8t\x07\xe3\xc2\xe0\x19\x1f\xf7\x9d\xd3\
-.\x91\xf1q\xd9\xd3xm\xcf\x0f\xf7:\xd9UMA\
-\xc8a\x0a\x1c\xab\xccn\xf1\xfa\xf8\xca\xa7\xd3|!\x22\
-\x85\xf4$W\x10\xb9\xbe\x86\xbf\x87\x056\xe5 \xf3\x8e\
-\xdb\x8d\xca\x09m\x1c\x1f\xce\xa5z\x9ajA\xa2\xcf\xf9\
-\x955XUR\xa5\x16;\xe6\xaf\x9c\xa48tMK\
-Tq\xb6\xa7\xe9\x10\x89\x1b{\xd2\xd8\xbf\x86+\xdb>\
-L\x91\x22i\xcc-,\xacP\x91\xc8\x9e\xae\xaei\x09\
-\x88\x93ga\xb7\x84\x12\x03\x8a\x0c\xa4\xf1\xefC\x9dp\
-B\x96UV\xe0\xbfo\xbe\x8aV-Z\xe1G'\x9c\
-\x84\xa4\xc4D\xb9\xcem/t\x1b\x01\xc8\x9fy\x9b\xf3\
-\xf1\xbf\xb7\xde\xc0\xe0\xfe\x03q\xc2\xa8\xa3\x10+\x89\xbc\
-#\x13\xa2q`9\xdc\xf2\xafa4;R\xa6\xf9d\
-\xa3u\x8ak\xe3\xb1\xe2ee\xcbg\x87\x22\x8a\x16\x16\
-V(\xce\x02\xe2\xcdS\xd9\xed)\x8c\x13-\x80\xec>\
-\xe4\x8cJ\x8e\x9f\x0a\xbf\xecJ\xe2\xe5\x88;\xda\xad\x18\
-OZ1\x19WN.\xd1\xb5\xcb\xe48\xf5-\xc7\x0c\
-uIJ\xd2\xee\xd4\xfdY:\xb8e\x11?w\x86\xeb\
-f_\xc5l\x9bxl'\xb0\xed\xc5s_\xc5\xc7%\
-2\x1an\xd8*Ne\xe3}\xe3\xd8\xee\xda\xb0\xa5\x90\
-\xf9\x93\x96B\xae?'\x87\xc3\xee\xc3\x7fE\xf89b\
-P|c\xcb \xec+\xbb\xae\xb9.^\x16\xdf\xca\x14\
-\xbb\xf3\x09\x03\x91\xd0\x07\xce\xc0\x9d\x99_\xac\x93V\xda\
-$\xc5\xab\x0e\xe02[\x1dS\x12u\xe8\x04E\x96\xb3\
-\x1e\xa63+;R\x0f\xa8UO>\xe9Fs\xe4v\
-\x83\xad\x93\xf3\x9dCt\xc7\xf3]\xe9\xe1\xf8\xd5p\x9d\
-\x1ao\xf9\xe1\x1cu\x1aq\xdc\xc7\xb5\xfd\x96\x17U\xa1\
-ov\x1229\x1bV\xaeWN\xd6\xe3\xf4\xcb\xe9\xa2\
-o\x08|\xabx\xc9~\xfa\xc7\xe4\xa2\xcfl(\xf1:\
-v\x1c\xdfC\x17\xa6\x05\xaf\xfd\x93I\x9fa\xc9\xcaU\
-\xb8\xe0\xccs\xd0\xbeu\x1b\xe7`\xa3k\xddF\x00\xb2\
-\xf0\x994\xed\x1b\xcc\x98?\x17\xe7\x9f\xfe#t\xe9\xd0\
-q\xabD5\x0c\xc38\xd4p\xaa\x13\xa7\xd2q\xba\xcd\
-\x9c\x7f\xac\xdaX9\xb8\x15\x04+\x8b\x03\x8d[ \xb3\
-\x10\xa7\x08\xe0\x0a\x00|\xf5&\xdfN\xe3\x5c\x09c-\
-U[\xb8X\xd6\xdfr\x12\x05 \x97\xac\xa1\xe5\x8f\xdd\
-\xab\xc6\xc1\x0f\xef\xb5{\xbf]Q\xe7\x08\x1a\xc7RH\
-!\xc8a\x01\xfc$\x9aO5\xff6\xc0\xfa9QD\
-\x9a\xf3\x86\x16'?\xefN\x8dM\xbf\xb8\xe0\xf2\xd4\x8d\
-\xc5\xc8J\xf4\xa2WF\xf8U\x91r\x80\xa2\x8a\x16\xdd\
-\xf5\x15U(\xa8\xe6:\xaf!]K\xafcj\x82\xbe\
-\xe7\x96\x0d\x94u\xe5\xb5(\xf7\x05E<F!;>\
-\x06\x9dR\x934\x0e.\x8c\xfb\xfa\x8a\x1a\xe4U\xd4j\
-\xbcZ$yEX&`\xa3\xecc\xbe\xee)\xe1\xb1\
-+\x97\x02\xaf\xb4\xc6\x8f^Y\xc9(\xae\x09\xa8E\x92\
-\xefU\xdf\x5cU\x8bVr\xcez\x09\x87\x96e.\xec\
-\x9f\x1e\x1f\xab\x16\xca\xfc\xcaZ\x14T\xf9\xe5\x1a\xead\
-\x9f\x84-\x82\x95\x13\x90\x98fkK\xab$^NG\
-s\xa7\xf4D\x9da\xcf\xb1\xaak\xca\xaaP%\xf1M\
-\xf4F\xa3\xb5\xf8\xc1\xfd\x91\xf1=\x1c\xe0=]\xb9f\
-5\xc6~<\x1e\xc3\x06\x0e\xc2Q\xc3G:\xf9\xa2\xd1\
-unU\xdeq\xd0`ee9V\xad[\x8b6-\
-Z\xa0M\xabV\xbb\x95\x91\x0c\xc30\x0eFX%\xb2\
-,c\x01\xe8X\xcf\xb8\xb6\xd7\xd6\x15\xe6\xc1 \xfe\x88\
-\xc6S6\xc6\x8b3\x97\xdb$&\xa0gZ2\xba%\
-'#;\xceY\x0e\x22:\x8a\xe3}\xdd\x7f\xce\x045\
-Vd\x5c\xf3/I\xc4\x80qh\xe0\xe6;nn\x1e\
-\xa5e\x8a]\xd4\x9c\xfc\x93\x12\x1b\x8bV\x09\xf1\xfa\xda\
-6n\xec\xd6m\x17\xfe\xeen|\xb7zV\x1c_\xbf\
-\xe6X\xfd\xe8\xc7\xee@\xf7\x09\xd1Qh\x91\x18\xab\x02\
-l^A96\x888\xa3\x00\xe5\x984\x8a\xacue\
-\xb5*\xfc\xda\xa4\xc6cK\xb5\x1fK\x8b+tr\x0b\
-W\xca\xe08\xc5\xb6)^\xed\xde_YR\xad\xdd\xdb\
-\x91\x94\x88\x9b5\xa5\xd5H\x8b\x8fF\x87\xb4xuG\
-CS\xa9\x88\xb1\x12\x11h\xb4\xc6Ql\x96\x88\xe8+\
-\xe5\x1a\x82r\xba.\x97$\xe1\xac/\xafV\xc1\x17'\
-y\x9e\x82\x938\x13d<\xbat\x0c_\xfd\xd6Q\xe2\
-\xd4R\x84+\x85 \xd7\xfd\xa3\xe0\x5c[Z\xa9\xf1\xa6\
-\x18\xa4\x88,\xad\xf6\xa1\xc2\xe7\xc7\xc2-\xe5\xba\xdc\x0f\
-\x05,\xaf\x9b\x16E.\x13\x13)\xa8\x0f\x0b$\x0dr\
-2\xb3\xd0*\xab\x05\x16,]\x02\x9f\x8f\xe2{\xdb\x9c\
-\xb1uI!\xc77\x17\x16\xa2\xb0\xa4\x18\x9d\xdaw@\
-\x827\xde\xd9i\x18\x86q\x18\xc0\xd2\xacq\x89v\xb0\
-\x96p\x91\xf1b\xc5\xcenj\xbe\x02\x8aK=u\x91\
-OgK\xd2E\xe1\xbb\xc8\xbe\xf6\x89\x89Z9\x8a\xca\
-\x0d\x9fe\x1c\x8al/\x8f6\x95==\x8fK\x85t\
-OOVK[\x8d\x88*\x8e\x05\x5cVR)b.\
-\x80MU5j\xdd\x936\x86\x9a\x968\xb2\xa0\xdc\x1f\
-D\x94\xech\x97\x9c\xa0\xe2\x8b\xf9\x93\xd0bH[\xb4\
-\x0b\x85\x15wq/\xc5\x1a\xc5-\xd7\xe5\xa4\xc5\xcf9\
-\xa3\x01\xe7wX\x04\x8b\x00\xe6\x88F\x0a\xc6\xde\x19\x12\
-/i\xdc\xb4H\x8cS\x17\xedRE\xf8\xca\xc6\xa5\xae\
-\xba\xa6'H\xd8@\xac\x88C~\xfa\x03\xce\x22\xde\x14\
-\x92\x1c/\xdb-=\x09\xbd2\x93\xd1A\xdcS\x982\
->j\x1c\xe79r\x02\xc5\x22'\xd0\x1cn\xf0mV\
-\x89II\xe8\xd4\xb1#J++\xb0q\xf3&\x11\xd9\
-[\x0bs\xd2 \x00E\x82\x07\x83A\xac\xdb\xb8\x1e\x01\
-\xb9\xb9\xdd:w\x09\x1f0\x0c\xc30\x0e\x14N\xc5\xe8\
-|\xb2\xc0f\xe5I\xabF*g\x07\xcb'\xc7}\x1d\
-\xaeoz1\x9c\xfb\xbe\xabmo\xa1\xdcJ\xf6\xc6\xa0\
-\x87\x88\xad#rRU\x1c\x15T\xf9P%Z\x80\xc2\
-\x89\xc2*\xbf\xa2\x16\x1b\xcb\xf9z\xc4:\xc4\xc7F\x83\
-k\x91n\xa8\xac\xc1\xfc\x82\x0a\xac\x97\xfd\xecn\xa5\xc0\
-\xaa\x8b\x98\x5c\xc3\xb8\xa5\x8b\xbfmR\xe2Th-*\
-\xac\xc4\xb2\xd2*\x04\x82\x8e\x18s\x85#\xf5\x07\xbf\xe9\
-$\xad\xf0.~\xd0ZO1\x18y\x95\xd1\xb4\x18\xca\
-'g\x9d\xcf\x93\xb0\xd7\x96Uk\xbc8\xe1\x87\x07h\
-M\xe4d\x1a^\x83N\x94\x12\xe1C\x8b!C\xe4u\
-\x96\xd6\x04\x90+\xe7\xf0\x93\xafHT\xd1J\x0f\x0f'\
-\xe4\x92XNtl\xddV\xc4{,V\xac^\xa5\xf7\
-\xad1\xf5w\x8a\x87*\xab\xaa\xb0&7\x179\xd9Y\
-\xc8J\xcft\xd2\xbc!\xdd\x0d\xc30\xb0\xe2\xf1\xab\xb5\
-+\x95\xdb\xe8\xc7W\x84\xf7\x1e\xfc\x1c\xcc\xf1^1\xa1\
-\xe9qc\xa1\xbd\xbd\xcd0\xf6\x14.H^P]+\
-\x22\x01H\x8a\xf5 +\xc1\xab\xdfi\x8fK\x8es\xd6\
-%\xec\x9f\x9d\x82Q\xad20\xb2u\x06\x06f\xa6\xa8\
-\xa0`7kZ|\x0c\x86\xb5LG\xab\xa4\xf0\x1bg\
-\x1a[\x9a$OwNI\xc4\xc8\x96\x19\xc8I\xf4b\
-\x93\x08I\xae\x01\xe8\x15\xf1U+\x02\xb3\xd2\x17\xd4W\
-$R \xb2\xeb\x9b\xa8\x98\x13UB\x11\xa3\xd20B\
-\x87\xd4\x89\x1b\x0aH\x0aR\x8e\x09\x1c*\x82u`\x0b\
-\x8aV\x11{\xe2\x8eC\xd9t\x89'\x11\xa8\xb4`r\
-\xbdJ\xfaO\xb1\xc9\x89(mR\xe21B\xaec\xb4\
-\x5c\xc7\x109\x97\xcb>\xf1\xbc\xc3\x0d^RN\xcb\x1c\
-\xb4m\xd9Jt\xdd:\x14\x97\x96r`\xb1s0\x8c\
-Sn\x84otiY\x09\xb6\x14\x16\xa2k\xfb\x8e\x88\
-\xe1R\x08\xdbQ\x8c\x86a\xec\x82\x15\x8fc\xb4\x94(\
-n\x85\xae\x95\xfa\xd5\x13\xc2\x07w\x80\x08\x80\xad\xcf\x19\
-\x8d\x83U[-_\xf4\x5c\xf8\x1b0u\xd1\xf2\xf0\xb7\
-\x03\xc9\x0aI\xbe\xd1[\xa7\xdf\xe8\xd1\xb8\xfa\xf1\x09r\
-\xa4\x81\x83/\xde\x11,[\x10\xfeb\x18\xfb\x17V\xf3\
-|#\xc5\xfc-\x15XXX\x8e\x85E\x15\xd8XY\
-\xa3c\x029\x99\xa8Mb\xbc.W\xb3\xb2\xb4\x0a+\
-\xcb\xaa\xb0\xb8\xb8\x02k\xca\xab\xf5\x5c\x8a\xae\xb2\x9a\x00\
-V\xcb\xb1\xe2\x9a\xf0|\xf5F\xcb\xebp\xa2\x08\xc7\x0c\
-\xf2\xdc\x0a_\x00\xc9^\x0a\xcah\x1d\xdb'\x0f+\x96\
-\x14WbyI\xa53\xe3\x99'\xa8\x1e\xd1\x0f\x9dt\
-\xe2\xe2\xccnu\xf6yD\x04&\x8aP\xa5\x08]U\
-V\x8d\x95%\xce\xfa\x97j\x9d\x948\xe7$yQ$\
-\xf1Z\x5cT\x89\x05rMyU\xb5H\x92\xb8&\xc5\
-x\xb0ID\xeb\xf2\xd2J9\xafJ\xad\x91\xbcv\x0d\
-\xf70\x83\xd7\x14\x17\xebE\x97N\x1dP\x5cV\x86\xc2\
-\xa2\xa2m\xaeS\xef\x14\x93\x9d\xffr\xf3\xf2dO\x14\
-:\xb4o/\x07\x0eCIl\x18\xfb\x83\xe5\x8b05\
-\xfc\xd5e\xeas\xf7\xeeD\xd0\xad\xc0\xe3\xf7>\xd7\xe8\
-\x9c\xa98\xd84\x8aK\xf7>W\x85\xbf\x01\xa3\xfat\
-\x0f\x7f;PL\xc0\xd5Q\xddq\xc6sS\xb7N\xbf\
-\xa9S\xf1\xdc\xb5g\xe0\xf2\x88D?\xb8\xe2\xbd\x8f\x88\
-l|H\xa3\xe3 mC\x18\x07\x11\x92Ut\xe9\xa0\
-\xae\x19\x89Z\xffS$tKKD\xaf\x8cd\x9d|\
-\x91\x13\xefE\xdf\xacd}[Ga\x0d_\x95\x18\x85\
-\x96\xe1W\xb4u\xcfLBj|\x0c\xaa\xebB\xe8\x90\
-\x9a\x80\x0ei\x09\xf0\xd2\xc3\x08\xf4\x15\x8c\x22\xf6\xf8\xb6\
-\x9d\x8c\x84X\xc7_97G\x84eg\xba\x17\x7f9\
-.\xb0gz\x12Z%{uB\x13\x97yi\x97\x1c\
-\xaf\x0b\xa0\xd37n|\x83O\xc7\xb4x\x15q\x1cK\
-\xd8!9\x01\x1d\xd3\x13P\xe6\x0b\x22S\x8euMO\
-Dv\xa2\xb3<L\xa7\xd4D\x1d\x1fHA\x98 B\
-\xb1\x03\x17\xc4\xf6\xc6\xa0ov\x0a\xb2%\x0e\x8c\x0b\x17\
-\xceN\xe7\xbb\x99\xa3\x0fO\xb5#%\x80\xfe\xeb\xdc\xa1\
-\x93\x96\x07\xeb\xf37\xc2\x1f\x08PI\x87]4\xea9\
-X\xb3!\x17\xa9\x89I\xfa\x02\xe1\x10\xcd\xb8\x8dn\xa4\
-a\x18\xbb\xc9\xa8Q\x18\xa5_\xa6\xe2\xcd\xf1;\xa8\x8e\
-'<\x8ck\xc3\xeae\x94\xb8?\xd8\xe9v\xcd\xb3\xda\
-\x1a\xe76\xe5\x9an\xe1\xbd\x07\x86\x09W\x9f\x01\xd7\xae\
-7\xea\xb1\x8f\xb0<\x1c\xaf\xba\xe5\x1f\xe1\xb1\xab\xb6N\
-\xcb\x83)\xde\xfb\x85\x05\xcb\xc2_\x0cc\xe7\xb0{\xb4\
-\xbd\x08\xaeAY)\x18\x9c\x9d\x8a\x0e)\x22\xcc<\xce\
-\xb8\xd2h\x11H-E@\xf5\xcfL\xc1\xb0V\x19\xe8\
-\x9b\x91\x22b\xcc\x8b(\x11\x82|\x93\xcb\x00\xd9\xcf.\
-a\xbe=\xa7\xbb\x08/\x9d\x88\x14\x01-r\xdd\xd2\x92\
-\xf4\xdc\x9e\xf2\xc9\xf7\x5cSZ\xf0\xd5o\x9d%\x9c\xe1\
-\xb2\xbf\xbd\x889N\xea\xe8\x91\x9e\xac\xe2\x8e\xe3\x06\xb9\
-\x1c\x0d\xddj$\x844\xaf\x17\xdd\xe5\xfcD\x11\xab\x84\
-\xe2\xb4kj\x12\x86\xb6LC{\xf1\x87~\xb4\x93x\
-\xd2=\xd7.d\xb7\xf309\xc6\xf8&H<)\x82\
-\xf86\x9d\x9e\x12\xc6\xb0\x9c\x0c\x0cn\x91\x86v\xe2F\
-_=x8\x9a\x005\xdd\xea\x90%z.'\xab\x05\
-\xd6l\xccEeM\xd5V\x97\xaaw\x8a\xee\x02\xa2\x0c\
-7o)@\xb68LL\x88\x97}\xe1T7\x0cc\
-\xcf\xe9w!.\x0c\xeb\x90\xa9\xd7>\x8c\xedu\x04O\
-x/,aF=\x86[/t\xbe\x1aMa\x02\xdc\
-\xa4\x93\xc4\xc3\x85g\x9e\x8ezY\xd7\xedt\x5c\xf3\xec\
-\x94\x1f\x86\xd03\x8c\xe6\x80\xaal\xab\x8d\xfb\x9cC\x0a\
-\xf7\xe9gx#\xdb\xb8w\x0f\xec\x00\xd7\xad\x8b\xfb=\
-r??\xdc\xdf\xee>\xe2\xeeoL\xa4\xbb\xad\xdc\x87\
-\xf7G\xee#\xba/\xfc\xa9\xbf\xc3\xdba\x8aG\x84|\
-\xc76mQRR\x8a\x8a\x8a\x0a\xbdnW\x04\xd6K\
-\xf5\x82\xc2\x02Q\x87\xd5h\x93\x93\x838o\x9c\xaa{\
-\xc30\xf6\x96\x1e8\xd3U\x80x\x0e\xefm\xa3\x00\x1b\
-D\xcc\xa8\x0b\xcf\xc4\xae:&WLx\x1cW\x8f\x1e\
--\xcf\xb04\xd1\xdcm;\xe3\xdd\x22\xd9\xads\xea'\
-#p\x0c\xa23\xb6\xae\xfew8\xee;\x9a\xb0\xb0\xe2\
-q\xd7\xed\xd5*t\xe9.r\x5c\xde\xe8\xab\x1f\xdf~\
-\x1cWL\xd86~\x91\xdb\xe8\x1d\x9c\xb7\x9b\xecV\xbc\
-G7\x84?Z\xc2\x9f\x10v\xbe\xcd\xb1\xed\x5cS\x83\
-\x7fQ\xd8f\xe8\xe7\x0e\xe2\xb03V\x84\xd3\xa7\xf1\x18\
-Q\x8e+\x8d\xf4a\xc2\xd5\xb2\xbf\xfb\xb5\x0d]\xe1S\
-\xafE\xf7\x1d\x84\xd5\xdcy\xc28\xf4\xb1\x1a\xff\xf0D\
-\x9eTth\xd7V\xd7u\x5c\xbfq#\xea8\xae\xb2\
-\xce\x91\x80*\x00\xf9u\xf5\x86\x5c\x9d\x0e\x9d\x93\x9d\xad\
-\x0f\xb7a\x18\xcdC\xb73/\x0cw\x03\x8b\x04l\xa4\
-\x00W<~o\xb8\x0b\x93\x16\xac\x9d[\xabX\xf1v\
-?\xe3Z<7\xb5\xd1\x08\xc3\xf0x\xb7\xee\xdb\x11J\
-{r\x8e\xcb\x9b\x97;c\xeb\x1c\xa6bQ\xf8\xdb\xae\
-',,\xc0\xbd\x22\x92\xba\x9f\xb1\xf5\xb8\xc6\xa9\xcfQ\
-\x908\x22\xab\x1e\x8a\x8b\xeegl\x1b\xbf&\xd1\x1d}\
-\xea{y\xa7\xe2\xda\xee\x22`D\xa9\xed\xe8zv+\
-\xde\x11\xd1\x99*B\xea\x8c\xeeW\xe3j\x11X\xdb\x1c\
-\xe355\x93@\xdd\x1e\x14\x93\xdd\xc3\xe9\xb3u\x0a\xc9\
-\xef\xe7\xe4\xfe5N\xcf&\xb0O\xf2\x84a\x18\x07\x1f\
-\xa2\xe58\x9c/#-\x03\x19I)X\x99\xbbZ\xb4\
-_\xc3\xc4\x1a\xbeE\x1a\xc1@\x10\x9b\xb6\x14 )9\
-\x05\xe9\xe9\xe9\xe1C\x86a4\x0b\xdd\xce\xac\xef\x06\x16\
-\x05\x18Qa\xaf\xc0\xf87\xc3\x95\xe9\xa8\x0b\xb1S\xfd\
-'B\xa9\xbe\xe2\x1du\x15>Z\x1e1\xd6\xcd\xf5[\
-\x84J\xe4\xa4\x87=:\xa7\x1e\x11\x18\x8d\xf4A\xd3q\
-\xce\xad\x1f\x93'\xe15\x0c\xc7\x8b\xb4\x82:\x93_\x1c\
-\x1a\xe2\xb7\xfc\xa3\x88\xc9\x1a\x8f-G\xdd\x94k\x1a\xba\
-v\xb7\xa2\x1b\xae\xb9\xb5\xc1-\xc3}\xee\x8c\xee\x22\x8a\
-\xb6\xb5\x8e5\x8dp\xbc\xaf\x8a\x88w\xf8\x08\xe3\xfd\x9c\
-Du\xbb\xc7$\x0d\x1f\xde]\x15\xb6;\xc8\xbd{\xec\
-\xa3\xe5\x0d\xe3\x1b\xeb\x967\xdc\xbf\x88\xf4<\xfdY\xc6\
-\xeb\xb1\xfa\xc6\x06\x87\x14\xb8\xe7\xd4w\x85\x1f\xb0<a\
-\x18\xc6\x81\x80\x16\xc0\x84\x84xdegcKA\x11\
-|>\x7f\xbd\xb5\xd7\xc3Y2\xd55\xd5\xd8\x5cX\x80\
-\x9c\xac,\xa4\xa7\xa4\x9a\x05\xd00\x9a\x95n\xdb\xef\x06\
-^1\x1e\x0d\xfa\xef\xcc\x1d\x88\x1c\x12)\x94F\xe1\xb1\
-\x17\x9f\xc5\xe9\xaec\x8eu{\xb1\xa1\xd2o\x18g\xb8\
-'\xe7l\x8b\x0a\xb0\xb0\xe8x\xf6\xf4\xf0\xce&\xc0\xf3\
-\xa6\x5c\x13\x1e\x93'\xe1\xddP\x7f\xfd\x9c\x9b\xe0\x8a\x8b\
-\xe5X\xe4\x0a\x8a\xab\xce\xad\x8f_\xb7\xd3o\xa8\x17#\
-\xbb\x5c\xae\xe5\xf4gU06\xf8N\x5c\xeb\xd8\x1e,\
-\xa5#\x02o\x8a\x5ch}\xbc\x1b\x94\xd6N\x8f5\x5c\
-S\xf3\xd2\xed\x9a)\x22\x80\x9f\xc55\x928\xee\xed\x93\
-\xbd\x11\xf9iw\xc2>\xb0y\xc20\x8c\xfd\x0f\x87\xf3\
-\xc5{\xe3\xd0\xbaE\x0e\xaajk\xb0E\xb4^\xfd\x18\
-@\xaa\xc3\xf2\x8a\x0aTTV\xa2UV\xb6\xb3\xfe\x9f\
-a\x18\xcd\xcaV\xdd\xc0\xf7:]l\x13\x1ev\xc7k\
-\xed\xaa\xfb7B(\xa1\x1fz4v\xda\xad\x87\xecu\
-Y\x00G\x0f\xec\xc99\x8d\xa0\xe0\xa9\x9fD\xb1\xb3\xf8\
-\xed\x9an=\x1aBk\x10u\x11]\xb8\xb4\x8c\x86\xe3\
-\xb0\x22rVt\x13\x96k\xe9&\x22p\x8a\x88\x11\x15\
-\x82\x0d\xbaH`\xb7\xf0\xeeu\x916\x0e/2\xde;\
-;\xb6/\xe1\x18\xc0\xc7\xaf\x1e\xbd\xd5\xd8\xc3\xeen\x02\
-\xed\x16\x07W\x9e0\x0cc\xff\xc0Y\xde\xadZ\xb6\xd0\
-%v\xd6\xe5o\xd0\x06\x9c\xee\xe7\x9fr\x11\x7f\xbe\xda\
-Zddf\x84[v\xae>4\x0c\xa3Y\x88\xec\x06\
-\x9e\xfa&\xc6K\xa5^?\x83uW\xdd\xbf+\x96I\
-u\x1cfT\x9f\xedL\x14\x89\x1c\x0b\x17fO\xce\xd9\
-\xefDv\xe1>\x873\xba\x87\xc5\xcd\x19\x0dV\xaa]\
-\x8d\x8bl\xa0\x9b#\x04\xa7l\xdd\x85\xbc\x95\xc5\xf5\x10\
-\xc4\x1d\x03x\xeds\xcd\xd0\xfdzH\xe4\x09\xc30\xf6\
-\x05\xe9\xc9\xe9HIM\xd5\xe1~\xc1PP'\x82\xe8\
-\x0a\x88\xa5\x15e\x08\xd4\x85\x90\x9e\x96\x11vj\x18F\
-\xf3\x12\xd9m7\x15o^\xeeN\xfe\xa0\xfe\xdbY\xf7\
-\xaf\x10i\x99\x99\xba\x08\xdbv\x8an\xc7\xb2\xb3'\xe7\
-\x1c\x00\x1a\x96\xc0q\xd7K$\xf2\xfd\xaa\xc7\xf0\xd1\xf2\
-)\xd8\x93U\x5c(\x04\xb7\xd2\x80\x87,\x13\xf0p\xbd\
-\xa5o\x94\x8e\x03t\x1b\xe8\xcb#\xbb\xa6\x9b\xca!\x92\
-'\x0c\xc3hf\xa4a\x9d\x9c\x94\x84\xac\x8c\x0c\x14\x14\
-\x17\xa3\xaa\xaaZ\x17\xc9\xf6pe\xe8B\xd9\xc1\x17\x06\
-g\x88:d\x970\xff\x19\x877j\xe5\xe5\xf6\x03g\
-\x7fZ\xbb#\xbb\x81\xa7\xd6\x9bs\x9ab\xe5\x8a\xb4\xcc\
-l\xa7kn\xbb\x96\x9d=9g?\xb3\xe2q\xb8C\
-\xd2\xae\xba\xf0EL\x91{\xe1\x08\x9c)\x98\xf2\xec5\
-\x0d\xe3\xd3\x0ea\x1a\x8f\xcf\xab\x17\xbcM!\xf2\x1e]\
-u\xab\x8e\x03\xdc;\x0e\x81<a\x18\xc6>!66\
-\x16\xadsZ\xa2\xac\xb4T4_\x11\xa2\xa4\xea\xf3\x04\
-\x02~\x94\x95\x97\x89:L@RB\xa28\x93\xbd\xa6\
-\xff\x0e{t\xa2\x0f\xb7\x1f8\xfbu\xc2Sd7\xb0\
-\x0b+\xf6]\xd6\xeb[[\x0f\xaf\xbd\xbca]:p\
-|\xd8\xe5\x0dk\xbf5X\x13\xf7\xe4\x9c\x03\xc7s\xd7\
-v\xd7{Q\xbfq\xdd\xbb\xd1W7\xc4y{\xe8k\
-\xcf\xc2k\xd7E\xb8\xe3Z}\x0d\xbd\xc8\x8f\xe1\x86\xfd\
-<Qa\xab\xf1\x8e\x9cL\xa1qs\xd6\xcf\xab\x8fW\
-S\x88\xb4\xd8m5F\xf2q\x5c\xbe\xa31\x80\x8d\xad\
-|\xee9\xfa\xf7\xd0\xca\x13\x86a4\x0fn\xcfA\xab\
-\x169\xf0\xf9}(\xad(G\x9d\x94\xb3\x9eZ\xbf_\
-\xbb\x80\xf9\xfa\xb7\xfdZ\x19\xfeP\xd9\x8f\x16'\xe3`\
-c\xeb\xd9\x9b\xe4\xaas\x9b\xa6N\xba]\xf3\xe2V\xcb\
-t\xb8\xe3\xe5\xb8\x86^\xfd\x84\x89\xad\x06\xe8\xef\xd99\
-\xfb\x95n\xd7\xe0\xd6F\xafk\xabg*\xc7\xbc9\xe3\
-\x02\xb7YLy+\xc2k\xd7\xb9\xd7&[\xe4\x18\xc2\
-\xc7^\xdc\xd1\x122\xfb\x90\x88Y\xcc\x0dc\x1b\xc3\xeb\
-\xe7m\xd5\xd5\xbd+N\xc7\xb9\xf5]\xd9\x91c$#\
-\x16{\xde\x86\xed\x9f\xe3.\xebr\xd0\xe7\x09\xc30\x9a\
-\x1dy\xc2\xf5_ZJ*bbcQRV\x8aP\
-(\xc8.`?jjk\x90\x99a\xe3\xffv\x97\xc8\
-\xee\xc3m\xbeoO\xe7\xc9~\xf6\xbb\x1b?\x1cF\xf5\
-\x09\x7f\x09\xd3\xed\xcc[#\xd6\x96\xbb\x0aM\xd4\x7fB\
-7\x5c3e{3]\xa9)\x9cu\xe2\xb8D\xc9\xd6\
-\xec\xc99\x0d4\x8e{={9\xfb\xb5\xc1\xdf\x09x\
-oAXu\x88\xe8p[\xa9\x5c^\xe4\xa3\x881n\
-\x8d\x17\xcf\xaeG\x04\xe4\x8b\x1f=\x86\xab\x1a\x8b*\xfe\
-\x16\xff\x96\xd75\x1aC\xb8\xa3x7\xfbl^'\xdd\
-\xb7~\x17\xf1(\xb9D\xb9\x17Snm\xb0\xd0E\xb2\
-\x838\x9c\xfe,\xd3b\xebenx\xef>\xdaj\x8d\
-\xc2\xad\xe19\x8d\xc3\xeeW?\xa0o\x1f\xe5\x09\xc30\
-\x0e^h\xdb\x93-3=\x03I\x09\x09\xd8RT\x04\
-\x9f\xdf\x8f\xa8\x0d\x9b\xf2\xeb^y\xe7M\x8c\x1a<\x14\
-\xa3\x87\x0dw\xdcJ\x8b\xd00\x9a\x03V\xe8\x9a\x9b\x98\
-\xa7(~-o\x19at\x86\xab\x9a\x9dF\xe1\xb1\xc6\
-\x13>\xd8\xbd\xeb\xbe\xd6\x8c\x0b\x1a\xefp1h\xc30\
-\x0cc\x97\xb0q-\x1f\xaf\xbe\xfb\x16j\xfc\xb5\xf8\xc9\
-\x19g\xc3S]]-\xbb\xa2\x90\x94\x9c,\x7f\xf9\xcf\
-0\x9a\x0fmL\xb8\xa2\xcf\xc4\x9f\x11\xc1\xf2\xfa)\xa7\
-S\xf1\xe6\xf8\xc87w\xac\xb0\xf1h\x86a\x18\xcd\x88\
-\xdb\xf7\xc8\xde\xde\xea\xea\x1a\xf8|>x\xca\xcb+\xf4\
-@b|\xbcs\xd40\x0cc?pz\xc3`5L\
-\xe58>i \xe8x\xb4\xa8\xee\xf5\xe3\xd1h\xfd{\
-\xd1\xc6\xa3\x19\x86a\xec\x1dacLNV\x0b}#\
-HeU\x15<\x15U\x95\xf0x<\x8e\x00\xb4.:\
-\xc30\xf6\x17\xa7?\xeb\xbc\x83\xf6\xaam'F\xb8\xe3\
-\xd1v\xfc\x1e`\xc30\x0c\xa3\xa9Dq8\x96H\xbc\
-\xd4\x94d]\x00\xba\xa4\xb8\x18\x1e\xbe\x07\x98\xadn\xae\
-\x11\x13\xda\xee\xcc\x05\xc30\x8c}\x04\xdfA\xfb\xec\x94\
-\x885\x00\x9dmJ\xf8\xfd\xb7\x86a\x18F3@\xe3\
-\x9e\x94\xad\x5c\xee/::\x1a\xe5\x15\xe5\xf0pQ\xc0\
-\xe4\x848\x11\x80^\x1b\xffg\x18\x86a\x18\x86q\x18\
-\xc2i \xf1\xf1qH\x8c\xf3\xa2\xa8\xb4\x18\x1e_\x9d\
-_\xc4_\x9cv\x03\xdb\x14\x10\xc30\x0c\xc30\x8c\xc3\
-\x0fj\xbc\x98\xe8X\x11\x81I()\xab\x80\xa7\xa6\xd6\
-\xc7\xbd\xcef\x18\x86a\x18\x86a\x1c\x96\xb0\xfb7>\
->\x1e5\xbe\x1ax\xfc\xb5\x01\xc4y\xe3\x10\xe3\x89\x0e\
-\x1f\xfe\xe1\x10\x0a\x85\xc2\xdf\x1c\x22\x7f\xf1\xbb;\x22R\
-\xbf\xd7\xd5!\x10\x0c:;x@6w\x1f\xfd\xd9\xd1\
-\xb9\x84\xee\xb8\x004\xdd\x05e\xe31~\x8ft\x13\x89\
-8\x15w\xe2>\xfc\xdb0\x0c\xc30\x0cco\x89\xf5\
-\xc6\x22))\xd1\x99\x05L\x99\x11-\xe2\x8f]\xc0?\
-4\xf4\x9aEmQ\x88q\xd3\x14\xa0\xfar\xbf\x0b\xf5\
-\xfb\x85\x18Q\xce\x0e\xee\x19\xce>\xfaC7\x14z\x84\
-\xdf9\xdb&\xecD'\xd9p\x9f\xba\x0b\x87\xc9\xcf\xed\
-\x19]\xe9\x07\xc7jF{\xe4\x9c\xb0\x7f\x07\x8a\x03\x1b\
-\xbaq \xa8c\xc3\xe4\x00\xe7;\xc30\x0cc\xdf\xe0\
-\x11\x81\x91\x10\x17\x0f\xbf\xdf\x0fO\x8d\xdf\xe7\x88\x12\xaa\
-\x8e\x1f\x22r\xdd[\xf5\x80G\xa4C\xe4\xfe\xad\xde\x8e\
-\xc2\xef</r\x9f\xb0\xb5\x9b\xf0\xe6\x12>\xa6\xbb\x1b\
-\x9d\x17\xc96\xe1\x1c@\x0el\xe8\xc6\x81 \x8a\x0d\x93\
-\x03\x9c\xef\x0c\xc30\x8c}\x83'\xca\x838\xafW\x0a\
-\xfbhxh\xe6\xe1\xac\x90\xd8\x98\x1f^\x17\xf0\xe1\x86\
-v+\xcbf\xa6;\xc30\x0c\xc30\x1a\xc3\x06\xbe7\
-&\x86\xdd=\xe1\xdeM\x13\x0c\x87\x05\xda\xad\xac\xd6\xdc\
-\xf0\x0e\xc30\x0c\xc30\x0c\xe2qz.\xbdq\xce\xca\
-/\x8e\x004\x0c\xc30\x0c\xc30\x0ek(\x00\xd5X\
-\x14U\xe7t\x01\xeb\x84\x05\xc30\x0c\xc30\x0c\xe3\x07\
-\x81NE\xad\xb3.C\xc30\x0c\xc30\x8c\x1f\x0c\xd6\
-\x05l\x18\x86a\x18\x86\xf1\x03\xc3\xba\x80\x0d\xc30\x0c\
-\xc30~`X\x17\xb0a\x18\x86a\x18\xc6\x0f\x0c\xeb\
-\x02n\x12u\xe1\xb7#8\x1b\xbf;\x9b\xfb\xb26\xee\
-\xb7\x17\xb7\x19\x86a\x18\x86qh`]\xc0M\x82\xaf\
-g\xe3+\xe3$\xa1T\xe79BP\xff\x87\xc5\xa0-\
-\xbeg\x18\x86a\x18\xc6\xa1\x82u\x017\x01g\xb5\x9c\
-(\x11zQ\x98\xbfx\x11>\xfch<\xc6\xbf\xf5\x12\
-\xc6\xcb\xe7\x92\x95\xcb\xf5\x9dz\x8e\x084\x0c\xc30\x0c\
-\xc38\xf8\xb1.\xe0&\xa0\xfaX\x04^eU\x05\xd6\
-\xcc\xf9\x16\xf1c\xeeC\xfc\xffnC\xfc;\x0f`\xe6\
-\xe7\xef#7o\xa3\xbaR\x11hB\xd00\x0c\xc30\
-\x8c\x83\x1c\xeb\x02n\x02\x1c\xeb\x17\x0a\xd5a\xfa\xcc\x99\
-\x88z\xe7\x7f8.\x94\x87\xa32c1\xb0j\x1db\
-\xbe\xfe\x00\xe3\xde\x1d\x8b\x8dy\x1b\x10\xf0\x07\x98\x9c\xfb\
-\x85C\xd6\xe2\x18\x11\xeff\xb9\x06\x13\xdd\x86a\x18\x86\
-\xb1\xdbX\x17p\x93\xe0\xfb\xf3\x80\x9a\xf2*d\xf9\xd6\
- \x18\x0a\xa0\xa0\xb4BDa4\xfayKq\xdc\xa0\
-\x1eX\xba|%&~5\x09c\xde|\x0b\x05\x05\x85\
-\xe1\xf3v\x0c\xc5O\xe4\xb6[ls\xdeA\x22\x80\x9a\
-\x10\x8d\xfax7\xbe\x06\xf7\x93D~\xdf\x05[\xf9a\
-\x18\x86a\x18F\x93\xb0.\xe0&S\x87\xe8\xe8h\xb4\
-\x8d\x13\xb1!\xa9\xe6\x8d\x8fBum-ZE\xd5\x22\
-3!\x0e\xfd\xfb\xf6\xc3\xcc\x99\xb3p\xf7\xbd\x0f`\xdd\
-\x86\xf5\x08\xedB\x98\xf0XyE\x05*\xab\xaa\x1c\xc1\
-C\xa7\xbb\xd21a7\x15r\xce\x82\x85\x0bQ\xc5s\
-\x15*\xf8]\x9d|\x80\x91k\x0c\x06\x83X\xbb>\x17\
-%\xa5%\xa8\xf1\xf9\xb0x\xc9\x12TVVjZ\xd4\
-\xfa\xfc\xf5\xee\x9aD8-V\xae^\x855\xb9\xb9M\
-?\xcf0\x0c\xc30\x0c\xeb\x02n\x1a\x14s@mm\
-\x0d\xaa\x82Q\xf0\x07<(\xad\x89FzB46\x96\
-Gc]A\x15&}\xfd\x15\xce>\xebG\x18\xff\xfe\
-X\xf4\xe9\xd5\x0b\x9e(Z\x0d\xb75\xadR\xecl\xde\
-\xb2\x05g\xff\xf8<\x9cq\xe6\xd98\xeb\x9c\x9f\xe0\xdc\
-\xf3.\xc0\xe4\xa9S\x18\x8a\xe3($\x9f\xdc\x1a\xc1\xae\
-hn\xcb\x96-\xc3\x95W\xfe\x02K\x96.\xc3\xbf\x9e\
-z\x0a\xf7\xdc{\x1f\x82\x81\xa0s\x0eOs\xcf\xdf\x9e\
-(\xe2\xbeH\xff]7\xee\xa7\xeb\x87K\xa4{w?\
-?\xc3\xfbt\x97\xb8\xa9\x151<\x7f\xd1\x02\x14\x15\x15\
-9\xc7\xc2\xfbC\xa1P\xfd'\xc5\xde?\xff\xf9$&\
-O\x9e\x82\x8d\x1b7\xe0\xaa\xdf\xfc\x1e\xf3\x17,\xc4\xbd\
-\x7f{\x10\xbf\xba\xfa7\xc8\xcb\xcfGYy9f\xcf\
-\x9d\x8b\x9a\x9a\x9a\x86\x85u\xdc8\xf03\x0cCfZ\
-\xdev\xc7\xddx\xe8\xa1\xbf\xcba\xf9\x1d\x0e\xab\x1e~\
-\x0d\xc7s\xab\xfd\xee>n\x8di|\x8c\xe7\xb9\xbf]\
-?\xf8\x11\xfe\xea\xec\x0f\x7f7\x0c\xc30\x8cC\x04\xeb\
-\x02n\x0a\x9a@Qh\xdd\xa6\x0d\x96\xb6\x1e\x08\xaf'\
-\x84\xae\xa9j\x06\xc4\xc2\x8e\xad\xb1\xbcd3\x8e\x1c2\
-\x18\xfd\xfa\xf6A\x97N\x1d\x11\x1f\x17\xe7\x9c\xb7\x03\x02\
-\xc1 V-_\x86\x9f_\xfa3\xfc\xe3\xef\x0f\xa1O\
-\x9f\xbex\xec\xb1\x7f\xa2\xb0\xb0P\x85RyU%\x8a\
-JK\xea\xc5\x13\xe1\xf7Z_-\xca++\x10\x15-\
-\x22\xd4\x1f@\x94'\x0a\x03\x07\x0eD\xff\xfe\xfd$z\
-Q\x94D\x08\x04\xfc(,)F\xad\xdf'\xdad[\
-e\xc2}\xb5\x01\x1f\x8a\xcaJ\xc4m@\xbcw\x04\x8c\
-O\xce\xd30\xfc\xb5\xda\xc5\xed\xa2\xd699VTZ\
-\x0c\x9f\xf8I\xb7!\x11\xa1\xc5r~\x99\xc4\x85\xf1\xa3\
-\x1b\x8a\xd1?\xfc\xf1:,^\xbcD\xc3\xa6\x18\x0b\x84\
-\x82(,*F\x95\x88\xb9:\x8aa\xd9\xa2\xa3=\xf0\
-x$\xdbEy\x10\x1b\x1b\xa3\xbf\x8f\x1a1\x02\xa7\x9d\
-r\x22\x92\x93\x93\xf1\xd5\xd7\x93\xf1\xc0\x03\x0f\xa1\xb4\xac\
-\x14\xa1p\xfc\xaa\xaa\xabQP\x5c\xa4q\xd7\xf8\xba\x88\
-\x971\xd1\xd1\x88\x8d\xf1\xc0\xe7\xf3\xa3\xac\xa2B\xb5\x18\
-\xdd\xe8&\xff*\xab\xab$\xae\xa5\xf5\xfb)\xd8j\xe4\
-\x1a\x8b\xc2i\xe4\xfa\xc7OZ(\xcb*\xcb5\x8d\x83\
-<[\xae\x81\xfbK\xca\xcb\xe4\x1a\xaa\x9d\xf4\x94\xffA\
-\xb9.\xa6AP\xe2G\xf7\xfe\xa0_\xd3\xc10\x0c\xc3\
-0\x0e\x15\xa2O;\xe7\xac;\xd3S\xd3\xd0\xbdsg\
-D{\xa2\xb5\x926\xc2\x84\xebtv[~\xf0\xd1G\
-X\xb7n-\x96\x95\xd4b\xf5\xea\xa5\xd8\x5c\x1d\xc4\xf4\
-j/\x16\xb6\x19\x8e\x91#\x8f\xc7\x80>\xfd4\xe9\xa2\
-\xa8Jv\x91\x86\xec\xba}\xe5\x95W\xf0\xd3\x8b/\xc2\
-\xe8Q\xa3\x90\x9a\x96\x8a\xf1\xe3?\xc2\xe9\xa7\x9d\x8ai\
-\xd3\xbf\xc5\xbf_\xf8\x0f\xa6L\x9d\x82\x193gc\xf8\
-\xd0#E$\xc5`\xd6\x9c9\xb8\xf3\xae{\xf0\xf5\xe4\
-\xc9X\xb0`1V\xaeX\x86s\xcf=\x17\xa1`\x00\
-\xb9\xeb7b\xd0\x11\x03\xb1.w\x1d\x9ez\xf6\xdf*\
-\xa2\xde\x1b7\x0e={\xf6@Vf\xa6\x13\x9f\xf0\xb5\
-\xcc\xfc~6\x1ex\xf0aL\xff\xf6[|\xf3\xcd\x14\
-t\xee\xd2\x09\x89IIx\xfe\x85\x17\xc4\xdfEx\xe5\
-\xd5\xd7\xd0\xbd{wdf\xa4\xeb9K\x97/\xc7\xa3\
-\xffx\x0c\x93\xa7NGQQ!\xbau\xe9\x8a\xb7\xc7\
-\x8e\xc5G\x1fM\xc0G\x13>F\x91\x08\xb3\xf6\xed\xdb\
-\xe3\xd1\xc7\x1e\xc77S\xa6I\x1a\xadCJJ\x8a\xfa\
-\xf9\xec\xbf\x9f\xc7\xcc\xd9\xb3\xf0\xe5\x17_\xca5\xa6 \
-33\x03_K\xdc:u\xec\x88\x9c\x16-$\x8e\xef\
-\xe3\x94\x93N\xd2\xf4\xe0y99-\xf0\xe0#\x8f\xaa\
-\x88\x5c.\xe1\x0e\x1at\x04\x96\x8a\xb0|\xe9\x95W1\
-s\xd6,I\x8f\x99\xe8&qKJLt.Fx\
-\xf7\xbdqX\xb1j5V\xad^\x85\xb7\xdf~\x07\xab\
-V\xadB\xef^\xbd\x11'\x22\xfc\x8b/\xbf\xc4\x7f_\
-|\x09S\xa6L\xc5\x92%K\xd1\xadk\x17\x94V\x94\
-\xe3\xf6\xdb\xef\xc4\xec\xd9\xb3\xf1\xc6\x9bo\xa1G\x8f\xee\
-\xc8\xce\xceV\xcb\xe5C\x12\xf6{\xef}\x80\x0f\xc7\x8f\
-GVV\x96\x5cC\x02\x9ex\xea\x19|\xf2\xc9'\xf8\
-\xe4\xd3\xcfQ#\x02\xbcG\xf7\x1e\xf8\xfe\xfb9x\xf5\
-\xb51\x98:m:\xfe\xf3\xdf\xffb\xc1\xa2%\x18\x22\
-\x0d\x00oll\xf8\xfe\x87#g\x18\x86a\x18\x07\x19\
-\x9b\x0a\xb6`\xc5\x9aU\xd6\x05\xbc3\x1c\x1bR\x9dV\
-\xf83\xbe\x9d\x81\x8f?\xfe\x1c\xabK\xaa\xb0\xa0\xcf\x8f\
-\xf1y\xef\x1f\xe3\xfb.'#oS5\xfc5\xbe&\
-\x8b?B\xcb\x92\xcf\x1f\xc0\xf4\xef\xbeS\xc1u\xf7=\
-\xf7\xe1\xc2\x0b~\x22B\xaa\x1d\x06\x0e\x1c\x80\xeb\xaf\xbb\
-\x06\xd7\xfe\xf1\x8f\x987\xe7{\xbc6\xe6Ml\xda\x94\
-\x8f?]w=N=\xfd4\xdcz\xcb_\xd1R\x84\
-\x12\xef\x1b\xadN\xeb\xd6\xe5J\xfcf\xa3\xa4\xa4\x04W\
-\xfe\xf2j\x11!1\xb8\xf9\xc6\xebq\xcc1G\xe37\
-\xbf\xfe-V\xae\x5c\xa5\x96\xbdP(\x88\x15\xf2\xfd\xfa\
-\xeb\xff\x8c\xf3~r.n\xbd\xf9f$\x89H\xfb\xed\
-\xef\xafEEE\x05\xd6\x8a?\xcf?\xffo\x9c}\xf6\
-Yh\xd7\xae\xads\x1d\xf2\xff\xa1G\xfe\x81\xbe}\xfa\
-\xe0\xfak\xff\x80\xd3N=\x15\xb1^/\x8e=\xf6\x18\
-\xfc\xf2\x17\xff\x87\xf3\xcf;\x17\xff|\xe2I\x11@\x8b\
-p\xceY?Bv\x8bl\xfc\xdf\x95\x97\xabp\xbb\xff\
-\x81\x07PR\x5c\x8cK/\xbe\x18\xadZ\xb7\xc2\xad\x7f\
-\xbdC~\x97H\xa4i\xa9t\xac\x95a\x83\x1aV\xaf\
-]\x83\xc9\x22\xd2(\xba\xce<\xe3tt\xee\xd4\x11\xd7\
-I\x1aPP\xddz\xfb\x1d\x180\xa0\x1f.\xbf\xf4\x12\
-,Z\xb8\x10\xcf=\xf3\x1c|\xb5\x0d\x96\xbb\x98\x98\x18\
-M\xf7\x9f\x9c{\x8e\xa4\xcd\xcd\x98$\x02\xf3\x7f/\xbd\
-\x84U\x92\xb9\xef\x7f\xe0A\x8d\xd7\xef\x7f\xf7kL\xf9\
-v:>\xfe\xec\x0b$\xc6'\xe0\x0f\x7f\xfc=~\xff\
-\xfb\xdf\xa1w\xdf\xde\xf8\xfb\xa3\xff@\xad\xf8w\xebm\
-w\x88\x98-\xc6-7\xdf\x88\xbbn\xbf\x0d]\xbbv\
-\xc6?\x1e\xff\x17\xf2\xf26\xe2\x96\x9bn\xc4E?\xbd\
-\x00\x0f\x89\x7f\xb3\xe5\x9e\x14\x8aX|\xf5\xb5\xd7\xc5M\
-\x17\xdc~\xdb_1\x7f\xde|\xbc.b\x92\xf0\xba\x0c\
-\xc30\x0c\xe3`\xc7\xba\x80\x9b@\xbf~\xbdq\xd4\xe8\
-\x918\xf3\xcc\xd31\xbc\x7f7\xf4\xf5o\xc0\xc8\xf2\x05\
-\xe8\x9dR\x8b\x8e]r\x10\x1f\xefUwM\xad\xfa)\
-\x80\x08\x05\xd1\xea5kPZZ\x8a~}\xfb\xea\xde\
-\xfc\xfc|\xbc\xf0\xc2\x7f\xd4\xba\x96\x92\x9a\xaa\xa2\xe4\xcb\
-\xaf\xbe\x960\x12\xf0\xd3\x9f\xfc\x04\xad[\xe6\xe0\xcc\xd3\
-OWq\xc6\xcd\x13\x1d-\xe2\xae\x0e\xdf\xce\x98\x81u\
-kV\xe3\xe7?\xff9\x92\x93\x92q\xee9g#3\
-;\x1b\xdf\xcf\x9d+\x01J\x88\x1e\x0f&}\xf5\x152\
-2\xb3p\xc2q\xc7!U\xfc\xbe\xf8\xe2\x8b\xb0v\xed\
-Z\xcc\x117~\x9f\x1f?\x16\xff\x8f?\xeeX\xc4'\
-$\x88\xfes\xe2x\xda\xc9'\xe1\x93O?\xc3\x981\
-o\xa8P\x0c\x06\x03X\xbch1\x9e{\xee?\x22\x86\
-\xe6j\xb7m(\x18D\x96\x84\x15+b\xacUN+\
-x\xa2<*6s7l\xc4\xbf\x9ez\x063g\xcd\
-V\xcb\x1c\xc3P+\xb3\x8a7i{\x84E\x1c\xbb\x83\
-\xa3<1\x88\xf3\xc6\xa1\x85\xf8\x13\x17\xe7E\xbb\xb6m\
-\x91\xbfi\x136o\xda\x8c\x89\x13\xbf\xc2\x93\xcf<\x8b\
-\xe2\xd22\xed\x86\x0e\xd5\x05\xeb\xcf\x0d\xf8\xfd\xe8\xdb\xbb\
-\x17\x06\x1dq\x04:u\xec\x80\xa3G\x8f\xc0\xb2\xa5K\
-\xe4\x9cIX\xbdr%\xde\x1d\xfb>\x9ex\xf2\x19\x94\
-\xcb\xb9\xabW\xaf\xd6\xf8\xbf\xf3\xce\xbbxE\x04\x5c\xb1\
-\xa4\x7fAQ1\xbe\x9f3\x07_I\x1a\xdfu\xc7\xad\
-h\xdf\xae\x1d\xdawh\x8f\x9a\x9aZ,_\xb1\x02\x97\
-\xfe\xecb\xa4\xa7g`\xd4\x88\x91\xe8\xd6\xbd\x07\xde|\
-\xeb\x1d\x1d\xef8h\xf0\x118\xfd\xb4\xd3\xd0\xb5KW\
-\x8c\x181\x0c\xeb\xd6\xae\xd3\xf8\x18\x86a\x18\xc6\xa1\x80\
-\xcd\x02\xde\x09\x14A\xdc\xd8\xedy\xc1\xf9?\xc1\xe0\xa1\
-\x83\xd1c\xedR\xfc\xa4b\x0e~\x1cX\x8fs7M\
-G\x97\x02\x11:\x1b7\xc2\x1fp\xc6\xcd\xb9\xc2dg\
-x<Q:\xfe\xed\xe4\x13O\xc4_n\xba\x11\x03\x06\
-\xf4\xc7\xb8q\x1f\xaaH{\xe4\xef\x8fj\x97\xef\xa8\x91\
-#\xd0\xa5K\x17\x1d\xd3\xc7\xd9\xc2Qa\xe1T\xc7I\
-\x07\x8e6\xab'\x18\x0c\xa9\xb8\xa2\xa5\xcf\xeb\x8dEP\
->i\x15KNN\xd1}\x84V\xde\xea\xaa*\x15[\
-\xb4R\xd1\x22\xc8\xb1\x8a\x14P\x5c\xbf\x90\xbf\xe3\xe2\xe2\
-U\xc4F^\xc3\xb9\xe7\x9e\x83\x8b~z!&N\xfa\
-\x0a\x8f=\xf1\x04\x16-^\x82\x87\x1e~\x04\xad\xdb\xb4\
-\xc2\x91\x83\x07#;+K\xc3\xa0U\x93\x13_\xe4l\
-\x0eXD\x9a\x08\xccaC\x86\x88\xd8<\x06\x17]x\
->\x9e}\xf6i\x11\x9f\x19:~N\x22\xa1\xee\x98\x0e\
-\x8dq\xc7-2\x0ee\x15\xe5\xc8\xc8H\xc7\xd1G\x8d\
-\xc2\xf1\xc7\x1e\x8b\xdf\x5c\xfd+\x11\xb8\x97\xc2+\xf1\xe6\
-8\xc2H8&O\xe3-~\xb3USYY\x85\x16\
--rp\xe2\xf1\xc7\xe2\x84c\x8f\xc15\x7f\xf8\x9dZ\
-\xf1\xde\x19;\x0e3g\xce\x16\xa18R\xbb\xcdy\xed\
-\x1c\xa3\xe8\xf3\xf9D\xc0\xc6J\xc0\x8e\xb5\x94\xe3\x01)\
-l)X9\x96\xd1\xb5\xecQ\xfc\xf1\x1e\xc4\xc5\xc73\
-Tu\xabi\xaca\xab\x13\xc30\x0c\xc38\xe8\xb1.\
-\xe0&\xc1\x9a\xdd\x83u\xeb\xd7\xa1\xf5\xba\xa9H\x12\xd1\
-\xb0\xa9\xb8\x129\xfej\xb4\xcd_\x8d\x18\x11U\x1f~\
-4\x01\x0b\x16-\xc6\x9a5k\x22\x96g\xd9\x0e\x14\x0a\
-\xe1\xf4\xa6\xa8\x88\x8d\x8e\xc69g\x9f\x85\xe5\xabV\xe9\
-\xec\xe0\xc2\xa2\x12\xedbMIM\xc1w3f\x221\
-!\x1e\xa7\x9e|\xb2\x08\xbcZ|\xf4\xf1'\xc8]\xbf\
-\x1e\x9f~\xf6\xb9\x8aE\xfaC\xd1\x13\x13\x1d\x85\xe1\xc3\
-\x87\xa1\xab\x08\xc6\x17^\xf8\x9f\x8eg{\xff\x83\x0f\xb0\
->w\xad\x8eM\xa3(\xa2@:N\xc4P\xc1\x96\x02\
-L\x9d>]>\x0bu\x1c[\xaf^=1l\xd8P\
-xDt\xd65\xca\x08\xf4{\xcb\x96\xcd\x18:\xf4H\
-\x9c\x7f\xdey\xd8\xb0~#V\xd3\x92\xe7\xf7a\x98\xec\
-\xab\xad\xa9\xd51\x82\x14\xac1\x22h\xe9~\xbd\x88a\
-Z\x94\x13\xe2\xe3\xb0|\xc5r\xf4\xe9\xd3\x07\x03\x07\x0c\
-\xd4\xf1\x88\xec\xae\xe5,f\xa7\x13\xd8\xf1\x9f[H\xb4\
-\xad+T\xa3E\x14\x16\x14l\xc1\xaaU\xab\xd1\xbdk\
-7\x15\xbe\x14\x97\x9cdC\xbfZ\xb5l\x89hIo\
-\x17\x0a\xf4\x15+Wb\xa1\xa4\xfd*I\xfbi\xdf\xce\
-\xc4\x80A\x83p\xdc\xb1G#\xd6\x1b\x8d\xe8\xd8h\x0c\
-\x16\xa1\xca\xeb\xa4\xf5t\xe6\x8cY\x188h :t\
-\xe8\x88y\xf3\x17\x88\xb8\x0b\xe9\xe4\x9d#\x8e8\x02\x8f\
->\xfe\xb8Z-ss7 A\xd2\xbdc\xfbv\x18\
-\xf3\xd6\x9b\xd8\xbcy3\xa6L\x9d\x8a\xf5r\xff/\x17\
-\x01\xca\xe0\x9d\xc6\x81~\xd1\xefr!\x8c\x8d\x13)\xc3\
-0\x0c\xc38\xc8q&\x81\xa4\xd9$\x90\x9dCqR\
-\x87\x8d\xb9+\xd0n\xd68$F\x87\xe0\x13!SY\
-\x13B\x8a\x08\x9f\x16\xc7\x9e\x83\xce\x03\x8e\xc0;\xef\x8e\
-\xc5\xddw\xdf\x8b>\xfd\xfb\xa0\x93\x08\x0c\xa2\xe2\xa0\x11\
-\xc1\xa0_\xbbzG\x8d\x1a\x89\x9c\x9c\x96\x22\x96\x12\x90\
-\x97\x9f\x87\xbe\xbd\xfb`KQ!f\xcf\x9e\xa3\x93\x22\
-\xe2\xbd^\x0c\x1e4X\xc4\xd6\x10\xed^\xfdp\xfc\x87\
-X\xb2l\x19\xb6\x14\x14\x8ah\xe9\x87\x91#\x86\x89\xa8\
-\x12\x91\x13\xe3\xc51G\x1d\x85~\xfd\xfba\xe2\x97_\
-a\xf5\xda\xd5\x98=s\x16~\xf1\xcb_\x8ap\x1a\xe2\
-X\xcb$\x1e-\xb2[ )9\x11\xe3\xc6\xbd/n\
-\xd6\xea\xf8\xc1\x9bn\xb8^\xe2\xdaA\x97`\xe9 \x82\
-\xa7G\xb7\xee\x9a\x05\xd4bX]\x8d\xd7\xc6\x8c\xc1w\
-\xe2\xd7\xda\xb5\xebp\xc2q\xc7J\x9cGa\xe5\xea5\
-*DyN\xf7\xae\x9dE@\x0eC\xdb\xd6\xaduB\
-\xc8\xacY\xb31p`\x7f\x11\x9eC0s\xd6L\xed\
-\x0a\xe6R/\xf9\x9b\xf2\xd1[D\x18\xc7*\xd2\xa2J\
-\xcb\xe1\xa6\xcd[0r\xf8px$y\xe3\xe3\xbc\x18\
-.\xfe$\xc4\xc7c\xce\xbc\x85X#\xf1\xa3\x15\xb4U\
-\xab\x96\x98\xf4\xd5d\x8d\xef\xec9s\x90\x98\x98\x88v\
-m\xda\xd6\xa7knn.\xfc\xc1\x10\x96,]\x22\xc2\
-\xf6[\xf4\xe8\xda\x15\x97_~):J\xfa\xc7\x8b_\
-\x9f\x7f6\x11k$-\xe7\xcc\x9d\x87\xd6\xadZ\xa3G\
-\xf7n\x98\xf8\xc5\xe7X+\xf1\xaf\xa9\xae\x11a\xda\x1d\
-C\x8f\x1c\x82\xe1\x92\x96\x1f\xbc\xff!\x16,\x5c$\xd7\
-;\x13m\xe4z\x86K\xdc\xbe\xfdv\xbav\x05\xcf\xfe\
-\xfe{\x9cz\xca\xc9*\xc6\xb9\x9c\x0dU\xee \x11\x92\
-\x9c\x85\x5cPX\x84\xcc\xcct\xf4\xeb\xd7O\xe3\xb4\xbd\
-{n\x18\x86a\x18\x07\x03\xee$\x90\xa8\xc7^x\xb6\
-\xaeS\xbb\x0e8\xfd\xf8\x13\xe0\x8d\x8e\x05\xb6\xd3-\xf7\
-C\xc7}\x15\xdc\x17\x13?B\xafg~\x83\xac\xd8:\
-\xe4U\xd7!1\x06X\x17\x15\x8f\xb8?<\x81\xfc`\
-\x1c*+*D\xdd\xd5a\xe4H\x11D\xad\xda\x86\xcf\
-\xde\x16\xfa\xc7.\xca\xf8\xf88\x11p\xb1\xa8\x13\x01S\
-\xed\xabE\x5c\xac\x17\xd5\xb5\xd5(.*\xd6n\xce\xd4\
-\xd4\x14\xb0+\x97B\x86]\x94\xc5\x22\x9e\xd8e\xcb\xb1\
-\x81\xb4\x94q?-g\x019\x9f\xc2\x89\xdfKJK\
-Ud\xb1\x0b6M\x84}L\xb4D\xd2\xbd\xa5uu\
-\xba\x04\x0d\xc7\x15VUW\x81\xb3\xbf\xe9\x86\x87\xabk\
-k\xb4\x01\xe0\x15\xd1\xe9\xb8u\x96;\xa9\x10\xb1\xc37\
-\x9b\xd0\x22\x96\x93\x9d\x0d\x8f\x08Q\x8e\x05\xe4\x925\xe9\
-\xe9\xe9\xba\x9fap\x91\xec\x8aJ\xee/B\xcb\x9c\x1c\
-\xed^\xe6\x22\xd7\x9b6oFll,\xb222\x90\
-\x90\x98\xa0\x13.\xf8\x9b\xa2\x94\x02\x93\xee\xd8e\x1d\x08\
-\x06T\x083\x8eE\x12\x7fZQi\xedcDJK\
-\xcbt\xbc^Zz\x1aRSR\xf4\xba\x1d\xea\xc4]\
-\xb5\xde\x1b\x86\xcderZ\x89\xa0v\xaf\x81\xdd\xb8\xbc\
-V\x8e\xb1\xcc\x90\xf0\x99&\xb4Bn\xda\xb4\x09>I\
-G\x8aP^<\xbb\xbe\x99\xedK\xcb\xca%\x9cb\xc4\
-\xc9\xf9\x9c\x90B\x7f*\xab*\xb1eK\x81\x5cg\x82\
-\xce\xa8f\xdc\xd9-\xef\x97\xf3\x19\x0f\x8a=^\x13-\
-\x99\x0d\xf12\x0c\xc30\x8c\x83\x93\xb9\x8b\x17\xe2\xe3/\
-?\x17\x01\xf8\xfc\xb3u\x9dE\x00\x9ev\x82\x09\xc0\x1d\
-Q\x17\x9et\xf0\xe9g\x13\xe1\x7f\xea\xf78=\xb9Z\
-\x04T\x10\xf1\x89\xd1\xf8<\xaa5\x96\x0c\xbd\x00\xa7\x9c\
-\xf2#\xb5>Q`8c\xe1v\x9e\x8e\x14k\xea.\
-l-b7'\xbb\x14\xd9U\x1b\x09\x05\x86Z\x94D\
-\xe4\x84\xa8\xca\xc2h\x08\xec\x82\x94x\xb1\xcb\xd5\xb5:\
-5\x8cG\x8b\xda\xca\xffz\x5c\x7f\x5c7\xe1\xb1t\xbc\
->\xed\x01\x8e\xbc\xff\xea\xacal\x9d\x1b\x17\x8e\x81s\
-\xc7\xc4Q\xa0\xea\xff\x88\xfd:\xb3\x88\xbf#\xcf\xe5?\
-\xf1\xdb\x1d\xc3H\xf7N\x1a\xec\xe0\x1a\x04\xc6\x8d\xe7\xab\
-\x1f\x8d\xe2\xe0\xe2\xbaU\xc4\x0d\xbb\xc6\xdd\xe3\x91\xe7:\
-\xe79a\xb9\xe9\xc8x\xf2\xbb\x9bN\x91~m\xf7\x1a\
-\xc2\x9b\xe3\xa7\xec\x0a\xa7\x15\x7fo\x93v\x86a\x18\x86\
-q\x10\xe2\x0a@\xad\xe7l\x16\xf0\xaep\x12\xa8G\xcf\
-\xee(\x19~&f\x86\x92Q\x1a\x1d\x87\x19\xc9\x1d\xb1\
-\xb1\xf71\x182d\x04zw\xeb\xae\x96\xb0\xa6&\xa5\
-\xdb-\xeb\xa2c\xfa\xe4'\xf7Gn\xf5bG\xc4\xc5\
-V\xfbe\xd3\xc0d\x7f\xbd\x1bA\x8fGG\xebg\xa4\
-\xff\xf5\xb8\xfe\xb8n\xc2\xa8\x1f\x8d\x05\x8c\xfcd8\xae\
-[7\x1c\x0a\x1f\xf5\x83\xfb\x22\xc2w\xf7\xab?\x8d\xcf\
-\x0d\xfb\x1d\xe9^\xdd\xf2k\xc4>\xe2\xfaM\xb8_\x7f\
-7\x8a\x83\x8b\xeb\xd6u\x13y<\xf2\xdc\xc8\xf4r\xdd\
-\xbb\xdf\xc5\xa1\xbaw\xf7\xbb\xc7vx\xfd\xf2\xe9^\x0f\
-\xd1\xfd\x11\xbf\x0d\xc30\x0c\xe3`\xc7\xa9e\x8d\x9d\xa2\
-\x15~\x94\x07\x1d\xda\xb7\xc7\xc0s\xae@\xd5\x05\x7fE\
-\xf1OoC\xc5\x05\x7f\xc1\xe0s~\x8e\x0e\x1d\xdb\xa3\
-N\x04\x80#\x01\x9c$\xa5E/lh2\x0c\xc30\
-\x0c\xc38\xa8\xb0Y\xc0M\x82\xe2.J\xc7\xdd\xf5\xe9\
-\xde\x07G\x0e=\x0e\xd9\xd9=\xd0m\xd9fd~0\
-\x05\xfe\x8f'\xa3rM.\xb8$\x08\xb8,\x08]\xd3\
-*dF!\xc30\x0c\xc30\x0eB<\x14)\xd6\x05\
-\xbck\x9c\xf7\xd0\x02\xc5s\xe6a\xf3o\xaeC\xf2\x05\
-\x97\xa3\xcb\x9d\x0f\xa2\xe3?\x1eG\x9b\xbf\xdc\x81\xa2\xab\
-\xae\xc3\xa6I\xdf8k\xf05\x1a\xc7g\x18\x86a\x18\
-\x86q0a]\xc0M\x80\x13\x01\xd8\x9f[^T\x82\
-\xe8[\xeeB\x87\x19\xf3\x91\x1a\x1b\x0f\xaeQ\xc7-Y\
-\xbe\xb7\x9f\xb7\x00\xd1w?\x80\x92\x993uR\x80\x19\
-U\x0d\xc30\x0c\xc38X\xb1.\xe0\xa6 \xe9\xe3\xe7\
-\x92&\xff\xfc7\x12\xe6-\xd6%O\xd4\x1c\xe8\x12\x15\
-\xa5\x8b!\xa7/[\x8b\xca\x87\xff\x09_i\xb9\xec\xb4\
-D5\x0c\xc30\x0c\xe3\xe0\xc4\xba\x80\x9b\x00-z\x15\
-\xf3\x97\x22\xe9\x83\xf1\x88\xe3R9\x5c\x1a\x84c\xfc\xc2\
-\xe8\xeb\xcb\xe4\x7f\xb4'\x06\xde)3\xb0\xf9\xcb\xc9\x1c\
-\x05\xb8\xff5 \xa3\x11\xe2\x9a\x85\xe1\xa5K\x0c\xc30\
-\x0c\xc30\xb6\x83u\x01\xef\x0a\x11R\x14x\xe5\x0b\x16\
- \xb1\xa8H\xe7up\xed\xba(\xd9\xc7\xf5\x01y<\
-*\xac\xf48\xf1#3\x18B\xec\xf8\x0f\xf4\xf7\xfe\xa4\
-^\xf0E\x08\xd3]\xb1\xdb\x12\xd1\x0d\xc30\x0c\xc30\
-\x8cC\x1a\xeb\x02n\x02\xa1@\x10\xbe\xcd[\x10\xe5\xa3\
-\xe0\xe3\xf2.a\x0b\x9b'\xc6\x11Q\x5c`X\x84\x97\
-'$\xe2\xcf\x9b\x80\xd8\xd2\x12\xee\xe4\x91m\xe0\xdb)\
-\xf8&\x0a\xbeZ\x8d\xaf;[\xbbn\x9d~\xdf\x98\x97\
-\xa7o\xa7\xd8#\xcb\x9d\x9c\x12\xf0\x07\xb0x\xe9\x12<\
-\xf2\xe8\xa3x\xf0\xe1G\xf0\xe9\xa7\x9f9\x0ao'\xde\
-1\x86\xbb\x0a\xcf9\xeel\xfe@\x00yy\xf9\x08\xc8\
-\xa7a\x18\x86a\x18\x87.\xd6\x05\xbc\x0b(}B\x14\
-<\xa5e(\x17\xe1\x97\x17\xa8E^\xc8/\x9b\x0f\xf9\
-u\x22\x88\x02\xd5\xf2)\xbf\xfd\xd5\xce\xbe@\x8d\xce\x04\
-\xe6k\xd4\x9c\xb3\x1b\xe0+\xdf\xca\xca\xca\xf0\xaf'\x9f\
-\xc6u7\xde\x80\x8b.\xfe9\xce<\xeb\x5c\x5c\xf3\xa7\
-?\xe3\xa1\x87\x1eA\xde\xc6\x8d\xf5\xdd\xb7*\xbc\xc2\xa7\
-\xbb\x22\xcd\xdd\xef\xfevaX3g\xcf\xc2o~\xfb\
-\x07$%&\xa1\xa8\xa8\x18\x7f\xbd\xf56\xb8o\x15\xd9\
-\xea<\xfe\x97\xcf\x9a\xda\x1aL\xfa\xfakT\xd7\xd4p\
-G\xf8\xd8\xd6\xfes\xf2\xcb\xf7\xdf\xcf\xd1\xd7\xbe\xf1\x0d\
-\x1e\xcbW\xae\xc0/\xaf\xbeZ\xdfc\xac\xf1\xe4\x9b?\
-\x1a\x9d#_\xb4\x1b\xba~\x9f\xbb\xdf0\x0c\xc30\x8c\
-\x83\x06\xeb\x02\xde\x05\xaa\x8d\xa3\xa2\xe0\xf5x\x10\x1d\xf0\
-i\x82\xc5\xca^\x8f\x88\xa3h\x11^|CD\x8c\x08\
-\xa1\x86\xfduH\xaa\x088V\xb2F\xda\x87o\x95H\
-MM\xc5\xef\x7f\xf7[\xfc\xe3\xef\x0f\xe1\xfc\xf3\x7f\x8c\
-^={\xe2\xfe\xfb\xee\xc2\x8d7\x5c\x8f\xd6\xad[\xeb\
-;\x7fi\x0d\xac\xad\xad\xd5s(\xa2\xf8>^Z\x0e\
-kD\xac\xf1\xdd\xba|\x9f\xaf\x0a\xab\xb0\xff\x0ck\xfe\
-\x82\x85h\xdb\xae-~v\xc9\xc58\xf1\xa4\xe3\x11\x1d\
-\xebu\xd4}\x98<\xf1\xb3\xbc\xbcBO\xa1\xfb\xf5\x1b\
-6\xe0\xee{\xee\xc7F\x11\x9d\xb5\x12&\xc3)\xab(\
-\xd7\xb0\xfd\xf2\x9b\xf0\x1d\xb7\xffz\xeai\x11\x97\xdf\xa3\
-\xbc\xa2\x02\xd9Y\xd9\xf8\x8d\x08\xc0\x8c\xccL=.\x12\
-\x0f\xc5\xa5%\xd8RP\xe0\x88=\x81q\xe3\xbb\x82\xf9\
-\xbb\xb0\xb8H\x84f\xad~w\x8f\x1b\x86a\x18\x86q\
-\xe0\xb1.\xe0&\xc0\xb1}5\xf1\xf1H\x8a\x8dG\xcb\
-\x98x\xb4\xf0D\xa3\xa5\xc7\x8b\x16\x92|-\xa3b\xd1\
-\x22J~s\x7ft,Zz\x13Q\x9b\x14\x0b\xaf\x08\
-\xb0m\xc6\xe3\xc9\xcfh9\xb7E\x8bl\xb4m\xd9\x06\
-)\xa9\xc9\x88\x8f\x8fC\xeb\x9c\x96\xc8\xce\xce\xc2\xcc\xef\
-g\xe3\xe2K/\xc7\xa5?\xbf\x02\xff\xf7\xcb\xab0o\
-\xe1\x02\x94\x96\x96\xe2\x96\xbf\xde\x8a[n\xbd\x1d\x97]\
-q%N?\xe3L\xfc\xe5\xe6[D\x14V\xa9\x85/\
-$\xe2s\xda\xf4o\xf1\xf43\xff\xc6\xb7\xdf\xce\xc0\xcd\
-\xb7\xdc\x86\xea\xaa\x1a\x8ds@\x04\xea\xba\xf5\xb9\xb8\xee\
-\xfa?\xe3\x92K/\xc3y\x17\x5c\x84\xb1\xef\x8f\xc3\xba\
-\xdc\x5c\xdc|\xf3mX\xbch1\xfe\xef\x17W\xe1\xe3\
-O?\xc3\xa4\xaf\xbe\xc6\x05?\xbd\x04\x97\x5c\xf2s\xfc\
-\xe2\xea_\xa3D\xc2}\xff\xc3\xf1\xb2\x7f2\xfez\xcb\
-\xed\xf8\xf3\x8d\x7fQQ\xfa\xc6\x9bo\xa1\xa8\xb0\x10~\
-\xbf\x1f\xcf>\xf7<\xce;\xef\xa7\xea\xef]\xf7\xde'\
-\x02\xb3\x1cK\x97/\xc7\xcf.\xbb\x027\xdct3~\
-|\xeeOp\xfe\x85\x17c\xde\xfc\xf9\x8e`5\x0c\xc3\
-0\x0c\xe3\xa0\xc0\xba\x80\x9b@\xb47\x06\xde\x16-\x10\
-\xe0\xeb\xdet\x09\x18\xbe\xe9C\x92\xce\x13C\xb3\x9e\xa4\
-\xa2\xfb\x0e\xda(\x84\x02\xb5(OK\xd9F\xfb\xd5#\
-\xfb=rP\xdfO\xcb\x1f\xe1\xef\x0b\x17/\xc1\xad\x7f\
-\xbd\x0d?>\xe7,\xbc\xfe\xfa\xcb\xe8\xd7\xaf\x1fn\xbc\
-\xe9/\xf0\x07\xfc\xd8\x94\x97\x879s\xe6\xe0\x0f\xbf\xff\
--\x9ey\xe6i\xacX\xb9\x0a\xcf\xfe\xfby\x0d\x93\xe1\
-\xf4\xef\xdf\x17g\x9du\x06\x86\x0e\x1d\x82?\xfe\xfew\
-\x88\x8f\x8bS\x8baEE%\xfe\xf9\xaf'\x91\x90\x98\
-\x88\x97^\xfa/n\xba\xf1Ox\xf4\xd1\xc7\xb1n\xed\
-:\xfc\xf6\xb7\xbfF\xab\xd6\xadp\xe7\xed\xb7b\xc4\xb0\
-\xa1h\xd5\xb2%\xee\xbd\xfb\x0e<\xf9\xd4\x13(,(\
-\xc2;o\xbf\x83c\x8f9\x1a\x03\x06\xf4\xc7o\x7f\xf7\
-\x1b\x5c\xf3\xc7\xdfk\xf7\xf2\xea5k\xd5b8F\x84\
-\xe0\x84O>\xc6\xa3\x7f\x7f\x08\xcf\xca9+V\xac\xc4\
-\xd3\xcf>+\x17X\x87\xa5\x8b\x17\xa3s\x97Nx\xe4\
-\xef\x8f\xa0s\xe7\xcex\xe1\xf9\xff\xee\xf9\xf8F\xc30\
-\x0c\xc30\x9a\x1d\xeb\x02\xde\x15\xa2\xb0\xa2=\x1e\xa4\xf4\
-\xeb\x8f\xba\xec,\xd4ql\x9f\xfc\xd6\x8d\x02\x8c\x9fB\
-@\xbe\x87D\x0cV\x06\x02\xa8<\xee8\xa7\xdb\x13\xbb\
-~#\x08\xc7\xcbq\xcc\xe0\x8c\xef\xbe\xd3\xf5\x05O=\
-\xe5ddgf\xe2\x97W^\x81\xaa\xcaJ\x94\x96\x96\
-!>>\x1e'\x9dx\x02F\x8d\x1c\x81\xc1\x83\x06\xe1\
-\xaa_\xfdB\xbb|)\xb6h\xbd\xcdL\xcf\xd0\xf7\x14\
-gee\xa2g\x8f\xee\xda-M\x8b\x1b\xbbfs\xd7\
-\xe5\xe2\xa2\x0b\xceG\xebV\xadq\xc2\xf1\xc7\xcbgK\
-|\xf8\xd1G\xe8\xde\xa3\x1b\x12\x93\x92T\xe0\xb5\xc8\xc9\
-Q\xab\xe4\x87\x1f\x8e\xc7\xff^|\x19\xeb7n\xc4\x06\
-\x11\x9d9\x22z3\xd2\xd3\xd0\xad[\x17\xf4\xee\xd5\x0b\
-\xd1\xb11\x88\x89\xf6h\xab\xe1\x83\xf7\xc7a\xd4\xa8\x91\
-\xe8/B\xb5g\xcf\x9e\xb8\xfc\xb2K\xb1x\xc9\x12\x15\
-z\xf1q^\x8c\x1c>\x1cC\x87\x0c\xc11G\x8fF\
-^~>\xcaE\x8c\xea\xfb\x91\x0d\xc30\x0c\xc38\xe0\
-X\x17p\x13\xa0\xa5-yp/\x14\x9cy\x1aj\x83\
-~\xdd\x17\xa4\xc0\xa3\xf9-L\x94\x08C\xbf\xbf\x16\xb9\
-\xc3\x07\xa2\xf3\x8f\xce\x0c[\xe7v\xac\xaf\x9d$\xa7\x9b\
-(\x15\x8b\x9c\xc5\xcb\xc5\xa4)(\x83\xc1\x90v\x15{\
-\xa2cU|\x12Z\x09\xe9\x9e\xc2\xce+\xee<\x1at\
-8|\xfd\xe0r5!\xc7\xbf\xf0N\xf7\x0d&\x14\x98\
-<\xc6O\x079A\xbe\xd3\x0f\xbf\x84[YQ\x81\xeb\
-o\xb8\x09\xa9i\xa9\xb8\xfe\x9akp\xf2I'\xc2\xe7\
-\xf3;\xd7@\xb7\xf2?R\xbc\xd5I\x86a\x1c=\x12\
-Gw|_\x8c\xc4)\xda#\xf1\x95k\x96\x9f:I\
-\x84\x96N\xc6E\xd7I\xd48\x1a\x86a\x18\x86q0\
-`]\xc0M\x80\x22&>)\x19-.\xff)J;\
-t@\x8d\x88@\x8a\x1b\x91[j\xe3\xe3q\xbf\x08\x9e\
-\xb2\x16\xe9\xc8\xf8\xcd\xd5\x88KOs\xc4\x17\x0f\xec\x00\
-&yHD#\x85\x12-\x7f#G\x8f\x86O\xc4\xd8\
-\xbb\xef\x8e\xc5\xec\xef\xe7\xe0\xb1\x7f>\x8e\xec\xac,\xa4\
-\x8b_\xecf\x9e>\xfd;L\x9e2\x05_}\xfd5\
-\x9e\xfd\xf7\x0b\x189bD\x83G\xf2'\x10\x10\xbf\x82\
-\x5c\x93P\x10\xc1\xc5\xc9\x18999\xe8\xd2\xb9\x0b^\
-~\xe5\x15\xcc\x993\x0f\xef\xbd7\x0e\xd5\xd5\xd5j\xad\
-\x8b\x8b\x8bW\x017k\xf6,\xe4\xe5\xe7as\xfe&\
-t\xef\xda\x1d+W\xafV\xab!-y\x84V\xc2/\
-&~\x89%\xcb\x96\xc1\xef\xab\xd5\x09$!\xb9\xae\xf3\
-\xce\xbf\x00\xb3f\xcd\xc6W_}\x8d)S\xa7\xe1\x99\
-\xe7\xfe\x8dAG\x0c@Ll\x8cZG\xf5\xd2U@\
-\xd2\x12\xea\x88D\xc30\x0c\xc30\x0e\x0e\xa2O;\xe7\
-\xac;\xd3S\xd3\xd0\xbdsg\xb5:\xb1\xd26\xb6F\
-\xed`\x92.\x89\x22\xc8\xca\xda\xb5G\xd5\xda\xd5(+\
-.@\x02g\xb8\x8a\xd0\xaa\x0a\xf8\x90\xd7\xb3'\xf0\x87\
-_\x22\xe7\xac3\xeaE\x90#\x80\xb6\x0f\xe5\x10g\xe0\
-Rh\x1d5z\x94v\xcdv\xed\xd2\x05\xefO\xf8H\
-\x85UP\xf6_{\xdd5\xc8\xcc\xcc\xc2G\x1fM@\
-EU%\x96\xafX\x89i\xd3\xa6a\xd0\xa0\x81\xf8\xd5\
-/\x7f\x89\xd8\xd8\xd8\xb0\x95\x0e:\xab\x97\xe1\x8d\x12a\
-\xb8\xa5\xa0\x10\x1b\xc4\xef\x0b\xcf?\x0f\xbd{\xf5T\x81\
-6u\xeaT,Z\xb8\x10\x97\x5c\xfa3\x1c{\xd4\xd1\
-\xf0z\xbd\x08\x86\x02\x18?~\x02\xbaw\xef\x8eN\x9d\
-;\xe2\xb5\xd7\xc6 w}.z\xf4\xec\xae\xe3\x08G\
-\x8f\x1a\xa5\xb3\x96\xdf~g\xac\xce\x02>b\xc0@,\
-Z\xb2\x18'\x1e\x7f<\x8e<r\x08V\xacZ\x85\x09\
-\x13>\xc1\xec\xd9\xb3q\xe4\xa0A\xf8\xbf+\xafP\x81\
-\xb8l\xf9ru\xc3Y\xc3\xf9\x9b\xf2PQ^\x8e\xa3\
-\x8e\x1a\xad]\xd9\x8c\xafa\x18\x86a\x18\x07\x86M\x05\
-[\xb0b\xcd*D=\xf6\xfc\xb3u\x9d\xdbu\xc0i\
-'\x9c\x00/_s\xe6\xf4-\x1a\x8d\xd1n\xcc:\x84\
-\xfc!T\x89\xa8Y\xff\xee\xc7\xc0\xe4\xa9\x88\xaf.G\
-M\xff!\xe8p\xf5e\xf0\xb6\xccB\x8c\x08'xh\
-\xf1\xa2\x1ecZ\xee8=i\x8d\xe3l\xda\x94\x94\x14\
-\x15\x99\xb4\x92\x15\x95\x14i\xb7l\x82\x88\xa5\xe4\xa4$\
-T\x89\x9b\xdf\xfc\xf6\xf7\x18(\xa2\xef\x8aK\x7f\xaek\
-\xfe\xa5\xa5\xa5m#\xa6\xe8\x17\xad~)\xc9\xc9\xba\x94\
-\x0c\x97\x8e\xc9\xcc\xc8P?\xb9,K\xa5\xfc\x8e\x89\x89\
-Q\x8bbL\x0c_gW\xa7\x939JKK\xe4\x9c\
-T\xd1\xabQ(\x91\xef\xb4Fr\xb2\x07\x17}\xa6\xf8\
-\xe3d\x92\xa2\xa2\x22\xed\x8aNKKE\x99\xf8\x95\x9a\
-\x92\xaa\xbf\xabjjP^\xe6\xbc\xf7X\xe3\xc4\xc9'\
-\xa1\x10JKJ\xb5;\x99\xe1\xd5\x8a\x1b.\x05\xc3k\
-\xd4\xb1\x89\x86a\x18\x86a\x1c0\xe6.^\x88\x8f\xbf\
-\xfc\x5c\x04\xe0\x0b\xcf\xd6u\x12\x01x\xfa\xf1&\x00w\
-\x06-v\xda\x9dIe'\x9f\x1c\xdf\xc7\xee\xdf\xf2Z\
-\x1f\xaa*\xca\x91\x93\x9e\xa1\xdd\xc2*\xca\xe4\xbf\xe3\x9e\
-\xec8=\xd9M\xcc\xeeTw\x9c\x1fE\x99.\xb0,\
-_u\xfc\x9c|\xa9\xaa\xa9\xc2\xfd\xf7\xff\x0d=z\xf6\
-\xc0\xa5?\xfb\x99\x8e\xa7\xa3\xb0\xe2\xf1H\x18/\x8e\xd3\
-\xe3XA~w\xbb\x96\xf5\x98|\xe7\x98E\x9eA\x11\
-\xe6\x0aG\xee\xa7\x7f\xee\xa4\x91z7\xe1\xe3\x1c\x8f\xe8\
-\xfa\xcb\x03z\xcd\xf4\x97\xee\xc5\x0d\xcfu\xc7\x06\xd6\xfb\
-+\xfb\xb84M\x94\xe4#\xf77\xfd\xd0\xf1\x90\x8e\xb7\
-\x86a\x18\x86a\x1c \x5c\x01h&\x99&\x12\x96D\
-*d\xa2\xa2\x1ca\xe5\x11\x81\xe6\x09\xf8\x11\xaau\xd6\
-\xdds\xc4\x1f]\xd2\x9e\xe7|\xee\x0c\xfaU/\xfe\x88\
-\x9cK\x01G\xe1F\xf1EQ\x95\x98\x90\x88\xdf\xfd\xf6\
-78\xeb\xcc3U\xf8ycc\xb7\x11\x7f\x84a;\
-\x13E\x9c\xef\xae\xf8#\xf4+\xc6\xf57\xe2\x5c\xeew\
-\xf7m\xe5F\xbesS7a\x7f9^\xb0\xde\xdf\xb0\
-\x1f\x8c\x07\x7fo\xe5\xaf\xbao\x10\x99\xfc\xad~m\x1b\
-e\xc30\x0c\xc30\x0e\x106\x0bx\x8f\x11E\x13N\
-\xb7(\x11<\xfb\x04\x09\xc2#\x22\x91o\x08\xc9\xcap\
-\xde\xbea\x18\x86a\x18\x86\xb1\xb7xT\xc7\x98uf\
-\x8f\xa1\xa5K\xdf\x89\x1b\xfe\xdd\xecP\x04\xd2\x82f]\
-\xf3\x86a\x18\x86a4\x13\xfb\xc8t\xf5\x03\x83\xe3\xdb\
-\x0c\xc30\x0c\xc30\x0e\x11\xac\x0bx/\xa9\x9f\x14\xe2\
-\xfc4\x0c\xc30\x0c\xc38\xe8\xb1.\xe0\xbdD\x93\xce\
-\xd2\xcf0\x0c\xc30\x8cC\x08\xeb\xbbl&\xcc\x88j\
-\x18\x86a\x18\xc6\xa1\x82u\x01\xef%\x9atLC\xfd\
-e\x18\x86a\x18\x86q\xf0c]\xc0{\x89\xb3\xde\x1d\
-7S\xd1\x86a\x18\x86a\x1c\x1aX\x17\xf0\xde\x12\x9e\
-\x04b\xd3@\x0c\xc30\x0c\xc38T\xb0.\xe0\xbd\xa4\
-.l\x014\xf9g\x18\x86a\x18\xc6\xa1\x82u\x01\xef\
-%Qa\x0b\xa0a\x18\x86a\x18\xc6\xa1\x82u\x01\x1b\
-\x86a\x18\x86a\xfc\xc0\xb0.\xe0\xbd\xc4\xed\x026\x0c\
-\xc30\x0c\xc38T\xb0.\xe0\xbd\xc4\x92\xce0\x0c\xc3\
-0\x8cC\x0d\xeb\x02\xde[l\x0c\xa0a\x18\x86a\x18\
-\x87\x18\xd6\x05\xbc\xb7X\x17\xb0a\x18\x86a\x18\x87\x18\
-\xd6\x05\xdcl\x98\x8a6\x0c\xc30\x0c\xe3\xd0\xc0\xba\x80\
-\x9b\x0dS\xd1\x86a\x18\x86a\x1c\x1aX\x17\xf0\xdeb\
-c\x00\x0d\xc30\x0c\xc38\xc4\xb0.\xe0\xbd\xc5\xc6\x00\
-\x1a\x86a\x18\x86q\x88a]\xc0\xcd\x81Z\x01\x0d\xc3\
-0\x0c\xc30\x0e\x0d\xac\x0b\xb89P+\xa0a\x18\x86\
-a\x18\xc6\xa1\x81u\x01\xef-6\x06\xd00\x0c\xc30\
-\x8cC\x0c\xeb\x02\xde[l\x0c\xa0a\x18\x86a\x18\x87\
-\x18\xd6\x05\xbc\xb7\x98\x05\xd00\x0c\xc30\x8cC\x0c\xeb\
-\x026\x0c\xc30\x0c\xc3\xf8\x81a]\xc0{\x8bu\x01\
-\x1b\x86a\x18\x86q\x88a]\xc0{\x8bu\x01\x1b\x86\
-a\x18\x86q\x88a]\xc0{\x8bY\x00\x0d\xc30\x0c\
-\xc38\xc4\xb0.`\xc30\x0c\xc30\x8c\x1f\x18\xd6\x05\
-\xbc\xb7\xb0\x0b\xb8.\x14\xfea\x18\x86a\x18\x86q\xf0\
-c]\xc0\xbbI\x9d\x08\xbe\xfa\x8d;\xec- \xc6\xe1\
-\x023t\xfd\xe6\xe4\xf1&AwMt\xda\x5c\x84B\
-!\x84\x82\xc1\xa6\xc7\xd1%\x14\x8e\xeb~\x8e\xefvi\
-\xaex\xec\xce\xbd\xda\x8f\xe8=\x92\xed\xe0\x8b\x99a\x18\
-\xc4\xb1\x00\x86\x7f\x18\xbb\x09\xc5\xb3T(\x07a\xd9k\
-\x18\xbb\x87f\xe2\x86M\xff6EX\xc8a\xc7\xc5.\
-\xdc5#uu!l\xcc\xcb\xc3\xaa\xd5\xab\x11\x08\x04\
-\xc2{\x9bFQI\x09^}\xfdu,_\xb9\xc2\xb9\
-\xb6\xfd\x17\xed\xad`\xd8\x85E\x85x\xfb\xddw0w\
-\xee\xbc\xf0\xde=C/\xa3)\xf7j\x7f\x22q\xd9\xb4\
-y3V\xaeY-\x220\x18\xdei\x18\xc6\xc1\x84\x8d\
-\x01\xdc\x0d\xfc\x01?\xd6\xae[\x87\xd5\xeb\xd6b\xb5T\
->%\xa5\xa5Z\xe8\xb2\x95\xcb\x9aD\xff\xb9\x85\xb0~\
-\x1eD\x05\xb2al\x07W8\xcc\x9e3\x17\xbf\xbb\xe6\
-Z\x5c{\xfd\x8d\xf2y\x1d\xee{\xe0o\x987\x7f>\
-\xfc~\x7f8/7\x22\xbco\xce\xdc\xb9\xf8\xf3\x8d\x7f\
-\xc1\xc4\xaf\xbe\xaa\xf7\xab\x1e~\x8f\xdc\x5c\xea\xf7E~\
-\xe7\x8f0\x8d\xf7G\x1c\xa3\xff55>\xfc\xed\xc1\x07\
-\xf1\xdb\xdf\xff\x11\xeb\xd7\xaf\x0f7\xc2\xc2n\x1a\xb9'\
-\xfcUGK\x94l\x0b\x97,\xc6\x9d\xf7\xdc\x8fO\xbf\
-\x98\x88`P\x84\x89\xeb>rs\xd1\xdf\xeeg\xa3c\
-$r\x7f\xe4\xb1\xc6\xfb\xb7:\xc6M\xe2+qY\xb6\
-l9\xee\x7f\xe0A\x8c\xfbh\xbcc)k|\x0e7\
-\x97\x1d\x1c\xe39\x9b\x0b\xb6`\xc1\xc2\x85\xa8\xa8\xa8\xa8\
-\xdf\xbf\x15\x91\xe7\xb8[\xe3\xfd\x91D\xeco|(\xf2\
-\xd86\x07\xc3\xfbxm\x05EE\xb8\xeb\xee{q\xd5\
-\xaf\xae\xc2\xfcy\x0b\x10\xac\xbf\xbe\x06w\xba\xb94\xde\
-\x1fy\xcc0\x8c}\x82u\x017\x15)\x90\xca\xcb\xcb\
-\xb0\xb1p\x13\x96\xadY\x89e\xabW\xa2\xa4\xac\x18\x1e\
-O\x14<QQR~E!$n\xea\xea\x82N\xd7\
-\x87|w\xbb@\x227\xc38\xd8`\xbe\x5c\xbdv\x0d\
-^\x7f\xed\x0d\xacY\xbbV[\x85\xef\x8c\x1d\x87\x8b/\
-\xb9\x1c\xdfL\x99\xaayy{\x152+\xf4\xb5\xebr\
-\xf1\xd6[\xef`\xd1\xc2E\xe1\xfc\xef\xb8\xe3'\x7f\xfb\
-\x03\x01\xf8\x83\xce\xe6\xe6\x7f\xdd\xef\x0f\xc83\x13B@\
-\xf6\xfb\xc4\x8d\x9e\x16\x0e\x22T\x17r\xce\x93\xcd'\x02\
-\x94\x9f\xae\xbf$&\xda\x83#\x06\x1e\x81\xd1G\x8fF\
-rJ\x8a\x1c\x0b\xaa\x98\xa3\x10t\xdc\xfbU\x84(r\
-\x1e\x8b7\xfa\xa1\x22$\x18R\xb7\xec>\xe6\xf0\x0dv\
-Pr\x7f}\x1c\xc5=\xc3\xe2\xc6s\x9c\xb8\x04\xeb\xcf\
-w\xe1\xf1@H\xf6\xf3<\xc6\xcf\xd9\xe9\x9c\xc7k\x93\
-\x1d\x019\x8f\xd7\x16\x900\xdd\xf8\x8b\x0b\xf9\x1d\x94s\
-y\xedr\xbe_\xe2\x12p\xfc\xa5\x1b\x8d\x8b\x9c\x13\xe9\
-'q\xc2\x97\xf3x\x8e\xfa)\xe7I\xdch\x01\xfd\xdf\
-\x8b/\xe3\x9c\x1f_\x80\x19\xb3g\xeb~7,\x17\xba\
-\xe7u9~K\xfaH\x9c\x99Vt\xcb\xf8i\xba\xb8\
-\xf1\x93\xfdNZ8\xe1\xd0\xdaZ\x8f\xb8\x89\xbc7t\
-C\x7f\x09\xd3T\xfd\x91\xef\xf47>\xce\x8b#\x8f\x1c\
-\x82\xe3\x8f?\x019-s\xf4\x1e\x04\xe4\xde\xb8\xe7\xfb\
-$\x1ezn8\xaa!\xb9\x87nZ\xea=\x14?\x0c\
-\xc3\xd8\xb7D\x9fv\xf6Ywf\xa4\xa6\xa1[\xe7\xce\
-\x88\xf6D\xdb\x98\xb6\x9dP\xeb\xf7!\xc1\x1b\x8f\x98\x98\
-h$\xa5$\xa1Ev6\xa2\xa3cP[[\x83\xe4\
-\xc4$\x11\x88\xa5Z\xa0y<\x1e-P\xd5\xea \xe7\
-\xe9w\xd9j|\xd5Z\xa0\xc6\xc89\x86q0\xb1b\
-\xe5J|\xf6\xc9g\xb8\xe1\xcf\xd7\xe1\xcf\xd7\xff\x09E\
-EE\x98:u\x1a\x06\xf4\xef\x87AG\x0cT7Q\
-\xdb)\x1b\x96\xcby\x9f~\xf69\x8e>j4\x86\x0e\
-\x19\x5c\xef\xa6\xba\xba\x0a\x1f\x8b\x7fc\xdf\x1b\x87)\xe2\
-\xcfw3f!33C\x9f\x999\xf3\xe6\xe3\xdd\xb1\
-\xef\xa9\x18x\xef\xbd\xf7\xf5\xb8\xcfW\x8b\xb6m\xdb\xaa\
-\x90\xf8`\xfcGxW\xce\x9b6\xed[L\x9d>]\
-Eh\xb7n\xdd\x90*b\x8f\x0f\x18u\xc3\xda\xdc\xf5\
-\xa8\x13\x815P\xe27w\xfe<|\xf6\xd9DTI\
-\x98\xaf\xbe6\x06\xdf~7C\xe3\xd1\xbe}{\x15#\
-\xdf|\xf3\x0d\xc6\xbc\xf1\x16f\xce\x9a\x8d-\x85\x05\x98\
->\xfd[\x0c\x1f>\x14\xc3D\xa0\xac\xdf\xb8\x11\xaf\xc9\
-9\x13\xbf\x9c\x84i\xb2?$b\xadm\x9b6\xd8\xb2\
-e\x0b^y\xedu=\xff\xf5\xd7\xdf\xc0\xd4i\xd3\xc5\
-\xedz\xf4\xee\xd9K\x87~\x14\x17\x17\xe3\x85\xff\xbe(\
-\xe7}\x89)\x14\xc9\xf2\xacw\xee\xd8\x11[\x8a\x0a\xf0\
-\xef\xe7_\x10!\xe3\xc7'\x9f}\x86\xaf\xbe\x9e\x8c\x8d\
-\x1b6\xa2c\x87\xf6\xfa\xdc/X\xb4\x10o\xbc\xf96\
-\xbe\xfc\xea+\xe4\x8ax\x9e\xf3\xfd\x5c\xf4\xed\xd7\x07\xc7\
-\x1ds\xb4\x94#\xb5r\xecM\x8c\xff\xf8cM\x93\xa2\
-\xc2\x22t\xea\xd4\x11\xd111xQD^\xde\xa6|\
-\xcc\x9a9\x1b\x9f\x7f1\x11\xf3\x16,@\x1b\x89\xe7\xf2\
-\x15+\xf0\xa6\xf8W*\x8dSZ\x00)\xe0zt\xef\
-&\xd7/2^\xe2I?_|\xe9e\x14\xca\xfd\xfc\
-F\xfc\xfcL\xce]\xb3f\x0d\xbc\x22\xd0\xdezw,\
-\xbe\x9e<\x05\xc5%%\xe1\xf8Ec\xf5\x9a\xb5x\xf3\
-\xedw\xf0\xc5\x17_H\xbaM\xc1\xc6\x8dy\xe8\xd5\xab\
-\xa74r=\xa8\x91r\xee\xf51c0\xe1\x93O%\
-oL\xc7\x92\xa5\xcb\xd0\xb2eK\xa4\xa5\xa5b\xca\xb4\
-i\xf8\xea\xab\xaf%\x8e\x9b0a\xc2\xc7h\xdb\xae\x1d\
-\xcaJ\xcb\x11\x14a7p\xc0\x00,\x93|2\xe6\x8d\
-7QUU\xa5\xf7w\xca\xd4\xa9\xa8\xac\xaaD\x87\x0e\
-\xed\xe4\xde\xfb\xf1\xfe\x07\x1f\xea6m\xfawz\xbfg\
-\x7f\xff\xbd^Gbb\xa2\xe6'\xc30\x9a\x8fM\x05\
-[\xb0b\xcd\xaa\xb0\x00L3\x01\xd8\x14j\xa4\x92\xaa\
-\xac\xaa\x96\xca\xadZ*\x8a:\xa4H\x85\x14\x1b\x13\xab\
-\xbf\xbdqq(\x91\x028\xda\x1b\x83jD\xa3\xb6.\
-J6\xa9\xaeB~T\xc8\xa7_\xb6\x8a\xd22\xb5\xae\
-\xc4\x8b[Kg\xe3`b\xe9\x92\xa5R\x01\x8fGw\
-\xa9t\xfd\x22\xcc>\xfc\xf0#\xc4\xc4\xc6\xe0\xff\xae\xbc\
-\x1c\xad\xa4\x92\x8f\x16q\xd0\x186n\x96-_\x81\x8f\
->\xfa\x18G\x1d5\x0aG\x0e\x1e\xec\xec\x17\x856q\
-\xd2W\xb8\xed\xae\xbb\x91\x9f\x97\x8f\xcd[6\x8bh\xf8\
-\x0c\x9bE\x1c\x9ct\xd2\x89\x22D\xa6\xe0\xef\x8f\xfd\x13\
-\x93E||\xfe\xf9D\xcc\x12a6\x7f\xe1\x22\x1c9\
-d\x10\x0a\x0a\x0a\xf1\xa7\x1b\xfe\xa2\xe2'w\xc3z\x15\
-\x91\x15\x15\xe58\xe5\x94\x13\x91\x95\x99\xa9~\xfb\x03>\
-\xfc\xeb\xc9\xa7\xf0\xb1\x08\xa53\xcf<S\xc4\xc7t<\
-\xf1\xaf\xa7%\xccI\x22\x18\xbf\xc5\xecY\xdfc\xc6\xac\
-Y8\xfb\xac\xb3\xb0t\xe9R\xdcz\xc7]*\xd2r\
-E4\xf2\xb8<\xbc8r\xe8\x91\x18*\x02\xf0\xc1\x87\
-\xff\x8e\x97_yU\x1br\xdf\xcb9\x9fO\x9c$\xf1\
-\x18\x8c\x9a\x9aZ\xdcy\xd7=\xf8\xf4\xd3O\xb1X\x84\
-\xce\xec\xef\xe7`\x92\x08\x9c\xd1r\x9dI\x22J\xfe\xf1\
-\xd8\xe3x\xe9e9O\x1a\x833g\xcc\xc6\xb4o\xbf\
-\xc3\xb0aG\xa2\xa2\xb2\x12\x7f\xfd\xeb\x1d\x98<e\x1a\
-\xbe\x944\xf8\xf6\xdb\x19\x22<g\xa1s\x97\xceh\xd1\
-\x22\x1b\xb7\xddy\x17\xdezg,\xb6\xc8u\xce\x92\xfd\
-eee8b\xd0@\x15\xd0o\xbd\xf3\x0e\x1ex\xe0\
-aT\xd7\xd4`\xed\x9au*\x8e;v\xec\x80\xee\xdd\
-\xba\xe2\x9e\xfb\xee\xc7\x87\xe3?V\xa1\xfa\xddw\xdfa\
-\x86\x08\xc1\xb6\xed\xdaj\xa3\xf4\xd5W\xc78\xa2X\xc4\
-[rJ2\x8e=\xf6h\xa7,\x97;D\xc1\xf5\xb7\
-\x87\xfe\x8e\x8f&|\x82\x89rmSD\xb8\xcd\x9d3\
-\x0f_\x8a0\xfd\xfc\x8b/%~\xdf\xe1{\x11\xa1\x03\
-\x06\xf4Cjj*\x1e{\xe2I\xbc\xf0\xc2\x7fU<\
-.^\xbc\x14\xef\xbd\xff\xa1\x08\xc0\x1e\xe8(B\x94\xe9\
-t\xff\x83\x0f\xa1P\xeeM\xbe\x88\xd1q\xe3\xde\x97\xf8\
-\x97b\x88\xdc\xf7\x09\x1f\x7f\x82\xc7\xff\xf5\x14\xbe\x16\x7f\
-\xbf\x9f;O\x04\xf60\x8c\x15\x91?Q\xc28\xf9\x94\
-\x930_D\xfa?\x1e\xfb\x97\x86\xf7\xd5\xe4\xc9\x989\
-s\x16\xd6\xaf\xdf\x88\x91#F`\x86\x08\xf6[o\xbf\
-S\xe2Z-\xf7k\x99\x88\xe6oT\x8c\x1e\x7f\xdcq\
-HM\xa6\xe8\x17\xac\xb84\x8cf\xc3\x15\x80\xd6\x05\xbc\
-;H!\xcb\xae\x8a \xbb\xaeB\x01DIE\xc2\x01\
-\xce\xec\xd6\xa9\xf5\xf9P\xfe\xfaX\x94\x9fp6\xeaF\
-\x1c\x8d\xd0\xf0\xd1\xba\xd5\x8c8\x06\x18~\x14\x82\xf2\xdd\
-s\xd1%\xa8\x5c\xbeZ\xbb>\x1aw\xd5\xe8\x8c\xc6P\
-Dw\x8ba\xecG4/z<x\xfb\xedwq\xfd\
-5\x7f\xd6\xb1}\x14}U\xd2\xa8\xa15M\xf3fD\
-~%,6<\xfc\xc32$\xe4\x1c\xa3%\xac\xb8\xb4\
-\x14/\xbe\xfc\x0abET\xbd\xf4\xdf\xff\xe0\xb5W_\
-\xc6y?>\x17_}3\x15_\x7f\xf3\x8d\xf8'\xfe\
-VV\xe1\x84\xe3\x8e\xc5'\x9f~\x84K.\xbb\x04k\
-D\xbc\xac\x5c\xb5Z\x85\x1b\xe4Y\xb8\xed\xb6[\xf0\xc4\
-\xe3\xff\x10\xf1\x99\x83K~v1\xbav\xee\x12\x11~\
-TX\x0fH\xbc\xe4K\xb4\x08\xd5r\x11\x89\xe7\x9c\xf5\
-#|\xf6\xc9x\x9cs\xf6\x99\xd8\x94\xb7I-\xf3\xec\
-\xd2^\xb5r\x15\xae\xff\xd35\x980\xe1\x03\xfc\xf6\xd7\
-W\xc1\xe7\x0f\xc0\xeb\xf5b\xf5\xea5\x18\xf3\xfa\x1b\xf8\
-\xe9\x85\x17\xe0\xe6\xbf\xdc\x88\x1bo\xba\x01e\x15ex\
-\xeb\xedw4=\xcaE\xcc\xf5\xe8\xd9\x13\x1f\x8f\x7f\x1f\
-\xb7\xfd\xf5/j\x1d|\xed\xf51j\x95|{\xec8\
-\x5cr\xc9\xc5\xf8\xeb_\xfe\x82k\xaf\xf9\x03r\xd7\xaf\
-\x17q\xe6\x8c\x83d\x0f@\x87\xf6\xed\xf0\xba\x5c\xf7\xa3\
-\x7f\x7fPE^Ee\x05\xd6\xad\xcb\xc5\xf7\x22\xbeN\
-<\xe18\xbc\xfb\xe6\xeb\xb8\xf1\xc6?#.!^\xcf\
-Y\xb3n\x1d^~\xedut\xed\xd6\x05\xf7\xdd{7\
-\xee\x97\xadC\xa7\x0e\x18+\x22\xab\xa4\xac\x5c\x84f\xac\
-\x88\xba(\xfc]\xfc{\xfb\xed7\xb4\xcc\xe1\x18\xcdc\
-G\x1f\x85K.\xbdH\xc3|\xf8\xe1\x07$\x9e7\xc3\
-\x1b\xeb\xad\x17L\xf4;&&\x06\xc9\xc9Ix\xf5\xe5\
-\xff\xe2\xc1\x07\xee\xd1\xb1\xcb\xadE\xd4\xbf5\xe6U\x11\
-\xab7a\x93\x08\xf3\xfc\xfcM\x12\xb7\xb9\x18+\xa2\xf3\
-,I\xc7W^~\x11\x8f\xfd\xe3\x11\xb4m\xd3\x1a\xff\
-\xfd\xdf\xcbX\xb4h\x91v5\x8f\x1c>\x02\xefH\xf8\
-c\xdfy\x0b\xa7\x9dv*\xc6\x8b(]\xb8x\xb1f\
-\x84\xca\x8aJ\xfc\xfc\x92\x9f\xe1\x83q\xef\xa0_\x9f>\
-ro84F\xd0\xc6\xaeG\xbb\xb0O;\xf5\x14|\
-\xf9\xf9\xa78\xfb\xec\xb3\xb0PD\xff\xf2\xe5\xcbT0\
-\xb6n\xdd\x0a\x8f<\xf4\x00\x1e\xb8\xef\x1e\xb97\xb18\
-\xef\xfc\x9fh\xc3C\xae\xa0\xfeZ\x0c\xc3h^l\x1d\
-\xc0\xdd\x80\x85\xe9\xc6\xfc|\x9d\xdd\x96\xbfe\x0b*\xa4\
-\xc5\x9a\xb79\x1f\xdf\xcf\x9f\x83\xf5R\x81\xd5\x8d\xff\x14\
--\xd7\xe4!;\xaf\x5c\xb6\xb2\xf0\x16\xfe\x9e_\x8e\xe4\
-\xf5E@M\x00\x05\x85\x85\xd2\x1a\xffR?Ya\xb2\
-\x9b\x86\x16\x84u\xb9\xeb\xc3!\x19\xc6\xfe%J*p\
-V\xd7\xbf\xba\xea\x17\x183\xe6\x15\xfc\xfew\xbf\xd1.\
-J\x0a\x10\xe6Q\x16\x11\xcc\xff\x8d\xa9\xdf%\x95\xbc;\
-\x06\xac\xb6\xa6F\x05Evv6\x12\x93\x12\x11/\x82\
-\xa4S\xe7\x8e\x08\x06\x02\xd8\xb0a\xa3:\xa7\xb8\xec?\
-\xb0\xbf\xf6<\x0c\xe8\xd7O5Buu\x0d\xba\xf7\xe8\
-\xa6\xcf\xd5\xbf\x9f{\x01\xf7\xdc{\xbf6\xacZ\x8a\x08\
-\xdc\x9ap\xa0r\x92\xc6Z\x22\xc1\xcf\xa1\xc3\x8eD\xdb\
-VmD\xec\xa4\xa8\x0b\x0a\x1f\x8a/\xba\xcb\xcc\xccB\
-b|<\x06\x0c\xe8_\xef\xbe\xa2\xaaR\xc7\x9aM\xfa\
-j2\xee\xb8\xf3.\xfc\xfb\xf9\xff 5)\x19\x19\x19\
-\xe9\x1a\x1f\x8a\xde\x01\x12GZ\xfa\xd9\x05\x9d\x9c\x9a\xa2\
-\xdd\xac\x1b7\xe6# \x22\x92\xdd\xb4\xb7\xdfu7^\
-\x7f\xf3M\xe4\xb4h\xa1\xd7\xca\xaeRvmw\xe9\xd2\
-\x19\xbd{\xf6@\x8b\xec\x16\x92~u\xf0\x8a\x80\xcb\x17\
-\xa1U&b\x8e\x16F\xfa\xd9\xb1}{\xed\x0d\xe09\
-\x85R\x16\x94\x95\x94I\xd9\xb2\x05w\xdds/\xeey\
-\xe0o\x92\x8e>\xb9\x96d\xed\x16g|\x99\x9e\x03\xfa\
-\xf5G\x9b\xd6\xad%~\x8e*\xe2\xf8\xe3\xa4\x84D\x11\
-\x87\x1e\xa4\xa4\xa5!^\xae1\xf2>\xb9\xdf\xd8\x95J\
-k\xe2\xb0#\x87\xea\xb9\xec\xd6\xa5\xb5\xb7u\xabV\xe2\
-3\xd3*Z\xee\xcd\x06\xf8}\xb5\x18=j\x04\xa2\xc5\
-M+9\x96\x9e\x99\x89*I'v5\x97\x96\x97\xa3\
-M\xfb\xb6H\x111\x19%\xe1\xd1\xeaKk\xa5\xaf\xd6\
-\xa7u\x08\xc3\xa6e\xb5m\xeb6z\x7f\x1b7h\xb9\
-\xaf\xb5\xc4\xbd\x8d\x88\xbd\xfe\xfd\xfb\xea\xbd\x0dJ\xda\xb4\
-o\xd7N\xcb\xbeG\xfe\xf1\xb8Z \x996-%\xdd\
-L\xf7\x19\xc6\xbe\xc5f\x017\x15)\x8dXH\xf6\xed\
-\xd9\x07#\x87\x0c\xc7QCG .\x8e\xdd\xbf\xb5\xe8\
-\xd0\xae\x13\xf2V\xafBu\xe9\x16)\x5c=\x88\x92\x82\
-.*:\xc6\xd9<\xf2=\xbci\xad\x12-\x15e \
-\x88\x87\x1e~\x04_N\xfaZ\x0b\xeb\xb5\xb9\xb9x\xe0\
-\x81\x07u\xbc\x8d;P\xde0\xf6'\xac\xd0Y\x89\xb3\
-\x9b\xb5g\x8f\x1e8\xee\xd8cu\x9c\xd8\xca\xe5\xabt\
-&\xf0\xd2\x15\xcb\xb1`\xc9\x22G\x0c\x86\x05\x06\xff\xba\
-\xbd\x07\xecr\xa4\x15\x8aB\x84~\xc5\xc6\xc6\xa2F\xc4\
-\x01\xf1\xc8sSRR*\x02\xc0#\x22&K\xf7\xd1\
-\x0fW \xf0\x1c\xc2\xc7c]\xee\x06\x15R\xe9\x19i\
-h\xd3\xa65\xee\xbe\xf36\x8c\x1a9\xd2\x11<\xdc\x22\
-\x11\xa1\xe5J\x1c\x0a!\x0aLZ\xc6\x08\x9dR\x8e\xc6\
-'$\xe8\x9e@\xc0\xaf~\xe4\xe5\xe5\xa9P\xe5\xf3\xcc\
-\xdf\x9c\x98p\xfcq\xc7\xe2\xb6\xdb\xfe\x8a;\xef\xb8\x1d\
-O?\xfd$.\xbf\xec\xe7r-\xd1*X*\xca*\
-T\x88P\xa0Q\xecx\xbdq\xf0\x8a\x9f\xf4\x83it\
-\xbb\x9cw\xc7\xed\xb7\xe2\xa9'\xff\x89\x1f\x9dq\x06/\
-L\xc3\xa7E_'^\xc8'\xe1\xf5\xc6\xc7\xc7!V\
-Di\x9e4 u\x22J\xc8\x998Ab\xd5j\x17\
-\xa5\xe3\x0f\xffz\xcb\xcd\xb8\xed\xd6[\xf0\x8fG\x1f\xc6\
-\x8d7\x5c\x8f\x8c\xf4t\xbd.\xfaA\xf7\xbc\x07\x8c\x13\
-\xef\x17\xaf\x81\xfbX\xa6DK\xd9\xc3.\x1d\xfek\x0c\
-\xf7S\x88R\x9c\x12~\xd2j\xcbs\xd5R'~\xc7\
-\xca\xfd\xa6\x1b\xa6\x11\xfd\xe5\xfd\xf3\xfb}z_\xd3D\
-\x5cz\xe5\x9e2=\x18\x0e\xef\x19-\x9a\x1c\x9f\xe8a\
-y'\xee\xe5\xbf\xfa\xe3N\x0ci\x0c\xef\x8fK]P\
-\xdc\x88;\xde\xb7\xfc-\x9b\x90\x95\x95%[\xa6\x88\xd2\
-.x\xf0\x81\xfb0P\x84:\xfdTO\x0d\xc3\xd8'\
-\xb0\x5c\xb0.\xe0\xa6\x10.l\x13\x13\xe2\x91\x96\x9a\x0a\
-N\x9c\xf1 \x06mZ\xe6\xa0U\xcbl\xa4\xa7\xc5#\
-\xe8\xdb\x8cXq\x18\x0aJA\xc7B\xb0qA\xc8t\
-\x8e\x91\x96uN\x0e\xfe\xf0\x87\xdf\xe3\xe5\x97^\xc2\xa2\
-\xc5\x8bq\xcf\xbd\xf7a\xe4\xa8\x91:0]J[\xc7\
-\xada\xecG(*B\x92??\xf8`<\xee\xbc\xfb\
-\x1e<\xff\xfc\xf3:c\xf6\xc4\x93\x8eGaq1\xfe\
-r\xe3\xcd\xf8\xd3\x9fn\xaa\x17uD\x8b\x0d9/.\
-.\x0e\x9f~\xfe9\xee\xbe\xef~\xdcr\xeb\xed\xbaD\
-\xd2q\xc7\x1e\xa3c\xee\xb8\x14\xc8\xbd\xd2\xb8y\xff\xfd\
-\x0f\xd0\xbf\x7f\x7f\x8c>\xea(\x15\x82\x14o:?W\
-\x9e)\x8f\xfcV\x81\x22\xa2k\xfd\xfa\x5c\xf8\xfc\xb5H\
-HLDFF\x06\x16.Z\x8c\xefg\xcfi\xb4\xde\
-\x1f\x05\x8b|\xc8\xb3\xa2O\x98\xfcP\xe1'\xff\x19'\
-\xee\xa3\x08\xa1\xc8\xa0\xa0M\x16A\xc9\x09\x067\xdd|\
-\x0b\x1ez\xf0\x11\xb5\x86\xf9}>\xb4k\xdb\x16\xfd\xfa\
-\xf7\xc3'\x12\xf7\xf7\xc7}\x80\x89\x93\xbe\xc4\xb8q\xe3\
-PZR\xac\xfeQ\xac\x8d\x1d\xfb>\xee\x90kx\xea\
-\xd9\x7f\xa3\xba\xaa\x1a\xa7\x9er\x12\x8e<b\x00\xbat\
-\xee\x84O?\xfb\x0c\x1f\x7f\xf2)\xbe\x9c(\xe7\xbd\xf7\
-\x9e.I\xc3p]\x11\xe6\x08\x18\x89\x8c|R<v\
-\xed\xd6]Dm+|:\xe1SM\x97G\x1f\x7f\x02\
-\x95\x95\x95\x22\xc2\xea\xd0\xb9SG\x1dC\xb8j\xd5\x1a\
-\x8c}\xef\x03L\xfa\xf2+\xbc\xfb\xce;X\xb0`\x81\
-\xf8\xe7\x16\xd4\xf2)~\xd1KQ\xd9\xea7\xc3`y\
-\xc2\x19\xc9\xcf\xff\xfb\x05\xbc\xfd\xdeX\x9dM\x1b\x09\xcf\
-\xa0\xd8ft\xe8\x99#\xe2y\xb2\xfc\x0f\x17\xfe\x8c\xdf\
-\x91G\x0cB\xb7n]1\xe6\xad\xb7\xf1\x0f\x89\xdb\xbd\
-\xf7?\x80\xc5\x8b\x97\xe0\x8c3N\xc7\xc0\x81G\xa0_\
-\xbf\xbe:Q\xe66\xc9\x1f\x0f=\xfcw\xbc\xfd\xee{\
-\x22\xce\x87\xa3{\xb7n\x08\xaa\xb0\xd4\x08i\x1c\x09\x05\
-&\x85\xb4\x8a}FW\xe2\xac\xb3\x8ay\x5c\x1a\xc2\x14\
-\xd8\xa4`\xf3\x16\x1d\x12\x93\x10\x9f\xa0\x16\xcf\xef\xbe\xfb\
-\x16\x8b\x97,\x15\x91\xec\x88U\xc30\xf6\x0d\xd6\x05\xbc\
-\x9b\xb0pc\x8b\x98]f))IHJL\x96D\
-\xf4 +\xa7\x9d\xec\x8b\x97M\x0a<n\xe2\x8e\x1b\xa9\
-\x1f\x0b\xc3\xb4\xae\xa5e \x84c\xa5\x22\xcci\xd5J\
-\xbb\xb9\x8a\x8b\x0aq\xe5\xff]\xee\x14\x9ez\x86a\xec\
-_23\xd2\xd1\xad{7l\xcc\xdf\x84\xcfE|\xb0\
-\x9b\x93\xdd\xc0\x17\xfd\xf4B\xed:\xe51v\xcfrp\
-\xbe\x93\xab\x1dR\xa41\xd4\xb3W\x0f\x14\x15\x97`\xd2\
-\xa4\xaf\xf1\xd5\xd7_\xa1\xb0\xa8\x18\x17\x9c\xf7\x13\x9cy\
-\xe6\xe9:\xe9`\x9c\x88+v?\xfe\xf1\xf7\xbfEf\
-Z\x1a\xd2\xd3\xd3tbAN\x8bl\xf5\x8bB\xafk\
-\xf7\xae\xc8JMA\x87v\xede\x9f\x07\xf9y\x9b\xb0\
-|\xd9r\x1d\x93x\xfb]w\xa9\x98\xa4\x90 \x14=\
-\xed;\xb6C\xcf\x1e\xddU|fee\xa3W\xef^\
-\xc8\xcc\xca\xd0g3'\xa7\x85\x8a\x92\xd8\xd8\x18\x0c\x1b\
-z$\xae\xbc\xe22,Y\xba\x14\x93\xbe\x99\x82s\xce\
-=\x1b}\xfb\xf4FVv\x0bi\xb4\xa5\xe3\x96\xbf\xdc\
-(\x02\xaa\x05\xc6\x89@}\xf9\xe5\xd70K\xc4fu\
-m\xad\xc4\xc1\xb1\xac\x0d\x10\xb1G\xd1\x93\xbbn\x1d~\
-z\xe1\xf98\xe9\x84\x13\xd0\xbd{w\xdc\xfc\x97\x1b\xa4\
-1\x98\x881c\xde\xc4\xff^z\x05\xf3\xe6\xcdG\xad\
-\xcf\x11\xae\x9d\xbbuA\xfb\x0e\xed\x9dn\xd9\x94\x14M\
-7\xce`\xceNO\xc7e\x97^\x82\xf8\xc4\x04|\xf6\
-\xf9\x17\xe8/\x82\xea\xc4\x13\x8e\xd7.\xd1t9v\xe5\
-\x95W`\xf0\xe0\x81\x18?~<\xfe\xf7\xf2+:\x0b\
-\xb7\xbc\xac\x9c\x85\x0e:\xb4o\x8f.]\xbb\xe8\xf5\xc6\
-z\xbd\xe8\xd5S\xc4d\xeb\xd6ji\x1d-\x8dGn\
-\xb3f\xcfV\xc1\xa6\x05M8\xadh\x9dk-\xa2\xb3\
-s\x8f\xaej\xc1\x8b\x17\x91\xd5\xa3g\x0f\x11\xbf\xadU\
-\x80edf\xa0w\x9f^\x1a~\x07\xb9G\x7f\xba\xee\
-\x0f\xda\x85\xcb\x09\x1f\xf3\x17,\xc2\xcf.\xbe\x18?\x97\
-8\xb7\xc8\xce\xc2\xf5\xd7]\x83>\x92v\x1f\x8d\xff\x18\
-\xaf\xbf\xf1\x16\x86\x0e\x19\x82\xeb\xfft\x9d\x8e\x13d\x17\
-x\xef\xde=\xe4:\x93\xf5>q\x8ce\xbbN\x9dt\
-\x1c#'\xcd\xb4\xc8\xc8B7\x89?\xbb\x95y\xcf\xb3\
-\xe4\x9e\xf7\xea\xd5\x1d\xa9i\xa9H\x93\xfb\xc0ndv\
-A/[\xbc\x14/\xbd\xf4\x1a\x1ez\xe4\xef:;\xb9\
-q7\xb2a\x18\xcdG\xd4c\xcf?[\xd7\xb9}\x07\
-\x9cv\xfc\x09\xf0F\xc7jacl\x8f:\x1d\xc8\xcd\
-\x01\xd6\xda]#\xac\xc9]\xab\xad\xdaX)HW}\
-\xff\x1dbn\xfa#\x86\x15\x8a \x94\xb27$\x95T\
-\xb4\x14\x84\x01\xa9\x04b\xc2\x85qyJ\x02*^|\
-\x16\xad\x86\x0f\xd6V\xf8\xbb\xe3\xde\x97\x02\xf4O\xb8\xe7\
-\x9e\xbb\xf1\xf3K.\xd5\x861\xbb\xcf\x0cc\x7f\xc3%\
-T\xd8\xa5G\xc1\xc0*7-)\x09\x99\x99\x99Z\x91\
-3\xaf\xe6o\xda\xac\xd6\x1bvQ\xaae\x8bH\xb6\xae\
-\xa8\xaa@\x9e\x88F\xed\x96\x94\xfd\x14Mm\xa4\x92O\
-IN\xd6\xc9 \x1c\xf3\xc7J\x9c\xa2\xace\x8b\x1cm\
-8q\xa6l~~\xbe\xfaEk\x1cg\xaan\xd8\xb8\
-\x11q\x224\xff\xf0\x87k\xb5\xb1\xf4\xb7\xfb\xefUa\
-\xf8\x97\xbf\xde\x8a\xe9\xd3\xbf\xc3\xbbo\xbd\x8e\xbe\xbdz\
-\xcb\x03\xa2\xc1\xea8\x5cZ#\xe9G\xa5\xc4\xbd\xb0\xa0\
-P\xbb\x8c\xe3\xe3\xe2ul-\xdf\xf8\xd1U\x04\x08\x05\
-kUu\xb5.W\x13#\x02\xa8c\x87\x0e\xd8\x22\xe7\
-\xa6\xa7g\x88\x00LU\xcb\x22\xc7+\x16\x15\x17I\xc3\
-\x0c\xc8\xc9\xce\xd61\x87KE|^p\xd1\xcfp\xd9\
-e\x97\xe0'\xe7\x9e\x8b\x9a\xea\x1a\xb4k\xd7V\x85\x92\
-\xda\xe0$-\xd6\x88(-)-Q\xb1E\x01\xc4\xf3\
-h\xf5\xe2\x84\x0e\x0a\x1c\xc6\x9fq\x5c\xb7~\xbd\x5c{\
-\x0b\xa4\xc9\xb95\x12\x97u\xb9\xb9\xf0\xf9|\x22\xb8:\
-\xea\x98@\xae\x99\xc7\xf1}\xf4g\xcb\x96\x02]\xee\x85\
-]\xc4\xecvm'\xd7G\xd1G?(n\x99\xb6\x14\
-X\xf4\x83i\xc7p\xf9\x9boF\xd9\xbce\x8b\xb8o\
-\xabi\xed\xc2\xfb\xc2\x09*1r\x1f\xdb\xb4l\xa9\x96\
-6N~\xa1\xa0\xe3\xb50~\x1b6\xe6\xa1eN\x8e\
-\x88\xd5d\xf8\xfc>\xbd\xd7\x9c\x8d\xcd1}\xb4\x92\xa6\
-H^\xe0}c8\x1c\xc7\xb8I\x8e3\x09\xdaJX\
-\xd9Y\x99z\xdf\x8b\x8a\x8bU\xb0qi\x9ax\x09\x8b\
-\xf7(\x7f\xf3\x16\xd4\xd6T\x8b\xa8o\xa7\x16F\x0eq\
-\xa1\xd8\xa5\x95\xaf\xb4\xacL\x97\xdaa\x1a\x9d\x7f\xe1\xcf\
-\xd0\xb2UK<\xf8\xc0\xbd\xdau\xfe\xeb\xdf\xfeA-\
-\xa3o\xbe\xfe\xaaN\x02b\x9e4\x0c\xa3\xf9\x98\xbbx\
-!>\xfe\xf2s\x11\x80/<[\xd7I\x04\xe0\xe9\xc7\
-\x99\x00\xdc)R\xf8\xb1\xb2\xa3\x00\xf4\xc6\xc6\xe9\xae\xc2\
-\xd2B\xe4m\x96\xca\xcf\x1f@\xd9\x86|\xc4\xddx+\
-\x06o,\xd1\xc2\x923\x1dYU\x85;l\xd4\x0aX\
-\x91\x12\x8f\xf2W\x9eC\xce\x11\x03\xb4\xd2\xba\xed\x8e\xbb\
-\x91\x9b\xbbN\x0ai\xe0\x85\x7f?#\x95\x86\x14\xa6\x96\
-\xfe\xc6\x81@\xf2w\xe3\xb1[\xac\xd8\xb9\x11\x8a8\x1e\
-\xa5\x08\x89\x84\xa2\x80[$\xda])\xe7\xb9\xe3\xcd\x5c\
-\xdcs\xdds\x5c\xff\xd5\x95\xf8O\xd1\xf3\xf0\xa3\x8f\xe9\
-:yq\x22\x8a89\x82\xdd\xc3\x17]t!~q\
-\xc5\xe5HHHP\x0b\xbc\xfa\x11\x11\x9fm\xfcc|\
-ds\xc3\xa3\x08r\xe1\xf3(\xae\xd5oF\x93~4\
-\xb62\xd1\x0fZ\xd2.\xb9\xf4\xe7:\xd3\xf7\x8f\x7f\xfc\
-\xa3\x86K\xff\xea\xaf\x81[\xa3\xf3\xdc\xb8q\x1c\x9d\xfc\
-\x88\xf8\xed\x88cnn\x5c\x09\x8f:\xdf\xc2i#\xfb\
-\xb7\xba\x07\xf2]\xc7f\xd2\x1f\xf1S;\xcd\xc3\xfe\xa8\
-\x9f\xfc\xc7\xf2BN\xd1\xb4\x8et\x1f\x81{\xfd\x0cC\
-\xbfE\xc6G~\xf2:\xea\x7f\x8b\x1fn\xfc\x08}\x8a\
-l\x94F\xa6%\xd1\xf0\xe4\x93\xc2\x97\xff\x5c\x7f\xea\xe3\
-$0\x5c\xd7\xdf\xfa\xe3\xe1\xeb\xe1\x18\xcc\xbf\xde~\x17\
-\xbe\x9c4I\x1b\xd6\x5c :A\x84\xe7\x95W^\x86\
-\x8b/\xbcP\x05\xbd\xba7\x0c\xa3\xd9h\x10\x80f\x01\
-l\x1aRx9\x020N\xad\x22,\xe18\xdb17\
-o\x03\x96,Y\x8eN\xad\xdb#\xfe\xca?\xa0\xf3\xfa\
-\x0d\x80W\x04\x22\x0b\xcaPP\x07\xc7\xbbEfeX\
-\x00\xb6\x1a|\x84\xae)\xf6\xe43\xcf\xe2\xfe\xfb\xee\xc6\
-M\x7f\xb9\x15\xc3\x86\x0e\xc1_n\xbc\xc1\xa94\xac\xc0\
-3~\x80P \xf0-\x10\xf3\x17,\xd0I\x17\xac\xf8\
-;u\xe8\x80\xae]\xbb\xd6\x8f\x17\xdb_\x94\x97\x97\xe3\
-\xbb\x193\xd1\xa1C{t\x93\xf0\x89\x09\x91}\x80\xdc\
-\xf3\x1a\x9fO\x97\xb4).*VA\xd9I\xd2\xbc\x8b\
-\xa49\xad\xb7\x86a4?\xae\x00\xb4\x85\xa0\x9b\x8a$\
-\x0b\xbbG\xb8`\xacS\x19Eiw\x0a\xbbI\xd2\xd2\
-S\x90\x91\x9a\x82\x92\x05\xb3\x91\xbch9\xbc\x92\x86\xa1\
-\x80O\xc5\x1cg\x1f\xb2\xfd\x1c\x0a\xfa\x11\x90\x16\xae\xff\
-\x8c3P\x16\xeb\x11\xd1\xf7\x17\xfc\xe8G?\xd2\xb5\xd0\
-:u\xec\xa8\xab\xf5\xf7\xed\xdb\xc7Y\x96\xc1\xee\x81\xf1\
-\x03\x84\xf9\x9e\x95>\xdf.\xd1E\xca\xa3\xce\x9d:!\
-;+\x0b\x9cH\xa0f\xa6\xfd\x08\x1by\x1c\xb7\x98\x95\
-\x99\xa5V6{&\xf7\x11\x92\xae\x9cI\xccr\xaf\xab\
-\xdcs\xbe\xf9\x84\xf7\xdc\xa9\x8b\xc2n\x0c\xc3hV\x1a\
-\xde\x04r\xceYw\xa6\x8b\x00\xec\xde\xc9\x04\xe0N\xa9\
-s\x04`\x0c\x17d\x0d\xb7L\xf9\x1eSv\x89p\x00\
-sZv6\xca\xdb\xa6cm\xbbll\x10!\xb7\xa5\
-o_\xac\x1d9\x00yG\xf6\xc7\x86#\xfba\xa3l\
-+zK\x85v\xd2\x09X\xb2|\x05j}~\x5c\xf5\
-\xcb_h\xb7\x16\x17e\xe5\x92\x1b\x95UU:x\x9d\
-]&V\xe1\x18?T\x22\xbb[\xf598\x00\x8f\x02\
-\xc3\xb5\xe7p\xff\xc0\x14\xe6=\xa7\xf5\xef@\xdes\xc3\
-\xf8\xa1\xe0\x0a@\xeb\x02n*\x91]\xc0:\x09\x84o\
-\xff\xa8\xd5\x97\xa9\x97\x96\x94\xa0u\xeb6\xda}U%\
-\xbfC,\xc4\x9c\xb3\x10\x13\x0c\x22\x18%\xbf\xe5|\xc4\
-D#=6V\x0b9\x0a\xca\xfa\xb4\x96c\xee\xa8\x1b\
-\xabp\x0c\xc30\x0c\xc3\xd8W\xb8]\xc0\x0d\xa3{\x8d\
-\x9d\x13\xd6e\x9b\xb6lF\xee\xc6\x5c\xac]\x9f\x8b\xaa\
-\x9a\xea\xfa\xc1\xcf$\xde\x1b\x8b\xcc\xc4\x04d{\xbd\xc8\
-\x8a\x8fCV\x9c\x17i\x09\x89\xc8L\x88G\xbal\x19\
-\x22\x1c\x9d\xee,\xf1,R\xe8\x85\xbf\x9b\xf83\x0c\xc3\
-0\x0cc\x7f\xa0\xa6*[\x08\xba)D!)1\x09\
-\x19\x19\xce:f\x99\x99\xe9\xfa\x0a&\x1a\xf3<\x1eg\
-6\x1d\xdd\xe8\xbfh\xae\x8c/\xbfh\x09\x8c\x96M>\
-u\xb5|.\x80\xeb\xa6u\xa347\xf1g\x18\x86a\
-\x18\xc6\xfe\xc2\x16\x82\xde\x0d\xb8\xe6_rb\x0aR\x12\
-Su\x8b\x89\xe5zW\x8ep\xab7\xa5\xbaB\x8e\xaa\
-\xda\x94\xb5a\x18\x86a\x18\x07!\xd6\x05\xdc$\x9c5\
-\xac\xaaj*\xb1j\xed\x1a,\x99\xf15\x16\xcd\xfc\x02\
-\xeb7\xe4\xa2\xbc\xa2,\xec\xa6\x91QOM\x80\xe1\xef\
-\x86a\x18\x86a\x18\x07\x11\xd6\x05\xdc\x14B@Mm\
-\x15\x0a\x0a\x0bP\xf0\xc5#\x88~\xf8Jx\x1e\xfa5\
-\x0a\xff{3\xca*\xca\xe1\xf3\xf9\xc3\x0e\x0d\xc30\x0c\
-\xc30\x0e~\xac\x0b\xb8\x09\xd4E\x85\x10\x0c\x05\x11Z\
-4\x03\xdd?\x1d\x8fN\x89u\xe8\x96\x18D\xe7U\xb3\
-\x10\xfc\xf4E\xc0\xd7\xf0\x82|\xc30\x0c\xc30\x8c\x83\
-\x1d\xeb\x02n\x02\x9c\xa0QQ^\x89\x9a\x89\xaf#!\
-\x06\x18\x9b[\x83\x9bVG!T]\x89\xd4\xef?F\
-\xa0$\xdf\xba{\x0d\xc30\x0c\xc38d\xb0.\xe0&\
-\xc0\xb7\xba\xf9\xf2\x96\xc1[\xb2\x16k\x031\xb8cU\
-\x08\xff\xfa6\x0fo\xaf\xafER\xb0\x1a\xb1\xfe\xda\xb0\
-K\xc30\x0c\xc30\x8c\x83\x1f\xeb\x02n\x02\x8e>\xae\
-C\xd0W\x87\xc4P-\xdaz\xea\xd06#\x01\xbdR\
-<\x08H\xda\xd5\xd5\x05y\xd80\x0c\xc30\x0c\xe3\x90\
-\xc0\xba\x80\x9b\x00\xb5]\x5cF\x17T%\xb4D\xeb\xb8\
-:\xfc\xbdw\x14\x9e\xea\x17\x87\xa1\x991\xa8\xa5u\x90\
-oP\xb1>`\xc30\x0c\xc30\x0e\x11\xac\x0b\xb8\x09\
-p\x0c`JN&<\xa7_\x04\x9f'\x0e\xfdD\xf8\
-\x9d\xd2:\x06\x9e\xd8\x18T\x0f<\x0a1\xd9\xed\xc5\x95\
-\x99\x00\x0d\xa3\xe9H\xcbI\x9f\x99:}\x9fv\xe4V\
-\xc71\x17\xf68\x19\x86a\xecS\xac\x0b\xb8\x89D{\
-<\xc8\x19v2V\x1eq\x1a\x16\xc7gbyM\x16\
-\xd6\x0d>\x1a\xc13\x7f\x81hob\xd8\x95a\x18M\
-\x83\xad\xce(\xbe\x06\x1b\xc5\xa5%\xc8\xcb\xcfG^^\
-.\xb6\x14n\x81?\xe0\xd7u7\x0d\xc30\x8c}G\
-\xf4ig\x9fugFZ\x1a\xbau\xee,\x22'\xfc\
-\x9eZc+\x98$1\xd1\xd1\xba\xd5u\xe9\x8f`\xb7\
-!\x08\xf69\x0e\xa9\xc7\x9d\x85\xa4\xe4\xb6@\xa8\x0e)\
-))j)\xb4\xf43\x8c\xa6@\xf1\x17\xd2\xf7i\x7f\
-\xfa\xf9\xa7\xf8\xec\xa5\x7fb\xd9\xc4\xf7\xb1\xa2\xa0\x04~\
-y\xce\xd2\xd3\xd2\x11\x17\x1b\xeb<S\x86a\x18F\xb3\
-\xb1\xa9`\x0bV\xacYe]\xc0M\x83\xc2\xce\x83\xf8\
-\xf8\x04\xb4m\xd3\x09=\x86\x9d\x84^'\x9f\x8a\xd6m\
-z#)1\x11Q\xa2\x9b\x0d\xc3h:\xec\xea\xa5\xa5\
-o\xe6\xf73\xd0r\xc9\x97\xf8\xd5\xe6\xafp\xe9\x96\x19\
-\x18>\xf7M\x8c{\xe5\x9f\x98=k\x16\x82\xc1`\xb8\
-Kx?[\x03\x0f\x03\xeb\xa3YP\x0d\xc3\xd8\x15\xd6\
-\x05\xbc[D\x81\xef\x03\x8ert\xb3\xc0qL\x82\xec\
-3\x0cc\xf7\xf0\xcb\xe3\xb3h\xc6gh3\xf3}\xa4\
-\xc6\x00\x09^\xa0k\xe5&\xa4\xad^\x8b\xf5\x9b6b\
-\xe1\xe2E()+Eeu\xa5\x0a\xc1&\x13Q\x9e\
-\xed\xae\x10\xa2U2t0\x8a\xa7&D\x89c'y\
-\xbd\xdc\xf4\x1a\xdc\xeb\x88<w7.\xed\x80\x88o\xc3\
-0\xf6\x1b\xa6\x5c\x9a\x0c%_\xd8T\x1a%B\xd0\x13\
-\xadB\xd0\xe9\xf2\x0d\xef7\x0c\xa3\xe9H\xc3)\xae\xb0\
-\x14\xa9\xd1@yu\x00\x15\xb2Q\xbcd%y\xd1\xa3\
-sgx\xbd^<\xf2\xe8\xa3\xf8\xeb\xad\xb7\xa1\xa8\xa8\
-\xa8A\xd04\x85H\x01\xd4D\x11\xc3\xb07\xac\xdf\x88\
-\xe93f\xc8\xf7\xdd\x10\x9c\x07\x18^\x1d\xe3>e\xda\
-t\x14\x14\x14b\xf3\x96-\xf8\xe4\xd3OQ\xe3\x8b\x5c\
-\x9f\xb4\xe9iG\xbf\xfc~?f\x7f\xff\xbd\xbe\xfb\x9c\
-\xbf\xe5O\xf8\xa8a\x18\x87\x0b\xd6\x05\xbc\xdb\xb8\x89\xc5\
-\x84\x0b\x7f5\x0cc\xb7\x89\xaa\x0b\xa2\xc6\xe3A0\xda\
-\x0b_@D\x87\x88\x8c(y\xa8j|~\x15 y\
-\x9b6!';\x07m\xda\xb7GL\xcc\xae\xc7Y\xd0\
-bURZ\x8a\x7f<\xf1O\xfc\xec\xd2\xcb\xf1\x7f\xbf\
-\xf8\x15\x1ex\xe8a,]\xb1\xc2yVE\x08\x86\x82\
-\xe1\x99\xc6\x8d\x04\x0d\x7f\x07\x83\x01L\xff\xf6[<\xf6\
-\x8f\xc7QQQ\x81'\x9f~\x06\xff\xfe\xcf\x7f\xb5+\
-\xda\x15A<\xbf\xf1\xb9\x91\xf0X\xc8u\x1f\x86V4\
-\xddO+f\xa3s\xb7q\xcf8\x8a;u+p\x7f\
-MM\x0d\xd6\xe5\xaeC\xad\xcfW\xef\x8e~\xeau\xc8\
-\x16%\xfb\x18\xc7\x07\x1fz\x04\x0b\x17-\xc4\xc2\x85\x0b\
-q\xcb\xcd\xb7hZ\xbc\xff\xc1x<\xfc\xe8?\xf4x\
-\xb1\x88\xe8\x0dy\x1b\xf4\x1c\xb7\xec\xe2w\x0d\xcf\x0d_\
-\xe0\xbe\xaa\xaa*\xfc\xef\xc5\x97\xf0\xd5\xa4IznP\
-\xf6\xd5\xc71\x8c\x1b\xcf\xc8\xfd\xfc\xde\xf8\xfa\x95\xf0~\
-\xbd.7l\xee\x0b\xfbQO8\xad\x1c\x7f\xb6M/\
-\xc30\x9a\x0f\xeb\x026\x0cc\xbf\xc3\xc9\x1d!O\x0c\
-\xa2S3P\xe9\x0f\xa1EZ\x02\xd2\x92\xe2Q\xe7\x89\
-FnI\x15f-X\xa0\x16\xc0k\xfe\xf0[\xdcp\
-\xdd\xb5:)\xc4\xb1\xb6\xef\x04\x11\x0b\xc5\xc5\xc5\xf8\xf4\
-\xd3\xcfq\xc1\x05\xe7\xe1\xc6\x1bo@^^>\xae\xb9\
-\xf6O\x08\x88\xa0dC\xb7\xb4\xbc\x14EE\xc5*0\
-U\xa4\xf0\xbf\x88\x8e\xf2\xf2r\x94\x96\x95!::\x1a\
-\xb1\xb1\xce\xba\x9e999h\xdf\xae\xad\xc6\x95n9\
-f\xb1\xb0\xa8\x10\xd5\x22\x8e\x5cQW\x0f\xfd\x91\xdf\x95\
-\x95\x95\xea\xbf\xaf\xb6V\x7fS\xdcTVUjx<\
-\x16\x10\x11\xb4\xb5\xfb*\xf1S\xdc\xcbq\xd9\x01\x91S\
-(((@\x99\xc4\x85\xc2\xcb/\xa2o\xf2\xd4\xa9\xf8\
-\xed\xef\xafA\x89\x5c\x9bO~\xd3\x9d\xdf\xefSw5\
-\xb5\x22\x0a\xe9\x9f\x08\xe9h\xc6\x9b\xbd\x13\xb2\xd5\xd6\x06\
-\xb4u\xdf\xb2e\x0e\xbau\xeb\xa2\xf1x\xf9\xb51x\
-\xe1\x85\xff\xc9u\x96;\xa2V\xf6U\x8b\xb8,(,\
-DP\xc3\xd7\x989HZ\xc9%\x22*:F\xe3]\
-ZZ\x86@ \xe0\x1cc\xdc\xe5\x5c\xa6Yqq\x89\
-^\x9b\xee\xe6\xf5\xc8\xb5\xf2z(Z\xdd\xf4\xa1[\x0a\
-H\xa6\x8b^\x97\x08\x7f\x1e\xe3\xb5\xd0\xb2\xabn\xe58\
-a|\xaa\xab\xabu_qi\xf1v\x85\xa7a\x18\xcd\
-\x83\xcd\x02\xde\x1b\xa4\x5c\xf2I\xa5P+\x85}JR\
-\xb2\x16\xbc\x96~\x86\xb1k|\x22`\xcaD\x88\xd4\x8a\
-\xd2\xa8-+F\xfc\xe6\x5c$D\x85\xb0:1\x0b\xdf\
-&v\xc7\xe0\x91G\xe3\xf8\xa3\x8f\x11A\x16#.\x1c\
-Q\xb3+(\x14\xca**\xf0\xd9g_\xe0\xb4SO\
-\xc6\xa0#\x8e@\x95\x88\x97\xd7\xc7\xbc\x85\xdf\xfc\xf6j\
-L\x9d6]\xadd\xef\x8c\x1d+\xc20\x0f}\xfb\xf4\
-ElL\x0cf\xce\x9e\x8d\xfb\x1fx\x00\x9f|\xfa\x19\
-6oq\xc4\xd7Y?:\x13\xd3\xa6M\xa5\x0eB\xbf\
-\xbe}\xb1~\xc3\x06<\xf1\xe4\xd3\xf8\xdf\xff^\xc2\xcc\
-Y\xb3\xd1\xb1c\x07dge\xebq\xc2\xb0\x97._\
-\x8e\xfb\xff\xf60\xdex\xf3m,Z\xb2\x04=z\xf4\
-\xd0c\x8f?\xf1/L\xfb\xf6[\xbc\xfd\xf6[\xe8\xdb\
-\xbf\x1fX\xde\xd2\xfd\x8a\x15+\xf1\xe0\xc3\x7f\x17\xf7o\
-\xa1H\xc4]\x97\xae]\xf0\xe8c\xff\xc4\x8b/\xbe\x84\
-\xf7\xc6\xbd\x8fv\x22>\xfd\xfe\x00\xfe.nf\xcf\xfe\
-\x1e\xf3E\x14\xb7i\xdb\x16\x99\x99\x99\xb8\xe7\xbe\x07\xf0\
-\xd2+\xafb\xce\x9c\xb98\xea\xe8\xd1RvGa\xcc\
-\x1boa\xc4\xf0aj\xcd\x1b?\xfe#\x5cv\xf9\xcf\
-\x91\xb71\x0f\xeb\xd6o@jJ\x0a\xfe&\xd7>g\
-\xde|\xac_\x9f\x8b\xfe\x03\xfaa\xfd\xc6\x8d\xb8\xed\xf6\
-;%^\xefb\xd3\xa6\xcd\x18>\xf4H\xa7\xfc\x92\xf3\
-k}\xb5\x98\xf8\xe5WR\xb6\xd5\xe0\x9dw\xc6\xe2\xcd\
-\xb7\xdeAqI\x09\xfa\xf7\xef\xaf\xe2p\xe2\xa4I\xf8\
-\xdb\xdf\x1e\xc2{\xef}\xa0]\xcd}{\xf7\xc6\x12\xb9\
-\xe6G\xfe\xf18\xc6\xbc\xfe\x06\xe6\xcc\x9d#\xd7\xdf\x13\
-\xa9\xa9\xc9\xd8RP\x88\xe7^\xf8\x0f\x9ey\xe69L\
-\x9a<\x19]:wBrr2\xfe\xf9\xaf\xa7\xf0_\
-IO\xfa\xd5\xa1C{\xb4\x14\xc1\xfd\xe2K\xafb\xc2\
-'\x9f\xca\xbd\x9a\x86g\x9f}^\xce-@\xf7\xee\xdd\
-\x90\x10\x9f\xd0\xa4<`\x18\xc6\xae\xb1Y\xc0\x86a\xec\
-wh\xe9\xa1\xf8\xf9\xef\x8b/\xe2\xea\xab~\x8d'\xff\
-\xf5\x02\xc6\x14%\xe2\xd6\xd2,\xdcU\x96\x89GK\xdb\
-c]\xb9\x1f\xadrZ\x22F\xc4\x19\x05\xc9\xeeT\xfc\
-t\xc90V\xadZ\x8dy\xf3\x17`\xee\xdc\xb9\xf8\xd1\
-\x8fN\x8776\x16\xe9\x22\xbc\xae\xf9\xc3\xef\xf0\xab_\
-^\x89OE\xec\xcd\x985SD\xd8\x0a\xdcv\xdb\xed\
-\xe8\xd4\xa9\x13~\xff\xdb\xdf`\xcd\x9a\xd5j\x99\xf2\x07\
-\x02\x987o\x1e\x96,^\x82\xc2\xa2\x22<\xf4\xf0\xc3\
-\xd8\x94\x9f\x8f\xbb\xee\xba\x1d\xd1\x12\xc8\xd5\xbf\xf9-6\
-\x17l\xd2k\xe1\xb6f\xed:\xdc\xf2\xd7\xdb\xd0\xa1S\
-{\xf1\xeff\xac^\xb5\x0aO>\xf9$\xca\xca\xcb0\
-k\xe6L\x8c{o\x1c\xfa\xf6\xeb\x8f\xcc\xb4t\x04\xc5\
-=E\xd3\x8b\xaf\xbc$\x02\xaf\x06\xb7\xdfv\x0bz\xf7\
-\xee\x09\x8f\xec\xef\xdc\xa9#\xee\xbb\xe7n\x9cx\xe2\x09\
-\xb8\xef\xfe\x07\xe1\x8d\xf3\xe2\x84\x93NDN\xabV\xb8\
-\xe2\xff.G\x97.\x9d\xf1\xd0#\x8f\xf2*\xf1\xf0\xdf\
-\xee\x87G\x84\xdf\xdf\x1f\xfd\x07\x02\xb4\xa01\x9d\x22\x92\
-J\xbcC\xae\x08Wv\x09\xb7\x92\xf3G\x8c\x18\x8ea\
-\x22\xf2.\xba\xe8B\xbd\xbe\xdbE\xfc\x1d9d0\xee\
-\xbe\xf3vL\x9b>\x1d\xef\x8c{\xaf\xfe\xfex\xa2<\
-\xfa}\xdc\xb8\xf18\xef\xfc\x1f\xabE\xf5\xdf\xcf=\xa7\
-\xc2l\xd6\xac\xef\xf1\xd8\xe3O\xe0\xa2\x8b/\xc2u\x7f\
-\xfa\xa3\x08\xec70\x7f\xd1B\xb5\x9e\x9ey\xfa\xa9\xf8\
-\xd3\xf5\xd7b\xe9\xd2\xa5\x183f\x8cZ\xfd\x1e\x12\xe1\
-9]\xc4\xf7\x9f\xff|-\xae\xbc\xf2r\xb5\xac\xdev\
-\xc7]X\xbab\xb9\xa4\xd9\x8d\xf2\xbb\x05\xee\xbd\xf7>\
-\xe4\x8aP]\xb9v\x15^}\xe5e\xa4gd\xe0\xb2\
-+/\xc5\x0b\xff}I\xee\xd5\x17\x8e\x85\x90\x17d\x18\
-F\xb3a]\xc0{\x8b\x16J\x96\x80\x86\xd1t\xeaP\
-ZQ\x8e>\xbd\xbb\xc9\xd7\x10\xaa\x02\x22\xf2Z\xf7@\
-aN\x1f\xc4\xb6h\x83@\xc0/:F\x9e)y\xb6\
-\x9a.\xfd\x1a`\xf7\xe6\xebo\xbc\x89\xbb\xee\xbeG-\
-g\xbf\xb9\xfa*\x15\x91\xadZ\xb7\xc2\xe2%\xcb\xf0\xd9\
-g\x9fk7\xe8\x96-\x05*\xf28\xbe\xf0\xf2\xcb/\
-\xc3\x80\x01\xfdq\xd1O/\x84\xd7\x1b\x1b~\xae\xa5l\
-\xf4x\x90\x9f\x97\x87\x95\xab\xd6\xe0\x97W^\x89n]\
-\xbb\xe27\xbf\xfb\x8dD;\x88\xfc\xfc\xcd\xf5\xef3\xf9\
-\xfc\x8b/D8\xd6\xe0\x92\x8b.\x92\xeb\xea\x85?\xfd\
-\xe9:\xcc\x9e;G\xbb3SSS\xf1\x8b+\xaf\xc0\
-\xaf\xaf\xfa\x15223E@F\xe9\xc2\xf2Y\x99Y\
-X\xb5r\x15\x96-]\x8e\xa1\x83\x87 -=]\x05\
-\xe0\xb8\x0f>\xd0}\xabV\xafAAQ!z\xf5\xec\
-\xa9\x16\xbc\xe3\x8e9\x06UU\x95\xf8\xf8\x93\xcf$\x8c\
-\xdej\x89\xa4\xe5l\xe2\x17\x13\xb5+\x95c\x01]\xb1\
-\x1c9\x89\x85\xfb\xd2R\xd3\xd0\xa9c{t\xec\xd0\x0e\
-C\x06\x0d\xc2\xcc\x193\xb1y\xf3\x16\x15Z\x0bD \
-\xd2\xfa8a\xc2\xa7a\x11\xe9\x08I\x8a\xaeK\x7f\xf6\
-S\x9c|\xc2\x89\xb8\xe0\xbc\x9f\xe0x\xf9\x9c6u:\
-\xbe\xff\xfe{\xedZ.-)\xc5\xfa\xdc\xf5\xa8(-\
-\xc7\xd8\xb1\xef\xa3\xb5\xa4\xaf\xcf\x1f\xc0\x07\x1f\x8e\x97\xb4\
-`\xcf\x88\x0f\x9b$\x8cy\xf3\xe7\xe3\xc6\x1b\xfe,\xe2\
-s\x18F\x8f\x18\x89\x94\xe4d|?g\x0e\xae\xbf\xe6\
-\x8f\xe8\xd3\xb3\x17\xae\xbf\xf6\x1a\xc4%&\x8a\xb0\x9c\x85\
-\x84\xb8x\x1c!\xf1\xfb\xe5\x95\xff\x87\xd3N<\x05G\
-\x8d\x1e)\xf7i\x8b\x95\xb0\x86\xb1\x0f\xb0Y\xc0\x86a\
-\xec7(\xa8(H\xce=\xebG8\xe1\x84\xe3q\xf1\
-\xcf.\xc2\xd1m\x13p\xf6\xe6\xa98\xbfh\x1a\x8e\xf7\
-\xafBfV\x96c\xf1\x11w\xae\x85\xad\xa9\xd0%-\
-\x87\x7f\xba\xf6\x0fx\xe2\xf1\x7f\xa8P\xa2\xa0b\x17\xeb\
-\xd3\xcf>\xa7V\xbfSN>\x09\xfd\xfb\xf5\xd5!/\
-A9\x83\x8b\xb8s\xdc\x1f\xc7\xb8E\xc7\xc4\xa2\x8e\x02\
-(LT\xb4G\xc7\xb8QT\xc6\xc5\xc7\xe9\x984\x0a\
-\x98d\x11T!w\x19(\x09\xb4\xa4\xb4\x04\x09\x09\x09\
-\x88\x15\xf1\x18\x08\x04u}P\x0f\xa2\x9d\x08\xd1\x89{\
-\x0d\x14i\x92\x06q\xb1^\x5ct\xe1\x858\xe7\xac\xb3\
-\xb4\x0b\xf8\xdf/\xfc\x17sD\x8c\xdew\xdf\x03H\x88\
-\x8f\xc7\x99g\x9c\x86V-[J:\xc8\xf5\xcb\xc64\
-\xa3\xa0*\x15\xb1\xc5\xf1\x7fkEx-_\xb1B\xaf\
-\xeb\xd2K\x7f\x86x\x11N\x0c\x81n\x1b\x88\xfc\xee\xe0\
-N\xba())Q+\xe0j\x11\x99+V\xadB\x5c\
-\x9c\x17?>\xf7l5\x06\xf0\xea5\xdd%L\xde\x0b\
-\xa6\x8bs\xfd\xf1:9\x84\xd7WVZ\xa6\xe7-\x93\
-8\x9cx\xd2q\x186\xecH\xbc\xf2\xfa\x1bx\xf9\xe5\
-W0h\xe0\x00\x0c>\xe2\x08\x15\xd2<\xd7\x1f\x0c!\
-11A\xc7P\xd2\x9f*\x11\xc5\x5cE!1)Q\
-\xfd\xa2\xe5\x90\xdd\xe2\x01\x11\xd5\x84\xd6\xc7hIw\x8f\
-\xa4\x13\xf77e\x02\x90a\x18\xbb\x8fu\x01\x1b\x86\xb1\
-\x9f\x89B\xf7n=0\xea\x98\xe3\x11\xaa)\xc0\x88e\
-\x9f\xe1\xcc\xac(\x9c\x94\x1e\x8d\x93*W f\xd32\
-\xcc\x98\xfb=J\xca\x8au,Z\xe4\xec\xd7]B\xe1\
-\x22\xffbb\xbch\xd3\xba5\x06\x0e:\x02\xe3?\xfa\
-\x18\xebrs1\xfd\xdb\xefp\xfa\xa9\xa7\xa2k\xd7\xae\
-\xce\x84\x8c\x80\x0fi\xa9)X\xb7v\xad\x8a\xa9\xe2\xe2\
-R,Z\xb4\xb8~R\x03EJP\x04JFF&\
-\xe2E\xfc,\x94c\x1c\x1f\xf8\xcd\xd4\xe9\xc8\xdf\xb8\x11\
-\xc9I\xc9\xda\x82\x8e\xf2Da\xd8\xf0\xe1X\xbbn\x83\
-\x8e\xc9S7S\xa6\xc0\x1b\x17\xa7\x82\x901\xa7\x98a\
-w\xadK\x9d(-Z\x06\xcf9\xf7\x1c\xfc\xf6\xb7W\
-c\xde\xdc\xb9\x98:u\x1a<\xd118\xf7\xec\xb3\x91\
-\x9a\x9e\x86\x8a\x8ar\x15G\xd1|\xe7\xb8\xa4CUM\
-\x0d\xda\xb7o\x87V99\x18\xd8\xbf\x1f.\xfb\xf9\xa5\
-\xb8\xe2\xf2\xcbp\xfe\xf9\xe7\xab\x85\x90\x221*:J\
-\x04\x14\xbb\xcd\x1d\xd1\xc4}j\x0d\x94\xf0\x18:\xd3\xb3\
-\xbc\xa2B\xc75\xc6JX\x17\xfd\xf4\x02\x5c.\xfe\xd0\
-\xbay\xf2I'\xaa\xe0%*\xc2$\xe63f\xcc\xd0\
-n\xdc\xd5k\xd6`\xf6\xccY8r\xe8\x91h\xd1\xa2\
-\x85\xf8\xeb\xc1\x85\xe7\xfd\x04W\x5cz)\xae\xfe\xd5\xaf\
-D\xf4\x1d\x81/'~\x89c\x8f9\x06\xc3\x87\x0dC\
-H\x02\xab\x91\xfb\xc6\xf4M\x10q\xf9\xd5W\x93\xd5\x1f\
-\xceLN\x95}L\x8aq\xef\x7f\xa8Bt\xe5\xaa\xd5\
-X\xb8p1\xda\xb6i\xe3\xa4\x95\x5c\xb3\x5c\x01#\xaf\
-\xf7\xd2\xba\xa8\x0cc\xdf\xe0L\x02\x91\xd6\xacM\x02\xd9\
-}X'\xf9\x836\x09\xc40v\x17Z\xf88#v\
-\xe1\xf8\xd71p\xf3|\xf8j}\xa8\xa8\xaa\xd5\x99\xbf\
-\xcb\x02\x09\xe8y\xecY\xa8\xf6Wc\xe2\xe4\xc9\x984\
-\xe9+\xf4\xee\xd9\x0b\x89\x09\x09\xe1\xb3\xb7\x0feB\x85\
-\x08;\x8a\x96\x91\x22\xc8\xda\xb6i\xab\xb3k\xa7M\x9d\
-\x8a\x93N:\x1e\x95\x15\x95\xf8\xec\xf3\x89*\xe4B\xc1\
-\x00z\xf4\xe8\x8e\x13O8Ag\x9e\xbe\xfb\xde\xfb\x98\
-6}\x9aZ\xbdbD\x18Q\x0cq\xd2Evv6\
-\x8e=\xfa($&'a\xec\xd8\xf70\xf1\xcbI\xda\
-e\xfa\xcb_\xfc\x02\xa3F\x8c\xd0\xae\x5c>\xf1-\xb2\
-\xb2\x90\x98\x18\x8f\x09\x1fM\xc0\x84O?\xc3\xfa\xf5\x1b\
-p\xfd\x9f\xae\xd18\xcc\x9a5\x13]\xbbtF_\x11\
-]*\xc8\xc4=\xbbH9\x19\xe5\xb9\xe7^\xc0w\x22\
-\xac\x86\x0d\x1b\xaa\x96\xc9/\xbf\x98\xa8\xeb\xf9q\xb61\
-'\x80\x1cs\xcc\xd1\xe8\xd9\xbd\x1b\x96H\x9c?\x1a\xff\
-\x11\xbaw\xef\x8e\x13N<\x01O?\xfb,\xbe\xfez\
-2&\x8a\xe8\xca\xcc\xcc@\x17)\xbf\xbf\x94\xb8\x0d\x15\
-\x81F\xd18\x7f\xfe\x5c\xfc\xf8\xdcs\xb1y\xd3&\x11\
-\xd2\xe58\xee\xd8c5-\xde\x1d;N\xbb\xbeO=\
-\xf5$\xb5D>\xfd\xf4\xd3*h'N\xfa\x12G\x1e\
-9D\xc7I\xb2`\xab\xad\xa9\xc5\xa2%K\xe1\x8d\xf7\
-\xe2\xddq\xe3\xf0\x91\x5cWg\x09\xe3\xe2\x9f^\x88\xde\
-\xbd{!w}.^{\xfd\x0dL\xfe\xe6\x1b\x11\xae\
-\xd3\xc5\xffc\xd4\xc2\xf7\xc1\xf8\xf1\x98#b\x96\x96?\
-\x0a\xba\xd1\xa3G\xa9\x9f\x9c\xd4\xf2\xd5W_\xcb\xb5\xce\
-D\xb7\xae]\xd0K\xee\xe7x\xf1\xf3\xf3\x89\x13\xf1\xe5\
-\xa4I\xb8\xe2\xb2\x9f\xe3\xc4\x13O\xc4\xdcy\xf3\xe5\xde\
-\xf8\xe5~\x89\x18\x95t\x9a;o\x1e\xb223u\xf2\
-\x09\x85\xad\x95\xaf\x86\xb1\xf7\xb8\x93@\xa2\x1e{\xfe\xd9\
-\xba\xce\xed;\xe0\xb4\xe3O\x807:\x96M\xbf\xb0\x13\
-c+\xc2\x16\x08m\x91\xea\x7fv\xffD\xa1\xaa\xba\x0a\
-\xa5e\xa5h\xdd\xb2\x8d\x15P\x86\xd1$\xb8<J\x1d\
-*E0L\xbe\xff\x1a\x8cZ\xfa\x11|\x95\xb5\xf0\xcb\
-\xfe\xa4\xa4x\xbcP\xdd\x06#oz\x14\xb1qq\xf8\
-p\xc2\x04\xac\xdf\xb0\x11w\xdf~;\xda\xb6j\x15>\
-\x7f\xfb\xd0J\xc8\x09\x1ck\xd7\xadS\xeb\x1fg\x9aR\
-\x88,[\xbe\x5c\xc7\xac\xb1{t\xc5\xcaUHII\
-BFz:bEl\xb6\x10\x81\xc75\xff\x96.[\
-\xae\xe7w\xea\xd4Q\x97<\xe9\xd8\xa1\x83\x8a8vc\
-\xb6i\xdd\x0aA9w\xd5\xea\xd5\xd8\xbcy\xb3Z\xc0\
-8V/&\xa6\xe1]\xc5\x14\xb4\x14X\xcb\xc4\x1fN\
-\xfc\xe0\x0c\xde\x0e\xed\xdb\xebu\xae]\xbbN\xc2L\x96\
-\xf3\xb2\xc5\xa5\xe3\x9e\xdd\xb0\x8c\xe7\xc6\x8d\x1bu\xa2G\
-\x9f^\xcek%\x97\xafX\x89\xcd[6\xeb\xa4\x146\
-,93\x96\xfb\xb9\xb8\xf3\xcaU+U\x00f\xa4\xa5\
-\xabEn\x93\x88;\x8a\xb8\xae\xdd\xba\x22'\xbb\x05V\
-\xae\x5c\x89\x96\xad\x9cn\xe3\xb5\xeb\xd6\xa2W\x8f\x9e\x12\
-\x97r]\x9a\xa5\x83\x94\xf1\xb4l.^\xb2Db\x10\
-\xa5\x93Nh\xc5\xa3\xc0b\xb7.-\x94G\x0c\x1cX\
-/\xb2)\xce\xf3\xf3\xf3\xd5J\xb9h\xf1b\x15\xba=\
-{\xf5BrR\x92^3\xc76rl\x1f\xd37.\
-.\x1e\x03\x07\xf4\xd7\xb4\xa7%\x95i\xd1\xa6m\x1b\x11\
-ruh%\xf1q\xaf5?/\x1f\xf1\xf1q:;\
-:Q\xae\x893\xab\x99\xc6\xa9i\xa9:\x8b\x98V\xc7\
-\xf5y\x1bE|\xd6H\xfav\xd2xh\xfa\xc8}\xe2\
-\xc4\x11\xc30\x9a\x87\xb9\x8b\x17\xe2\xe3/?\x17\x01\xf8\
-\xc2\xb3u\x9d\xa4p8\xfd8\x13\x80;\x85\xaf\x88\x92\
-\x82\x8cc\x80B~.^!\xff\xa4\xe0cA\xc8\xf5\
-\xb0Z\xb5l\xa5\x83\xbb\xf7F\x00\xd2\x7f\xc2\xc2\xd80\
-\x0eg\x98\xd7\xabEd\xbc\xfa\xf0-8k\xc1X$\
-\xfb*Q\xea\x0b!!)\x11\x0f\x95dc\xd0/o\
-DRZ\x0cF\x0f>\x16\x9eh\x0fR\x92R\x10\xdd\
-\x84\xb1`\x14q\xf4\x9b\xcf\x90\x8a3\xf9\xcd\x19\xb2\x14\
-0\xda\x8d\xcc-\xfc\x8c\xf2/\x05\x14\xf7\xf3\xb9\xd6\xa7\
-.|\x8cb$\x14\x9eH\xa1\xcf\xa3\x9c\xc6\xdf\xeaG\
-x\x9f+\xfe\x5c\x1a\xfbC?\x18\x08\xf7\xd1e\xe3\xe7\
-\x9a\xf1\xe49\xdch\xb5\xa3\x7f\x5c,\x99\xb3\x84\x19_\
-\x86\xc9\xeee\xdd/n\xc5\xa1~g\x9c9\x96\x8e\xf0\
-\x5cv\x99\xb2\xf1I7n\x9c8I\xc5\xe3a'.\
-\xfdw\xc3f\xda\xf0<\x8f\x1379\xe0^#\x97\x8e\
-q\xc6\xda5\x5c\x93\xfa'\x9fzM\x0c7\x1c6\xd1\
-k\x958\xb8\xe11\xfe\x14~\xdcO\xb8\x9f\xdf\x22\xd3\
-\xce\x09\xaf\xe1Z\xe9/\xf7\xd5\xa7\x8d\xec\xd3E\xa4\xe5\
-S\xaf_\xd0\xeb\x16\x1a\xa7\x9da\x18{\x8e+\x00m\
-\x16p\x13\xe0\x18\x1a\x9f\xaf\x16[\x8a\x0a\xb0t\xc2\xcb\
-X\xf6\xc4\x8dX\xf4\xe4]X\xbbr\x86\xb6\xd6)\x02\
-\x1b\x8a\xcd&\xc2\x82\xb2\xd1F\xeb\xc2\xc6\xbc\xbc\xb0\x83\
-\xbd#\xf2\x96\xba\x95\xccV;\x0d\xe3\x00\x13\x83\x10r\
-z\x0d\xc0\xe2\xf4,\xc4z=\xc8N\x8eGQt\x1c\
-6x\xd3\xd5\x8au\xea\xb1g\x22##\x03\xa9\xc9\x22\
-\xfe\xc2c\xd3v\x05\x85\x85+0\xc2;\x10\x13\xfeM\
-\x11\xa1b\x89\x9f\xb2\xb9b\x86\xc7\xe8&\xf2\x18\x1f\xe8\
-\xfa\xef\xea\xc8\xf9M\xbf\xb7\xf2?\x82\xc6\xfe\xb8\x85\x02\
-\xc5L\xbd?\x11\xb8\xfeq\xd2\x8a\xeb\x1f\xcf\xe5\xda\x84\
-<F\xe1[\xbf_\x7fK\xb8a\x7f\xdcx\xf0\x5c\xed\
-y\x10\xe8\x86\xee\xb9q,\xa1|\x91\xff\x91a3\x0d\
-\x1c\xbf5n\x22.5\xaea\x7f\xea#\x1cF\xfd\x93\
-M\xc3\x88\x08\x9b\xe8\xb5\xca~7\x1e\xbaO\x8e\xbb\xfe\
-\xe9w\xd7\xbdx\xcb\xefn8\xee51]x.\xf7\
-3\xae\x84\xdf]\xf1G\xf4\xbc\x88\xdf\x86a4\x1f\xb6\
-\x10\xf4.\xa0fb\xab\xb9\xa4\xac\x04[\x16\xcfF\xca\
-\xebw\xa1c\xee<$\xe6\xceGY\xd9f\xe4\xa5v\
-DLl\x02Z\xea\xc0hI\xbb]\xa4\x1f\x85\x18\xbb\
-\x5c\xc6\xbc\xf5\x16\xbe\xfd\xee;\xcc\x98\xfd=f\xce\xfa\
-^\x0b\xc6\x8f&|\x22\xfbf\xe0\xe8\xa3F\xd3\xa1\x16\
-\xc7\xee+\x9a\xd4oj8\xb5B\xb0U\xec\x84\xc3\xfd\
-\xf5-o\xf9\xce\xbd\xfc\xce\xf3\xd8\x9a\xe6i+W\xaf\
-\xc1\xd7\x93\xbf\xd1n-\xa7\xa0w\xdc\x10\xb70\x96\x1d\
-\xce\x87~u\xc2\xd6\x93\x0dc\x1fA+TRz6\
-\x16UVb\xd9\xaa\x0dXU\x97\x8e\x95}\x87!\xaa\
-}W\x8c\x1c6\x1cm[\xb7\x0f\x8b\x10\xc9\x87\x96\x17\
-\x0d\xc30\x9a\x05[\x08\xba\x89pm\xad:\xa9\xa8\x8a\
-V/E\xdc\xbb\x8f\xa0m\xb0B\xad\x15\xe9\x09\x1et\
-Z8\x05\xf8\xf8_\x08\x04+\xe9\xd29\xa1\x09p\x5c\
-\xce\xdf\x1f~D\xd7\x16KHIDB\x92\xb3|\x04\
-W\xcc\xe7\x8a\xfc\x84\x22\x8cb\xcc]\x82\x82\x16\x11\x0a\
-Q.\xbbp\xc3M7k\xf7\x89\x0a=\xf9\xe4x\x1d\
-\xbas\xdf\xc1Y]]\x85+\x7f\xf1+L\xf8\xe4\x13\
-\xfd\xbdE\xfc\xe4:e\x81\xa0\xf3\xb2}='\xbc\xb4\
-\x83\xdb\xc5\xc2\xb0T4\xcao.\x0f\xe1\x0aA\xc3\xd8\
-\x17\xb0\xe1\xc1\xadm\xcb\xd68\xe5\xdc\xdf\xe2\xe8\x07\xdf\
-\xc1\x91\xb7\xbf\x80\xa1\xc7]\x86\xe1\xdd\x07!\xd1\x13/\
-O\x94\xe4q\xe6O+\xa0\x0c\xc30\x9a\x1d\x9b\x05\xdc\
-\x04\x82u!\xac\x99;\x05i3' \xae\xb6\x1a\xe5\
-5\x01T\xf9CH\x94\xe4\xdaP\x1d\x80\xa7\xff\xb1h\
-\xdb\xae\x8b\x93tMH\xbf\xca\xaa*\xbc\xfc\xd2K\xf8\
-\xcd\xaf\x7f\x8d\x9f\x9c}\x0e\x06\x0e\x18\xa0\x03\xcb'}\
-\xf5\xb5\x0e\xfc>\xfd\xd4\x93u@\xf9\xa4\xaf'c\xcc\
-\x9boamn\xae\x0e\xa6\x16E\xa6\xb3\xf8\xc6\x8d\xfb\
-\x00\x9e\x18v\x9dxP^^\xa1n\xbe\xf8\xf2K\x11\
-t!th\xd7\x16_\x7f3\x15\xcf<\xf3\x0cj}\
-~$\x8a\xb8\xe4\xec\xc3\xf4\xf4t\xf4\xee\xd9S\xfd\x98\
-<e*\xdey\xf7=\x1d\xc4\x9d\x95\x95\x85\x8c\x8ct\
-,_\xb1\x1cS\xbf\xfd\x16\x1b\xd6o\xc4\x981o\xa8\
-\xc0\xe4\x00to\xacww\xb4\xada4\x19\xf7Q\xa9\
-+\xafB\xf9\xeb\xef\xa2\xf6\xe9\x97\x11\xf3\xf4\x0bH\xfa\
-r2\x82\x8bW\xc2\x93\x96\x81\xd8\x8em\xb5K\xb0\xde\
-R}\xa0a\x9b\xc8\x9e\x07\xc30\x0ea\x1a,\x80\xc6\
-N\xe1\x80d\x0a\xabP\xc1&\xc4r\xa0z\xb5\x1f1\
-\xb11\x22\x0a\xa5\x16\xe0x\xea\x8ar\x04\xaa\xabw\xcb\
-HA\xcb\x1a\xadv\x1c\xef\xb7z\xf5j\xacY\xbdF\
-\x85\x9f\xd3\xbd[\xa7\xef\x17~\xf3\xedw\xf0\xaf'\x9f\
-\xd2\xd9r\x13&|\x82G\x1e\xfd\x87\xae\x03\x96\xb7i\
-\x93\xbe(}\xe9\x92\xa5(/+\xc7\x9auku\xdd\
-1\xce\xce\xbb\xeb\xce\xbb0\xfd\xbb\xef\xf4%\xf1>_\
-@\xdf`\xb0ac\xbe\xbe\x0e\xea\xc5\xff\xbd\xa8\xe2\x8f\
-KT\xdcz\xeb\xad:\xd3\x8e3\x00\xff\xfc\xe7?\xeb\
-{K\xbf\x992\x0d\xd7]\xfb'\xbc\xf1\xd6\x9b\xd8\x5c\
-\xb0\x19\xd7]w=\xc6O\x98\xa0VG\x9eg\x18\xcd\
-\x8a\xe4)Z\x9bk\xe4\xd9\xd9p\xdfCH\xfa\xdb\xa3\
-\xe88{6\xba\xfaB\xe8W\x19@\xb7)\xdf\xc1\xff\
-\x97;\xb1i\xfcD}&\x9aj\x8d\xa6\x9f\xdb\xdb\xf6\
-\x9a}\xfc\x0c\xe856G<\x0d\xc30\x9a\x88u\x01\
-\xef\x02v\x01s\xa0rbf&b\xe2\xe3\x90\x9c\x9c\
-\x84-U\xec&\x0d\xb2\x83\x0aQ\x89\xa9\x88\x8bOr\
-\xbaL\x9bh\xa5`a\xef\xf7\x07E`}\x82'\x9f\
-~\x16O=\xf3\x9cN\x00a\x17,\xbbe\xe7\xcf_\
-\x80\xc7\x1e\xfb'n\xf8\xd35\xf8\xe3\xef\x7f\x87\xbf?\
-\xfc\x00\xbe\x9b\xfe\x9d\xbe\xd6\xea\xc7\xe7\x9c\x85\xae];\
-\xe3\xce;n\xc3\xc8\x11\xc31z\xe4H\x5cx\xc1y\
-\xba\xa6Y\x8d\xcf\x8f\xe9\xe2\xee\xd4\x93OF\xcb\x16Y\
-\xb2\xff|\x5ct\xfe\xf9:0\x9d\xab\xf1\xd3\xe4\xf2\xd2\
-K\xaf\xe0\x97\xbf\xfc\x05\xfe|\xfdux\xf8o\x0f\xc8\
-.\x0f\xa6L\xfe\x06I\x22 \x93\x13\x13p\xfdu\xd7\
-\xe2o\xf7\xdd\x87\xe3\x8f?\x163DLR\xa8\xea\xc5\
-\x19Fs\x22y*\xe8\x97F\xca\xff\xc6\xa0\xc5{\xe3\
-\x91\x1d\x9b\x80\xb8\xe8Xg\xa2\x81\xe4Io\x8c\x17-\
-7\x17\x22\xe6\x9e\x07Q\xf0\xd9\xd7\x1c\x9f\x10>q\xe7\
-\xb0q\xc41\xb6\x9c\x98\xc5\x8do\x9d\xe0gS\x05\xe4\
-\xf6\xa8\x93g\x87\x8d\xace\xcbW`\xf9\xca\x95(-\
--\xdd\xf93!a\xa9\xe8\xdcE\x90\x1c\xd6\xe1\xc6\x8b\
-\x9f|\xd6\xf6&\x9e\x86a\x18\xbb\x83\xcd\x02n\x02\x1c\
-\x83^\x9b\xdd\x19EI\xad\x91\x1c\x13D\xfb\xa4h\xb4\
-L\x8eG &\x115Y=\x11JH\x81G\xd3\xb1\
-i\x09\xc9A\xed\xf1q\xb1\xb8\xf2\x8a\x9f\xe3\xa1\x07\x1f\
-\x90\xed~]3,\x86]\xf0rC\xd8\xad\xcb1}\
--[\xb6\xd6\xee\xaf\xd6\xad\xdb\xa0_\xff~\xba\x16\x98\
-\xde/\x89\x0f_\x17E7\xef\xbc\xfd.\xfez\xebm\
-\xf8\xfa\xab\xc9HNJ\xd4\x8aG\xeaO\xa9H\x9c%\
-\x1c\xe2\xbc^\xfdd\x17\x1a\xd7,,\xab\xa8\xd0w\x81\
-r2\x08_i5\xf8\xc8!\xa8\xac\xaaF\xb4\xfc\xa6\
-\x08l\xd7\xb6\xad\xae;\xd6\xa7o_\xb9\xf0mg\x06\
-\x1aFs\xc0\xc6S\xc9\xa2\xe5\x88\x1e\xf3&\xd2\x02\xd2\
-\x90\x92\xfc\x19\xd9\x80\x8a\xe1\xb3$\xcfI\xfa\x86<\x94\
-\xbc6\x065\xc5\xc5\x9a\xa7w\x04\x85\x13\x87M<\xf1\
-\xf4\xd3\xb8\xed\xce\xbbp\xf3\xad\xb7\xe3\xc6\x9bn\xc1\xed\
-\xf2\xfd\xee\xfb\x1f@ee\xb9>\x1bt\x17)\xb2\xf4\
-{x_\xe3c\x84V\xb9\xd5k\xd7\xe2\xa6[n\xc5\
-\x0d7\xfe\x05\xbf\xbc\xea\xd7x\xf2\xa9g\x10T\xcb8\
-\x1dl{\x1e\xdf\xb6\xc15\x03K\xcb\xcb\xea\xf7\xbbn\
-\xf4\xb7\xfc\xa7e}Ka\x81\x8a\xc9\x90\x08\xcc\x05\x0b\
-\x17\xe1\xa9\xa7\x9f\xd1W\xac\xb9\x93\xba\x1a\xdc7\xf8\x1d\
-\xb9_\x8f\x19\x86a\xec!\xd6\x05\xbc+X)I9\
-\xdb\xa1ko\xc4^p\x05J\xfcQ\x88\x8d\xe5r\x06\
-\x1elh\xd1\x05\xa9'_\x8a\xb8\x848q\xb2{\x85\
-1_3E\xb4\xdb'\xc2\xba\xc1\xb5\xbb(\xcc\xd4\xff\
-\xbc\x0dZ1\x16\x16\x14b\xe9\x92%h\xdb\xb6\x8d\xfe\
-v\xdcy\xf4e\xf1\xffz\xf2I\xdcy\xc7\xed\xb8\xf7\
-\x9e\xbb\xd0\x9a\xafRb\xa5P\xe7\x0c\xb0\xe7\xbbK\x9d\
-\x19\x94\x8e{\xbe/\xd4+Bo\xf6\x9c9j\xd5\xa4\
-\xb5\x85/w\xf7\xc6\xc6J\x1c\xa4B\x13\xe5\xc8\x98\xb8\
-\xcb=\xb8\xcbK\x18F\xb3\x22y4T\xebC\xf9\xe7\
-\x13\x91\xba*7\xfc\x8cm+h\xd80M\x90\xe7!\
-f\xea\x0c\x94\xacX-\xd9\x98-\x9b\xf0\xc1\xed\xc0\xc6\
-\xd2\xb0!Cp\xfc1\xc7 \xde\x1b\x87\xdc\xf5\xebq\
-\xec\xd1\xc7\xe0\x98\xd1\xa3\xe5\x99\x8dS7\xf5a4\xfe\
-$\x8d\xc2\xe7\x22\xce\xdc3v\xdc\xfb\xf2\xec\xc4\xe1\xe9\
-\xa7\x9e\xc0\xaf\xaf\xfa\x05jjk\xf5x\xbd \xe5y\
-\xb2\xb9\xc2\x8d\x8b\x17\xdf\xf2\xd7[uQ\xe7\xb0\x83\xf0\
-\x87\xf3\xc95\xfa\xf8\xe6\x13\x8e\xe7\xe5[@\xf8|\xf2\
-I\xd3\x89]\x91\x17\x18\xf6\xb7\xfe{$;\xdao\x18\
-\x86\xd1D\xa2O;\xe7\xac;\xf9\xaa\x9e\xee\x9dl\x12\
-\xc8\x8e`?y\xac7\x06Uq\x19\xd8PV\x81\xd5\
-%\xe5\xc8K\xccD\xe5Y\xbfE\xcb>\xfdE\xac\xc5\
-\xea\xea\xfc*\xcev\x91~,\xae\xf9J\xaa\xb7\xdez\
-\x1b\xc7\x1dw\xac\xbe\x97\xd4}\x83\xc8\x17\x13\xbf\xd4W\
-Y]\xf6\xf3K\xd4\xed\x7f\xfe\xfb\x92\xbe\x8e\xea\xc5\x97\
-^\xc6\x80~\xfdp\xf9\xcf\x7f\x8e` \x801o\xbc\
-\x8d\x99\xb3g\xa9\xc5n\xc3\x86\xf5\xf8v\xc6L\xcc\x15\
-Q7o\xfe\x02\xed\x0a>\xe6\xe8\xa30w\xc1\x22|\
-\xf2\xd9\xe7\xfa\xbe\xd2\xcc\xecLL\x94\xca\xf6\xa7\xe7\x9f\
-\xaf]\xccO?\xf3o]\xdd\xff\xb5\xd7_\xd7J\xe7\
-\xf2\xcb/\xc3\xa6M[\xf4}\xa4\x17\xff\xecb]y\
-\x7f\xe6\xcc\x99().\xc2\x09\xc7\x1fo\xf9\xc2hv\
-\x82\xf2\x1c\x95<\xf142V\xaf\x87W\xf2\x97Z\xff\
-\xb8\xd5\x05\x11\x0a\xfff\x8e\xab\x13Q\x17UQ\x8e\xb2\
-\x8e]\x919\xeaH\xe7\xe4\xeddE>{l\xe4t\
-h\xd7\x0e\xdd\xbbwC\xfe\xe6Mj\xf5\xfb\xc3\xef~\
-\x8b.]:c\xdd\x86\x5c<\xff\x9f\xff\xe2\x95W^\
-S\xd1\xd4\xbe]{\x9dy\xff\xec\xf3/\xc83\x10\xc0\
-\xebc\xde\xc4\xbb\xef\xbd\x87\x94\x94\x14\xb4n\xd5J\x97\
-\xa8\xe1\xd3\xca\xc6\xd2=\xf7\xfd\x0dE\xc5\xc5\xe2_\x15\
-\xdaH#+oC\x9e\x0e\x91\xe0\xb8]\xbe\xc6\xec\x89\
-\xa7\x9e\xc6\xd4i\xd3\xd1\xaeC;\x1d\x1f|\xc7\x9d\xf7\
-`\xe2\x97_a\xc5\xaa\xd5\xe8\xd8\xb1\xbd\xbeO\xf8\x89\
-\x7f=\x851o\xbf\xad\x8b\xc6w\xeb\xde\x15c\xdf\xff\
-\x00\xcf<\xfb\x9c<s\xf3\x91\xbfi\x93\xc6q\xc9\x92\
-\xa5\x182x\xb0>o\xdf\xce\x9e\x81\x7f<\xfeOL\
-\xfaj2\xd2\xd3\xd3\xf4M\x18+W\xaf\xc6'\x9f\x7f\
-\xa1\xe5\xc7\x03\x0f=\xacc{Y~P\x9c\xba\x0dC\
-\xc30\x8c]\xe1N\x02\xb1Y\xc0M!\x8a+\xf3G\
-#%)\x159#OG\xbb\x1f]\x89vg^\x81\
-\xf6\x9d{\xc2\x13\x1d\x0b\xbe\xb3391\xc9Y\xb3\x8c\
-\xb5\xd3N\x92\x90\x87(\x18\xfb\xf6\xeb\x8b\x01\x03\xfa;\
-\xef\x10\xf6\xc8Y\xa2\x0c[\xb7j\x89!G\x0e\xd6w\
-h\xf2\xdd\xa0\x9d:wBQQ\x89\xbeg\xf3\x17W\
-\xfe\x1f\x12\x12\x12\x90\x9e\x91\x81\xbe}\xfb\xa0\xb8\xa4\x04\
-G\x8f\x1e\x8d\x9f\x9c\x7f\x9e\x8e\x1f\x1cx\xc4\x11\xf8\xc5\
-/.G\xcf^=\xd0*\xa7%\x86\x0f\x1f\xaeb\x91\
-\xaf\x94\xea\xd3\xab\x17\xfa\xf4\xe9\x8d\xd6mZk\x98\x83\
-\x87\x0c\x12qW\x82>\xbd{\xe3\x8e\xdboA\xbb\xb6\
-mt&\xf0\xa0\xc1\x83\xd0\xa9cG\xbd\x8e\xcc\xcc,\
-\xf4\xef\xdf\x0f9M\x5c\xdf\xd00v\x07_i\x19\xf2\
-\x9e\xfb\x1f2JK\xf5\xcd\x17\x81P\xd0\xd9\xe4{0\
-\x18\xd0\x99\xf7\xfc\xcd\xae\xd6(\xd96\xb7i\x85\x96g\
-\x9c$g:\xdd\xc5;B\x85\xa0<e\xf3\xa4\xe1\xc4\
-W\xc8\x9dq\xfai\xfa\xaa\xb7\x1bo\xba\x19!y\x1e\
-F\x8d\x1a\x89\xa7\x9f\xfd\xb7\xbeV\xed\xc8!CD\xac\
-\xdd\x85I_~-\xcfG/\x15j\xcf<\xfb\xacZ\
-\xd2\xbb\x89\x88\xa4P\xe4\x84\xac/&N\x92g\xb2\x15\
-\x8e>z\xb4\xfa\xbf1/\x1f\xc7\x1ds\x0c\xfe\xf9\xc4\
-\xbf\xf0\x864\xe4N8\xee8\x1d\x9e\xf1\xef\x7f?\x8f\
-\xc1\x83\x8e@Aa1\xe6\xcd\x9b'\xcf\xed\xd1\xfa\xbe\
-`Z\x04\x8bKK\xd0\xa3[7\xbc\xf6\xda\xeb\xfa\xca\
-\xb4v\x1d\xdac\x814\xd2\xf8J9\x0e\xc3(\xd8R\
-\xa0\xe3~/8\xff'\xf8f\xcaT< \xa2s\x84\
-\x9c\xcbE\xa1\xff\xf1\xd8\xe3\xc8\xcei!e\x90\x07\xf7\
-\xdc{\x1f\xd6\xae]\x83\x01\xfd\x07\xe0\x9d\xb7\xc7\xeaD\
-2\xc6\xc5\xbdv\xc30\x8c]\xb1\xb5\x00\xb4\x85\xa0w\
-\x09\x85\x1d\x97]\x89f\xf2H\xe5\xc4\x9e\xd5\xb9\xf3\xe7\
-c\xe1\xc2\xf9(-+\xc3\xca\x15+\xe1\xab\xad\xd5w\
-\x8b\xee\xb4 \x96c\xb11\xd1h\xdf\xa1\x9dZ\xe7\xea\
-\xdd\xca\x07_<_/\xb8\x84\xf6m\xdbj\x85\xd5\xab\
-gO\xb5\xcaq?7\xbe\xe7\x94/Y\xe7\xbbE9\
-\xfbw\xd4\xc8\xe1\xe8!\x15VfF\x16\xb232\xd5\
-\x0d\xdf\xe99l\xe8Pt\xee\xd0\x11qq^\xb5j\
-\xb8]\xbb\xad[\xb6\x94\xcae8\x8e\x180@\xe2\x12\
-\xaba\xd3\xf2\xd1V\xc2s\x17\x8a\xa6\xd5\x81\xf1\xa1\x18\
-\x14\x0fu\x9fa4\x0b\x92\x9f\xfc\x22\xfc6>\xf54\
-b\xe5\xd9\xa9\x0e\xf8v\xba\xd5\x88\x00,\xea\xd5\x01\xed\
-\xce>K\xcf\xad\x7ff\x04\xb7K7r\x1f\x993w\
-.\xf2\xf26\xe1L\x11\x80\x1f}\xfc1f\xcc\x9c\x8d\
-\x7f>\xfe\x98Z\xd8RSS\xf0\xfakcp\xe2I\
-'\xe0\x9b\xa9\xd30T\x9e\x13N\xb6b\xa3k\xee\xbc\
-\xb9X\x97\xbb\x0e'\x9ft\x92\xfa\x9d\x91\x9e\x81\xa9\xd3\
-\xbf\xd5g\xe9\xd2K.\xc2\x92\xa5\xcb\x90\xbfi\xb3\x8a\
-\xbb\xdbn\xbf\x03W\x5cq9.\xfe\xe9\x85\xe2\xef \
-L\x13wl\xa4\x9dp\xdc\xb1\xbaT\xd3\x0d\x7f\xfe\x13\
-\xfaIC\x8f\x0d/v\xf9\xce\x9c\xfd=\xd6\xac^-\
-\x8d\xba\x22\x5cr\xd1\xc5\x1a\xce\xe8\x91#p\xae\x5c\xd7\
-\x8a\xe5+1u\xda4\x9cs\xce\xd9x\xfd\x8d7\xe4\
-\x99\x1e\x89\xdf\x5c}\x15\x86\x0e;\x12s\xe7\xcc\xd3p\
-G\x0c\x1f\x86\xcf>\x9f\x88\xdbo\xbb\x15g\xfd\xe8G\
-(-)\xc5[\x22\x02\xaf\xbe\xea\x97\xdb\x5c\xbfa\x18\
-\xc6\x8e\xb0\x85\xa0w\x0bI -`\x9d\xcdM.v\
-\xcf\xce\x9e=\x17_\x7f\xf5\x0df\xce\x9a\x8dog\xcc\
-\xd0.\xd6]\xceX\x14\xbf\xd8\xc5\xd4\xb8\xd0\xe6\xef\xc8\
-}\xee\xef]\xed\xe7L\xde\xc8\xdf\x91nT\xa9ng\
-\x7f\xfdq\xdd\xef|W\xb1\x17\xa6\xfe\xb8a4;u\
-\x88\x96\x86Gzf\x1b\xe4\xa4d\xa2Uj\x96l\xd9\
-\xe1-\xf2\xbb\xb3e\xc5%\x22;!\x95\xa7m\x03-\
-\xe7\xdb\xcb\xa5\xcc\xcb\x1ckGV\xafY\x83V99\
-\xdaX\x92\x5c\xad\xdd\xa9\xde\xb88\x9d\x14\x12\x13\x15-\
-\x0d\xa7\x0c\xb5\xca\xc7\xc6\xc6\xea\xf8[v\xed\xeaS\x11\
-~>\xe8\x0f\xc5\xa0\xda\x16%<.\xb8N\x92S\x92\
-\xd0\xb9KG9\x16\xd2sSSSEt\xe6\xe9l\
-~=O>8#\xf9\x91\xbf?\x86q\x1f~\xa8\x96\
-\xf8\x9cV9\xced\x149\x9f\x16z\xfa\xcb\xd9\xc0\x84\
-e\x87\xcf\xe7\xc7F\x11\xae\xd9\xd2\x10dc,\xde\x1b\
-\xaf\xdfY\xa6pL\xa2N\xd6JH\xd4\xf8\xb9\xaf`\
-3\x0c\xc3\xd8\x13l\x16\xf0\x1e\xc0J\x84\x7f\x13\x13\x93\
-\xd0\xb1cG\xf4\xee\xdbK\xbbkS2\xd2\xb4\xe0o\
-\x0a;\x12W[\xed\x0f\x7f\xdf\xc6\xedv\xcf\x0d\xef\xdb\
-\x81\xbf[\xedw\xbf7rk\x82\xcf\xd8?\xc8\x13$\
-B&\x98\x9e\x86@\xc0\x87\x18)\x7f<\x22\x8abu\
-\xabC\xac\x88\x22\xdd\xc4%?k)\xe4\xba\xf5v\x1a\
-3TU\x91\x84\x1b8\x8dqf\xc3G\xab\xc0\x1a>\
-l\x18V\xaf^\x83%K\x97\xa2\xba\xb6\x06\xd3\xa7O\
-\x13\x81\x08\xc4\xc7\xc7\x83\x8b9\xadX\xbe\x02%%\xc5\
-\xd8\xb01\x0f\xb9\xb9\xeb\xd1\xa6M\xdb\xad\x9e\x05~\xdf\
-\xea77\xf9\xcd\xa5\x9c\xbe\xf8\xfcK\xd4T\xd7`\xed\
-\xbauX\xbf~\x03\x06\x0d\x1a$qt&\x87\xf0\xfd\
-\xe1\xec~\xfe\xe2\x8b/0d\xe0@\x9c~\xfa\xa9h\
-\xdf\xa6\x9d\x1e\xa3'A\xb9\x94\xe2\x922\xed\xea&\x14\
-\xad\x9c\xdd\xdf\xb7w/\xcc\x9a\xfd=\x0a\x0b\x0b%N\
-\x1b\xb0`\xfe|ddf2\xd5\xe4r\xe5Dw\xd3\
-\xeep=\xd50\x0cc\xb7i0\xf9\x18\xbb\x05\xab\xa1\
-\x8a\xb2r\xd4J\x85\xd2\xb7{O\xe4\x17lFqa\
-\xf1VV\xb4\xed\x22'r\x8c\x93\xdbu\xa5\x84\xbf\xeb\
-\xbe\xc6\x15\x9ca\x1cn0\x8f'\xc4#z\xf8\x10\xf8\
-D\xc1P\xc3\x88Ts\x8e\x11\xf7\x19\x08?\x0f\xd5\x22\
-\x16\xbd}\xba8\xd6>\x9d\x9c\xb1\x0b\xc4\x1d\x9fC\x8a\
-%>S#\x86\x0e\xc5\xb0\x11\xc3p\xd3\xcd\x7f\xc5\xf5\
-7\xdc\x88\xaf'O\xc55\x7f\xfc\xa33\xe4!:\x1a\
-3f\xce\xc4mw\xde\x8d\xbf\xfc\xf5V\xc4'$\xe2\
-\x82\xf3\xcf\xd3\xe1\x12\xee\x90\x89\x06\x1c\xe1\xa5bP\x84\
-\xeau\xd7\xfe\x11s\xe6\xce\xc7\xf57\xfe\x05\xf7\xde\xf7\
-\x00\xfa\x88p\x1b,\x020;\xbb\x05z\xf6\xec\xaec\
-\xf7\xb8\x84\xccQG\x1f\x85\xb7\xdf}\x0f\xb7\xdfq\x17\
-f}?\x87\xb2M\xc7\xf3\xa5$'\xe1\xf9\x17^\xc0\
-+\xaf\xbd\xae\xbe3\xce\x9c\xb9\xff\xe3s\xce\xc6\x9a5\
-k\xc5\xdf\x9b\xf1\xd7\xdbnGfV\x16\xae\xb8\xe22\
-\x1d\x82B7\xaa\xf9\xe4\xba\x9c\xf8\x99\x024\x0cc\xcf\
-\x88z\xec\x85g\xeb:\xb5\xef\x80\xd3\x8f;\x01\xdeh\
-is\xb3Em\xec\x14]\xbaE*\x01\xbe\xadc\xc5\
-\x8a\x95\xba\x1e_L\x5c\x0c:w\xec\x84\x9f^p\xbe\
-v+m7\x1d\xa5\xd0f\xf7\xd0\xbc\x05\xf3\xf1\x9f\xff\
-\xbc\x84\x1b\xae\xbfNg\x15\xf2m\x08/\xbd\xfa\xaa\xce\
-\x04<\xe9\x84\x13\xb4r\xa0\xff\x86q\xb8\xc2\xc5\x95\xf3\
-?\x9e\x88\xd0\xf5\xb7\xa0uY\x85#\x8a\xe4\xd9P\x98\
-\xff\xe5{@\x9e\x01\xbf4\x96\xd6\xf4\xeb\x83\x0e\xffy\
-\x02I\xed\xda8\xcf\xc5\xae\x1e\x0d\xf1f\xd3\xe6M(\
-+/E\xf7n=\xd4\x1a\xc8\x85\x9cW\xadZ%\xfb\
-*\xd0\xadk\x17}\xf5\x22\xc7\xd5^|\xc9e\x18\xd0\
-\xbf?N>\xf1x\x04\xea\x82\xe8\xd6\xa5\x1b233\
-\xb4{\x95\xd1\x11\x09\x89\xa5\xcb\x97#99\x05m\xdb\
-\xb4\xc6\x96\x82\x02TVV\xa0S\x87N\xf0\x07\xfc\xba\
-\xd4\xcc\x86\x0d\x1bu\xec_\x8f\xee\xdd\x91\x92\x92\xac\xa2\
-s]n.\xd6\xae[\x8b\xbe\xbdziw\xf7\xd2e\
-\xcb5j\x19\x19i:\xf3\xbe\x87\x84STZ\x8c\x15\
-\xcbV\xc8\xbeLd\xe7da\xcd\xdau:\xdb\x9f\xcf\
-?'\x95\xac^\xb5Fg*w\xe9\xd2\x05\x19\xe9i\
-\xfa& \xae/\xd8\xbdk7$\x8a\x80^\xbfq#\
-\xf2\xf27a\xe8\x90\xc1\xea\xb7a\x18FS\x98\xbbx\
-!>\xfe\xf2s\x11\x80\xcf?[\xd7Y\x04\xe0i\xc7\
-\x9b\x00l*\xae\x00|\xe1\xd5\x97\x11\xa8\xaa\xc5\xa8\xd1\
-\xa3\xf0\xe9\xa4/\x90\xe2M\xc4\xaf~\xf9\x0b]\x14z\
-\x87\xe9\xc8\xb1<R\xa9\xfc\xfa7\xbfG\xeb\xb6\xadq\
-\xf3\x8d7`\xec{\xef\xe3\xf51c\xf0\xd4\xbf\xfe\xa9\
-3\x80\xb7\xb5<\x18\xc6a\x04\x95\x95\xfc\xaf\xae\xac\xc2\
-\xea{\x1eF\xdbW\xdfD\xb2<R\x1c\x8f\xa2\x16>\
-9\xae\xe3\x92\xc5\xcd\xe6\x04/\xfc\xf7\xdf\x81\xd6\xe7\xff\
-\xc8\xb1~q\xa2ZS\xe03\x18\xf1\x08R\x949\xb6\
-F\x1er\xde\xd4A\xff.\xbb\xe2J\x8c\x1c1B'\
-\x5c\xe8\xe1\xf0y\x91]\xbe\x8d\xfdrq-\xf6tK\
-'\xcew6\xde\x9cc\x1a\x1e\xcf\xa3\xbbz\x0f\xdc\x00\
-\x22\xdc\x10u\xe7|\xaa\xbf\xfa\xd59\xc6\xf8\xd6\xc7\x87\
-\xc7\x9a\x107\xc30\x8c\x1d\xe1\x0a@S\x1a{A\xb4\
-\x14\xc4\x99Y\x99H\x97V}\x8b\xcc\xac\xa6\x097\x15\
-\x86u\xb8\xe6\x9a\xdfa\xee\xdcyx\xff\x83\x0f\xf1\xc2\
-\x0b\xcf\xe3\x17W^\xa1\xd6\xc0\xad*\x1e\xc38\x1ca\
-\x1e\x97->)\x01\xad\xaf\xb8\x04\xc5C\xfa\xa3\xc6_\
-\x1b^\x0b\x90\x02*J_\x8bV\x82 |W\xfc\x1c\
-\xd9'\x1e\x13\x16\x7f{^\x5cE>W\xfc\xae\xfe\xc9\
-\xe7U\xbf\xfa%N<\xe1x\xf1\xdb9\xaeK2E\
-\xb8\xdd\x19t\xe7v\xc3\xea?~\x0f\x9f\xba\x95\x1f;\
-\xf8\xbe\xa3p\xd4\xdf\x1d\xba\xdb\xfe9\x86a\x18\xbb\x8b\
-\x0e(\xb1Y\xc0{\x06\x1b\xdf\xec\x06\xca\xcb\xcb\x87/\
-\x18\xa8\x9f\xdd\xb7K\xa4@\xe7\xfa|\x03\xfb\xf7\xc3C\
-\x0f=\x82\xfe\x83\x8f\xc0\xa9\xa7\x9c\xe2\x14\xed;\xa8\x14\
-\x0c\xe3\xb0B\xb29\xade\xe9=\xbb\x22\xe3owc\
-\xe5\xe8\x91X\x17]\x87\x8a:\x1fJ\x83>\xac\x8d\x8f\
-F\xd1/\xaeD\xf6\xef\xafD\x5cfz\xbd\xd0j2\
-\xdbs\xca}\xe1\xfd\xae\xa8:z\xd4(\xf4\xe8\xd9C\
-\xbf\xefH\x90\xed2\xd8\x08\x7f\xb7\x22r_\xa4\x9b\xa6\
-\xec'\x91\xc7\x5cv\xf5\xdb0\x0c\xa3\x89\xd8,\xe0=\
-\xa5\x8e]\xb9\xceL\xbfZ\xbf\x0f1\xa1(\xb5\x086\
-\xc5FAk\x817&\x16\xdd\xbauCYY):\
-\xb6i\xab\xcbH\x18\xc6\x0f\x0a\x11/\xb4\xb8\xa5\xf5\xea\
-\x81\x1e\xaf>\x0b\xef\x9b\xaf\xa2\xe0\xc9\x7fa\xd9\xcd7\
-!\xe1\xdd1\xe8t\xc7\xf5HH\xdf\x03\xf1\xb7;\xd0\
-\xe2\x17\xfej\x18\x86\xf1C\xa2)z\xc5\xd8\x1e\x22\xf6\
-\xa2\x82!\xbe\xb9\xca\x11\xd0R\x91\xb8cwv\x8a8\
-\xe1\x18\xc2\xc2\xa2\x22\xbc\xf3\xeeX\x5ct\xf1Ex\xfd\
-\xf51\xfa*\xa9}V\xc9\x19\xc6\xc1\x0a\xadn\xb2\xc5\
-'%\xa1\xcd\x88A\xc8<y8bN\x19\x86\x96G\
-\xf4u\xd6\xb9c\xd7\xec\x8e,s\x86a\x18\xc6\x1ec\
-]\xc0{Ct\x94v\x01\xcf\x99?\x0f!\x7f@\xea\
-\xa9]\xebi.\x1aK\x99\xf8\xce\xd8\xf7\xd0\xb2e+\
-\x5c\x7f\xdd\xb58\xfe\xf8\x13\xf0\xea\xab\xaf!\x10\x0c\xe8\
-$\x11\xc3\xf8A\xc1\xf2G\xd7x\x91\xec/\x8d\xaa\x90\
-<#!\xb6\xac\xacyj\x18\x86\xb1\xcf\xb0.\xe0=\
-\xa6\x0eQ\x01.R\xebC\xcf\x1e\xdd\x11\x88\x96\xdf\xb4\
-V\x90\x9d\x09j9\xc6\xf7\x94\x8e{\xef=\xfc\xea\x97\
-\xff\x87\xe4\xe4d\xfc\xf1\x9a\xdf\xa1\xb4\xbc\x5cE!\x97\
-\xbd\xd0\x99~\x86\xf1C\x82\xadP\xd98\xe3\xb5\x1eg\
-=e\xc30\x0cc\x1f`m\xec\xbd!\xda\x83\xb8\x98\
-8\xc4%\xc4\xa1\x8e\xcb\xfa7\x01\x0e4\xcf\xca\xc8\xc0\
-\xbd\xf7\xde\x83AG\x1c\xa1\xb3\x11[\xb5h\x85{\xef\
-\xbeS~\x0f\xd4\xdf\xd6\xe5e\x18\x86a\x18\xc6\xbe\xc4\
-\xba\x80\xf7\x98(M\xb7\xb2\x8a\x0a\xe4\xae]/B\xd0\
-\xdb0\x06p\xa7Z0\x0a\xed\xda\xb5\xc3\xe0\xc1\x83u\
-\x8c\x13\x05!W\xf8\xef\xdc\xa9\x13\xbaw\xebf\xef\xf7\
-4~\xd0l5%\xc3\x9a\xa7\x86a\x18\xfb\x0c\xeb\x02\
-\xdeSD\xec\xb1\xaaj\x95\xd5\x029\x19\xd9\xf0\xd7\x05\
-\x9c\xfdd\x17\x82\x9aV>\xbe\x82*\x12\xeeS\xeb\x9f\
-a\xfc\x80q\xe6\xd6\x87\xb1r\xc90\x0cc\x9fa\x8a\
-cO\x89\x8aBT\xa8\x0eq\x09^\x0c8\xa2\xaf\xbe\
-\xfd\xa3~\xa1Z\xab\xb8\x0cc\xef\xb1\x9e\x09\xc30\x8c\
-}\x86u\x01\xef\x05\xa5\xc5\xa5\x98\xf0\xd9\xe7x\xf1\x95\
-\xd7\xf0\xf1G\x9f\xc2\xef\xf3\xe9,_\xc30\xf6\x1c\x16\
-GV$\x19\x86a\xec[\xac\x0bx\x8fp\xaa\xa7#\
-\x8f\x1c\x8c\xbe}z\xc3\x9b\x9c\x88\xe3O<\x1e\xdd\xba\
-uE0 \x02\xd0j/\xc3\xd8#\xb8\x94:\x97\x81\
-\xd1\x22\xc9\xdaR\x86a\x18\xfb\x0c\xeb\x02\xde\x038q\
-\x83\x8b9\xf7\xee\xd5\x13}z\xf5Fbb<\x8e?\
-\xee(\x1c5j\x04bbc\xe8 \xec\xd20\x8c\xdd\
-\x81\xcb\xc0x\xa2\xb4c\xc2\x1aR\x86a\x18\xfb\x10\xeb\
-\x02\xde\x03XIq\xb0zLl,\x92\x92\x93\x90\x96\
-\x9c\x8c\x9c\x16\xd9\xf0\xe8:\x80fN5\x8c=\x85\xb3\
-\x80\xf9\x04\xe9Sd\x8f\x92a\x18\xc6>\xc3\xba\x80\xf7\
-\x00VR\xfc\x17\x0a\x06\xa5\x92\x0a\xe9\xf2/\x01\x7f\xb0\
-a\x19\x18\xc30\xf6\x10>Ya\xe3\x9f\xf5O\x18\x86\
-a\xec3\xac\x88\xdd\x1b\x22,\xa7\xda\xeb\xeb\xfc\xd1\xdf\
-\x86a\xec>\xb4\xac\xb3\x19\xa5M)kO\x19\x86a\
-\xec3\xac\x0bx\x8f\x89\xd2\xb1\x80\xa1:\xa7\xcaR\xe3\
-\x9f\xf3G\x8f\x1a\x86\xb1'D<?\xf6(\x19\x86a\
-\xec3\xac\x0bx\x8f\x11\xd1\x17\xaaS\x11\xa8\xff<4\
-\x00\x9a\x926\x8c\xbd\x81\xb3\x80\x0d\xc30\x8c}\x8f\x95\
-\xb6{\x01E\x1f-\xa8y\x1b\xf2\xf0\xe1\x87\x130v\
-\xdc\x07xg\xec{x\xeb\x9dw\xf1\xee\xd8q\xba\x8d\
-\x9f0\x01\xd5\xd5\xd56>\xd00\x9a\xc0Vo\x02\xb1\
-\xf6\x94a\x18\xc6>\xc3\xba\x80\xf7\x06\xb5\xfe\xc9Gt\
-\x0c\x12\x93\x93\x11\x97\x90([<\xbc\xf1^l,\xdc\
-\x82\xd2\xaa\x0a\xf9\x1e\x0f\x84\xdf\xf9k\x18\xc6\xce\xa1\x05\
-P\x9f)\xe7\x87a\x18\x86\xb1\x8f\xb0.\xe0\xbd \x14\
-\xe4\x0c`\xa0m\xbbV8\xed\xe4\x93p\xf6\x19\xa7\xe3\
-\xcc\xd3N\xc7\x19\xb2\x8d\x18v$\x8e>j\x14N:\
-\xee8$x\xbd\xe13\x0c\xc3\xd8\x19\xce\x12K\xe1\xe1\
-\x7fV.\x19\x86a\xec3\x1c\x0b`\xf8\x87\xb1{\xe8\
-\x82\xd0\xa2\x00\x83\x81\x00j}\xb5\xf0\xf9k\xe5wH\
-\x12\xb4\x0e\xb5~\x9f\xb3L\x0c\xb1\xee_\xc3h\x126\
-\x06\xd00\x0cc\xff`\xa5\xed^\xc0I \x9e\xf0$\
-\x10\xc2\xbf\xfa[\xbeP\x1c\xea\x1b\x0d\x9c\x1fz\xdc0\
-\x8c\xdd\xc0\x1e\x1b\xc30\x8c}\x86u\x01\xef\x0dRA\
-\xd5']\xf8KdR:\x9dY\x86a4\x95\xad&\
-\x81\xd8\xbb\x80\x0d\xc30\xf6\x196\x09d/p\xbb\x80\
-\xf9O\x0d}LN&\xa6\xe8\xbe\xea\xf2*TWU\
-\x85]\x1a\x86\xd1\x14\x5ck\xbab\xe5\x92a\x18\xc6>\
-\xc3\xba\x80\xf7\x82\xc8.`g\x98\x9f\xfc\xa9\x0b\xa1\xb2\
-\xba\x0a\x1f}\xfa)>\xfe\xec3\xf8|>\x15\x89\x86\
-a\xec&\xf6\xd8\x18\x86a\xec3\xac\x0bxop\x8c\
-}\xf5h\x97\xafH\xea\x193g\xa1K\xfb\x0e\xf0\xc6\
-\xc5\xe1\xbd\xf7\xdfW\x81h\x95\x99a\xec\x1a\xb5\xa6;\
-_\xf4\x0d;\xa1Ph\x9b\x0d\xd2\xf02\x0c\xc30\xf6\
-\x0e\xeb\x02\xde\x0b<\xd1\x1e}\x15\x9c\xdb\x05LE\x18\
-\x94\xca\xc9\xe7+G\x5c\x8a\x171\xb1\xd1\xa8\xf1\xfb$\
-}\xc5\x85\xa5\xb1a\xec\x126\x96\x82\xfe \xd6\xae[\
-\x8b\x15\xabVa\xc5\xea\x95\xba\xad\x5c\xbdJ\xb6\xd5X\
-\xb6r\x056\x17\x16\x84]\x1b\x86a\x18{\x8au\x01\
-\xef\x05\xa1`\x9d*\xe8\xfa.`U\x81u\x88\x89\xf1\
-b\xec[\xef\xe1\xcbO'\x22>9\x91Gu3\x0c\
-cg\xd4I\x03*\x84\xd5\xeb\xd6\xe0\xf9\xff\xbd\x88'\
-\x9ez\x1aO>\xfd\x8cn\xff\xfc\xd7Sx\xe2\xc9\xa7\
-\xf0\xc8\xa3\x8fa\xca\xd4i\xce\xd8[Z\x03\x0d\xc30\
-\x8c=\xc2\xba\x80\xf7\x0a&\x9e\xf3\xcd#R\x9aj:\
-J*\xa6`\x9d\x07\x9b\xf2\xb7\xa0`K\x11\xe0\x0b\x84\
-\xc7\x07\x9a\x09\xd00v\x06\xbbw\x03\x01\x1f|\xfe\x00\
-~\xff\xeb_\xe3\xc1\x07\xee\xc3\x03\xf7\xffM\xb7\xbb\xef\
-\xb9\x1b\xa7\x9cy*\xee\xbd\xfb.\xfc\xe8Gg\xea\x04\
-\xac(>t\x86a\x18\xc6\x1ea]\xc0{\x01\xbb\x80\
-\x83u\x1c\xa9T\xa7\xc3\x92B\x5c\x04:\xbc_'~\
-\xc8\xc6=N\xf7\xb0\xa9l\xc3\xd8\x11\x5c@\xdd\x1f\xf4\
-\xa3\xb6\xb6V\xca#\x0e\xa5\x08\x22V\x9e\x9bDo\xac\
-n\x09\xb1\xb1:\xe9*.6\x061\xfa\x12n\xc30\
-\x0cco\xb0\x92t/\xa8\x0b\x86\x10-\x0a\x9a\xff\x22\
-I\x8c\x8fG\xb4Tb\xb1q\xb1\x88\x8d\x8fEH\x07\
-\xad\x9b\xca6\x8c\x1dB\xcby(\x80\x1a\x7f\xad\x8a\xbf\
-\x1a_\x95\xbea\x87\xfb\xad\xe9d\x18\x86\xd1\xfcX\x17\
-\xf0^!\xd2\xcf1\xef9V\xbe(\x0f\x02\xa1\x10\xbe\
-\x99>\x1de\xa5e\xc8\xcf\xcb\xc7\xac\xeff:3\x17\
-\x9d~`\xc30v\x00\x1bJ\xee\xb3B\x0bz\xa8Q\
-\xa3)\xfc\xa8YS\xca0\x0c\xa3\x19\xb0.\xe0\xbd\xc0\
-\x15\x7fD\xf5\x9d\xfc,+/GIq)\xce9\xff\
-\x5c\x9ct\xc6\xa9\xa8,/E\x8d\xcf\xe782\x0cc\
-\xfbx\x1a\x1aS\x0e\xb4\xab74\x9a8\xb6V\x9e2\
-\xfdnM)\xc30\x8c\xbd\xc7\xba\x80\xf7\x02\xb5VD\
-\xc0\xea\x8b\xd5VRZ\x0aRs2\x91\x9e\x93\x8d\xf8\
-\x84T\xe7\xa0a\x18;&\xd2B\x1e\xfe\xae\x92O\xbe\
-\xb3\x87\xa2\xa0\xa4\x08\x9fN\xf8\x14\xeb\xd7\xafs\x1e4\
-\xc30\x0cc\xaf\xb0.\xe0\xbd\x80\x93=\x5c\x5c\xe3\x85\
-\x8eX\x92\xef\xfaS\xbeF\xd6k\x86a\xec\x00y\x80\
-\xea\xdf\x98\x13\xfe\xae\xcf\x90|\xf7\x05\xfc\x985\xef{\
-\x04\x82u\x986\xfb{l)\xd8\xa2\xce\x0c\xc30\x8c\
-=\xc7\xba\x80\xf7\x02Z\x00\xdd\x99\xbf\xe1\x0fIPI\
-R\x0ecr~\x1a\x86\xd1\x14\xd8n\x8a\xe8\x02\xf6x\
-\xdc\x0e\xe0:T\xd7V\xc1\x17\x0c\xe1\x98\xa3G\xa1\xac\
-\xac\x0ck\xd6\xadS\x81X/\x18\x0d\xc30\x8c\xdd\xc6\
-\xba\x80\xf7\x9a\xed\xa8g\xa9\xc8\xb4wxW\x15\x94V\
-b\xe1\xef\x91p\xdfv\xf7\xcbN\xab\xf4\x8c\xc3\x91\x88\
-|\xddX\xdcE{<\x08\x06\x03\x987g\x86<\x16\
-5\x88\x8e\xb5b\xcb0\x0cco\xb1.\xe0\xbd\xc0#\
-\x15\x93'\xc2j\xe1\x8aA\xbe\xfa\x8dk\xd4\x06\xea\x82\
-\xdb\x8c\x13T\xa4r\xe3~'\xd9\xe5{\x90&\xc3\x88\
-\x0aP\xdf\x82\xba\xf5Mq\xfd\xe1\x1aizn\x84{\
-\xc38\xf4i\xe8\x02v-\x81\xfc\xc9-\xde[\x87\xdc\
-5k\xf0\x9f\x17^\xc3\xd2\xa5ke\xdfv\x1a]\x86\
-a\x18\xc6na]\xc0{\x81\x0a7\x17\xa6#E\x9b\
-V^\xac\xcc\xe43T\x87`\xc0\x1f\x96\x85\x0dT\xd7\
-\xd6\xe2\x93O?\xc3\xcb/\xbf\x8a\xff\xfe\xefEL\xfa\
-\xeak\xd4\xfa\xfdZ\x01\x06\x02\x01L\x9b\xfe-\xbe\x9a\
-<\x19\xbeZ\x9f\xf3\xba+\xd9\xbfx\xc9\x12\xbc\xf4\xca\
-\xabx\xf1\xc5\x97\xf0\xde\xb8\xf7QXT\xa4\xee\x0d\xe3\
-\xf0\x80\xef\xd3v\x9e\x94\x06!\xe8\x88\xc1@(\x16\xd1\
-Q\x01\xc4\xc5\xc5s\xb20\xea\x82A\xbaR7\x86a\
-\x18\xc6\x9ea}){ATt\x94h<\xca\xbep\
-\x85\xc5M+-v[\xb1\xa6\x92J\xcd\xa3FV\xb5\
-\xdc\x11Vn\xc5%\xc5\xb8\xfd\xf6;0\xfe\xe3O\xb0\
-`\xe1\x22<\xfc\xf7G\xf1\xea\xab\xaf\xaae\xaf\xb4\xb4\
-\x14\xb7\xdez\xbblw\xa0\xa0\xa8P\xdd3\x8c1o\
-\xbe\x897\xdex\x0b\x8b\x16/\xc6\x07\x1f\x8e\xc7\x9dw\
-\xdd\x85\xc2B9\x1e\xb6\x0c\x1a\xc6\xa1\x8cZ\xb6\x83\xfa\
-\xa4\xa8\xe8\xab\x17\x83n\xfe\x0e9\xbf\x89k;7\x0c\
-\xc30\xf6\x1c\xeb\x02\xde\x03\x1c\xc9'\xffB\xe1\xca\xca\
-1\xff\x09\xac\xa4\xea\x10S\x17\x8d \xad\x14\xd1j`\
-U\x9cu\xcc\x1cxNMu\x15\xae\xb8\xecR<p\
-\xef\xdd\xf8\xcbM7\xe0\xc5\x17_\xc6\xea5k0\xe9\
-\xeb\xc9(\xaf\xa8Tw\xb4\x12\xaa\xd7u!TVV\
-\xe1\xc2\x9f^\x80{\xee\xba\x13\x0f\xdcw\x0f\xa6M\x9f\
-\xa1\x96B\x0d\xdb0\x0eq\xa2\xa4\x10r4\x9f\xfc\x91\
-\xff\x5c\x14\x9a?\xa3\xd8\x90\x92\xef\xa5EU\x08\xf9k\
-Q]\x5c\x84\xda\xeaZ\xc7\x9da\x18\x86\xb1\xc7X\x17\
-\xf0\x1e\xe0H>\xf9'5\x16-t\xfc\xc7ttD\
- \xe0\xf7\x84\xad\x16\xfe \x02\x22\x04ifu-\x80\
-J\xbd\x16t,\x84\xabV\xafFzf&\x92\x92\x92\
-0n\xdc\x078\xe3\xcc\xd3q\xca\xa9'c\xc6\xcc\x99\
-\xea?\xdds\xacauu5**+\xb1b\xe5J\
-\xa4\xa6$\xa3M\x9b\xd6f\x0d1\x0e\x0f\xa4\x10R\xb1\
-\xa7\xdf%\xbf\xd7\xcf\x02\x8e\xc2\xb2U\xab\xb0~S>\
-\x86\x8c\x1a\x81\xb2j?6l\xc8s\x1cE4\xaa\x0c\
-\xc30\x8c\xdd\xc3\xba\x80\xf7\x06\xa9\xaf<R\x07\xd5[\
-P\xdd/\xa1\x90Z3b\xbc1\x88\x8d\x8d\x15\x91\xe6\
-\x8c\xe3s\xe1\xb7\x1a\x9f\x1f\xaf\xbe\xfe&n\xbd\xed\x0e\
-\x11}\xef\xe3\x97\xbf\xf8?\xc4\xc6\xc4`\xfd\xfa\xf5\x18\
-5r\x04\x86\x0d=\x12\x8b\x17-AQQ1<\xd1\
-\xd1\x88\x96\xed\xa3\x09\x9f\xe0\xf6;\xee\xc6M7\xdd\x8c\
-_\xff\xfaj\xf4\xeb\xd7WE\xa8a\x1c\xfa8\x16\xbf\
-H\xf8\x9b[uu\x0d\xdav\xea\x80aG\x8fB\xff\
-\xa1\x83\x11\x13\x13\xed\x1c\xb1\xbco\x18\x86\xb1\xc7X\x17\
-\xf0^\xc0.\xe0:Z-X\x11I\x1a\xd6k<\x8f\
-G\x85Y@\x8e;\xd0^\xd8\x00\xbb\x83\x99\xf0\x1d\xdb\
-\xb7\xc3\x89'\x1c\x8f\xe7\xff\xfd,N?\xed4L\x99\
-6\x1d\x9b6\xe5\xe1\xc1\x07\x1f\xc1\x83\x0f=\x82\xb5k\
-V\xe3\xc3\x8f&\xc8\x19u\xf0\x07\x028\xf3\xcc\xd3p\
-\xeb-7a\xf8\x88\x11\xf8\xfe\xfb9j\xbe\xb5*\xd0\
-8,\xd0\xe7\xc7y^\xd4\xba^G\xeb\xba\xfet\x1e\
-,\x1dn\xe1Q\xcb \xad\xe6;C\xad\xf2\xe1\xad\xc1\
-\x930\xdb\xdd\xd7\xf8\x9c\xf0~\xc30\x8c\xc3\x18\xeb\x02\
-\xde\x0b\xd4\xfa\xa6\xf5\x85\xfc\x11\x15\xedT \xb2/\xe4\
-t\xccF\x07\xeb\xfe\x9f\xbd\xb3\x00\x8c\xe2\xf8\xfe\xf87\
-\xb9\xb8\x1b\x11H\x02\x01Bpw)PW\xea\xee\xee\
-\xf6\xeb\xaf\xff\xba\x97\xba;-\xb4\xd4[\xa0-U\xb4\
-\xb8\xbb\xbb\xc7\xdd\xedr\x97\xfb\xbf\xf7f\xf7r\x09\x01\
-B\x12h\x7fd>\xc9\xde\xce\x8e\xed\xec\xec\xbc\x9d7\
-\xb2\xb3j. \xfbp\xe9\xad\xe0\x0a\xcc\xcb\xdb\x1b#\
-G\x9e\x84\xd3N=\x05\xa1!!\xa8(/\xc7\x8c\xe9\
-\xd3\xf1\xe0\x83\x0f\x92B\xf81m\x9f\xe0\xba\x1b\xae\xc7\
-t\xb2+((\x92p\xde\x14&&:\x06\xd7]{\
-5\xfe\x9e=\x0b{\xf6\xed\x93\x17G\x1a\x02O\xa6\x97\
-\xcaM\xa3\xf9WB\xf2a\xc8\x08/\xae\xce\x9b!^\
-p\xe3/\xeex\xb0\x9b\x08\x9b,\xbft(\x5c\x159\
-\xd7\xcdp\xac}l\xe0\xea\xaf>w\x8dF\xa39\x11\
-\xd1C\xc0M\xa1F\xa7#\xdc\xe0\xee\xa6z\xfeL{\
-\x87\x97\x05\x1e\x16\x0b)_\xdc\xa3QS\xa9\xf0[\xbd\
-\xac\xb8Y\xadV1s\x85\xb3i\xf3f,Y\xba\x0c\
-}z\xf7F\xbb\xf8\xb6Hh\xdb\x0e\xe7\x9cu\x16\xd6\
-\xae]\x8f\xf5\x1b\xd6\xa3\xb2\xa2\x12v\x9bM\xc2\xb5\x8a\
-\x88@\xa5\xd5\x86\x8d\x1b7\x19J\xe8\x91+,\xf6\xa1\
-\xab5\xcd\xbf\x16.\xc6F\x8f\xb9s.\xa0\xa0\xec,\
-\xdc\x8e28\xe4\x9b\xef$\x07Vk\x15\xb6\xed\xdc!\
-K+\xcd\x9b7\x1f\x1b\xb7l!Y\xa9\x14\x19\xe3\xfd\
-\xea\xf5\xeb\xb0{\xef>\xf1\xcb\x9b\x9d\xe2:\x90\x9a\x82\
-\x05\x0b\x17a\xce\xdcyX\xbeb\x05\xb2ss\x9c\xee\
-\x1a\x8dFs\xa2\xa2\x87\x80\x9b\x80TX\xa2\xef\xd1\x1f\
-\xd7YR\x89U\xc3\xdd\xa6\xd6\x01tT\xd9PE\x9b\
-\xd1\xb1!\xb0\xb1Uh(>\xfe\xe4c\x0c\x1a4@\
-\xe6\xf6\xf1\x16\x1b\x1b\x8b\x8f>\xfe\x00]\xbbv\x91\x1e\
-\x0e\xdez\xf5\xe8\x81\xcf'\x8cC\xe7\xa4$\xdc{\xd7\
-]8\xf3\x8c3$\x82\xa8\xa8(|\xf6\xd9'\xe8\xd3\
-\xa77\x1d\x93\x85\xeb\x09\x0e\xc1\xc1\x8bVk4\xff\x22\
-\xea\x16M\xe3\x98e\x8b\x97T\xaa\xa6\xa6\xaa\xf4\xcc\xd1\
-v(\x05\x90\x1bG\xe9\x19\xe9x\xfc\xb1\xc71\xe5\xa7\
-\x9f0s\xd6l\xdcu\xe7\xbdx\xe5\xf57\xa5\xa1\x95\
-\x96\x96\x8e\x87\xff\xfb0\x9ex\xe2)\x14\x97\x94\x88]\
-EE9>\xf8\xe0\x03|\xf9\xd5\xd7\xd8\xbcy\x0b\x9e\
-\x7f\xfeE<\xf8\xd0\x7f\xa5\xc1\xc5\xee\x1a\x8dFs\xa2\
-\xa2\x87\x80\x9b\x00\xf7\xbe\xc9\x90\x11\xffq]\xc1\xfa \
-\xe7%i\xd4\xeen\xd5\xb0xz\xc2\xcb\xcb\x8b\xdc\x5c\
-*,\xf2\xe0\xe9\xed\x8d\x11\xc3\x86\xa1Ux\x84\xc4\xc1\
-[l\x9b6\x182p\x10|}|\x8cH@a=\
-1l\xe80DGG#)\xa9\x13\xda\xc4\xc4\x88\x22\
-\xe7\xe1\xe1\x81\x81\xfd\xfb\xa3CB\x82\x84\xd5h\xfe\xe7\
-\xe19~F\xcf\x9f\xd9\x13h\xec`\xb3W\xa3\xb4\xa8\
-D^\x86b\xd98\xdc\x1c@V\x18\xe1f\xc1u\xd7\
-^\x83\x97_z\x11w\xdcq+\xbe\xff\xf6;\xd8\xaa\
-\xacX\xbcd)z\xf6\xea#}\x8a\x8b\x16-qN\
-\x9fpw\xb7\xe0\xaa+\xaf\xc0}\xf7\xdc\x85O\xc6}\
-\x84\xfd\xfbS\x90_T(=\xfa\xe2Y\xa3\xd1hN\
-@\xf4\x10pS\xa8\xab{\xc9<\xc0\xda\x0a\xb5\xc3a\
-\xa7\xed\x10J\xda\x91\x947Ww6jeOs\xa2\
-\xc2e\xbb>e\x8b\xac\xd9\xc9\xe2I\xca\x1f\xbb\xb3V\
-x\x84\x9e9G\xad/\xf4\x88\xe0\xa0\xb8\xb4\x14\xcbW\
-\xae\x94^\xf4\xc0\x00?,[\xbe\xcc\x98\x9f\xabz\x0e\
-\xab\xaa\xaa\xc4o~^>||\xbc\xe1M\x0d\xb7#\
-\x9dG\xa3\xd1h\xfe\x97\xd1C\xc0M\xa0\xeeB\xd0\x9c\
-\x8d\xdciPUnEQ~1\xca\x8bJ\x0e\xa9\xfc\
-\xd5\xd7sw8\xbb\xbanr\x5c\x8f\x7f\x8d\xe6\x7f\x12\
-*\xca\xdc\x93.F\xd7rMV\xdc\x13\xe7\xeb\xe1\xa3\
-\x8e-\x87\xe9\x01\xa4p\xfc\xc1\x90*R\xec\xdey\xf7\
-\x03\x5c}\xed\xf5\xf8\xe1\x87Ix\xf9\xe5\x17\xb1g\xf7\
-\x1el\xda\xb4\x19^\x9e\x1e\x185z4\x16,Y\x8a\
-\x94\x94T\x09\xc6C\xbd/\xbe\xf4\x0a\xce9\xef|\xdc\
-u\xf7}\xb8\xe1\x86\xeb\x10\x1c\x1c,i\x92M\xa3\xd1\
-hN@\xf4\x10p\x13\xe0\x8a\xca\x1c\x02\xe6|\xe4l\
-\xe4N\x03~\x07\x98{\x17\xaalU\xca\x8d\xed\xb5\xb2\
-\xa6\xd1\x1c\x1a\xa31\xc5\xc8\x5c?\x82\x0fY~X\xa1\
-\xcb\xca\xce\x86\xc5P\xfc\xcc\xa1\xdb\x83\xa0p\x1c\x03O\
-\x93\x88\x8c\x8c\xc4\xb0a\xc3\xf0\xfak\xaf`\xcc\xb9\xe7\
-b\xe5\xea\xd5(,(\xc4\xb4\x993\xb0|\xf9\x0aT\
-UV!\x87_\xf6 \xf8\xbc\xb7\xdcr#\x9e\x7f\xe6\
-it\xec\xd0\x1e\xdb\xb6n\x93\xef|\xeb9\x80\x1a\x8d\
-\xe6DF\x0f\x017\x05\xaamj-\x04Mp\xa5U\
-RX\x8c\x82\x9c<\x14\xe6\x17\xa0\xb8\xb8\x18n\xe4\xc9\
-\xf5-`\x8dFS\x0fuD\x84\x959\xee]\xf7\xb4\
-X\x10\x1e\x1d!_\xd5i\x08\xbcP\xf4\xe5\x97]\x82\
-;o\xbb\x05I\x89\x1d\xc5\x8e{\xff.\xbe\xe8B\xdc\
-s\xe7\x9dx\xe0\xfe{\xd1\xa7O/\xcc_\xb0H)\
-\x9b$\xb4\xad\xa3b\xd0\xaf__\x5c|\xe9E\xf2\x89\
-E\xb5\x0c\x8dh\xa0\x1a\x8dFsB\xa2\x87\x80\x1b\x81\
-\xea\xf3\xa3?\xbb\x83\xbf\xf1!\x15\x88\xd4\x15\xd5\xd5\x08\
-\x0a\x0c\xc4\x90!\x03QVT,\xbd\x1a\x83\x87\x0f\x86\
-\x9f\x8f?{b\x9f\x1a\x8d\xa6^\xdcD\xa6\xc4D\xc2\
-\xc4\xefM\xa9\xfe<~\x09\xc4\x86\xd2B~\x09\x84\xda\
-\xab\xdcSx\x98\x97@X\xa1\xab&E\xd1Na\xd8\
-\x1fo\xb9yy\xd8\xb2i\x0b\xce>\xebL\xb4i\xdd\
-\x1a\x09\xed\xda\xe1\xf4SN\xc6\x9f\x7f\xfd\x85*\xab\x95\
-\x9e\x7f\xd5r\x0e^hz@\xdf~\x14\x89\x0d\xdbw\
-\xeeT\xf1\x19i\xd2h4\x9a\x13\x0d=\x04\xdc\x08\xd4\
-\xac?7\x19j\xe27\x17\xb9\x8a0_\xf4uw\xb3\
-`\xccYg\x91\xe27\x04\xc3O\x1a\x8ek.\xb9\x5c\
-\xfcq>k4\x9aC\xc0\x22\xc2\xad(\x82\x958\x9e\
-K\xab$K\xc9\x94\xaf\xaf\xaf\xac\x83I\x072\x04\x5c\
-\x9fZ\xc6\xca^Xh(n\xbe\xe9F$vT=\
-\x7fLYY)\x1ex\xe0>\xf4\xea\xd5C>\xb7\xc8\
-\xf28|\xf80\xdcr\xd3\x0d2\xcc{\xe1\x05\xe7\xa3\
-[\xb7.\x22\xa3Q\xd1Q\xb8\xff\xfe\xfbE\x89\xd4\xba\
-\x9fF\xa39\x919tSZsD\x1cn\x0e\xa9@\
-j\xf5\x12P%\xe6\xe5\xe5\x8d\xfe\xfd\xfbc\xd8\xe0\xc1\
-\xf2-`\xb3b\xd3h4\x87\x80\x87b\x0d1r.\
-\x07cl\xb6j;\x8a\x0b\x0a`!\xe5\xedp\xb0\x9c\
-\x05\x07\x06a\xccy\xe7\x22&&F\x8eyKh\x97\
-\x80\x0b\xce\x1f#\xcb\xbd\xb0|\xb2\x1d\x7f}\xe7\xda\xab\
-\xafFxX\x18\x86\x0c\x1e\x82vm\xdbI\x1c\x16\xf2\
-s\xde\xd9g\xa3W\xcf\x9e\x92\x0e-\xbb\x1a\x8d\xe6D\
-E\x0f\x017\x01~\x0b\xd8B\x15\x04w\xa3r\x8f\x85\
-@\xf5\x05g\xa7\xea\xa3\xd0\x15\x88F\xd3 H\x5c\xea\
-\x0e\xb7\xb2N\xc8\xd2CR$/\x82\xf0\x9eQv\x87\
-\x80\x1c\xea\x93\xb9\x83\xec\xf8X\xac\x94\x8c\xba\xba\x1fn\
-\x88Y\xa3\xd1hN\x14\xf4\x10p\x13p\xad4\xb8\xb2\
-bLeZg\xa9Fs4\xb8(a\xd5r$:\
-\x1a\x8b\x93\xa7\xc5\x03\x91\xd1\xd1j\xdd>jt9\x85\
-\xad\xc9h)\xd5h4-\x17\xdd\xd4m\x02\xdc\x03X\
-w\x08X\xde*tVP\xcdYYi4'0\xac\
-\xec\xb1r'\xb2\xe4*3\x0eQ\x04\xdd\xbc\x8cG\x15\
-\x0f\x0f\xbb4\xbc4\x1a\x8dF\xd38\xf4\x10p\x13\xe1\
-\xef\xebVY\xabP\x5cX\x82\xe2\xe2R\xe4\x17\x16\x22\
-\xbf\xa0P\xbe%ZRR\x8a\x82\xa2\xa2C\xaf[\xa6\
-\xd1h\x14\xd4Pr7\x95;\xda\xa4Y\xc5\xcf&\xd6\
-\x0c\xe9\x01\xe5\xb0\xdaQA2U^R\xee\xfc\x82\x87\
-F\xa3\xd1h\x1a\x8f\x1e\x02n\x02n\xfcU\x02\xca\xbb\
-=\xbb\xf6\xe3\xe3\x09\x13\xf0\xee'\x9f\xd0\xf61>\xf8\
-\xf8cL\x9f1\x13S~\xf9\x05_\x7f\xf7-\xca\xca\
-\xcb\xa5\x82\xd3h4\x87\x80\x9fC,#\x86\x9c\xf0p\
-\xb0\xb3g\x9d\xcc\xb6J+\xca\x0b\x8bP\x98\x97\x0f\xab\
-\xbdJ\xd9k4\x1a\x8d\xa6\xd1\xe8!\xe0&\xc0\x95\x94\
-\x9d\xea\xa8\xb8\x84x\x5cs\xd5\x15\xb8\xfa\xf2\xcbp\xd5\
-e\x97\xe1\xca+\xae\xc0\xcd7\xdc\x80\xeb\xaf\xbd\x16\xe7\
-\x9d}\x0e|}|\xa4\x12\xd3h4G\x82\xe4\xc4P\
-\x06\xf9\x05+\x13>\xe6\x9e?\x1e\xadp\xd3-V\x8d\
-F\xa3i2z\x08\xb8\x09\xf0\xe7\xa2,T\x19\x05\xf8\
-y#&:\x0am\xe3\xe2\x91\xd8.\x01\x89\x1d:\xa0\
-#\xefi\x8b\x8f\x8b\x83\xc5b1Bh4\x9az\xe1\
-\xe7\x10+|.\xba\x1dO\x09\xe4\xc9\x13>>\xde\xc8\
-\xcbMEFZ\x06\xb223UO!c\xee5\x1a\
-\x8dFs\xd4\xe8!\xe0&\xc0\xeb\x84\xd9\xa9\x8a\xe2\x17\
-A\xf8#\x05\x1et\xcc_+\xe0o\x96\xf2b\xb3\xe6\
-\xa6\xd1h\x8e\x00=\x83\xaa\x8d7|\xd5\xcb \xac\x13\
-:d\x88\x22\xa9C\x22.\xba\xecjT\x96Wb\xcc\
-\xf9\xe7\xe1\xbc\xb3\xcf$\xef<\xfdB\xcb\x96F\xa3\xd1\
-4\x16\xfd\x04m\x02\xfc)8~\x09\x84\xff\xf8=\x0f\
-\xf5\xf1x\xadMk4G\x0fI\x91\xf1\x12\x88\xb9\x10\
-4\xcb\x16K\x94\x87\xbb\x07\x86\xf5\x1f\x88\xb3\xce=\x1d\
-\xa7\x8e\x1e\x8d\xe0\xa0`%fZ\xd44\x1a\x8d\xa6\xd1\
-\xe8!\xe0&bf\x9d\x9a\xae\xc4G:35\x9a\xa3\
-\x86{\xfe\xb8\x01e\x88\x0f\x1b\xb9u\xcab\xe5 \xe1\
-\xe2\xafxD\xc7\xb4F\x80\x7f\x80\x9e\x03\xa8\xd1h4\
-\xcd\x80\x1e\x02n\x02\xfc\x16\xb0\x87\x87\x07\xbc<\xbd\xa5\
-\xe2r]\x18Z\xa3\xd1\x1c\x1d5\x0bA\xf3\xda\x7fn\
-2\x07\x90\xf5A\xee\x07d\x17\xd5P\x95\x1f\x8dF\xa3\
-\xd14\x11=\x04\xdc\x04X{\x8e\x8c\x08GLT4\
-<\xbd\xbc\xa4\x97\x82\xab+\x8dFs\xf4\x98\x0bAs\
-O\xa0Zd\xbd\x9a\xf6\xd527\xb0\xba\xda\x0e\xbb\xd1\
-K\xa8>\xb3\xa8\xd1h4\x9a\xa6\xa0\x87\x80\x1b\x03\xe9\
-x\xfc\xbdP?\x1f_\x84\x06\x07#$(\x08\xfed\
-\xe6\x0f\xc9\xf3|@\x8dFs\xf4\xb8[\xd4\x9c?\x96\
-#\x0f7\x92%\x921\xab\xad\x0a\xd6\xaa*T\xd9l\
-\xf2\x82\x95\xcdn\xd7\x0b\xabk4\x1aM3\xe0\xf6\xce\
-\x84q\x8ev\xb1\xf18k\xf4\xc9\xf0\xb2x\xd2SX\
-+0\x0d\x82{\x22\xaa\xed(-+Cna\x1e\xe2\
-bb)\xeb\xdc!o&\xea,\xd4h\x8e\x8ajR\
-\xec\xacU\x15X\xb1a\x1d\x96\xafZ\x8d\xb2\xc2R\xf8\
-\xfax\xc2\xd3\xe2\xad\x86\x83I\xd6\xb2\xf2r\x10\xe4\x17\
-\x88\xe1\xc3\x87\xe3\xa4\xa1C)\x14\xb7^\xb5\xb0i4\
-\x1a\xcd\xd1\xb0~\xebfL\x9f;[\x0f\x017\x1a\xaa\
-x\xdc\xb8\x97\xc2\xe2\x0eO\x0f/Q\xfc\xea\xaec\xa6\
-\xd1h\x1a\x0e7\xa0\x0a\x8b\x0aa\xb7W\xa3Ux8\
-\x22\xc2\xa3\x10\x1c\x1a\x8a\x10\xda\xc2\xc2#\xd0\xb5s7\
-D\xc5\xc4\xc0\xcf\xd7\xd7\x08\xa1\xd1h4\x9a\xc6\xe2\xf6\
-\xce\xf8q\x8e\x84\xd8x\x9cy\xb2\xee\x01<j\xaa\x1d\
-()/Eaq\x11b\x22\xa3e\xd9\x0a\xdd#\xa1\
-\xd1\x1c=\x0e\x1e\xdau\xd81m\xfe\x1c\x19\xee\x1d\xdc\
-\xa7\x0fB\x82\xc2`\xb1x\x18>j\xe0u6\xf5\xe2\
-\xea\x1a\x8dF\xd38jz\x00I_\xd1o\x01k4\
-\x9a\x7f\x06c\xf9\x17\x9e=\xebf\x81\x8f\xa7\x17\xfc}\
-\xfc\xe0\xeb\xed\x03wj\x8c\xf2[\xf6\x9e\x9e\x9ejc\
-3m\xac\x00j4\x1a\x8d\xa6i\xe8'\xa9F\xa39\
-\xfe\x88\xd2g\xc0f7^\xeb\xcf\x1d~\xbe\xfe\x08\x09\
-\x0c\x80\xbfo\x00\xbc<\xbc\xa4W\x9d\xdb\xa7\xb2\xb1Y\
-\xf7\xb2k4\x1aM\xb3\xa0\xdf\x02n*R\x19\xe9\x0a\
-I\xa3i8\xbc\xc4\x8b\x1d\xf9E\xb9\xc8H\xdb\x8fm\
-\xebW\xe2@\xda^d\x15\x17\xca\xcb \x167\x0fx\
-xz\xca[\xc0G\x0d=\xcb\xf8-a\x8e\xc7\xdcd\
-\xe9\x18\xb2\xe3%e\x9a\x1b3n\x8dF\xa3\xf9_C\
-\x0f\x01k4\x9a\xe3NiY9\x8a\x0flB\xde\xc4\
-\x87`y\xe9J\x14~x\x1b\x0a\xb7\xcd\xc0\xb6];\
-PTTL>\x1a\xf1P\x22\xe5\xcff\xb7!3+\
-\x0b{\xf7\x1f\xa0m?\xf6\xd1VQQ\x89\x03\xc9\xc9\
-\xd8w\xe0\x00\xec\x87Q\xd6\x9c\x8a\xa2k\xefd=\xf0\
-\x1a\x85\xe2\x87\xfe\xcb\xcb\xcbe\x0e\xf0\x91\xc2h4\x1a\
-\xcd\xbf\x0d=\x04\xdcT\xe4\xc1\xaf\x1f\xfe\x1aMC\xe1\
-%]\x0a\xb2R\xe0\xf6\xcbx\xc4o_\x87D_;\
-\x92\xf6\xed\x80\xff\xa4\xf7P\xb4{-\xaa\xed\x86\x12v\
-\x94J\x15\xf7\xf0\xe5\xe4\xe6\xe2\xad\xb7\xde\xc6\xdd\xf7\xdc\
-\x8b\xbb\xef\x7f\x10\xf7\xd0\xb6}\xfbv|\xfd\xcd\xb7\x98\
-\xf8\xe5\x97\xa8 \x85Mz\x08\x8dMz\x05\xe9<|\
-\xbe\x92\x92\x12l\xdf\xb9C\x94:\xb6g;\xa7?#\
-=UUU\xa4H\xeeG~~>\xecv;\xe6\xce\
-\x9b\x8f\xb1/\xbf\xaa\xc2p<\x86\x7fg\x18N\x17\xdb\
-\xd3\xe6\xb4\xa7M\xa3\xd1h\xfei\xf4\x10\xf0\xd1b|\
-\xad@\x8c\x92y\x8d\x1b\x02v\x1d\xa22\x87\xa9\xccJ\
-\xe2X`VF\x1a\xcd?\x8d\xbb\x9b\x05y\xfb6\xc3\
-s\xffZ\xb8\xdb*Q\x5cb\x85\x87\xbb\x03QYi\
-(\xd9\xb0\xac\xd1\x0f$\x92 TVV\x92\x12\xb7\x0b\
-\x97^v)\xc6>\xf7\x0c\x9e{\xf6i\xb4m\xd7\x0e\
-yyy\xc8\xcf+ 9PC\xc4\xac\xbc\xb1_\x9b\
-\x8dd\x8f\xc2V\x93\xc3\xce]\xbb\xf0\xe9\xa7\x13\x90\x9d\
-\x95%\xc7\xec\xcfj\xb5\x92?\xab\xf8\xb7\xd1qFF\
-\x06\xdez\xe7]l\xd9\xba\x0dvRd\xa3\xa3\x22\xd1\
-\xb5K\x17yY\x85\x15;\xeea\xe4xYQd\xb9\
-\xe6\xe7\x85\xa9\xf89\xcfi\xd8k4\x1a\xcd?\x89\xe5\
-\xcc\xf3\xcf{6$8\x18\x89\x09\x09\xb2\x02\xbf\x9e`\
-}\x08\xa8B\xe0?\xbb\x83\x154\x95G\x0e2\xdb\xe8\
-A_YQ\x81\xc0\x80\xc0\x06OP\xe7\xca\xa0\xa8\xa4\
-\x18\x15T\xb1p\x05Sa\xad\x94\xf9N\x05\x05\x05(\
---E\x80\xbf\xbf\xe1\xf3`\xa4\xda\xa0\xb4\xc8\xb9\x0e\
-\x03+|\xe2\x83\xfcq\x98rJ#\xbfI\xa9\xd1\xfc\
-\xa3P\xb9d\xf9\xd91s\x02\x227/\x87\xbb\xdd\x81\
-\x0a\xbbR\x90<=,\xd8\x90S\x89\xc0!g \xb1\
-}\x87\x06\xcb\x93\x09\x97y\x1e>\x9e>m\x06\xc6\x8c\
-9\x07\x03\xfb\x0f@\xeb\x98hx{ya\xfa\x8c\x99\
-\xa4\xa0\xd9q\xea)\xa7 5=\x1d\x13\xbf\xfc\x1aS\
-~\xfa\x09[\xb6oCd\xabV\xa8 \xf9x\xf7\xbd\
-\xf7\xb1b\xe5\x1a\x1cH>\x80v\x09\xed\xb0i\xf3f\
-\x8c\xff\xe2\x0bL\x9f9K\xe4\xb4ml\x1c\xbe\xfe\xf6\
-;\xfc\xfe\xfb\x9fHOK\x13\x99m\x1d\x13#a\x13\
-;t$\x19+\xc7/\xbf\xfd\x86/\xbf\xfa\x06K\x97\
--\x83\x8f\x8f\x0f\xa2b\xa2\xb0b\xc5J\x89k\xf6\xdc\
-y\xf8\xea\x9b\xefp\xe0\xc0\x01t!\xa5\xd1\x8b\xd2u\
-$9\xd6h4\x9a\xe6&3'\x1b\xbb\xf6\xed\xd1C\
-\xc0\x0d\x86*\x97\x8a\xcar\x14\x16\x15`\xe7\xee\x9dT\
-Q\xacD^A.J\xcb\xcbPec\xa5\xb0a-\
-z\xae\xa4\xf2\xf3\x0b\xf0\xd8\xe3O\xe1\xee\xbb\xef\xc1]\
-w\xdd\x8d\xfb\xef\xbb\x1f\xb3f\xcd\xc2\xe4)?c\xe2\
-W_\x8b\x1fs\x98\x88+F\xd7\xde;\xae\xc4XI\
-\xe4\xf4\x98\xa7\x949I\x86\x7f\x13\xfeBI9\xa5\x97\
-\xc3n\xdc\xb4\x09o\xbd\xfd\x0e\xd9\x95\xaa\xb8i\xab\x1b\
-\xaf`\xc4)q\xd5u\xd3h\x9a\x03\xd1w\xa8!E\
-\x7f\xca\x04R\x94,j\x1e2\x95m\xb6i\xaaJ\xc4\
-\xbdp\x13'~\x8d\xe7\x9e\x7f\x11\xaf\xbf\xf1\x1623\
-3\x0d\x17r\xb3\xdb\xf1\xf2+\xaf\x90\x12\xb6\x1f#\x86\
-\x0dCqa\x11\x9ex\xf2\x19\xe4\xe4\xe4\xa2]|[\
-\x84\x85Pc\xb8cG\x04\x07\x05\xc9\xd6\xbbg/t\
-\xed\x9cD\x8a\xdb\xb7X\xb6l9\xda\xb4\x8eApp\
-\x10\x12HAd\xe5\x92\x87\x97\xff\xf8\xf37\x14\x97\x94\
-\xe0\xc7\xc9\x93\xb1t\xe92\xf4\xef\xd7\x17\xad\x22[\xe1\
-\x8d\xb7\xde\xc2\x96-[\xb1}\xc7N\xbc\xfc\xda\x1b\xf0\
-\xf6\xf4\xc2\x00r\xfb\xed\xd7\xdf1\x93\xe4\x9deL}\
-\xffX\xa3\xd1h\x8e?z\x08\xb8!\xd0C\xba\xcan\
-C~a>\xd2V}\x07\x8f\x0f\xeeF\xd4\x07\xb7\xa3\
-\xe4\xeb\xa7\x91\x9d\xb5\x19%\x05\x05\xaa&k <\x0c\
-4\xe7\xef\xb9\x08\x0b\x0f\xc7P\xaa\x84\x06\x0e\x1e\x82\xb8\
-\xb8x\xa4\xa7g %9U\xfc\xb0\x82\xc6\x15\x84\xcd\
-f\x13\x85\x8c\x8fyHi\xf7\x9e}x\xfa\x99ge\
-\x88\x8a\xff\x18\x1e\x8a\xe2\xc5s\xc5\x0fm\x1c\xff\xfd\xf7\
-?\x88\x193f\x8b\x92W\x5c\x5c\x8c={\xf6J\xc5\
-h*\x80<\x0c\xc5\x95\xa1y\x1e\x13\xfe\x00?\xbb\x99\
-J\xa2F\xd3\xdcp9\x0c\x8d\xed\x0do/\x0b<\xdd\
-\xdc\xa8ab\x83'=\x8ax\xc9\x97\x22\xbf\x00x{\
-4\xb2\xa7\x9a\xc2W\xb3\xf6\xe8\xae\x96\x94\xb1x\xd4\x1e\
-\xd1\xf0\xb0x\xa0\x88\x14\xbe\xad\x9b\xb7\xe1\xfe{\xef\xc1\
-\x05\x17\x9c\x8f+\xaf\xb8\x1c\xfb\xf7\xefCjJ\x0aN\
-;\xedT\xc4\xc7\xc7\xe1\x82\xf3\xc7 22\x92d2\
-\x8ed\x84\xe4>?\x0f\xfb\xf7\xec\xc1\xae\xdd\xbb1p\
-\xc0@\xc4\xc4\xb4\xc6\xe8\xd1\xa3\xd1\xbfo_:\x07\xaf\
-S\xe8\x8d\xfc\x82|\xcc\x9a\xfd7N?\xf5T\x5cq\
-\xd9%\xb8\xfe\xdak\xe1\xeb\xeb\x87_\x7f\xfbCz\xfa\
-\x22\x22\x22p\xf1E\x17\x90\xfd5\x182d0\x96/\
-_YK\x865\x1a\x8d\xe6x\xa3\xdf\x02n \x95U\
-VXwnE\xc2\xf8\xb7\x90\x90\xb3\x0dm\x1d9\x88\
-Y9\x1d\xd5S&\xa0\xbc\xa2@\xfa3\x1a\xfa(\xe7\
-\x8f\xdas\xe5w\xfe\x981\xb8\xfb\xee\xbbp\xcf]w\
-\xa2W\xaf\x9ej\xcd3\xae\xb0(\xa2\xd2\xf2r\xcc_\
-\xb8\x08\x1f|\xfc\x09~\x984\x05\xa9ii\xa8\xb4Z\
-\xb1b\xe5\x0a\xac\x5c\xbd\x163g\xcf&ep\x0fR\
-\xa8\xe2\xfa\xe6\xdb\xef\xf0\xce\xfb\x1f`\xfe\x82\x85(+\
-+\xc3\x9auk\xb1x\xd1\x22,]\xb1\x02k7\xac\
-G\x97\xce\x9dq\xfbm\xb7\x22\xd0?@\x14\xcaEK\
-\x96\xe2\xa3q\xe30\xf1\xeb\xaf\xa5R\xe3\x0ay\xef\xde\
-\xbd\xf8{\xee\x5c:\xe7B\xbc\xf7\xe1\x87\x983\x7f>\
-\x8aKK\x1a~Q\x1aM\x83\xe0u\xfd\x1c\x08K\xea\
-\x8b\xe2\x8e=a\xf1\xf5Et\x88\x1f)Q\xa4\x08\x86\
-\xb4\x85G\xf7\xde\xd4\xf8h\xe4\x03\x89\x14*\x0e\xc9S\
-Yn\xba\xf1z<\xf5\xc4\xe3x\xf8\xa1\xff **\
-\x0a\x16\x96-R\x0c\xab\x1c6\x04\x05\x05\xa2U\xabV\
-2\x84\xeb\xe1\xe9!:\x227\xa2\xd8\x9d\x95G\x96\xc1\
-\x9c\xec\x1c\xdc\xff\xc0CX\xb7n#F\x8d\x1aIq\
-\x84KK\x99\xdd\xdch/\xb2*\xcb\xd4\xa8\xeb\xa9\xa8\
-(G\x1a5\xe0\xbc\xbd\xbd\xe5+%<\x8d#\x9c\x1a\
-x)$\xb7\x9c(o/o\x0a\xa3\xbe\x15\xce\xf6\x0e\
-=\xf6\xa2\xd1h\xfea\xf4c\xa8\x01p+\xbd\xcaZ\
-\x05\xdb\xac\x89\xf0\xf1de\xb0\x1ai\xc5vx\xa2\x1a\
-\x11\xdb\x97\xc2-m\xb7T>\x0d\xd5\x95\xaa\xaby\xb2\
-z\x15\xfe\x9a>\x03\x9f}6\x1e\x13>\xff\x02\xd9Y\
-\xd9\xaa\x07\xcfQ-o\x14\x8e7\xec\x93:v\xc4\xea\
-\xb5k\xf0\xc4S\xcf8\x152\xaep\xf8\x5c\xacHf\
-\xe7\xe6\x2248\x18\xf1\xb1\xb1xa\xec\xcb\xd2\x0b!\
-\x1a=W6t\x1e\x0f\xda\xa7\xa6\xa6\xe0\xc3\x0f?\x92\
-4N\x9a2\x05\xef\xbe\xfb\xbe\xf8\xb7\xdb\xec\xb8\xe7\xde\
-\xfb\xb0j\xcd\x1a,Z\xbc\x04\xb7\xdcz;\xe6\xcd[\
-\x80\xf8\xb88<\xf5\xf4s\x98<i\x92\xf4\x12r8\
-\x8d\xa6\xb9`\xc5)8:\x0e\xe5c\xee\xc0\x9e\x98$\
-\xac-q\xc3\xee\x90xd\x9c|#\xc2\xbb\x8c2\x94\
-2.\xc3\xb4\x1d%\xdc\xab\xc6\xbd\xe1\xfc\xe2\x06\x0f\xaf\
-\xf2\x1b\xc7\x0c\x7f_\x98\x1b?\xc1\xfe\x81()+\x97\
-\xe1\xda*j\xd4-\xa1\xc6\x10\xcf\xd5Kh\xd7N\xfc\
-\xf1\xdb\xbd\xe9\x19\x19\xc8\xa5}Zz:\xce;\xefl\
-\xf8\xfa\xf8\xa1\xa8\xa8Lz\xe2\xb9g\xb1\xac\xac\x02\xfb\
-\x0f\xec\x97y\xb5\x1c\x7f\x95\x8d\x14\xda\xb0p\xf4\xe9\xd5\
-\x0b\x7f\xcf\x9e\x83\xbc\xfc\x02\xac]\xbf\x1ek\xd7\xad\xc3\
-%\x17^\xa0z\xdaI\xaeE\x8a\xe8\x92\xb8W\xd1N\
-i\xd1h4\x9a\x7f\x12=\x04\xdc\x008{\xb2\xb3\xf6\
-\xc0\x96\xbf\x0fVz\x90gX\x81*z\xf0\xef/%\
-\x17/O8h\x93\x9e\x01\xe5\xfd\xf0\xb0\xa2HqT\
-Q\xa5\xb0t\xd9r\xfc2\xf5WL\x9d\xfa;\xf2\x0a\
-\xf2\xe5\xadb\x1e\xe6\xdd\xb2m\x1b\xbe\xfa\xe6{\xdc|\
-\xd3\x0d8\xeb\xac3\xf1\xc8\x7f\xff\x8b}{\xf7a\xe5\
-\x8a\xd5HJ\xea\x84\xb0\xd0\x10\x9cy\xda\xe9H\x88o\
-+\xf3\x95\xdaw\xec\x80\x88\xc8\x08\xa9\x90v\xec\xdc\x89\
-N\x89\x89\x08\x08\xf0C\xf7\x1e\xdd\xd1\x8b*%\xaep\
-\xadU<D\xec\xc0\xd4\xdf\xfe\xc4%\x97\x5c\x84\xf3\xce\
-9G\x86\xa3\x02\x82\x02\xb1v\xf5\x1a\xf8\xf8\xfa!\x90\
-\xc2\x5cs\xcd\x95\xb8\xe4\xe2\x8b0\xe2\xa4\x11\xd8\xbau\
-\x87\xf4\x0e\xaa\x9aK\xa3i.\xdc\x10\xe8\x1f\x84\xf0\xc4\
-\xa1\x08\xb8\xe5ex\xff\xe7)x\xdc\xf1\x0eBG\x9f\
-\x87\xc4\xf6\x1d\xe1\xe1\xdd\xf8\x97\x95|<=\xd1>\xa1\
-\x1d\x02\x03\x03EY\xe3^7&&\xb6\x0d\xa2\xa3\xa3\
-\xe1\xeb\xeb\x8bk\xaf\xbe\x0a\xbf\xfd\xf6\x07^\x7f\xfd-\
-L\x9b6\x1d\x0f>\xf0\x00:'%\x91\xcc\x04\xc8\x9a\
-\x81o\xbd\xf3\x1e\x82\x83\x020\xa0_?|\xfd\xcdw\
-\xf8\xf8\x93qp\xb0\xd2\x1a\x1a\x86\xb0\xf00\x0c\x1f6\
-\x04_}\xfd\x1df\xcc\x98\x81@\x92\x9fX\x8a\x9b\xe7\
-\x0b\xdex\xc3u\xd8\x9f\x92,\x0d\xb1\x0f\xa8\xc1u\xc6\
-\xe9\xa7a\xe8\x90\xc1\x08\x09\x0eB\xbb\xf8xxxX\
-\xa4\xe70<\x22\x5c\xe6\x12\xf2\xf3\xe2\xe8U\x5c\x8dF\
-\xa3i\x1e\xdc\xde\x990\xce\xd1.6\x1eg\x8d>\x19\
-^\x16z\xf0\xf20\x88\xa6\x16\x8ej\x1bR\xb7\xacA\
-\xde;\xf7\xa3cY\x0arK\xed\xf0\xf4p\xa0\xd4\xee\
-\x8e\x00O\x0fd]\xf14\xba\x9e\x7f=\xdc-\x16\xd5\
-sq\x18xn\x1d/T{\x1a)po\xbe\xf9&\
-N;\xe5\x14\xb1\xe7\xe1\xa7g\x9e}\x01\xd99\xd9\xb8\
-\xec\xd2Kp\xef\xfd\x0f\xe2\xe7\xc9?\xa2c\x87\xf6\xa2\
-\x80\xdd}\xff\x03\x188\xa0?\xbaw\xef\x86\x17\xc7\xbe\
-\x84_\xa6LAEe\x05\x9e~\xf6y\xa4\xa5\xa5\xe1\
-\x5cR\xe8&O\x99\x8c\x01\x03\x07\xe2\xf6[n\xc6\xe9\
-g\x9c\x89\x07\xa8b\xbb\xe6\xea+\xb1i\xcb\x16\x0a\xf3\
-*>\x1d\xf7!.\xbd\xf4\x0a\xbc\xfe\xda+2,\xcc\
-\x95\xd1+<9\xdd\xdb\x1b\xed\x12\x12\xf0\xd6\x1b\xafc\
-\xd6\xac\x99\xf0\xf7\xf3\xc3\xb8\x09\x9fc\xd7\xae]\x18\xfb\
-\xfcs\xf0\xe29Y\xba\x5ch\x8e\x11\xf2\x22\x04\x15/\
-\x1eZ\xdd\xb1{\x0fR2\xd2q\xf2\xd0\xe1la\xf8\
-8J\xb8\xc1R+(YH\xaf\xb8qD2\xc8\xbd\
-\xed\x85E\x85\x08\x0b\x09u\xb6oXv\xb9G\xcfZ\
-U\x05\x1f/o\xb6Aqi1\x02\xfc\x03TPN\
-\x8f\xf4\x86\xbb\xa1\xb4\xbcT\x86uY\xa9S\x11\xabX\
-\xd8\xb9\xac\xbc\x8c\xec=\xa9mH\x0dC\xb15Nl\
-\xec\x04\x15\x8dF\xa3\xd1\x1cw\xd6o\xdd\x8c\xe9sg\
-\xeb!\xe0\x06\xe1\xe6\x0e\xcf\xd8\xf6(\x8fK$%\xd9\
-\x1d\xa1^\xeeps\xb8\xa3\xb5\xbf\x07\xca\xdd\xddQn\
-\xf1\xa0\xfa\xe5(\x9f\xe6R\x09\xd9U\x0f\x9b\x0b\xee\xee\
-\x16DD\x84#0\xc0\x1f\xeb7n\xa4s\xbb\xc9\xc2\
-\xb3\xfc6a\xd7\xaeI\xd2\x9bWi\xe5\xb5\xcb\x1c\xd8\
-\xb3o/fL\x9f\x86\xa7\x9fz\x02g\x9dy\xba\x0c\
-qYx\xe8W\xe61AM\x827j\x19\xfe\xb0\xbe\
-?\xf7\xf2\x05\x05c\xd6\xec9R\x01\x96\x94\x96\xc9\xbc\
-\xc1\xe0\xe0`\xf2A\xe9\xa0\xb0<\x84\xa6*\xbaj\xad\
-\xf3i\x8e\x0fF9\xe3\xb9\x7fn\xc7\xe4\x91tpA\
-\xe6\xc6\x1a+\x7f\xec\xa6\xe6\xf5\x19r\xe2fQ\xca\x9f\
-q\xcc\xf3fk5\xea\x0c3\xcb\x12\xaf\xfdW\x137\
-\xefk\xdc\xbc\xcd%\x97\xd8\x7f\x8d\x93F\xa3\xd1\xfck\
-\xd0C\xc0\x0d\x80\x9f\xe1\x01>\xbe\x08\x19x1J\xed\
-\x1e\xf4\x80wG\xa4\xbf;,\xa4,\xe5\xc7\xf7\x84-\
-\xbc\xedQ=\xdf\xb9\x07\xc2\xd3\xcbK\xf6\x1c\x90;'\
-\xf8\x16\xa8\xe1V;:u\xea\x84\xdbn\xbb\x15\xef\xbe\
-\xfb\x01\x1e{\xe2)\xdcu\xf7\xbd\x189\xea$\xf4\xee\
-\xd5\x07\x11\xe1\xe1\xc8\xcb\xc9\xc15\xd7\xdd\x88\xcd\x9b6\
-\xa3S\x97.x\xfe\xc5\x97\xf1\xc4S\xcf\xc9\x1b\xc2\x1c\
-\x0f\xf7X\xf4\xed7\x00\xef\xbc\xfd\x1e\xbe\xffa\x92\xf4\
-\xb0TVT\x8aBw\xfdu\xd7\xe0\x93O>\xc3C\
-\x0f?\x8a\x1bn\xbe\x05\xde\xbe\xbe2\xc9\x9d\xe7)y\
-yr\x85\xa6\x90yK\xb4\xe9\xa2\xa19\xd6\x98\x0a\x16\
-\x975\x87[um\x85\xab1\xd4\x17\xdc\xc5N\x14>\
-e8\xd8/\x1f\x9b\xe7\xafev\xf1\xe8j_\x07I\
-\xbb\xb1\x1d\xf6:\x0e\xe3\xa4\xd1h4\xc7\x03=\x04\xdc\
-\x00\xd4K \x95\xb2\xd4\xc3\x9e\xa9\x9f\xa2\xd5\x92\x1f\xe1\
-(\xaa@y\x97~\xb0^|\x1b<=\xa2\xd0\xb5k\
-Wx4`\x08\x98{\xfex\x99\x15~\x83\xb7u\xeb\
-\xd6\x08\xe4E\x9f)\x0cW~\x99\x99\x19\xf2e\x82X\
-\xb2g\xbb\xed;w\xa2 \xbf@\xe6-u&\xa5\xd0\
-\xd3K\xf5*\xa4\xa7\xa7#9%U\xd6\x22\xe3\x09\xec\
-[\xb7nC@\xa0\xbf,hk\xb3W#&2J\
-\xd2\xba{\xef^\xb1\x8bn\x15\x81\x8c\xcclY\xe2\x82\
-\xcf\xb3\xef@2\xb2\xb2\xb3`qwG\xcf\xee\xdde\
-\x99\x8a\xfc\xc2\x02y\xf3\xb1=/\x08N\xd7\x91\x9b\x97\
-\x03ke\x95\xcc\x9bjr\x85\xac\xd1\x1c\x01i\x0c\x11\
-\xbbH.\x923\xd2\x9a6\x04\xac\xd1h4\x9aCb\
-\x0e\x01k\x05\xb0!P\xe5\xc4\x7f\xbc\xe2\x7fzz2\
-J\x0elAuF\x11r\xc3\xc2\xe1\xe1\x13\x04x\xba\
-!2\xb4\x15b\xe3b\x11\xe0\xe7\xdf \x85\x89\xdf(\
-t\xf6\x16\x18\x98\x95\xa0\x19\xdeu\x1d>\x9e\xafg\xfa\
-\x15\x7f\xbc\xd11\xdb\xf0\xcb\x1d\xceh\xd8\x8e6\xf6\xa3\
-\xce\xc1KO\xa80<|\xec\x0cK\xf0\xaf\x19\xafi\
-\xaf\x96\xb6P\xfe\x19\xad\xfci\x8e\x07fy\xdb\xb9g\
-\x17R22\xb4\x02\xa8\xd1h4\xc7\x88\x9a9\x80\xf4\
-\xdc\xd5C\xc0\x87\xa7ZiP\xf0\xf1\xf1FB\xbb\x0e\
-\xe81\xf2|t\x1cs\x096\xee\xda\x83\x0d\x1b7a\
-\xf3\x86\xcd\xf8\xe5\xd7_\xe5\xa5\x09\xf9\x8aF\x03\xa8\xab\
-\xfc1l\xe7\xaap\x99\xc7u\xfd\xd6\xb5Ws\xfex\
-\xcf\xca\x9e\xf2\xe7<f\x85\x9e\xcd\xae\xf6.\x1b\xfd\xd4\
-\xb27\xa9{\xac\xd1\x1c\x0fx\x0e\xa0\xa9\x0cj4\x1a\
-\x8d\xe6\xd8A\x1a\x02\xe96\xba\x9e?,\xdc'\xa6z\
-\xd2H)\x92\x1e2R\x06\xbd\xbc\x10\x18\x18\x04\x8b\x0f\
-\x7f\x04\x1e\xb2|\x04\xcf\xe1kp\xd5\xd5\x00\xe5\xcaT\
-\xc2\xeaU\xc4\x5c\xec\xc4\xbd\x1e?\xb5\xc2\xd55\xd3v\
-P\xbcu\x8f5\x9a\x7f\x00\x8bE\xbf\x9b\xa6\xd1h4\
-\xc7\x1a\xfd\xa4m(\xa2\x1c\x89*H\xff\xee\xb2\xfcC\
-fZ\x16N\x1e1\x0a\x97^v\xb1X[I\x09\xac\
-WY\xd3h4\x0d\x86\xa74h4\x1a\x8d\xe6\xd8\xa2\
-\x87\x80\x8f\x1a7\xf9\xab\xb0Z\xd1\xb7o/,_\xbd\
-\x02?\xff\xfc\x0b\xa2c[\xc3\xd7\xc7W\x86\x8a5\x1a\
-\xcd\xd1\xc12%\xad\xa8\xfaz\xa65\x9a\x7f3\xfc\xcc\
-\xff\xb77Z8y\xff\xa24\xca\xfcv]W\xfe\xe3\
-\xe8!\xe0F\xe2\xe3\xe9\x8d\x15+V!$8\x14\xed\
-;t\xc0\xae\xcd\xdbda\xe6\x86\x0e\xa3\xd6\x9d\xe7d\
-\xbe\x84\xa1\xd1\xb4D\xf8%+\xfee\x19\xd0s\x005\
-\xc7\x1a.c\xbc\xcc\x95\xb9\xc9b\xe4G(vu\xc3\
-\x98\xcfk^\xd5\xa1\xcans\x1e7\x95C\xd5\x05l\
-on\xf5\xb9\x1f\x12\xf2\xca\x9f\x22\xac\xb4Y)\xdd\x0d\
-\x9b\xa3~\xac\xe1\xcf5\xca\x9a\xb3M\xc0\x99\x17\xff2\
-j\xdd\xa7\x7f9z\x08\xb8\xb1\x18z^\xd7\xa4\xce\xe8\
-\xd5\xa3\x07\x02\x02\x83\xe4A@w]9\x1c\x09\x17\x7f\
-\xff\x0b\x05E\xa3\xd1hN\x04\xb8\xf7\xa9\xac\xacL\xbe\
-\xf5\x9c\xca[Z:\x0a\x8b\x8a\x94\xe3!\x9e\xc5\xfc\x8c\
-.\xa50\xa9iiH\xcb\xc8DJj\x9a|1\x86\
-\x15\xc1\xe93g\xe1\xb3\xcf'\xa2\xa8\xb8\xb8y\x9e\xe5\
-\xf5\xc4\xc1\xf1\xf2*\x14\xf3\xe6/\x90\x8d\x15\xa8\x86\x9c\
-\x8b\xfd\x90\xda\x8a\x8d\x9b6\xe1\xfd\x0f?\xc2\xa6\xcd\x9b\
-\x95]\x03\xc26;\xc6y\xb3\xb2\xb3\xf1\xfe\x07\x1fa\
-\xf1\x92%t\xdcD\x85\xf4\x9f\xb8\x8eC\xc1I\xa1\xf4\
-\xf0'^\xa7\xcd\x98\x89\xe2\x92\x12\xb9\xde\x7f3z\x08\
-\xb8I\xb8!=3\x03\xfb\x93\x93)'\x1b\xda\xf3W\
--\x1f\x89\x1f\xfb\xca\xab\xd8\xb3o\x1fl\xb6*\x94W\
-\x94\xe3\xcb\xaf\xbf\xc1\xd2\xe5\xcb\x95@\xfc\xcb\x0b\x8dF\
-s,\x90\xe7'=\x8c\xf4\x10\xb0\xe6X\xc1\xca_A\
-a!\xde~\xf7}\x5cs\xc3\xcd\xb8\xea\xeakq\xc5\
-\xd5\xd7\xe0\x9e\xfb\x1f@n~\xbeQ\x08\x95_\x13\x0e\
-SD\x0a\xe2\xab\xaf\xbfI\xfe\xaf\xc7\xc5\x97\x5c\x8e\x8b\
-.\xbe\x14\x9f\x7f\xf1\xa5(b\xb3g\xcf\xc1\xc4\x89_\
-!;+[\x9e\xe7\xae\xbd\x83\x0c\xaf\x0ca\xf6\x1a\xf2\
-\x02\xfb\xa6R`\xda;\xddi\x9f\x9d\x93\x837\xdf}\
-\x0f\xf3\x16-\x82\xd5ju\xfa\xb5\xdb\xab\xb1k\xf7\x1e\
-<\xf7\xdc\xf3x\xf8\x91G\x91_P(\xfe%<\xf9\
-1\xe3wU8\xd8\xcc\xe7\xe3\xb0k\xd6\xad\xc7\xb8q\
-\x13H\x11\xdc\xa8\xfc\xd0?\xf7\x06\xd6\x0d\xc7{\xee\xc8\
-\xe0\xbd\xe9\xc6\xe7q\xc5<o\xadpdg^[\x8d\
-\x9bK8\xb6g?\x94_\xa9\xa9\xa9\x18?\xe1\x0bR\
-\x00\x97\x92\x83\x92u\xd7<r=\x9f\xc4\xc3n\xd5.\
-n\xd5\x14\x97\xcd\x8e\xc5\x8b\x97\xe0\xdd\xf7?\x94\xfbY\
-\xf7\x8bZ\xec\x87\xbf\x8c\xa5\xc2\xaa\xb8\xd9\xac\xae\xdbH\
-_\x9d0\xa6\xbdlu\xdc\x0eJ\x9f\xbal1\xf3\xb9\
-\xd5\x9e\xdc\xe8:\x9f\x7fq,\xdd\xa7\xe7\xb0c\xc7\x0e\
-g\xfe\xbb\x867\xf3\x8c1\xd3\xe6\xbaq^\x1d/\xf4\
-\x10pc\xe0\xfbC\x99\xc6\x15\x15\xb7\xafxy\x98\x86\
-\xe3\x86\xc4\xc4D\xac_\xbf\x01S\xa7\xfe\x8a\xaa*j\
-ARk\xe1\x9bo\xbf\x93\x0f\xd8K\xdc\xba\x02\xd4\xb4\
-0x\x0e ?\x8c\xf8\x13\x8b\xae\x0fH\x8d\xa6\xb9\xe0\
-re\xa7\xed\xf57\xdf\xc2\x84\xcf'\x22( \x00\x17\
-^p\x01N9\xe5dQ\xfe\xf2i\xe3\xba\x90\x9f\xe9\
-\xae\xf0\xd3x\xe5\xaa\xd5\xf8\xf9\x97\xa9\xe8\x98\x94\x88\xa7\
-\x9ez\x0c\xe7_0F\x16\xedW\x1e\xc8?y*\xab\
-,Gzz\x062\xb2\xb2\x8c\xe1M\x15Syy\xb9\
-\xf44&\x93\xe2\xc3\x0a\x9e(&\xe4\xceS\x86\xf8\xbb\
-\xf0%\xa5\xa5\xe2\xceJfJJ*>\xf8\xe0cL\
-\x9f6]z\x1bm<\xb4Lx\xb8\xbb\xa3m\xdbx\
-\xdc\xf7\xc0\x03x\xf6\xf9g\x10\x1a\x1a\x22=L\x99\xa4\
-tVVVJx\xe9\x954\x95FR\x80*)~\
-\xee\xe5\xcc\xc8\xccT\x9d<\x94\xc6j\xb9\x1aV<\xec\
-\xc8\xca\xcd\x91\x0f\x0apzYq\xe5p\xfc\xc5\xa8\x8c\
-\x0c\xfe A\x152\xb3\xb3q 9\x85\xd2W\xc2\x99\
-'\xee\x9c\xf6\xdc\xdc<\x0a\x97\x82t\xf2\xc7\xe7f\xfb\
-\xb2\x8a\x0a\xe9\xd9\xe3p\x1c\x1f\xa7\xa5\xbc\xbcB\xce\xc5\
-\xee\xac$\xb1\xff4\xca\x1f\xeeIe\xc5\x87\x9az\xe2\
-\xce\x8a(\xf7\x9e\xa6P\xfe\xf0\xc6\xdf\xd2V\xe7\xb2K\
-\xda\xcb(\xffr\xe8\x9c\x07\xe8\x9c\x05\x05\x05\xb0Q\xda\
-\x0b\x8a\x8b0\xe5\xe7\xa9\xf8\xe0\xe3q\xd8\xb5g7\x0a\
-\xc9^)f|\xa1\x90!y\xbe\xf6b\xca\xdb\xbc<\
-\x15\x96{yYI\xcb\xe0\xeb\xa2\xeb\xe64\x8b\x7fc\
-\xcb1\xfc\xf1}\xe24\xb0\x9d\xa4\x9d\x94\xb2\x02\x0a\xcb\
-\xf6\x9c\xbe\xc2\xc2\x22\xb2\xa7\xf4\x93\x1b\xdf\xb3\xbc\xdc\x5c\
-\xb2+D&\xa5\x95\xfd\xde{\xef\xddx\xf4\xb1G\x90\
-\x94\x94$\xf767/\x17\xe5t.\x0e\x9b\x9e\x91\x09\
-\xab\x91g\x1c\x7fii\x99\xd8K\xdct\xbf\xd39\x0e\
-v;NX\xce<\xff\xbcgC\x82\x82\x91\xc8_\x80\
-p\xb7P!Q7Esd\x16P+-\xa9s\x12\
-)n\xfe\xd8\xb0a\x13:\xb4O@|l\xac\xb1T\
-L\xfd\xb0\xd2\xc8\xdf\x10\xed\x94\xd8\x11\xe3?\xff\x02m\
-bb\xf0\xf6\xdb\xef\xe0\xca+\xaf\xc4\x19\xa7\x9f\xa6z\
-?\xf4=\xd0\xb40\xccJ77?\x0fET\xb1%\
-\xc4\xc5k9\xd04\x1bR\xe1\x12)\xa9)x\xfc\x89\
-g\xd0>\xa1\x1d\x9e'E\xea\xa2\x0b/\xc0\xa8\x91#\
-q\xf2\xa8\x91h\xdd:\xa6\xfe\xaf9Q\xd8\xb5\xeb\xd6\
-b\xda_30l\xd8P\x5c{\xd5U8y\xf4(\
-\x0c\xe8\xdf_\x9cg\xce\x98\x85];wc\xff\x81\x03\
-\xf8q\xd2d,X\xb0\x08\x1d:\xb4GTd$\x8a\
-\x8b\x8a\xf1\xe9\xf8\xcf\xf1\xe1G\x9f`\xeao\xbfc\xd1\
-\xe2%\xa2\xbc\xc5\xb6i\x83\xe5+V\xe1\xcd\xb7\xdf\xa5\
-4\xa5a\xc2\x84\x09\xa4(\xe4\xe1\x8b/\xbe e\xa3\
-D\x14\x85\xe5\xcb\x96\xa2o\xff\xbe\x08\x0f\x09\x95\xf4\xe7\
-\x91\x82:y\xf2dR\xd02q\xd2\xb0a\x98<\xe5\
-'|\xf9\xd5\xd7\xa2Dr\x8f\xe6\x9f\xd3\xa6\xc97\xae\
-;u\xec\x08+)b\x9f\x93\x92\xfb\xde\xfb\x1fa\xda\
-\xf4\x99\xa4@\xe5\x90r\x99\x82a\xc3\x87\xa2{\xb7n\
-t\xee\x95x\xf9\xd57\xf0\xfdw\xdf\xe3\xefy\xf3\xe5\
-kP\xfc\xb5\xa9\x8d\x9b\xb7\xe0\xb9\x17^\x14%\x8d\x87\
-i\xa7\xfc\xf4\xb3(n\xbdz\xf5\x80\x8f\x97\x0f\xd5s\
-\x1b\xf1\xe2K/\xe3\x9bo\xbe\xc3\xcc\xd9\xb3\xe5|\x1d\
-;t\xc4\xf2\xe5\xcb\xf1\xce{\xef\x91\x92U\x8cw\xdf\
-\xfb\x00S\xa7\xfeF\xe9-@\xef^=E1\x9b=\
-g\x0e\xc6\xbe\xfc\x1a~\x99\xfa+\x0e\x1cH\xc6\x9e\xbd\
-{\xc5m\xf8\xd0!\xa2\xc4r\xef*+\xe5\x7f\xfc9\
-M\xf2\x81\xd3\xc2_\xb3z\xe4\xb1'I)J\xc7\xb7\
-\xdf\xfd\x80\xef\xbf\xff\x11\x1b6mB\x9f^\xbd0\x7f\
-\xe1B\xfc\xf0\xe3$\xe9][I\xd7\xc2Jj\xaf\x9e\
-=\xe8\xfe\xa9\xefs\xef\xa3{q\xdf\xfd\x0f`\xf7\xee\
-=r\xce\xef\x7f\xf8Q\x14\xac\xaa\xaa*\xbc0\xf6%\
-\xfc\xf2\xeb\xef\xa2\xe8\x0e\x19<\x88\xee\xb7;\xd6\xac]\
-K\xe9{\x15\xdf\xd1y\xfe\x9a6\x03i\xe47)\xa9\
-\x13\xfc\xfd\xfd\xb1{\xef\x1e\xbc\xf1\xe6\xdb\x98\xf8\xe5\xd7\
-\x94\xbe\xbf\xb0y\xebV\xf9\x0a\x97\x1f\xb9}\xfd\xcd\xb7\
-\xf8\xf5\xf7\xdf\xa9\x81\xb0\x0a\x7f\xfd5\x0d=z\xf4\xc0\
-\xaft\x9f\x0f\xec\xdf\x8f\xbe}\xfa\xe0O\xb2\xfbq\xd2\
-\x8f\xd2{\xcb\xf99s\xf6\x1c\x04\x04\x06\xc8\x17\xb7\xd2\
-H\xd9\xfb\xe4\xd3\xcf\xf0\xf1'\x9f\xe1\xf7\xdf\xff\xc0\x8c\
-Y\xb31\x8f\xee\x05\x7f\x9a\xd5\xcf\xd7\xe7\xe0r\xd8\x8c\
-d\xe6dc\xd7\xbe=z\x08\xb8Q\xf0}\xa1Lc\
-\xa1\xe4n\xff\x9d\xbbv\x1f\xd5\x07T\xf8\xc6&uJ\
-B\xdf~}\xa9\xa5\xf0\x04\xe2\xda\xc6\xe1\x92\x8b/4\
-\x1d\xd5^\xa3i\x81pO\xa0YYk4\xcd\x0a\x95\
-\xab\xe5\xcbIY(.F\xef\xde\xbd\x90H\x8a\x12\x97\
-5\xfe\x1aRLt4\xbcDy8\x18\xee\xcd\xeb\xd0\
-\xa1\x03\x22\xa3\xa2\xf0\xc7\x1f\x7f\xe2?\x0f?\x82\x9f\xa9\
-\x92\xe7^4\xae?\xb9\xb8\x96\x96\x97#-+\x13\xad\
-\xa2\xa3D\xb9\x9a4\xf9'RJ\xca0\x8e\x14\xbb\xcf\
-H\x01\xec\xda\xad\x0b.\xb9\xe8B$''\xe3\xa9\xe7\
-^\xc0\xfe\x94d\xf9\xdc\xe6\xaaU\xabEil\xdb\xb1\
-=:Rz\x86\x0e\x1f&q&\xb4\x8b\x97\x0e\x81\xd0\
-\xe0P\xa7\x22PL\xe9^\xb7~\x03\xd6\xaf\xdb C\
-\xcf\xdc{\xb7x\xe9r|\xf3\xed\xf7\xd2;\x98\x91\x91\
-\x85\xcf>\x1b\x8f\xed;vb\xe7\xee\xdd\xa4\x90}(\
-\x9f\x0f\x1d<x \x16/Z,\x9f\x09\xe5\x0a\x7f\xef\
-\xde}\xa4\xe4\x8dE%\xa5\xf9\x86\x1b\xaf'E\xb5\x95\
-\x1c\xb3\x92\xc2=\xa1[\xb6n\xc3W_~\x8b\xfe}\
-\xfb\x2208\x98\x14\xad\xc9X\xb4h)\xb9\xe5\xe2\xa9\
-\xa7\x9fEii)\xae\xbb\xfeZ\xc4\xc5\xc7\xe1-R\
-`yJSvV\x0e\xe6\xcd]\x88\xb7\xdf~O\x14\
-i\xee%\xfb\x80\x94\xdeEK\x96\xd25\xa7\xe0\xa3\x8f\
-\xc6I\x8f\xe6y\xe7\x9d#\xbd\x8av[\xcd\x10,+\
-\x8eK\x96.\xc3\xb9\xe7\x9e\x833\xce<\x1d_}\xfd\
--\xe5\xefor\x1e\xeey\xfd\xfc\x8b\xaf$\x0f\xbc\xfc\
-}I9\x9b\x8eU\xa4\xacu$\x05\xbbm\xdb\xb6\x92\
-\xf9\xa3F\x9f\x84\xbe}\xfb\xc0\xd3\xc3S\xe5\x15\xfds\
-\xcf\xdbZ\xca\xa7\xc9S~F%\xe5\x15\xe7\xd7\x0f?\
-L\xc6\x03\x0f>\x8c\xa0\x80@\x94\x95\x95b\xdcg\x13\
-\xe4^\x1d\xa0{\xf1\xda\xebo\xc9\xd0\xf4u\xd7\x5c\x8d\
-v\x14\xef\xc4\xafH\xb1\xa3{]PP\x88g\x9ey\
-A\xae\xe34\xba\x1f\xfcM\xfe\x193g\x89\xf2\xcc\xbd\
-\x7f\xfcY\xd5\xbf\xfe\x9aI\xe9\x5c\x83\x04*#\xde\xde\
-^X\xb3f-6n\xda\x22\xf3LS\xd33\xf0\xeb\
-\xaf\x7f\x90\x12\xfa\x1b:&u\xc4\x96\xcd\x9bEi\xe7\
-^I\xfex\x04+\x88g\x9fs\x86(\x8e\x9c\xffC\
-\x86\x0c\x92O\xbf\xf2x\xc8\xf1@\x0f\x017\x1a\xaa\xaa\
-H\xebs\xb7\xb8\xa1\xa2\xc2Jbut7\x8c[\x5c\
-\xdc\x92)+/\xc5\xa9'\x9f\x82 \x19\xfe\xd5\x15\x9f\
-\xa6\x85C\xcf\x22\xf7\xa3iMi4GAII)\
-X\xed\xf0\xf6\xf6\x96aU\x81\x9e\xbb\xa28p\xb9#\
-\xb34@\x5c\x1e\xc5\xfc\xcdt\xee5{\xee\x99'\x90\
-\xd0>AF~\x1ex\xf0\xbfx\x83\x94\x9f\xf2\xca\x0a\
-^\x16\x16!\xa1!x\xe7\xb5\xd7\xf0\xde\x1b\xaf#\xa2\
-U\xb8\xf4.\xf1p\xe5\xb7_\x7f\x87\x11#\x86\xe2\xa1\
-\xff<\x88\x1bo\xb8\x0e\xd7]{5\x92\xf7\x1f\xc0\xf6\
-m;\xa8\x0e\xf0A\xb9\xd5\x8a\xf3\xcf\x1f\x83\xd7\x9e\x7f\
-\x01\xe7\x9e}\x16) \xd7H\x9d\xd2\xabO/\xf2{\
--ZED\xd4\xea\x14P_{Rf\xfef\xbb\xad\
-\xca\x8a\xfb\x1f\xb8\x17\xef\xbf\xfb6.\xb8\xe0\x5c\xe4\xe7\
-\x15P}T\x8e\x15\xa4\xe8\x06\x04\xf8\xe3\xbft\xde\x87\
-\x1f\xfa\x0f\xee\xbc\xfbN\x19\x9e\xf4&\xe5b\xf9\xea\xd5\
-8@i\xe8\xdf\xbf\x9f\xf4Du\xed\xd2\x85\x94\x99b\
-\xacY\xbfN\xb2\xa0\xcaj\xc3\xa9\xa7\x9e\x8c\xff>\xf4\
- n\xbb\xe9F\x19\xa6\x5c\xb2l\xb9(+[\xb6o\
-\xc7\xa0\xc1\x83H\x01\xeb\x80\x1e={\x22?\xbf@\x86\
-0=\xbd=a#\x85\xee\xce;n\xc3\x1b\xaf\xbd\x82\
-'\x9exD\xe4x\xdb\xb6m\xa4\x90\xee\xc0\xd6\xed;\
-\xe4\xfa\xee\xb8\xf5\x16<\xf2\xdf\xff\xd05R\xa6\xd1\xb9\
-6o\xd9\x8aY\x7f\xcf\x93\xde\xb6n\xdd\xba\xa2k\xe7\
-.\xf0\xf3\xf1\xc1\xda\xb5\xeb\xa4\xe7\x90\xb7\x81\x03\xfa\xe1\
-\xb5W^\xc2]\xb7\xdeJy\xe6\x8d5\xeb\xd6\xa2S\
-\xa7N\xe8\x9c\x94$\xeb\xf1^Ky6j\xc4Ir\
-O\xcd\xcc\xe1[\xcb\xe7\xbf\xfc\xf2K\xf1\xc1;o\xe1\
-\xbe{\xee\x91\xe1\xdf3\xce<\x0d\x13\xc6\x7f\x8a{\xef\
-\xbe\x0b\xf6*\x1b\xf6\x93\x02\xb7p\xe1\x22R\xa4\x97\xe2\
-\xca+.\xc7\x95W]\x81\xb1c\x9fChH\x10\xe6\
-\xce\x99\x8bY\xf3\xe6`\x01\xb9\xdfp\xfd5\xb8\xfb\xce\
-\xdbp\xdb\xcd7I\xaf\xe1\xea\xd5\xab\xa4,yyz\
-\xa0\xd2ZIJ\xe2\x93t]\x0f!\xb6M,\xd9\xa9\
-o\xf6\x8b.\xea\xa8\xa64z\xe2\xf1\xc7\x1e\xc13\x8f\
-?\x81\x81\x83\x06\xca4\x01\x1e\x1eOOMGtd\
-\x14\x06\x0d\x1c\x84~\xa4ls\xfa\x07\x0f\x1a\x04?\xba\
-G\xe6\x88\xc8\xb1Fz\x005\x8d\x81\x1f\x1a\x90n`\
-\x1f_o\xd5\x1ad\x5c\x84\xf5Pp\xcb\x87\xe7\x0c\xfc\
-\xf2\xf3/\xb8\xf0\xc2\x0b\xf1\xc5\xc4/\xa9\xd5\xb5\xd5p\
-\xd5hZ.jn\x8dq\xa0\xd14#\x5c\xac\xc2\xc2\
-\xc3Dq\xe2\xf9~\x15\x95\x95\x5c\xe0D\xe13\x95>\
-\xd9I\x01\xe4\xcd\x80\x9e\xe9<\xb4x\xfai\xa7\xe1\xc3\
-\xf7\xde\xc1\x0b\xcf?C\x0aH\x22&\xff\xf4\xb3\x0c\xab\
-\xba\xc1\x22\xca\x86\xb7\x97\xa7($\xa6\x02 \xdf\x85\xa2\
-\xb0\xc1\xc1!\x08\xf0\xf7\x13;__?x\x92;?\
-\xff\xcdJ>\x84\x94\x0d\xeee\xe4z\x81\xe7\xd41<\
-T)\xf3\xe4hs\xc5\xec\x0d4q'M':*\
-\xcay\x0d\x0e\xae\x87\xc8\x0f\xf7\xb6\xf9x\xfb 44\
-T\x8e#h\xcf!\xb9\x97,\x85\x94\xbf*R\x06\x97\
-\xadX\x85\x0f?\xf9T\x86\xa2{\xf6\xe8\x8e\xc8V\x91\
-\x94\x22\x15?+\xbd\x9c\xba\xd0\x880\xb9\x9e\xd2\xb2R\
-\x99C\xc7\xf3\xf2\x16-Z\x82\x8f\xc7}\x86y\xf3\x16\
-\xa2w\x9f\xde\x14.B\x94KN[\xbb\xf88\x19F\
-\xf7\xf7\xf1\xa3\x5cQJ*\xcf\xff\xe3\xb9\x89\x1d\xda\xb7\
-\x97\x0c\x0e\x09\xa34\x19\xd9\xcbC\x91\x1c7\xcf}\xe4\
-!\xd6\xaf\xbf\xfb^z\x16;\x93B\xc8p\x9c\xadZ\
-\xb5\xa2t{ 00\x00\xde>^\x14\x85\x1bOq\
-4^V\x81\xeaMdC](lTT\xa4\x0c\xa7\
-\xfa\xf9\xfbR~xS\xfa\xe2%\x0d|M<\x83\xdf\
-\x9d\xe2\xe5\xbc\xe7\xf4s\xcf_\xb5\xdd\x86\x90\xa0 \x84\
-\x85\x85\xc9|G\xc6\x83\x94\xd5\xf0\xf0p\x09\xe7N\xda\
-\xbe\x7f@\x00\xacUv5W\x91b\xf1&E>\xc0\
-?@\xee\x15\xa7\x83\xd3\xc6H^\x92\x7fOR\x12\xfd\
-\xfd\xfcEy\xe7\x1eB\x1e6\xf7\xf6\xf1\x96!kV\
-@\x1fz\xf8\x11\xbc\xfe\xe6\xdbh\x1d\x1d\x8d\xc8\xc8H\
-\xe9\x91\xe6\xbf\xe3\x814\x81\x8e\xcf\xa9N<\x1c$k\
-\xdc\xaa\xe09\x942\x0f\x98n\xdc\x91\xe0\x02\xc2\xfe\x16\
--Y\x02_R\x1ey\xc2h\x87\x0e\x092O\x84\xe7\
-m\xd4[\x905\x9a\x16\x84\xee\x01\xd447f\x95:\
-d\xf0@R(\xc2\xb1b\xe5j\xcc\x9e;W\x94\x04\
-~\xd9a\xd6\xdf\x7f#\xbf\xa0\x00k\xd6\xad\xc3o\x7f\
-\xfc)s\xe0\xb8\xc2\xe7\x8d\x95\x83\x1d;w\xca\xd0%\
-\x0f\x15\x8f\x18>\x0c\xed\xda\xb5\x85\xb5\xd2*J\x02\xf7\
-\xd8\x19'\xa1\xe8\xdc\xa9\xa2\xb7\xc8\xc6\xca\x19+\x8eY\
-Y\xd92\x94\xc8~SR\x92%\xbe\xd6\xb1m\x9c/\
-d\xb02\xc4~\xb9^0\xab\x10\x0f#\xbcs>\xb9\
-K\xdd\xe2n\xcc\xd5g+>\x0f+0\xa24\xd0&\
-nD\x5c\x5c\xac\xf4Nfd\xf1\x0b \x0el\xdd\xb6\
-]\x14\x8f*\xaacbI\xc1\xe2\xb8G\x8e\x1c\x8e\xb1\
-\xcf?\x8b\x97\xc6>\x8f\x0f?x\x0f\xc3\x86\x0c\x968\
-,\xa4\x14\xa9\x17:l\xd8\xbcy\x0b);VD\x93\
-b\x12\x11\xd1J\x94!\xee\x1d|\x91\x94\xe0W_y\
-\x11\xef\xbf\xf3&\x06\x0d\x1a$\xd7\xa0\x94=\xae\x08I\
-y\xe4\xe4JZ\xdcD\xe9\xe4\x17%\xb7l\xdb&\xe9\
-NOM\x93\xb4p\xda9?\xb9\xc7+\xa1];<\
-\xfa\x7f\x0fa\xec\x8b\xcf\xe1\x9d\xb7\xde\xc0u\xd7^C\
-\xf1y\xc0\xc2\xdd\xab\x1c\x0b\xa5\x97\xe3\xe7\xfc\xe588\
-zVR\xf9\xc49\xb9\xd9\xe2G\x12a\xc2yA\x1b\
-+\xd1\x1c\x86\x157\xde\xcb\xcb9d\xcf\xca\x99\x9b1\
-\xe4/\xe9\xa34l\xa5\xf4\xb9\x93\xdd^R\x90\xf9\xfa\
-#\x22\x22Di\xe4Kb\x05\xd5f#\x05\xddZ\x89\
-\xf4\xb4tR\xe8|\x11\x14\x1cD\xa1\x1d\xcetp\x1a\
-9\x05\x16\xe3\xf9%\x0a&\xa7U\xaeA\xb9\xf35p\
-\x99*+-\xc3\x82\x85\x0b\xa9q\x10\x88\xeb\xe9Z\x9f\
-x\xec\xff\xf0\xe6\x9b\xaf\xa1M\x9b6\x12\xd6,\x1a\xc7\
-\x1a\xca\x15J\xcfq:\xd9\x09\x03\xdfe\xca4\x16|\
-7\xdas\x01\xa2\x92\xaa\x947\xba\xe1\x87\x85\xfcp\xb7\
-\xf7\xd8\xb1cq\xcdUW\x22\x92\x0a\xd9\x0b\xfc\xca\xf8\
-\xf6\x1d2Y\x97\x1f\x0e\x1aMK\x85\xe7\xbe\xf0C[\
-\xa3iV\xa4\x9esC+Rb\xfe\xf3\xe0\x03('\
-\x05\xef\xd1G\x9e\xc0\x90\x11\xa3p\xfa\x99\xe7\xe0\xf6[\
-o\xc7\x8e];\xf1\xfa\x9bo\xe2\x8e;\xef\x96\x17:\
-\xf81\xcf\x0aM\xa5\xd5\x8a\xc9?\xff\x82s\xcf\xbf\x08\
-\xa3N=\x03c\xce\xbf\x18\xf3\xe7\xcd\xc7\xc5\x17\x9d/\
-C\xa1\xa2\xf3T\xab\xba@U\x0e\xbcl\x8b\x0d\xfe\xa4\
-T\x5c}\xed\x95X\xb4h1n\xb8\xe56\xdcp\xdb\
-\xed\x98\xf0\xf9\x978\xf7\xbc\xb3\xd1\xa7G\x0f\xd8*\xcb\
-E\xa1beD\x85\xe2\xea\xc3]\xea\x93\x9f\x7f\x9e\x8a\
-s\xce\xbfP^z0{\x02E\x19\x14\x8f\xd5\xa2\xc8\
-\xf0'\x13\xf9\xbb\xd9\x5c\x89\xab\xf0\xac\x00\xd2/\x1d\x0c\
-\xee\xdf_\xe6\xa0=\xf8\x9f\x87q2\xa5\xf9\xa7\xa9\xbf\
-J\xef\x13\xf70\xb2\xa2\xc7=~\xef\xbe\xfb\x01\x9e~\
-\xfey<\xf7\xfcX\x5cx\xd1e\xd8FJ\x22\xf7 \
-r/\xe6\x1f\x7fM\xc3\xc9\xa7\x9c\x81\xd7^\x7f\x13\xd1\
-\xa4\xa4\x9dz\xf2h\x19\xc2\xed\xd1\xa3\xa7\x84\xfb\xbfG\
-\x1e\xc7\xf3\xcf\xbf\x88\xdb(\xaf\xb6l\xd9B\xe7\xe7I\
-P\xac\xecHV\x0b<\xca\xcb\x0bPw\xeb\xd6Ez\
-\xbb&O\xfe\x09'\x9f~\x96\xcc\x81d\x05\x90\xeb\xba\
-\xce\x9d;\xd3\xb9\xcf\x97\x97D\x1e|\xe8a\xbc\xf6\xe6\
-[\xb8\xfe\xa6[\xf1\xfd\x0f\x93\xe8ZTd\x9c'f\
-o)+T|\xc4=h\x89\x1d\xdbK>\xdcv\xfb\
-\xbdx\xe9\xe5WQTT\xe2\x5cF\x85\xf3\x80W\xa1\
-\xb1H}\xcc\xa1\xe9\x8f\x8c\xd2++\xf18H\xc9\xe6\
-4;p\xd2I\xc31x\xe0\x00|\xf2\xe9x\xdc~\
-\xe7=\x14\xdf]\x14\xc4\x0d\x17^x\x01N?\xf9T\
-y\xf1g\xdc\xb8\xf1t\xadw\xe1\xba\x1bo\x95\xb5\x14\
-o\xbd\xed\x16\x99K\xc8O*\xd1\xef\x8c\x8b\xe6\x1d\xe5\
-\x82\x98Y\x1d\xe0\x1f\xce\x07V\xb8\xf9\xd4bG\xf0}\
-\x0b\x09\x0d\x95\xb7\xa2\xf9\xe5\x97w\xde\xff\x10\xb7\xdcv\
-\x07~\xfd\xf5W\xca\x17\xd5\x93x<\xb0\x9c9\xe6\xbc\
-gC\x83\x82\xd1Q\xbf\x05\xdcp\xd4]\x96\xf5\x9fz\
-\xf4\xec\x06__\x1f\xacZ\xb1\x1a]\xa90\xc7\xf1[\
-\xc0\x87\xcaC\xbe\xa9\xe4\xc6\xaf\x85wJ\xec$o\x9e\
-\xf1\xfc\x00\xee\xaaO\xec\xd8A\xe6l\xb4i\xddZ\xc2\
-\x1f2\x0e\x8d\xe6\x04\x86e\xa3\xb8\xacT\xbf\x05\xaci\
-v\xccg*\xbf\xc1\xd9\xb9s'$uJ\x84\x17)\
-\x12'\x0d\x1f\x8e\xeb\xae\xbf\x0e\xfd\xfa\xf6\x11eg\xf0\
-\xa0\x81\x180\xa0\xbf<\x979\x8c')+11\xd1\
-\x88m\xd3Z*r^\xde\xe3\xd2K.\xc6\xd5\xd4\x80\
-\xe7\xa1]~nw\xef\xd6\x15={\xf5\x94\xcf\x81\x06\
-\x07\x07\xa3\x7f\xbf~\xa2\x1c\xf2\xdc\xc1v\xed\xe2I\xe1\
-qG\x80\xaf\x1f.\xbb\xec\x12\x5cu\xc5\xe5\x88j\xd5\
-J\xe6\xb3\xf1\xb0#\x9f\x8f\xdf\x18\xe6\xf2\xces\xc3\xc3\
-#\xc2\xa5N\xe9\xd5\xab7\x86\x0d\x1d\xec\x1c>\xe4\xde\
-\xa3\xb0\xf0p\x0c\xe8\xdf\x0f]:u\x82\x9f\x9f\x1f\x12\
-;u\x94\xe3\xe0\xc0@\xf8\xf8\xf8\xa0CbG:w\
-_Dsz\xa9.\xe2\xf4\xf1|\xb9\x9bo\xba\x11\x83\
-\x06\xf4C\x9f^}\xe4\x05\x0aN/\xf7b\x16\xe4\xe5\
-#$8\x08\xa7\x9c2Z\xae9+'[\xde\x82\x1d\
-Ji\x1a<x\x90\x0cu_y\xc5e\x18JJ\xa3\
-?\x9d\xafg\xcf\xee\xd2kWi\xad\x92\x97\x15F\x8f\
-\x1a%o\xbb\xf2\x90)_\x0b\xa7\x85\x87\x9dY\x97\x88\
-\x8a\x89\xc1PJ\x7f\x02\xd9\xc7\xd3\x16\x1a\x16\x82\x88V\
-\x11\xb8\xe6\xaa+0\xea\xa4\x11\xe8\xdd\xab\x87\xbc\x0d\xcd\
-\xcahk\xf2\xcbC\xa5U\x95V\x0c'\x85k\xd8\xb0\
-!R\x17FF\xb6\xc2\xc0\x81\xfd\xd1.\xbe\xad\xf4\x22\
-\xf2\x90\xee@R\xd6\xb8\x9e\x0d\x8f\x88@Xh\x98\xe4\
-\xff\x90!C\x90D\xd7n\xe1\xa1]\xcaG\x1e\x86\xe6\
-\x97v\x06PX\xbe\xa7\xde\x94\xaf\xad\xa3c0\x90\xae\
-\x91\xcf\xc5\xf9\x1c\x1b\x17\x8b!\x83\x07\xcb\xcb$\xed\xa8\
-L\xf0PzaQ!\xfa\xf4\xee\x85+\xaf\xbc\x1c#\
-G\x0c\x97<\xedA\xe9\xe3\xfc\xac\xa0\xb4u =\xe9\
-\x86\x1b\xae\xc59g\x9e\x01\x7f:\xaf?\xe5/\xcf\xa1\
-\xecGy\xeeG\xf7\x97\xf1\x0f\x0c@?\xca\x93n]\
-\xbbJ^$R\x1e\xf2=\x09\x0a\x0a\x92a\xecn\xdd\
-\xbbP\xd9\xeb\x84\xbf\xe7\xccEeE\x85\x94\x09>\xc7\
-\xae]{\xb0|\xf9\x0a\x5cp\xe1\xf9\xf0\xa5\xb2w,\
-\x9f\x7f\xe6[\xc0n\xef\x8c\x1f\xe7\xe0\x87\xed\x99\xa3O\
-\x86\x97\xc5\x93Uc\xc3\x8b\xe6\x90\x18\x9a\xfd\xb3\xaf\xbf\
-J\x85<J\xe6~\xac^\xb2\x12\xd7^\x7f-\x06\xf6\
-\xe9\xab\xb4\xfd\xc3Aa\xa5\xe5\xc0\x1b\xdfdn\x19\x18\
-6Z\xf1\xd3\xb4D\xcc\x16\xef\xce\xbd\xbb\x91\x9a\x91\x8e\
-\xd1C\x86\x1f\xd3\x07\xa0\xa6\xe5\xc2e\x8dK\x1b\xcf\xb3\
-\xe35\xe6\xf8\xa5\x03V\x08\xd4\xb3\x98\x1b\xe9\xec\x896\
-\x97\xf2\xc7a\xb87\x8b_\x88`E\xcc\x97\xc2po\
-\x14\xfb\x91\x92K\xee\xe2\xdb\xf5\x98\xcd\x12\xce!\x8b\xfd\
-s\x8f]\x00)Ql/\xbdD\xf4\xcfn2}\xc8\
-\xa5\xde\xe5\xb5\xff\xca\xcb\xca\xe1\xe9\xed\x0d\x1f\x9eO\xc8\
-\xe7a\xc8\x1f\xa7\xdc\xac#\xf8<\x1c\xbf\xd46lG\
-\x16\xd5\xf4\xc7\xc3\x9d\x0c\xcf\x91\xe35\x08=-\x1e\xa2\
-\xe8\x9a\xa8\x1eC\xb56\x1f\xbf-\xcb\xca\x12+s|\
-=\xf3\x16-\xc4=\xf7>\x88\xab\xaf\xbc\x02\xf7\xdf\x7f\
-/\x1c\xf6j\x99Cg\xd6i|>\x9e\x07\xc8\xf1r\
-\x0f\x9d/]\x8f\x0csr\xda(\x09\xce\xb4\x91?N\
-\x9f\x0a\xc5s\xf6x\xf8\xd4Jy`\x17%\xd9\xf4g\
-\xee9\xad\x15\xe5\x15\xca\x9d\xe2\xe44\xa9k\xe2Xj\
-\xc7\xcb\x11s~\xa9\xb4\xd8\xe4\x1e\xfa\x93\xf2\xc5\xcb\xab\
-q\x9e\x9a\x88_\xe2\xa04\xb9\xc6Ef>b3\xf7\
-H\xf2\xfdeE\xd3\x93\xca\x83\x99\xafr\x1e#/y\
-H\x9f\x95s\xe5\xc4\xd7\xa5\xee\xbby\x0e\x13\xb1\xe7\xb8\
-\xe9\x9e\xd7\xcd\x17\xee\xa5\xe4\xc5\xab\xaf\xb9\xfe&)\x17\
-o\xbc\xfa\x0ar\xf2r\xf0\xd2\xcb\xaf#0 \x00\xdf\
-\x7f\xfb\x95\xacQ\xc9\xe7>V\xac\xdf\xba\x19\xd3\xe7\xce\
-\x96\xb2 \x09\xd4\x1c\x0d\x0e\x14\x97\x14K\xb7q\xff\x1e\
-=\xd0\xaeu\x1cN?\xedT\xf8\xb3\xd6N7\xf8\x88\
-\xd0\x8d\x15\xa11o0\xed\xb8\x9b\xbbn!\xd2hZ\
-\x0a\xfc\x186\xffX>\x1a E\x1aM\xa3\xe0\xe7,\
-?\x7f\xf9\xc5\x02\xee9s*\x7f\x04\x0f\x13K\x95n\
-\x1c\x9b\xb0;\xcfG\x0b\xf0\xf7W\xca\x1f+D\x86\x1f\
-\x09\xc1\x05\xd6y\xac6\xc6\x0c\xe7GJ\x0f\xf7\x00:\
-\x9f\xfb\x86\x07V2\x5c\x95?\x86{\xcfx\xfd9\x1f\
-\x9eZd\xc4)\xd4\x04\x13\xd8\xec\xeer^\xb6\x90\x0a\
-\xdd\x80\xe7\x11r\xaf\x1d\xbf]\xca\xe7\xe5s\x89\xf2\xc3\
-\xff\xb4\xf7\xa0t\x05\xd1yx\x0e\x1e\xdb\xb3r\xe2\xe3\
-\xe5\x8d61\xd1\xf2b\x877)\x9f\xae\xca\x1f#\xe1\
-<,\xd2\xeb\xc6=\x90\xec&\xd7C\xd7Psf\xe5\
-\xcfT\xa0$]\xe4\x8f{\xe1X\xf9\x93\xf9x\xa2{\
-\xd5\x84\xe0\xb4\xfa\xf9Q\x1e\x91\xe2\xc3=\xae\xec\xc6\xae\
-\xea\x89P\xe3O\xec\x8c\xfcb?\xdc\xe3\xc7J\x93\x85\
-\xd2\xe4\xe2M\x90s\xd4\x09+\xd7o\xa0\xdc\x0d3\xc7\
-E\xe7\x0d\xa4\xeb\xe2\x17DT>)Wvc\x85\x94\
-\xef=+\x87\x926\xc3\x8d\xf3\xbb&\xc6\x1a\xe4\xbe\x8a\
-\xa1\xb6;\x1fqo.\xf7\xea^u\xe5\xe5\x08\x0a\x0a\
-\xc6\xa3O<\x85\xd7_\x7f\x1b\xed\xdb\xb5\xc3{\xef\xbe\
-%\xd7c\x84>\xe6\xe8\x1e\xc0F\xc0\x82\xc2\x9bZ\xb9\
-;\x03e%eh\xd3\xa6\xb5tK\xfb\x92\xb0\x99\x05\
-G\xa3\xd14\x0c\x96'\x86\xd7/K\xcd\xd2=\x80\x1a\
-\xcdq\x87d\xb0\xac\xa2\x5c\x16~\x8ej\x15)o\xb6\
-\x0aZ\x0c\x8f\x09\xdc\xe3(_\x12\xc9\xcf\x97\x1e\xc7\x88\
-\xf00\xd5;\xca\x8e\xc7\xf8\xd9W\xd3\x03\xa89jX\
-\xfb\xe7\x16\x0d\xcf_\xe8\x92\xd4\x19\x9d\x92\x12e=%\
-~cHWZ\x1aM\x13 \xf1\xe1\xa12\x8dFs\
-\x9c\xa1\xba\xcb\xcf\xc7\x0f\xed\xdb\xb6\x93\xde.\xd1Dt\
-uv\xcc\xe0\x9e\xde\x90\x90\x10\xd1\x1dX\x97P\xca\x1f\
-e\xf8q\xd4!\xa4\xc7X\x0f\x017\x0e\xee~\xb7\xf0\
-\x12\x00\xf4\xcf]\xc6:\x1b5\x9a\xc6!C#\xfcG\
-r\xc4o\xc8i4\x9a\x7f\x00\xae\xcex\xc8Wwd\
-\x1c{8\xafYo\xa0M\xf4\x07\xce\xf3\xe3\x9c\xed\xb2\
-p\x8d\xcc_\xd04\x0a\x19\xb9\xd2\xf9\xa7\xd14\x0b\xe6\
-b\xaa\x1a\x8dF\xa39\xb6\xe8\xa6v\x13\x91\xaa\x8a\x17\
-\x1c\xd2h4\x8d\x86\xdf\xcf\x93w\xf4\xf4\x1cd\x8dF\
-\xa39.\xe8!\xe0&\x22Y\xe7\xa6\xf5h\x8d\xa69\
-ps\xb8\xeb\x1e@\x8dF\xa39\x0e\xe8!\xe0\xa6\xa2\
-\xc7\x805\x9afA$\x89\x1eF2\x17F\xa3\xd1h\
-4\xc7\x14\xddu\xa5\xd1h\xfeq\x8cW@\x8c#\x8d\
-F\xa3\xd1\x1ck\xf4\x10pS\x91\xde\x0a\x9d\x81\x1aM\
-S\x90\xf9\x7f\xb4\xf1h\x84\x1e\x02\xd6h4\x9ac\x8f\
-\x1e\x02n*z\x08X\xa3i6X\x11t\xfd\xf2\x80\
-Fs\xe2\xe3R\x7f\x90Q\x1a@f\xb5\xe2tr\x1a\
-4\x9afC?i\x9b\x8a\xee\x01\xd4h4\x1aM\x93\
-9\x84\x92'\x0b\xa3\xeb:F\xd3\xfc\xe8!`\x8dF\
-\xf3\xaf\x81\xe7\x01VW\xebe\x954-\x09\xfe\x9a\xb0\
-\x03U6\x1b\x92\xd3R\xb0y\xf5\x12l\x5c4\x0d{\
-v\xacGfN&\xacUV\xaa\xa4u\x0f\xa0\xa6\xf9\
-\xd1C\xc0ME\x0f\x01k4\xcd\x06\x0f\x7f\xe9\xb7\x80\
-5-\x0a*\xf3\x8ej;\xf6%\xef\xc3\xd6\xb9\xbf#\
-\xfd\xad\xbbQ\xfa\xf2MH\xff\xe2\x05|5\xf1Sl\
-\xda\xbaY5\x8a\xcc\xa1\xe1\x06\xc0r$\x8b\xaa\x9b\xe1\
-\x8e\x06\x0ek\x84\x91x\x8e6\xfc?\x88kze\xcf\
-F\xde5\xf6\x1a$\x8eF\x86\xfd\x1f@\x0f\x017\x15\
-=\x04\xac\xd1h4\x9aF\xc2\xcaIe\x95\x0d+g\
-\xfd\x86\xb09_\xe0$dcP\x98\x07\x12\xd3\xd6#\
-s\xd1,,\x5c\xba\x14\xa9\x19\xe9\x86\xef\xa3\x80\xeb\xa6\
-F4\xa6\xb8'2//\x1fv\xbb\xdd\xb0\xf9w\xa0\
-\x94Y\xe3\xa0.\x94\x87\x9c\x8fE\xc5E(-+\x83\
-\x8d\xd2\x9e\x9b\x97G\xd7RexP\xb0\x1f\x89\xa7\x81\
-\x14\x17\x97\xa0\xa4\xacT\x9d\xf7\x04\xd4\x03\xf5\x10\xb0F\
-\xa3\xf9\xf7\xc0\xcf\xa3\x13\xb8\xc5\xad\xd1\xd4\x85K\xbb\x8d\
-\x94\xae\xfd\xfb\x92\x11]\x96\x85\xf2\xcaj$\x17V\xc2\
-\xbb\xaa\x0a\xdd\x83\xec\x18\xd4\xa7\x0bV\xae_\x8b\xe5\xab\
-V`\xc5\x9a\xe5(\xaf(W\x01\xeb\x83#\xabv`\
-\xd9\xf2\xe5x\xee\x85\x17\xf1\xd2+\xaf\xe2\xcf\x19\xd3\x91\
-\x99\x95e\xc8\x95\xd9Cv\xb0\x8c\xb1=\xf74\xae\xdf\
-\xb8\x11\x97\x5cv9\xd2\xd3\xd3\xf1\xd7\xf4\x19\xf8e\xea\
-o\xa8\xa2\xb4\x88\xf2T+\x8e\xfa1\xdd\xea\xf3So\
-\xa8\xba\xfe\xe8X\xcee\x98\x19;\xa5+/?_\x86\
-\xc3k\xc7\xaf6v\xb7Z\xadx\xe8\xa1\x87\xf1\xe1\x07\
-\x1fb\xf7\xee\xdd8\xe7\x9cs\xb1\x81\xae\xe5@j2\
-~\xfb\xe3\x0fT\x94\x97S\xdeU\xa0\xb4\xb4\xcc\x19\x07\
-#f\x97cA\xe6]\x82\xf2p,>\xf8\xe0cR\
-\x86m|\xd5\x07\xf9\xabIC\x0d\xb5\xd3W\x03\x1f\x9b\
-\x9b\x13W\xbf\xb5\xbd+7s;F\xe8!\xe0\xa6\x22\
-7Gg\xa0F\xd3\x1c\xb8\xb9Q\x9bT\x0f\x01kZ\
-\x18\x5c\xe4\xe3\x1d\xa5\xf0\xa4\xaa\xa4\xc8j\x97\x86\x90G\
-u\x15\xfcI\x19\xac\xaa\xf2D\xbf\xee=1\xe1\xcb\xaf\
-\xf1\xc2\xf3\xaf 77\xef0J\x01)qT\xa1\xbf\
-\xf3\xee\xfb\xf0\xf6\xf6FBB;|\xff\xdd\x8fx\xea\
-\xe9gPTTD\xc1j\x94\x10sS\xc1j\xcc\xbc\
-//+\x97Zm\xfb\xb6\xed\xd8\x9f\x9cLv\xdck\
-V'\x9c\xe1\xbf\x16.\xee\xae~\x5c\xed\xc4\xde\xa4\x1e\
-{\xd7\xe3j\xb6\xa3\x8d\xd3\xfe\xd2k\xafc\xcf\xde\xbd\
-\xa2\xa4\xba\xfa17\xa6\xb2\xb2\x92\x94D\x9b\xf8))\
-)!\xc5\xda\x8e\xec\xacll\x22E\xb0\x8c\x14\xe7y\
-\xf3\xe7c\xf2\xcf?\xa3\xda~\xe88\x5c\xb1\xda\xaaP\
-I\x8a%\xb9\xd6\xf81\xfc\xb9\x86\x13\xfb\xfa\xec\x5c\xa2\
-\xacm\xaf\xdc\x5c\xed\x94\xfd\xc1v\xa6\xfd\xb1\xc0r\xe6\
-\x98\xf3\x9e\x0d\x0d\x0eF\xc7\x84\x04X\xdc-\xaa$j\
-\x1a\x06\xdd\x94J) \x95\x08\xf4\x0fP\x15\x97\xce?\
-\x8d\xa6\xd1\xf0\xb0Mqi\x09\x12\xe2\xe2\xb5,iZ\
-\x04<$i\xad\xaa\xc2\x9c\x85\xf3\xd1!w\x1b\x82,\
-\x0eTX\xab\xe1\xe3\xeb\x83e\xe5\xbe\xa8h\xdb\x05\xf9\
-y\xf98\xe3\xd4Sp\xea)\xa7 >.\x0e\x1e\x1e\
-\x1eF\xe8\xfap\xc3\x8f\x93\x7f\xc2\xe5\x97]\x82\xd3\xd8\
-\x7f\xdb8L\x18\xff\x05N?\xfd4\xd8\xaa\xecx\xed\
-\x8d7\xf0\xdb\xef\x7f\xc2f\xb7!\xb1cG\x09\xc1\xbd\
-g\x1f\x8f\xfb\x143f\xce\x12\xa5k\xc5\x8aU\xb8\x8c\
-\xc2\xb3\xf2\x11\x11\x11\x8eN\x89\x89R\xbf\xb1\xfbG\x9f\
-|\x8au\x1b6\xa0w\xef\x9e\xf0\xf6\xf4\x96\xf0f\xcf\
-\xbd\x95\x14\xb0\xcf\xc6O\xc07\xdf~\x8f\x82\xc2B\x89\
-\x9fT\x18\xfc\xfa\xfb\x1f(%\xb9\x9e:\xf57\xa9/\
-c\xdb\xb4\x91\xf8Xa\xfb\xfe\xc7I\x988\xf1K\x19\
-\xb6\x8d\x8b\x8b\xc5\xe2\xa5K\xf0\xf1\xc7\x9f`\xde\x82\x85\
-\x88i\x1dM\xf6\xd5x\xef\xbd\xf71\xf5\xd7?\x90\x96\
-\x9a\x8aN\x9d:!((\x10\xf3\x17-\xc2'\x1f\x7f\
-\x8a\xed;w\x92]GQx\x7f\xfd\xf57D\x84\x87\
-\xa1k\xb7\xae\x98<y\x0a.\xbc\xe0\x02\x04\x04\x05\xc8\
-u\xfb\xf9\xf9\xe1\xedw\xde\xc3\xe2\xc5\xcb\x90\x9c\x9a\x8c\
-\xf6\x09\xed\xe1\xee\xee\x86\x1f&M\xc6\x17_|\x09/\
-//$\xb4kG\x97b<w(}\x7f\xfe5\x1d\
->~>HNI\xc5W_\x7f\x83\xf0V\x11\x88\x89\
-\x8e\x16\xe7\x94\xb4TL\xf8\xfc\x0b\xfc\xf0\xc3\x8f\x88\x89\
-\x89ATd$\x8aI\xe9\xfc\xea\x9bo0\x91\x94\xf5\
-\x9c\xdc\x5ctIJ\x82\xc5Bz\x15\xb1l\xc5\x0a\xbc\
-\xfb\xde\x07X\xb8h1:&\xb6G`@ \xd6\xae\
-[/i\xda\xb8a\x13\xda\xb4\x89A``\x00)\xb9\
-\xfb\xb0i\xcbf\xc9c\x8e\x9f\x1b\xc5q\xb1\xb1p\xb7\
-4_\xe383'\x1b\xbb\xf6\xed\xd1C\xc0ME\xdd\
-\x10\x9d\x81\x1aMs\xc0\xf2$-^\x8d\xa6\x85\xc0\x0a\
-\x17\x0f\x01\xb7I\xea\x8cT\xbf(\xf8\xf8\xf8\xa1UH\
- \xcaIq\xd8VR\x85\xec\x9c\x1c\x8c\x18>\x02\xdd\
-\xbbuG\xd7\xae]E\xd19\x22\x14gqQ\x112\
-32\xb1\x8e\x94\x8c\xf8\xb6\xb1\x08\x0e\x0a\xc6\x9a\xb5k\
-\x11\x14\x1c\x8c\x84\xf6\x09x\xf4\xd1\xc7\xb0p\xf1b\x14\
-\x92\xa2\xf6\xe0C\x0fc\xf6\xdfs\x11\x12\x1c\x84q\xe3\
-\xc6\x8b\x82\xc9\x9d~s\xe7\xcc\xc3\xacY\xb3\xa5Gm\
-\xe2W_\xe3\x8d7\xdf@RR'\xec\xde\xbd\x07\xf7\
-\xde\xff r\xf2r\x95\xbcV;\x90\x9f_\x80\xff\xfc\
-\xf7\xff\xb0b\xe5jt\xeb\xde\x0d_N\x9c\x88w?\
-\xf8\x00\x15\xa4\xe4M\x9b>\x13\x8f?\xf94\xe6\xce_\
-\x80\x8a\x8aJ\xe9<\xe1k~\xf5\xb5\xd71~\xfc\xe7\
-\xe8\xd2\xb5\x0b\xb2\xb2\xb2PJ\x0a\xd4\xce\x1d\xac\xd0u\
-BEy\x19\x9e}\xe6Y\xe4Q\xa3\xd0\xdb\xcb\x1b\x9e\
-\x94\x1f>~\xbe\xac\x97a\xd6\xec\xbf\xf1\xf6[\xef\xa2\
-CbG\xac_\xbfA\x94\xa8B\xba^\xceK~\x86\
-\xa8\xe7H5\x1dWc\xe7\xce]\xf8\xfe\x87\xc9\xa2@\
-\xf9\xfb\x07\xc0\xc7\xdb\x93\x94k_QL_\x7f\xf3-\
-,\x98?\x1f\xfd\xfa\xf7\xa3k{\x07\xd3g\xce\xa4t\
-\xa9y\x83|]\xbe\xfe~\xf8\xf3\x8f\xbf\xb0\x7f\xef^\
-\xf8\x92\x22x\xd7\x9dw\x89\x9f\x92\xd2R<\xf2\xe8\x13\
-8\x90\x9c\x82Nt\xdf\x1ez\xf8Q\xac[\xbf\x1e[\
-\xb7l\xc5\x1e\xca\x9baC\x87\xe0[R\x04?\x9b0\
-A\xe2\xfb\xf6\xfb\xef\xf1\xd8#\x8f!:&Z\xd2V\
-PPH\x0a\xedo\xb8\xf7\x81\xff\xa0mB;\xa4\xa6\
-\xa5\xe0\xdak\xaf\xc7\xde}\xfb\xa4\x97\xf3?\x0f=\x82\
-I\x93\xa6\x90_w\xdc\xff\xe0C\x98=w.\xdd\x0f\
-\xa37\xb0\x19\xd1C\xc0MEn\x88\xce@\x8d\xa6\xa9\
-\x88$\xd1\xc3]/\x04\xadi\x11p\xddA\xdb\xea\xf5\
-k0\xfe\xf3\x89\xd8\x9bY\x88e\x9dF\xe0\x87|O\
-L\xcd\xb6\xe1\xdb\xeax\x14\xb7IB\x9f\x9e}Hy\
-\x0b\x12\xc5\xc1\xd2\x00\xd9`\xa5\xc7\xdb\xd3\x82\x0f>\xfc\
-\x18\xff\xf7\xd8c\xf8\xea\xeb\xef\xf0\xf2\xcb/#:*\
-\x0ag\x9fu&\x06\x0d\x18 #V\x81A\xa1\xd8\xbf\
-\x7f\xbf\xf46m\xda\xb4\x09\x13>\xfb\x04\xf7\xdc}7\
-\x1e\xb8\xff\x1eTV\x94\xc3\x83\x14.7\xda<<<\
-\x91\x9e\x91\x8e)?\xfd\x82\xb7\xdf~\x0b\xb7\xddr\x13\
-\xdez\xe3Ul\xdd\xbc\x05?\xfd\xfc\x8b(R|\xce\
-E\x8b\x97H\x8f\xd6\xab/\xbf\x88[o\xba\x01\xef\xbe\
-\xf7\x0e)9\xbf##3\x13!\x94~\x1f\x1f_|\
-\xfb\xe5\xe78\xfd\xd4S\xe4:XA+\x22\xe530\
-(\x00\x83\x06\x0e\xc4\xb5W_\x8d\x88\xf0\x08\x8c\x193\
-Fz\x02\xe3\xe2\xe2\x90\x91\x95\x8b\x9c\xec\x1c\xdcv\xeb\
-\xcdh\xdb.\x1e7\xdfp\x03b\xdb\xc4\xe2\xdb\xef\xbe\
-\xc7)'\x8fD\xd7\xceI8\xf5\xd4\xd1\xd8\xb0q\x13\
-RRR\xe4\xfaYI\xe2\xcdT\x04\xdd\xdc\xdd\xe0E\
-J_|l,\x86\x0f\x1b\x84A\x83\x07\xe3\xe1\x07\x1f\
-\x90\xe7\xcc\xbcy\x0bp\xc1\x85\xe7\xa3C\x87\x04\x8c\x1c\
-9\x02?\xff2U\x94\xbbj\xba&\x0e[E\xca\xeb\
-\xa0\x01\xfd\xf0\x7f\x0f?\x84\xb1\xcf?\x87\x81C\x86`\
-\xc6\x8c\x99\xf8\xf5\xf7\xdfe\x88\xf9\x92\x8b.D\xef^\
-=(\x8f,\xd2\xab:p\xe0\x00\x5c}\xd5U\xa40\
-;\x10J\xd7\xf2\xc3\xe4\x9f\x90\x9c\x92\x86_)\x1f\x9e\
-x\xe2q<\xf4\xc0\xfdx\xfe\xd9\xa7\x11\xdb:\x16\xdf\
-\x91Rx\xc5\xa5\x17\xe3\x96\x1b\xaf\xc7S\xe4\xd6&\xb6\
-5)\xe1\x7fK\xcf,\xf7\xba>\xfb\xcc\xd3\xb4=I\
-\xd7y22\xb32\xe5\x9a\xb8\xbc4'\xfaI\xab\xd1\
-h\xfe\x15H?z3?\xe04\x9a\x7f+\xd2\xe0\xa1\
-m\xe9\xd2%\xd8H\x0a\xcc\x9c\xd9s\xb1a[\x0e\xe6\
-\x06\xf5\xc4\xac\xe0>X\xef\x9d\x80\xd4\x9cR\xe5\xd7P\
-h\x1a\x82;\xf9\xb3\xda\xabq\xcd5W\xe1\xfe\xfb\xee\
-\x15ej\xde\xdcy\xb0W\xdb1y\xcaO\xf8\xf0\xe3\
-q\xc8\xcd\xc9EXH0\xf9vCJr*|}\
-}\x11\x14\x18(\xbdr\xb1\xa4(Y\xdc=\xa4\xd7\x8f\
-a\xbb\xd4\xb4tQx\x12\xda\xb6\x15{\x7f?\x7f\xb4\
-\x89\x8f\xc7\xee\xdd<'\x8f\x14@\xf2\xb7k\xf7n\xb4\
-i\xd3\x06>\xde>\xf2\x061\x0f\xf3\xf2\x90\xf0\x9e=\
-{\xe5\xcd\xe2\xee\xdd\xba\xc2\xd3\xd3K)2\x94F\xee\
-e\xbc\xf5\xb6\xdb\x10\x19\x19\x89\xa7\x9f~\x0e\xbfL\x9d\
-\x8a\xfc\xc2\x02\xbc\xff\xc1G\x98D\xe9\xe4\xe1II#\
-\xf9\xe7\xf8x\xde\x1e\xefy\xdb\xb3o\x1f\x16.\x5c\x8c\
-\xcf&|\x8e\xdf\xff\x9c\x86\x00\x7f\x7f\xba\x06\x1fIo\
-}p\x1a\xdd\xb8\xbf\x8bN\xcd\xe9\xe7\x9e\xc2\xbd{\xf7\
-!%5\x8d\xce\xf53>\xfdl\x02\xd6\xad[\x87\xb6\
-\xf1q\xe2f\xc2~[\x93\xc2\xc9=q|\xde\xae]\
-:\x8bR\xb8s\xc7.Ql?\x1d?\x81\xd2\xf0\x05\
-\xbc\xbd\xbdT>\xcf_\x80\xa7\x9fy\x06\xbbv\xedB\
-p`0]\xbf\x15\xe9\xe9i\xf26q\xf7\xee\xdd\xe5\
-\xda\xf9\x85\x12\x9b\xbcT\x03tLL\x14E;\x90\x14\
-\xe4\xe8\x986\xd8\xb1s\x0f\xecU6\xb4k\x17G\xd7\
-\x1e\x22=\x9f\xd1\x91\x11\x94\xf6c3\xca\xa8\x87\x80\x9b\
-\x8a\x08\xa5\xce@\x8d\xa6yPo\x22j4-\x85\x8e\
-\xed;\xc1\xcb\xd3\x13\x89\x9d\x92\x10\xe9\xef\x81\xf8\x9c\x8d\
-\x88-\xd8\x8e0k\x11\xbc\xbc<\xa4z\xe1\xa5\xa2\x1b\
-\x0e/\xa6\xee@\xdb\xb88\x0c\xec\xdf\x1fW_y\x05\
-~\xf8\xfe{\x19^\xfcd\xdc\xa7x\xe3\xb5\x97q\xeb\
-\xad7!\xa1};TUY\xd1\xb6m\xbc\xbc\xf4\x91\
-\x9b\x9b+JNjZ\x1a)\x8bUJ\xe1$-\x85\
-\x95\x9f\xd86\xad\xe1\xe3\xe3\x83-[\xb7\xcbK\x16\xd9\
-\xd9\xd9\xd8\xbf\xff\x00\xfa\xf6\xe9%\xf3\xe8X\xe9\xec\xdc\
-)\x11\xbb\xf6\xec\x91\xb9o\xfc\xf2\xc5\x96-[\x11H\
-Je\xaf\x1e\xdd\xc9\x1d\xf0\xf4\xf6\xac\xa9*i\xef\xee\
-nAB\xbb\xb6x\xe3\xd5Wp\xe5\x15\x97\xe1\xcf\x19\
-3\xb0z\xedZl\xdb\xba\x05\xcf>\xfd\x14.\xba\xe8\
-\x02\xf8\xd29Yi\xe2\xab\xe7\xf3TS\xfa8]\xed\
-\x13\xda\xe1\xbcs\xcf\xc1\xab/\xbf\x84\xb7^}\x15\x1f\
-\xbc\xfb\x0e)om\xa5W\xcfM\xdee0NB\xca\
-\x8d\xb3\xe7\x8c\x0f\xc9\xb6\xbc\xbc\x5c\xe6\x1e\xf2\x0b2\xac\
-\xf0=\xf2\xd0Cx\xfd\xe5W\xf0\xfe\xbbo\xe3\x81\xfb\
-\xefC()^\x1c\x8fy\xde\xcc\xcc,\xf5r\x89\xb5\
-J\xe6\xea\xf9\xf9\xf9\xa0K\x97$\xb4i\xdd\x06/<\
-\xf3\x14^{y,&|\xf6).\xbe\xe8||\xfa\
-\xe98\xf4\xed?\x00\xf7\xdc}'z\xf5\xeeN\x1a\xa4\
-]\xe6\x07\xfa\xf9\xf9b')\x85<\xff\x91\xf3\x86{\
-%++*dx\xba\xbc\xa2\x12Y\x94\x9f)\xc9)\
-\x180\xa0\x9f\x0cU\xab\x0b\xe6K\xa0k\xe6\x84\xf3\xbd\
-8\x06C\xb5\xea%\x90 \xfd\x12H\xa3\xa0\xfbQI\
-\x02\xa4_\x02\xd1h\x9a\x0e?\xde\xf2\x0a\xf2\xf5K \
-\x9a\x16\x01\xd7\x17\x5c\xc4\xf9E\x89\xb3\xcf>\x13\x1e\x9e\
-\x0e\x0c\xc9Z\x81\xf3Kw\xe1\x14\x7f+\xba\xfb\x96a\
-\x9b[\x18\xbc\xc2\x22\xd1\x8e\x94\x15_\x1f_g\xb8\xc3\
-\xc1\xceS\xa6\xfc\x84a\xc3\x86J\x8f\x1c+2S~\
-\xfe\x05\x83\x06\x0e@n~\x01\x96-_\x81m\xdb\xb7\
-c\xe9\xd2\xe5\xe8\xd5\xb3\x07\x86\x0e\x19\x8cm;\xb6c\
-\xeao\x7f`\xe7\xee]\xd8\xb7w\x1f\x0a\x8bJp\xd6\
-Yg\xc8\x90.+^c\xc6\x9c#\xe7\xfd\xf8\x93O\
-\xb1g\xcfn\xcc\x9c5\x1b\xdd\xbav\xc5\xd5W\x5c!\
-\xca\x0d\xa7($,\x14\xa5\xa5\xa5\x98=\xfbo\xe9M\
-\xfb\xe9\xa7_p\xeey\xe7\xc8\xd0\xea\x9c\xf9\x0bd\xee\
-\xe2\xc8\x11#\xd4u\xd3\x9f\x8d\x94\xa3\xbf\xfe\xfcK^\
-\x10\xd9\xb0i\x93\x0cQ\x0f\x194\x10\xd3g\xfe\x8d=\
-{wc\xef\xfe\xfd\xd8\xb8i3F\x8d:\x09mH\
-\x99\x9d;w\x1e\xb6l\xdb\x86\xee\xdd\xbb!&:\x8a\
-\xd2\xfb\xbb\xf4:\xae^\xb3F^baen\xfa\xcc\
-Y\x88\x8c\x88@R\x97.\xf8\xed\xd7\xdf\xe5\xfce\xa4\
-\xdc\xf2\xdc\xbc1c\xce\x15\x1d\x87\xe72f\x92\xc2\xd5\
-\xa7W/\x94\x922\xf8\xfb\x1f\x7fb\xc7\xce\x9d\xb2\xfc\
-MdD+y\x99\x83u-\x1e\x8a\x9d6m\x86,\
-=\xb3q\xf3&,\x5c\xb8Hz<\xef\xb8\xfdv\xc9\
-\xb3\xb9s\xe6`\xc5\xaa\x15\xd8\xbam\x07\xb6l\xde\x82\
-\xc4\xc4\x0e\xc8\xca\xc9\xc5\xc2\x05\x8b\x90\x9a\x9eJ\xf9\xbc\
-\x12%\xa5e\xb8\xe9\xc6\xeb\xe5\xe1\xf6\xc9'\x9f`\x1f\
-)\xcdK\x96.C\xfb\xf6\x09\x88\x8b\x8d\xc3\xcc\xd9\xb3\
-e\x08~\x0e]\x1b+\xda7\x93_\x8e\x83\x15\xc3\xd1\
-\xa3FJ\xaf\xe6\xe2%K\x10BJi\xcf\x1e=T\
-\xde\x1d\xe1\xfe7\x04\xf3%\x10\xb7w\xc6\x8fs\xf0\xc3\
-\xf6\xcc\xd1'\xc3\xcbB\x1a:\xab\xea\x9a\x86A\xad\xac\
-\x92\x8a2\x99|\x1a\x13\x19%\xad \xba;\x86\xa3F\
-\xa3i(fk\x9b+\xa0\xb4\xac\x0c\x8c\x1e2\x5c\xcb\
-\x92\xa6E\xc0=\xdeee\xa5\xf8\xec\xad\xe7p\xc9\xd6\
-)\x08\xb7YQI\x1a\x88\xc5\xc3\x82\x17\xb2#\xd0\xf9\
-\xda\x07\xd0\xbam\x1b\xf4\xee\xdcC:\xb2Z\x91\x82\xe3\
-y\xd8\xb7\x80\x1dX\xb1r%:v\xe8\x88\xd0\xd0\x10\
-\xe9\x0d\xe4\xe5O\xf8\x98{\xb6\x96\xadX\x8e\x90\xe0`\
-\xe9\x9dc\xf7\xa4\xc4$\xe9\x81\xe2\xb5\x03y^^\x0f\
-R4\xb8\xd7\xab')Z\xdck\xc8t\xeb\xd6M^\
-\xe6X\xb9r\x15\xd2\xd3\xd2\x10\x18\x14\x88\x11\xa4\xcc\xf1\
-\xd0\xab\xa9\x90\xb0\x0c\x97\x95\x95\xc9[\xae\x85E\x85\xa4\
-\xa4\xc5\xa0o\xdf>\xf0'\x05q\x13)H\x16\x8b;\
-\xbat\xee\xa2\xfc\xd3u\xf0\xbc\xc1\x8d\xa4t\xed e\
-\xc7\xdb\xcb\x13=z\xf6D\x9b\x98\x18Q\xe8\x0e\x1cH\
-\x16\xa5\x97\xc3\xc4\x93~\x12A\xd7\xbc\x85\x14\xa5\xad[\
-\xb7c\xc4I\xc3\x11\x12\x14\xac\xe6\xfd%'\xcb\xf0s\
-bbGt\xee\x9c\x84\x0d\xeb7\xcaPvkR|\
-W\xacX\x81\xbe}\xfaH\x07\xcd\x81\x03\x07\xd0\xaf_\
-?I'\xe7Eqq\x11N\x1aq\x12)\xdd\x1er\
-M\xdck\xc9\xe9\xec\xd3\xbb/\xda\xb4n-\xfe8}\
-\xfc\xd2\x0c\x9f{\xeb\xd6\xad\x12\xa6g\x8f^\x94_\xea\
-\x8dh~\x0b\x98\xdd\xcb\xcb+d\x8e\xe6\xe0\xc1\x83\xe4\
-M\xe6e\xcb\x96\xc2n\xafF$\xe9\x04\xfc\x22\xcb\xb0\
-a\xc3d\x18}\xcd\x9a\xb5\xd2\xbb\xea\xe5\xe5MvC\
-\xe4\x1el#\x85v\xc7\xce\x1d\xf0\xf3\xf5Cw\xca\xf7\
-\xd8\x98\xd6\xc8\xca\xcd\x91<\xe6\x17~\xf8\xcd\xe4\xed;\
-vH\xdaxN\xa4<$\x9b\xe1\xb9\xb8~\xebfL\
-\x9f;\x9b\x14\xc0\x09\xe3\x1c\xed(\x83\xcf\x1a\xa5\x15\xc0\
-\xa3\x86\x15\xc0\xf2R\x14R\xc1P\x0a\xa0\xbb\xae\xb44\
-\x9aF \xc34\xc4Nj\xf9\xa7ff`\xd4\xe0a\
-\xce\x8aE\xa39\x91a\x05\x90\x17w\x9e\xf3\xcaC\x18\
-\xba\xe3OT\x96W\xc2\x93\xca\xbe\xbf\x9f\x17&\x95\xc7\
- \xfe\xbeW\xe4\xad\xda\xf7?\xfc\x08\x0b\xe7/\xc4\xf8\
-\x09\x9f!1\xa1\x83\x0a|\x94\x22\xc2\xe7r*l\xb4\
-\x97\xb7@)\x12V\xfc\xb8\x07\xca\x94\xc3\xfad\x8f\xdd\
-\xb8g\x8c\xa7\x8c\xb1;\xc7\xc5\x0a\xa5+\xe2\x87\xdc\x9c\
-\xf1\xf0\xee\x08:\x85\x841\xf7\x1c\x1f\xed\xe5\x8f\xc2\xba\
-v\xaa8\xe3t\x89\xdf\xa4\xbe\xf4\xd6\x0b\xd5\xd9\x9c\x1e\
-9\x97\x19F\xceGq\xb0\xb9\xbex(\x8c9M\x8e\
-\xc3\x99\xd7,\xd7\xcfyF\x7ff\x5c\x12/\xefis\
-\x8dO\xec\xc9R\xf2\x8e]\xe8_\xae\xc1\xe9Q\x1d\xd7\
-\xcd\xcfc\x85\xa9\x00\xca\xfd\x97\x9b\xa4i\x1c\xc6\xcds\
-1h4\x9a\xc6\xc2\x0fh\xe3!\xaa\xd1\xb4$r\xab\
-\xdda\xab\x06\xbcI\x09(\xa9\xaa\x86\x95\xb4\x85\x94J\
-\xbb|\xdel\xed\x86\x0d\x18>|\x18\xee\xbf\xff>D\
-\x85\xb7R\xd5M#\x84\x84\x15\x0c\x15\x94\x95?FE\
-\xc2\xca\x9f\xec\xc5\x5c\x7f\xc4bO\xca\x93\xb8\x92\x98\xd6\
-\xa7\xac\x98a%\x1e\xfem@\x87\x92\xe9C\x94?e\
-\x92?\x89\xdf%-\xca\xd60\x93\xbdllVV\x0d\
-\x83\xd3\xc3:O\xadP\xb5\x8f\x0eB\xaeY\xf9q\xbd\
-f\xd3\x5c+&\x97\xeb\xaf\x95v6\x9byg \xe9\
-7\xecx\xab/?\x8f5\xc7\xff\x8c'\x1c\xe6\xed\xd3\
-h4M\x81\xdb\xa15\x95\x80F\xd3r\xe0\x1a\xc4\x1a\
-\x19\x864\xbb\x07\x82\x03<\xd1*\x88\xd7\xbbsCf\
-a)\xb6\xee\xdc!\x0b\x01\x9f>\xfa\x14\x5cp\xdey\
-2\xfc\xda$X\x199T\x95\xe5\xa2\xb4\x1c\x92\xc3\x85\
-7i\x88\x1f\x13\xf1\xeb\xe2\x99\x8d\xf5\xa5\xa3>\xfb\xba\
-a\x1b\x82\xc4\xa3\x8c\x82\x1c\x1f!\x1e\xd3O]\xea\xb3\
-?\x5c\x5c\xe2f\x98M\x0e\xe7\xff\x18\xa3\xdf\x02n*\
-\xdc\x8d+U\x97F\xa3i,\xdc\x0e6\x1fF24\
-\xa2\xd1\xb4 \xf8\x05\x89\xde\xc3\xcfC\xce\xd0K\xb0\xbd\
-\xc4\x0d\xd9\xe5UX\x11\x9c\x00\xcf\x81\xa7\xa1\x7f\xef\xbe\
-Hj\xaf\xe6\xef5\xe7\xd7 4\x1a=\x04\xdcTD\
-\x18\xb5@j4M\x81\xe7\xd1\xf0\xe2\xab\x0ez\x18\xe9\
-\x0aN\xd3\x92\x90eT\xdc-\xe8\xde\xb5\x17\x1c\x03\xce\
-\xc6\xeaQ\xf7`\xe5\x90k\x91>\xfc\x06\xf4\xe8\xdd\x0d\
-\xa1a\xa1\xb0\xf0\x979\xfe\x0db!\xfd\x1dZa8\
-Q\xd0\xe3-MD\x8b\x82F\xd3<H\xfd\xc6s\x00\
-5\x9a\x16\x05\x95|\xfa\xf7\xf5\xf6\xc2\xa8\xa1\xc3p\xee\
-\xf9W\xa2OD_\xf4]\xb0\x0eI\xbf\xcc\x83\xf7\xac\
-%\xa8,)\x15\xc5\xabA\xba\x17{\xaaw3\xdc\x1b\
-\x09\x7f\xb3\xd8\xc4\xd5\xdc\xacp:5\xc7\x0d=\x04\xdc\
-Dt\xd6i4\xcd\x87\xeb\x9b\x88\x1aM\x8b\x81\xca<\
-/\xd7\x92\xf2\xdb4X/\xbf\x1a\xe1O=\x83\xc4\xdf\
-f\xa0\xf7\xca\x8d\x88~\xffc\xec\xbb\xf1^\xa4\xadX\
-e4\x90\x0e\xaf|\xf1\x97,\xec\xa4\xa0\xb9n\xfc\xc6\
-*\xf7\xb27\x16\x96\xc9\xd2\xb2r\xec\xde\xb3\x07\xdb\xb6\
-mG^A\xc1\x11\xe5\x94\xcfy\xa4\x06\x1d\xfb\xe1\xc5\
-\x9d\x05\x8aO|\x1f!^M\xf3\xa1\x17\x82n\x0aT\
-N\xad\xb6*Y%\x5c/\x04\xad\xd14\x0d~\xec\xe7\
-\xeb\x85\xa05-\x0d*\xf8\x0e{5\xb2V\xaf\x85\xfd\
-\xc1\xc7\x10\x9d\x9a\x8d\x00wO\xf0J\x7f\x9ep\x83\xb7\
-\xc3\x0d\xc1\xfb\xf6\xa0\xe4\xc0>8\xfa\xf7\x83WH\xa8\
-\xbc=Z\x17\xa5\xa4\x95b\xf6\xdc\xb9\x98\xb7`!\xd6\
-\xae['\xdb\xba\x0d\x1b\xb0e\xcb\x16Y\xf3/(0\
-\x88=\xaa\x8e\x0bS\xbe\x0c\x85K~\xeb\xba\x11\xdc\xdb\
-\x97\x9d\x93\x83q\x9f\x8d\x97m\xf2OS\xb0x\xf1\x12\
-\x9cu\xc6\x19\xf0\xf4\xa4\x14\x92_\xe9\x11\xe4\xb0F8\
-V\xecxmA^\xcb\x90?\xf9\xc6s|y\xa9\x19\
-\xf3\x5c\xe2\x8f\xcc\xf9\x85\x85((*D\x00\xd5\x9f9\
-t\x8e?\xff\xfc\x13\x11\xadZ\xc1\x9f\xd7\x17$\x7f\xa2\
-dJ\x9a\xe8\xc8H\x92\x83\x94\xcaZn.i\xd54\
-\x0cs!h=\x04\xac\xd1h\xfeq\x9c/\x81h4\
--\x09C\x89)K\xcfB\xe9\x07\x13\x10\x93_B\x0a\
-\x93\x97r\xa2\x8d\xfb\xc6,\xe4\xee\xe5\xee\x05\xdfe\xeb\
-\x91?\xfe;\xd8KJ\x0f;\x04\xcbn\x0e\x9b\x1d\xab\
-V\xad\xc2w\xdf\xfd\x80\xd2\xe2\x12\xe9\x15\x14\x0d\x8a\x95\
-%Sa\x12\xbb:\xd4q3{\xf9f\xcc\x9c\x8d\x03\
-\xc9)x\xfe\xb9gp\xce\xd9gc\xeb\xb6m\xe0o\
-\x0bK\xcf\x22\xfb1\xe2\x95\x1e=\xb2\xcf\xcd\xcf\xc3\xab\
-o\xbc!J\x9d\x13\x97s\x9b\xf1~\xf1\xf9D|\xfd\
-\xcdwr\x5c@\xca\xe0\xec9sQXT\xcc>\xc4\
-\xdd5\x8c\x99&\xe7c\xc2p3\xe3\xd2\x1c=\x963\
-\xcf?\xefY^\x91:\xb1\x9d\xee\x01<j\xa8\xdc\xf1\
-gb\xf4\xa7\xe04\x9a\xe6!/\xbf\x00\x85%EH\
-\x88k\xabeIs\xe2Ce\xbc\xdanC\xde\xe2e\
-\xf0\xfc\xf2;\x84\x94\x95Kc\xc8N\xf6\x5c\xfa\xb9\x87\
-\x86\xf7|\xeck\xafFaN.,\xa7\x8e\x82od\
-\xb8\xe1R\x03\xd7?\xfc\xe5\x88\x0e\xed\xdb\xcb\x170\xf8\
-3d\x85\xc5\xc5\xf8\xcf}\xf7\xcag\xe0x\xa8u\xe1\
-\xe2\xc5\xf2\xd95\xfezU\xabV\x112<\xbcv\xfd\
-z\xf9\x82\xc7\xf2\x95\xab\xb1a\xe3\x06y\xdb8<<\
-\xc2\x19{fV\x16\xde\xff\xe0}\x14\x14\x14\xca\xd76\
-l6\x1b\xd6\xaeY\x87\xeb\xaf\xbbF\xce\xb9e\xdbv\
-,Z\xbcD\xbe\xe2\xc3\xe7\xe7\xde\xbbE\x8b\x96`\xe2\
-\x97_\xc3\xc7\xcfW\x14R\xfe\x8e\xf0\xac\xbf\xe7`\xf3\
-\xd6-\xc8\xc8\xc8\x94\xafk\xec\xd8\xb5\x0b\xef\x7f\xf8\xb1\
-|u\x84?\x03\xd7\xbe};\x84\x85\x87\xa1C\x87\x0e\
-\xf0\xf1\xf6\x91\xaf\x90\xcc\x99?\x1f[\xb6n\x93O\xa2\
-\xf1\xe7\xd0\xf8\x0b#k\xd6\xae\x93\xf4\xf29\xf7\x91\x9f\
-\x98\x98\xd6r^M\xc31{\x00\xf5\x10pS`\x05\
-\x90\x84\xb7\xb2\xd2\xaa\x15@\x8d\xa6\x09\x98\xf3\x93r\xf3\
-rQ\x5cV\xaa\x87\x805-\x03\x87\x03U\xa4\xa8e\
-\xbc\xfb1\x22\xd7o\x84\xa7\xd4\xc1\xeep#{\xfeR\
-\x87\x89;\xcf\xfb\xb3x\xc2-'\x0b\x85=z \xb8\
-GW\xf2\xc7\x22RGF\xccN2\xb2_\xbfi#\
-\xf6\xed\xd9\x873N;U\xa6)\xbd\xf0\xe2K\x985\
-\xeboT\x96W`\xd2\xa4\x9fP^^\x86N\x89\x9d\
-\xf0\xe6\xdb\xef\xe0\xa3\x8f?A\x11)\x85\x9b7m\xc6\
-\xe7\x9fO\xc4\xa0A\x03\x11\xd9*R\xe42+;\x8b\
-\xfc\xff,\xee1\xd1\x91\xf0&ek\x15)\x8b\xd7^\
-w-\x16,\x5c\x88\x97_zE\xea@\x1e\x16\x9e:\
-u*N\x1a9\x02\xeb7l\xc0\xbc\xb9\xf3\xe4Sq\
-A\x81\xc1\xf2\xb5,\xfe\x96oNv\x0e\xbe\x98\xf8\x95\
-|\xfa\x8d\xe3\xe1\xef\xf9Z\xab\xaa\xd0::\x1a\x11\x91\
-\x11\xb8\xe7\x9e\xfb0t\xc8PR^\x8bq\xdbmw\
-\x22?\xbf\x10\xfb\xf7\x1f\xc0\x97\xa4Lv\xef\xde\x85\x94\
-O;\xee\xbd\xf7\x01Qd\x8bK\x8a\xf1\xed\xd7\xdf\x8a\
-\x92\xdb\xbf\x7f?xX,\x07\xe7\x87\xa6^\xf4\x10p\
-s!\xdd\xcf\x86\xd4i4\x9a\xa6Q\xcf\xdc&\x8d\xe6\
-\x84\x85\x15\x96*\x1b\x1c\xbb\x0e\xc0\x93\x15?V\x00\xeb\
-\x19\xd2ts\xaf\xf9\xf6o\xd9\xfa-\xcaO=\xfe\x9c\
-J\xa1\x8b\x18\xf1K\x9e<\x0f0%5\x0dc_x\
-\x0ec_|\x0e\xd7_\x7f\x0d>\xfe\xe4\x13\xf9\x04]\
-HH\xb0\xf4\x10\xbe\xf1\xda+x\xe7\x9d\xb7\xd0))\
-\x11\xdf\xfd\xf0\x03E\xaf\x86w[\xc7\xb4F\xef\xde\xdd\
-1|\xd8\x10\xdcy\xfb\xed\xb2d\x0d\x0f)\xb3B\xf8\
-\xebo\x7f`\xd4\xe8\xd1xi\xec\xf3x\xe7\xed7a\
-\xb1x`\xce\xdc\xf9\x18=r$\x12\x12\xda\xe1?\x0f\
-\xdc\x87+/\xbf\x14#\x86\x0d\xc5=w\xdf\x85.]\
-\xbb\xc8wsg\xce\x9a\x8d\xa1C\x07\xa3W\x8f\xee\xa4\
-l\x0e\xc0\x1dw\xdc\x8a\x80\x80\x00\xb9N^\xeb\xf0\xc7\
-\x1f\x7fB\x9f~}\xf1\xf6\x9b\xaf\xe1\xad7_E\xa7\
-N\x09\xf8\xee\xbbI\x08\x0d\x0b\x83\xa7\xa7\x07n\xbd\xf9\
-f\xbc\xf6\xcaK\xb8\xfe\x86\xebH\xb1\x9c#=\x82z\
-(\xf8\xe8\xd1o\x01k4\x9a\x7f\x0dn\x0e\xfd\x16\xb0\
-\xa6e\xe1 \x05\xd0F\x0aL^E)2K\x0b\x90\
-U^$[\xb6\x98\x8beK/\xc9GaY\x11\xec\
-6+\x8a\xb3\x0f\x90\x02\xa6\xbe\xdd{8X\x11\xac\xe6\
-\xd55\xab\xab\xe5%\x90\x80\x00?DGG\x89\xde\xd8\
-\xabgwQ \x0f\x1cH\x86\xaf\x8f/\xbau\xeb\x0a\
-//O\x04\xfa\xfb\x93B6\x08E\xc5%N9\x94\
-\x1d\xbf\xbf\xc1\x07F\x0f\x1b\xcf\xf5+!?\x99\x99\x99\
-\xe8IJ\x9c')~Q\x91\x91\x12\xcf\x96\xcd[%\
-\x0co<O\xd0N\x86y\xf3\x17\xe2\xf6;\xef\xc1\xf2\
-\x15+\x91\x9f\x97\x0f\x9b\xdd.\xf1\xcb\x1c\xc2j\xf5\x06\
-4\xe3Fg\xb1\xda\xad\xd8F\xe9\xe5x\xbd\xbd\xbd\xe0\
-\xe9\xe1\x89\x91\xa3OFEe\x85\x5c\x13\xbfT\x92\x94\
-\xd4\x91\xce\xe9\x89\xa0\xa0`T\xdb\xaa\x0e;'Rs\
-h\xf4B\xd0MDg\x9dF\xd3<\x88,Q\xfd\xf2\
-O|\x13S\xa39\xeep\x81'%\xa8\xcan\x93\x9e\
-\x98\x00/_\x84\xd0\x16\xe6\x1b\x84\x10\x9f\x00\x84y\xfb\
-!\xcc?\x18\xe1\x01!\xf0#{\x7f\x1f\x7f\x92\x0fw\
-\x04T\xf2\x8ed\xe4p\x15\xb7\xa1\xa8\xb99\xd47u\
-\xbbtJ\x92e\x5c2\xb3\xb3E\xf1Z\xb9z-l\
-\xd5n\xe8\xd01\x81\xceoErr\x0a*+*Q\
-\x5cZ\x8a\xc5\x8b\x16\x8b\x22h\x0e\xa7:\xcf\xe2\xd2Q\
-\xc4q\x06\x06\x06 &&\x1a\x9bHY\xb3\xf1\x8b\x1f\
-9\xb9\xa4hnC\xdf\xbe\xbd\xa5S\xa9\x8a\x14\xb3\x92\
-\x92R\xa4\xa7\xa7\xe3\xad\xb7\xde\xc2\xa5\x17_\x80\xd7_\
-\x1e\x8b\x01\x03\x07\xd4DEi\xb1\x91?\x1e\xda\xe5\xe1\
-f:\x84\xb7\x87\x17\xda\xb5\xef\x80\x1d\xdbw\xa2\x82\xd2\
-\xc4\xbd{\xd3\xff\x9a\x01\x0b\x0f\xf1\x1a\xc18\x1f8e\
-\xbc\x88\xb6\xa6\xf1\xe8'm\x13\xd1\xc5O\xa3i\x1eX\
-\x96d\xa9\x08\x8d\xa6%\xc0\x05\x9e\x94,/O\xf5\x02\
-\x83\x85\x94\x1a~\x03\x98\x95+\x1e\x0e\xe69m\xee\xa4\
-\x11\xf1[\xc0\xc1^>\xf0p\xb7\xc8\x10+\xc2BE\
-Q\xe2\x9e\xb3C\x22K\xa5(\xe5\x8f\xe9\xdd\xbb\x17\xda\
-'$\xe0\xc9'\x9e\xc2\xb3\xcf\x8f\xc5\xcf?O\xc5m\
-\xb7\xdd\x8c\xc0\x80@\xf6\x85\xc5K\x97\xe1\xa1\xff{\x14\
-\xf7\xdd\xf7\x00\xd2\xd2\xd3p\xd9e\x97J\xda\x5c\xe7\xd4\
-\xc9\xdb\xc5\x86\x99\xe1o\x12_t\xe1\x05\x981c\x16\
-\x9ex\xea\x19<\xf2\xc4\x13\x08\x0a\x0e\xc6i\xa7\x9e\x8a\
-\x88\xb0p\xb4\x89\x89\xc1s\xcf\xbf\x809\xf3\xe6!\xb1\
-S'L\xf9\xe9'\x8c}\xf9UR\x127Q\xbc\xee\
-p\xa7\xad{\xcf\xeeX\xb4`\x01\xde{\xef}\x94\x97\
-\xf3\xdb\xcdv:\x91\x1b\xae\xbe\xf2rl\xdc\xb8\x09\x0f\
-S\x9a\xfe\xef\xd1\xc7I\x89\xcc\xc0e\x97S\x9a\x0cd\
-x\x9a\xd2&\xf9\xc0[\xad\x94i\x1a\x8a~\x0b\xb8)\
-P\x99\xd3/\x81h4\xcdG>\xbf\x05\x5c\xac\xdf\x02\
-\xd6\xb4\x0c\xb87\x8e\xb7\xe2\xb5\x1b\xe1\xbfc'|X\
-\xc1c\x8d\x86\x8a>\xabn\xbc\x99/\x84\xb02X\xe1\
-\xb0\xa1\xe2\xc6\xab\xd0\xaaO/Q\xa2D\x89\xac\x03\xd7\
-C\xbcN`Hp\x10\xbat\xed\x8c\xb6q\xf1\x08\x08\
-\xf0\xc7\xe0A\x03\xd0*:\x12%%%\xb8\xfa\xaa+\
-p\xee9gK\x0f\xda|R\xc0x\xd8\xb7g\xf7\xee\
-\xf2f\xf0}\xf7\xdd\x8b.\x9d\x93\x9c=n\x16\x8b\xbb\
-\xf4\xf4u\xef\xd6\x1d\xadI\xa9\x0b\x0d\x09A\xef\x9e=\
-\xd1\x89\x94\xba\xb6\xf1\xf1\x14\xef@\xa4\xa4\xa4\xc8\x8b#\
-\xb7\xddz3\x22\xc2\xc3\xe1\xeb\xe3\x83\xfe\x03\x07H\xdd\
-\xd8\xadK\x17\x5cq\xe9e\xf0\xf0\xf4\xa4\xf8[\xe1\xfa\
-k\xafEoJ\x7fB\xbbv\xe8\xdd\xab\x17BBC\
-i\x0bA\xaf^\xbd\xe9\xbc\x9d\xd1\xbd{7\xc4\xc5\xc5\
-a\xc4I\xc3Q^QA\xe7\x8e\xc1\xfd\xf7\xdd\x83\xee\
-]\xbb\x92\xb2\xec\x89\xb6\x09m\xd1\xa9cGyS\x98\
-\xc3u\xed\xd6\x0d\x1d\xe9\x98\x87\xa1\xf53\xa3a\x98/\
-\x81\xb8\xbd3~\x9c\x83\xdf\xb8;s\xf4\xc9\xf0\xb2x\
-R\x89\xd3\x19\xd8`\xa8\x95UB\xad\x16\xae\xb0b\x22\
-\xa3)\xeb(\xeft\x01\xd4h\x8e\x1ei\xc5\x03;\xf7\
-\xeeFjF\x1aF\x0f\x19\xaeeI\xd3\x22\xa8\xb6\xd9\
-\x912e*\xbc\xfe\xef\x19D\xdbX\x10X\x12x3\
-\xea\x13\xdax\x1e\x1d\xbfx\x91\xd5:\x02\xa1\xdf\x8d\x87\
-obG\xb2\xae_\x01\xac\x85\x11\x8d\xec\xe9Gb\xa6\
-xXI\xe4\xf8x\xf8\xf5\xb9\xe7\xc7\x22.\xb6\x0d)\
-o\xb7\x88\xbd\xb9\xd5B\xd2D\x18\xf6f\x1c\xbcw=\
-fdox\xe7s\xf0\xa1\xab_\xee\x99\xe4\x94(\x7f\
-5}w\xa6\x1f\xd3\x9e1v\x1cH]\xaa\xab\x1f\x86\
-\xdc\xb97P\x86\xc45\x0df\xfd\xd6\xcd\x98>w\xb6\
-\x1e\x02\xd6h4\x1a\x8d\xe6\x1f\x81\x94\x19\x1e\xa6\x0d\xee\
-\xdf\x0fE=\xbb\xa1\xca\x1c\xdad\x05\xc7\xa9\xe4(-\
-\xa8\x0c\xd5(>i8,Q\xd1r\xac4\xa2\x06\xc2\
-~\xcd\xf8\x086q\x87\x05\x8f\xfa\x8d\x18>\x14\xbdz\
-\xf6T\x0e\xae\xcaU\x03`\xbf\xae\xfe\x9df\xde\x89\xd1\
-\xd4\xe0\x08\x8a\xdb\xb8\x94\x1a\xd8\xbf\xd8\xd7q`{\xda\
-X=\xe4\xf9\x84\x12\xaf\x19w]\x0ee\xaf9\x22\xfa\
--\xe0\xa6\x22\x85Og\xa0F\xd3\x14T?\x00U>\
-\xf40:\xa82\xd0hNT\x0c\xe5%\xb0]\x1c\x02\
-\xef\xbe\x03\xd9\xe1!\xb0\xc9<X7\xd8\xe8\xd7\xc6\xef\
-\xf1\x92<\xd8\xedU(\xec\xdc\x09\x91W]\x0e\xaf\xc0\
-\x80\x86W9u\xfc\xb1\x22%\xf3\x02i\xcff~\xa3\
-\xf6\xd4SN\xc6\xc0\x81\x03d\xc8\xd7\x9d\xb6z\xe1t\
-\x1aie\x5c\x95>\x86\xe3\xack\xc7\xb8\xdas/\x9d\
-\xbc\xb4\xc1\xff\xaeq\x89\xbd\xea\x8b\xaa/^\x19Ys\
-\xa1\x96\x9f:qi\x8e\x0e\xfd\x16\xb0F\xa3\xf9\xf7\xe0\
-\xee\x90\x8aH\xa3i1\x90R\xc4\x8aN\xe4\xa9\xc3\x81\
-\xd7^\xc2\xbe\xf8\x18\xe4\x93\xeaWhq`KR\x1c\
-r\xbc=\x90\xd6\xa7;\x02\xdez\x05a\xfdz\x8a\xc2\
-s\xa4%`\x8e\x06\x0f\x0fO5\xff_\xd3\xe2\xd0C\
-\xc0\x1a\x8d\xe6\x1f\x87\xe7\x05\xf1\x9f\x87\xc5CM\xe6\xd6\
-hZ\x12\xa4\xd4\xf1\x1b\xbe\xd1\xa4\x04\x86\xbc\xf6\x02R\
-/9\x1f\xbb\xfb\xf5\xc3\xfc\xde\xdd\xb1\xfb\xe2s\x10\xf0\
-\xfa\x8b\x08\xed\xd5Y\xfc\xc9&=\xe6\xcd\x83(\x94z\
-\xee\x7f\x8bD\x0f\x01k4\x9a\x7f\x15\x5c!\xe9A\x09\
-M\x8b\x82\xeb`w\xfa\xf7\xf0@\xf8\xf0\xc1Hx\xf6\
-q\xf8>\xf5\x1f\x14\xb7\x8d\x85\xfb\xa5\xe7!\xb4s\xa2\
-4\x90D\xf1\x93\xfaZW\xda\x9a\xa6\xa3\x87\x805\x1a\
-\xcd\xbf\x065\xfbIWo\x9a\x96\x08\x95zw\x9e\x03\
-[\x0d\xbb\xa5\x1ae\x16;Z\xb7n\x8dv\x1d:\xc0\
-\xee\xb0\x1b\x82\xa1%C\xd3|\xe8!`\x8dF\xa3\xd1\
-h\xfe%\xa8\x17\xa2H\xd7\xa3\xd6Pu\xb5]>\x97\
-Vm\xb3\xc1\xce{\x87Z\x0e\x867\xfd\xb2\x94\xa6\xa9\
-\xe8!\xe0\xa6\x22B\xa8\x05Q\xa3i\x0e\xf8Q\xa4%\
-J\xd3\xb2\xe1JY\xad\x0f\xc8/\xc7z\xd0\x8f\x9b\xbb\
-\x05v\xbb\x1d6R\x04y\xb3\x1b{\xad\x04j\x9a\x82\
-\x1e\x02n*\xd2%\xaf5h\x8d\xa69\xe0G\x91\x96\
-(M\xcb\x86+e\xfa\xf7\xb2 5-\x03\x93~\x9e\
-\x8a\xef'O\xc6\xf7\x93&\xe1\x07\xda\xbe\xfb\xe1G|\
-\xfb\xfd\xf7\xf8q\xf2\x14\xe4\xe7\xe5\x1ba4\x9a\xa3G\
-\x0f\x017\x15\xdd\x03\xa8\xd1h4\x9a\xe6\xc4\xa8V|\
-}}\x11\x1f\x1b\x8b\xd86qh\xd3\xa6\x8d\xcc\x09\x0c\
-\x0d\x0bAY\x95U\xcc\x9e\xde\xea;\xc2\x1aMc\xd0\
-C\xc0ME\xf7\x00j4\xcd\x06K\x92nRiZ\
-6\xaa>\xe1\x91\xb9\x90\x90`\xf4\xef\xdf\x17#\x86\x0e\
-\xc2\xe8\x91#q\xf2\xa8Q\x180\xa0?\x92\x92:\x16\
-\xd4\xe0\x8d\x00\x00q\x95IDAT\xe1\xa4\x11\xc3\x11\
-\x18\xe0/~5\x9a\xc6\xa0\x87\x80\x9b\x8a\xee\x01\xd4h\
-\x9a\x0d\x96$\xdd\xa4\xd2\xb4h\xa8N\x91\xbfj\xfe,\
-\x1b\xc9\x02\x8f\xd3\x91A\xe4B:\x1c\xf8%\x10\xbb\xaa\
-\xbc\xb5\xa4h\x9a\x80\x1e\x02n*\xba\x07P\xa3\xd1h\
-4\xcd\x05U'\xb2\x16\xa6\x9b\x03\xee\xd5\xa4\xee\x91\x22\
-\xa8:\x1a\x18\x07,R\xe7h4MG\x0f\x017\x15\
-\xdd\x03\xa8\xd14\x1b\xfc(\xd2\x12\xa5i\xd9p\xa5L\
-;R\xfc\xcc\xbaY}\xfe\x8d]\xdcP\xcd\x0a\xa1F\
-\xd3\x0c\xe8!\xe0&\xe2\xd0\xad1\x8d\xa6\xd9\xe0G\x11\
-K\x94\x96*M\xcb\x85+e\xaa\x9c-\x16T\x8b\xd9\
-\x0d\x8ej1\x91NX\x8d\xa2\xd2\x12ded\xa2\xb2\
-\xd2J^u\xe5\xadi<z\x08\xb8\x89\xb8i\x01\xd4\
-h4\x1aMsAU\x8a\xcc\x01$%\xd0B?\xee\
-\xfc\x9d^\xeeh\xa0\xba&'/\x17KV\xad\xc0\xe6\
--[\xb1v\xe3FX\xab\xaa\xc8Z\xd7A\x9a\xc6\xa1\
-\x87\x80\x9b\x8a\xf4\x00\xea\x0c\xd4h\x9a\x03\x96$\xae\xce\
-t\x95\xa6i\xb1P\x9d\xe2F\x952/\x04\xcdu\xb3\
-\xf4\xfe\xb1\x92G\xff\x05\x05\x85$#nh\xdf>\x1e\
-k\xb6\xaeFa\x11\x1fk4\x8dC\x0f\x01k4\x9a\
-\x7f\x0d\xfc(\xd2M*M\x8b\x86\x94=~\x01\xc4\xcd\
-\xc3]\xbe\x8d\xcd\xd2\xe0\xce_\x03!\xa1\xf0\xf6\xf5B\
-xH\x08\xa2[E!$ \x5c>\x13\xa7:!4\
-\x9a\xa3G\x0f\x01k4\x9a\x7f\x0d\xfa\x81\xa4i\xf1\x90\
->\xc7\xbd|nvn\x0e\x912H;s\x98\xb7\xda\
-^\x8d\xbf~\xff\x15\xcf=\xf7\x12\xf6\xef?\xa0{\xca\
-5MB\x0f\x017\x15\x11L-\x86\x1aMs\xa1%\
-J\xd3\xb2\xe1J\x99\xfee\x1d@R\x04\xa9U\xc4\x0a\
-\xa0(\x81\xd5@iI\x05m\xa5\xa8*\xaf\xd4s\xd0\
-5MB\x0f\x017\x15=\x07P\xa3i6x\xc8K\
-K\x94\xa6e\xc3\x952\xfd[T\x7f8\xcb\x82;+\
-\x82\xb4\xf1\xd00\xdc\xecb\xe6\xf7\x82\xedZ\x01\xd44\
-\x01=\xe2\xd2Tt\x0f\xa0F\xd3l\xe8\x07\x92\xa6\xc5\
-C\xd5\x09\xbf\x05\xccu\x0bW/R\xc5\xb0\xf2G\x06\
-\xbb\xad\x1aUe\x15\xa8(+Gei9\xb5\x98\xd4\
-,A\x8d\xa61\xe8!\xe0\xa6\xa2{\x005\x9af\x83\
-+9\x9b\xae\xd44-\x19\xee\xed\xa3J\xd9\xcdM\xaa\
-g\x91\x09^\xfc\x99\x15\xc1\xad[\xb6a\xe7\xee\x03p\
-\xb3X\xb0l\xd9\x0a\x14\x16\x15)\x0d\x91\x95D\x8d\xe6\
-(\xd1C\xc0MD\xe6eh\xe9\xd3h\x9a\x05\x1e\xda\
-\xf2p\xd7\xfd\x80\x9a\x16\x0c\xd5)<\xd4+\x7fl\xe6\
-:\x9ad\xc2f\xb7\xa1\xc2Z\x893.:\x0f\xd7\xdf\
-u#\x06\x0c\x1b\x88*[\x15\x05\xd0\x1d\x10\x9a\xc6\xa1\
-\x9f\xb4\x1a\x8d\xe6_\x83\xee\xfb\xd3\xb4xH\x9fs\xa3\
-?V\x00-\xb4w\xb7\x90\x85\x83$\x83v\xee\x16w\
-x{y\xc3b\xb1\xc0\xcb\xdbG\x8e5\x9a\xc6\xa2\x87\
-\x80\x9b\x08\xf7X\xe8\x16\x98F\xd3<\xb0$\xe9>u\
-M\xcb\x86+e\xaa\x9c\xdd\xdcag5Pz\x01\x95\
-D\xb8\xd3\xde^mG\xb5\xdd\x8d6;\xd9hI\xd1\
-4\x1e=\x04\xac\xd1h\xfe5\xc8\xa3\x88*9\xdd\xa4\
-\xd2\xb4\x5cT\x85\xcco\xf9z8\xdc\x8c7\x80\xb9\xa7\
-\x8f\xf6\xb2 4/\x0cM2\xc2S%\x0e\xd1{\xc3\
-_\x0fa\x05\xd1\xdcL\x05\x92\x91/\x8bT\xd7\xae\xf4\
-\xeb\xfa\x97qg\xcd\x09\x8f\xee?n*\x22(ZX\
-4\x9a\xe6\x80\x1fHZ\x9a4\x1a\x82\xea\x16\x1b)z\
-vY\x0f\xd0\xb0\x92\xef\x02\xbb\xa3\x9a\x14?Q\xea\xea\
-Q\xd4\xd8>5=\x1d\x9b6o\xc1\xc6-\x9bq \
-9\xd9t\x90-#+\x0bY\xd9Y\xa2\xf4\x99v\x99\
-\xd9\xd9\xd8\xbc}\x1b6m\xd9\x82M[\xb7\xa2\xbc\xa2\
-\x92\xec9\x8c\x0a\xaa91\xd1C\xc0ME\x0f\x01k\
-4\xcd\x8aZ\xef\xcc8\xd0hZ\x1c\xaa\xf0\xcbB\xd0\
-\xf2g\x98Y\x19\xb3;Dqs\xa3\x03\x99~dj\
-\x86&\xa4\xccU;\xaa1\xf6\x95W\xf1\xc0\x7f\xfe\x8b\
-\xa7\x9f~\x0e\xd7\x5c{=~\xfd\xedw\xd8\xedvX\
-\xab\xac\xb8\xe3\xae{\xf0\xd8\xe3O \x8d\x94D\xfe\xb2\
-\x08G\xfb\xd1\xc7\x9f\xe2\xe6\x1bo\xc6\x8b/\xbd\x82[\
-n\xbe\x15\xef\xbd\xff\xbe\xf8\x15%Qs\xc2B\xed\x0b\
-.35s\x0c4G\x89\xe4\x9b\xce;\x8d\xa69\xe0\
-\xe7\x10/n\xab\xa7\xa5hZ&T\xf0\xb9>f\x05\
-\xcf\xe2\x0e\x0b\xe9_\xee\xdc\xebG\xf6|\x5cRZ\x0a\
-[\xb9\x95\x94B\x1e\xfe\xad_H\xd8\x7fNv\x0e^\
-}u,~\x992\x09\x0f>\xf8\x00^\x1a\xfb\x12\x0e\
-\xa4$##3\x0b\xf9y\x05(*)\xc7\xeau\xeb\
-\xa4\xa1\xe5 \x851//\x17={\xf5\xc6\xf7\xdf|\
-\x89\xdf\xff\xfc\x0dS\x7f\xfd\x1dK\x97\xaf\x90ah\xcd\
-\x89\x8b;\x17\x16\xab\xb5\x8aZ\x07Z\xd3\xd7h4\xff\
-,\x0e7wx\xe87\x1b5\x1aC\x11d\xd5\xcf\xd8\
-HQ\x0b\x0a\x0e\x84\xa7\x9f\xb7\x98\x0f\x07\xd7\xe7v\x9e\
-\xebG\xe6\xf8\xf88TS\x5c\xd6\xca*\xfc\xfe\xc7\x9f\
-\xe8\xd7\xb7\x17\x06\xf4\xeb\x83?\xff\x9a\xa6\x22&u\x92\
-\x87\x99mU6\x8a\xd7\x01/\x0fOV\x0c`\xb7\xd9\
-\xd8Qs\x02\xe3\xeei\xf1\xa2\xc2b\x93\xc2\xa2i\x04\
-z\x08X\xa3i6d\xf1\x0b\xae\xf8\x8cc\x8d\xa6e\
-a\xbc\xf4\xc1s\xfcH)S=tJ\x1aX)+\
-.(\x16E\x8e\xcd\x07\x0d\xff\x1a\xb0nh\xa1F\xd4\
-\xc2\x05\x8b0\xf1\xab\xaf\xf0\xc4\x93\xcf\xe2\x9cs\xcfF\
-Hh\x08\xe6\xcf_\x80\x9bn\xbe\x09}\xfa\xf4\xc6\xea\
-\xd5k\x90W\x98//\x93xyz`\xcd\xba\xf5\xb8\
-\xff\xc1\x87q\xc7\x1dw\xe1\x8c3NG\xff~}\xd5\
-y4',\xee\xbe\xde\x9e(\xab(\x17%P\xd3\x08\
-D8\xb5\xf2\xac\xd14\x07,M<\xfc\xab\x9bT\x9a\
-\x96\x89C\x0d\xbb\x92\x00\xb0\xf2\xc5\xf2`\xbe\x05\xcc_\
-\x03\xf1\x09\xf2\x83\xc5\xcb\xe2T\x0a\xeb\x85\x04\x88\x97\x0e\
-\x5c\xbcd)\x96\xafX\x85+\xaf\xbc\x0cO?\xf9$\
-V\xafY\x83\x8d\x1b6\xc8>9%\x19\x95\xa5\xa5\x98\
-;w\x9e\xd4a<?0(0\x00\x1d;\xb4Gz\
-V6\xc2\xc2B\xe1\xeb\xe3kD\xa89a\xa0b\xc3\
-sD\xab\xacV\xdaS\xd9\x0a\xf0\xf1\x17\xe5\xafZ\xf7\
-\x00\x1e5\x9c\x916\x9b\x0dUUU:\xff4\x9af\
-\x82\xab\xb6\xc3To\x1a\xcd\x09\x8cK\xd3\xc7\xe8\x09\xe7\
-\xe1[\xee\xec\xe3\xcdZZ\x0e\xbb\xd5.\x0a\xa1(\x81\
-\xf5(\x82\xecf\xb5U\xe3\xf1G\xff\x0f\x1f\xbd\xff.\
-\xae\xbb\xe6j\xa9\xf0\x97,Y\x82>\xfd\xfa\xa2]|\
-<\x12I\xd1;\xf5\x8c\xd3\xb1`\xd1b\xd8mj\x99\
-\x98\x0e\x1d:\xe0\xbe{\xee\xc2\xf3\xcf?\x8d\x1f'M\
-ANn.\x9f\xdc\x88UsB\xc0e\x8a6y\xc1\
-\x87n\xad\xbb\x8f\x9f\x0f***PE-\x00=\xf0\
-\xd208\x03y\xdb\x9f\x9a\x8c\xfcB\x9eP[\x8c\x9c\
-\xfcl\xb1\xd3h4\x8d\xc7\xa5\xfa\xd3hZ(J\x0a\
-\xe4\xcd_C \xa4n\xa1\xcd\xe2\xed\x05\x8b'\xf7\x00\
-V\x8b/\xae\xb5\x0fB\xea!\x9e\xd3\xc7\x9f\x89Su\
-Uqi\x09\xf6\xef?\x80\xcb.\xb9\x18\xc3\x87\x0d\xc3\
-\xb0a\xc3q\xd7\x9dw`\xf1\x82\xc5\xd8\xbam\x9b\x9a\
-\xffW\xadF\x01\x87\x0c\x1c\x88\xeaj;\xb6l\xdb*\
-\x9d\x1c\x9a\x13\x0by\xb3\x9c\x0b\x16\x95\x0b\xf7\xa0\xc0 \
-j-\xd8\xa9\x85P)\x0e\x9a\x86\xc1\x22Vn\xad@\
-pp\x10\x22\xc2[Q+J\xad\xd0\xae\xd1h\x1a\x0f\
-\xcb\x15?\x85\xf4\x93H\xd3r!) \x01p#E\
-\xcfb|\xec\x83TA\xb2pCUE\x85(k\xe2\
-\x8b+\xf0:\x92\xe2 ?\x5c\xb9w\xeb\xd2\x19\x81\xc1\
-\xc1pw\xb7\xc8\x10rNN.\xda\xc4\xc6\xa1o\x9f\
-\xbe\xf2\x199\xf6\xd31!\x01c.\x1c\x83\xf4\xcc\x0c\
-$%%\xca[\xc0l\xefe\xf1\xc4\xe5\x97]\x8e\xec\
-\xac\x1c=\x07\xf0\x04\x84G++*\xadR\xa6\xdc\x03\
-\xfc\xfcenAiY\x99\x140\xd5z\xd0\x1c\x09\x11\
-;j\x1c\xc9D]\x9e?Iy\xa7Vk\xd7h4\
-\x8d\x85\xe5\x8a\x9f@\xfa)\xa4i\xb9p=L;[\
-\xb51\x1f\x90\xea\x16\xee\xf1s\xf0\xe7\xdf\xc8\xce\xa6\x86\
-\x80\xf9\xe5\x8d\xba\xfdsJ\x1dt\xc3\xa3\x8f\xfc\x1f\xba\
-$%\x89\x02\xe7N\x0a_b\xc7\x8ex\xe6\xc9\xc7\x11\
-\x17\x17+~d^!\xb9=\xf2\xdf\x87p\xd2\xf0\xe1\
-\xb8\xe3\x8e\xdbq\xd7\x1d\xb7\x89\x7f\xb6\xbf\xfb\x8e[q\
-\xc1\xf9\xe7\x89Ys\xe2\xc1\xe5\x88\x0b\x99{pP\x90\
-\x8c\xf3\x97\x96\x97\x8b\x85\xe6(`Ib\xa5\xd9\x10;\
-\x8dF\xa3\xd1h\x9a\x05~\x93\xc3X\x03\x90kfV\
-\x07}}}\xe1\xe9\xe9\x09\x1e\x02V=\x80\xf5\xe3\xe7\
-\xe7\x07\x0fR\xfcL\xb8\xd7\xcf\xc7\xc7\x87\xaa+\x8a\xcf\
-\xdc\x08?\xb2\xf3\xf6\xf6\x96\xbd\x1f\xc5\xad\xdc\x94\x7f\xb6\
-\xd7\x9cxp\x0f`Ye\x05\xbc<<\xe0\xee\xef\xef\
-\x0fO\x0fw\x14\xe4\x17H!\xd3*`\x03\xa1\x8c\x92\
-y\x19\xacH\x93\xd0\x88Y\xa3\xd14\x09\x96\x22\xae\x9a\
-T\xf5\xa4\xd1\xb4DH\x0aD\x0fs\x93E\xd1y-\
-\x18V\xdc\x1c\xd5n\xb0x\xfb\xd0\xe6!~\x0e'#\
-NE\xcf\x80\x8f\xc5\xae.\xa6\xbd\xb9\x99\x98\xf6\x9a\x13\
-\x0e\xab\xad\x0a%\xe5\xa5\x08\xf0\xf7\x83\xbb\xa7\x07i\xfa\
->\xde((R\x0a\xa0\xbe\xe5\x0d\x842\x8a\x87\xcf\x0b\
-K\x0a\x91G\xca\xb3\xa7\xa7E\xe7\x9dF\xd3DX\x86\
-x\x1e\x93nNiZ.$\x05j\x84\x0e\xf2\x15\x10\
-\xe3\xb3on\xee\xac\xf4U\xc3a\xe5O\xba\xa9\x8f7\
-\x88\x82\xa8\xd1\x1c\x056\x9b\x1d\x95\x15\x95\xf0\xf3\xf6\x85\
-\xbb\x97\xa7\x17i\x82\x01\xc8-*4\x9c5G\xc2l\
-\x19\xf1\xe7xX\xfeJI\x9b\xe6\xe5`t\x8bI\xa3\
-\xd1h4\xcd\x81\xc3\x9d6\xaa_\xb8^q.3F\
-\xe6\x8a\xd2R\x94\xe5\x17\xa3\xa4\xb0\xb8\xc6^\xa3i \
-\xbc\xec\x1f+\x80\xfe~\xfep\xf7$\x05048T\
-\x962\xb1Z\xadR\xc04\x87\x87\x87{\xf7\xec\xdd\x8b\
-\xf7?\xfc\x08\x9b\xb7n\xc6n2\x8f\xffl\x22\x0e\xa4\
-\xa4\xea\xa1`\x8d\xa6\x09\x88\xf4\x90\x0c\xe9\xa7\x90\xa6\xe5\
-b\xd4!$\x07\x1ev\xdaU;\xe4\xe5\x0c\xae[\x1c\
-\xee\xea[\xd9<7\x90\xe7\x04\xeaW44G\x03\xbf\
-Td\xad\xb2\xa1\xc2Z\x81@\x7fV\x00=<\x10\x16\
-\x12\x82\xcaJ+\x8a\x8a\x8bT\xd9\xd3:\xcc\x11\xf1\xf2\
-\xf1$-\xba\x02\xde>\xbe\xf0\xf1\xf2\x84'm\xfc\x12\
-\xf0\xd1f\x9d\x085\xb5\xe2xc\x81w=vn,\
-\xf0\xec\xb7\x1e;\x8d\xe6D\xc2\x8d\xca5/|\xcb\xc3\
-\xc0\x1aM\xcb\x84\xca>\xfd\xf33\xdef\xa1\xe7<\x99\
-\xb9\xa7OV\x99\xb0\xdbQ\x5cP\x80\xe2\xfc\x22\x94\x15\
-\x97\xe8Q'\xcdQ\xc1\xcb\x06\xd9mU\xb0\xd9\xab\xe1\
-\xc7\x0a \xcf\x5ccM\xb0\x9a\x0aV~~\x81h\x88\
-\xfc\xa794,r<\xfc\x1b\x11\x11\x8e\x01}\xfa\xa2\
-C\xc7\xf6\xa8\xb4V\xaa\xf5\x95\x94\x97#\xc3\x95\x1c\xb5\
-\xec\x04\x16bWA6\x8f\x0fgO\xc8\x124Z\x11\
-\xd4\x9c@p\x85\xc6KTh4-\x1ez\xbe\xf3<\
-?Q\xfe\xe8\xd0\xe2\xee\x8enI]\x11\x12\x14\x8c\xd4\
-\xd44\xf4\x1f\xd0\x0f\xb1m\xda\x90\x8bR\x125\x9a\xc3\
-\xc2\xba\x02=[\xcb++`\xa72\xe5\xe7\xe7\x0b\xcb\
-\xb3\xcf<\xf3,\x0f\xfdn\xdb\xbb\x07\xc1\xfe\x81H\x88\
-\x8f\x97\x87\xb0\xe6\xf0\x94\x94\x96\xe0\xc7\x1f\xa7`\xef\xee\
-]X\xbfq\x13\xa9\x83\x16\xf4\xef\xdf\x0f\x81\x01\x01\x0d\
-\xca?\x9e3\xb8\xef\xc0~\xfc=w.f\xce\xfe\x1b\
-\xab\xd7\xae\xa1\xfbS-\x1f\xe4^\xb4x\x11\xd6\xaf_\
-\x8fu\xeb6`\x0d\xd9\xef\xd8\xb9\x13\x11\xe1\xe1\xf8e\
-\xeaT\xac]\xbb\x0ek\xd7\xafCJJ\x0ai\xf0~\
-\xf0\xf7\xa5\x9b\xe8\xf2\xba\xbfF\xf3\xbf\x8c|Y\x87d\
-\xabmk\xaa\xd8\xf4sH\xd3\x02\xe1\xafpT\xd9\xac\
-\xc8+*DfF\x06\xda\xc7\xb7\x93z\xc5b\xf1@\
-8\xd5\x03\xd111\xb2\x18\xf4\x0d\xd7\x5c\x8d\x90\x90P\
-\xbdV\x9f\xe6\xa8\xd8\xbdw\x1f\xf6\xa7$\xa3_\xaf>\
-p\xe7\xde\xbe\xa0\xe0 y\xa35\xbb0\x0f6\xbb\xfe\
-\x9aEC\xe0~\xb7\x90\xd0\x10t\xed\xde\x1d\xed\x13:\
-\xc8W@X\xab>b\x7f\x9c\xf4\xfcUc\xe5\xea\xd5\
-x\xe4\xb1'\xf0\xd3OSQRT\x8c\xe4\xfd\xc9\xd8\
-\xbbo?\x0e\x90R\xb8m\xdb\x0eL\x9d\xfa\x1b\xc6\x7f\
-\xfe\x05v\xed\xda\x8d\x9d;v\x22-=\x1d\x0f=\xf4\
-\x08\x16-Y\x86\xdd\xbb\xf7\xe0\xab\xaf\xbe\xc6\xe3\x8f?\
-\x89\xd9s\xe6J|\x1a\xcd\x09\x01)}\x1e\x16]\xa1\
-iZ.\xd2\xec\xa1\x8a\xc4\xcf\xc7\x1b!a\x01\xf0\xf0\
-\xb0\x80\xbf\xe8\xc1\x1d\x0b\xbcEFE\xa2\xff\x90\xfe\x08\
-\x96/}\xe8F\x92\xa6a\xb0n\xc2[V~6|\
-\xa8l\xf1\xda\x8fT|\xdc\xe0\xe7\xeb\x87\x88\xf00d\
-\xe7\xe5\xa1\xa4\xb8X\x0f+6\x00\xee\x96o\xd3\xa65\
-F\x8f\x1c\x89aC\x07\xc3\xd3\xd3C\x94\xbb#\x89#\
-\xe7lqI\x09^x\xfe\x05\x0c\x1d2\x04\xef\xbd\xf3\
-&\x9ex\xfcQ:~\x16\x17\x8c\x19\x83\xdbo\xbd\x15\
-c_|\x1e\xe7_0\x06#F\x0c\x17\xfbG\x1e\xfd\
-?\x04\x87\x04#44\x187\x5cw\x0d\x9ey\xfaI\
-\xbc\xfb\xee;\xe8\xd7\xbf\x1f^x\xe1\x05ddgI\
-z\xf4}\xd3\x9c\x08\xc8\xd4\x06\xc3\xac\xd1\xb44X\xd9\
-\xe3\xc5\x9eyu\x8e\xe0\xc0P2{\xc9K \xfc%\
-\x10\xf9\x1a\x08=\xeb\xab\xf8;\xbf\xfay\xaf9\x0aL\
-\xdd$\xb7\xa0\x00\xfe\xbe\xfe\xe0\x15`\xdcY\x05\xe4!\
-\xc4\xd8\xe8H\x14\x15\x16 \xbf\xa8\xc0\xf0\xa69\x1c\xf2\
-\x91l\xca\xd1]\xfbw#-=\x93l\xe8\xe0H\x02\
-I\xee\xac\xa4M\x9e\xf23\xb2r\xf3q=)s<\
-\xb4\xcbs\x9eX\xe0\xbd\xbc\xbc\xe0a\xf1\xa0\xfb\xc1\xc2\
-\xae\x94I\x8b\x9b;<\xe8\x81 \xc1\xb9Z$Kw\
-\xb2\x8b\x8a\x8c\xc4]\xb7\xdf\x86\xb0\xf0V\xd8\xb9c\x97\
-\xb8k4\xff\xeb\xb0\x04q\xb9\xe7M\xa3i\x89\xb8\xb9\
-Y\xe0\xe3\xed\x87\x90\xa0\x10\x04\xf9\x07\xcaW=\xe4\x0d\
-C\x99\x12\xc1\xb5\x80V\xfc4\x8d\x80\xca\x0fO=+\
-(,\x02\x7f\x01\xce\x87\xf4\x0d\x19k\xe1b\x15\x19\x1e\
-\x09+\xb5,\xf2\x0a\x0b\xc5\xa3.b\x87\x874g\xca\
-77\x04\x07\x04S+-\x80\xe4\x93\xf2\xac\x81\xb5V\
-vN6\xbcI\xe1\x0b\x0f\x0b\x95\xef4r~\xcb\xe4\
-w\x9e\xcb!q\xf0\x0fm\xb2Snr`(\x90\xac\
-0zxx\xc0\xdb\xc7G\x14\xc7,\x8aOU\x9d\x1a\
-\xcd\xff6\x5c\xd2\xb9$\xeb\xd2\xaci\xb1\x90\x10p\xbd\
-\xe0\xe9\xe1I\x8a\xa0\xafs\xf8\xd7T\xfd\xf8\xf9\xcfv\
-\xaaN`\x89\xd1h\x8e\x80\xf1P-*)Aee\
-%B\x83\x83D\x87p*\x80Q\x11\x91T\xe0<H\
-\x99\xc8\xd5\xdd\xcbG\x01\x0f\xfdz\x92&}4\x04\x92\
-\xf6]Z^\x81\xdc\xbc|\xe9\xce7\x15\xbb#\x0e\xe1\
-\xb22(BO\xff\x14\xae\xb4\xac\x14E\xc5\xc5h\x1b\
-\x1f\xcf\x8e\xca\x8fF\xa3\xd1h\xfe\xe7\xe1\xf9}\xfc\x82\
-ffV\x062\x8c-3;\x1b\xb9TG\x17\x15\x15\
-!-+\x0bU6\xaa\xab5\x9a#\xa0\x1a\x0f\x0e\x94\
-\x94\x16\x8b~\x17\x1c\x18\x0c\x0b5\x22D\x01\xe45\xb7\
-\xfc\xfd\xfc\x10\x13\x11\x81\xb4\x8ct\x94\x95\x95\x1dY\x19\
-i\xe1\xf0\x22\x9c\xcc\xce}\xfb\x90Ly&J\xd9\x91\
-t0V\xe0h\xbb\xf0\xfc\xf3(\xbf\xbd\xf1\xf5\xb7\xdf\
-\x92 \x17\xcb\xbag\xdc5+\x8a\xb7\x89,\xfci\x98\
-\x0d$z\xb2\xe4\xe1\xe7\x82\xa2B|\xf4\xf18TV\
-\x94\xa3C\xfb\xf6\x12\xaf\xea)\xd4h\xfew\xe1\x12l\
-n\x1aMK\x85\x1f\xfdnTA\xef\xdc\xbb\x07\xe3\xbf\
-\xf8\x1a\xe3>\xfd\x02\x9f|\xfa9>\x1a\xf7)\xa6L\
-\x99\x8a\xd5\xcb\xd7`\xc2\x84\xcf\x91\x93\x9b\xab\x02h4\
-\x87Au\x1d\xb9!-;S:\xfaBB\x82Y\x1d\
-\x81\xe5Y\xc2\xd44\xb80\xedM9\x80\xc4\x84\xf6\x08\
-\x09\x0c\xa2P\xfa1|(\x0a\x8b\x8b\xb0q\xe3&\xc4\
-\xc6\xc7\xa2\x9a\x94\xb7\xf4\xb4t\xf4\xee\xd5\x934\xeb\xa0\
-#*b\x81\xfe\x01h\x13\xdb\x06_}\xf9\x15\xb6n\
-\xdf!K\xba\xacZ\xb5\x06\x15\x95\x15\xb2\xae\x13\x87\xdf\
-Dq\xe7\x15\xe4\xe3\xe4\xd1\xa3$L~A\x01>\xfd\
-l<\x02\x02\x02\x91\x9c\x9a\x86\xdf\xff\xf8\x13+W\xae\
-\xc4}\xf7\xde\x83^=z\xc8\xbd\xd2\x0a\xa0\xe6\x7f\x9d\
-|j\xd8\x94\x94\x96\x22\xb6\xb5\x92\x03\x8d\xa6%\xc2%\
-\xbf\xd2V%\xf3\xc1\xcf:\xfb,\x8c\x1a1\x02\xc3G\
-\x0c\xc7\x88\xe1\xc30b\xd8P\x8c\x18q\x12F\x0c\x1d\
-\x82\xa0`\xae\xc8\xb5\x9ch\x8e\x00\x15\x11\x9b\xdd\x86\x95\
-\xeb\xd6\xc2V]\x8d~={\xc1\xd7\xdbG\xf5\x00\xb2\
-\xf2\xc0[\x1c=ty\xe1\xc9lR\x04\xa57K\xf7\
-\x02\x1e\x12\xd1\xa7)\xcfZ\x85\x85\xc3\xd7\xd7\xd7\xb0=\
-2\x22\xac\xb4\x9d<z4\xde|\xe3uY;\x90\x15\
-oOo/\xc4\xc5\xc6\xcaK\x1f\x16r\x1f<d0\
-.:\xff\x02\xf1\xcf[xX\x18\x1ex\xe0\x01\xf8\x07\
-\xf8\xa3\xa0\xb0@\xde>~\xfd\xd5Wq\xd6\x19gH\
-|\xfa!\xa0\xd1h4'\x0e<\xeb\xcf\xe6\xb0\xc3\xd7\
-b\x91\x09\xfb\xbe\x1e\x1e\xb4y\xc2\xc7\x93\xcc\x9e\x1e\xf0\
-\xe6I\xfc\xfa\xb9\xafi\x00<\xa2\xcb\xd3\xc5x\xa5\x97\
-\x98V\xad\x10\xe4\xcf\xeb\x15\xcb\xcb\xa6\x86\x96G\xbb\x5c\
-R,&\xfd\xf1\x0b\xc2\x02Bp\xc9\x98\x0b\xa4pi\
-\xc5\xa2\x1e(\xaf\xf6\xa7&\xe3\xc7IS0r\xf4p\
-\x84\x85\x86\xe2\x9b\xaf\x7f\xc0\xad7\xdf\x8461\xad\x1b\
-\x96g\x14\x07\x0f\xe5r\xee\xf3<@~\x01\x84Wz\
-geN9\x93\x03\xfd\xf3\xcb%rL\x9b\xddfS\
-\xf6\x84\xb9\xf83/\x02\xaa\xef\x90\xe6\x7f\x1eU\xac\xb1\
-;y?\xb2\xb321\xb8\xdf\x00\xa7,h4-\x0d\
-\x16\x87\xca\xf22l\xdd\xb5\x13\x9d\x13;\xc1\xd7\xcb\x87\
-\xdf\xfeP\x8e\x1a\xcdQ\xc2\xd3\xccv\xee\xdb\x83_\xfe\
-\xfa\x03\xa3\x07\x0f\x93/\x98\xb1\xce\xa1z\x00\x09.p\
-~>\xbe\x88\x0e\x8fB*=\x80+*+\xb5bq\
-\x18X\xc9\xab\xaev\x90\xd2\xe6\x09k\x95]z\x049\
-\x0f\x8dz\xec\xc8Px~\x93K\x14?R\xe6TK\
-\xae&\xc7\xe5\xc8\xe5\x06\xb0\x91\x15D\x0f\xf2k\xfa\x97\
-\xb5\xa1\x94\xb3FsB\xc0\xe5\xf9\xa8\xe4H\xa39\x01\
-a9\x90Z\x85\x9e\xf3f\xa3_\xa3i\x14\xf2@u\
- 77\x17v\xda\xb7\x8e\x8e\x96r\xc58\x15@\xb6\
-\xf0\xf6\xf2F\xeb\x98h\x94V\x94#+;\xcb\x08\xa7\
-\x0b_}\x88\xc2W]\x8dn\x9d;#\x22,\xc2\xb0\
-=z8\xdfE\x91\xa3M\xa4\xde\x84o\x90q\x93L\
-\xa4\xb7\x8f6\xf6_\xd7M\xa3\xd1h4'\x0e\xee\x5c\
-\x03S\xfdk\x8e\x02i4\x8d\x82\xca\x10\xbfM\xce\xc3\
-\xbf~\xbe\xbe\x08\x0f\x0dw\xaa\x0fN\x05\x90\xe1\x83\xd6\
-\xad\xa2\xa5'p\xc7\xee]\xa29\xb2\xa2\xa39\x18V\
-\xc2\xf6\xef\xdf\x8f\x193gc\xee\xdfs\xe5%\x0d\xce\
-?\x9d[\x1a\xcd\xd1\xc3s\x8ey\x99\x02\xf9\xd2\x01\x1d\
-\xeb\xf6\x8d\xa6e\xe3@\xb5\xb1\xb6\xac\xfe\xd4\xa7\xa6)\
-\xf0\x07j\xf9\xfb\xea\xe9\x19\xe9h\x13\x11)\xeb\x07\x9b\
-K\x96\xd4R\x00\xd9\x8e\xbfL\x11\x1d\x19\x85}i\xa9\
-(.-f[\xe5\xa8q\xc29b\xb7W\xa1\xb0\xb0\
-\x08\xf3\xe6\xcd\xc7\x8a5\xab\xe5\x1b\xca6;\x0b\xaa\xce\
-/\x8d\xe6hq\x90\xfcX\xad\x15HIIFqA\
-!**\xca\xe5\x93p\x1aMK\x84_\xc6\xac\xb2Z\
-\xa5!d\xb3\xd9Pi\xb3\x1a.\x1a\xcdQ\xe0\xe0\x0f\
-G\xb8#7?\x1f\x85\xa5\xa5Hh\xdb\x96\xc7.\xe5\
-\x8f\xa9\xa5\x00\xf2p\xa4\x8f\xb7\x17:\xc6\xc5#\xaf\xa0\
-@\xbe1\xab\x9b\xe2\x07\xc3\xf9\x14\xd9*\x12\xb7\xder\
-#*\xcb\xcba\xa1,\xe5\xcf\xbaEFF\x92[\xad\
-,\xd5h4\x0d\xa4\xb4\xac\x1c\x1f~\xf4\x89,od\
-\xe7^\x0f7\xad\x00jZ&\x0eG5\x8a\x8b\x0a1\
-\xf1\xf3\xf1\xf8\xe9\xd7\xa9(//\x93\xca\x5c\xa39\x1a\
-\xb8\xc4\xf0\xcb\xa6\xfb\xf6\xed#\xdd\xce\x13\xad[\xb7\xae\
-\xf5r\xefA\xda\x0a\x0f\xf9vLh/C\x99{\x93\
-\x0f\xc0\xca\x8b\x13\xeb\x96\xf8Ax{\xf9 ,<B\
-&\xeafg\xe7\xa0\x1d)\xcd\xfcZ\xbeF\xa39z\
-x\xae\xf1\xdau\xeb1t\xe8 X\xbc<\xb1e\xcb\
-V\xf5\x95\x1c\x8d\xa6\x85\xc1\xb2`\xb1x #3\x13\
-\xc5\xa5Vl\xdd\xb4\x1d\x95\x95UZ\x1e4G\x0d+\
-z\xfcB\xef\xee\x94\xfd\x88\x89\x8cFH@P\xad1\
-\xca\x83\xbb\xab(@Hp0\xda\xc4Dc\x0f)\x80\
-E\xc5E\xe6p\xb1\xc6\x80\xe7d\xb00\xfe\xf5\xe7_\
-8\xeb\xac\xd3q\xee\xb9g\xe3\xef9s\xc4^\xbf4\
-\xa3\xd1\x1c\x1d,K9y\xb9X\xbdv\x1d.\x18s\
-\x1e\xfa\xf7\xeaE\xf24\x0fe\xe5<\x0c\xac+=M\
-\x0b\x83\xea\x90\x92\xd2\x12L\x9e\xfc\x0b\xee\xb9\xfbnt\
-\xe8\xd8\x1e\xdb\xb7ow\xbai4\x0d\x82\x8b\x0am\xe9\
-\x19\x19(,.F|\x9bX\xf8x{K\xe7\x9e\xc9\
-\xc1\x0a \x05\xe0o\xc4u\xee\x90\x88\xc2\xc2Bdd\
-e\x1a\xf6\xba\xe09a\xad\xba\xa2\x12\x09\x1d\x13p\xfa\
-\xc9\xa7\xe0\xe4\x91#a\xb7\xdbQe\xb3\xd5\xca\xdc#\
-b\xdc\xa0\x86\xa0\x95K\xcd\x09\x89Q\xa6y\xa4\xa1s\
-\xe7D\x84\x85\x86\xa3K\x97\xae\xe8\xd8\xa9#;\x8a\xdb\
-\xb1F\xcb\x96\xe6_\x05\xd5/iY\xe9\x88\x8e\x8bA\
-\xb7\xa4\xce\xe8\xd9\xb3\x076n\xdf\xe6\x1c\xb6k\x14\x87\
-+\xdf\xe4$\x0d--\x03'\x16T\x5cx\xfd\xbf\xbd\
-\xc9\xfbI\xf1\xf3At\xabHc\xb5\x91\x9ar\xa4>\
-\x05\xe7\x8a\xb89\xe0\xe9\xe9\x89\x1d{\xf6\xc8w\x81y\
-!J.|M*\x80'\x08\xd5\xd5vd\xe5d!\
-3;\x0b\xbdH0\x83\x02\x82\xe0\xed\xed\x85\x88V\xe1\
-\xf2\xaa5\xe7\x9b\x87\x87\x87\xe1\xfb\xd0p\xaf\x87d'\
-\xfd\xb0\x99E\xefp\xf9[^^.\xee\xe6\x02\xd0\x1a\
-\xcd\x89\x00?\xa0\x96\xaf[\x85\xf4\xcct\x0c\xea\xdf\x1f\
-\x81\x81A\xf0\xf1\xf1\x86\xaf\xbf\x0f\xb6\xee\xdc\x81\xa0\xa0\
- Y\x95@\x09K\x03\xe0\xca\xcca\xc8\x96\x83d\x8b\
-\xcc\x5c\xb1\x1dJ\xb6X\xf6\xf8\x19g\xae\xc7\xa9\xd1\xfc\
-\x93pG\xc2\x9e\x03{\xe4\xc5\x8f\x91\xc3\x86\xc1\xdf\xcf\
-\x1f\xa1!\xc1\x88\x88\x08\x83\xd5f\x87\xd7Q\xd5/\xc6\
-\xda\xb4d\xe6\x97\x14\xf9\xb8>9`\x19)%\x19\xf0\
-\xb0x\xa8%\xc64'\x04\xdc\xa8\xcd+\xcc\xc3\x82\x15\
-\xcb\x11\x1d\x19\x89\xfe\xdd{\xc2\x93\xee\xb1z8*\xea\
-\xbd\xdb\x5ch\x82\x02\x02\x91\x10\x1f\x8f\xbdi\xc9\xf2\xe9\
-1Y\x0e\xa6\x857\x108C\xadU6\xfc\xf6\xd74\
-\xfc8\xf5g\xc9L\xceJ\x16\x9a\x8d[\xb7\xe0\xd9\xb1\
-/c\xd7\xde\xbd,Q*\xc0!\xe0\xa1\xad\xbf\xa6M\
-\xc3\x0f\x93&\xe1\xdb\xef\xbe\xc7\x8c\x99\xb3PR\x5c\x5c\
-;\x7fEr\x95\x91\x99\xf0\xc5D,_\xb5R\x04[\
-\xa8\xe3.\xd4g\xc74\xd4o}v\x1a\xcd1\xc3A\
-:\x9a\x1bV\xaeY\x87\xb5k7R\xe3\xc9W*(\
-/Oo\xe4\xe4\x16`\xe2\x17\xdf\xca\x8bh\x0d\x1d\x04\
-f\xf9,-/\xc3\x82E\x8b\xf0\xed\xb7\xdf\xe1\xbb\x1f\
-~\xc0\x9c\xb9\xf3\xc8\xae\x9c\x1d\x0dO\xc6Fpe\x9b\
-\x99\x99\x89W_{\x1d\x1b7oR\x96&u\xe5\xc0\
-\x0cw({W\xea\xb3c\xea\xb3\xd3hL\xa8\x8cr\
-\xdd0\xee\x8b\xaf\xb0h\xd1RX\xdc=Hys\xc0\
-\xc7\xdb\x17;\xf7\xec\xc6\xd8\x97_AjFzM\x1d\
-p\x08X\x0eV\xae\x5cEu\xcb\x0f\xf8\x8e\xea\x97\x99\
-T\xbf\xac\xd9\xb4\x01\x85E\x85\x12\x9f\xf2\xa46V\x0e\
-\xf9S\xa4\xaf\xbf\xfe\x06v\xed\xde%ay;\xaa2\
-\x5c\x9f\xdf\x86\xdai\x8e\x0d\x94\xcf|o\xf7%\xefG\
-\x01\xdd\xf7\xa4\xf6\xed\xd5;\x0au\xd6\x94\xacW\x01\xe4\
-\x87\xb0\xb7\xa7\x17\xda\xc7\xb7\x95\xc2\xb0y\x871\xff@\
-#\xb4m\xdf\x16={t\x97\x05:\xb9\xb7\x81\xcbt\
-hH(\x06\x0c\xe8\x0b\x1f?\xbf\xc3\xce\x99\xe4\xfc,\
-(,\xc4\x93O=\x8di3fa\xd3\x96-\x18\xfb\
-\xd2+\xf8b\xe2\x97\xb0;\xec\xecA\x09\xa0\x81t\xcd\
-\x13\x8b\x17/\xc5\x81\xfd\xc9\xe2\xe6\xfa\x00p\xf5\xeb\xc4\
-\xb4\xe3]=\xeef\x9c\x0c\x87\x17o.v\x1a\xcd\xf1\
-\x81\x17S\xb7#\xa9SG\xf4\xee\xd7\x13\xd5v\x9b,\
-}a\xb3VJ\xaf\xc79\xe7\x9de|\xef\xd4\xf0~\
-\x04\xa42\xcb\xc9\xc5\xdb\xef\xbc\x8f9\xf3\x17b\xe3\xa6\
-Mx\xeb\xedw1\xe1\xf3\x89\x22\x06u\x97\x95\xe1\xde\
-\xc7\xe2\x92\x12\xcc\x9c5\x1b))\xa9J\x16X\x0eL\
-o\x22\x18\xbc\xd5\x0eg\xca\xdcA\xb2g\xfa7q\xf1\
-w\x90_\x8d\xa6.n\xfc\xf2\x87\xbbL\x85H\xa0:\
-\x86{\xfa\xf8\xe9\xccvaaah\xdf\xa1\x03<\xdc\
--\x87\xef\x0d7\xca\xda\xfb\x1f~\x84\xf9\x0b\xe6`\xeb\
-\xf6\xedx\xfb\xdd\xf70a\xfc\x17\xd2\xab\xc8\xf5\x95+\
-\xfc\xb6}\x09\xc9\xc0\xb4i\xd3\x91\x95\x93#\xe5\xbfn\
-\xfd`\xee\xeb3\x93A\xed]\xa8\xaf.q\xfa\xd7\x1c\
-\x17\xf8>s\xc3w\xe7\xde}\xf0\xf7\xf5CbB\x07\
-5\xfc[\x87C\xf6\xf7r\x11k\xd7&\x0emcb\
-\xb1e\xe7N\xe4\x17\x15\x90\x8d\xbe\x89Lxp0\xa2\
-\xa2ZIoC~q\x01J\xcaJ\xe0\xe5\xeb\x8d\x8e\
-I\x89\xf0\xf1\xf24|\x1d\x1a~\x0d\xdb^U\x85\xcb\
-.\xbd\x18O?\xf9\x04^|\xfeY\xfc\xfc\xf3T\xec\
-\xdd\xb3W\xba\xea\x93\x93S\xb0b\xe5Jl\xdb\xb1\x0d\
-\x95T!J\x18\x8b\xc5\xd9}_XT\x84\x15\xabW\
-b\xe5\xea\xd5\xc8\xa6\xd6\x1b\xc3C\xc4\xeb7l\xc0\x8a\
-U+\xb1\x83\xeeW\x15\xc5/K\x09\x94\x96b\xdd\xba\
-uX\xb3v\xad\xb4\x00Yy\xe4E\xab7lXO\
-~W\xc9\x07\xa2\xf9\xb6VVZ\xb1a\xe3\x06,_\
-\xb1\x1c\xc9\xa9\xa9\x12\xa7Fsl\xa1\x8a\x84\xca47\
-\x9e\x02\x83\x82a\xab&\x05\xd0n\x85\xd5^\x05\x0fO\
-\x0fD\xb5\x8e!y\xe2EK\x0d\xef\x0d\x82<\x93\x98\
-\xdct\xc3\xf5$[\x8f\xe3r\x92\xb1\x8f\xa82\xac\xaa\
-\xb2Reg\xc7\x9e}{\xb1|\xf9r\xec\xdc\xb5K\
-*D\x89\x9bZl2\xc2A\x14\x16\x15c\xdd\xfa\xf5\
-X\xcd\xb2\x95\x93-\xc3c\xdc+\xb3e\xcbf\x09\xb7\
-k\xf7n\xd8\xaa(\x1c)\x93YYY$\x83\xab\xb0\
-b\xcd*\x94\x96\x95\x8a_\xeeMY\xb1z\x05\xc9\xe2\
-z\x14\x91\x9c\xb2\xbcUVVb\xdb\xf6\x1dXI\xb2\
-\x99\x91a\xcc\xa9\xd6h\x0e\x82J!U\xd2\xb1m\xa2\
-\xd1*\x92\xeb\x97\x12\xaaw\xf3\xa9\x91R\x04?\x7f\x7f\
-$uI\x84'\xd5/\xeeG\x90\x07\xae\xe7\xb9\xf2\xbf\
-\xf1\x86\x1b\xf1\xe4\xa3\x8f\xe0\xd1G\x1e\xc1j*\xbby\
-y\xf9R\xdc\xf7\xecU2\xb0e\xeb\x16\xe9\x05g\x85\
-\x92\x1bb\xd2qA\xe6\xe2\x92R\xacY\xbf\x0e\xab\xa8\
-~\xe0\x15.j\xca\xf0V\xa9\x1f\xcc\xfa\x85\xed\xb93\
-c\xed\xba\xb5\x22/\xf9\x05\x14?)z\xf9b\xb7\x9e\
-\xfc\xae\x10y`%\x91ef\xe7\xee\x9db\x97\x9a\xa6\
-\x1a[\x9ac\x07\x97\xa3Lz~%\xa7\xa7\xa1K\xa7\
-N\xf0\xf5\xf6\xa97\xcf\x0f\x9e\x03hB\x05\xc1\xc3\xd3\
-\x93Z\xe5vl\xd8\xb6\x05a\xc1!\xb2@\xb4<(\
-\xd5\xb3\xb2\xc5\xc1\x97\xcd\xfd}\xa5\xb6*X<<\x11\
-\x19\x1a\x86`\xff \xf9\x84^Ae\x19\xdc\xbd\xbc\x10\
-B\xf9\xc4s\x96\x0e\x97E\xa5\xd4\xe2\xfa\xea\xab\xafp\
-\xca\xa9\xa7 ::\x1as\x17,@A~\x01\xce?\
-\x7f\x0c\x96._\x81w\xde\xfb\x00\x1b7m\xc6\xcc\x99\
-3\xa9\x12)F\xf7\xee\xdd\xf1\xeb\xaf\xbf\x22)\xa9\x13\
-\xc2\xe8\x9co\xbc\xf96\x96/[\x8e%K\x97R+\
-o!F\x9d4\x02\xc9))\x98\xf8\xe5\xd7\x22\xb4?\
-\xff2\x15Q\x91\x91\x08\x0d\x0b\xc5\xb8\xf1\x9fa\xfa\x8c\
-Y\xd8\xbcy+\xda\xc6\xc5\xca\x03\xe0\x85\x97^\xc62\
-z\x00,\xa5m1\xc5\xd1\xb5sgL\x9b1\x03\xef\
-\xbd\xff!\x09\xe9ni`v\xef\xd6M\xd2Z\xdf\x9c\
-\x11\x8d\xa6y\xe09z@.Up<w\x96\xe5\xc9\
-\xdf\xd7_\xa6V\x14S\xc3\xa7\x8a\x1eX<'0\x80\
-*?5\x9b\xa9nY4\x1fh\xca\x9e\x1fp\xdc8\
-\xfa\xeb\xaf\xe9\x18\xd0\xbf\x9f\xacf0o\xd1\x22j\x04\
-\x95\xe1\x92\x0b/\xc0\xfc\x85\x0b\xf1\xe5\x97_Ich\
-\xc1\xc2\xc5\x22\xb7\xe1\xe1a\x22/#\x86\x0f%y\x09\
-\xc3\xebo\xbc\x859\xf3\xe7c\xf5\x9a5X\xb5z\x0d\
-:\x91\xcced\xa6\xe3\xf3\x89_c\xfd\xfa\x0d\xf8a\
-\xf2\x14\x84\x93\xbf\x84\xf6\xed\xf0\xe0\x7f\x1f\xc6\xe2%\xcb\
-\xb0i\xe3f$vJDnn\x1e^{\xedu\x0a\
-\xbb\x16\x0b)~\x96\xa5\x9e$\xbb\x93)\xcc7\xdf~\
-\x8bM[\xb6\x22 \xc0\x1f\x9d\x12;\xb2`I\x9a5\
-\x9a\x1a\xd4\x88RQy\x19\xfc\xfd\x02\xe4\xbb\xfc\x01\xbe\
-\xbe2\xef/\xbf\xb2\x02\x16w7D\xb5\x8a\x84\x8f\x8f\
-\x0f\xf9<t\xf9\xa9&\xb7)S~V2\x10\x12\x82\
-\xf5\x1b7I\x03\xe6\xa2\x8b.\xc4\xd6\xad\xdb\xf1\xfe\x07\
-\x1fJ\xfd\xf2\xebo\xbf\x8b\x02\x18\x17\x17Get2\
-\xce8\xe3\x0c\xf8R\xdco\xbc\xf9\x16\x16-ZBr\
-\xb2F\xea\x88\x1eT\x86\xb323\xf1\xf57\xdfa\x19\
-\xd5;\xbfL\xfd\x1d^T\xd7\xf1\x9ar\x9f\x8e\x9f\x80\
-\xdf~\xff\x93\x94\xc9\xed\x88h\xd5\x0a!\xd4\x90{\xf5\
-\xf57I.\x16\x93\xb2\xb7\x92\x14\xcd\x95T\x97t\xc5\
-\xa2%K\xf0\xf2\xabo`\xf7\xae\x9d\xa2WtJL\
-\x94\xa9S\xba~i~\xf89\xc8\xdb\xa2\x95\xcbP\x5c\
-\x5c\x8c\x91\x83\x87\x22\x98\x9e\xa3\xf5\xe9n\x87\xec\x01d\
-\xd8obB{\xf8\xfb\xfba\xfb\x9e]()-\x15\
-m\xbe%\xc3\x19\xcb\x8brZyaN\x86\x9b[T\
-\x88\xdd*\xabPUFv\xfc&\xf0\x11\xf2\x88\xbb\xdd\
-\xcb+\xac\x18?\xfe\x0b\xdcv\xfb\x1d\xf8\xe1\x87\xc9x\
-\xf0\xc1\xfb\x11I\x02\xf4\xc9'\xe3p\xf2\xe8\x91x\xe5\
-\xe5\x17p\xcf\xddw\xe2\xb3\x09\x9fc\xfb\x8e\xed\xf2`\
-`~\xa2\xcaj3U$/\xbf\xfc\x22^}\xe5%\
-$'\xa7b\xd1\xe2%\xe8\xd0\xbe=\x9e{\xe6I\xdc\
-x\xf3M\x22\xd0s\xa9\x12\xcb\xca\xce\xc6\x82\x05\x8bq\
-\xe5\x15\x97I|=z\xf6\xc0\x17T\x01fge\xe3\
-\xf9\xe7\x9e\xc1[o\xbc\x8a\x0d\x1b6\xe1\xef\xb9sD\
-\xd0\xfb\xf7\xef\x8fw\xde|\x83*\xcb\x8b\xb4pj\x8e\
-\x03\xfc\xe97jP\x15\x14\xa0\xb4\xb0@\x1a\x9b\xa6}\
-5)\x80E\xb9Y\xb0WY\xe9!\xc5e\xbf\xbe\xb2\
-\xc8v\xb5\xed\xb9\xccr\xcf\xc4{\x1f~\x84\xdb\xee\xbc\
-\x0b+\xa9A\xf5\xd4\xe3\x8f \x93d\xe1\x8b/\xbe\xc2\
-\x981\xe7a\xec\xd8\x17p\xde9ga<\xc9\x16\xf7\
-\xdaUW\xdbd\xa8y\xe9\x92\xa5\xc8\xcb\xcf\xc7\x13\x8f\
-=\x82'\x9fxL>\x9d\xc4\xf3\xa7:t\xe8\x88\x87\
-\xff\xfb n\xb9\xe5&$\xb4kK\x0d\xafe\xd2\x03\
-\xb2\x8d*\xbd\x9bn\xbc\x1eo\xbf\xf5:\xda\xc5\xc7\xe3\
-\xb7?\xfe@\x1bjd\xbd\xf0\xfc\xb3\xb8\xef\xbe{\xf0\
-\xf7\xdf\x7fc\xf3\xd6-X\xb4t1:u\xea\x88W\
-_\x1e\x8b\xd3\xa8\xd1\xd7\xb2\x9f\xa0\x9a\xc3\xc1\xd3\x12J\
-KJa\xab\xaaTM\x1eR\xfax\xf4\xa7\xba\xb2\x12\
-\x95T\xe7H\xefs\xbd\xb2\xe0\x02\x95iO\x8b;\xde\
-}\x9fd\xe0\x8e;\xf19\x95\xf3k\xaf\xbf\x8e\x87\x9e\
-\xa8\x81\xf3\x06n\xbb\xedf\xaa\x0f\xc6\xe2\x91\xff{\x18\
-\xdf}\xff\x83\xc4\xc9\xcf{\xfeb\x04O5\xda\xb5k\
-7\x9e\x7f\xfa\x09\xaa#\x9e\xc5\xd6-\xdb\xf0\x0b\xd59\
-m\xdb\xb6%\x19x\x087\xdfr\xb34~\xc6}6\
-\x1e\x19\xe9\xe9X\xb6|\x19.\xbd\xf4b*\xdb/b\
-\xc8\xa0\x81\x98=\xe7odfe\xe1\xd9g\x9e\xc2\x9b\
-T\xbf\x94\x92\xce0}\xc6L\x99\xe7\xce\x0d\xa7\xb7\xdf\
-z\x13\x17\x8c\x19#\x0a\xa4\xae_\x8e\x01ThX\xd1\
-+,.\xc2\xee}\xfb\xd0&\xa65B\xa9\x11`8\
-\x1c\xc4\xa1{\x00\x09VvX[\xaf\xb2Vb\xe3\xf6\
-\xedh\x13\x1d\x85V\xe1\xe1\xca\xb1\x85\xde<n1\xf1\
-\xd28V\xca\x93\x88\xd0py\xbd\x9a{'\xb8\xd0\x97\
-\x95\x96!,4\x14\x01\xfe\x01\x87\x15Q\x16\x8a\xaf\xbf\
-\xf9\x1ac\xce;\x0f\xa7\x9d~*U(\xcbIC\x0f\
-D\x9f\xbe\xbd\xf0\xe5W_Sl\x0e\xe9\xb1\xdb\xb3w\
-\x1f<<,\xe87\xa0?UN\xcb\xd0\xa5s\x17\xec\
-\xde\xbb\x17\x99\x99\x19t\xbel\xac]\xbb\x0eU6+\
-\xda\xb5k's\x98\xdez\xf7}\x11\xde\x94\xd44j\
-\xf9\x05\xe3\x02\x8a\x9f\xdf\xa8\x1c7\xee3i\x05v\xeb\
-\xda\x19\x93&M\x96n\xfd\xfc\xfc\x02\xe9\x09aA\x1c\
-\xd0\xaf\x1fN?\xed4|\xf9\xe5\x97\xf8\xfd\x8f?\x11\
-\x13\x13\x8dv$\xf0\x8c\x16R\xcd\xb1\x83\xcbV5\x0e\
-\xa4\xa5\x88\x0cEE\xb4\x82\x8f\x97\xb7\xb41\xf3I!\
-,(*FDp\x08\xc9F\xf0\xa1\x9f7\xdc\x85h\
-\xb8q\x85\xc9\xc3\xae\xdc\xe3=j\xd4I8e\xd4(\
-\xec\xdb\x9f\x8c\xd0\xd0\x10xzz\xe1\x93O\xc7\x93\xff\
-j\xe9\x059p\xe0\x00\x02\x02\x02\xa8\xd1\xd3\x0f?\xfd\
-\xf43\xce<\xe3tl\xdf\xb5\x13\x1b\xa9ATX\x90\
-\x8f\x0d\x9b6Job\xe7\xce\x9d\x91\x9b\x93\x877\xdf\
-~\x07\xdb\xb6m\x17\xc5/00\x00\xa3G\x8d\x94a\
-\xe5\x8fI\xb6\xd6\xaeY\x87^={b\xe6\xec\xd9\xd2\
-\xb8\xda\xb3{\x0f\xb6\xed\xd8!\x0b\xb0\x0e\x1a4\x00\x83\
-\x06\x0c\x12\xe5\xf0\xf7?\xffDll,\xda\xf0j\xfc\
-\xdcp\xd4h\xea`\xb3\xdb\xb0G\x96\xed\xf0Bdx\
-\x04)\x7f\x1eT\xc4\xdd\x90\x91\x9dIe\xbb\x00Q\xad\
-\xa2\x11\xe8\xe3wHy\xe0)\x15\xec\xf2\xe3\xa4\x9f0\
-\xea\xa4\xe1\xd2\xe08\x90\x9c\x8c\x22\xaa\x9bb\xe3\xe2\xf0\
-\xf5\xc4o\xa4\xb1\xc3\xcf\xfe\x9d;wJ\x0f;\xf7\xd0\
-\xfd\xf1\xfb\x1f8\xf7\xdcs\xb0q\xe3f\xec\xa2\xf2\x9b\
-Cu\xc4\x1a*\xd7\x15\x15\x152\x1a\x94E\xe5\xfa\x83\
-\x8f>\x91y\xb5\xbc@u\x0e5\xa8n\xbe\xf9&:\
-\x93\x1b\xbe\xfa\xea[\x19\x8d\xeaJ\xf5\x0b\xcb\xde\xee=\
-\xbbe\xe8\x97\xe5\xa2\x80\x14\x11\x0e\x7f\xc6i\xa7b\xde\
-\xfc\xf9\xf8\x96\x14N??\x7f$v\xec\x00\x8b\xd1y\
-\xa2i^\xb8!\xbdx\xf5r\xa4ffa\xf8\x80\x81\
-\x88\x890\x96\x7f\xa9\x0fR\xf2\x0e\x0d5Gx\xcb\xca\
-\xcer\xbc\xf7\xc5x\xc7\xd7S&9*++\xc9\x8e\
-\x1dZ t\xdd\xf4Pw\xac\x5c\xbf\xc6\xb1p\xe5\x12\
-G^a\x9e\xa3\xc2Z.\xdb\xba\xcd\x1b\x1c\x0b\x97/\
-q\x90\xa0\xb2G\xe5\xbf\x1e\xaa)\x8e\xf4\x8c\x0cG\x8f\
-\x9e\xbd\x1d\xd42\x92\xe3w\xdf\x7f\xdfq\xf3\xadwH\
-\xdcg\x9c3\xc61\x7f\xe1\x02\x87\xcdnw\xd8\xed6\
-#\x94\xc3q\xf5\xb578\xbe\xffq\x92\xe3\xd9\xe7_\
-t\xdct\xcb\xad\x14\x8e\xdd\xab$<Uz\x8e[n\
-\xbb\xdd\xf1\xed\x8f?8\xa8\x82r\xbc\xfe\xe6[\x8e'\
-\x9ez\x86BQ:\xc8}\xe7\xee\xdd\x8e\xdb\xee\xbc\xcb\
-\xf1\xdak\xaf9\xee\xba\xe7~\xf2{\xa7\xa3\xb4\xb4\x84\
-\xc2\xdb%n\x8e\x83\xb7\xdc\xbc<\xc7\xdd\xf7\xde\xe7\xe8\
-7p\xb0\xa3\xcaj\x15;\x8d\xe6XRe\xb39\x96\
-\xadY\xe9X\xb2j\xa9#\xaf \xc7QV^\xe2(\
-\xab(u\xec\xdc\xbf\xdb\xf1\xf7\xe2y\x8e\xe4\xd4d*\
-\xc5\x87(\x87\x5c>]\xca\xa8\x9d\xe2\xda\xbbo\x9fc\
-\xcc\x85\x978\x96.[.\xe5\xf7\xe3O>u\x5c~\
-\xd55\x8e\xd5\xab\xd68F\x8c:\xd91\x7f\xc1\x02\x91\
-\x1b;\xc9\x8f\xcdV\xe5\xd8\xbec\x87c\xc0\xa0!\x8e\
-\x993g:\xc6M\x18\xefx\xf0?\x0f;\x0a\x0a\x0a\
-\x1d\xd5${\xa6\x5c\x8c\xb9\xe0\x22\xc7\x97_~Ev\
-v\xc7\x17\x13':\x9ez\xeaY\x0ak\x13\xf9\xd9\xb0\
-q\xa3c\xc8\xd0\xe1\x8e7\xdez\xdb\xf1\xf4s\xcf\xd3\
-\xf9\xc6\x91\xecTR8\x92O\xda8}\xec/;;\
-[\xe4\xfc\xfc\x8b.uP\x85\xec\x94=\x8d\xc6\x95\xf2\
-\xca\x0a\xc7\x8c\x85s\x1ck6\xaf\x15Y\xb0VU:\
-\xacTN\xd7o\xdd\xe8\x986w\x86\xd4/.E\xbe\
-6Fy%\x83\xe3\xa2K\xafp,[\xbe\x5cd\xe2\
-\xd7\xdf~s\x9ct\xd2H\xc7z*\xab\x83\x87\x9eD\
-\xe5\xef\x80\x94O\xde\x98={\xf7:\xfa\xf5\xeb\xefX\
-\xb8x\xb1\xe3\xe3q\x9f:n\xbb\xe3.GqI\xb1\
-\xc8\x07\x97\xf9\x82\x82|\xaa3ns<\xf3\xecs\x8e\
-\xf2\xf2r\xc7[\xef\xbc\xeb\x18~\xd2(\xa9w\xf8|\
-,sg\x9cs\x9e\xe3\xb9\x17\xc6:^}\xed\x0d\xc7\
-\xfd\x0f>\xe4(-+\xa5sWIZL9*-\
--u\xbc\xfe\xc6\x9b\x8e\x0b/\xb9\xcc\x91\x95\x95E2\
-PS\xbfi\x9a\x09\xca\xe7\xe4\xd4\x14\xc7[\xe3\xc79\
-~\xfc\xe3W\xba\x0febw(\x0e\xdf\x0c\x15\xe5\xdc\
-!\xf3\xda\xbavL\xc4>j\xa9\xa7f\xa6KK\x9b\
-\xc2\xb2c\x8b\x83\xdfHt7^K\xa4\x8a\x84Zl\
-\xd5\xf2!{[\xb59|ud\xe8v\xc80\x95z\
-Q\xc3\x81A\xa4\xa5\xf3\xe4r\xee\x958e\xf4H\x8c\
-}\xe9U|\xf5\xf57\xf8a\xd2\x14j1\xfd(\xad\
-0\xfe8>/\x96{\xd6\x99\xa7c\xc7\x8e]x\xe9\
-\x95\xd7\xf0\xfb\x1f\xd3@\xc2H\xad\xad\x1c\x04\x05\x05c\
-\xd9\xe2e\xf8\xea\x9bo\xf0\xd3O?\xa1\x98Z^\xfb\
-\xf7\x1f\xc0\xdb\xef\xbd/\xf3\x02y\xf8\xc0\xcf\xcf\x0f\xb7\
-\xddz\x13V\xac\x5c\x81W^}\x13\xbfR\xab\x8f*\
-,\xa4\xa6\xa5\xe1\x87\x1f'\xe1\xef9s\xa5\x07%8\
-8\xd8H\xa9Fs\xec\xa9\xb2\xdb\x8c\xa1XsB:\
-\xc9\x14\x1d\xf3vX\xb8\xf7\xa0N\x0f\x02\xcbSee\
-\x85\xbc\x14\xc5\xf0\xfa\x9ck\xd7\xacA\xab\xe8H\x9cw\
-\xce\xd9x\xfd\xf57\xf1\xe3\xa4\x9f1q\xe2WX\xbc\
-t\x99\xc8!UD(/+\xc7\xa0~\x03d\xae\xd4\
-\x0b/\x8e\xc5O\xbf\xfc\x8a\x8f>\x1e\x87}\xfb\xf7\xcb\
-\xbc=\x9e\x22\xf1\xdd\x8f?\xe2\xf3\x89_\xd2\xf3\xafZ\
-\xa6W\x8c\xfb\xf43\xac[\xbf\x81\xe4\xd8&\xf3\xb2\x86\
-\x0e\x19\x82\x9f\x7f\xf9\x85d\xf2=:\xc7\x14|\xf4\xc9\
-\xa7\xd2[\xf2\xc9g\xe3\xf1\xe7\xb4i\xf2\x86r`@\
-\x80\xf4r\xd6N\xb5Fs0\x15\xd6Jy\xb9\xa8\x9c\
-\x9e\xfd\x22\x1fT\xb6Y6\x0e\x89\xd1\xfb\xc7\x9d\xe2\xfc\
-\xd2F\xa5M\xbd@\x18\xd3:\x06y\xf9\x85\xa8(\xaf\
-\xc0e\x97_\x8a\xfb\xee{@\xca\xf1w?\xfc\x88\xc5\
-K\x96\xaax\xe9\x8f_\x8a\x1a<h 6n\xdc$\
-u\xd0\xef\x7f\xfc\x857\xde~\x07%ee\xd2S\xb8\
-s\xd7n\xfc8y\x0a~\xfb\xedw\xf9HDNN\
-\x0e&|\xfe\x05\xd5'\xabPUi%=!\x08\x97\
-\x5cr1\xd6\xac]\x87\xe7\x9e{\x11\xbf\x90\xbfq\x9f\
-M@ZF\x06\xbe\xfc\xea\x1b\xfc\xfa\xdb\x1f\xf2\x02\xa2\
-\x9f\xaf\xaf^s\xf3X@\xf7\x91u\x84\xad;w\xca\
-3\xb0_\xf7\x9e\xf0\xf5\xf6>\xe8\x19\xe9\xcaa\x87\x80\
-\x05.T\xb4\xf1P\xe1\x9e\xfd\xfbPXR\x8c\xc4\xb6\
-\x09\xb2h\xe4\xe1\x22>\x11\xe1\xee\xf5*\xaa\xa42\xb2\
-\xd3I\xc1*ALt\x94\xbc\x04\xc2\xaf\xeb\xefOI\
-F\xa5\xb5\x02\xadZE\xca\xe2\x9d\x87\xcb\x19\xae\xa4\xf8\
-\x95\xfbaC\x87 22\x12\x01\x81\x01r\xc3:v\
-h\x8f\x93G\x8f&\x01\xf1\xc3\xc2E\x8bD\x81\xeb\xdc\
-9\x09]:wFAA!\xbav\xe9\x22\x13{{\
-\xf7\xe9\x8d\xb9s\xe7a\xeb\xb6m\xb0\x93\xb4\x9fq\xda\
-ih\x97\xd0N&\xae\x97\x95\x96\xca<\xa7V\xe1\xad\
-\x90Da\x97.[\x86uk\xd7\xa3[\xb7\xee\xb8\xe9\
-\xa6\x1b\x10\xdb&\x16}\xfa\xf6\xc6Z\xb2\xdb\xb4i\x93\
-,[3h\xa0R@\xa7O\x9f\x8e6\xad\xdb\xe0\xd1\
-G\x1e\xa6\xebh%o+\xb7\xb4{\xac9\xde8p\
- -\x15%\xa4\xb0\xf1\xb7*\x83d\xb8\xd7]\x16\x86\
-\xe67\x0c[\x85\xb5B\x08U>\x0d)\x87\xdc$e\
-\x85\x8e\x17v\xee\xdb\xbb7\x22\x22\x22\xa4\x1c\x97\x94\x96\
-\xa1C\xfb\x04\x19\x86*\xa9,\xc7\xa2E\x8beHk\
-\xe0\x80\xbe\x88$y\xe5\xb9\xcd\x83\xa8\xe2\xeb\xd1\xb5\x1b\
-\xc9IWyYc\xd3\xa6\xcdRQ\xb1=\xcb\x1c\xdb\
-\xf1\x1b\xf77^{-\xc2\xc2\xc3\x91\x94\xd4Q\x1a`\
-<\x1f\xf7\xcc\xb3\xce\xc05W_\x85\xc4\x0e\x1d\x10\x1b\
-\x1f\x87%T\xa9\xee\xda\xb5\x8b\x9e\x0f1\xe8K\xb2\xca\
-o\x1c\xb3\x1d\xa7\xed\xbe{\xefE\xdb\xb6qz\x08X\
-S/<\x04\xccu\x09\x13\x17\x13+KxxR\xfd\
-\xb2/\xf9\x80(u\xd1$#\x81T\xbf\x1cR\x1e\xc8\
-\xde\xcd\xcd!sY{\xf5\xe8)\xcb\xc7D\xd0\xc6\xeb\
-\x5cv\xa4\xf2y!\xd5\x0d\xac\xd0\xadX\xb9Z\x14:\
-\xfe\x98Al\x9b\xd62\xddb\xe8\x90\xc1\xe8\x92\xd4\x19\
-\xc3\x87\x0f\xc3\xf2\x95+eU\x09\x1e:\xe4\xfa\xa5[\
-\xd7.\xd8\xbbw\xaf4\x88N?\xfdT\xc4\xc7\xc7\x93\
-\x5c\xf4\xc7\x92\x15\xcb\xe5\xc5\x90\xd1#G\xe2\x86\xeb\xaf\
-GTT$z\xf7\xeeIJ\xe0zl E\x92e\
-h\xe8\x90\x81\xd8\xb3o\x1f\xe6\xcf_ \xb2}\xfb\xad\
-\xb7 !\xbe\xad\xccm\xd44#\xf4\x00L\xa7\x06\xe7\
-\x82\x15\xcb\xd0\xaeu,\x86\xf4\xedO\xcf\x19^6\xc8\
-p\xaf\x077RF\x8e\xdc\x95G^\xf8\xc5\x85E\x14\
-\xf1\xe2\xd5\xabp\xce\xc9\xa7\xa0G\xe7\xae2i\xb4E\
-5e)\x1fl\xd4\x12\xdb}`?U\x069\xe8L\
-\x02\x15\x16\x12\xce\x83\xee\xd8\xb8}\x0b\x09V)\xba&\
-vF\xa8TX\x87\x7f\xc0sK\xce\x1c\x977o\x01\
-\xcb\xb4\xf3n\x98\x06\x11hu(\xf3\xf1\xc8 .N\
-\x8f|*#\x1en\x1d\xb2\x1f9`{~\xab\x8c\x0c\
-\x12\x98\x9d\xc8\x9f\x11\xae\xe6\xb6S\xfc\xae\xfe\xd8Fz\
-8\x8dx4\x9ac\x8a\x03\xbb\xf7\xedENq!:\
-\xc4\xc5#,8Tz\xc6w\xa7\x1c@~~\x1e\xba\
-w\xea,J\xe1\xd1\x94F.\xcbT\x07\xaa\xeez>\
-\xa6F\x929\x97\xb5V\xaf\x22\xc9\x0d\xdb:\xdd\xe5\x80\
-\xe4\xcb\x94\x0d\xb2s\xca\x9c)\x1bt\xcc&\xd9\xb3\xbc\
-)KcW[\x8e\xd8\xbe\xae\x9d\xc8\xa0\x18\xd4N\xa3\
-q\x85{pV\xaf_\x037\x8b;5H\xba\xc3\xcf\
-\xdbG\xe4a\xcd\xd6\x8d\xd2\xb8\xef\xdd\xb5\x07\xc2\x82B\
-\x9ce\xeePp97\x9f\xf7\x5c\xf4\x92\xd3S\x11\x11\
-\x1a\x06_\x1for\xe52\xe8ZF\xd9\x1b\xc9\x00\xd9\
-\x1b\xb5\x8b\xb3\xbc2\x5c\xbf8eB\xf6|n\xf2/\
-\xf5\x86i\xa7\xfc\x09t\xe8\x943\xa7\x0c\xd01[q\
-P\xc3N\xd3\x8c\xd0=\xa8\xb2\xdb\xf1\xe7\xdf\xb3\xb0\x93\
-\x9e\xa7\x17\x9fy6\x12\xe2\xda\xaa|>LV\x1bw\
-\xec\x08P$\xfc}\xe0^]\xba\xc9P\x07/\x0bS\
-\x5cZ\xe2\xbc\xf1-\x06\xca\x07Vz#\xc3\x22\xa4e\
-\xc6\xbd\x08T\xb4E9\xe6\xf5\xf6b\xf8\x15}\x12\xd8\
-\xc3\xe6\xb8\x93\x1a?5\xc2p(\xc1p\xb1\xab\xd7\xbd\
-\x1e\x0e\xf2fX44\xbcFs\x9ch\x15\x1e\x01\x0b\
-=K\x96-_!S\x1d\xf8%+\xee\xddn\x1d\x19\
-\x0d\xef#,\xa9tH\x0c\xe5\xcf\x09\x1f\x8aU=\xb1\
-9\xdd\x1aO\x83+\xb4f8\x97\xe6\xc4\x84kS\x1e\
-\x1am\x1d\xd3F\xea\x99\x8a2^u\x03\xb2Pse\
-e\x95|\x98\xc1\x97?\x8b\xd8\xa0j\xd7(dT.\
-YQ\x8b\x8di\x0d__\x1f2\xd7\xd7#TS(\
-\xb9\x1c\xd7W\x96k\xd99\x8d\xae\xfe\x0e\x0eS\x1br\
-7\xbc4XV4\x0d\x82\x95s.\x12\xc9\xa9\xc9\xb2\
-ZKRB{\xc4\xf0\x92}\x9c\xcdG\xc8\xea\x86)\
-\x80\x06<7lp\xaf>HIK\xc7\x8e\xdd\xbbU\
-9laJ \x0f\x8b\x86\x04\x04 6*\x06\xf3\xe6\
-\xccCAA\x01f\xfc=\x1b{\xf7\xefG\x5c\x9bx\
-Y[L\xe5\xfc\xe1Q\xbdl5\xb8\x0a\x85\x08!\xf7\
-N\xf0f\xd8\x1f\xd2\xddlu\x11\xa6\x7fs\x13;\xd3\
-\xafq,\x98v\xb2\xd5\xf1G\x1b\x1d\x89\x9dFs\xec\
-qC\x80\x9f\xbf|S{\xe1\xa2%H\xcf\xc8\x94u\
-\xfc\xca\x0bK\xa8A\x15\x05o\x8f#/\xac^\x97Z\
-e\x9dp\x9556;\xcb\xbeiw(\xd90\xed]\
-e\x83\xcd\x86\xfdA\xfe\x086\xd7\xb5w\xb5\xd3h\x0e\
-\x05\x97\x16~3\xb65U\xde\xd6\x8a*|\xfc\xc9g\
-2\xec;w\xde<\x94\x97\x14\xa3uTky\x83\xf7\
-\xa0\xc6M=\xb8\x96IF-\xeb\xa5\xca\xdf\xa1\xca\xa8\
-\xebc\xdf\xe9N\x9b\x893\x9c\xb1\xafe\xe7\x9a&\x8e\
-\xca\x08\xeb\x1a\xbfi\xa7i^8\x87\xb9Cn\xd1\xaa\
-\x95\xb2\x02I_\x99\xfb\xe7\xc3\x99\xae<\x1c\x86\x86\xdf\
-\x0d\xbe\xa9\xb4\xeb\x9e\xd4Y\xd6\xab[\xb2v\x95|Y\
-\xa2%\xc2*oxh\xa8\xcc\x1d\xfa\xfe\xfbI\x98\xfe\
-\xe7\x0c\x9c~\xd2HxR\xeb\xad\x01\xb2\xa9\xd1h\x5c\
-\xe0\xca)\xb1]{\x8c<i\x84\xbc\x98\xc4\xdf\xe7=\
-\xfd\xf4S\xa4\xb23+\x10\x8d\xa6\xa5\xc0s\xca\xfb\xf5\
-\xee\x8d\x82\x82\x22\xfc5c\xba,\xc7\xd2\xabK\x0fx\
-\x90\x02'\xd3\xae4\x1a\x03\xee\xfd\xab\xb2\xd9\xb0~\xd3\
-&\xa4\xa4\xa7aP\xef>\x88\x89\x8ajP#\x819\
-\xba\xd2D\x0fcn\xad\xf7\xed\xde]>\x8f\xb4z\xd3\
-zT\xf3+G\xbc\xb5 \xb8\x17\x90\xffF\x8e\x18\x81\
-\x99\x7f\xcf\xc6\xe0\xc1\x03\x11\x16\x1cF.\x9c\xe9\xba\xc2\
-\xd2h\x8e\x0aC\xc9\xeb\xdd\xa3\x07\x96-]*k\xf2\
-\xf1\x1a\x9b\xba\xb7@\xd3R\xe17\xc5\xcf?\xef\x5cY\
-c\xaf_\xdf>\x08\x0d\x0e\xd6\xf2\xa0\xa9\x0d\x8f\xbe\x92\
-\xee\x95\x9e\x95\x89u[7\x93\xe2\xd7\x0a]\x12\x93d\
-\xba^C9\xf2[\xc0\x07\xe1\x86\xe0\xa0`\x14\x15\x15\
-b\xeb\xae]\x88\x0a\x8f\x90\xcf\xcd\xb4\xa8\x96\xbaq\xad\
-AAA(/\xaf@\xdf>\xa4uGGk\x01\xd5\
-h\x1a\x097\xa8\x02\xfc\xfdP\x09;\x06\xf4\xedK\x0d\
-\xcd\x00\xa7\x9ci4-\x09\xb3.\x0d\x0e\x09F^a\
-6N?\xfdLY\x8aM\xbf9\xaeq\x85W%\xe1\
-\xa5\x82f\xce\x9f\x8b|\xd2\xc7\xce8i4\xa2\xc2\x22\
-T\xf9i\xe0\xa3\xf3\xa8K\x14\x8f\xf5\xf3\xf7\x02\x87\xf4\
-\x1b@\x05\xd2\x0dK\xd7\xadFaq\xb1\xbcI\xd7\x92\
-\xe0L\xe6/\x09\xf4\xea\xdd\x9b\xf6\x81\xba\xb2\xd2h\x9a\
-\x08\xbf\x85\x18\x1b\x1b\xd3\xe0\x87\x97Fs\xa2\xc2\xb5\xa9\
-\x8f\xb77\xbat\xef._\x83\xd2\x22\xa1q\x85\x87~\
-y\xdd\xc6U\xeb\xd7aOj2\x06\xf6\xea\x8d\xb8\xd6\
-mx\x12\xe9Q=?\x1b\xd5\xa4\xe0\xd6zdD+\
-\xf4\xef\xd1\x1b\xc9i\xa9\xd8\xb8m3x\xa1\xca\x96\xf6\
-B\x88\xbc}\xf3o\xb8\xe6\x16\x96\xef\x9a\x13\x14zp\
-\xd9\xecj9\x8a\x7f\x05,VZ\xb64\xff\x00f\x1d\
-.K\x14\xfd\x93\x13\xcb\xb9\xfck\x19\xf8W!w\x83\
-\xee\xc9\xfe\xe4d\xac\xd8\xb0\x0e\x1d\xe2\xe3\xd1\xbbkw\
-xyx9\xcbMCi\xdc\x93\x96\xce\xc2'\xea\xd9\
-\xb5\x1b\xda\xc7\xc6c\xd9\x9a5HMOWn\xba\xac\
-4\x1c\xca+^\x1c\xb6)s(Y\x01\xe5\x95\xdcu\
-\xc6kN\x04x\x11[\xfe\xd2Fs\xc0\xdf\xc4<\xec\
-\x97\x13\x8e\x80\xa4DW~\x9a\x7f\x1c^l\xec\xe8\x91\
-\xba\x81\xca\xbf\xd41\x8d\x84\xcf+\xf3\xfc5\xff\x1a\xf8\
-\x99\x96\x9d\x9f\x87E\xab\x96\xcbH\xe4\xa8\xc1\xc3\x11\x1c\
-\x18\xd4\xa8\x86B\xe3\x9b\xdat\xe2 \xff\x00\x0c\x1d8\
-\x08\xbe\xbe\xbe\x98\xbdx\x81|<\xbd\xa5\xb5\x16\x1a;\
-\xf2+]\xb8v\x1bRRSQ$k*\x1a\x0eG\
-\x85\x03\xb9yy\xf8u\xea\xaf\xf2\x09\xb7\x7fEo\xa4\
-F\xd3h\xd4\xcbU\x96fx\xd3\x91e\x81\x97f\xca\
-\xc9\xcdk\xd4\xf4\x14\x0e\xbf}\xc7\x0eL\x9a\xf2\x13\xec\
-\xa4Hj4\xff\x04,\x0f\x8d\xe9 \x90\xfa\xa5\xca\x86\
-\xe4\x94\x14\xf9\x1cac\xea\x17\x8ec\xd7\x9e=\xf8\xf9\
-\x97\x9f\x9d\x9fV\xd4\xfc\xb3\xf0=\xe1{1\x7f\xe9\x12\
-\xf9\x1c\xe5\xc9C\x87\x22:\xa2\x15\xb94N\x11i\xd2\
-\x93\x96\xb5\xcf\xd6QQ\x18\xd4\xab7\xd2\xb2\xb2\xb0b\
-\xfd:\x94[+%\x91'<t\x8d|\x9d\xc5\xa4x\
-\x95\x97\x97)A=\x0aX\x8b\xdf\xb7\xff\x00\x9ez\xfa\
-\x19|\xf9\xf57$\x9f\xf4g\x08:\xc7\xcb\x9b\xd9z\
-s\xe6'\xed8\x1c\xdbq\xa5\xc4-\xb3\xb4\x8ct\xbc\
-\xf1\xce{T\x18r`\xb7\xd9\xc4\xdd\x14\xf6Zq\xd4\
-\xb17\xdd\xc8\xa0,5\x9a\x7f\x10.\xff<\x8d$5\
--\x13\xd9y95e\xbe\x91X\xadV\xfc\xe7\xbf\x0f\
-\xe3\x8b\x89\x13\xe5\xd3p\xaa\xfc\xb3\x8c)Yp\xca\x85\
-\xcby\xea\xca\xcb\xf2\xe5+\xf1\xca+\xaf\xa1\xb2\xa2\xf2\
-\xe0\xdeD\x17\xbf\xbc\x89\x15m\x12\xd6pk\xea5h\
-Z6,\x13\xc5\xe5\xa5\xa8\xa8\xaa8\xea\xfa\x85?N\
-\x90\x96\x9e\x8e\x17^\x18\x8bO>\xfd\x0cv\x07\xd7\x17\
-\xaa\x9c\xba\x96\xd1\xba\xe5\x94\xeb \xb6S\xf5K5\xd6\
-\xae]\x8bW_}\x0d\xc5\xc5\xc5N;.\xfb&\xf5\
-\xc9\x12\xef\xcd\xf8]\xe3\xd64\x11\xcaK\xfen\xf9\x8a\
-\xf5k\xe4k\x1f\xbd\xbbwG\xe7\x0e\x89\x90\xf6r#\
-;\xa2\x9a\xd6\xd4\xa6\x93\xca\x17B\xba\xf5@\x97\xf6\x1d\
-\xb0z\xd3\x06l\xdd\xb5\xe3\xa0Br\x22\xc2\xc2i#\
-\x81\x08\x0a\x0bDie)]3U\x10\x0d\xbdf\xc3\
-\xdf\xaaU+\xe5[\xa2_\x7f\xfd-2\xb3\xb2%?\
-9\x8e\xb2\xb2r\x99\xe0YXX\xe4\x14<\x13>'\
-\xf7\xf6\xf1\x02\xd4\x5c\xc9q\x18V\xc4\xd9\x7f\x11\xf9-\
-\xaf\xa8 _5\x82\xc8\xcb\xf5\xe4\xe7\xe7\xcb\xf7\x1f\xcd\
-\xcf\xf3p8^`\x94W\x98\xe7O\x0fi4\xff8\
-TV\xf9\xc3\xf7\x03\xfb\xf5\xa1\xd2K\xe5\x99\xcb|#\
-{>\xb8RZ\xb0h\x11J\x8aK\xb0e\xeb6\xe4\
-\xe6\xe7\x89=\x0f\xe7\x16\x97\x94J\x99\xe7\xd1\x0a\x96\x17\
-Sfy\xcf\x9f\xdc\xe2\x8f\xdc\xb3\xbc\xf0\xdaZ\x0c\xcb\
-VEe\x05\xf2\x0b\x0ai_\xa9\xd2d$\x8be\x93\
-\xfdr\x8b\x5c\x1ao\x14\x07+\x9b,_\xa5\xa5\xa5$\
-\x93\xba\xe7P\xd3\x08\xa8(\xb1\xc2\xc7\x0d\xfc\xf0\xa0P\
-\x94R\x99\xad&\x05\x8e\xcbW\x83 \x7f\xfc\xdaHJ\
-Z*R32\xe4\xdb\xd7\xc5E\xc5T\xd9+-A\
-\x9e\xfbTF\xb9\x1eq\xd6/F\xd4<*\xc52\xc0\
-\xdf\x9egy\xe0\xf2\xcfC\x8b\xa6}\x05\xd5/f*\
-\xb8\x9e\xe7\xfa\x86e\x80\xcb\xbb\x92\x01\x88<\xb0\xbfb\
-\xf9\x82\x09\xc9\x8c\xa6\xe9P\xde\xf2\xf3d\xed\xe6MX\
-\xben\xad|\x86vp\x9f~\xf0\xf1\xe4O\xfb5R\
-\xfb#\x1a\xb1\x0cLm\xb8\xa0z\xb8\xbb#&:J\
-\x16\x22\xdc\xb4}\x1b\xe2\xa2c\x10\x12\x14,\xaeMH\
-\xdb\xbf\x16V\xf6\xb8\x82\xb0Z+E@\xec,\xa8a\
-ab\xe65\x02\xc9`\xf8\xac\x1f\xf9t\x1c\x09\xde\xbb\
-\x1f|\x84\xd3N=\x05{\xf7\xee\x83\xb7\xb7\x17z\xf7\
-\xea%\x8a\xdd\xd3\xcf=\x8f\xdd{\xf6\xe2\xfd\x0f?\xc0\
-\xf7\x93&\xa3m\xdbx\xb4i\xdd\x9a\xc2\x94`\xd2\xe4\
-I\x18\xfb\xf2\xab2\xec\x1b\xe0\xef\x8fV\x11\xad0y\
-\xca\xcf\x22h\x9f|\xfa)VS\x8b\xadg\x8f\xee\x08\
-\xf4\x0f\x10\xf3+\xaf\xbe\x8a\x1f~\x9c\x84\xbf\xe7\xccC\
-\xfb\x84v\xf2q\xfc)\xbf\xfc\x82\x9f\x7f\x99\x8a\xcf\xc6\
-\x7f\x8e6\xb1m\xd06>^\xd2\xc5\xe9\xd7h\x8e+\
-TY\xb1\xb2WRZ\x22\xca\x13\x7fJ\xb1\x92\x14.\
-\x1f_^\xc9\x9e\x1ePn\x5c\x95\xb1L\x19\xfe\x1b\x00\
-W\x9c/\xbf\xfa\x1a.\xbc\xf0|\xa4\xa6g 8(\
-\x08I\x9d:I\x8f\xc8\xfd\x0f\xfe\x07;v\xed\x92^\
-\x91o\xbf\xfd\x16\x1d:vDl\x9b6\xa2\x10~\xf4\
-\xe1\xc7x\xf7\xfd\x0f\xf0\xed\x0f?\x22$4\x04V\x92\
-\xa99s\xe7\x223;\x1bo\xbe\xf3.\xb6l\xd9\x82\
-!C\x87\xc8[\x99k\xd6\xaf\xc7\xa3\x8f=\x89\x9f~\
-\xfe\x09\x8b\x17/FRR\x12<=<\xf1\xd8\xe3O\
-b#5\xea\xbe\x9b\xf4\xa3|\xf0>*\xb2\x15U\xa0\
-M\x1f\xd2\xd6\xb4\x1c\xb8\xa1\xce=v\xa5\xe5\xa5\xb2\xbc\
-X\x95\xcd\x0a?\xbf\x00\xe9li\xc83\x9a\x1b:\xdc\
-c\xfd\xc9\xf8\x09\x184\xa0?rs\xf3D\x89\xeb\xd1\
-\xb5\x1b)uV\x5cq\xcdu\xd8\x7f\xe0\x00&|\xf1\
-%~\xa0\xfa\xc5\xdf\xdf\x17\x09T7\xb0\xc2\xc6\xa3Q\
-\xaf\xbf\xf1\x06~\x99\xfa\x1b\xbc\xbc\xbcD\xa9\xfb\xe3\xf7\
-?IY,\xc1\x87\x9f|\x8auT\xa7t\xef\xd6\x0d\
-A\x81\x812E\xe2\x8d7\xdf\xc6\x97_}\x85i\xd3\
-g\x22:&\x1aqq\xb1\x22{\x0b\x16.\xc2g\x9f\
-\x8d\x87\xc5\xd3\x0b];'I\x9d\xa8\xeb\x97\xc6\xc3\xcf\
-\xb4-;\xb7a\xce\x92\xc5\xf2)\xda\xb3O>U\xee\
-AS_\x10j\xfa\x93\x89\xcfO\x89\xe0O9\x8d\x18\
-0\x18^t\xc3\xe7,]B\xad\xee|j\x0c4\xb0\
-\xc5\xf2?D\x95\xb5\x8a\x14\xddt\xecOI\xa6\xd6U\
-:\xca*\xca\xe1aqGaI\x11\xf2\x0b\xf2\xe4\x93\
-,f\xafB\xbd\x90\x13\x0b\x02\x7fE\x84\xd7u:y\
-\xf4(\x9cu\xe6\xe9X\xbf~\x83(\x96\xd5\xf6j,\
-]\xba\x0ck\xd6\xac\xc1-7\xdd\x84\x9e\xdd\xbb\x89\xa2\
-\xc6s\xfd\xfe\x9c6\x0d\xbf\xfd\xf1'\xae\xba\xf2r<\
-\xf1\xc4c\xe8\xd9\xab\xa7\xb4\xc2\x0a\x0a\x0bH\x88\xfdp\
-\xdf\xbd\xf7\xe0\xc0\xbe\x03\xf8\xee\xfb\x1fPJ\x95\xe9;\
-\xef\xbf\x8f\xa8\xa8(<\xfd\xf4\x93H\xa4\x16\xc33\xcf\
-\x8f\xc5\x81\xe4d\xe4Q\x5c?\x93\xd28x\xd0 \xa9\
-\x189=Z85\xc7\x1b\x96\x13\xee\x99.(\xca\xc7\
-\xde\xe4\xfdH\xc9HCAq\x91<7x\x9dQ\x96\
-\xa7\x92\xf2b\xaa\x00\x8f\xa2\x97\x9a\xe2\xdc\xb3o/\xb6\
-m\xdbNru&\xbau\xe9\x82?\xff\xfaK\xce\xc5\
-=\x1d[\xa9\x05\x9dAJ\xe1\x1d\xb7\xde\x8a.]\xba\
-\x8a\xd2\xc7\xbd\x15\x13\xbf\xfc\x0a\xbf\xfd\xf9\x07n\xbb\xf5\
-\x16<\xf5\xf8c\xe8\xdc)I\xe4\xb3\xbc\xb2\x0a=H\
-\x06\xef\xbb\xfb.,_\xb1\x0a+W\xad\xc2\xf6\xed;\
-\xf0\xe4S\xcfR\xfcg\xe0\x19\x92-\x7fj\x88\xbd\xf3\
-\xde\xfb\xa8\xa4\xca5\x83\x9e\x09\xbf\xfe\xf6;N\x1b}\
-\x8aT\x86Z\xf9\xd3\x1c\x0d\xdc\xdb\x9c\x96\x99\x81\xbc\xc2\
-|i\x14UT\x96S9\xb4\xc0ZUI\x0aZ!\
-\xca\xa9\xbe9\x5c\xfd\xc2n\xdc`\xca%\xd9\xd9\xb4q\
-\x13\xfa\xf7\xeb\x871\xe7\x9d\x8bi\xd3f\xa0\xdcZ.\
-\x9d\x0f\x1b7n\xc6\xb6-\xdbp\xf3\x8d\xd7\x93{o\
-|\xf0\xd1\xc7HNM\x95\xfae\x1a\xc9\xca\xf5\xd7_\
-\x87G\x1fy\x18\xbd\xa9~a\x19`\xf9\x8b\xa1F\xd2\
-\x83\xf7\xdf\x8b\x0d\x9b6\xe1\xef9sI9-\xc7K\
-\xaf\xbe.2\xf5\xf4\x93O\x92\x8ct\xc7\xfb\x1f|(\
-\x9d\x19\xd9\xd99\x98G\x0d\xa7Q#G\xa1_\xef^\
-\x12\x87\xae_\x1a\x09\xdfj\xdav\xef\xdf+\xca\x1f\x7f\
-\x0bz\xf4\xd0\xe1J\xf9k\x86<m\xb6\xa7\x93\x85\x94\
-\xa0vqq\x189p\x082s\xb31o\xd9\x22\x14\
-\xd2\xc3\x5c\x86\x83O\x04\xe4F8\xb0}\xcf\x0ex\x93\
-\x92\xcb\x1f\xd7n\x1b\x1b\x8f\x8e\xed:\xa0cBG\xba\
-!\xc1\x08$%\xb8\xb4\xacD\xba\xd6\xcd\x1bW\x17\xae\
-\xdc\xf8\xc6\xad\xdd\xb0\x0e;\xb6m\xc5\xac\xbf\xe7\x223\
-+\x0b[\xa8b:p Y\x14\xea\xc0\xa0 \x5cx\
-\xc1\x058\xf5\x94\xd1\xb8\xe4\xe2\x8b\x91\x9e\x91\x81\xac\xcc\
-,\xcc_\xb0\x10\x17_x!.%\xbb\x81\xfd\xfb\xa3\
-}\xfb\xf6R\xc1D\x93\x92w\xd1\x85\x17`\xe4\xf0\x11\
-\xe8\xd6\xb53\xf6\xec\xd9\x8d\xcc\xec,dfd\xe2\xde\
-{\xeeF\x97\xce\x9dq\xe9%\x97\x90`fb\xd7\xce\
-\x1d\xf0\xf7\xf5\xc3\x981\xe7\xe2\xbe{\xee\x92\xcf\xfai\
-4\xc7\x1dj\xd1\xda\xabm\xd4P\xcc\xa5g\x87'\x12\
-I\x86\xba\x90\xd2\xd5.6\x16\x09\xf1\xedd\x99\xa9\xe0\
-\xa0P\x19N*(.<l\xa5\xe7\x84\xe2\xe4\xde\xc4\
-\x993gK\x0f\xfbW_\x7f\x83\xb5\xd4\x90\xfa\xeb\xcf\
-\xe9\xc8\xce\xc9\x91\xef\xacret\xce9g\xe3\x8cS\
-O\xa5\x06\xd6\x0d\xd8\xb5k7rrsH\xb6\x16\xe1\
-\xd9\xe7\x9f\xc6Yg\x9d\x89\x91#\x86\xa3KR'y\
-v\xf1\x17\x18.\xbd\xe4b\x5cp\xfe\x18\xa9\x10\xb7P\
-\xc5\xb9`\xe1B\x99`\x7f\xf1E\x17\xa0G\x8f\x1ex\
-\xea\xa9'\xb1y\xeb6\x92\xaflx\x93l\x9dr\xf2\
-h\x92\xd1\x0b\x11\x1e\x1e\xae+>M\x83\xb1Z+\xb0\
-?\xf5\x80\xac/\x1b\xe4\x1f\x88V\x11\x91\x08\x0f\x09G\
-\xeb\xa8\x18\xf8y\xfb\xc1\xdb\xcb\x07ET\xa7\xaai>\
-\x87\xc3!\xf3\xcbwn\xdf\x86\xbf\xa6M\xc7\xaa\xd5\xab\
-\xb1~\xed\x1al\xdc\xb0\x19\x1e\x16\x8b\xc4\x7f\xc6\x19\xa7\
-\x91\x826\x02\xe7\x8f9_\xe2-+-\xc3/\xbf\xfc\
-J\xb2q\x0e\xce?\xf7\x5c\x0c\x19<\x08\x89\x89\x89\x12\
-[TT$\xae\xbe\xe22\x9cq\xfai\x186t(\
-\xc9\xc0Vi\xe8l\xde\xb8\x117\x5c\x7f-\xbau\xeb\
-\x8a\xeb\xaf\xbb\x86\xd2_\x85-[\xb7\x22,,\x14\x1d\
-\x13;\x89[\x87\x0e\x1d\xa4\xf7O\xd38x^\xf4\xbe\
-\xe4\x03\x98\xb1`>,\x1e\xee8u\xf8p\xc4F\xc7\
-4\xdbs\xa5Y\x9b\xa7\x1e\x16\x0f\xf4\xe9\xde\x03\x83\xfb\
-\xf4\xc5\xf6\xbd{1\x8f4V\xee!k\xd0\xc3\xfb\xdf\
-\x0e\xe7\xb7d\xba\x1b\xb2\xf3rE\xd1\xe3\xd6Y\x05]\
-\x1f\xbf\x04\xc2\x02\x94E\x15IFf6\x1cn\x87\x99\
-\xfbCy\xc1\xf3\xf5\xbe\xfd\xfa\x07t\xe9\xd2\x05U\xd4\
-\xe2\x0b\xa6J&0(\x18\xabW\xaf\x95\xee{O\x0f\
-\x0b\xbc\xbd\xbd\xa5\xe5\xe7\xe9\xe9\x09\x1fR89\x1cW\
-H\xfc\xc65\xc3\x05\x80SSm,\x99!\xad,w\
-\xd5\x93\xc7\xdf\x8b\xe4\x96\x99\xbb\x9b\x03\xee\x1675t\
-\xc0\x8a'\xff:\xdc$L\x04U\xb0>>>\x12N\
-\xa39\xeePYuw\xb3\x90\xf2gAjf:\xca\
-I\x96\xacUV\x99\xb3*\xf2D[~~\x9e\xc8\x9a\
-\x17\xc9@C\x1ex\xdc\xb8\xe2\xa9\x10\x9b\xa9\x12\x1a9\
-\xea$\x99\x97\xd4\x89\x14\xb9\xe0@?\xe9\x01\xe1\xdeu\
-\xe9!\xe1\xa8\xe4\xfc\x5c\xf6\xd5\x5c+\x9e7\x18\xe0\xed\
-/\x0fD\x91-\xf1D~Xi4\xf72\x04G2\
-G\xb2\x05\x96-\xb2c\xd9\xf2\xa0\x07\xb3\x9b1\xbf\xd6\
-VeG\x0cU\x98\xbcH\xbeF\xd3`\xa8\x5c\xf2\xb3\
-\x99{\xbdw\xee\xde)\x0d\xf8<*\xfbY9Y\xc8\
-\xa6z%;7\x1b\xdbw\xef\x22\xfbL*\xaf\x5c\xbf\
-\x1c\xbaN\xe52>{\xf6\xdf\xe8\xdb\xbf?\xd5\x1f\x1e\
-\x88\xa0\x86Hx\xab(\xacY\xbbV\xdc\x18\xaeW\xa8\
-\xc2\xa0\xba\xc6\x03\x9e<\xd4K\xf6<7\xd6\xdf?@\
-\xea\x0cS\x06\xdcyaa\x0eb\x1c{zy\x8b\x99\
-\xeb\x22\x12\x01\x99\xf6`\xa1\xfa\x8a\xa7E\xf8\xfa\xf9\xb0\
-\x93\xc8Sdd\xa4\xd4U\xe6\xbcC\xcd\xd1\xc3u\xf8\
-\xee\xfd\xfb\xf0\xe7\xbc\xbf\xa5\xce>\xe7\xe4\xd3\x91\xd8\xbe\
-\xa3\xe4ws\xd1\xbc\xb5\xbf\xdck\x07\x06\xf5\xee\x87^\
-]\xbb`\xf3\xae\x1dX\xben\xb5\x9aPm\x14\xbc\xff\
-u\xb8\x90\x07\x06\xf8S\xc1\xf7\x92\xd6\x94\x1bW\x0a\xb4\
-Y\xe8\x81\xcf\x1f\xaf/\xad(Ci\x09)\xbd\xc6_\
--X\xc8i\xc7\xdd\xe4[\xb7l\xc6-\xb7\xde\x22]\
-\xed\x8f\xfd\xdf\x7f\xa556}\xc6t\x94\x14\x17\xa3\xaa\
-\xca\x98\x80.\xbf\xdcSR\x0dOo/\xc4\xc7\xc7\xe1\
-\xf7?\xff\x94\xe5-\xd233e\xceT\xddS0U\
-v\x9b(\x95UT\x19\xfd2\xf5w\x99\xc3\xb4|\xe5\
-\x0a\xe9\xa5\x8d\xa38\xf8\xad\xc6z\x03j4\xc7\x13\x92\
-\x07ooODQ\x05\xc5\xfa\x92(T\xf4ps\xa3\
-\x8a\xc9\x9dd\x8b\xe7\xc5r\xc5TTr\x84i\x15\x06\
-\xecg\xff\x81d\xe91\xbf\xf5\xe6\x1b\xf1\xc8\xc3\x0f\xe1\
-\xff\xfe\xfb\x10\xae\xb8\xeaJ\xacZ\xb5J\x04J)v\
-5T\x93\xac0\xdc\xcb\xf1\xf1\xb8\xcf\xb0\xe7\xc0~Y\
-6\x83\xa7hp\xeb[&\xc8\x1b\x95\x1f\xa7\x97\x87y\
-\xbb\xf7\xec\x81\x82\xfc|l\xdc\xb4Iz\xef?\xfd\xec\
-sDQ\x85\x17\x15\x1d-\xfeY^M\xe9\xd5h\x1a\
-\x04\x95/n\x0cE\xb7\x8aF|l\x9c\xf4\x80G\x84\
-\x85\xa1Ux\x84\xec\xc3BC\xd1Z\xbe\xf4`\x81\xad\
-\x9a\xcbl\xfd\xe5\x8be =#\x133g\xfd\x8d\xff\
-{\xf8\xbfR\xfe\x1f~\xe8A\x5ct\xe1\xf9\xd8\xb4i\
-\xb3\x94k\x9b\xad\xca)O\xfck\xbe\x1c8l\xe8`\
-L\x9f>\x83\x14\xd0\xbd\x22\x03\xdc\x80\xe2F\x93\x92\x1b\
-\xf1\x22\xc7\xac(\xf2\x88\x97\x7f`\x00f\xcc\x9a\x85\xec\
-\xacl\xac \xf9\xe2\xa9E\xf1\xf1\xf1\xa8\xe2\xa9L\x22\
-\x03\x9aFa\xdc\x1b\x9ef6s\xd1|\xe90:\xfd\
-\xa4\x91h\xd7:V\x94\xee\xe6\xa4\xf9\xbb\x7f\xa8\xa4\xf8\
-y\xfb\xc8|\xc0\xae\x89\x89X\xb1n-VoX'\
-o\x11\xf1\x10\xcd\xff4tc\xb8u\xb3\xeb\xc0^\xa4\
-f\xa4!\x8d*\x9a\xf4\x8ct\x12\x96\x0cdde\x22\
-%=U\xe6nxP\xab\x8b\xaa\x0c\xf9\xab\x8f\xc5K\
-\x97J\x17y\xdf\xde\xbd\xa5\x17\xc2b\xf1@\x8f\x1e\xdd\
-\x91N\x8a\x1aO\xc4\x8d\x89\x89\x96\xca\x8f\xf1\xf4\xf4B\
-tt\x14\xfc|\xfdp\xcb\x8d7HEu\xd7\xdd\xf7\
-\xe0\xc6\x9bn\xc1\xac\xbf\xe7H\xf7=W>\x16j\xc9\
-1A!!\x08\xa5\x87\x05\xf7\xee=\xfe\xd8#\x98\xf6\
-\xd74\xdct\xd3\xad\x98;o!^\x7f\xedU\xe9\x92\
-\xe7\xf9\x03!!\xfc\x92\xce\xff\xf8\xfd\xd0\xfcO\xc3J\
-\x95\xb5\xd2\x8a=\xc9\xfba\xa5J\xa9\xaa\xaa\x92\x1a\x8b\
-\x95\xf4\xac\xb0\xca\x9e\xe7@U\xdb\xaa\x11\x12\x14t\xc4\
-\x07\x9fTh\x14\xdf\xf6\x1d\xdb\x11\x17\x17\x87\xd61\xad\
-E\xb6x\xbb\xee\xdak\x91\x9a\x96\x8e\x9c\xdc\x5c\xb4\xa1\
-\xca\x95\xe7\xd10\x9e\xde\xdehE\xf2\xc4\xd3(^x\
-\xeeY\x04\x05\x05\xe2\xf6\xdb\xef\xc4\x15W_'\xb2\x15\
-@\x0d=\x967Q\xfeh\x8b\x88\x08\xa3\xc6_ \x06\
-\x0f\x1c\x88\xd7^~\x09\xaf\xbf\xf96\xae\xbd\xee\x06\x99\
-\x17\xf8\xec\xb3O\xc9'2\xc3\xc3\xc3\xe4\x1b\xe1\x1a\xcd\
-\xd1\xc2\xc5\xac\x92\x94\xab]\x07\xf6!37\x13Y9\
-\xd9\xd2x\xe7-'?\x87\xea\x97\x14yI\x90|\xaa\
-\x00\xf5\xc0/!\xf2\x90/\xbf4\xc8\xd3\x18\xf8\x98e\
-`\xd8\x90!\xc8\xa3\xb0\xac\xd8\xf1KO<g\xdcB\
-\xd1p\x0fa\xabV\x11T\x8fx\xe2\xba\xab\xafA\xbb\
-v\xedp\xff\xfd\x0f\xe2\xc6\x9bo\xc3\xf4\x193\xe0\xeb\
-\xeb\x83h\x92%77\xd5\xeb\x14\x1c\x1c\x88\xe0\xa0`\
-\x04\x05\x07Q}\xf2\x8a\xcc]\xbf\xfe\x86\x9b\xf0\xcd7\
-\xdf\xe1\x81\xfb\xeeC\xe7\xa4$\x84R\xf9\x0f!wM\
-# \xfd\x82G\x01\xb7\xef\xd9\x89?\xe6\xfe-\x0d\xca\
-3F\x8eBb|\x82\x8c\xf0\x1d\xe6\xd67\x0a7z\
-p\x1e\x13-\x80\xa3\xe5\xe1\x9c\xdfg\xcf\xc4\xfe\xd4\x14\
-\x0c\xea\xd3W\xbd\xb6\xcc\xdd\xcd\x86\x9f\xffE6l\xd9\
-\x0co\x0fO\x99\xdf\xc37\x83o\x0a\xf7\xfc\xf1\x01\xdf\
-\x9f\x1cj\x05\xf1\xaa\xdc,$\x87Bu\xe1\xab\x1e\x0f\
-\xd7;\xca-3\x1ef\xe2\xbcc7\xaex\xf8-,\
-~#\xcc\x83\x05\x90\xcfGv\xdc\x02c?\xdc}\xcf\
-\xc7\xdc\xe3\xe7IJ$?A$n\x0e\xcf\xc7\x04\x17\
- \xf6\xefC\x0a\xa5(\xa4\x1c'\xb5\xf8\xe4\x1cF\x9c\
-\x1a\xcd\xf1\x87\xe7\xeb\xd9\xa8\x95{\x80\x1a+~\xb2\x92\
-\x00OR\xe0!'?\xaat\xb8S\x82\x87Q\xb9G\
-\xdc\x83\x1aA\xe1\xd4\xa8iHa\xe5u\xb2\xb8\x8c\xf3\
-\xd0\xac+,[\xa2\xc8\x89l\xa8^FY\xc3\x8cN\
-d\x0e\xed\xb2Lpk\x9b\x1e\x8a\xf00\x86\xc5\xec\xf6\
-jx\x18\x8d+\x96%\x8eC\xe4\x96\xdc\xf8A\xcd\xcb\
-i\xf0\xdb\x92J\x96\x95\x7f\xaet\xf5\xcb\x1f\x9a\xa3\x85\
-\xa7@l\xdf\xbd\x13Q\xadZ\xc1\xcfh\xa4p\xaf \
-O1`xD\xa7\xa8\xa4\x10!\x81\xdc\xc0W\xee\xf5\
-a.\xdf\xc2\xc3\xb2\xa6\xccp=\xc2\xf2\xc6\xf1q\x99\
-7\xdf(\x962Nu\x06wB\xb0\xd0\xb1\x5c\xf0\x9b\
-\xc2\x8c*\xf7\x5c\xa6I\x1e\x0c\x19P\xf5\x0b\xcb\x17\xc9\
-\x0fE\xcd\xc7,[^\x9e\xdeR\xaf\x8b\x1c\xd1\xb9\xa4\
-~\xa1si\x1a\x0e\xdf)\x1e-]\xbby\x03\x16\xac\
-X\x8e@\xdf\x00\x9c5\xead\xc4\xc7\xb61<\xa8{\
-\xd9\x9c\x1c3\x05\x90\xe1\xa8s\xf2r1s\xe1\x02\x1c\
-HK\xc3\x90\xbe}0\xb4\xef\x005\xff\xe0\x7f\x94\xcd\
-$\xa0Ue\x15p\xe3\xc2M\xf7\xc3\x8bZP\xdc\xeb\
-\xe6N\x85\xde\x9d\x04\xb5\xa2\xc2\x8a0\x9e\xd3\xe7\x1f`\
-\x848\x18u\x1f\x95\xf0\xb9b\x0a\xa4TT\x84\x98\x95\
-\x83\xd3\xafy\xecD\xa4N\xf9e\x5c\xc325\xfe\x95\
-P\xb2M]?\x1a\xcd?\x017Dx\x8d\xbeR^\
-H]\x15IQ\xa4Xv\xb8\xa7\x9d\x15@\xbb\xcd\x0e\
-\x7f?\x7fx{\xfb(\x0fG@\x95m.\xeb\xea\xd8\
-\xc4,\xf3\x8a\x1aw\xb6\xaf\x91\x03\x96=Sq3\xed\
-\x5cd\xaf\x96\xdc\xd4\xf8u\x95#-[\x9a\xc6\xc2o\
-\xdb\xee\xda\xb7\x97\x94;o~JK\x11\xf4&3\xcf\
-\xa5sP\xb9r\xa3\xc6E\xa5\xcd\x8a\xe0\x80 \xf8\xf0\
-\x5c\xbcCp\xa82h\x96u\xe5^[\x06\xd4\xb1\xb2\
-8\xac\x0cp\xba\xc4;\xf9\x17w\xb3>Q\xa3cl\
-V\xc7\xec\xc5\x0c\xafi\x08\xdc\x98\x5c\xb5a\x1d\x96\xac\
-Y\x8b\x88\xd0`\x9c<d8)\x7f\xb1\xce\xfc<\x16\
-\x1cS\x05\x90\xe1\xb9\x00))\xbb\xf1\xc7\xdf\xb3P\x5c\
-aC\xb7\xc4h\xb4i\xc5\xadt\x9e#`\xce\x13p\
-m-\xbb\xce\x1dp\xb5\xa7\xd6\x10\xb5Z\xf8\xcdA\xa3\
-\x04\x8a\x9d\xda\xd7\xf6\xa78T<\x87\x8e\xdf\xd3\xc3[\
-\xe2\xaf\xae\xaeo\xd9\x097\x99/\xe4\xe1\xe9K-\x1e\
-\xd5\x83\xc7\xa8\xd6>\xa5\xcbn\x85\x87\x85\x15[\xf2\xe7\
-\xa0\x96\x16Ud\xf6z\xe39<\x1e\x16/j\xa9q\
-\xb8\xc3\xdd\x16N\xb7\xebu\x1c\x0a\xd7|:\x1a\x1a\x1b\
-\xeexp\xa4\xb4\x99\xc2rt\xe9\xe7{\xab\xe6\xc2P\
-x\x1681\xbb\xe2b/{3~2\x0b\xc6\xb1\xd3\
-\xcd\xc5\xbfi\xcfv\xb5\xe2\xad\xe3\x87\xe1\x87\xaf3n\
-\xda\xbb\x9eK\xe2 \xcc\xf8\x05\x97s\xc9\xa1y>\x8e\
-\xa7NZ\xc5\x0f\x1f\xbb\xa6\xc1\x053\x8ca\xe6\xb2\xc8\
-\x0b\xd0Vsyt\x8d\xc7\x95C\xd97\x043\xac\xec\
-\xf9XY\xd7\xdc:\xd3\xed\x10\xf1;\xdd\x0e\x0ah\xe0\
-b\xdf\x94t\x1e\x0a\xa9()\xce\xe6\x8e\xf7p\x1c\xea\
-\x9aM{g\xf9Q\x15:\xf7\xee\xb8\xa2\x1e\xf7F\x18\
-\x03U\xa9\xab\xf8\xcc\xf9`\xb5\xa9\xa9\xd4\x9dP<\x1c\
-\x8b\xd8\x8bY\xc5\xe9T\x1e\xf8<.q\xd6(\xcb5\
-\xf1\xd7(\x1a\xb5\xfd\xb8b\xfag\xb7Za\x8d\xeb\xe7\
-\xf3\x9af\xf3|\x0c_g\xdd\xb4\xd5G\xedxk\xae\
-\xd3\xf5\x5c\xb5Q~\xeaswM\x13s\xa8\xeb3\xc3\
-\xd6\xf5\xcf\xb8\xd1\xb3\x9d]\xc5\x85\xb3\x90\x1aA|-\
-\xdc\xdb\xcc\xf3\xcc\xd9\x85\x8e8\x12\xf6Q'\xfd\xecZ\
-\x13\xa7\xe9V\xaf\x1f\xb9\x06\x95G\xaen\xae\xd4\xf8s\
-u'[\xa7\x9d\xab\xf9P\xfe\x0f\x8dk\xbaj\x999\
-\x1e\xc25\x1f\xeb\x8b\x93\xed\x99\x86\x9c\xafn\x9c\x8c\x8a\
-\xb7\xfe<\x90\xb8\x8d<\x96\xbct\x09\x7f\xa8\xeb4\xed\
-\x19\xe7\xb5\x1c\x22\xed&\xea\x1a\x1c\xa4\xfc{!-'\
-\x0c\x07xD\xc4\xc3\x0d\xe7\x9ez&\xe2\xe3\xdb\xab\x9e\
-\xd9c\xc81W\x00%\xcb\xaa+\xb1c\xf7\x12\xccY\
-\xb2\x10\x199\xfe\xf0\xf7NC\x80\xe7&\xb8[\x8e\xf4\
-:{#\xe0~i\xb9\x11G.\x14u\xb1P\x85\xc7\
-\x8a\x5c\x83\x91\x9c\xa3\x1f\xe3\xa63\xeen\x1eRi\x1a\
-\x8e\x87\x86\x9c\x1d\x0e~s\xf7(\xd3iFK\xa7\x94\
-\xf0r\xfeC\x9c\x8bo\xadK\xda\x8e\x09\xb5N}\x98\
-\xf35$-f\x5c\x0dI\xf2\xd1\xf8\xfd7p,\xef\
-\xc5\xb1\xbe\xcf\xcd\x1d\x7f\x9d\xf8\xcc\x87p\xbd4\xf5\xdc\
-\x1c^\x9e\x07\xea\xf0\x98p4i\xe4\xe40\x87\xf3n\
-\xc4wP\xbe4$\xec\xb1@\xce{\x84k<\xda\xb4\
-5$\xce\xc6\xd0\xd8\xf2b\x863\xaf\xa3\x09i\xabu\
-\xdf\xea\xa6\xc7\x8c\xff\x10QKX\xc3Q)\x1b&d\
-:D\x98\x7f\x0dG\xb8\xb6Z\x88\xdf\xc6\xe7q-\x8e\
-\xe6\xbcG\x03\xc5+\xf7\xe0P\xf7\xb2\x19\xe0:\xbc\xca\
-\x1e\x8a\xe2\x8a^\xa4\xd6{#2\xac\x12#\x07\x9f\x84\
-\xc4\x0e\x83I\xe1\xf7m\xf6\xf3\xd5\xe58(\x80|\x91\
-\xdc=\x5c\x8d\xad;\x16b\xd6\xbc\x05(\xab\xf0\x85\xaf\
-O\x0e|<\x93aq+R\xf9j\xdc\xbd\xfa\xb4m\
-\xde\xf3\xd0\x10\xfbS\xc9\xad\xf1\xc3\xb0;\xa3\xec\xc8\x9f\
-\x98H\x09\xe3\x16\x93\x04\x12g\xa1\xbe\xf8\x05\xc3\xab\xca\
-o\xfa!\xa5J>mCf\xa5\xa3\xab\xb3\xb0\xff\x9a\
-p\xca\x8e1T1\x8a\xa3\x9e\x96\xac\xf2*\xbe\xcd\xf0\
-\x12\xae\xdaB\xd7E\xfe\xc5Y\xc5\xee\x8a\xe9\x9f\xff9\
-m*\x1djc\x9f\xd5\xac\x00\x92\xa2k\x867\xfd2\
-\xac\x13\xb2j)\xd7C\x9b4Bh\xefN\xf6N\xbf\
-D\xb536\xcac\xda\xf3\xb1rQv\x1c\x81\xebC\
-\xc9\xc4\xb8\x02\xe3\x97\xb3\xda\xf0\xc7'\xe4`d'\xba\
-\xb8\x11}\xdd8j\xd2\xcb\x1b\xfd\x93?\xb9\xb7\x86_\
-\xa6&=*$\x0f\x83p8u\x0d\x8crc\xb3y\
-\xccaLL\xff\x14\xa1\xcc\xcd\xe2\xb7\xa0\x19\x9e\x14\xcd\
-\xf7\x89\xc3Hx\x95\x04\x15\x89\x9c\xc8\xd8\x1dt>\x82\
-\xa2\xe0r\xa1RD\x18\xbb\x1a\x0fl\xacq\x97\xf3\xf3\
-\x9e\xd2\xc0\xf3\xdb\xcc\xb0f\xcb^\xfc\xd1\xbfy\xcd\xae\
-\xf1(\xc8\x82\xd3\xc1;9R\xd7\xe8\xea\xcd\xcc7\x91\
-\x11)\xb3\xb5\xe1pf>Jx\xbe~\x8eA\xfe\x8d\
-\xf4\xd4\xf5#{\xe5.\x06\xe9}\xa0\xb8\xd8\xac\x8cF\
-\x82\xe4G\xdd?\xb1Tq\xa8f\x0d\x99\xf9:\x8d\xa1\
-!\xb9\xd7\x94V9\xe6{A{\xd72\xc2nr~\
-\xf6*\x87*F\x0e\xeb\xcc+\x13\xd3\xc8\xe75\xfc\xab\
-4\xd0\x8f\x9c\x87,\x8c<6\xe3\xe5\x7f>\xe4+3\
-\xe3bo\xf5!\xae\xce\xf0|`\xfaT\xe1\xccka\
-\xe4\x9c\x02\xbb\xb9\x9c\x8bm\xea\x84\x15\x13Y\xba\x19\x89\
-6\xafK\xf90\xfc\xd1\xcey\xcd\x94\x063o\xd5y\
-\xf8\x1c\xeaW\x99\xccP\xa6\xab\xb2u\x1e\x19\xe9d[\
-3\x0e\xe5\xc7\xdc\x93\x89\xbd\xd0\x9e\xcb\xb9\x92\x0a2\x9b\
-n\xf2\xa7`\xfffxg<**\xfe\x17\xa3iR\
-\xf7\xb5\xe6\x5c\xe2\xcaeH\xca'm\xce\x9e\x11g*\
-\xc4\xc4\xaef\xde\x9a\xe7`w)\x9bR\x07\xd0^<\
-\xd5\xa0Rh\x9e\x89\xdc\xcd\xfb\xaf\x22V{\xa3\x9d\xad\
-\xfc\x18\xfe\x8c\xb2)\xcf\x19\x8e\x97\xf3\x9c\xed\xe5\x98\xe7\
-r\xaa'\xae3]\xe2j\x9e\xc9\x88C\xdc\xd4^\xc5\
-\xac\xfc\xaa#2\xd1\xbf\xcc\x075\xee\x81\xe4/\x19\xe4\
-\x5c,\x07\xf2\xa7B\xb2\x7fu\xcf\xd9?[\x18\x0fm\
-\xf1\xaf\xf2\xcb\xd5?\xa3\xce\xcd\xa8_\x85\x9c\xd9i\xcf\
-\xd7)\xcb\xb6\xb0\x0d_\x92\xdc\x03q\x11\x7f\xca\xb7:\
-6Q\xf1\xd6\xc4\xec\x1a\xa3B\xb9\xab\x90|T\xe3\xca\
-~k\xca\x8f\x19^\xed\xcdg\x0cc\x9eC\xb9+\x1f\
-\x12V\xf2\x9d\x93I\xee|/\xd9\x9f\xe4\x97\xca\x0f\x09\
-'\xf6\xe4b\xe4\xab\x99\x0e3\xee\x9a\xeb4\xe2\x94\xbd\
-J\x83y^N\x8b\x99N\x8aP\xe2R\xd4\xb8\xf3\xbf\
-\xf3\x5c|@\xf0\x91\x9cG\xca\x8fQ\x86\x8d\xb2d\xc6\
-m\x04t\xa6O\x85R;e\xc7\xe1\xf9\xa5\x9fh\x94\
-\xdb\xda\xa2\xca\xe6\x81\x0e\xf1\xbe\xe8\xd3\xad/:u\x1c\
-B\xcf\xf2\x9a\xf9\x9b\xc7\x92\xe3\xa2\x00*\xb8\x12\xae\xc2\
-\xce\xdd\xcb\xb0x\xe5B\xa4\xe5\xfa\xc0\xdbR\x0a\x1f\xcb\
-\x1exZ\x8a\x9d\x97\xca\x89\xa9\xcf\xcc&\xf3\x060\xa6\
-=\xef\x0d1\xa9\x07\xb6\xad}y\x87\x8e\xbf\xfec\x86\
-2\x89~\x0c\x172\xcb|\x0cu$\xb0\xd9\xf4{8\
-\xcc\xf8\xc5/\x0b\xb3Q\xd0\x19\xd3\xcd\x15W;\xd3\xcc\
-\x9by\xbd\xf5\x85a\xea\xda\x9ba\xd8\x81/\xa3\xbex\
-M\xf8\x98a;q\xa3\x1fy\x98\x1b\xd4\xf2\xcb\x0f(\
-\xbe\x06.\xd0f\xfe\x1c\x8a:'\xaa}\xc8&\xf3\xcc\
-\xae.\x94\xd7\x86\xb5\xf80\x12/\xa7r\xb9'f\x08\
-g\xc8:n\xde\x94L\xaf@^M\xbf\x1aV+\xd9\
-\x18\x1eM\xff\x22\x90.\xfe]\xafG\x04Z<\xaac\
-\xfe\x95\xbc$\x94M\x0d\x12\xd6\x05vw\xda\x99q\x1a\
-{>\xa7\xb3\x1c)kg|\x07\x85\x11#{Pf\
-\xfe\xe5\x8d\xfd\x89_v#S\xdd\x86\x87\x19\x8f\xe9\xd7\
-u\xef\x1a\x9e\xcd\x8cy?k\x8eU\x0c\x92^\xfaS\
-\xe1\x8c\x07\xa3afj\xc5A\x1b\xa7\x82\xfd\x8b\x0fr\
-\xe0\xe7\xb0r\xe7_:\x878\x19\x15\x9a\xe4Am\xd9\
-V!\xd5f\xda\xca\xde5?hs\xf5#\xc7\xe4n\
-\xe6\xa9\xb27\xfc\x1a\xe7aOfY6vu0c\
-\xe5=\xc3\xe9\xaakCH\xbe\x90\x89\xfe\xc5\xde\xf4d\
-`\x1a\xd9\xda\xbc#\xae\xf7\xcf\xd5{\xad\xb2g\xf8q\
-\x89\xaa\x16\x1c\xce\xc4\xe9\xc7\x08\xc3n*\xdfk\xfbc\
-\x5c\x9f_\xec\xc6&W\xff\x0a\xe5b\xba\xb9b\x86a\
-L\xb3\xab\x1dS\xd7\xde43b'ip)\x19\xae\
-\x1e\x0e\x813\x9c\x989\x9f,j/6\x0d\xc3\xcc_\
-\xd7\xb2lb\x9a\xccd\x98{>\xa7\x19\x86\xcb\x93\xa4\
-\x9a\xcd\xe2Xs\x7f\xf8\xd8\xbc\x0c\xd7<6mM{\
-\x95b#Nv&\x9cy\xef\x12N\x1d\xd7\xae\x17\x18\
-\x09m\xa4\xc5y,\xa6\x1a\x94\x8b\x01\xf9\xe5s\xf1s\
-\x8a\xed9\x98\xa1\xf39\xafE,]\xcfm\x841a\
-\xeff\xde\xb3\x1f\xd3El\xc8^\xe4\xcc\xc5]\xf9\xe7\
-\x03\xc3\x8d\x8d\x8c\xcb9\x9c\xe1\xd4Q-\xe4\xfc\xbcw\
-q\x978\x95Q0\x8fyo\xe6\x9f\xab\x1f\xd3\xad\x16\
-|N\xfas\xe6\xa9K\x1a\x5c\xe3a\xc4N\xfc\x93=\
-\xf9q\x8dK\xcc\xf4#m\x182\x9a\xe7d{eV\
-1\xd6\x1c\xab\xbdk]\xa1|(\xec\xd5^(\xb3\xb7\
-\xa5}\xb8\x1cw\xed\x10\x84\xc1\x03F <\xbc\x13,\
-n\xc7v\xd8\xd7\x15\xba\x87t\xc5\xc7\x0d\xb9\x15(,\
-.\xc0\x92\xa5S\xb0iW\x0e\xa5\xc0\x13\xad\xc3\x93\x11\
-\x19\xc6J \xb7RL\x9f\xb53\x903\xde\x99{d\
-vf\xb4iO\x9b8\xd3\xb1Xq\xcf\x98\x83{:\
-\x94\x1b\xdf\x7f\xbeR\xde\xcc\x9b\xee\x12T\xca\xa8\xd9\xd2\
-f3\x0b\x8c\x9c\x93Pf\x99yAa\xc8\x92\x8e\x0d\
-'\xc3?[p \x97\xf0d\x92\x22'\x91*aT\
-\xa91\x0a\x22\xfb\xa1\xc4\xa8\xb4\x98\x05\x92\xfe\xc8\xaf\x19\
-\xb7\xb23\xe2c\x83aV\x82\xa6\x90xM\x8f\x06l\
-4\xc3\xf1\xf5\xb23#\xc7\x86\x99\x0d\xa6=W\x8al\
-\x96\x92\xc0~ho\xa4R\x8e\xcd\xbc`{\xf1\x22\x9e\
-\x0d\xb3\xb19\xed\x19vsZ*w1s\xa4\xc6\x0d\
-Uy\xe9\x12\x86\xb0\xd9\xaa\x91\x93k\xc3\xb6\xed\xd9\xfc\
-\x1cDb\x87\x10D\xb7\xe6o`R`\x8e\x87\xe3 \
-\x8c(j\xcekl\x82a\xc9~\xac\x95v\xac\xdb\x90\
-\x85\xcd\x9b*\x90\x99^\x88\x90 \xe0\xbc\x0b;\xa0m\
-|\xb0Z\xdf\xca@\xe20\xc2\x99\xe9f;\xe7\x09\xc5\
-\x92\xfd\x18\xf7\x87\x0e\xcd<b\x1f\xe61\xfb7\xcb\x87\
-\x11\xd2L\x8es/\xd0\x81\x9c\x8f\x92 n.\xf9\xc2\
-\x91\xf2\xb5+\xbf\xfc\xcb-b~\x18\xd5\x94\x0b\xbe\x1f\
-f|\x5c*e\xa9b\xb20\xef\x0f#\x9d\x08f\x9c\
-|>\xda\xb1\xbb\x19Np\xb1g\x94t\xb2M\x0d\xec\
-$\xc9s\xc9\x8b\xdar\xa1\xc2\x9b\xa1\xd8\x97\xc4)y\
-Ei\x97Lbe\xcfps'\xc9\xe088O\xd9\
-\x0f;s\x9e\xd2\x9e\x91=\xfd\xd4\x8d\x937\xfee\x9f\
-\x22\xcb|mf~\x93\xbd\x19\x0f#ykB\x0e\xec\
-f\xa6Y\x8e\xc9\xec\xf4b\xb8K\xfe\xd13\xc3Q\xcd\
-y\xa9\xd2\xae\x94\x00s\x04@mL\xedc\x95\x06\x89\
-\x83\x0f\x8d\xb8%\xfd\x1c'\xedM7\xb1\xa7\x8d\x11;\
-\xd3/o\xf4c\xfa\x91K36\xd3\xbf+\xce0r\
-\xa4\x8e\xa5\xac\x1a\xd7_\x17\xa7;\x9b\x5c\x029\xf3\xd8\
-\x08\xc6\xc7b6\xec\xcdt\x88\xb5\xe1G\xf6d!v\
-\xbc7\xce{\x90\x7f\xde\x8c0N\xff\xca(\xf0\xc8\x85\
-\x94\x0b\x0a\xaf\xf2Y\xf9\xe7\xf2\xecF\xf7@\xfc\xf3}\
-\xe6\xb0\xec\xc6\xc7\x12\x90\x7fT\xd93\xed\xcc\xcb\x96\xf0\
-\x9c\x089\xe0\x1f\x0el\x96\x10\x05\xef\xf9\xd8\xb43\xf7\
-j3d\x89\xcc\x07]\x0bm\x02\x19$M\xca\xa8 \
-\x03\x9b%\x0e\xfe!\xf8\x98\xd3\xe3*\xab\xce2\xc8\x90\
-\x85\xe1\xb5\xb6\x9ba\xcf\x9b\x19\x8e\xf7\xaeA\x9d\x05\x90\
-a\xff\xe2H\xf9\xc8\x06\xfagi0\x9fS\xec$y\
-j\xd6\x85\x06\xec\xc6\x16\x0ez\xb6\xbaU\x1b\x1e\xd9\x8a\
-\xec\xd8\xc8\xd7\xcf\xa7\xe1\x03\xa7\x9c\xf3!\x87a{6\
-\x1b{\xb17\xf6\xbc)\x9976\x0eG{v\x97[\
-C\x11\xc8\xb5R\xfa\xc4\x0b\xff\x10f\x5c\x8c\x11L\xc5\
-)?\xb4\x11f\x9a\xcd8\x05\x1eA\xa3\xf2\xe2\xb4s\
-)\x8f&r-\xaea\x08\xd3\xdd\x8c_v\xf4c\xda\
-\x9b\x98i7\x83\x9af\xd3\x9fK\x94\xaa\xfc\xb1\x81~\
-\xb8\x5cs6TS\xa4\xae\xb7\xcbNi-*\xf5\xc1\
-\x9e\xd4x\xb8[<\x11\x11R\x8d\x81\xbd\x92\xd0\xb5\xcb\
-9\xe4\xca\xcf\xd6\xba)8\xb6\x1cg\x05\xd0\xa4\x1a\x85\
-E\xfb\xb0e\xfb*\xac\xda\xb8\x17Ee\x16$\xc6\x15\
-\xa2C\x5c\x09\xfc\xfdx\x11I\x95$\xd7\xbc0\x1f\xb2\
-\xcaL\x19j&\x9b\x0e\xcc\x07\x08g\xb3y\xebU\x95\
-p0.\xc1\xc4\x87\xd1;/\xe1\xf8XUZd\xa6\
-4H\xbc\xfc'\xee\x0aeg\x9a\xc9\xcd\xf9\xc0\xe14\
-p\x18u\xe8<\x8f\x19\x90`;s\xa8\xd4\x99\x00B\
-\xa5_\x1d\xf0/\x871\x9dM\xaf\xcaB\x095\xa7I\
-\xd2K\x8e\xca\xbf\xf8 \xe8\x88-\x94\xa9&\x9c\xfcp\
-X\x0e\xccK_\xa8t\xcay\xe5\x09\xa5\xe2R\xd7m\
-\x86a\x8c\xf3\xf1\xf0\x01\xbbq\xa4\x1cV\xccF\xbe\xb0\
-\x07\xf6\xc9y!\xd2\xa4`wY$[\x05\x12\xbf\x12\
-\xaf\x0ad\xec\xf9_\x85\xe1\xa0\xd3\xa6'\xe3\xbb\xefv\
-\xa0c\xa2z\x83\xdaV\xe9\x85\xff\xfc\xb7;\x22B=\
-\xa9L\xb0\xf0\x88\xb5\x5c\x9b(\x85\xc6\x01\x0b\x99a\x94\
-\xd8D!'\xd6o\xc8\xc3+\xaf\xae\xc2\xad\xb7tE\
-\xdb\xb6\x81x\xee\x99y\xb8\xf2\x9a>\xb8\xf0\xfc\x0e\xa8\
-\xa8\xb0\x91_z4\xd2\x83QBR@~D\xaa{\
-\xc16\xec\xc6\xc2\xcb&\xce\x07\xfeU\xe7\x10{\xe3z\
-\xb9\xfc\xc8\xe5\xc0B?\xbcL\x08\xedT\x04\x86=\x1f\
-\xd3\x0fa>\x18\xe5\xd8td#\xe5'\xc7)\xcd\x04\
-\xc9\x17\x89D\xed\xc9\x93\xb8\x18\xe7d\xd4}\xe74q\
-Z\xe9\xde\x88?\xf6\xae\xd2T\x17\xd3F\x9dW\x1d\xcb\
-\xfd1\xc2q\x8bX\xa5\x85~\xc4\x13\xf9a\xb9p\x96\
-m\xe7\x8f\xe1N\xe7\xa5C\xbe\xb7f~\x99\xce\x12\x05\
-\xfd\xc9\x970\xc8\x81\xdd\xc4\x0f\xff\x89Y\xf9\x11\x03\xbb\
-K\xa0\xda\xf6\x92\xb6\x9aC1(3\x87a\x83\xca\x13\
-\xf3\x1a\xccX\xcc\xf8M\x7fR\xce\xd9\x81\x0f\xe9>\xbb\
-S\x99\xe1*\xdeM\xe6\xe8\x9a\xfe\xc5Q\xfc\x98\xf0\xa1\
-\xf9\x5c\xe0x8/d\xa4\xc7@\xc5\xc9\xbf5\xd7'\
-fr\xe1\xd4\x883\xdb\xb0\x91\x0c\xca\x8fXK|N\
-;\xfe3\xec\xcd\xb4*g\xc3R\xeew\x8d\xad\x83\x12\
-\x22_\x1c1#\xa4\xbd\xb8\x18^x/\xe5\x88\xf3\x87\
-\xcdF\x9a\xf9^\xc8\x1b\x9a|\xa0\x82\x09\x92w\xe4G\
-\xe4\xc5\x88\xc4\xcc\x0f\xf1B?\x86\xd7\x9aTp\x18N\
-\xabDV\x03\x1f\xf3\xf9\x5c\xf3S\x99\xf9\xdf\x8c\xa5\x06\
-3\x0d5\xcfC#B\xc9l\xba?\xc6\xa1\x0ao:\
-\x1b\xf9\xc5v\xc69\x14*\xc7\xd8N\xf9U\xc7\xce!\
-D#~\x09c\xb8+\xd4u\xb0\xcc\x98n\xae\x98\xe9\
-\xaf9\x8f2\x8aO#N\x13\xb1'+\xf1\xce\xf9)\
-\xf7\x81\xed\x0c\x7f\xb4\xe7\xf8\xd8\xddY\xa0XF\x182\
-+7q\x95x\x18\x15\xbd\xf2\xc3f\xf3\x1e\x8a_#\
-Z~&\xcas\x85q9\x07\x9fWr\x81\xfe\x95Y\
-!r\xed\x9a6\xc3E\x9ee\x94n\xfe\xe3pfy\
-\xe4\xf8\xd8l\xa2\xe4\xc2\x8c\x8d\xec\xd5\x7f\x8d=\x1dH\
-\xdc\xca\x039\xd0s\x91\xee\xa7k\xfer\x9c\x1c\x83\x5c\
-\xaf\xfa7RA\x98\x81M\x0b\xa7Yy\xe4\xb0\x8c\x99\
-&u\xa8\xec8\xdfk\x95A\xc3\x9e\xcfS\xabG\xcf\
-0\xb8\xda\x93\x89\xcc\x14\xd8\xc4\xc5\x0fG\xa5b\xa2\xbd\
-)Krb\xf6d\xba\x90Y\xfd\xd7\x927>f\xf8\
-\xeb*\x05\xc5~\xd8\xb5\xdf\x07\xc9\x19\x81\x08\xf4q\xa0\
-w\x8fX$\xb5OBxx7\x8a\xcf\x93\xfc\x9bq\
-\x1d?\xfe!\x05\x90O\xc9kn\x95a\x7f\xcaJ,\
-^\xb6\x16)9\x0e\x84\x05W\xa1_\xf7bDGT\
-\xc8\x8d43\x92qU\x9c\x5c\x0b(\xbb\xca\xbd`\xb3\
-rvf:#N.\xee&le*2\x1c\x80\x9d\
-\xf8\x1c\xea\xa1a\xc4\xe5\x12\xce\x8c\xc7\xb4wu\xaf\x05\
-Gd\xec\x9c\xee\x86\x9d\x99\x0e\x86\x0b\x90\x99\xf5\xf5\xc6\
-)\x11\xd4\xb13Q\xc1\x9c\xee&\xa6\xbf\xbaaL?\
-\x22x\x12\xc6\xb0\xa0\x1d\x9b\x5c\xc3)\x81P\x85\xde\x15\
-\x15\xae\xc6,{\xfac\xbf\x82D\xa4\x8c\x8c\xf8\xe5c\
-\xda\x9b\xfeM\x5c\xe3\x113\xdd\xe3\xfc\xc2\x0a<\xf0\xe0\
-l\xf4\xee\x1d\x85\xff<8\x00Uv\x07\x8a\x0a\xad\x08\
-\x09\xf6\x92\xb9{\xd5t\xec\xeb\xe7!kRq\xb9\xb0\
-Z\xf9\xa1Ba\xe9\xc7\xc7\xd7C\x95\x13\x8a\x90\xd7\xca\
-b\xbfAA^x\xf7\x8d\x15\xd8\x9fV\x82\x17^\x1c\
-\x81\xd2\x92*\xdc{\xef4\x9cw~o\x5czq\x1c\
-*\xca\x1d\xb2\x08\xaa\x87|\x11\xc9\x8d\xe2\x05\xac\xac\x14\
-\x92Y\xd2F\x9b\xb7\x8fE\xc5K\xff|>\x86\x05\xd9\
-\xdb\xdbB\xe7\xe1t\xf0\x9a[\xea\xa1\xc1\xa5\x91s\xc3\
-8\x10\x93\xc4T\xe7\xdaM7\x13\xc9\x1b\xb63\xf6\x8c\
-\x99_|}\xce<\x22\x5c\xed\x9d\x0f\x19\xc3\x8e\x11\xff\
-\xbcW\x87\x07\x85\x95pd\xe0\xfb\xcf\xd6\xaea\x19\xf3\
-~\xca\xde\xf0c\x22~\xc9\xa2\xae\x9d\x9c\xd3\xdc\x8b\xa5\
-8)\x8f\xa6\xd9\x80\xfd\xb8R\xcb\xff\x110\xcf\xe34\
-\xf3^\x1d\x0a\xae\xd7\xe2z\x9eZ\xe7 {\xa5\xec\xd6\
-<;\x0e\x853\x9c\xe9I\x05\xabu\x1e\x89\x8fv\xce\
-\xeb\x17G#\x80\xe1\xc6\x98a\xcct\xb9\xc6Q_Z\
-k\xd9\xd11\xc7\xab\xca7Y\xf0\xce\x0cOf\x17\xaf\
-\xce\xe4\xba8+\xbf\x86\xbfC\x9d\xd7\x15\xd7\xb0\x8ck\
-\x98Z8=\x18{\xe3\x1c\x0c\x87\x91\xfc 3\xdb\x99\
-\xc7&f\x9c\xe2\xe7 \xb3\x0ae\xfa\xaf\xe5\xce\x06\xfa\
-1\xfdr\xe3M5\xc4j\xdfOvs\x0do\xfa\x97\
-c\xf6i(\x0a\xeaX\x85\xabu\x1e\xc3\x5c\x1f\x1c\xbe\
-V\xddc\xec\x19y\xbe\xd2\xdeU\xbe\x9c\xe9\xa0\xcd\xb4\
-\xe3#I\xf3Af\x85\x19\xc6D\xdc$0\x9b\xe9\x87\
-\xcc5\x0a\x90\xe9\xc8\xceJ~\x19\xe7y\xd9\xbba6\
-q\xb5\x93\xe0\x04\x1f\x9bf\xc6y\x9du\xfd\xb2\xd9\xf4\
-g\xd8\x9bV\xc6a\xadx$\xa7\x8c\x08\xcc\xb8xo\
-\xa6\xd5\x8c\x9b\xa9\x1b\x87\xe9\xd7\xdc\x0bdv\x09Rc\
-oP+>#\xacif\x5c\xddM\xc4\x1f\xef\xd5\xa1\
-`\xdcI\xae\x9a\x9cH\x1c\xae\x1e\xc9\xec\x1a\x9dy>\
-Wolg\xb3\xbba\x0f)~\x1bv\x07\xa3\xac\xcc\
-\x82\xb61\x0e\xf4\xed\xd1\x09\x1d\xda\x0d\xa7\xba$\x90|\
-\x1d\xbf!\xdf\xba\xfcC\x0a \xc3\xa7U\xa7\xb6Z3\
-\xb0l\xcd_X\xbb\xb1\x18\xe5T\xb1\xf6\xee\x5c\x82\x0e\
-mK\xe0\xe7G\xeeF\xf2\xd4\x0dTY+-\x18\xde\
-\x8b\x0d\xd9q\x8b\x8b\xf7.\xddW\x22T\xd24\xe28\
-\xd8Z\xd9\xd7\x94\x00\xdaSs\xc8\xf5\xf2\xb9\xb0JG\
-\xb9q\xa7\xf9\x98\xa3V>\xe4\x88\xf6\xe69h\x93\x87\
-\x8fYT\xa4\xa8\xd7\xe0z\xc0\xb5\xbb\xf2$?\xea\x90\
-~\xf8\xd8\xf4'\xe90=)\xb3:\xa3\x04\xa2C\xf6\
-o\xf8\xa9\x13\xc6<\xb7\xf2o<\xd9\x9c\x9e\x18\xe5\xaa\
-\x8cF\x8c\xf4\xa3l\x95AB\xd2S\x91\x15\x04q\xa0\
-\x1f\x955\x14\xabxT\xe7a\xc4\xd9\x15\xc3BR!\
-\xd1\x19\x91\xb3\x1d\x07\xa1\x08\xb8\xb7H\xa5Ol\x0d\xb3\
-\xcaK\xf6\x92\x9a\x5c\x82;n\x9f\x86\xf3\xcf\xea\x84\x9b\
-\xef\xe9\x03\x07id\xdcx\x94\x87*mYY\xa5\xf8\
-\xf6\xbb\x1d\xc8H\xad@l\xb47.\xb9\xaa3bb\
-|QT\x5c\x81\x1f'\xed\xc1\xbe\xbd\xa5\xa4\xcc\xd9q\
-\xf1\x05\x9d\xd0\xb3W8\x96\xaf\xcc\xc7\xeb\xaf-\xa18\
-\xaa1th\x1c.8?\x01O?5\x17\x97\x5c\xd6\
-\x03\x17]\xd8\x01EEUX\xbe<\x03\xf3\xe7\xa5\x90\
-\xc2\xe8\x86\xce\xddBq\xc5e\xfc\xf1s7\x8a\xc7\x1d\
-\x1b\xd6gc\xce\xbc\x03HK\xa9BL\x1bo\x0a\x9f\
-\x88\xb8X\x7f\x94\x96U`\xea\xd4\xdd\x88o\x1b\x86U\
-\xabR0jd<\xfa\xf7\x8b\x96\xbc\x13\xf8\x02\xf9\x06\
-\x1ft\x1f\xcc\xbb\xa4P\x0fn\xc9.\xfa\xa9&\x97\x1a\
-\x7f\xaa\x5c\x92\x91\xacT\x0fj\x0d\xea\x88}\x1b\x1e\xc4\
-?\xed%\x7f\xd9\xc6\xf4O&\x89\xb2&\xcf\xc5?\xfb\
-\xa3\x9d\xd8:\xefIM\x18\xe5\x8f\xe1\xbd!?\xb2\xb9\
-\xba\xb1\x997\xc6p\x974\x90\x91wt\x02\xe3\xf2\xf8\
-\xc00\x98\xce\xe69\xebG\x1441\xb8\xe6\x96\xb2w\
-^\xb3DY\x13\xaf2\x9b\xae\xe4\xce\x01\x9d~\x5c\xfd\
-\x19\x0er\x0e\xf2\xefL\x9b\x19\xc0L\x17\xfbQ;e\
-\xeb\x8ayT\x93\xdf\xce\xeb\x91x\xe9X\xd2^\xe3\x8f\
-\xed\xd9/\xfbV\xf7\xb3v\xac5\xd7Ff\x97\xeb\xe6\
-^\x09\xfe\xad\x89\xcd\x8c\xc5%<\xef\x94\xb5\xb9#\x94\
-\xa5\x19\xa7\xeb\xb9\x94/\xd7\x18\xf8W\x95U\xf3\xcc\xca\
-\x86\x9f\x85\x8cy~\x15\x97\x19N\xd9)\xf9U\x16\xec\
-\xc3<\x9f\x99b\xc37\x1b\xc9,\x0a\x1b\xdbq~\xc8\
-\xcep\x97`\xf2c\x86P\x18Q(\xbb\x9a_\xa7\x83\
-\xd3d\x9e\xad\xcey\x0d?\x0a\xd3\x87\xe9\xc7\xc4\xf4\xe3\
-j\xc7\xf0\xb1\x99/\x86\x1c\xf0}\xa2\x84\xcb\xfd\x92`\
-\xb5\xafX\xaeM\xc2\xd5\xc4)6F%\xa2\xcel\xa6\
-@\x85\x15\xdf\x14\x9f\xe9*\x19#\xb6\xea\xec\xaaW\xce\
-8\x1f\x9b\x8dg\x8b\xf8%\x94o2KP\xf6\xc9(\
-?\xd2c,\xc7|r6\xd5\x9cS\x99\xd9\x9d\xf7\xc6\
-\xb99\x1dr~\xe5\xeeD\xd2\xc76\x9c\x0e\x15\x87\x82\
-\x8eUF\x90\xa3\x8a\xdf\xc4\xcc#\xd3\xb7\x8aA\x1d\xf3\
-\xb9\xcc_e\xc7\xeefX3\x1ee\xc3\xbe\xd41\xa3\
-bQ/\xe8\x981\xb2\xab\xf2e\x86\xab\xf1\xcf\x98v\
-.PX\xb1\xa5xj\xa7\x83\xf3\xc3\xb4S(\x17>\
-\xae\x91\x113e\xce|\x13\xd8\x8e\xca\x89\x9c\x9e\xcd\x0e\
-Xm\x16df{c\xf3\xce`\xa4f\x01Qa\x9e\
-\x18\xd8\xbb5:&\xf4A\x80\x7f;\xf2\xc3/z0\
-u\xd2w\x1c\xb1<K\x18\xe6\xe3\x0c_\xb4\xbap\x8b\
-\xc5\x1f\xd1\x91\xf1\x08\x0d\xb2R\x85\x9e\x85m\xbb-\xc8\
-+\xf0\x81\xa7\x87\x0dA\x81t\xb3)_9\xab\x9de\
-\x93\xcc5YV\x13\x0f\xff\xaa\xac'w\xc3\x83iW\
-\xe3\x87o\x1b\x8b\xaay#Mj\xc7a\x04w\xdaJ\
-|\xf2\xe3\xea\xaa0\xfd\x88?1\x9b\xb8\xfaW{\xf3\
-\x8c\xcag\x8d\x1b\xa7\x87Q>\xd8l\xb8\x9b\x17bX\
-\x9b1\x98\xbe\x14\xa6\xa9\xe6\xfc\xea\xfa\xf8\x887\x15\xc6\
-\xf4\xc7q([\xe5n\x9a\xf9T\xa6\x0f3\x069\x22\
-\x07S\x90M\x1f5\xe1\xd8d\xa6\x9f\xed\x94Y\x1d\xd7\
-P;\x94B\xaa\x18\x8a\x9bm|},$0\x0eL\
-\xfd}\x0f\xf6\xee-@XX\x00)x\xfer\xef3\
-\xb3K\xf1\xfa\xeb\xcb\x11\x17\x17\x84\x81\xfd\xa2\xb0?\xad\
-\x0cs\xe7\xec\xc3\xe0!1((\xb0\x22=\xad\x12\x89\
-\x89\xa1T>\xaa\xf1\xf3O;\xd1\x7f@\x14\x95\x1d`\
-\xc9\xb2=\xb2B\xfd\xa0\xc1qh\x1b\xef\x8f\xd9\xb3\xf7\
-\xa0}\xc7\xd6\xe8\xdd+\x0c?\xfe\xb8\x15\xe3>\xdb\x89\
-\xd3Ok\x83\xd6\xad\xfd\xf1\xdb\xaf{\x91E\xe7\xe9G\
-\xca\x5cjZ1\x1e\x7f|!\xa2\xa2\xfc\xd1\xb7o\x0c\
-\x0e\x1c(\xc67\xdflA\xf7\x1e\x11\x14\x9f'\x9ex\
-l\x09\x96/\xcdD\xd7\xae\xa1t\xae\x18\x04\x04p\x0b\
-\xce\xf5z\xd9l\xde!\xce\x0bF\xe5\x8d\xda\xabc\xe5\
-\xc7\x84+\x193\xffj\xe5\xbe\xd3T\xe3[\xd9(?\
-*Nek\x9a9.\xc6\xf4\xe5\xeaW\xf9\xa9\xf1[\
-7.\x85\x0aen&\xec\xc7\xd5\x97r\x13eV,\
-M\x17\xf2eX\xa9\xd8\x15\x22\xbftCUy2c\
-bw\xb57C+;\xfa%\x7f\x5c\xd5\xd5`\xd8\xb3\
-O2\xaaP\xae\xee5\xd4\xa4\x93Ml6\xf3W\xc1\
-n\x92\x06)\x7f\xaegV>\x94R\xc6\xc7\x8c\xeb9\
-\x94o\x95~\xe5\xbf\xc6O\x8d\x94\xf0=P.5\xf2\
-`\xfa7\xcd\xecW\xc5\xc6\xc7*\x16F\xa9^\xea\xd8\
-\xf4\xab|3\xb5\x8fk\xbb\xb3\xc9\xbc\x1ae\xcf\xee\xca\
-l\x867\xed\x94o6\x9b\xc7L\x8d\xc9\x8c\xa1&\x0e\
-\xde\xd8\xac\xe2r\x8d\xc54)\xd7\x1a;3\x06\x93\x9a\
-\x18\x196\x9b!\xcc\xd4\x9b\xa8s\x98>\x94\x0do5\
-f\x13\xb6S\xe9Q\xf7\xd8tu\xf5S\x03\x97Ay\
-\x9b\xd8\xb8\xbf*\xf6\x83C8\xcf\xea,\xab\xae\xee\xe6\
-9M\x1b3]\x8c\xe9\xc6\x98{F\xf9\xa8\xb9\x9a\x9a\
-\xf0t\x0arp\x8d\x83\x11K\xf9\x15w#\x84I\x8d\
-\xabiV\xa6\xda\xbe\x94\x9b\x82L|\xcd\xb4\xab}=\
-5!]}+3\xc7Fy*\x81\xf8\x98C\xf2f\
->_\x5cQ1\x98q3\xe6^\xc5\xc3\xf6\xea\x9ak\
-\xf6\x0ag\x18\xb9P\xe5jR\x13\x87BB\xaa\x0c\x11\
-L\xdf5\xb11\xca\xcc\xf12\xcaM\xc9\xa1\xab\xbf\x9a\
-t\xb0I\xa9\xef&\xa6\x9b\x89\x0a\xa76\xd7\x14*\x1f\
-\xea\x97m\xb9\xbe\xe2\x86NF\x8e7\xd6o\x0d\xa2-\
-\x00\xb6*\xa0s\x07_\x8c\x1c4\x14\x89\x1d\x86\xc2\xdb\
-\xab\x15\xfb\xa4\xcd\x8c\xf3\x9f\xe3\x1fT\x00M8\x03x\
-\xd1Y?\x84\x86\xb6A\xdb6at\x94\x87\x03\xa9V\
-\x1cH\xf7Aq\xa9\xb7\x0c\x0d\xfbz\xb1f\xce\x98\xc5\
-E\xdd8S3gjn\x9a\xdaT\xfb\xa7\xc6_\xdd\
-\x1b\xa7\xec\xd5\x83\x83\x8f\xcd\xc7\x87\xe9\x9b\x8f\xf9l*\
-\xd6\x9a}\x0d\xe6\xf9\x94\xbf\x9a\x16 o5\xe7\xe2\xe3\
-\x9ax\xcc\x82X\x13\xd65\x1e\xe5RcV\xfe\xc8,\
---\x95\xce\xda\xfeUl|\xa4~\x19#\x1c\x1d\xb2\
-O\x15\x9f\xb2\xabi;\xf2\xde<r\xfdU\xe7\xe3\xbd\
-\x19N\x9d\x99M\xeaH\x04\x906\xe5b\x86U\xb9\xa7\
-|\x98\xfe\xd5\x9f\xf8\xe5\x9d\xb8\xa8\xf8\xc5?\xd9\xc9\x03\
-\x99\xfe,^\xee\xe8A\x0aVB\xfb0L\xfei\x1f\
-~\xfdu\x0b*+\x81\x01\x03\x22\xf1\xd7o\xfb\xf1\xfb\
-\x9f{\xf1\xd4\x93C\x11\xd3&\x00=\xba\x87\xe3\xfbo\
-w\xa3c\xa7\x08t\xeb\x16\x8c\xae]\xc2\x10\x1d\xe5\x83\
-6\xe46\xfe\xf3\x9dH\xec\x18\x86SI\xb1[\xbf>\
-\x0b\xe1\xe1^\xb8\xed\xd6n\xb0\x93r9m\xda.t\
-\xe8\x18L\xca`\x08\xdexc\xb5\xf4\xf8]yU'\
-\x09\x1f\x1f\x1f\x80\xb7\xde^\x87\xe1\x03\x130\xe5\x97=\
-\xf0\xa0t>\xf5\xf4 tN\x0aF\x8fn\xe1\x984\
-y\x1bbc\xfd\xd1\xb1}\x08&M\xda\x89\x0b.N\
-\xc0\xbd\xf7\xf6\x85\xbf\xbf\xea\xbeW\xd7\xa6L\xaeJ\x8b\
-\xe4\x80q\xfd\xe6\xb1\x82\xfd\x8b\xab\xf1\xc7G5\xf6f\
-\x13\x851\x7fk\xf6,\x0b.eA\x22W\x9b\xbag\
-u}\xf3o\xcd\xf9\x94=\xf7\x11p\x8f\x8cyGx\
-\xaf\x5c\xe5\x9ep\x9a\x0d\x1b\x09k\xd8\x99\xbe\xd8\xa4\xf6\
-\xca\xc4\x9bT\xaad\xac9\x97B\xa5\x89\xae\x89\xca\xb0\
-i\xcbs\x91\xc4\x9b\xfc\xa8\xb2\xa3\xce\xc7\xfb\x9a\xd0\xae\
-\xc7fz\x5cm\xf8*\xd8\x5csF\xc3\x17\x17/g\
-\xa5j\xba\xb0\xef\x1a?\xbc\xe4\xae\xe9b\xdaJ\x92\xf8\
-:d4A\x0e\x8c0\x0a\x09)\xd7\xc91\xa8\xb3*\
-\xcc\x14\x98\x7f\x0a\x0e\xcbWg\xa4\xca\x19\xc2\xf5\xcc\xec\
-\x22\xff\x1c/\x1b\xc8F\xf96\xc3\x99{6\xa90\x12\
-@~\xcd\xe7\x97\xfa\xe3\xb0\xe6\xf9\x94\xbb\x0a\xa9bQ\
-\xa1\xcc\x14)\xb7\xda\xb2Z\xfb\x1e*\x94\x8b\xb2S&\
-\x86M\x1c\xd2\x80\xa7NH\x10\xf6c>y\x19\x15\x13\
-\xa7J-q\x5cs6\xe5\x97\xad\xe8\x88<\xb1?u\
-\x0e3^\x15\x83\x19F\xb9\xab}\xcd\x15\xab\xfb\xafl\
-8W\xd9\x95!;\x09\xce\xcf<%M\xcaB]\x83\
-8\xc9yM\x17\xe5\xa6\x5c\xd5q\x8dIa\xc6m\xda\
-35\xfe\xd5\x1dUG*\xa5\xca\xa7J-c\x96y\
-u\xa4\xecM\xff*6\xa3\x5cP\xbaT\x0c5\xe9Q\
-\xf1)j\x8eU\xfc\xce\xfb/\xf1+{\xd3M\xa1\xce\
-\xa80\xed\xd4Yy\xabq\xa5p|\xf3y/\xfe\xd4\
-\xb9\xcd\xd4\xc8\xb1\xdcg\x95*\xf5\xa7\xdc\xd9d\xc6\xac\
-\xe24\xfc\x1bn\x12\xad\x98\x15\xae\xfeU\xdc\xea\xd7\x94\
-\x0bF\xf90Sg\x5c\xa7SF\xd4\x9e\xfd\xabz\xd7\
-\x88M\x04\x9f\x0d\xae\xb1\xd7\xd4{\x12'\xdfw\xc3]\
-\x9d\xab\xc6M\xc5\xcan\x92\x99\x86=\x9b\x5c\xafH\x1d\
-\x1b\x0fJ\xb1\x95\xf9\xd9t\xee\xffo\xef\xcab\xe4\xb8\
-\xae\xeb\x9d\xe9\x9e\xee\x99\x9e\x8d\xb3q\x15\x17ih)\
-Q\xb48\x92e\x1b1$[\x8b\xa5\x10\xb2\x9d\xc5I\
-\xbe\x02\xc4@\x00!\x80\x91\x0f%\x0e\xa2 \xc8\x9f\x7f\
-\x02\x04\x0a\xac8\x82\x8d|$\xf9\x8b\xff\x12\xc3\x08\x82\
-8\xf2\x06IQ\xach\xb1$S\x8b)RdD\x91\
-\x1c\x893\x9c\x8d3\xdd\xd3=\x93{\xeey\xb7\xde\xab\
-\xea\xee!%\x0a0I\xcf!\xab\xea\xbe{\xcf\xbd\xef\
-\xbe\xa5\xaa^u\xf7t\xcf/\x96\xe5'/\x0f\xca\x0b\
-\xaf\x0e\xcb\xd9\xb9\x8a\x1c\xd8\xb3.\x9f\xfe\xe4\xedr\xdb\
-\xcdw\xcb\xf8\xd8uJ\xe7\x8fEp\xfb\xf9#\x8e\xfd\
-\xcf\x1d=\xb6\x08\x1c\x1f\xbfE>\xfd\xa9\xdf\x96\xdf\xfd\
-\xdc\x1dr\xf0\xc069r\xbc$\xdf\xf9\xafqy\xee\
-\x95aY\x5c\xd2\xdb\xb2}h\x9f\xc3\x8b\x0d'\xb7\x0f\
-&\xc1\xc1\xc4<%\x03\xfbx\x11 \x9f\xdd\x0f=$\
-\xde\x08Xr\x1f\x9bTJ2\x0f\x1d\xdc\x18\x09\x92\x97\
-\x19\x07\x1b\xf8\xa6\xc3DP\x1f\x9f\xea8\xba/3`\
-~\xd1\x13\xf0\x9c\x18\xdf\xb5,90\xf9\xf5\x10\x8c\x1e\
-'\xb2\xbd\x1e\x928A]\xf2(\xf1d\xf7\xc8\xdc\xe3\
-\x22\x1a9q\x8b\x12\xac\xc6\xc0\x09\xa6\x02\xdf\xcaB\xde\
-^\x03[\xca\x1ev0\xa6u\x89n\xde\x03\x1c\x0bS\
-h)\xb04\x05\xfcz\xca]w\xed\x90\x7f\xff\xce!\
-y\xe4\xcf>!\xdf\xd2E\xd7\x93O\x9f\x91\x97^\x9b\
-\x93\xe5\xe5\xa6\xfc\xc9W\xbe/\x0f?\xfc=\xf9\xf3G\
-~(\xa3\xe3}R_]\x93\x17_\x98\x97/\xfe\xde\
-\x7f\xc8\x9f~\xe5I\xf9\x97o\xbd--\xfc\x8e\xa5}\
-\xe8X\x0f\x1a\xb3\xa1E|^\xaf\x84_>W\xe0\xcb\
-\xbe\x97\x17\x9bR\xd7\x07\x8b\xe9\x83c\xf6\x19\xbe\xb5\xd6\
-\xba|\xec\x8e\x9d\xd2\xd0'\xb5\x17_\x9d\x95g\x9f}\
-C\x1exp\x9f.\xee*\xd2Z\xdf\x90\xc1\xe1^\xb9\
-\xed\xf6)y\xedg\xe7\xec\xad^\xfcn\xed\xad\x1f\xdd\
-\xaeOvZA\x18\x14o\x9b\x83\x17<@9h\xa0\
-^\x98\xd9C(\xd2\x18\x8f\xdc\xf3H\xa4}\x1a\x19\x0a\
-\xeb\xccx\x0eX\x0fRP\x90O\x9f\x08\xcf\x0cz\x8c\
-4\xed\x9e 5\x00x\x80/\xf4\x08\x1c\xb5>\xd5\xa5\
-\x1a\x97!e\x99k\xa7\xa3\xdf\x91;\xa2\x1a\xcf\xde\xde\
-\x0e-\xd5\xb9C_\xdd\x83`\x16\xaf\x15z\xe6\x81E\
-H\xc6\x0b\xf0Zx\xa4\x94A\xf9\xc8\x19\x9a,b\xfa\
-\xe1\x1d\x03}<\x17\xf6 \x98i\xc4p\x1e\x86\xb9\x8d\
-h\x80\xf9PT\xa8`d\x8f\xc4\xa8v\x0cU\xf2\xc0\
-\x1e@Oxl\xd4\xc2,\xdd\x83{\xab\x89\x1d\xe7\xaa\
-\x00\xcf\x0b\xca\xd8O$Z\x07*\x90s\xb40\xdb\xe8\
-C\x0d\xbd\xfd\x5c\xa5\x951\xb2\xeal^\x85\x83n\xce\
-c\x916\xc6\xd4\xf6dN\xaeSh\x7fC\xe6\xd9\x1f\
-\x82d\x1bkf\x1f@\xe3\xfb\xd0&=\xa7\xech,\
-\xf7\x07pD\xfch\x05<\x0a\xc16z\xbc\x18C\xfb\
-\xc7(|\xdb9\xf3\xb59\xc8\x7f\xecB\x8c\x10\x19\xac\
-+F\xc6\xd1x\x0a\xe6\x1f\xaf]\xce\xf1\xd8\xac\x13H\
-\xe5\x18\xd3\xf4V\x1f\xa3B\x1f-\x9e]\xf0\xd4\xbe\xe4\
-[\xad\xe0\xc4\x9cX\xf2\xf6\xa5\x08\xf9\xf8\x04\xb4\x12=\
-\xb0q&\xba.\xf8\xaa\x89\xf7\xbd\x14\xdeg8\xa0\x9e\
-\xb8\x01\xb6\x0f\xe7\x15\xa3\xf9}\x0e1Q\x0bd_\x90\
-\xb1H\x7f=\x9a\x0a\x16\xef\xeb\xc0QX\x0d\xe1\x04c\
-\x84\xd8N\xe4\xed\xf5\xc3\xc7\xe2\xe8$\xa5\xc6\x19\xcc\xd1\
-\xc6\xc6\xce#\x90\xd8\xce\x18\xd7c\xe8\x11m\xc0\xf9k\
-s\x81\xbe\xb6\xa9\x1a=\xc29L.m\xb1\xbfm\x08\
-U\x87hX\x0c\xe3\xd8j\xf5\xc8\xff\x9d\xa9\xc9\x8f\x9e\
-\x19\x93o\x7fwR\x8e\x9e\x1c\x90}\xbbj\xf2\xc5\x07\
-n\x90\xdfy\xf0\xf7\xe5#\xd7}\x5c\x06\xfa'C.\
-\xbe]\x1e\x88-\xbb,\xc0\x0e\xadV\xc6d\xdf5w\
-\xc9\xbd\x9f\xbaO\xee\xfb\xb5i{\x15\xe7\x85\xd7\x06\xe4\
-\x89\xa7\xb6\xc9K\x87\x87da\x09_\xa0\xacC\x13.\
-ZhF\x18\x92\xb0\xf7I\x80\x8d\x93\xd4\xad\xecz\x96\
-\x22\xa2\x96\x03\x1e`\x82v\x91\x0e\x1c\xa7\x02\x10'\x84\
-k\x08\xe4\x13D\xe8\xb5@\xbbG\x84\xec\x9b\xc3k\xe2\
-4\xa7\xe4>\xe9\xa24\xc0&7\x04\x8f\xe1\xf1\xa0\xe4\
-\xe6\xff\x5c\xeb`\x0e]\x10\x12'\x03{^2\x8a\xb0\
-\x96$j\x13=\x95L`M\xa4\xa5\xb9\xb1\x84\x93\x00\
-\xd5\x91M=\x00]\xa5\xca\x13\x18\x8b\xb2C\xba\x00\x1b\
-\x1d\xad\xc8[\xc7Vdr\xac\x22;\xb7\x0f\xca?|\
-\xf3>\xf9\xc67\xee\x95\xc7\x1f\xbfW\xbe\xfeww\xc9\
-\xed\x1f\xdb._\xfb\xfaOdz\x7fE\x1e{\xecN\
-\xf9\x8bGn\x94\xfe\x81\x9a.\xdat\xccC\xa2xI\
-\x1e\xf0\xbc76ZR)\xeb\x08n\xac\xe8\x03\xc5\xaa\
--\xe6\xf0G&3'\x97\xf4\x01\xa4%{\xf6Td\
-jjR\x0e\x1f^\xb4\x18\xf8+\xe9\xf5u\xb5\x9fY\
-\x91\xa9\x89\xaa\xe5\xcf8\xda\x1b\x88\x1d\x9b\x90\xb5\x16\x95\
-\xf1\xb3\xa1\xe4\xe2\xc0\x9bf\xd0Y2\xc1\xa6\x80\x94\x84\
-\xf1\xe1\xc8\xf4n\xb3~\xd3\x02\xbd\xdd\xe2#K9\xc2\
-F+\xc8\x0e\xcf\x08\x81(\x83equ\xb3\x88\xc8\xdd\
-$23\x80\x0f\xd2&\x80\xd5\x19<j\xf4\xcc\x85\x97\
-\xce<\xac\xc6\xc8\xd5\xcd\xf2Qu1w\xc6&\xd3\xf9\
-\xb6Y\xe2z\xb4>u\x9f\xb4O\x08\xaf%\x1f\x97\xda\
-lC\xa86\x06v\xba\xd7\xff\xa8\x9f6g\x04O\x1f\
-\xcf\xd0X\xec\xd38\xd4\xba\xde\x01F\xec\x93\x187\xc4\
-\x0a@\x14\x8fD\xd9\xc1\xeb\x12=T\x1b\x0c\xd1\x0e=\
-\xfd\x0c\xc8-3\xba\xc0\xa3G\x8f\xf5\x07\x8bN\xf0l\
-\xbe\xa3\x08\x11\xbb,,\x85\xe8\xa5\x99\xd01l\x00s\
-N5&)1\xd5\x85jB\x9c\x14yM,\xc1!\
-\xd6\x0cX\x88\x10\x97p\xc99\xde\xdfA\x1f\x89\x06;\
-\xa7\xf5\xe8\xea\xb4\xbf!\xa56 \xad9\xd5\x1b4\x0f\
-?\xe7\x09\x1c\xe1\x81\xa3\xcb\x8c@\x0d\xf6\xe1b\x95\xe9\
-#\x87H\xe54\x9e\x03\x1e\xaa\xcbT1\xb2\xb3\x01\xf4\
-\xb5]GL\x91im\xcf\xb3\x1f:\x96\x1d\xcc%\x82\
-V\xc6N-\xeeeQXA\xa6\x83\xc0>\x0d\x1a3\
-\x87\x92rC\x91\xfd\x16(\xb4\xc3B%\xd5\xf9\x9e\x81\
-\xd6\xee+&\x03\xc1\xa2\x05\xbb\x9ei1\xad7\xf5\xa5\
-\x07Jz\xbfU\xb1s;\xa9\xf3\xe52\xd6\x1d\xa5\x12\
-\xeeS\xbdr\xe2\x9d\x9a<\xfd\xfc6\xf9\xfe\xd3\xdbt\
-\x11X\x96=;\xfb\xe4\xd0g~E\x1e\xf8\xcc!\xb9\
-~\xfa>\xe9\xeb\xdb\xa1\xfcA\xf5\xc2\xd8bc\x8c\xcb\
-\x05>\xe3.3\xb0\x93F\x86\xaf\x95\xdbn=$\xbf\
-q\xff\xe7\xe4\xfe;\xaf\xd5\x11(\xc9\xf3\xaf\x0e\xca\x13\
-OO\xc8+\x87k\xb2\xbcR\x96\x92\x0e\x86\x0f\xb2\x0f\
-\x90\xcb\x18r\xc8l$\x06\x91\x0cN5\xb3\x86\x12y\
-\xb0\x03\xaeg\x1eX\x00P\x8b\x8d{x8\x8f\xb0\x07\
-#\xdb\xd4\x82'\x03\x0b\x08\x1e\x07\x1d| ^\xf2\x19\
-\x85\x11\xb0gD\x7f\xc5\x80\xe0+\x12\xb4\xa5\x17/\xcf\
-\x10\x11\xc8g\x04\xcf\x0f`\x0f8?\x85\xc7\xc7\x93\x8e\
-YL\xc16\xf1\x99\x0a\x92\xd7\xcd\xdeB,\x7fbD\
-9\xcb=}\x85\xc7\xf6!\x07\x5ca\x02\x93V2\xd0\
--\xeck\x96\x99\xa7\xc8\xec\xdc\x8a<\xf1\xbd\x132{\
-\xb6n\x8b\xae\x7f\xfd\xf6)\x95\x17\xe4\x8e\x8f\x8f\xca\x9d\
-w\xed\x96\xc5\xe5\x05\xf9\xe9\xe1\xb324T\x95\xe1\xa1\
-\x8a\xd4\xeb\xf8\xba\xa0\xa6\xcc\xcd.\xc8\xf0\xc8\xa8l\x9f\
-\xaa\xc9SO\x9f\x94\xf9\xd9w\xa5\xaf\xa49\xd8\x05A\
-\xfb3<(\xf8_\x93\x0f\xd6J\xb2mj@\xa6o\
-\x1c\x91\xc7\xff\xfe\xb0\xac\xaclH\xa3\xb1.\x8f>\xf6\
-\x92L\x1f\x9c\x92O~bR~\xf3\xb7\x0e\xca\xb7\xff\
-\xed\xa7\xf2\xcc3gt\x11Z\x95\x1f\xfc\xf0\x84\xbc\xf8\
-\xe2Y\x99>0\xa1\xf1\x18\x9bMC\xe6\xde?qd\
-\xf1\x01e\x96\xb1\xe9\xf8k\x83\xf1\x96\xa2sxS\x05\
-\x87a\x00\xf6!J\xe0\xd3\xc6>\xe2f\x9eFfo\
-\x92\xed,X\x19)\xea}\x03\x22\x97,\x95\x91\x93\xfa\
-\xa1&\xbbP\xeb\x7fcY\xee|\xa50\xfa)\x8f\x83\
-\xa6\xe0|\xc6\xc6Z\xbd\x8eX7\xad\xd8\x94cnA\
-\xa3}\x90\xd5oH\xbd\x11\x97\x0fr\xe0\x84\xccT\x8a\
-\xf3\xc7{\x9ar\x98\xa7a\x0c\x00\xaf\x9f,\xb0\xe9\x01\
-\xb8\x96\xf5\x10\x9cy\xee\x83X\x8cd\xb2Z]\xcf/\
-\x91\x85%fE\xb9\xfbx\x12\xd0\xb0\xbf \xb1\xec\x99\
-`\x1fs\xa1\xdd\xe7)3\xa0\x96\xfe\xa8\xcfY\xd9Q\
-\xa9\x90,\x16\xdc,g\xcf\x9a1\xa0\xb6\xa3\x8dq\xcc\
-\xd9=m\x1fV\x03\xb0\x82\xef\xb5\xc3\x05\xe9x\xf6,\
-\x07\x1f\xdb\x83\xed\x91B\x9d\x16\xc7\x01\x0b\xdb\xe81\xc9\
-U\xd05\xe8\x95\xa3~\xf0\xc75\x86YB\x0fR \
-*\xc0\x88Q\xd8R\xdaq\xa4\x059r\xd4\xbd^\xf4\
-\x0a\xafe\xf4N\xe6\xa0\x09|M\xcf\xec6\xcedB\
-O\xe4\xcf\x05f\x96\xb6^k\xb3\x97\xf6\x22\x1f6\xeb\
-k\xd3\xc7\x88\xf4\x83\x97n\xfa\xe0\x19$\xb3X\x1c+\
-\xc1\xc73\x02\xa8My\xd9\xbc\xb3\xb2g\xa3 \x89\xe3\
-\xa4:;5tl\xc1\xc7\xdec\xf2\x0fI\xd4\x84\x05\
-\xbe\xe9\xe9\xca~\x8aL\xdf\x5c\xc3V\xd2\x17\xf0x\xd8\
-\xfb\xabf\xc8\x96=\xe4^\x8cn\xcc\xd0\x1f\x84r\xec\
-Z\x03x\x06\xaa\xd5\x03_\x0dG\x14\xaf\x0d\xfb\x84k\
-T\xc6t\x06\xc7\x1d@\x99\xb9\xb0\x03Tc\xe3\x0a;\
-\x18\x9e\x9bzZ\x1d\x00t|%\x98\xde\x8c\xc4X\xdc\
-\x10\xdf\x17~\xe7W\xcb\xf2\xda\x91\xaa\xfc\xe7\x8f\xa6\xe4\
-\x07?\x1e\x957O\xf4\xcb\xbe\xdd+\xf2\xf9{w\xc8\
-\x17>\xfb\x05\xb9\xf1\xfa{dt\xe4\x80>?\xe1\xed\
-\xde\xcb\x1b\xda\xd7h\xda\xe5\x0c\xa6\x87\xc1[Y9.\
-\xaf\xbe\xf6\x82\xbc\xf8\xfa;2\xf3\xde\x8a\xf4\xe8\x8d~\
-\xff\xae5\xb9azI\xc6G\x1b\xd2W\xd6\x81\x0c_\
-4\x0b7\x1b\x5c\xcc(\x93B3q\xb1\xf6\x16gj\
-rR&K\x0e\xd5FCw\xb8K\x16WQ\x90\xbd\
-\xb7-L\x12+\xd3\xa7| \xf8\x90\x0a\x83JA\x07\
-P\xdf\x0d\x91_\x8c\xe9&\xa0c\xddE\x1f\x85\xb9\x14\
-8m\xed1\x12\x0a\x01Z&EO:un\xe3+\
-\xb0\xe0\x9b\x9f\xaf\xcb\xa3\x7f\xfbcy\xf9\x95y\x19\xac\
-\xe8\x89S\x16\xf9\xd2\x1f\xfc\xb2\xdcs\xf7^\xfb\xab\xdc\
-\xff\xfe\x9fS\xf2\xe8\xa3\xcf\xeb\x02nX\xfa4\xd6M\
-\x1f\x9d\x92/\x7f\xf9\x97\xe4\x7f\x9f;-\x7f\xf3\xd7\xcf\
-\xca\xae\xdd\xdbe\xef\xfeq\x99=5+\x9f=\xb4_\
-\x1e\xfc\xfc^\xf9\xdac\xcf\xc9Z\xa3G\x1ez\xe8f\
-\xfb\x1a\x97\xaf~\xf5)\xb9\xfb\x9e\xeb\xe5\xd7\xef\xdf)\
-\xc7O,\xcb?\xfe\xf3\xeb\xf2\xe6\xcf\x96u\xcel\xc8\
-\xee\xa9\xb2\xfc\xf1\xc3\xb7\xcaN\xfc\xe1\x89\xe6\xf5O\xdf\
-<.\xdf}\xf2\x88.6G\xa4\xd9Z\x92?\xfc\xd2\
-M\xf2\xab\xb7M\xd8W\xd3\xfc\xd5_>#\x0f\xfd\xd1\
-\x8dr\xdb\xed\xbb4w\xbd\xa8Y\xa7$\xf0vi[\
-3S\xda/\xa1\x0f2@\xafd\xa3\xa4\xb1T\x11\xdd\
-\x92\x00\xc6\xa7\x08\xd9\xfb\x14(\x8e\x8f!\xb8\xa6<\xc0\
-\xcc\x89\xde\xcb\xc0E\xe5\x0e](\x1b\xc59\x8a,f\
-\xa2\x03,.\x84\xc4\xb7\xabl\x80C\x08\x92\xd3\x03P\
-\x04\x1b\xe0\xbe\xe1\x98Y]\x0f8=\x18smOQ\
-\xf4\xe9\xe2op\x9bC\xf5\xb9\xf6'\xf6\xd4\xcdyE\
-N[\xdc\xc4^T\xc1\xb7S\x1b\xccF\x91\x08\xbcL\
-\x07\xa1H\xd22C\xf1\x5c\x85\x03)))\xc0Ut\
-\x88(\xeaQNd\xcf\x15\xf0\xdcs\x94\xb4\xa0\xe8\xa8\
-\x87\x0c\xa0l\xfa`P\x12og\x9aq\xc2w\x9a\xfb\
-y\x9d^\x8eq\xac\x14\xa1:r\xb1sg\x1e\x08\xf4\
-\x8f\x07!\xc5\xf8\x9db9\x22=K;Eb\xce\x01\
-TO\xa1c\xec\x9c\xcd\xd8\xd4\x15\xb9\xa9.\xf8x\x1e\
-\x1e\xc2\xe0\x85\x94\x1b\xe4L\x95\xc6\x0a@1\x17G\x91\
-\xe9R~!^.\x96\xca\xd9\x18\xa5H\x15j7?\
-\xc8\x81\x1f\xc4\xc83\xa5\x16B\xd9bB\x0e\xdc\xc8\x0b\
-\xc7\x80\xb4\x88E\x1f\xbe\x1c\xbe^\xef\x91\xb3\xf3}r\
-\xf4\xad\x9a\xbc}\xba$\xab\x8d\xb2LNT\xe5\xdak\
-\x06\xe4\x86\xeb\xae\x95kv\xdd\x22\xa5\xf2\xa4z\xc0;\
-\xad\xc0+\xb9<q\x05,\x00\x1d|\xb2\x90\x8d\xba\xcc\
--\xbc%G\x8f\xbe,\xc7\xde\x9e\x91\xa3'V\xb5\xe3\
-\x9b\xb2}\xac\xa9\x8b\xc1\x86\xec\xdc\xd1\x90\xe1\xe1\xa6>\
-`\xf1ic\x1d\xdfr\xae\xc8N\x9e-\x5c\x9e\xd0Y\
-X\xd7E\xda\xa9SK\xb2\xb2\xdc\x92\xdd{\x06eb\
-\xa2_\x9aMNO,\xee\xcf\x9e]\x95\x93\xef,K\
-\xab\xd9#\xd3\x07\xb7I\xb5\xba!\x95J\xc9\xfeJw\
-q\xb1!\xd3\xd3\xa3\xea\xdb\xb0\xcf\x12\xd6\x86\xfb\xe4\xdc\
-\xb9\xba\x9d\xf4\xdb\xb6U\xedU\xdc\x99\x99U}2+\
-\xcb\xe0P\x9f\xce\x0f}\xe2\xd3'\xc07^?g\xfc\
-}\x07\x86\xa4\xaa\xb1\xf8e\xd3\xfa\xa4\xa7\xab\xc0\xd3\xa7\
-\x97u[\x95\xbd{\x07e|l@\x17\x82\xc8e]\
-fgVdx\xa4\x22\xd5Zx\xc2\xdb\x9a[[\xd8\
-\xc2\x16\xb6p\xc5\x22[@\xe2\x15S\x5c\xcf\xb5\xbcZ\
-/\xcb\xdc\xb9\x1e993,\xa7f\xf4\xfes\xae\x22\
-\x95>\xbcXP\xd1\x85\xdf^98\xfd\x11\x19\x1a\xdc\
-!\xfdU\xfe\x9c\x1bo\x04W\xd6\xcd\xe0\x0aZ\x00:\
-6\x04_\xc9\xbb\xd1Z\xd1\x01Z\x92c'\x9e\x97c\
-\xc7\x8e\xca\x91\xe3\x8b\xb2\x5c\xef\x95\x91\x91\x1e\xd99\xb6\
-&\xbb\xb7\xd7e\xdf\xde\xf3zS\xc7\x1d\x1d\xbfC\x1c\
-\x07'[\x0c\xa6c\x85^\xe84v\x89>{\x82\xb0\
-B\xd8P\xc6\x86j\xc2+\xcfm\xe8\x16\xdb\xde_Q\
-\x83\xfe\xcfbo\x16Ga\xbc\x8b\xad7\x05|\x80P\
-\x97\x89\xf0\x07l\xd1\xa3\xb8P\x1c\xaf7\x81\xe5c\x82\
-n\x10pD\x9c\x0e\xdc\x1c\xb4\xce\xf0\x0a}\xccC\x01\
-\x11\xaf8\xd8\x9bY\x88\xed6\x951U\xb1X\x83\x0e\
-_R\x8a*\x10\x08/\xdf\xe3U\xbb\xa6\xae\xde\xc8\xd7\
-\x9d\x06\xe7\xcfTiI\x8d\xfce\x17\xc4\xb3\xe7y\xd3\
-\xa3\xfb\xcb\x9a+\x9e\xe2\xb1\x18\xc4+\xc7\x1a\x9e\x08$\
-\xe4\x82\x9a6\xf4A\xc2\xde*K\xde\x02\xf6\x0c\x1c\xd6\
-\xaf\xba\x85w\x1c\x22\x9c\x86c\xb0aAj\x22\xf2M\
-\xf4\x06\x94\xad\x1d\x1d\x10l\xb9\xbeq\x84\xb9\xd0f+\
-\xce\x11\xc4\x00R\x8e\xea\xd0\x1fY\xfb\x1d\xe0\x82\x97\xfa\
-\x14\xe54N\x11\xc5\xba\x1d\xa9\xbe\x9b\xdc\x05\xd6w)\
-\xa7[n\x80\xe7\x87\xb88\x16\xf5\x9b\xe0B\xe3\x99\xf6\
-\xd7\xa6\xe3\x99\x22\xc448\xc7\xdb\x0c\xbd\xfb\xa7y\x02\
-E=\x90\x94/8\xe6\x0e\xef\x07\x00\xfe\xe0\x14\xfb\xa6\
-\x88b,\xf5\xb3\xaa\x8b\xf5yY\x8f\xb9|@\x06\x12\
-~:\x86\x90\xc1\xcd\xc5Ka\x95\xe9!\xd4\xd1\x95\x07\
-\x04\xae\x89\xc5\x1c\x8a~i\xbbR;d/\x17}\x00\
-\xd8\x80\xd4\x96\xc6rx\x1c\xd5g\xb9t\xf2-\xc0\xe6\
-\x9d\xc2\xae\xf3\x85~7\xc07\xf4\x85m\xd0\x17\xb9\x17\
-\x82\xfb\x00\xf0\x83\x9c\xc6M\xe3y\xdb\xdc\xe7B\xf5\xa4\
-\xb99<~1F\x87\x98\xb9\xf6\xa7q:p\xdb\xe0\
->@\xc2O\xe7\x82\xc5\xc7\x06\x98nC\xca\xf8!'\
-\xd5\xe1\xbb\xfb\xce\xcdW\xe4\xedw\xb0\xf0\x1b\x94\xb9\xf9\
-^i\xac\xf5\xc8\xc8PKn<8!{v]#\
-{v\xde$\xb5\xda\x98\xf4\x96jI*^\xe9\x95\x85\
-+p\x01\xd8\x8e\x8d\x0d|\x7f\xe0\x1b\xf2\xc6\xb199\
-\xfc\xfa\xcb2\xbfT\x97\xc5\xe5u\xa9\x946d\xe7\xc4\
-\x9a\xec\xdbW\x97\xb1\x91\xba\x0c\xd5Z\xba \xe4\xe8c\
-2`\x01\xc25\x02\x06\x0f\xb7s\xdc\xee#\xa2\xec]\
-\x84#\x16\x04\x81\xafE\xbee\x07\x0dl\x98\x0eqY\
-`\xfeV\x11u\xbe\x9805\xad\x04(8\xea\x8e\xe1\
-\xc8&\x82\x87\x1a\xc2z\xc6\xa2\x04\x0f\x05K\xe4\xd3\xca\
-\x92sPNcA\xc6\x19\xaa\xd0;\x1b\xaa\xc2g\x1e\
-\xd8v\xb7;\x18\x19\x88Zp\xd8\xce\xa8\x83\x14\xebF\
-\xfc\xc8\xe1gG`\xf1LsZmW\xea\x19\x85\x00\
-s\xf1\xfc2\x05\x91\xf4-v\xf6r}`\xd9\xc5\xc3\
-\x80r\xe0(l\xbcH\xd14\xcd\x89V\x9d\x0c\xa6\x8e\
-g\xb4\xc5\xa6#cd\xb10\x16\x1e\x03P\x93-\x06\
-H\xa6\x22T\xc2\xbc\xa97?\x1b[\xc0\xdb\x8d=6\
-\xf6\x97\xfbANK@,\xc3\xc6\xcf\xeb\xc4\xf8\xb0\xe8\
-1$\xc6\xd3\x9a\xba\xd02cG]\xb4@\x1bK>\
-ZA\x1fB\xd2\x83\x8a\xe8\xa55k=\x5cT\xbb\x1e\
-\x80\x8dv:\xb3LF\x9e\xc9\xba\xa8#(\xd1\xdb\xd9\
-\x00[I\x0b@V\xf4r\xa4\xec\xb0\xf7\x80\x19b\x0c\
-\x8f\x8f\xbd\xfb\x00\x89\xb7n\xfc\x0cU\x9e\xa7\xb2\x06.\
-\x8e'%\xf4aq<Q\x22\x83\x91\xd2r\xc2\xcc\xfa\
-+\xf8\x05#\x99\x04\x1f\x8f\xfc\xfc\x8a\xdc\xc4+\xe13\
-\xdfhs\x86#\x7f\xae\xe6sb\xa6\xdeG\x06\x15\xf8\
-\x192\xea2v\x98\x07\xd4\xe81\x1a\x15\x9d\xa3\x12\x94\
-\xd3h\x11\xdeS\x0a\x17\xb2\xbeI\xfd\x01\xc6\x88\xfd\x11\
-\xe7\xb1\xf7i{t\x07\xa5\xd4\xce\xa60\x96G\x06\xa8\
-\x89\xf3!\xc2\xebM%\x0b\x92\x95(\x13y\xadKi\
-\x04\x1ei\xf3v9\xa0c\x04j=\x1a\x8f.\xf9>\
-\xfa3z\xaa\xcf\xf7<%\x8b`7\x9b\xc0\xcf\x08d\
-\xb9G\xac\x09Q\xfc\xc2\xe9z\xf4?\xe0\xe7\x01\x80\xa3\
-\xf3\xe8\xc5\x1a6k'\x90f\xc9c\x9e\xe9q\xb0/\
-\xd6\xab<\x8c#\xce\xd5\xd4C\xa9\x1b\xad\x1e]\xf0\xf5\
-\xca\xd2\xf9^]\xe8U\xe4\xe4\xa9\xaa\xcc\xbcW\x91\xa5\
-zI\x17\x84k2>: \xfbw\xf7\xc9\xf4\xb5\xd7\
-\xc9\x8e\xc9\x0324\xb8_\xc3\xf8\xd7\xb88R\xf9\xca\
-\xc3U\xb1\x00$\xd0\x8c\x0d\x1d\xcc9\x99_8!\xa7\
-g\xde\x957\x8f\x1f\x913\xef\x9d\x97\xf9E\x91j\xb5\
-%\xa3C\x1b29\xd6\x92\xb1\xd1\xba\x8cokJm\
-`]\x06\x07\x9av\xe1\xb2Ww\x14\xb8\x91\xe3\x02\x97\
-\xf6\x8a\x0d\xb1\xee8\x81\xe2\x80[\xc9\x8b\xe1bA\x04\
-9g\x03\xba\xd8\x81\x94\xe2r\x8a\xa0\xa7gJ(\x06\
-\xf1r*+Ru!J\x1a\xc1\x0ajH\xbdM\x0e\
-\xfa\xbc%\x85\xea\xbd3\xc2\x09G9\x1e\xf2^Q\x93\
-\xb3\xe5I\xc1?\x5c\x00B?2\x17\xdd\x19Wm\xc9\
-\x0d)\x03H\xa4+\x5c\xd0#^\xceq\x22\x06\xdb\x0a\
-\xc1\x0e\x9f4\x08\xd4\xba\x19\xcbh\xc8\x03\x94@\xc2!\
-\x88\xd6d\x8a\x0a\xb0\x80\xa81\xa0hm(\xe8C\xd4\
-v\x14\xf4.v\x8a\x81\xa2%A}>\x1f\x07\xfb1\
-\x0b\xa3[;\x07\xe8n1[\xa8\xc3h\x19R\x9fD\
-\xc6!\xe3\xa5\x9c\x14\xd4\xa7\xfb\xee\xc8\xb7\xc1\x90\xd5Q\
-\xf0\xedV\x15\xd0\xcd\xa7#R\xa7\x04\x16\xa3\x93\x7f\xb7\
-\x98\xc5\xdc;\xc4M\xdd\xd20*\xc7b\xc1\x90\xca]\
-\xc7?\xe5) B\x95\xf8\xb0\x9c0]\x0d\x0a\xc5\xbc\
-\x9f!\xb3D1\x0b\xa0\x084g\x03\xd1#!\xe2`\
-}\x09DF*fp\xb74h\x1b\x8a\xb1)\xe6\xf4\
-\x1d\x90Y\x13\x9f\xd4\xa3\xcd;\xe3E\x0b%\xdd\xa3_\
-}~\x18/\xe8\x5c4)\xf0\xd3B\x86\xe0\xdb\x11\xb4\
-e{\x0d\x90\x84\xcf\xe2\xc3\x0e\xb4\x9dW\x9912\xd2\
-C\x1b\x9cV\x8c\x13\x90i\xb3\xb8@\x91\x9b/\xc7R\
-\x91\xd7\x0e2t\xbfY;u\x87\xa3G\xe2\x1f\x00\xaa\
-\x10\x94kM\xfc\x84\xa8.\xf8\x96\xca2\xbfT\x92\xd9\
-y]\xf0\xbd[\x96\x85\x15\x91\xd5\xd5\x92\x0c\xf77e\
-j\xfb\x90L\x8c\x8f\xc8\x81\xdd\xfber|\xaf\x8c\x8e\
-LI\xb9\x8c\x9fks\xa45\x5c\xf9\xb8\xea\x16\x80h\
-\x8eI\xebMY\xa9\xcf\xc9\xf2\xd2\xac\x9cz\xf7\x98\x1c\
-;rZ\xce,\xbc+\xe7\x16*\xd2h\xadI\x7f\xa5\
-W\x86k=21\xb6*\xc3\xd5\x86\x8cO\x8a\x8c\x0c\
-5\xa4V\x0b_\x13\x821\xf6q\xd6\x80\x16W\x17\x1a\
-\xfewCW4|\xc4\xd1\x14{_%<\x95m\xd6\
-4\x7f\xb0\x02\xe2C\x1ccm\xe6\x87\xf8m\xef\xa1}\
-0X\xaa\x8a\xac:\x08\xba\xd9\x0c\xd6\x9d\xbd\x02\xe1\xd3\
-\x19\x03\xe8\xef-\xa5\x09&b\xd6\x0f\x8e\xd4\x06X\x5c\
-\x1e\xb2\x0b\x0ed\x8a<\xea.\x17&% \x17w|\
-?\xb0\x80]|\xcd\x16\xfa4\xad\xab\x136\xb3w\xb2\
-\xa1\x7f7\x1b\xaa\x0b\xd5\xe7(\x8e\xb9\xe5\xac\x80\xaf\xcb\
-8~8\xd3\x22,\xe4\x15\x18\xf3\xb4.\xc7\x85\xda\xe5\
-\x00\x0f~\xa9/\xe2y\xb9\xd3xv\xaa\xaf\x08\xe3\xb8\
-\xaf\x1eQ\x0f\x1c<\xa7b~\x17\x13\xd3\xd1\xa9\xafS\
-\xff\x8b\x89\xe1\xb8\x94~\xfa (\xc6y\xbf\xe7\xcb\xfb\
-\xe1w\xca\xf9b\xdb\xbb\x19<.\x84\x8b\xb9\xce\xa59\
-c\x9c6K?\xcd/\xab'9v\xc2\x85b:\xc0\
-\xc3\xb6Y\xca\x17\x13\x0b\x1c\xec:\x9d\x17\xae*\x8eS\
-\xce\x16\xb64\x0f\x94\x81\xcd\xeaNbba\x88\x17p\
-\xf0\x0d\x0d\x065\xe1\xd2__\xeb\x95\xf3+%]\xf0\
-\xf5\xc9\xec\xdc\x86.\xf8\x06dN\x17\x7f\x8b\xcb\xf8\xb8\
-\x10\x1e\xc5Jz\xcf_\x97\xfd{\x06djbL\xae\
-\xdbs\xb3\xd4\x86\xb6K_\xa5\xaa\xeb\x83m\x8ce\xb8\
-\xd4Ir\xf9\xe2*Z\x00\x16\x81\x05\x1b\x8f\x98'\x1b\
-\x1bMi5Wev\xe1\xbc\xcc\xcc\xbc,'gV\
-e\xe6\xbds:)\x96\xa5\xb1V\x97\xfajK\xef#\
-M\xe9\xaf\x96d\xb0\xb2&#\xc3k28T\x92\x81\
-\xfe5\x19\xa8\xb6\xec\x15\xc4jU\xa4\xbf\xaf%}e\
-\x9c\x8d\x22e|\xb9\xb0\xfe\xc7\xbcC\x1d\xf8\xddY\x9b\
-\x93\x85\x1e\xf57\x0c\x98\x07u\xa0\x01\xc5\xd7\x04\x00w\
-\xcfk#\xf8\xa6M7\xeb\xc5\xc1\xeb\xfd@\xb1\x02\x1d\
-\x9f\xc33_\x94?\xc0,\xca\xday\xb1\xd5\x17\xeb\x08\
-~\x98\xc2\xc5>\xec\x8a\x94\x86xZ\xce\x8dI\xd1\xde\
-\x0d\xc5\xea6\xe3\x02\xe0\x07N\xa71\x07R}7N\
-\x067]\xa8\xdeK\x80\x87\xb6\xaa\xb0\xebV\xd7f\xb6\
-\x0e\xc8\xda\x96\xb4!W\x97C\x0b\x17;\xb6iL\x93\
-\xedU\xe1\x8b\x00h\xef#\xf7\x0c\x89_\xc7\xb1\xf2\xe2\
-f\x1c\x87\xaa\xbb\xb6\x13\xaa\x0f\x92\x9f#\xf8\xe7\xfa\xfc\
-R\xe2\x15\xa1\xf1.f\x8c:\xb5?\xd5e\xd7H\x14\
-.!f\x1b`\xee\xd0\xde\x9co\x17\x8eAm\xd9u\
-\xae\x0b:\xc5\xcat\xa1\xfc\xa1\xe2\xfd\xc6\xdc\x84\x9f^\
-\xff/\xf9\xbe\xe2\xae\xd6~\xa2-Z\x8e\xc3>*\xd6\
-\xdb\xad\xef\xf0\x07\x9d\xf6\x22\x8c\xde~\xb1\xe1K\xfa\xa1\
-;_/\xcb\xf2\xf9\x92\xd4\x1b\xbd\xba\xb8\xab\xc8\xf2\xf2\
-\xba,.\xf4\xca\xb9\x95A\xe5\xaf\xd9b\xaf\xafo@\
-\x86\x06\xf0\x82\xcf\x90L\x8dTdrj\x87\xca\x22{\
-v\xde\xa27\xee\x9a\xd6\x85\xcf\xf3q\x16\x021\x1b \
-_\xba\x9ap\x15/\x00\x01o\x1a\x8eq6\xa1\xc9\xeb\
-\xeb\x0dYk6\xe5\xdc\xfc\xac>%\xcc\xca\xd2\xe2\x9c\
-\x9c>\xbb\xa4\x93\xa9!\xf3\xf3'ea\xb1_'\xce\
-yi\xb4\xaa\xd2\xbb\xd1R\xcf\x96\x86\xc0\x9f\x9f\xb4t\
-\x11\x88\xb7\x8d7\xa4Z)[\xd8\xb2.\x08\xf1\x81\xe6\
-J\x9f.\x00{cw\xfaT\xc2\x84\xa6DMZv\
-9\x87\xa0\x8a\x9f\xad\xb2R&w\xf0\xc8\xe9q\xf3\xc3\
-\x1f@\xa4\xf5\x99\xac\x04\xfb\xc3\x88\x0e\xf0:<J\x91\
-\x95\xe6J.p\xe1\xfc\x8am,\xc6q\x8b\xc9Z\xc8\
-\xdbU\xab\xf9\xa2dr\x80\xd5\x13\xda\x08D\x8b\xe7\x90\
-?\xa6\xf08\xae/rs>\xee\x1a+0X\x8c|\
-\xd8<\xcc\xdc\x1e\xcb\xca6.\x00\xf6\xb4ao\x0b\x16\
-\xf8\xe1\xc6g\xfe4\xb8\x0f\x90q\x82\x9f\x1a\xc2\xe29\
-\x94\xc1\x0d\xa7s\xce\x0fr\xc6!\xe0\x96y!\xae\x09\
-\xd8%\xb1\x12\x9f\xe2\x9c\x02\xd8F\x08\xba\x87\xa0t\xaf\
-\x13r\x9a\x03\xe0\xbe\xb9\xb8\xe0\xe8\xbfb\x5c\xa0\xad\xbd\
-@\xb1\xcd\x09\xc7b\xa1\xff\xa0\x80.\xf4\x05d\x1eb\
-\x9b\xa0\x82\x94\xeaRd}\x02$b\xca\x8d}b%\
-\xddh\xb3\xbd\xee\xb2\xd8i\xa8\xcc\x87\xb6b\xfd^o\
-\xec\xebh\xcdr\xd2C\xea\x03\xa4q\xdab\xea?\xf7\
-(\xcaE^\xae\x1cruXY\xff9\xafx}R\
-1\xa77\xe0@\x82\x81\xb5\xe3\x98p\x0a`\x8e\x04\xe3\
-\xa7\xf1\xd4\x16r\x8a}\xd9\x1e3\xb3\x19\x9f\x84N}\
-\x0a\xb8\x9f\xd7\x9b\xc5\xb0\xc2\xe6\xfei\x9d@{\x8c<\
-\xdf\x04RL\xce\xce\xf5\x02H\xc9\xe7\xe5q\xd2\x98E\
-\xd9\xe7\xbf\x8f\x1b\xadyX\x9f\x98@O\xe3\x07\x96Y\
-\x92~%R\xbb9e\xbe)\xd2\xb8nu~\xcc\x87\
-\xb1L\x0f\x14lD\xe2\x1bd\xa0\xd9\xec\xb5\xad\xa5\xb7\
-a\xfc\xben\x03\xbf\xe2\xb4\xa6e\xe9SfI\xef\xe9\
-e\xed\xcf\x92\x0c\xf67\xa4Zm\xc8\xd4\xd4.\x19\x19\
-\x1c\x91\xd1\xc1>\x19\x19\xdd+\xa3\xc3\x22\xb5\xdan\xa9\
-\xf5\xe3\x0b\xfd\x074\x22\xe2#\x1f \xdf\xde_\x14\x5c\
-\xe5\x0b\xc0\x22bS\xd1ll\xfe\xb21\x9e\x14\xd6\x9a\
-\xba\xcc\xd3\x85a\xa3\xb1 \xf5zIu--\x97d\
-\xe9\xfcyYZZ\xd6\x85\xa2\x1e!\xeb\xb1\xd9l\xe8\
-D\x5c\xd7\xa7\x8dU\xc1O\xc5\xad6\xf4Ic\xbdi\
-\xb1\xb6\xb0\x85-la\x0b[\xd8\xc2\x87\x89\x1e\xe9+\
-\xf5I\xb9\xa4\x8b\xbc\xc1\xaa\xf4\xf7\xd7d``@F\
-jC2<8(\xdb\x86\x87t\xe1W\x95\xberK\
-z\xcb\xeb2\xd0?\x22\xa5\x1e\xf0{\xa5\xb7T\x0d1\
-\x1c\xbe\xc8\xfb\xc5Y\xec\xb5C\xe4\xff\x01\x92:\xe3\xed\
-t\x174\x8f\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x08\x15\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
-\x00\x00\x00\x04gAMA\x00\x00\xaf\xc87\x05\x8a\xe9\
-\x00\x00\x00\x19tEXtSoftware\
-\x00Adobe ImageRead\
-yq\xc9e<\x00\x00\x07\xa7IDATx\xdab\
-\xfc\xff\xff?\x035\xc0\x9b\x99\x8c\xf7\xff\x8b\xe5)\xbc\
-\xbd\xf5\x94\xe1\xd5\x99\x83\x1b~}x3\xd1e\xf7\xff\
-\x03\x84\xf4\x01\x04\x10\x03\xc8\x01\x94\xe27\x13\x19\x1c~\
-^\xe6\xfb\xff\xff\xfd\xe6\xff\xff?\xdc\xf9\xff\xfb\xe9\xb9\
-\xffwg\xe5\xfd\xdf\xed\xc2\xd0OH/@\x00Q\xc5\
-\x01\xef\xe62\xec\xff\xff\x9a\xf1\xff\xff\xbb\xfc@\xdc\x05\
-v\x04\x08C\x1d\x11\x80O/@\x00\xb1\x80Ba\xdd\
-\xfa#\xff\x7f\xff\xfe\xc3\xf0\xfb\xd7_\x06FF\x06\x86\
-?\x7f\xfe\x021\x90\xff\x1bA\xa3\xb2\xff\x80\xd5\x80h\
-Y\xb6\x1b\x0c\x19\xfe\x8c\xd0x\xf8\xc4\xc0\xf0\xa5\x9c\x81\
-\xe1V?\x03\xc3O{\x06\xce\xa7\xe7A\xa2\x17\xf0\xc5\
-\x00@\x00\xb1\xac_\x7f\xf4\xbf\xad\xbd>\xd0\xc0\x7f\x0c\
-\x7f\xff\xfdc\x90\x91\x10\x04K\x5c\xbe\xf9\x04E\xa1\xae\
-\xba\x0cV\x03\xbe\x1fOd\xe0P\x012\xbe\x02\x1d\xf1\
-\x05\x9a\x9e\xdep\x00%\xae0\xdc~+\xc4\xd0\xf6\xaf\
-\xf8\xbe\x0b\x03\x03#.\x07\x00\x04\x10\xcbo\xa0\xaf~\
-\xfc\xfc\xcd\xf0\xf5\xdbO\x86?\x7f\x11\x0e0\xf5od\
-\x90\x14\x15`\xe0\xe0`e\xe0`ge8\xbf\xa5\x11\
-C\xf3\xbf\xcf\x0f\x18\xfe\x7f_\x08\xe1\xbcfe``\
-\x02:\xe0\x17\x13\xd0rn\x86\xe7\x0f>0\xdc\x94\x8e\
-gp\x92\x96a\x90\x94\x0c\xfd\xff\xfc\xf9j\xac\x8e\x00\
-\x08 \x16P\x90\xfe\x05Z\xfc\xfb\x0f\x84\x86\x01n.\
-v\x06#\x1dy\x06A>.\x06\x01~.\xac\xae\xff\
-y\xa1\x89\x81S\x03h\xeeo\x90\xa5@5L\x7f\x18\
-\x18\xde\x0b\x81\xe5n\x7f\x93c\xf8\xa8\xa0\xc3\xf0\xeb\xf9\
-+\x06\x16\x16&\x9cQ\x00\x10@,\xe0\xf8\x06Z\x0c\
-\xc6@6\x0c\xb0\xb1\xb20H\x8a\x090\x08\x80\x1c\xc0\
-\x87\xe9\x80\xff\xbf>00\xb1lc`d\xe7d`\
-x\x0e\xc4L\xc0\xe4\xf4\x8b\x1d\x18\x0d\xfc\x0c\xef_\x7f\
-f\xb8\xcd\xe9\x0a\xf6\xd4\x87\x0f\x9f\x18\xfe\xfd\xfb\x87\xd3\
-\x01\x00\x01\xc4\x02JH\xa0\xb8\x07\x87\x04\x92B\x09Q\
-~\xa0\x03\xf8\xa1\x0e\xe0\xc6\xf4\xfd\xc5\x09\x0c\xac\xd2@\
-\xc6\x1f^\xa0\xa5\xdc\x10\xdf\x7f\x06\xb2\x99\xd9\x18\x9e\xbd\
-\xe5fx\xa9\xec\xc4\xf0\x09h\xf9\xf7o?\x80\x0e\xc0\
-]\xd6\x00\x04\x108\x04\xfe\xfe\x01\x85\x00j\x14\x04\xba\
-\x193\xe8k\xca1\xf0\x00\xa3\x82\x87\x9b\x03\xc3\xf7\xff\
-?/``V\x01Z\xf8\x9a\x19h9\x10\xffec\
-`\xf8&\x08LO\xdf\x19\x04\xdd\x8b\x19>\x9c\xf9\xc4\
-\xf0\xed\xf3W\x86\x9f\xbf~3\xe0+\xec\x00\x02\x08\x9c\
-\x08A\x96\xc3\xa2\x02\x06\xea\xf2\xfcpj\xfas\x7f\x03\
-\x03\xbb\x1a\xd0\xf2\xff@\x8b\xbf\x82\x12\x1fP\xdf'P\
-\x1a\xe0`xx\xf7\x0d\x03\xbf\xbf\x1f\xc3\x97}k\x18\
-@f\xff\x06:\x00_\x14\x00\x04\x10\xcb\x1fp\x22\xfc\
-\x0fT\xfc\x0f\x1c\x02\xb7\x1f\xbc\x04\x07\xd9?PA\x01\
-\xa5A\x06\x80<\x01\x11\xff\xc7\xa0\xfa|\x22\x03\x9f\x19\
-0\xb7\xbc\x87\xfa\x8c\x09\x98v\xbe\x091\xfc\xf8\xfe\x95\
-\xe1\x16\xab%\xc3\x9b}\xe7\x19~\xfd\xfa\x03.7~\
-\x11\x08\x01\x80\x00b\x81\xc5=8*\x80\xf4\xf5;\xcf\
-Q\xf8\x7f\xa1\x09\x14F+\xfc\xda\xc6\xa0o\x09Lt\
-\x8c@\x1f\x7f\x81Y\xce\x06\xf6\xfd\xdd\xeb\x0f\x18v\xfd\
-\xf6f\xf8v\xfa\x06\xc3\x1fP\xc1\x06r\xc0\xef\xdfx\
-\xd3\x00@\x00A\xa2\x00\x1c\xfc\x7f\xe1\x85\x11\xccB\x88\
-\xa5\x90\x10\x82\xa5\x11\x15\x81\xf3\x0c,\x12\xc0B\xe9\xcb\
-\x1fPI\x00I|\xdf\x84\x81\xf2\xbf\x18\x8e\xbd\x94d\
-\xf8\xca\xc7\x0a\xb4\xf87\xd8\xf7\x90\x92\x13\x7f\x08\x00\x04\
-\x10$\x0a@\xb9\x00\x1c\x05\x7f1|\x8cL\x8b\xfd=\
-\xc7 \xab\x0a2\x0c\xe4\xfb\xdf\x10\xcb\xbf\xf3\x82C\xe3\
-\xd1\x85+\x0c\x179\xfc\xc0>\x06[\x0c\xf5\xd8o`\
-T\xa0;\x80\x91\xd1\x90\x13\x14v\xff\xff\x9f\xff\x0a\x10\
-@,\xbfa\xe5\x00\xb4 \x12\x16\xe4\x01\xc7\xf9\xdf\x7f\
-\xff\xe1\xf4/`I\xf9\xe3\xc7/\x06\xd3?\x9b\x18X\
-\xe5\x0c\x81\x96\xfe\x02&@`\xe1\xc2\x0c\xcc\xfb\x7f\xf8\
-\x18\x18X\x98\x19N=\x11b\xe0\x96\x91g`\x07Y\
-\x0a\xb4\xfc\xc1\x93W\xe0h\xf8\x05\x0d\x01\xa0\xa5\xcc\x10\
-\x97\x831\x13\xd4!\xac\x00\x01\x04)\x07\xa0A\x0d\x8a\
-\x02\x17k-\xb8KA\xe2\xdf\x80E\xf4\xcf\x9f\xbf\x80\
-\xc5\xee}\x06\xa1\xaf\x82\x10\xfd\xdf\xffC\x8c\xf8\x0d4\
-\xf3?/\xc3\xf3+\x17\x18\xe4\x83\xcb\x19dy%\xc0\
-f\x80<\xd33k=\x98\xfe\xf5\xeb\x17\xd0\x1cPt\
-1\x88a\x89\x01N\x80\x00b\x81\xf9\x1c\xbd \xfa\x09\
-\xf4\xf57`!\x02\xa9\x19\xff1p=\x9d\xcd\xc0b\
-l\x01,\xed~\x02}\xfd\x1b\x92\xf7\xff\xf0\x00}\xcf\
-\xc2\xf0\xe0\x01\xd0\x13z@\xcb\x7fC\xb33\x10\xff\xfc\
-\xf1\x13l\xc6\x8f\xef?\xf0\xa6\x01\x80\x00\x02\xe7\x82?\
-H\xf1\x0cR\xfc\xf5\xeb\x0fp\xf6\x81\xf9\x06\x849\x19\
-\xaf\x03\x95\xab\x01}\xff\x07\x9c\xe2\x19@)\xfb?\x1f\
-\xc3\xf3\x0b\xa7\x18~\xe9F0\xfc\xfb\x0d\xc9r_\xbf\
-~\x07\xe3\xef@\x8ba\xe5\x0b>\x07\x00\x04\x10\x22\x0a\
-\xa0\x16}\xf9\xf2\x9d\xe1\xf4\xe9\xc7\x90\x1c\x01N\x94\x90\
-\x10r\x15Pe`\xfb\x07,r\xff|\x05:\x00X\
-\xe6\xff\x06F\x05\x0b+\xc3\xbd\xc7\xff\x18.\x8bJ2\
-|\x7fq\x1f\xe8\xe3\x9f`\xf522\x82\xe0t\xf0\x0f\
-\xda\xae\xc0\xe7\x00\x80\x00b\x81\xd5\x82 \xfa\x1b\xd0\xe7\
-?~\xfcf\x90\x93\xe3\x87&\xca\xbf\xf0(\xf8\x0d\xaa\
-\xe3\x7f\xdb00\xb0\xdf\x05F\xc3]pZx\x7f\xff\
-:\xc3s\x06%\x06.\xa0[\xd8\xd9\xd9\x81\xeaY\xe0\
-\x8d\x99\xbf\xe0(\x05\x95\xb28\x1d\x00\xaa\xf9\xbe\x03\x04\
-\x10\x0b(\xa5\x82\x82\xff\xfb\xf7\x9f\x0c\xdf@\xc1\x06\xd4\
-\xfc\xe1\xc37x\xa8\x80\x1c\xc1\xfa\xe6$\x03\xa3(0\
-\xef3\x02\x8b]6\x0d0\xfe\xfc\xe6:\xc3\xb1\xad\xab\
-\x19^\xe9d3\xfc\xf9\xf2\x13\x1eR \x9a\x87\x87\x0d\
-l\xf1_p=\x83\x11\x05\xc0,\xc4\xf0\x0d\x98\x05\xbf\
-\x838\x00\x01\x04\x0e\x01Pp}\xf9\xf2\x0d\xdc\xc4\x02\
-\xa5\x89\x0f\x1f\xbe\xa3\x18\xc8\xf6\x11\xd8X\x91\x16\x87\x9b\
-\xf0\xf9\xc1u\x86\xbd\xb3\xe60\xdcQJc\xf8\xfb\xf9\
-'RT\xfd\x07\xd3\xec\xec\xcc\xe0,\xf8\xf7\xff_\xe4\
-\x10\x00Y\xf8\x15h\xf1od\xd7\x00\x04\x108\x11\x82\
-\xaa\xcc\x9f\xc0\xec\x02J\xc5\xa02\x5cV\x96\x0f\x9e&\
-@\xf8\xdf\x1f.\x86}\x07\xae2\xe8\xb1(2p\xbd\
-\xb8\xc8p\xf9\xd8Y\x86/\x96Y\x0c\xa2\xd0\xac\x0b\x0b\
-)x\xe9\x09\xd2\x07\x0c\xfe\xff\xa0:\x04\x9c\xb3\x18\x81\
-\x8e8\xff\x01[<\x00\x04\x10\x0b\xa8\xb6\xfa\x01\xcc2\
-\xbf~\xfe\x8166\xff0\x5c\xbc\xf8\x1cl\xe0?h\
-\x9d\xc0\xfe\xfa-\xc3\xdf\xef\xbf\x19\xce\xae\x98\xc3\xf0\xf9\
-\x07\x0f\xc3K17\x86?\xb7_C\x0a*\xa8:\xe4\
-\x10\x90\x91\x11\x00\xe6\x10\xa0\xa5\xa0\xc2\xfa\x1f(\xaaq\
-'B\x80\x00b\x01\xd5\xd7\xbf\xc1>\xff\x0d\xa9@\x80\
-XZ\x9a\x17%\x01\xfe\xfb\xc9\xc9\xf0\xe3\xfa\x09\x86_\
-R\x96\x0c\xffU\x1c\x19D\xfe!J\xce\xbf(Y\x8d\
-\x11X,\xb00\xb0\xb22\x81\x13 \xac\x80\xc3\x97\x0b\
-\x00\x02\x08\x9c\x0d\xff@\xf30\xac\xd9\xcd\xc6\xc6\x04d\
-\x83\x8aO\x08\xfe#$\x0d,\x84\xa2\x18~\x89h3\
-\xf0 eOp\x81\x03,%A\x0dW&`\xc1\x04\
-\x0b~H\xd9\xf2\x17\x9c\x0d\xff\x82\xb3!3N\x07\x00\
-\x04\x10\xcb/`\xb9\xfe\xe5\xed{\x86O\xc0\xc6#(\
-1\xde\xbd{\x07)\x07\xc0|\x08\xa4\x99D\x19\xfe\xbe\
-~\x8e$\x8eTy\xa1\xab\x05\xd2__\xbd\x00W\xc3\
-\x7f\x80e\xc3\xff\xff\x5c8\x1d\x00\x10@\x8c\xa0\xe01\
-0H\xfd\xff\xf1\xe3\x17p\x02\x14\x10\xe0\x827\xcd\x10\
-=\x18\x06x0\xa2\xf2\x11lt\xb1\x97/\xdf@\xd5\
-\x83::\x07p\xf6\x0b\x00\x02\x88\x91Z\x9dSr\x01\
-@\x0011\x0c0\x00\x08\xa0\x01w\x00@\x80\x01\x00\
-{\xd6(\xba\xe5)\x08\xf0\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x05\xb2\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
-\x00\x00\x00\x04gAMA\x00\x00\xaf\xc87\x05\x8a\xe9\
-\x00\x00\x00\x19tEXtSoftware\
-\x00Adobe ImageRead\
-yq\xc9e<\x00\x00\x05DIDATx\xdab\
-\xfc\xff\xff?\x03\x080222\xe0\x02\xad\xad\xf3\x16\
-011\xc5Cx\xff\x19\xa0Z\xc0\xe0\xef\xdf\x7f\x97\
-O\x9c\xd8\xe3\xb5u\xeb\xf2\x17@\xee\x1f\x06\x12\x01@\
-\x001\x80\x1c\xf0\x1f\xd9D4PS3}\xc1\xf4\xe9\
-k\xff\x7f\xff\xfe\xf3?6\xb0~\xfd\xfe\xff\x95\x95\x93\
-\xaf\x9b\x9a:\xa8\x02\x95\xb3\x92j?@\x001\x22\x87\
-\xc0\xcd\xc9\xda\x02\x7f\xff\xfd7\xfc\xf5\xe7?\xd3\x9f\xbf\
-\xff\x19W\xbc\xca\x88\x95\x92\x12\x8bKJ\xf2e\xe0\xe4\
-d\xc7i\xc8\xda\xb5\xfb\x18N\x9e\xbc|S\xe3\xff\xea\
-J}\x89\x8f_\xd9X\x18\xff\x01\xcd\xb8oUu\xf3\
->8\xc8 \x18+\x00\x08 \xb8\x03\xceuk\x19\xb2\
-\xb12\xeecf\xe7\x16\xe0\x14Sdx\xf2\x81\x8fa\
-\xf7#\x13\x86\xb4\xb4 \x06\x0e\x0e6\x82>Y\xb1b\
-\x17\x83\xd0\x8fc\x0c\x96\x0a\xcf\x18~}|\xc5\xf0\xfb\
-\xd3k\x86\xa7o\x7f\xe5\xb9\xb7\xdc\x9e\x03\x94\xfe\x09\xc4\
-\xff\xb0\xe9\x03\x08 \x16\x18\xe3\xcf\x1f\xc6\xf5B\xda&\
-\x02\x0a^\x9e@\xdeo\x86_7\x7f2\xb0\xadab\
-\xf8\xfd\xfb7\x18\x13\x02\xbc\xbc\x5c\x0c<\xb2\xca\x0c\x0a\
-~F`\xfe\xdb\xcb\x17\x19\xbem\xdd>)\xdb]\xec\
-\xfc\xd4\x9d\xaf\xce\x02\x85~`\x0b\x09\x80\x00\x82;\xe0\
-\xc7/\x06y\x19{\x1d\x86\xff\x7f\x9fB\x12\xd7\x9f?\
-\x0c\xdf\xbe\xf12|\xfa\xf4\x8d\xa8\xb8\xfc\xfa\xf5\x07\x03\
-\x0f\xd7G\xa0\xfe\x9f`\xbe\x90\x86\x04\xc3\x83\xa3B\x0c\
-<\x1c\x1ft\x80\xdc\x9b\xd0P\xc0p\x00@\x00\xc1\x1d\
-\xf0\xed\xe7\x7f\x06&\x96?\x0c\xff\xa1\xe9\x98\x9d\xf5/\
-\xc3\x9d;O@9\x00g\x14\xa2\xa7\xdd\xb8h\x0e\xa0\
-\xfe_0\x03\x81\x9e``\xf8\xfc\xfd\x1f(\xfe@\x98\
-\x09[4\x00\x04\x10\xdc\x01\xdf\x81\x01\x04\xd7\x0c\x04\xf2\
-\xd2\x0c\x0c\xcb\xe6\xb1\x93\x9e\xab\xe0\x0e\xf8\xc6\xf0\x03\xe8\
-\xa9_\xbf\x19\x18\xa1\x96c\xcd\xe7\x00\x01\x84\x12\x02\xc8\
-\x0e\xa0\x08\xfc\xfd\x07\x8a\x13\x86\x9f\xbf\xfe1\xfc\xfe\xf3\
-\x1f\xafR\x80\x00B\x09\x81\x7fD$6\xa2\xc0G`\
-\xba\x01\x9a\xf5\xe3\xe7?P\x08\xe0\x05\x00\x01Dv\x08\
-\xfc\xfa+\xc2\xf0\xe5\x97\x028\x1d\xfc\xfb\x07)\xcc\xfe\
-\x03\xe9\x7f \xfe\xe7\xef`6\xb3\x8c4\x83M\x10\x97\
-\xcd\xf2\x13e\x1bqE\x01@\x00\xe1L\x03\x84\xc0\xe7\
-\x1f\xb2\x0c\xec\x82^\x0c\xec\xec\xec\xf0\x04\x09r\x04\xc8\
-1\x7fE\xff\x01\xb3\xf5?\x06}\x99\x7f\x0cL\x97\xef\
-\x84,Z\xb4\x995.\xce7\x11\x149P\x0c\x07\x00\
-\x01\xc4\x84\x08\x01\x88\x03\x88\xc5\xff\x80I\x1cd9\x0f\
-\x0f7\x18\xf3\xf2r3\xf0\xf1\xf10\xf0\xf3\xf3\x80i\
-\x08\xe6\x06\xd5\x15\x0c\xea\xea\xaa\xfe\xf3\xe6m\x04e'\
-> fFv\x00@\x00\xc1\x1d\xf0\x03\x1c\x05\xbf\x89\
-\xc6\xff\x80\xe5\xc4\xff\xff\x84C\x0a\x14\x12zzJ@\
-G\xa8\x04\xcc\x98\xb1\x1e\xc3\x11\x00\x01\x04w\x00(\xee\
-p\xfa\xf6\xd7O\x86\x7f_\xbf!\xf0\xc7/\x0c\x7f\x81\
-A\xf6\x9f\x08\x17\xfc\xfd\xfb\x1f\x18R\xac\x0cFF\xaa\
-\x0c\x9a\x9a*\x01\x93&\xadAq\x04@\x001!+\
-\xfe\x07\xb2\x0c\x19\x03\x13\xc6\xbfW\x1f\x18\xfe=}\x0b\
-\xa1a\xf8\xdd'\x86\x7f\xdf~\x12\x97#\x81Q\x00\xaa\
-\xe9A\x8e00Pf\x90\x96\x96\x0a\xe8\xed]\x01w\
-\x04@\x00\xb1\xa0\x16\x22\x88<\xf3\xff3\xd0\x82\xcf\xb8\
--\xf9\xcbD\x5c\x14\xf0\xf2r2l\xdat\x1c\x1c\x12\
- \xc7\x80h!!\x91\x00\xa0T\x05(3\x01\x04\x10\
-\x0b\xb6R\xec\xffG`\x96\xf8\x8a?G\xfcc\xfeK\
-T\x14\x18\x19\xa9\x81\xd3\xc1\x8f\x1f\xbf\xe1\xeao\xdf~\
-\x06\xa2\xf8\x81\xf8\x15@\x00\xa1:\xe070\xce\x7f\x00\
-}\xf6\xf1;A\x83\xff1\x13\x17\x02\xac\xac\xac@\x07\
-\xfcf`aa\x01gQ\xa4\xa4\x07\xb2\x9b\x09 \x80\
-P\x1c\x00Jl\xff_\x7fe \xc6\xe4\xbf`\x07\x10\
-V\xf7\xfb7$\xa4@\x0d\x1e&&D\xa1\x05\x03\x00\
-\x01\x84\xea\x80\x8f@\xcb\x7f\x13W\x18\xfd\xfb\xf3\x17\xaf\
-;\xff\x00\xe5\x7f\xfe\xfc\x03\xb6\x10a9\x03\xdc\x110\
-\x00\x10@\xa8Q\xf0\xe1+$?\x12\x93\xbaYPC\
-\x00d\xe8\xaf_\x7f\x80\xf8/\xd8r\x98OA9\x80\
-\x89\x89\x11\xc9r\xd4\x00\x06\x08 \xb4( \xbe(F\
-\x0e\x01\x98\xc5\x08K1}\x8c\xec\x08d\x87\x03\x04\x10\
-\xd6\x5c@\x94\x03\xfe\xfe\x81[\x0e\xcaZ\x98\x962\xe0\
-t\x04r\x08\x00\x04\x10\x8a\x03>|\xfc\xcb\xc0\xcf\xf5\
-\x8f\xb8(\xf8\xfd\x07\x1c\xd4\x90\x165f0\xe3s\x04\
-\xb2\x03\x00\x02\x88\x05\xd1\x86\xf8\x7ft\xd3)^k\x0b\
-\xd5\xcf\xc0\xe6\x18\xe1t\xf0A\x04\xe2\x13\xe4\xd4M\xac\
-#\x90\xa3\x00 \x80\xe0\x0e\xb8\xf2\xecS\xf8\xcf?<\
-S^\x7f\x12\x0c &\x04\xc4\xf48\x18\x0c0|N\
-\x9c#\x90C\x00 \x80\xe0\x0e\xd8}\xe3\xe5K N\
-\x012+\xa1\xe54\x0b>\x07\xd4[\x17\x02\xd52&\
-\x12Jp\xd8h\xe4\x10\x00\x08 dK@\xa9\xea\x03\
-\xb4\xfd\xce\x86^Q\xa1\x03\x1e\x1e\xc1\xf7 \x83\xb0[\
-\x86\xdf\x11\xc8!\x00\x10@\xe8\xbe\x04\xa5\xaa\xafPL\
-\xa0\x88\xe5\xf8\x013\x88TG ;\x00 \x80\x98\xc8\
-mw\x82*\x18\xe4\xfe\x02\xc82Ht \xd3\x10K\
-\xd1\xc5\x91\xa3\x00 \x80X\xc8ny\x03\xab\xd6\xcb\x97\
-\x1f3<x\xf0\x06\xde\x16D\xc6\xa0\xb2\xe1\x1f\xd0\xbb\
-\x98b\xff\x81\x1d\x9e\x97ps\x00\x02\x0c\x00\xfbf\x7f\
-l\xc36v\xb2\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x07\xa0\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
-\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x0b\x12\x00\x00\
-\x0b\x12\x01\xd2\xdd~\xfc\x00\x00\x00\x07tIME\x07\
-\xd3\x08\x1c\x13\x19\x0c\xfe\x17\x9f\xdd\x00\x00\x07-ID\
-ATx\xda\xc5\x97\x7flUg\x19\xc7?\xe7\xdc\xdb\
-\xdb\xde\xb6\xb7@\xa1\x80H\x87e\x8b\xc2\x0a\xadts\
-\xb0a\x1d\xc3e\x03-nf1\x04\xd0\x88&\x1a\xb3\
-\xd6hb\x98FgL\xa78\x05\x9c[\x06\x99?\xc3\
-\x1f\xca\xfc\xc3,f\x9b\x19\xe2\xc6\xac\x94\xe2\xa0c\xd8\
-\x0a\xf2c\xfcl{)\xed-\xed\xfd}~\xbc\xbf\xfc\
-\xe3\xdc[\xa8\xa3\x22:\xe5M\xde\x9c\xf7\x9c\x93\xf3>\
-\xdf\xe7\xfb|\x9f\xe7<\xafe\x8c\xe1f\x0e\x9b\x9b<\
-\xc2\x00\x96e\xbd+\x9b=\xbe\xf9\xe5\xba\x10%;\x1d\
-\xdf\xeb\xda\xd2\xfe\xd0w\x01\x1f\xd0\xff\x17\x06\xda\x7f\xb8\
-\xa7\xbd\xa2\xbc\xe2l\xcb\xc7\x1a\xee\xad\xac\xac\xf8\xe6\x9a\
-G\x1e[\x09D\x01\xeb\xba\x0c\xfcW\x86\xb7\xfca\x09\
-X;\xeb\xe6\xcdh\xfc\xc4\xaa\xc5\x94F\xc2\x94FB\
-$F\x92O\x03+\x0b,\x88I7\xf8OE\xf8\xe4\
-\x8f\xf7N\xdd\xfc\xa3W\xdb\xb7m\xef0g\xce\x8d\x19\
-!\x8c\xb9|\xd93\xc3\xc3yc\x8c1\xcf\xed<h\
-\xd6}\xee\xe9\xad@\xf5\xbfb\xda2\xc6P\xb1\xb6\xb3\
-\xc3(e\x1bm,\x8c\x09@\x99+\xe0\x8c6ho\
-\xe4\xfb\xea\xb5\xf5{\x01\xf1\xe4S\x7f\x5ca\xb0w.\
-x\xff\xecykV\xd5\xe3{\x1a!\x14J\x19\x94R\
-\xd8\xb6EiY\x09Ol\xd9\x93\xdd\xf7\xfa\xf3-\x07\
-\xf7\xef\xea\x06\x1c\xc0\x5c3\x04\xf7.\xaa\xbe\xf7\xa5o\
-\xd7\x93\x04\xa4\x02W\x81'\xc1/\xac\xf7\x1cL\xb3\xed\
-\x17\x7f}%\xbc\xfa\xd7\xed_[9\xbdf\xda\xb4\xd8\
-\xa3\x0f\xae\x5c\xc8-s\xa7\xe0\xba\x1a\xad'\xee+\xa5\
-\xa6\xdc\xb6\xb9\x7f\xc5\x82\xca\xc4\xc8\xea\xa7\x0e\xee\xdf\xd5\
-R\x08\x83\xb8&\x00c \x0d\x0c\xe4A\xea`\x0a\x19\
-\x5c}\x05K\x1a\xaa\xd8\xb4\xbe\x8e\xfci\xf5\x9d\xe5\xcb\
-\xdf\xc7\x87\x97\xd6a\x0cH9y\x88\xc6\xc6r<p\
-\xdf|\x0e\xbd\xd5\xdf\xb4\xa8\xe5'[\x8f\x9e<\xb3\x8d\
-\xb7\xb7\x1e\x05\xd4\xd5L\x84)\x22\x98dh\x01\x17\xdf\
-<\xce\xecl\x9a\x96\x8dK\x99US\x8e1\xa0\xf5\xf5\
-u22\xe2\xf2\xe9O5q\xf2\xdc\xe8\x86\x93C:\
-%\xe0q \x03\xc8\x09\x00\xb4\x01u\x0d\x0c\xe9\xc1\x0c\
-}\x87z\xb9\xbbi\x1ew.Yx\xc3B\xf5}\xc9\
-\x9c\xd91\x1ez\xf0\x03\xa4\x92\xc3u/w3\xad\xa0\
-\x85\x89\x00\x8c6\x13\x00H\x1f\xce\xec?JT\xfbl\
-\x5c\xbb\x94X\xe5\x8de\xeb\xb1\x0bY~\xdf=\x02\xda\
-`\x85,\x22\xe1\x10}b\xf6\xea\x92e?\x7fB\xe8\
-\xe8E\x08\x8b\xc0k\xd1\x130P\x88\xfb8\xf2\x9c\xc4\
-O\xa5\xd8\xf8\xd9\xe57\xec\xf5\xd1\x0b9\x1e\xfe^\x0f\
-\x1f\x5c0\x83\xdb\xde;%\xd0\x89gh\x5c\xb6\x88[\
-\x17y\x1b\x94!i\x8c1{\xff\xd2\x17\xcb]\x1a\xfc\
-U\x18@\x99\x89\x0c\x94O\x0b\x13\xa9\xae\xa6\xfb\xc8\x00\
-\x1fZ2\xf7\xdf6\x9e\xca\x09\xbe\xfc\xdc\x09\x9a\x9b\xe6\
-\xf0\xe8\xbazN\x0e\x05\x22\x06\x88\x94\xc0\xd0\xb0\xcf\xd0\
-X\xdes2\xee\xa5\x5c\xfe\xccb\xb2'NL\xaa\x81\
-=\xe7K\xd9\xf2\xd2Y\xe6\xd5&1\x06\x8c\x0a\xea\x83\
-\xd1\xba\x102\x83\xd1f\xfc\xb9\xd6\x86\xbe\xa1<\x8d\x0b\
-jh\xddP\xcf\x0bG`4\x17\xec\x0d`\xdb\x10\x0e\
-E8p\xe8\xe2\xac\x81?\xf7j*\x84\xcd\x99\xad]\
-\x85\x10h\xa4\xbab|p\x04^\xdc\x17g\xd7\xa6F\
-*K\x0c\xb1X)R\x81\xc4 4He\x90\x12\x84\
-2(\x0dB\x81\x94\x86hi\x09S\xa7\x97\xf1b\x0f\
-d\xdc+\xc6-+`\xe0\xd4\x1b\x17\x18<pB\x13\
-\xd6S\xf1G\x0e\x00\xfe\xb8\x06\xaef\xa0\xeb\xc80\x8b\
-\xebb\xb4\xdc5\x85\xb3\xe7\xd3L\xad.\xa1\xa2*L\
-\x06H\x0b\xc8\xe4!\xed\x043\x97\x87\x8c\x03)\x01\x99\
-1\xc8\xc4\x03\xe3\xa2\xe0\x90r\x05\xc9\xf8\x18\xc7\xf6\x9f\
-bt8\xed\x90\xf5\x87\x98*\xdfC\xf6\x5c\x17\xe0\x14\
-\x00\x04\x9e\x14+\xf6\x0b\xaf\xf6\xd1\xbe~>.\x10\xad\
-\xa9\xe2\xec\x85\x04\xb7\xdd^\x83g\xc0\x17\xe0\x0aH\xa6\
-!\x9e0\x8ce4\xfd\x83\x1e\xc9\xb4&\x95Qd\xb2\
-\x127\xef#\x5c\x0f\x99\xc91\x1a\x1fet,\x8fr\
-D\x0aW$\x08\x990\xb6)%u\xb0\x1b\xc8\x17D\
-\x08\xb2\xc0\xc0\xdb}\x92\xc1D\x9e\x96e\xd5x\x1at\
-\x04\xa8\x9a\xc2\xb1\xb3\x19\xaag\xc58\x1d\x87\xfe!M\
-2\xadH\xa6\x15\xa9\x8c\x22\x99Q\xa4R\x92\xd1\xb4\x22\
-\x97\xf5\x90\x8e\x8f\xcc\xe5\x19\x19\xbc\x8c\x92\x1ae\x97\x81\
-\xf0\x83\x0aXJ\x052\x7f\x9a\xd1\x8e> o\x8f3\
-P\x00\xb0\xbb3N\xcb\xd2\x1a\xca# \x0cx\x80(\
-\x8fpj\x18\xbaO\x18\x86\xc7\xc0\x13\x06_\x04Z\x10\
-\xca \x04\xf82X\x1b\x03\xe9\xb4\xc3\xa5D\x16\x1d\x89\
-bUT\xe2|\xf13\xe3\xe1\x9dS\xa3+\xf1/\xf7\
-\x10l\xed\xda\xc5,(\xd6\x81}\x87\x87X\xb3t&\
-\x1e\x90\xf1\xa1o\x14\xe2I\xd0\x91\x18C\x89\x1c\xbe\x08\
-\x0cJ\x05\xbe\x04!\x021Jm\x91w\x14\xf1x\x9a\
-\xacg\x08W\xc6\xb0\xc2a\x92k\x1f\xa1\xac\xb5\x06\xe7\
-\xb1\xd6j\x80\x8bi\x15%\xd9\xf5\x0a\x90\xbfJ\x84\x06\
-\xa9\xa1\xef\x82$\x9f\xf3\xf9\xf8\xdd\xd3\x19\xc8\xc2@\x16\
-r~\xf0\xd316H+\xc4h\xca\xc5\xb2#\xf8\xd2\
- \xa5\x092@\xc1`\x22\xc7P\xc2\xc3\x8a\x96\x93\xbc\
-\xff#\x00L\xfb\xed\xef\x0a~\xdf\x09\xec\x86RS\xe1\
-|i\x13\xc0/\xa3m\xcc\x1d\x07\xa0\x0au\xe07\xbb\
-\xcf\xf3\xf0\xb2\x99$<\xc8z\x10\xb5\x82\x14\xb2m\x08\
-\x85\xc0T\x95\x12\x1f\xc8\x10-\x0f\x11A\x12\xb1\x14\x11\
-#\xc8\x8df\x88\x86`\xf6\x8c2\x8e\xdfq\x0fe\xad\
-\x0a\xb77\xc4\x18\x9f\x84f\x80&h\xde\x8d\xc3W\xe7\
-\xd0\x0ce\x0d\x0a\x87\xda\x81h[\xbf\x1d0P\xc8\xe7\
-\x8e\xeeA\x9e\xdf\xd4\xc8\xc2\x18\x10\xbb\x92\x96J\x81\x10\
-\x0a)\x15ra\x09Bx\xc1ZJ\xa4\xd4\x08\x11)\
-\xac%\xc7\xc4\x9f\xa8\xdfq\x1fe\xad+\xa0\xa1\x11\xb8\
-\x1d\x98IY\xc3O\xa1\xe1\xef@\x0f\xee\x8e\x0e\xa2m\
-\xfd1\x02b\x03\x0d\xbcv(M\x08\xc3\xaa\xa6\xaaw\
-v\xae6\x84B\x16\xb6]\x9c6\xb6mcY6\xb6\
-m\xfd\xd3;\x8b\xbf\xdd\xf5:\xee\x8e\x0e\xdc\xdeg\x80\
-\x99\xc0\x1d\xc0L\xdc\xdeg\x8a\xc6\xe7\x17\x9b\x93\x02\x00\
-C\xe7\x9b\x83|\xfe\x81k\xd7\xfd \x0cE\xc3\xa1q\
-\x83\xa1\x90\x8de\x15\x0d\x87\xb0m\x9bP(\x00u\x9d\
-\x91/\x02\x18\xaf\x84Gz/\xf1\xb3/\xdc3\xe9\x17\
-\x96\x15x\xaa\xf5;\x99\xd0\xda\x10\x0a\x99\xf1w\xf5o\
-\x14B@#0\x0c\x1c\x06\x86)k\xf8\x0a4\xf4\xe0\
-\xd0q)\xda\xd6o\x8d\x038}\xf62\xb7\xde\x12c\
-\xc1\x9c\x92\xc9\x0f\x10v\xa1dk\x81\xe7\xfb\xb8\xae\x87\
-\xe7\xb9\xb8\xae\x87\xeb\xfa8\xae\x8b\xeby4\x1f_W\
-\x10a\x07tv\x10\x88\xee[\xb8\xbd\x9b\xa1\x93\xe0\xbe\
-U\xe1Pk\xa2m\xfdV\xb8\xc8\xf1XZ\xf0\xd1\xaf\
-\x1f\x06\x13\xa4e\xd0\x1d\x07\xed\x9a.\xfc\xf9\xb4Vh\
-\xa9\x91J\xa1\x95F+\x85,\x5c\xfb\x13\x1e\x99\x84\x00\
-\xbd\x15\x87M\x00D\x9f\xfd\x01\x0e\xdf\x80\x86\xb7\xa0\x13\
-\xa2m\xfd\xcd\xce\xf6\xdaN\xb73D\x91\x01\xcb\x18\x83\
-eYU@-0\xe5\xdd>\xfb9\xdbk\xbb\xcaZ\
-kpw$\x88\xb6\xf5\xd7\x03q\x82\x1e\xd8\x5c\x0d\xa0\
-\xa4p\x8c*\xf9_\x1c@\x9d\xed\xb5#\xd1\xb6\xfe\xe9\
-\x05\xe1M\xe8\x09\xad\x9b}<\xff\x07\x19\xbf\x1f\xed\x82\
-\xbbD\xa7\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x07+\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
-\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\
-\xd4\x05\x10\x0f(\x14\x91Y\x11\x9c\x00\x00\x06\xb8ID\
-ATx\xda\xbd\x97[lT\xc7\x19\xc7\x7fg\xef\xbb\
-^_bL\x8c\x0dlL\x0cq\xc0\xd4\x80\x03\x89\x1c\
-\xd4\xaa\x128\x95\xa8DZ\x1e*\xd4\xa8)\xe0\xf2\xd0\
-G^\xfaVU\xa2R\xab\xaaUQ\xd3\xa7V\x16X\
-\xa9\xd4\x90(QCR\xa5\x84\xb6\xa0\xb4O\x0e\xa6\xa4\
-\xc2!8\x80\xc1\xc6^|_\xaf\xd7{\x9bk\x1f\xf6\
-\xac\xb3\xcb\xae\x89U\xa9\x1di43g\xe6|\xff\xef\
-\xfb\xcf\x7f\xe6;\xc7\x016\x01=\xfc\xff\xca\x9f\x01\x09\
-(\x00\x1f\xd0s\xea\xd4\xa9\xb7zz\xfe\xb7>H)\
-9s\xe6\x0cCCC;\x80) \x09\x18\x1f@O\
-O\x0f\xdd\xdd\xdd\x0c\x0e\x0e\x02`\xad]yq-\xfd\
-\xd2\xf1j\xcf{{{\x19\x18\x18\x00h\x05\x96\x80\xd4\
-\x8a\x03\x00\x83\x83\x83\xfc\xf1\x9d\x0f\x88\xb5?[f\xc0\
-X\xcb\xa5\xf7\xde\xe4\xc8\xd1W\xc9dEEd\xdaX\
-.\xbdw\x9eC\xdf\xfen\x058\x80\x05.]8\xcf\
-\xc1\x83\x07\x8b\x8fB.\xf3P\xda\xb1\xd6\xb2\xb9\xfdY\
-\xa2\x1b;+\x8c\x04\x22\x17i\xdd\xf6\x1cS\xf3KU\
-\xe9\x0d\xd64\xb0e\xe7\x0b\xcc,\xa4\xaa\xce\xfb#\xf5\
-\xa5C\xc7\xad\xe5\x0e\xe0z\xfa\xc8b\x00\xe2\xf7G\x18\
-x\xed4B\xaa\xaa\x00\xf1\xfb#\xbc\xfe\xdb\x9f>v\
-\xdeZ[\x95\xa12\x06\x0e\x7f\xe7{\xb4m\xdfW\xb1\
-\x05\x03\xaf\x9d\xe6\x9f\x7f}\x7f\xd5\xfd>~\xfc8g\
-\xcf\x9e\xad\xaa\x03k-}}}U\xc1+\x18\xc8\xe7\
-%\x93\xb3\xc9\x8aEy\xa1V\x05/FV\xedy5\
-Q>\xd6\x81\xc7\x95\xb5\x00\xace\xee\xd1\xe2);\xab\
-\xca\xac\xc9\x89\xff\xd6\xc1\xc72`\xad\xe5\x1f\x17\xdf\xa6\
-\xae\xf1\xa3\x0a\xc33\x0fns\xec\xd8\xb1U\x8d]\xbd\
-z\x95\x13'N\xac\x0a244\xb46\x0d\xf4\x1e>\
-J\xf3\xd6=\x15\x0e\xbc\xf5\xbb\x9fs\xee\xdc\xb9U\xa3\
-\xeb\xeb\xeb\xa3\xbf\xbf\x7fU\x06N\x9e<\xb9*\x1be\
-\x0c\x18cH\xa5s\x15\x8b\x946\x8f\xa5x-\x22\x5c\
-\x13\x03k\xd9\xff\x85\x85\x05\x86\x87\x87\xf9\xec\xd3aL\
-:M.\xbdD:>\xce\xafO\xff\x84@M\x94\xe6\
-X\x1b\x9d\x9d\x9dttt\xe08\xce\x97\xda-c\xe0\
-\xf6\xada\x22U\x8e\xe1rr\x81\xbf\xfc\xe9\x1d\xe6n\
-\x0dc\xc7\xef\xd2\xd5T\xcb\xabu\x11l>\x8f4\x92\
-\xef\xbf\xb0\x15\xa1\xa6\x10\x0b\x86\x89\xb1\x7f\xf3\xf1\x85?\
-\xf0\xae7\xcc\xe6\xee}4\xb4m#\x1e\x8f\xaf\x8d\x81\
-p\xd0\xcf\xc6\xf5\xf5e\xf7\xf8\xed\x1b\xd7\xd8\xdfZO\
-\xc3\xb5\xbf\xf3|8H\xa8\xa5\x0e\xa35jy\x19c\
-\x0d\xca\x18\xa4\xb1hk\xc1Bs$\xc4\xbap\x80\xac\
-T<\xfct\x90\x8f.\xbe\xcf\xf4\xddI2\x99\xcc\x97\
-;\xb0iK\xc7J.\x10\xb9\x0c\xb3\xb7>\xe6D,\
-\xc4\xd7\x1b;\x91\xcb\xcb r\x18\xf7v\xd4\xd6\xa0\xac\
-Ei\x83\xb6v\xc5\x09\xa5\x0d\xcaX\xac\x85\xf5\x91\x10\
-/o\xdb\xcc\x81\xf6M\xbc\xf1\xcb\x9f1;5EI\
-\x1ep\xca\xee\x81G)\x9a\xbbs\x9d\x97\xa2)\xbeV\
-\x17(\x80\x17\xb3\x9f5(k\x90\xda\xa0t!zi\
-,\xcaX\xe4\xca\xd8 m\xa1U\xd6\xe2\xb7\x86\xedb\
-\x91\xb6\xa0\x03\x10\x06\xbc\xc5\xa4\xe4y4u\x02$\xe7\
-\xa7\xd9#\xc6\xe8\xad\xf3\xa2s\xb9\x95\x9cP\x04\x16Z\
-\x937\x96\xbc6\x08\xb7\xe6\x95v\xfb\xba\xe0\x801\x08\
-c\xc9+M^\x1b\x109^\xe9\xda\xca\xf3\x1d\xed\xdf\
-\x02j]\xf6\x9d\xaa\xd9Pd\x96\xf8\xd1\x0f\x0e\xa1&\
-\xc6]\xf0B$\xda\x8dL\xebBt\xda\x822\x16e\
-\x0aZ\xd0\xc6\xa2\xb1_\xe8\xc2\xd8\xb2\xf7\xe4\xe2\x22\x87\
-\xf6t\xee\xf9\xd7\x9d\xfb1\xa5\xf5\x18\x90/;\x05\xdf\
-x\xf9(\x1d\xbb_\xe4\x83\xd7\x7fC\xd4\x0b\x19\xad\xd1\
-\xd6`\xacE\x14\x0d\xba@\xca\xba\xc0\xd6\x92\x08G\x99\
-\xb7\x81\x82\x16\xb4A\xaf8dPF\xbbma}\xb4\
-\xa1\xb1iCSclbz6\x0c\xa4+\xee\x81\xc9\
-\xd9$\xc9L\x0e\x82A\xb4-P\xf9\x05`\xa1\xeaR\
-\xe5\xd7x\x10\xfbc\xbc9\xdd\x852\x12\xa5$J)\
-\xb4\x94h]\x18k\xa5\xd0J\xa2\xb5\xa2\xbb\xd6\xe7\xcd\
-Z'\x0c\xf8\xcb4P*B_0\x82\xbf\xe9I\x8c\
-\xdf\x8f0\x16\xa1\xed\xca^\x0bwO\xa5)\xec\xb7w\
-c\x80\xe7\xf6e\x895\xa7Hx\xc3,x\xc3,z\
-B$<\x01\x16=A\x16=\x01\x16\x9d\x00\x09\xc7O\
-\xe0\x89F\xa6\xa7\xa6\xa3\xe9t\xba\xc1\xd5\x80\xc7S\xfd\
-\xd6\x03\x13\xae#\xb4\xa1\xc5U\xb6AhW\xe5\xb6\xa8\
-\xfe\x02\x0b\xa1\xa7\xc2\xd8\xa0\xc3\x81\xd8$Qo\x06\xa3\
-\x14ZK\x8c\xd1(\xad\x0a\xd1kI\xd0\xe7\xe5\xe9\xfa\
-\x1aFo\xde\xf4\x1a)}\x15\xc7\xb0\xa5\xa5\x85\xc9\x91\
-\xab\x8c\x5c\x1e\xa0\xce\x9f\xe3\xf2\xf5\x9bD\x9e\xe9$\xd2\
-\xb4\x1ea,Rk\x84q\x15o\x0dymP^\xa8\
-\xd9Y\x8b\x14\x86g\x1a\x12\xeco\x9e@IQ\xa0^\
-K\xb4\x14(%\x09\xf9\xbdt5\xd5\xf2\xe0\xfa\x10\xa9\
-\x87\x13\xf7\x85\x10c\xee\x7f\x81]\xd1\xc0\xde\xbd{\xe9\
-\xef\xef\xc7ZK6\x9b\xe5\xf7\xbf\xfa\x05\xad\xe3S<\
-\xd5\xb1\x1d\xeb\xf1096^P\xb4\xb5H]\xd0A\
-hS\x18O\xd4\x83\x94\x16k4_m\x9d\xe6\xc3\xcf\
-\xa3,*\x0fFI\x8cV4G#\xb4\xd7\x06\xb9w\
-}\x88\xa9\xdb#\xa4\x1eN^\x01\xee\x01\x19@\xfb\x00\
-\xae\x5c\xb9\xc2\xe8\xe8hY\xe2\xc9\x05\xc2\xfc\xf8\x8dw\
-\xf9\xe1\x81\xfdtl\x88\xf1d0\xccl|\x92\x5cr\
-\x09a\x0c\xc6\x03M\xbbjQ\xc2 \xa4AIM\xbd\
-O\xf2\xcd\xb68\x17F[\xa9\x09\x85Y\xef\x8f`f\
-\xe2\xdc\xb86Bf~\x86\xd4\x9d[\x18\xad\xff\x06L\
-\x00i@;@;p\x04h\x02\x02\xa5\x9f\xcc\x0ex\
-\xba\xb6\xc4\xb6\xf7\xee\xde\xf9\xe2\xe1\xee\x1d\x11-rd\
-\x13I\xd2\xa9\x14& \xd8t\xa4\x99\xd0\x860F\x83\
-1>\xd0~\x1e\xce{x\xfb\x93\x1a\xeeM\xa6X\x9a\
-\x9f#1?\x87X\x983\x8bw>\xfbD\xa4\x96\x06\
-\x81\xf3\xc0(0\x0d(\xc7=\x0eO\x00u\xc5\xdb\xe9\
-\x91o\xf8\x88\xcf\xeb\xdd\xd5\x19k}\xe5\xa5\xaftt\
-m\xae\xabk\x5c\x17\x09:\xbez\x03\xbb,\xda\x03B\
-X2iI&\x97gyYq\xf9\xf3(\xa3\xf1\xbc\
-\x16\xc9D.\xfd`t)3?{\xdb\x1a\xd3\x0f\xdc\
-\x05\xc6\x80\x04\x90\x05l\xf1'\xc1_\x05\x9c\x92\xb9\x1a\
-\xc7q\x9e\x0e\xf9}\xbb776\x1cj\xae\xad\xd9\xd1\
-\xb2\xa1\xb6v\xdb\xfeu\xbe\x86\xa6P\xd8h\xebM.\
-\xe5\xd5R*\x9f\x9d\x9b\xc9\xcc\x0f\x0eg\xccT<\x91\
-\x15\xa9dBKy\x1d\xb8\x0a\xdc\x00f\x5cp\x01h\
-\xaaD[\xad8n\xf2\x08\x01\xd1\x12\xb6\xf6\xb8\xdb\xd7\
-\xe2\xce\xe1\xae\x9b\x06\xc6\x81;\xc0,0\xef\xfe\x88\x16\
-\xa3\x96%i\x07g\x8d\x1fD\x8e{d\xbd@\xd0\x05\
-\x8c\xb8m\xf1V\xf3\xb8\x86\x85[3n\x9b\x05\xf2%\
-Q\x97\xa5\xdd\xff\x00t\xc3\xaf\x07g\xd4\x1a\x01\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\x02\xe4\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00 \x00\x00\x00 \x08\x03\x00\x00\x00D\xa4\x8a\xc6\
-\x00\x00\x01\xa1PLTE\xff\xff\xffB\x8d6\x7f\xb6\
-u\xd5\xf0\xcf\xc9\xeb\xc3\xad\xde\xa3\xa4\xda\x9a\xc8\xea\xc2\
-~\xb5u\xa3\xd9\x99\xaa\xdb\xa1\xc6\xe9\xc0}\xb5s\xd5\
-\xf0\xce\xa2\xd8\x98\xa1\xd7\x96\x9f\xd5\x94\xa6\xd8\x9c\xc4\xe5\
-\xbd|\xb4s\xd4\xef\xce\xa0\xd6\x95\x9e\xd4\x93\x9c\xd2\x91\
-\x9a\xd0\x8f\xa1\xd2\x97\xc0\xe2\xb8{\xb2q\xd2\xee\xcd\x9d\
-\xd3\x93\x9b\xd1\x90\x99\xcf\x8e\x96\xcc\x8b\x94\xca\x88\x9b\xcd\
-\x90\xbc\xdf\xb4z\xb2p\xd1\xed\xcb\x98\xce\x8d\x95\xcb\x8a\
-\x93\xc9\x87\x90\xc6\x84\x8d\xc4\x81\x96\xc8\x8a\xb9\xdb\xb1x\
-\xb0o\xd0\xeb\xc9\x97\xcd\x8c\x94\xca\x89\x92\xc8\x86\x8f\xc5\
-\x83\x8d\xc3\x80\x8a\xc1}\x87\xbe{\x91\xc2\x84\xb5\xd8\xac\
-w\xafm\xce\xea\xc8\x93\xc9\x88\x91\xc7\x85\x8e\xc4\x82\x8c\
-\xc2\x7f\x89\xbf}\x86\xbdy\x83\xbav\x80\xb7s\x89\xbc\
-}\xb1\xd4\xa8v\xael\xcc\xe8\xc6\x8d\xc3\x81\x8b\xc1}\
-\x88\xbe{\x85\xbbx\x82\xb8u\x7f\xb6r|\xb3n\x86\
-\xb8y\xaf\xd2\xa5u\xaek\xca\xe7\xc4\x8d\xc3\x7f\x8a\xc0\
-}\x87\xbdz\x84\xbaw\x81\xb7t~\xb4p{\xb2m\
-\x85\xb7x\xad\xd1\xa4u\xadj\xc9\xe6\xc2\x89\xbf|\x86\
-\xbcy\x83\xb9v\x80\xb6r}\xb3oz\xb0l\x84\xb6\
-w\xad\xd0\xa4\xc7\xe4\xc0\x85\xbbw\x82\xb8t\x7f\xb5q\
-|\xb2ny\xafk\x83\xb5v\xac\xd0\xa3\xc5\xe2\xbe}\
-\xb4p{\xb1mx\xaei\x82\xb4t\xac\xcf\xa2t\xad\
-j\xc3\xe1\xbcy\xb0kw\xadh\x81\xb3s\xab\xcf\xa1\
-t\xadi\xc2\xdf\xbax\xafju\xacg\x80\xb2r\xaa\
-\xce\xa1t\xaci\xbf\xde\xb8t\xabf\x7f\xb1q\xaa\xce\
-\xa0\xbe\xdc\xb6\x7f\xb0q\xa9\xcd\xa0\xbc\xda\xb4\xa9\xcd\x9f\
-s\xaci\xbb\xd9\xb2s\xabh\xf7\x0bv\xa9\x00\x00\x00\
-\x01tRNS\x00@\xe6\xd8f\x00\x00\x00\xf1ID\
-AT8\xcbc`\xa0'`d$\xa4\x80\x89\x80\x0a\
-Ff\x02*\x18\x99Y\xf0\xab`df\xc5\xaf\x82\x91\
-\x99\x8d\x95\x9d\x83\x11\xaf\x02N.n\x1e\xdc*\x18y\
-\xf9\xf8\x05\x04\x85\x84q\xaa`\x14\x11\x15\x13\x97\x90\x94\
-\x92\xc6\xa5\x82QFVN^AQIY\x05\x87\x0a\
-FU\x095u\x0dM-m\x1d]\xec*\x18\xf5\xf4\
-\x0d\x0c\x8d\x8cML\xcd\xcc-\xb0\xaa`\xb4\xb4\xb2\xb6\
-\xb1\xb5\xb3wptrv\xc1\xa6\x82\xd1U\xd3\xcd\xdd\
-\xc3\xd3\xcb\xdb\xc7\xd7\xcf\x1f\xab\x82\x80\xc0\xa0\xe0\x90\xd0\
-\xb0\xf0\x88\xc8(\xecVD\xc7\xc4\xc6\xc5'$&%\
-G\xe1pdJjZzFfVv\x14.o\xe6\
-8\xe6\xe6\xe5\x17\x14\x16\xe1\x0c\xa8b\x9f\x92\xd2\xb2\xf2\
-\x0a\xdcA]YU]S[\x87'\xb2\xea\x1b\x1a\x9b\
-\xea\xf0EwsKk\x1d\xde\x04\xd3\xd6\xde\x81?\xc9\
-uv\x10H\xb4]\x84\x92=\xa1\x8cC+\x00\x00\x0b\
-\x18(\xd2\x22\x0fl\xf9\x00\x00\x00\x00IEND\xae\
-B`\x82\
-\x00\x00\x06\xc8\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
-\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x0b\x0d\x00\x00\
-\x0b\x0d\x01\xed\x07\xc0,\x00\x00\x00\x07tIME\x07\
-\xd3\x09\x09\x13\x0e\x0c\xa13\x95V\x00\x00\x06UID\
-ATx\xda\xc5\x97\xdbo\x1c\xd5\x1d\xc7?sf\xe7\
-\xb2\xbb\xb6w\xd7qb\xc7\xc6\x89\x13b\x14'M\xb0\
-=-R\x9b\x84\x92\x16\x8a\x8a\x90\xda\xa2\xbe \xd1\x0a\
-h\xad6\x0f}\xa8\x84\xf2X\x89\xfe\x03\xbc\x82\x96\x86\
-\x06\xf1\xd2>\xf4\xc2\x03B\x05\x14\x95\xa8\x84Jx\x8d\
-mQ\x10\xca\xa66\xa9\xb3I|\xd9]\xdb\xbb3\xbb\
-3sN\x1fv\xbd\x17\xafCHR\xa9#}\xa53\
-\xe7\xfc\xce\xf9]\xce\xef\xfc.\xf0\x7f\xfe\xb4;!\x9e\
-<3{\x00\xd4i\x90\xe3\xc08J\xb6\x9c\xa1\xe6P\
-r\x0e\xe9_p8\x9f\x05d:\x9dV\xff\x13\x01&\
-\xcf\xcc>\x07<\x0b<\x0c\x0a\x90 L\x10v\x8d@\
-z\x10z\xad[>@\x06o8\xeaw\xe7\x00?\x9d\
-N\xcb\xbb\x12`\xf2\xcc\xec\x04\x9ax\x09%\xbf\x8d\xd0\
-\xc1L\x82\xd9\x8biE\x19\xeeY\xe7\x1b\xf7\xe5\x01\xd8\
-\xf4\xe0\xbd\x85\xfd\xb8^\x15*\xcb\xe0\xad\x82\xf2\x01\xe5\
-\x12z/8\xbc\xfe{\xc0\xdbI\x10\xed6Z\x9f\x03\
- :\x80\xd9\xb5\x87\x9f=\xb4\xc4\xb1\x83]<p_\
-\x0c\xdb\x14\x1d{\x96V*|\xf8i\x91\x8b\x9f\xc1G\
-\x0b\x06\x94\x16k\x0ba\xf5\xcf\x0e\xaf\xfd\x1cXO\xa7\
-\xd3\xc1m\x05h0\xd7-\xe8y\x80g&\xfe\xc3\x0f\
-N\xf4\x91\xea\x8a\xb4\xd1\xcdd\xcb\x00L\xdc\x1fCm\
-;\xea\xe2|\x81W.\x18\xdc\xb8~\x1d\x82M\x90\xfe\
-\x9c\xa3\xce}\x0fXn\xb5\x84~K\xe6\x91\x18\xc3\xc3\
-{y\xe1\xf1M\x1e\xfbz/FD\x10H\x1a\x98_\
-py\xf0`\x8c=I\x83\xd9+eR\xdd\x11B\xa9\
-\x1a\x18\xea\xb38u\x18\xf2\x9b\x01\x0b\xcb\x1a\xa8\xb0?\
-\xa7\x8e\x1e\x19d\xf6\xaf\x8e\xe3\x04\x99LFu\x080\
-y\xe6\xe3\x09\xd0\xdeB7\x18\x1a\x1a\xe2\xec\x93\x8a\x91\
-~\x1b?Pm\xb8|\xad\xc2\x91}6{\x92&\x86\
-\xae\x11\xb5\x04\x9f]\xf5\x88[\xa2\x8d.\xa2k\x1c\x1b\
-\x89rs]ru\x15@\x8d\xe6\xfc\x03\x97\x06\xc5\xbf\
-\xae\xd6\x85 \xb2\xcd\x00\xafA\x08=\xc7x\xfe\xd4*\
-=\xb1\x18\xe5J\xfbKZ.\xfa\x8c\x0e\xd9\xecN\x98\
-\x00\x98\x86\xa0\xb7\xdb`\xa4_\xb1p\xa3\xc2\xee\x84\xd1\
-q\xa5?=\xdd\xc3\x8d\x0d\x83\xcbW6\xc1L\xbe\x88\
-d\x06\xf0\x01_oj\x9fy\x0e\xd4/\x88\x0e\xf2\x93\
-\x87\xf2\x8c\xed\xef\xc2\x0fU\x1b\x0a\xa5\x90\x91~\x8b\xc1\
-]&F\xa4\xe9\x84FD\xc344\x82Pq\xb3\xe0\
-\xa3i\xb4\xedS\xc0H\x9f\xe4\xfdl\x12\xfc\xf5\xbd9\
-9V\x18\xd4\xe6f\x1c\xc7\xa96OQ\xf2Y\xd0\xe9\
-\xef\xeb\xe6\xf0\xfe8%Ov`\xa0\xd7`\xa8\xcf\xc4\
-\x8ct\xbe\x80\xb8\xad3\xd2o\xd1\x15\x15;\xee\xed\x89\
-\x1b\xfch\xbc\x08\x9a\x01\xba\xfd\x14\x90\x04\x0c\x010\xf9\
-\xcb\x8f\x0e\x00\x0fc\xef\xe2;\x87V\x09B(W\xc2\
-6$\xe2\x82\xd1A\x1b\xcb\x10\xb7\x8c\x1bq[\xe7\xf8\
-\x818R\xc9\xb6\xbd\xc5R\xc0\x95\x5c\x19\x85\x0e\xf6.\
-\xd0\xf4\xf1\xe9\xca\x13c\x80\xbd\xe5\x03\xa7k\x17\xdaK\
-_\xcf:%\xb7\x19/4\x0d\x86w\x9b8\xa3\xdd_\
-)\x5c\xdb\xa6\xe0\xd1\x89\x14o^Z\xe3\xdf\xb92_\
-\xaci\xfcsi\xa8I`\xba\xe0^\x07#q\x02\x98\
-\xd9Rg\x1c` !Q\xb4k\xbf'\x19\xe1\x9bG\
-z\xee8\xc9<:\x99\xc04D;s\xc0\xb4\xa2\xb5\
-\x810\x0f\x03\xd1\xa6\x00\xbaM*Ze\xd3\x95\x0d\xf4\
-\xa7L\x1ey0yWY.f\xe9\xfc\xf0d?\xc7\
-\xf7\xd5\xac\xd8\x08<\x82\x9a\x1f\x08\xe3\x10`7/T\
-\xd8\xf4XUJ\x15I\xa9\x229\xb8\xd7\xe6\xbb\xe3\x89\
-{J\xb5{S:\xbf\xfe>\x8co\x13\x82H\x1c\x94\
-\xd2\x1aN\xb8\x15\x92K\xbe\xc9\x86\x0b\x1b.\x8c\xed\x8b\
-a\x99\xe2\x9e\xf3\xfd\xe8\x00L\x8c\xdcrY4\x03\x91\
-\xf4\xc8\xbb6\x11Q\x0b<\xaf\xff\xdd#fU\x00\x18\
-\xee\xd3y\xfaT\xfc\x8e\x18\xff\xea|s|\xbd\xd0t\
-h\x00\x82R\xd3\x18\x8db\x22\xf4N\x16*\x16\x81\xaa\
-M\xe56\x9b\x07\x1cs5\x9e\xde\x81\xc9\xa9\xdf\xb6\xff\
-_\xfcMs\xfc\xf1b'}D\x80\x1fRK\xd5\xca\
-\xcf\x022R\x0fBsh:%7\xc0\xd0#\x1d\x1b\
-\xfd\xf0\xde\xae\xc1h\xc98\xaeW\xad\xa7\xe8J\x16\x1d\
-\xbfv\xc9\xd2\xbf\x00@u\x15!D\x074qo\xbe\
-\xa0\x8b&\xa8\xae\xd6&\xab\xf9\x0c\xe0\x09\x80z\x0d\xf7\
-\x01\xee2\x86\xe6\x13\x8d\xb4\xc3\xd2\x83;f\x9a\x8a\xfa\
-\x0dl\x9dch>\xb8\xcb \x83y'\xfa\xb7E\xc0\
-\xdd\xb2\xb7D\x06o \xf8\xd6za\x85\xfb\x87\xda\x1d\
-\xae\xdb\xd4\x9b\xee\xd2\xf2\x1dL\xado\x9bi\x06\xac\x94\
-\xedv\xd0g\x97J\xb5\xfb\x0f6\xdfA\xa7\x04\xb8\x02\
- \x9dN\xabZ\x01\xa9>t\x8b\xd7\x90\x81O\xc2\xaa\
-6\x107v\xb6@+M\xc2\xaa~\xe9\x9a\x0c|\xdc\
-\xe2\xb5\x9a\xf6\xfa\x1f\xde\x04\x8a\x80\xd7\xaa\x96O\xe8\x9d\
-E\x8f\xbe\x9f]\x5c\xe2\xe4\xf1\xdd\x18z\xedI\x167\
-|^}\xdbo\x10\xe6\xd6|<_\xd1m\xb5\x0b\xf4\
-\xea\xdb+M\xab\xb5\x08\xe4\x87\x1a\xd9\xc5\xe5\xda\x8f\x97\
-{\x19\x8b\x02Ph\xab\x072\x99\x8cz\xd2\x89\xe4r\
-\xeak\xf9P\x8a\xc7W\x0a\x15\x0e\x0d\x9a\x98\x86\x8e\xa6\
-\xc1\xa6'\x1b\xd040t\xad\x03\xad4[s\x82\x80\
-\x7f\xcc\xe5){>T\xf3/9\xc6_\xde\x03r@\
-!\x9dN\x87\xdb\xdd;p8\xff\x0a\xa1{v\xa3\x5c\
-\xe5\xdd\xe9<~\xc5\xc52\xc4]\xc1\xaf\xb8\xbc;\x9d\
-g\xa3\x5c\xad1\xd7\xff\xf8'\xe0\x06\x90\x07\x82\x8e\x9a\
-0\x93\xc9\xe08N8\xc8\xeclN\x1d-\xfaR\x7f\
-\xec\xf3%\x0f_\x0a\x86w\x09\x8c\x88 \x22\xb8-4\
-\x150}\xb9\xcc\xa5O\x0a\xf8\x81le\x9e\x03n\x02\
-\xeeV\xd7\xb4cY>55%\x80\xd8t\xf0\xe3G\
-0\x93/\xa2\xe9\x93\x96!\xd87\x10\xe3\xe8\xa0\xa4\xb7\
-7\x81\xae\xb7\xd7~a\xe8\xb3\xb6V\xe4\x93k\x82/\
-\xae\x97\xa9\xf8\x12d0\x8f\x97{\xd9\xb1\xde\x9a\xa9k\
-~\x13(\xb7\x96\xe5\xb7lL\xeaB\xd8@jZ=\
-\xf3<\xba\xfd\x14\x9a>\xbe\xb5\x1e5\xa1/Q\xf3\xe1\
-\x95b\x80\xdb\xfa\x08d0O\xb0\xf9N\xdd\xdb\x0b\xc0\
-J\xdd\xec\x1d\xdd\xd1\x97\xb6fSSSZ=\x00\xc4\
-\x81\xe4t\xe5\x891\x8c\xc4\x09\x84y\x18a\x1c\xaa\xa7\
-\xd4z:\xf1\xb3\x84\x95,\xd5|\xa6\x1edJ\xf5\xa7\
-V\xa8\x8f\x83\x9d\x9a\xd5\xaf\xd4\x9c\xd6\xada\xd4-\x12\
-\xad\xc3\xae\xcf\x89F0\xab\x95\xda\x1e\xe0\xd6\xe1\xdd\xae\
-9\xfd/\xd0B\x12\x9f6z\xba:\x00\x00\x00\x00I\
-END\xaeB`\x82\
-"
-
-qt_resource_name = b"\
-\x00\x0b\
-\x0cj,G\
-\x00r\
-\x00e\x00f\x00r\x00e\x00s\x00h\x00.\x00p\x00n\x00g\
-\x00\x0f\
-\x0f\xcc\x90\x87\
-\x00p\
-\x00y\x00t\x00h\x00o\x00n\x00-\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
-\x00\x0d\
-\x02\xc5_\xc7\
-\x00f\
-\x00i\x00l\x00e\x00-\x00s\x00a\x00v\x00e\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x01B\x06\xdf\
-\x00w\
-\x00i\x00n\x00d\x00o\x00w\x00s\x00-\x00m\x00a\x00i\x00n\x00.\x00i\x00c\x00o\
-\x00\x12\
-\x07;_\x87\
-\x00l\
-\x00i\x00b\x00r\x00a\x00r\x00y\x00-\x00l\x00o\x00a\x00d\x00-\x002\x00.\x00p\x00n\
-\x00g\
-\x00\x10\
-\x0ez`\x07\
-\x00l\
-\x00i\x00b\x00r\x00a\x00r\x00y\x00-\x00s\x00h\x00o\x00w\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x04giG\
-\x00l\
-\x00i\x00b\x00r\x00a\x00r\x00y\x00-\x00l\x00o\x00a\x00d\x00.\x00p\x00n\x00g\
-\x00\x0d\
-\x05\x02Qg\
-\x00f\
-\x00i\x00l\x00e\x00-\x00e\x00x\x00i\x00t\x00.\x00p\x00n\x00g\
-\x00\x0b\
-\x03\x03\x9bG\
-\x00z\
-\x00o\x00o\x00m\x00-\x00i\x00n\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x07\xb1Y'\
-\x00e\
-\x00d\x00i\x00t\x00-\x00c\x00u\x00t\x00.\x00p\x00n\x00g\
-\x00\x0d\
-\x01\x1c\xb1\xa7\
-\x00e\
-\x00d\x00i\x00t\x00-\x00c\x00o\x00p\x00y\x00.\x00p\x00n\x00g\
-\x00\x0d\
-\x0c\xc4^'\
-\x00f\
-\x00i\x00l\x00e\x00-\x00o\x00p\x00e\x00n\x00.\x00p\x00n\x00g\
-\x00\x0f\
-\x0a\xa9\xcdg\
-\x00s\
-\x00p\x00r\x00e\x00a\x00d\x00s\x00h\x00e\x00e\x00t\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x06\xeb\x97\xe7\
-\x00z\
-\x00o\x00o\x00m\x00-\x00o\x00u\x00t\x00.\x00p\x00n\x00g\
-\x00\x0a\
-\x08\x94\x19\x07\
-\x00s\
-\x00p\x00l\x00a\x00s\x00h\x00.\x00p\x00n\x00g\
-\x00\x0f\
-\x0e\x8e\xd2\xc7\
-\x00f\
-\x00i\x00l\x00e\x00-\x00s\x00a\x00v\x00e\x00a\x00s\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x0c\xaa\xc0\xa7\
-\x00e\
-\x00d\x00i\x00t\x00-\x00p\x00a\x00s\x00t\x00e\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x09j\x07\xc7\
-\x00f\
-\x00i\x00l\x00e\x00-\x00n\x00e\x00w\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x05A\xd0\xc7\
-\x00g\
-\x00n\x00u\x00m\x00e\x00r\x00i\x00c\x00.\x00p\x00n\x00g\
-\x00\x08\
-\x02\x8cY\xa7\
-\x00p\
-\x00l\x00a\x00y\x00.\x00p\x00n\x00g\
-\x00\x08\
-\x068Z\xa7\
-\x00h\
-\x00o\x00m\x00e\x00.\x00p\x00n\x00g\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x15\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x01V\x00\x00\x00\x00\x00\x01\x00\x00\xbaO\
-\x00\x00\x01\x8d\xe7t\xc0\x7f\
-\x00\x00\x00`\x00\x00\x00\x00\x00\x01\x00\x00\x13\x93\
-\x00\x00\x01\x8d\xe7t\xc0\x83\
-\x00\x00\x02t\x00\x00\x00\x00\x00\x01\x00\x02eF\
-\x00\x00\x01\x8d\xe7t\xc0\x83\
-\x00\x00\x00@\x00\x00\x00\x00\x00\x01\x00\x00\x0eK\
-\x00\x00\x01\x8d\xe7t\xc0\x83\
-\x00\x00\x01\x1c\x00\x00\x00\x00\x00\x01\x00\x00\xa9\xb8\
-\x00\x00\x01\x8d\xe7t\xc0\x83\
-\x00\x00\x00\xd6\x00\x00\x00\x00\x00\x01\x00\x00\x9d\xb2\
-\x00\x00\x01\x8d\xe7t\xc0\x83\
-\x00\x00\x00\xfc\x00\x00\x00\x00\x00\x01\x00\x00\xa29\
-\x00\x00\x01\x8d\xe7t\xc0\x83\
-\x00\x00\x02V\x00\x00\x00\x00\x00\x01\x00\x02^\x17\
-\x00\x00\x01\x8d\xe7t\xc0\x83\
-\x00\x00\x02\x8a\x00\x00\x00\x00\x00\x01\x00\x02h.\
-\x00\x00\x01\x8d\xe7t\xc0\x83\
-\x00\x00\x01\xba\x00\x00\x00\x00\x00\x01\x00\x00\xce\xb4\
-\x00\x00\x01\x8d\xe7t\xc0\x83\
-\x00\x00\x00\x86\x00\x00\x00\x00\x00\x01\x00\x00\x92\xf5\
-\x00\x00\x01\x8d\xe7t\xc0\x83\
-\x00\x00\x018\x00\x00\x00\x00\x00\x01\x00\x00\xb1\xd2\
-\x00\x00\x01\x8d\xe7t\xc0\x7f\
-\x00\x00\x01\xd8\x00\x00\x00\x00\x00\x01\x00\x00\xd6\xef\
-\x00\x00\x01\x8d\xe7t\xc0\x83\
-\x00\x00\x028\x00\x00\x00\x00\x00\x01\x00\x02Vs\
-\x00\x00\x01\x8d\xe7t\xc0\x83\
-\x00\x00\x01\x96\x00\x00\x00\x00\x00\x01\x00\x00\xc7i\
-\x00\x00\x01\x8d\xe7t\xc0\x83\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x8d\xe7t\xc0\x83\
-\x00\x00\x02\x16\x00\x00\x00\x00\x00\x01\x00\x02P\xbd\
-\x00\x00\x01\x8d\xe7t\xc0\x7f\
-\x00\x00\x01v\x00\x00\x00\x00\x00\x01\x00\x00\xbd\xc2\
-\x00\x00\x01\x8d\xe7t\xc0\x83\
-\x00\x00\x00\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x99\xfd\
-\x00\x00\x01\x8d\xe7t\xc0\x83\
-\x00\x00\x01\xf2\x00\x00\x00\x00\x00\x01\x00\x02H\xa4\
-\x00\x00\x01\x8d\xe7t\xc0\x83\
-\x00\x00\x00\x1c\x00\x00\x00\x00\x00\x01\x00\x00\x06\x1f\
-\x00\x00\x01\x8d\xe7t\xc0\x83\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -0,0 +1,193 @@
+"""Static simulation of a mooring line, independent of the Qt user interface."""
+
+import csv
+import logging
+import numpy as np
+
+from solver import Line, solve, solve_adaptive, SEGMENT_LENGTH, ACCURACY
+from version import NAME
+
+# columns of a simulation result, in the order of the csv file
+RESULT_COLUMNS = ('name', 'sheet', 'length', 'buoyancy', 'depth_top', 'depth_bottom',
+                  'x_top', 'angle', 'knock_down', 'tension_top', 'tension_bottom',
+                  'breaking_strength', 'safety_factor')
+
+
+class SimulationResult:
+    """Per element results of a simulation, stored as columns from the
+    top of the line to the anchor. Depths, horizontal offsets and
+    knock-down are in m, angles in degrees from the vertical, buoyancy
+    and tensions in kg.
+
+    The result of a batch of current profiles stacks the solved columns as
+    (N profiles x N elements) arrays, profile() extracts the result of one
+    of them.
+    """
+
+    def __init__(self, design, columns, equilibrium=None, converged=None):
+        """SimulationResult constructor
+
+        Args:
+            design (MooringDesign): the simulated design
+            columns (dict): column name -> np.ndarray or list, see RESULT_COLUMNS
+            equilibrium (Equilibrium, optional): the per segment solution.
+            Defaults to None.
+            converged (bool or np.ndarray, optional): True if the solver
+            converged, one value per profile for a batch. Defaults to the
+            convergence of equilibrium.
+        """
+        self.design = design
+        self._columns = columns
+        self.equilibrium = equilibrium
+        if converged is None:
+            converged = True if equilibrium is None else equilibrium.profiles_converged
+        self._converged = np.asarray(converged, dtype=bool)
+
+    def __len__(self):
+        return len(self._columns['name'])
+
+    def __getitem__(self, column):
+        ''' overloading operators result[column]'''
+        return self._columns[column]
+
+    @property
+    def batch(self):
+        """Getter to the number of current profiles, None for a single one"""
+        shape = np.shape(self._columns['depth_top'])
+        return shape[0] if len(shape) == 2 else None
+
+    def profile(self, index):
+        """Return the result of one current profile of a batch
+
+        Args:
+            index (int): the profile index
+
+        Returns:
+            SimulationResult: the per element results of the profile
+        """
+        if self.batch is None:
+            raise IndexError("The result holds a single current profile")
+        columns = {column: values[index] if np.ndim(values) == 2 else values
+                   for column, values in self._columns.items()}
+        return SimulationResult(self.design, columns, converged=self._converged[index])
+
+    @property
+    def converged(self):
+        """Getter, True if the solver converged, for every profile of a batch"""
+        return bool(self._converged.all())
+
+    @property
+    def holding(self):
+        """Getter to the anchor margin in kg, the anchor lifts when negative"""
+        return -float(np.sum(self._columns['buoyancy']))
+
+    @property
+    def slack(self):
+        """Getter to the names of the elements hanging on a slack line"""
+        tension = np.minimum(self._columns['tension_top'], self._columns['tension_bottom'])
+        return [name for name, value in zip(self._columns['name'], tension) if value < 0]
+
+    @property
+    def min_safety_factor(self):
+        """Getter to the smallest breaking strength / tension ratio"""
+        return float(np.min(self._columns['safety_factor']))
+
+    @property
+    def ok(self):
+        """Getter, True if the solver converged and the line is taut, held
+        by its anchor and under the breaking strength of every element
+        """
+        return (self.converged and self.holding > 0 and not self.slack and
+                self.min_safety_factor > 1.0 and self._columns['depth_top'][0] >= 0.0)
+
+    def summary(self):
+        """Return a one line description of the result"""
+        return (f"{self.design.name}: top at {self._columns['depth_top'][0]:.1f} m, "
+                f"knock-down {np.max(self._columns['knock_down']):.1f} m, "
+                f"anchor holding {self.holding:.1f} kg, "
+                f"min safety factor {self.min_safety_factor:.2f}, "
+                f"{'' if self.converged else 'NOT CONVERGED, '}"
+                f"{'OK' if self.ok else 'FAILED'}")
+
+    def write_csv(self, filename):
+        """Write the per element results as a csv file
+
+        Args:
+            filename (str): the csv file
+        """
+        with open(filename, 'w', newline='', encoding='utf-8') as fid:
+            writer = csv.writer(fid)
+            writer.writerow(RESULT_COLUMNS + ('converged',))
+            for row in zip(*(self._columns[column] for column in RESULT_COLUMNS)):
+                writer.writerow([f"{value:.6g}" if isinstance(value, float) else value
+                                 for value in row] + [self.converged])
+
+
+def simulate(design, current=None, accuracy=ACCURACY, segment_length=SEGMENT_LENGTH,
+             solver=None):
+    """Static equilibrium of a mooring line under a current profile, see
+    solver.solve_adaptive(). Without current the line stands vertical and
+    each joint carries the net buoyancy of the elements above it.
+
+    Args:
+        design (MooringDesign): the design to simulate
+        current (CurrentProfile, optional): overrides the design current.
+        Defaults to None.
+        accuracy (float, optional): target shape error of the adaptive
+        rope segments, in m, None for uniform segments. Defaults to ACCURACY.
+        segment_length (float, optional): length of the uniform rope
+        segments, in m. Defaults to SEGMENT_LENGTH.
+        solver (IncrementalSolver, optional): solves the design from the
+        solution of its previous version, with its own accuracy.
+        Defaults to None.
+
+    Returns:
+        SimulationResult: the per element results, stacked for a batch of
+        current profiles
+    """
+    elements = design.elements
+    if current is None:
+        current = design.current
+    if solver is not None:
+        equilibrium = solver.solve(design, current)
+    elif accuracy is None:
+        equilibrium = solve(Line.from_design(design, segment_length), design.bottom_depth, current)
+    else:
+        equilibrium = solve_adaptive(design, current, accuracy)
+    line = equilibrium.line
+
+    # first and last segment of each element
+    first = np.searchsorted(line.element, np.arange(len(elements)))
+    last = np.append(first[1:], len(line)) - 1
+    length = np.array([element.length for element in elements])
+    buoyancy = np.array([element.buoyancy for element in elements])
+    # a batch of current profiles keeps its leading axis
+    tension_top = equilibrium['tension_top'][..., first]
+    tension_bottom = equilibrium['tension_bottom'][..., last]
+    tension = np.maximum(tension_top, tension_bottom)
+    breaking = line.breaking_strength[first]
+    with np.errstate(divide='ignore'):
+        safety_factor = np.where(tension > 0, breaking / np.where(tension > 0, tension, 1), np.inf)
+    # depth of the top of each element on a vertical line
+    vertical_top = design.bottom_depth - np.cumsum(length[::-1])[::-1]
+
+    result = SimulationResult(design, {
+        'name': [element.name for element in elements],
+        'sheet': [element.sheet for element in elements],
+        'length': length,
+        'buoyancy': buoyancy,
+        'depth_top': equilibrium['depth_top'][..., first],
+        'depth_bottom': equilibrium['depth_bottom'][..., last],
+        'x_top': equilibrium['x_top'][..., first],
+        'angle': np.maximum.reduceat(equilibrium['angle'], first, axis=-1),
+        'knock_down': equilibrium['depth_top'][..., first] - vertical_top,
+        'tension_top': tension_top,
+        'tension_bottom': tension_bottom,
+        'breaking_strength': breaking,
+        'safety_factor': safety_factor,
+    }, equilibrium)
+    if result.batch is None:
+        logging.getLogger(NAME).debug(result.summary())
+    else:
+        logging.getLogger(NAME).debug(f"{design.name}: {result.batch} current profiles solved")
+    return result
@@ -0,0 +1,662 @@
+"""Static equilibrium of a subsurface mooring line under a current profile.
+
+The line is cut in segments, ropes in pieces of at most segment_length
+metres, other elements in one piece, from the top float to the anchor.
+Each segment carries its net buoyancy and the horizontal drag of the
+current at its depth. Summing these forces from the top gives the
+tension at every joint, the tension direction gives the segment angles
+and summing the segment heights from the anchor gives the shape. The
+drag depends on the depths and angles, the two steps are repeated until
+the angles converge. Every step is a NumPy operation over all segments.
+"""
+
+import logging
+import numpy as np
+
+from mooring_line import ComponentChain, ELEMENT_PROPERTIES
+from version import NAME
+
+GRAVITY = 9.81  # m/s2
+SEAWATER_DENSITY = 1025.0  # kg/m3
+
+# default length of the rope segments, in m
+SEGMENT_LENGTH = 10.0
+# adaptive discretisation: target shape error, initial rope segment length
+# and shortest segment, in m
+ACCURACY = 0.1
+COARSE_LENGTH = 250.0
+MIN_SEGMENT_LENGTH = 0.5
+# the relaxation of a profile is halved down to this value while the
+# update of its angles grows, the damping of an oscillating iteration
+MIN_RELAXATION = 1.0 / 64.0
+
+
+class SolverError(Exception):
+    """Raised when a mooring line cannot be solved."""
+
+
+class CurrentProfile:
+    """Horizontal current speed as a function of depth, linearly
+    interpolated between the given depths and constant beyond them.
+
+    A batch of N profiles on the same depths is given as an
+    (N profiles x N depths) speed array, the solver then computes the N
+    equilibria at once.
+    """
+
+    def __init__(self, depths, speeds):
+        """CurrentProfile constructor
+
+        Args:
+            depths (array_like): increasing depths, in m
+            speeds (array_like): current speed at each depth, in m/s, one
+            row per profile for a batch
+        """
+        self.depths = np.asarray(depths, dtype=np.float64)
+        self.speeds = np.asarray(speeds, dtype=np.float64)
+        if (self.depths.ndim != 1 or self.speeds.ndim not in (1, 2) or
+                self.speeds.shape[-1] != self.depths.size or not self.depths.size):
+            raise SolverError("A current profile needs as many depths as speeds")
+        if np.any(np.diff(self.depths) <= 0):
+            raise SolverError("The current profile depths must be increasing")
+
+    def __repr__(self):
+        return f"CurrentProfile({self.depths.tolist()}, {self.speeds.tolist()})"
+
+    def __len__(self):
+        return len(self.speeds) if self.speeds.ndim == 2 else 1
+
+    @property
+    def shape(self):
+        """Getter to the leading shape of the solver arrays, (N,) for a
+        batch of N profiles, () for a single one
+        """
+        return self.speeds.shape[:-1]
+
+    def __call__(self, depth):
+        """Return the current speed at the given depths
+
+        Args:
+            depth (np.ndarray): depths, (N profiles x M) for a batch
+
+        Returns:
+            np.ndarray: the speeds, shaped as depth
+        """
+        if self.speeds.ndim == 1:
+            return np.interp(depth, self.depths, self.speeds)
+        depth = np.broadcast_to(depth, self.shape + np.shape(depth)[-1:])
+        depth = np.clip(depth, self.depths[0], self.depths[-1])
+        if self.depths.size == 1:
+            return np.broadcast_to(self.speeds, depth.shape).copy()
+        # interval and weight of each depth, then a gather in each profile row
+        upper = np.clip(np.searchsorted(self.depths, depth), 1, self.depths.size - 1)
+        lower = upper - 1
+        weight = (depth - self.depths[lower]) / (self.depths[upper] - self.depths[lower])
+        return ((1.0 - weight) * np.take_along_axis(self.speeds, lower, axis=-1) +
+                weight * np.take_along_axis(self.speeds, upper, axis=-1))
+
+    def take(self, rows):
+        """Return the batch of the selected profiles
+
+        Args:
+            rows (array_like): profile indices or boolean mask
+
+        Returns:
+            CurrentProfile: the selected profiles
+        """
+        return CurrentProfile(self.depths, self.speeds[rows])
+
+    @classmethod
+    def uniform(cls, speed):
+        """Return a profile with the same speed at every depth"""
+        return cls([0.0], [speed])
+
+    @classmethod
+    def from_dict(cls, current):
+        """Build a profile from a design [current] table
+
+        Args:
+            current (dict): 'depth' and 'speed' lists
+
+        Returns:
+            CurrentProfile: the profile
+        """
+        try:
+            return cls(current['depth'], current['speed'])
+        except KeyError as ex:
+            raise SolverError(f"[current] needs depth and speed lists, {ex} missing") from ex
+
+    def to_dict(self):
+        """Return the profile as a design [current] table"""
+        return {'depth': self.depths.tolist(), 'speed': self.speeds.tolist()}
+
+
+# the per segment arrays of a Line, in the order of its constructor
+LINE_ARRAYS = ('element', 'length', 'buoyancy', 'area', 'normal_cf', 'tangential_cf', 'linear',
+               'breaking_strength')
+
+
+class Line:
+    """The segments of a mooring line as property arrays, from the top to
+    the anchor. Forces are in N, lengths in m and areas in m2.
+    """
+
+    def __init__(self, element, length, buoyancy, area, normal_cf, tangential_cf,
+                 linear, breaking_strength):
+        """Line constructor, see Line.from_design()
+
+        Args:
+            element (np.ndarray): index of the design element of each segment
+            length (np.ndarray): segment length
+            buoyancy (np.ndarray): net buoyancy, positive upward, in N
+            area (np.ndarray): frontal area facing the current
+            normal_cf (np.ndarray): normal drag coefficient
+            tangential_cf (np.ndarray): tangential drag coefficient
+            linear (np.ndarray): True for rope segments, whose drag
+            depends on their angle
+            breaking_strength (np.ndarray): in kg, inf when unknown
+        """
+        self.element = element
+        self.length = length
+        self.buoyancy = buoyancy
+        self.area = area
+        self.normal_cf = normal_cf
+        self.tangential_cf = tangential_cf
+        self.linear = linear
+        self.breaking_strength = breaking_strength
+        self._cumulative_buoyancy = None
+
+    def __len__(self):
+        return len(self.length)
+
+    @property
+    def cumulative_buoyancy(self):
+        """Getter to the net buoyancy of the segments above each joint, the
+        vertical tension at the bottom of each segment, in N, cached
+        """
+        if self._cumulative_buoyancy is None:
+            self._cumulative_buoyancy = np.cumsum(self.buoyancy)
+        return self._cumulative_buoyancy
+
+    def take(self, rows):
+        """Return the selected segments
+
+        Args:
+            rows (slice or np.ndarray): segment indices or boolean mask
+
+        Returns:
+            Line: the selected segments
+        """
+        return Line(*(getattr(self, key)[rows] for key in LINE_ARRAYS))
+
+    @classmethod
+    def concatenate(cls, lines):
+        """Join lines from the top to the anchor, their element indices
+        must already be those of the joined line
+
+        Args:
+            lines (list): Line instances
+
+        Returns:
+            Line: the joined line
+        """
+        return cls(*(np.concatenate([getattr(line, key) for line in lines])
+                     for key in LINE_ARRAYS))
+
+    def split(self, mask):
+        """Cut the selected segments in two halves
+
+        Args:
+            mask (np.ndarray): True for the segments to split
+
+        Returns:
+            Line: the refined line
+        """
+        repeats = np.where(mask, 2, 1)
+        scale = np.repeat(np.where(mask, 0.5, 1.0), repeats)
+        return Line(
+            element=np.repeat(self.element, repeats),
+            length=np.repeat(self.length, repeats) * scale,
+            buoyancy=np.repeat(self.buoyancy, repeats) * scale,
+            area=np.repeat(self.area, repeats) * scale,
+            normal_cf=np.repeat(self.normal_cf, repeats),
+            tangential_cf=np.repeat(self.tangential_cf, repeats),
+            linear=np.repeat(self.linear, repeats),
+            breaking_strength=np.repeat(self.breaking_strength, repeats),
+        )
+
+    @classmethod
+    def from_chain(cls, chain, segment_length=SEGMENT_LENGTH):
+        """Cut the elements of a component chain in segments
+
+        Args:
+            chain (ComponentChain): the elements, from the top to the anchor
+            segment_length (float, optional): maximum rope segment length,
+            in m. Defaults to SEGMENT_LENGTH.
+
+        Returns:
+            Line: the segments
+        """
+        if segment_length <= 0:
+            raise SolverError("The segment length must be positive")
+        linear = chain['linear']
+        length = chain['length']
+        pieces = np.where(linear, np.maximum(np.ceil(length / segment_length), 1), 1).astype(int)
+        element = np.repeat(np.arange(len(chain)), pieces)
+        # per element properties, totals are shared between the pieces
+        scale = 1.0 / pieces[element]
+        breaking = chain['breaking_strength']
+        return cls(
+            element=element,
+            length=length[element] * scale,
+            buoyancy=chain['buoyancy'][element] * GRAVITY * scale,
+            area=chain['area'][element] * scale,
+            normal_cf=chain['normal_cf'][element],
+            tangential_cf=chain['tangential_cf'][element],
+            linear=linear[element],
+            breaking_strength=np.where(breaking > 0, breaking, np.inf)[element],
+        )
+
+    @classmethod
+    def from_design(cls, design, segment_length=SEGMENT_LENGTH):
+        """Cut the elements of a design in segments, see from_chain()
+
+        Args:
+            design (MooringDesign): the design
+            segment_length (float, optional): maximum rope segment length,
+            in m. Defaults to SEGMENT_LENGTH.
+
+        Returns:
+            Line: the segments
+        """
+        return cls.from_chain(ComponentChain.from_design(design), segment_length)
+
+
+class Equilibrium:
+    """Solved shape of a line: per segment positions, tensions and angles.
+    x is the horizontal distance downstream of the anchor and depth is
+    positive downward, both in m. Tensions are in kg, angles in degrees
+    from the vertical. For a batch of current profiles the columns are
+    (N profiles x N segments) arrays.
+    """
+
+    def __init__(self, line, columns, iterations, converged):
+        """Equilibrium constructor
+
+        Args:
+            line (Line): the segments
+            columns (dict): column name -> np.ndarray
+            iterations (int): iterations of the solve
+            converged (bool or np.ndarray): True if the angles converged,
+            one value per profile for a batch
+        """
+        self.line = line
+        self._columns = columns
+        self.iterations = iterations
+        self.profiles_converged = np.asarray(converged, dtype=bool)
+        self.converged = bool(self.profiles_converged.all())
+
+    def __len__(self):
+        return len(self.line)
+
+    def __getitem__(self, column):
+        ''' overloading operators equilibrium[column]'''
+        return self._columns[column]
+
+    @property
+    def columns(self):
+        """Getter to the list of solution columns"""
+        return list(self._columns)
+
+
+def segment_forces(line, current, depth, angle):
+    """Horizontal drag of each segment, in N
+
+    Bodies take the full drag of their frontal area. A rope segment
+    inclined at angle from the vertical only sees the current component
+    normal to it, and adds the skin friction of the tangential component.
+
+    Args:
+        line (Line): the segments
+        current (CurrentProfile): the current profile
+        depth (np.ndarray): depth of the segment centres, in m
+        angle (np.ndarray): segment angles from the vertical, in rad
+
+    Returns:
+        np.ndarray: the horizontal drag of each segment
+    """
+    speed = current(np.maximum(depth, 0.0))
+    dynamic = 0.5 * SEAWATER_DENSITY * speed * np.abs(speed)
+    cos, sin = np.cos(angle), np.sin(angle)
+    rope = (line.normal_cf * cos ** 3 + np.pi * line.tangential_cf * sin ** 3)
+    return dynamic * line.area * np.where(line.linear, rope, line.normal_cf)
+
+
+def solve(line, bottom_depth, current=None, tolerance=1e-6, max_iterations=200, relaxation=1.0,
+          angle=None):
+    """Solve the static equilibrium of a line held by its anchor
+
+    Args:
+        line (Line): the segments, the last one is the anchor
+        bottom_depth (float): water depth at the anchor, in m
+        current (CurrentProfile, optional): the current, none if omitted.
+        tolerance (float, optional): convergence of the angles, in rad.
+        Defaults to 1e-6.
+        max_iterations (int, optional): Defaults to 200.
+        relaxation (float, optional): fraction of the new angles kept at
+        each iteration, halved for a profile whose angle update grows, as
+        a strong current makes the iteration oscillate. Defaults to 1.0.
+        angle (np.ndarray, optional): initial segment angles from the
+        vertical in rad, a warm start. Defaults to a vertical line.
+
+    Returns:
+        Equilibrium: the solved line
+    """
+    if not len(line):
+        raise SolverError("The line has no segment")
+    logger = logging.getLogger(NAME)
+    # a batch of current profiles adds a leading axis to the shape arrays
+    shape = (current.shape if current is not None else ()) + (len(line),)
+    angle = np.zeros(shape) if angle is None else np.array(
+        np.broadcast_to(angle, shape), dtype=np.float64)
+    drag = np.zeros(shape)
+    # the vertical tension never depends on the shape
+    vertical_bottom = line.cumulative_buoyancy
+    vertical_top = vertical_bottom - line.buoyancy
+    vertical = 0.5 * (vertical_top + vertical_bottom)
+    # iterate on 2-D views of the profiles not converged yet, so a batch
+    # does not pay the iterations of its slowest profile on every row
+    angles, drags = angle.reshape(-1, len(line)), drag.reshape(-1, len(line))
+    active = np.arange(len(angles) if current is not None else 0)
+    relax = np.full(len(active), float(relaxation))
+    residual = np.full(len(active), np.inf)
+    previous = np.zeros((len(active), len(line)))
+    iterations = 0
+    while active.size and iterations < max_iterations:
+        iterations += 1
+        # height of the segment centres above the anchor, which stands
+        # vertical on the bottom
+        height = line.length * np.cos(angles[active])
+        height = np.cumsum(height[:, ::-1], axis=-1)[:, ::-1] - 0.5 * height
+        forces = segment_forces(line, current, bottom_depth - height, angles[active])
+        horizontal = np.cumsum(forces, axis=-1) - 0.5 * forces
+        new_angle = np.arctan2(horizontal, np.maximum(vertical, 1e-9))
+        new_angle[:, -1] = 0.0
+        update = new_angle - angles[active]
+        # the undamped update measures the convergence, a growing or
+        # reversed one the oscillation of the fixed point iteration
+        new_residual = np.max(np.abs(update), axis=-1)
+        oscillating = (new_residual >= residual) | (np.sum(update * previous, axis=-1) < 0)
+        relax = np.where(oscillating, np.maximum(0.5 * relax, MIN_RELAXATION), relax)
+        residual, previous = new_residual, update
+        angles[active] = angles[active] + relax[:, np.newaxis] * update
+        drags[active] = forces
+        keep = residual >= tolerance
+        active, relax, residual, previous = (active[keep], relax[keep], residual[keep],
+                                             previous[keep])
+        if current.shape:
+            current = current.take(keep)
+    converged = np.ones(len(angles), dtype=bool)
+    converged[active] = False
+    converged = converged.reshape(shape[:-1])
+    if active.size:
+        logger.warning(f"Mooring line not converged after {iterations} iterations"
+                       f"{f' for {active.size} profiles' if shape[:-1] else ''}")
+
+    # shape from the anchor
+    height_top = np.cumsum((line.length * np.cos(angle))[..., ::-1], axis=-1)[..., ::-1]
+    height_bottom = height_top - line.length * np.cos(angle)
+    x_top = np.cumsum((line.length * np.sin(angle))[..., ::-1], axis=-1)[..., ::-1]
+    x_bottom = x_top - line.length * np.sin(angle)
+
+    horizontal_bottom = np.cumsum(drag, axis=-1)
+    horizontal_top = horizontal_bottom - drag
+    # the seabed carries the anchor, its weight does not load the line
+    vertical_bottom = vertical_bottom.copy()
+    vertical_bottom[-1] = vertical_top[-1]
+    horizontal_bottom[..., -1] = horizontal_top[..., -1]
+    # a negative tension marks a slack joint, pushed instead of pulled
+    sign_top = np.where(vertical_top < 0, -1.0, 1.0)
+    sign_bottom = np.where(vertical_bottom < 0, -1.0, 1.0)
+    vertical_top, vertical_bottom = (np.broadcast_to(vertical_top, shape),
+                                     np.broadcast_to(vertical_bottom, shape))
+    return Equilibrium(line, {
+        'x_top': x_top,
+        'x_bottom': x_bottom,
+        'depth_top': bottom_depth - height_top,
+        'depth_bottom': bottom_depth - height_bottom,
+        'tension_top': sign_top * np.hypot(horizontal_top, vertical_top) / GRAVITY,
+        'tension_bottom': sign_bottom * np.hypot(horizontal_bottom, vertical_bottom) / GRAVITY,
+        'angle': np.degrees(angle),
+        'drag': drag / GRAVITY,
+    }, iterations, converged)
+
+
+def shape_error(equilibrium, current):
+    """Estimate the shape error of each rope segment, in m
+
+    A straight segment replaces an arc which turns by an angle dtheta,
+    the distance between them is about length * dtheta / 8. The turn is
+    the largest of the change of the tension direction between the ends
+    of the segment (its own curvature, a single segment rope included),
+    the angle jumps to the neighbour segments of the same rope, and the
+    change of the current drag between the ends of the segment over its
+    tension (current shear).
+
+    Args:
+        equilibrium (Equilibrium): a solved line
+        current (CurrentProfile): the current profile, None if omitted
+
+    Returns:
+        np.ndarray: the error estimate, 0 for the other elements, one row
+        per profile for a batch
+    """
+    line = equilibrium.line
+    angle = np.radians(equilibrium['angle'])
+    same = line.element[1:] == line.element[:-1]
+    jump = np.where(same, np.abs(np.diff(angle, axis=-1)), 0.0)
+    edge = np.zeros(jump.shape[:-1] + (1,))
+    turn = np.maximum(np.concatenate((jump, edge), axis=-1),
+                      np.concatenate((edge, jump), axis=-1))
+    # tension direction at the top and the bottom of each segment
+    horizontal_bottom = np.cumsum(equilibrium['drag'], axis=-1) * GRAVITY
+    horizontal_top = horizontal_bottom - equilibrium['drag'] * GRAVITY
+    vertical_bottom = np.maximum(line.cumulative_buoyancy, 1e-9)
+    vertical_top = np.maximum(line.cumulative_buoyancy - line.buoyancy, 1e-9)
+    turn = np.maximum(turn, np.abs(np.arctan2(horizontal_bottom, vertical_bottom) -
+                                   np.arctan2(horizontal_top, vertical_top)))
+    if current is not None:
+        top = current(np.maximum(equilibrium['depth_top'], 0.0))
+        bottom = current(np.maximum(equilibrium['depth_bottom'], 0.0))
+        middle = current(np.maximum(0.5 * (equilibrium['depth_top'] +
+                                           equilibrium['depth_bottom']), 0.0))
+        tension = np.maximum(np.abs(0.5 * (equilibrium['tension_top'] +
+                                           equilibrium['tension_bottom'])), 1e-9)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            shear = np.where(middle != 0.0, np.abs(top ** 2 - bottom ** 2) / middle ** 2, 0.0)
+        turn = np.maximum(turn, np.arctan(equilibrium['drag'] * shear / tension))
+    return np.where(line.linear, line.length * turn / 8.0, 0.0)
+
+
+def solve_adaptive(design, current=None, accuracy=ACCURACY, max_segments=20000, line=None,
+                   angle=None, **options):
+    """Solve a design on rope segments refined where the line bends or the
+    current shear is large, and coarse elsewhere.
+
+    The ropes start in segments of COARSE_LENGTH. The segments whose
+    shape_error() exceeds accuracy are cut in two, and the line is solved
+    again from the previous angles, until every segment is accurate or
+    MIN_SEGMENT_LENGTH long. The profiles of a batch share their segments,
+    cut where any of them needs it.
+
+    Args:
+        design (MooringDesign): the design
+        current (CurrentProfile, optional): the current, none if omitted.
+        accuracy (float, optional): target shape error, in m. Defaults to ACCURACY.
+        max_segments (int, optional): refinement stops beyond this number
+        of segments. Defaults to 20000.
+        line (Line, optional): the initial segments, ie of a previous
+        solution. Defaults to the COARSE_LENGTH segments of the design.
+        angle (np.ndarray, optional): initial segment angles in rad, a
+        warm start. Defaults to a vertical line.
+        options: solve() keyword arguments
+
+    Returns:
+        Equilibrium: the solved line
+    """
+    if accuracy <= 0:
+        raise SolverError("The accuracy must be positive")
+    if line is None:
+        line = Line.from_design(design, COARSE_LENGTH)
+    equilibrium = solve(line, design.bottom_depth, current, angle=angle, **options)
+    refinements = 0
+    while current is not None:
+        # the profiles of a batch share their segments
+        error = shape_error(equilibrium, current).reshape(-1, len(line)).max(axis=0)
+        refine = (error > accuracy) & (line.length >= 2 * MIN_SEGMENT_LENGTH)
+        if not refine.any() or len(line) + refine.sum() > max_segments:
+            break
+        angle = np.repeat(np.radians(equilibrium['angle']), np.where(refine, 2, 1), axis=-1)
+        line = line.split(refine)
+        equilibrium = solve(line, design.bottom_depth, current, angle=angle, **options)
+        refinements += 1
+    logging.getLogger(NAME).debug(
+        f"Adaptive line: {len(line)} segments after {refinements} refinements")
+    return equilibrium
+
+
+class IncrementalSolver:
+    """This class solves the successive versions of an edited design,
+    each from the previous solution.
+
+    The elements of a new version are compared with the previous one, the
+    unchanged elements above and below the edit keep their refined
+    segments and their cumulative buoyancy, only the edited elements are
+    cut again, and the iteration starts from the previous angles.
+    """
+
+    def __init__(self, accuracy=ACCURACY, **options):
+        """IncrementalSolver constructor
+
+        Args:
+            accuracy (float, optional): target shape error, in m, see
+            solve_adaptive(). Defaults to ACCURACY.
+            options: solve_adaptive() keyword arguments
+        """
+        self.__logger = logging.getLogger(NAME)
+        self.accuracy = accuracy
+        self.options = options
+        self.reset()
+
+    def reset(self):
+        """Forget the previous solution"""
+        self._names = None
+        self._properties = None
+        self._bottom_depth = None
+        self._current = None
+        self._equilibrium = None
+        # rows of the elements solved again by the last solve()
+        self.changed = None
+
+    @staticmethod
+    def __rows(chain):
+        """Return the names and the properties of the elements of a chain"""
+        return (np.asarray(chain.names, dtype=object),
+                np.column_stack([chain[key].astype(np.float64) for key in ELEMENT_PROPERTIES]))
+
+    @staticmethod
+    def __same_current(current, other):
+        """Return True if both current profiles are equal"""
+        if current is None or other is None:
+            return current is other
+        return (current is other or np.array_equal(current.depths, other.depths) and
+                np.array_equal(current.speeds, other.speeds))
+
+    def __changed(self, names, properties):
+        """Return the (top, bottom) number of unchanged elements"""
+        old_names, old_properties = self._names, self._properties
+        count = min(len(names), len(old_names))
+
+        def unchanged(old_rows, rows):
+            equal = (old_rows[0][:count] == rows[0][:count]) & np.all(
+                old_rows[1][:count] == rows[1][:count], axis=1)
+            return count if equal.all() else int(np.argmin(equal))
+
+        top = unchanged((old_names, old_properties), (names, properties))
+        bottom = unchanged((old_names[::-1], old_properties[::-1]), (names[::-1], properties[::-1]))
+        return top, min(bottom, count - top)
+
+    def __splice(self, chain, top, bottom):
+        """Return the line and the warm start angles of a new version,
+        the segments of its top and bottom unchanged elements are reused
+        """
+        previous = self._equilibrium.line
+        angle = np.radians(self._equilibrium['angle'])
+        old_count, count = len(self._names), len(chain)
+        first = np.searchsorted(previous.element, top)
+        last = np.searchsorted(previous.element, old_count - bottom)
+        head = previous.take(slice(0, first))
+        tail = previous.take(slice(last, None))
+        tail.element = tail.element + (count - old_count)
+        middle = Line.from_chain(chain, COARSE_LENGTH)
+        middle = middle.take((middle.element >= top) & (middle.element < count - bottom))
+        line = Line.concatenate((head, middle, tail))
+        # the buoyancy above the top elements is unchanged, below the edit
+        # it moves by the buoyancy change of the edited elements
+        cumulative = previous.cumulative_buoyancy
+        above = cumulative[first - 1] if first else 0.0
+        edited = np.cumsum(middle.buoyancy) + above
+        below = edited[-1] if len(edited) else above
+        line._cumulative_buoyancy = np.concatenate((
+            cumulative[:first], edited,
+            cumulative[last:] - (cumulative[last - 1] if last else 0.0) + below))
+        # the edited elements start at the angle of their neighbour
+        if first:
+            neighbour = angle[..., first - 1:first]
+        elif last < len(previous):
+            neighbour = angle[..., last:last + 1]
+        else:
+            neighbour = np.zeros(angle.shape[:-1] + (1,))
+        angle = np.concatenate((angle[..., :first],
+                                np.repeat(neighbour, len(middle), axis=-1),
+                                angle[..., last:]), axis=-1)
+        return line, angle
+
+    def solve(self, design, current=None):
+        """Solve a version of the design
+
+        Args:
+            design (MooringDesign): the design
+            current (CurrentProfile, optional): overrides the design current.
+            Defaults to None.
+
+        Returns:
+            Equilibrium: the solved line
+        """
+        if current is None:
+            current = design.current
+        chain = ComponentChain.from_design(design)
+        names, properties = self.__rows(chain)
+        line = angle = None
+        if self._equilibrium is not None and len(chain):
+            top, bottom = self.__changed(names, properties)
+            same = (self._bottom_depth == design.bottom_depth and
+                    self.__same_current(current, self._current))
+            if same and top == len(names) == len(self._names):
+                self.changed = (top, top)
+                return self._equilibrium
+            # a batch of another size can not start from the previous angles
+            if (np.shape(self._equilibrium['angle'])[:-1] ==
+                    (current.shape if current is not None else ())):
+                line, angle = self.__splice(chain, top, bottom)
+                self.changed = (top, len(names) - bottom)
+        if line is None:
+            self.changed = (0, len(names))
+        equilibrium = solve_adaptive(design, current, self.accuracy, line=line, angle=angle,
+                                     **self.options)
+        self.__logger.debug(f"Elements {self.changed[0]} to {self.changed[1]} solved again "
+                            f"in {equilibrium.iterations} iterations")
+        self._names, self._properties = names, properties
+        self._bottom_depth, self._current = design.bottom_depth, current
+        self._equilibrium = equilibrium
+        return equilibrium
@@ -0,0 +1,229 @@
+"""Parameter sweep of a mooring design over a process pool, never imports PySide6.
+
+A sweep file is a toml design with a [sweep] table giving the values of
+each swept parameter, every combination of them is simulated:
+
+    [mooring]
+    bottom_depth = 4000.0
+    [[element]]
+    component = "Benthos_1"
+    [[element]]
+    component = "Nylon 18mm"
+    length = 3900.0
+    ...
+
+    [sweep]
+    bottom_depth = [3900.0, 4000.0, 4100.0]  # m, as in the [config] table
+    "element.1.count" = [2, 4, 6]  # Benthos spheres
+    "element.2.component" = ["Nylon 18mm", "Dyneema 6mm"]
+
+A parameter is a dotted path in the design, element positions start at 1
+from the top of the line as in the design error messages.
+"""
+
+import os
+import csv
+import copy
+import logging
+import itertools
+import toml
+
+from library_cache import LibraryCache
+from library_model import ComponentLibrary
+from mooring_design import MooringDesign, DesignError
+from simulation import simulate
+from solver import ACCURACY, SolverError
+from version import NAME
+
+# per design columns of the sweep csv file, after the swept parameters
+SWEEP_COLUMNS = ('ok', 'converged', 'depth_top', 'knock_down', 'holding',
+                 'min_safety_factor', 'max_tension', 'error')
+
+# shortcuts of the swept parameters
+PARAMETER_ALIASES = {'bottom_depth': 'mooring.bottom_depth'}
+
+# library attached to the shared memory block in each worker process
+_worker = {}
+
+
+def set_parameter(design, parameter, value):
+    """Set a parameter of a design dictionary in place
+
+    Args:
+        design (dict): the design, as read from a toml design file
+        parameter (str): dotted path, ie 'element.2.length'
+        value: the parameter value
+    """
+    keys = PARAMETER_ALIASES.get(parameter, parameter).split('.')
+    node = design
+    try:
+        for key in keys[:-1]:
+            if isinstance(node, list):
+                position = int(key)
+                if position < 1:
+                    raise IndexError(f"element positions start at 1, not {position}")
+                node = node[position - 1]
+            else:
+                node = node.setdefault(key, {})
+    except (ValueError, IndexError, AttributeError) as ex:
+        raise DesignError(f"[sweep] invalid parameter {parameter}: {ex}") from ex
+    if not isinstance(node, dict) or not keys[-1]:
+        raise DesignError(f"[sweep] invalid parameter {parameter}")
+    node[keys[-1]] = value
+
+
+def expand_grid(design):
+    """Expand the [sweep] table of a design into the swept designs
+
+    Args:
+        design (dict): the design with its [sweep] table
+
+    Returns:
+        tuple: (parameters, designs), the swept parameter names and the
+        list of (values, design dictionary) for every combination
+    """
+    sweep = design.get('sweep', {})
+    base = {key: value for key, value in design.items() if key != 'sweep'}
+    parameters = list(sweep)
+    values = [value if isinstance(value, list) else [value] for value in sweep.values()]
+    designs = []
+    for combination in itertools.product(*values):
+        swept = copy.deepcopy(base)
+        for parameter, value in zip(parameters, combination):
+            set_parameter(swept, parameter, value)
+        designs.append((combination, swept))
+    return parameters, designs
+
+
+def _init_worker(layout):
+    """Process pool initializer, attach the shared library once"""
+    _worker['library'], _worker['shm'] = ComponentLibrary.attach(layout)
+
+
+def simulate_chunk(chunk, accuracy=ACCURACY, library=None):
+    """Simulate a chunk of swept designs
+
+    Args:
+        chunk (list): (index, design dictionary) of the swept designs
+        accuracy (float, optional): target shape error of the rope
+        segments, in m. Defaults to ACCURACY.
+        library (ComponentLibrary, optional): the component library.
+        Defaults to the shared library of the worker process.
+
+    Returns:
+        list: (index, row) where row maps SWEEP_COLUMNS to the results
+    """
+    library = library if library is not None else _worker['library']
+    rows = []
+    for index, design in chunk:
+        try:
+            result = simulate(MooringDesign.from_dict(design, library), accuracy=accuracy)
+        except (DesignError, SolverError) as ex:
+            rows.append((index, {'ok': False, 'error': str(ex)}))
+            continue
+        except Exception as ex:
+            # any other error of a swept value fails its design, not the sweep
+            rows.append((index, {'ok': False, 'error': f"{type(ex).__name__}: {ex}"}))
+            continue
+        rows.append((index, {
+            'ok': result.ok,
+            'converged': result.converged,
+            'depth_top': float(result['depth_top'][0]),
+            'knock_down': float(result['knock_down'].max()),
+            'holding': result.holding,
+            'min_safety_factor': result.min_safety_factor,
+            'max_tension': float(result['tension_top'].max()),
+            'error': '',
+        }))
+    return rows
+
+
+def run_sweep(library_file, sweep_file, output=None, workers=None, chunk_size=None,
+              cache=None, accuracy=ACCURACY):
+    """Simulate every design of a sweep file and stream the results to a
+    csv file as the chunks complete
+
+    The numeric columns of the library are copied once into a shared
+    memory block mapped by the workers, a task only pickles its chunk of
+    design dictionaries.
+
+    Args:
+        library_file (str): the Excel library file
+        sweep_file (str): the toml sweep file
+        output (str, optional): the csv file or its directory. Defaults to
+        <sweep>_sweep.csv next to the sweep file.
+        workers (int, optional): worker processes, 1 runs in this process.
+        Defaults to the number of CPUs.
+        chunk_size (int, optional): designs per task. Defaults to about
+        four tasks per worker.
+        cache (LibraryCache, optional): on-disk cache of converted
+        libraries. Defaults to the user cache.
+        accuracy (float, optional): target shape error of the rope
+        segments, in m. Defaults to ACCURACY.
+
+    Returns:
+        int: the process exit status, 0 if every design passed its checks,
+        1 if one failed, 2 if the sweep could not be run
+    """
+    logger = logging.getLogger(NAME)
+    try:
+        library = ComponentLibrary.from_file(
+            library_file, cache=cache if cache is not None else LibraryCache())
+        parameters, designs = expand_grid(toml.load(sweep_file))
+    except DesignError as ex:
+        logger.error(str(ex))
+        return 2
+    except Exception as ex:
+        logger.error(f"Unable to load sweep {sweep_file} with library {library_file}: {ex}")
+        return 2
+    # excel2json logs an unreadable workbook and returns no sheet
+    if not len(library):
+        logger.error(f"Unable to load library {library_file}: no component")
+        return 2
+    stem = os.path.splitext(os.path.basename(sweep_file))[0] + '_sweep.csv'
+    if output is None:
+        output = os.path.join(os.path.dirname(sweep_file), stem)
+    elif os.path.isdir(output) or output.endswith(os.sep):
+        os.makedirs(output, exist_ok=True)
+        output = os.path.join(output, stem)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(designs)))
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(designs) // (4 * workers)))
+    tasks = [[(index, design) for index, (_, design) in
+              enumerate(designs[start:start + chunk_size], start=start)]
+             for start in range(0, len(designs), chunk_size)]
+
+    failed = 0
+    with open(output, 'w', newline='', encoding='utf-8') as fid:
+        writer = csv.writer(fid)
+        writer.writerow(('index',) + tuple(parameters) + SWEEP_COLUMNS)
+
+        def write(rows):
+            nonlocal failed
+            for index, row in rows:
+                failed += not row['ok']
+                writer.writerow((index,) + tuple(designs[index][0]) + tuple(
+                    f"{value:.6g}" if isinstance(value, float) else value
+                    for value in (row.get(column, '') for column in SWEEP_COLUMNS)))
+            fid.flush()
+
+        if workers == 1:
+            for task in tasks:
+                write(simulate_chunk(task, accuracy, library))
+        else:
+            # only imported by a parallel sweep, as in excel2json
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+            shm, layout = library.share()
+            try:
+                with ProcessPoolExecutor(
+                        max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                        initializer=_init_worker, initargs=(layout,)) as executor:
+                    futures = [executor.submit(simulate_chunk, task, accuracy) for task in tasks]
+                    for future in as_completed(futures):
+                        write(future.result())
+            finally:
+                shm.close()
+                shm.unlink()
+    logger.info(f"{len(designs)} designs swept, {failed} failed -> {output}")
+    return 1 if failed else 0
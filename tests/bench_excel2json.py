@@ -0,0 +1,88 @@
+"""Benchmark of the excel2json worksheet conversion.
+
+Compare the legacy per-cell conversion, which creates a Cell object for
+each value, with the bulk column conversion used by excel2json, on a
+synthetic library sheet.
+
+> python tests/bench_excel2json.py
+> python tests/bench_excel2json.py --rows 100000 --repeat 5
+"""
+
+import sys
+import argparse
+import timeit
+from os import path
+from collections import OrderedDict
+
+from xlrd import XL_CELL_TEXT, XL_CELL_NUMBER
+from xlrd.book import Book
+from xlrd.sheet import Sheet
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+from excel2json import worksheet2dict  # noqa: E402
+
+HEADER = ['attribute', 'category', 'name', 'mass', 'length', 'projected_area',
+          'nl_drag_cf', 'tl_drag_cf', 'breaking_strength', 'image_file']
+
+
+def synthetic_sheet(nrows):
+    """Build an in memory xlrd worksheet shaped like the Instruments sheet.
+
+    Args:
+        nrows (int): number of data rows, header excluded
+
+    Returns:
+        Sheet: an instance of the ~xlrd.sheet.Sheet class
+    """
+    book = Book()
+    book.formatting_info = 0
+    book.ragged_rows = False
+    book.logfile = sys.stdout
+    book.verbosity = 0
+    book._sheet_visibility = [0]
+    sheet = Sheet(book, 0, 'Synthetic', 0)
+    values = [HEADER]
+    types = [[XL_CELL_TEXT] * len(HEADER)]
+    for row in range(1, nrows + 1):
+        values.append([float(row), 'LPO', f"Instrument {row}", -3.0 - row % 7,
+                       0.6, 0.03, 1.3, 0.9, 18000.0, '\\Pictures\\Instruments\\microcat.bmp'])
+        types.append([XL_CELL_NUMBER, XL_CELL_TEXT, XL_CELL_TEXT] +
+                     [XL_CELL_NUMBER] * 6 + [XL_CELL_TEXT])
+    sheet._cell_values = values
+    sheet._cell_types = types
+    sheet.nrows = nrows + 1
+    sheet.ncols = len(HEADER)
+    return sheet
+
+
+def per_cell_worksheet2dict(worksheet):
+    """Legacy conversion, one worksheet.cell() call per value."""
+    ws_dict = OrderedDict({})
+    header = [cell.value for cell in worksheet.row(0)]
+    for row in range(1, worksheet.nrows):
+        row_dict = {value: worksheet.cell(
+            row, col).value for col, value in enumerate(header)}
+        ws_dict[str(row)] = row_dict
+    return ws_dict
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='excel2json conversion benchmark')
+    parser.add_argument('--rows', type=int, default=50000,
+                        help='number of rows of the synthetic sheet, default is 50000')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of timing repetitions, default is 3')
+    args = parser.parse_args()
+
+    worksheet = synthetic_sheet(args.rows)
+    assert per_cell_worksheet2dict(worksheet) == worksheet2dict(worksheet)
+
+    print(f"Synthetic sheet: {args.rows} rows x {len(HEADER)} columns")
+    timings = {}
+    for label, func in (('per cell', per_cell_worksheet2dict),
+                        ('bulk columns', worksheet2dict)):
+        timings[label] = min(timeit.repeat(
+            lambda func=func: func(worksheet), number=1, repeat=args.repeat))
+        print(f"{label:>14}: {timings[label] * 1000:8.1f} ms")
+    print(f"{'speedup':>14}: {timings['per cell'] / timings['bulk columns']:8.2f} x")
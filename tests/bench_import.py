@@ -0,0 +1,87 @@
+"""Benchmark of the start up import cost.
+
+Run each entry point in a fresh interpreter with -X importtime, report
+the cumulative import time and the heaviest modules, and fail when a
+headless entry point imports PySide6 or a generated resource module.
+
+> python tests/bench_import.py
+> python tests/bench_import.py --top 10 --repeat 5
+"""
+
+import os
+import re
+import subprocess
+import sys
+import argparse
+from os import path
+
+ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+
+# entry point -> (python arguments, headless)
+ENTRY_POINTS = {
+    'excel2json': (['-c', 'import excel2json'], True),
+    'batch': (['-c', 'import batch'], True),
+    'sweep': (['-c', 'import sweep'], True),
+    '--help': (['mooring_simulator.py', '--help'], True),
+    'main window': (['-c', 'import main_app_window'], False),
+}
+
+# modules a headless entry point must not import
+FORBIDDEN = ('PySide6', 'shiboken6', 'qrc_resources', 'resources_rc')
+
+# import time: self [us] | cumulative | imported package
+IMPORTTIME = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def import_times(arguments):
+    """Run python -X importtime and parse its report.
+
+    Args:
+        arguments (list): python command line arguments
+
+    Returns:
+        list: (module, cumulative us, nesting level) in import order
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    process = subprocess.run([sys.executable, '-X', 'importtime'] + arguments,
+                             cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    times = []
+    for line in process.stderr.splitlines():
+        match = IMPORTTIME.match(line)
+        if match:
+            times.append((match[4], int(match[2]), (len(match[3]) - 1) // 2))
+    return times
+
+
+def main():
+    """Benchmark the entry points, return the number of headless failures"""
+    parser = argparse.ArgumentParser(description='Start up import time benchmark')
+    parser.add_argument('--top', type=int, default=5,
+                        help='number of heaviest modules shown')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='runs per entry point, the fastest is kept')
+    args = parser.parse_args()
+
+    failures = 0
+    for entry, (arguments, headless) in ENTRY_POINTS.items():
+        runs = [import_times(arguments) for _ in range(args.repeat)]
+        times = min(runs, key=lambda run: sum(us for _, us, level in run if level == 0))
+        top_level = [(module, us) for module, us, level in times if level == 0]
+        total = sum(us for _, us in top_level)
+        imported = {module.split('.')[0] for module, _, _ in times}
+        forbidden = sorted(imported.intersection(FORBIDDEN))
+        status = 'FAILED' if headless and forbidden else 'ok'
+        failures += status == 'FAILED'
+        print(f"{entry:12s} {total / 1000:8.1f} ms  {len(times):4d} modules  "
+              f"{'headless' if headless else 'gui':8s} {status}"
+              f"{'  imports ' + ', '.join(forbidden) if forbidden else ''}")
+        # the entry module itself is not interesting, its imports are
+        heaviest = [(module, us) for module, us, level in times
+                    if level <= 1 and module != entry]
+        for module, us in sorted(heaviest, key=lambda item: -item[1])[:args.top]:
+            print(f"    {module:30s} {us / 1000:8.1f} ms")
+    return failures
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Collection of tests around the binary mooring design file."""
+
+import os
+import json
+import tempfile
+import unittest
+import numpy as np
+
+from design_file import (DesignFile, DesignFileError, open_design, save_design,
+                         read_design_file, HEADER, MAGIC, ALIGNMENT, FORMAT_VERSION)
+from library_model import ComponentLibrary
+from mooring_design import load_design, MooringDesign, DesignError
+from mooring_line import ComponentChain
+from simulation import simulate
+
+
+class testDesignFile(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.library = ComponentLibrary.from_file("library/Library.xls")
+        cls.design = load_design("designs/example.toml", cls.library)
+        cls.result = simulate(cls.design)
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def assertSameResult(self, design):
+        result = simulate(design)
+        self.assertEqual(result['name'], self.result['name'])
+        for column in ('depth_top', 'x_top', 'tension_top', 'tension_bottom', 'buoyancy'):
+            np.testing.assert_allclose(result[column], self.result[column])
+
+    def test_round_trip(self):
+        """ Test every format simulates as the toml design, with or without library """
+        for name in ('example.mdf', 'example.json', 'example.toml'):
+            save_design(self.path(name), self.design)
+            for library in (None, self.library) if not name.endswith('.toml') else (self.library,):
+                design = open_design(self.path(name), library)
+                self.assertEqual(design.filename, self.path(name))
+                self.assertEqual(design.elements[-1].overrides, {'mass': -600.0})
+                self.assertSameResult(design)
+        with self.assertRaises(DesignError):
+            open_design(self.path('example.toml'))
+
+    def test_layout(self):
+        """ Test the arrays are aligned and memory mapped """
+        results = np.arange(24, dtype=np.float32).reshape(4, 6)
+        save_design(self.path('sweep.mdf'), self.design, arrays={'results': results})
+        design_file = read_design_file(self.path('sweep.mdf'))
+        self.assertEqual(design_file.version, FORMAT_VERSION)
+        np.testing.assert_array_equal(design_file.arrays['results'], results)
+        self.assertFalse(design_file.arrays['results'].flags.writeable)
+        for array in design_file.arrays.values():
+            self.assertEqual(array.ctypes.data % ALIGNMENT, 0)
+        np.testing.assert_allclose(design_file.chain['buoyancy'],
+                                   [element.buoyancy for element in self.design])
+        # the JSON export holds the same arrays, in strict JSON
+        design_file.export_json(self.path('sweep.json'))
+        with open(self.path('sweep.json'), encoding='utf-8') as fid:
+            content = json.load(fid, parse_constant=self.fail)
+        exported = DesignFile.from_dict(content)
+        np.testing.assert_array_equal(exported.arrays['results'], results)
+        self.assertEqual(exported.arrays['results'].dtype, np.float32)
+        np.testing.assert_array_equal(exported.arrays['breaking_strength'],
+                                      design_file.arrays['breaking_strength'])
+        with self.assertRaises(DesignFileError):
+            DesignFile.from_design(self.design, arrays={'length': results})
+
+    def test_upgrade(self):
+        """ Test a 1.0 file, with the area of one unit of an element, is
+        read as the current version """
+        elements = [{'component': 'Benthos_1', 'count': 4}] + self.design.to_dict()['element'][1:]
+        design = MooringDesign.from_dict(dict(self.design.to_dict(), element=elements),
+                                         self.library)
+        content = DesignFile.from_design(design).to_dict()
+        area = content['arrays']['area']['data']
+        self.assertAlmostEqual(area[0], 4 * self.library.component('Benthos_1')['projected_area'])
+        area[0] /= 4
+        content['version'] = [1, 0]
+        design_file = DesignFile.from_dict(content)
+        self.assertEqual(design_file.version, FORMAT_VERSION)
+        self.assertAlmostEqual(design_file.arrays['area'][0], 4 * area[0])
+        np.testing.assert_allclose(design_file.chain['area'],
+                                   ComponentChain.from_design(design)['area'])
+
+    def test_invalid(self):
+        """ Test invalid and newer files are rejected """
+        with open(self.path('bad.mdf'), 'wb') as fid:
+            fid.write(b'not a design file at all')
+        with self.assertRaises(DesignFileError):
+            open_design(self.path('bad.mdf'))
+        save_design(self.path('new.mdf'), self.design)
+        with open(self.path('new.mdf'), 'r+b') as fid:
+            _, major, minor, size = HEADER.unpack(fid.read(HEADER.size))
+            fid.seek(0)
+            fid.write(HEADER.pack(MAGIC, major + 1, minor, size))
+        with self.assertRaises(DesignFileError):
+            open_design(self.path('new.mdf'))
+        with self.assertRaises(DesignFileError):
+            open_design(self.path('missing.mdf'))
+
+    def test_invalid_export(self):
+        """ Test JSON exports of other content are rejected """
+        content = DesignFile.from_design(self.design).to_dict()
+        without_sheet = json.loads(json.dumps(content))
+        del without_sheet['elements'][0]['sheet']
+        codes = json.loads(json.dumps(content))
+        codes['arrays']['component']['data'][0] = len(content['components'])
+        for invalid in ([1, 2], dict(content, mooring={'name': 'test'}),
+                        {key: value for key, value in content.items() if key != 'elements'},
+                        without_sheet, codes):
+            with open(self.path('invalid.json'), 'w', encoding='utf-8') as fid:
+                json.dump(invalid, fid)
+            for library in (None, self.library):
+                with self.assertRaises(DesignFileError):
+                    open_design(self.path('invalid.json'), library)
+
+
+if __name__ == '__main__':
+    unittest.main()
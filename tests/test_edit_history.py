@@ -0,0 +1,133 @@
+"""Collection of tests around the undo history of the mooring editor."""
+
+import copy
+import random
+import unittest
+import tracemalloc
+
+from edit_history import EditHistory, Command
+from element_list import ElementList
+from library_model import ComponentLibrary
+from mooring_design import MooringDesign
+
+
+def deep_water_line(count=300):
+    """The [[element]] array of a long line: instruments on rope sections"""
+    elements = [{'component': 'FSAB 1200'}]
+    for index in range(count - 2):
+        if index % 2:
+            elements.append({'component': 'Nylon 18mm', 'length': 40.0})
+        else:
+            elements.append({'component': 'Microcat'})
+    elements.append({'component': '1 Rain train', 'mass': -900.0})
+    return elements
+
+
+class testEditHistory(unittest.TestCase):
+
+    def test_undo_redo(self):
+        """ Test every edit is undone and redone """
+        elements = ElementList([{'component': 'float'}, {'component': 'anchor'}])
+        history = EditHistory(elements)
+        top, anchor = elements.ids()
+        rope = history.insert({'component': 'rope', 'length': 10.0}, top)
+        history.update(rope, length=20.0, count=2)
+        history.update(rope, length=20.0)
+        history.move(anchor, top)
+        history.move(anchor, top)
+        history.move(top, anchor)
+        with history.group('paste'):
+            history.append({'component': 'release'})
+            history.append({'component': 'chain'})
+        history.delete(anchor)
+        final = copy.deepcopy(elements.to_list())
+        self.assertEqual(len(history), 6)
+        self.assertEqual([item['component'] for item in final],
+                         ['float', 'rope', 'release', 'chain'])
+        self.assertEqual(final[1], {'component': 'rope', 'length': 20.0, 'count': 2})
+
+        labels = []
+        while history.can_undo:
+            labels.append(history.undo())
+        self.assertEqual(labels, ['delete', 'paste', 'move', 'move', 'update', 'insert'])
+        self.assertEqual(elements.to_list(), [{'component': 'float'}, {'component': 'anchor'}])
+        self.assertIsNone(history.undo())
+        while history.can_redo:
+            history.redo()
+        self.assertEqual(elements.to_list(), final)
+        # a new edit drops the redo commands
+        history.undo()
+        history.update(rope, length=30.0)
+        self.assertFalse(history.can_redo)
+        self.assertIn(anchor, elements)
+
+    def test_command(self):
+        """ Test that a command must implement apply and revert """
+        class Partial(Command):
+            __slots__ = ()
+
+            def apply(self, elements):
+                pass
+
+        with self.assertRaises(TypeError):
+            Partial()
+        with self.assertRaises(TypeError):
+            Command()
+
+    def test_budget(self):
+        """ Test the history counts each command at its recorded size, as
+        updates grow the elements shared with its insertions """
+        elements = ElementList([{'component': 'float'}])
+        history = EditHistory(elements)
+        ids = [history.append({'component': 'Microcat'}) for _ in range(200)]
+        for element_id in ids:
+            history.update(element_id, **{f"key{key}": key for key in range(10)})
+        recorded = history.nbytes
+        self.assertEqual(recorded, sum(command.size for command in history._undo))
+        self.assertGreater(recorded, 0)
+        history.budget = 0
+        history.update(ids[0], key0=-1)
+        # only the last command is kept, the total never goes negative
+        self.assertEqual(len(history), 1)
+        self.assertEqual(history.nbytes, history._undo[0].size)
+
+    def test_long_session(self):
+        """ Test a long session on a 300 elements line stays in its budget """
+        library = ComponentLibrary.from_file("library/Library.xls")
+        elements = ElementList(deep_water_line())
+        original = copy.deepcopy(elements.to_list())
+        budget = 2 * 1024 * 1024
+        random.seed(1)
+        tracemalloc.start()
+        history = EditHistory(elements, budget=budget)
+        for _ in range(20000):
+            ids = list(elements.ids())
+            edit = random.random()
+            if edit < 0.5:
+                history.update(random.choice(ids[1:-1]), length=random.uniform(10, 50))
+            elif edit < 0.7:
+                history.move(random.choice(ids[1:-1]), random.choice(ids[:-2]))
+            elif edit < 0.85:
+                history.insert({'component': 'Shackle 5/8'}, random.choice(ids[:-1]))
+            elif len(ids) > 10:
+                history.delete(random.choice(ids[1:-1]))
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        self.assertLessEqual(history.nbytes, budget)
+        self.assertLess(used, 3 * budget)
+        self.assertLess(len(history), 20000)
+        final = copy.deepcopy(elements.to_list())
+        # the whole kept history is undone and redone
+        while history.can_undo:
+            history.undo()
+        while history.can_redo:
+            history.redo()
+        self.assertEqual(elements.to_list(), final)
+        design = MooringDesign.from_dict(
+            {'mooring': {'bottom_depth': 5000.0}, 'element': final}, library)
+        self.assertEqual(len(design), len(final))
+        self.assertNotEqual(final, original)
+
+
+if __name__ == '__main__':
+    unittest.main()
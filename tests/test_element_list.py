@@ -0,0 +1,79 @@
+"""Collection of tests around the linked list of the mooring editor."""
+
+import os
+import sys
+import time
+import unittest
+import tracemalloc
+import numpy as np
+
+from element_list import ElementList, ElementNode
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                'tools'))
+from dll import Node, Sentinel_DLL  # noqa: E402
+
+
+class testElementList(unittest.TestCase):
+
+    def test_operations(self):
+        """ Test the Sentinel_DLL operations on handles """
+        elements = ElementList(["Maine", "Idaho", "Utah"])
+        reference = Sentinel_DLL()
+        for state in ("Maine", "Idaho", "Utah"):
+            reference.append(state)
+        self.assertEqual(str(elements), str(reference))
+        idaho = elements.find("Idaho")
+        ohio = elements.insert_after(idaho, "Ohio")
+        self.assertEqual(elements.delete(idaho), "Idaho")
+        self.assertNotIn(idaho, elements)
+        elements.insert_after(ohio, "Paris")
+        nantes = elements.prepend("Nantes")
+        elements.insert_before(ohio, "Brest")
+        self.assertEqual(elements.to_list(), ['Nantes', 'Maine', 'Brest', 'Ohio', 'Paris', 'Utah'])
+        self.assertEqual(list(reversed(elements))[0], 'Utah')
+        self.assertEqual(elements.first(), nantes)
+        self.assertEqual(elements[ohio], "Ohio")
+        # drag and drop
+        elements.move_after(nantes, elements.last())
+        elements.move_after(ohio)
+        self.assertEqual(elements.to_list(), ['Ohio', 'Maine', 'Brest', 'Paris', 'Utah', 'Nantes'])
+        self.assertEqual(len(elements), len(list(elements.ids())))
+        with self.assertRaises(KeyError):
+            elements.delete(idaho)
+        self.assertIsNone(ElementList().first())
+
+    def test_large_line(self):
+        """ Test the nodes of a 10,000 elements line are light and format quickly """
+        count = 10000
+        footprint = []
+        for node in (ElementNode, lambda index, data: Node(data)):
+            tracemalloc.start()
+            nodes = [node(index, None) for index in range(count)]
+            footprint.append(tracemalloc.get_traced_memory()[0])
+            tracemalloc.stop()
+            del nodes
+        self.assertFalse(hasattr(ElementNode(0, None), '__dict__'))
+        self.assertLess(footprint[0], footprint[1])
+
+        elements = ElementList(range(count))
+        start = time.perf_counter()
+        text = str(elements)
+        self.assertLess(time.perf_counter() - start, 0.1)
+        self.assertEqual(text, str(list(range(count))))
+
+    def test_to_chain(self):
+        """ Test the solver chain is built from the list """
+        elements = ElementList([{'component': 'float', 'buoyancy': 300.0},
+                                {'component': 'rope', 'length': 100.0, 'linear': True},
+                                {'component': 'anchor', 'buoyancy': -600.0}])
+        chain = elements.to_chain()
+        self.assertEqual(chain.names, ['float', 'rope', 'anchor'])
+        np.testing.assert_allclose(chain['buoyancy'], [300.0, 0.0, -600.0])
+        elements.append({'component': 'release', 'weight': 1.0})
+        with self.assertRaises(KeyError):
+            elements.to_chain()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,9 +4,12 @@ import unittest
 import shutil
 import tempfile
 from os import path
+from unittest import mock
+
+import xlrd
 
 from logger import configure_logger
-from excel2json import excel2json
+from excel2json import excel2json, diff_library
 from version import NAME
 
 class testExcel2json(unittest.TestCase):
@@ -74,6 +77,66 @@ class testExcel2json(unittest.TestCase):
         self.assertEqual(fd.read(), self.dump)
         fd.close()
 
+    def test_open_workbook_once(self):
+        """ Test the Workbook is parsed only once per load """
+        with mock.patch('excel2json.open_workbook',
+                        wraps=xlrd.open_workbook) as opener:
+            self.form = excel2json("library/example.xls")
+        opener.assert_called_once()
+        self.assertEqual(len(self.form.worksheets), 6)
+
+    def test_progress(self):
+        """ Test the progress callback is called once per worksheet """
+        calls = []
+        self.form = excel2json("library/example.xls",
+                               progress=lambda sheet, rows, worksheets:
+                               calls.append((sheet, len(rows), len(worksheets))))
+        self.assertEqual([sheet for sheet, _, _ in calls], self.form.worksheets)
+        self.assertEqual(calls[0], ('Terminals', 7, 6))
+
+    def test_parallel_workers(self):
+        """ Test the process pool conversion gives the same library """
+        sequential = excel2json("library/Library.xls")
+        calls = []
+        parallel = excel2json("library/Library.xls", workers=3,
+                              progress=lambda sheet, rows, worksheets: calls.append(sheet))
+        self.assertEqual(parallel.worksheets, sequential.worksheets)
+        self.assertEqual(list(parallel.hash), sequential.worksheets)
+        self.assertEqual(parallel.hash, sequential.hash)
+        self.assertEqual(sorted(calls), sorted(sequential.worksheets))
+
+    def test_to_dict_view(self):
+        """ Test toDict() returns a read-only view sharing the data """
+        self.form = excel2json("tests/test.xls")
+        h = self.form.toDict()
+        self.assertEqual(h['Sheet']['1'], self.hash['1'])
+        with self.assertRaises(TypeError):
+            h['Sheet']['1']['Column1'] = 'changed'
+        self.form.hash['Sheet']['1']['Column1'] = 'changed'
+        self.assertEqual(h['Sheet']['1']['Column1'], 'changed')
+
+    def test_to_dict_copy(self):
+        """ Test toDict(copy=True) returns an independent copy """
+        self.form = excel2json("tests/test.xls")
+        h = self.form.toDict(copy=True)
+        self.assertEqual(h, self.form.hash)
+        h['Sheet']['1']['Column1'] = 'changed'
+        self.assertEqual(self.form['Sheet']['1']['Column1'], 'row1')
+
+    def test_diff_library(self):
+        """ Test the sheet and row differences between two loads """
+        old = excel2json("library/example.xls").toDict(copy=True)
+        new = excel2json("library/example.xls").toDict(copy=True)
+        self.assertEqual(diff_library(old, new), {})
+        new['Ropes']['3']['mass'] = -0.2
+        del new['Anchors']
+        new['Floats']['9'] = dict(new['Floats']['8'])
+        diffs = diff_library(old, new)
+        self.assertEqual(list(diffs), ['Anchors', 'Floats', 'Ropes'])
+        self.assertEqual(diffs['Ropes'].changed, ['3'])
+        self.assertEqual(diffs['Floats'].added, ['9'])
+        self.assertEqual(diffs['Anchors'].removed, ['1', '2'])
+
     # add write test.json, remove file, add and delete values
 
 
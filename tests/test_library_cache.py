@@ -0,0 +1,79 @@
+"""Collection of tests around the library cache."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import xlrd
+
+from excel2json import excel2json
+from library_cache import LibraryCache
+
+
+class testLibraryCache(unittest.TestCase):
+
+    def setUp(self):
+        # Create a temporary directory for the cache and a library copy
+        self.test_dir = tempfile.mkdtemp()
+        self.cache = LibraryCache(os.path.join(self.test_dir, 'cache'))
+        self.library = os.path.join(self.test_dir, 'example.xls')
+        shutil.copy('library/example.xls', self.library)
+
+    def tearDown(self):
+        # Remove the directory after the test
+        shutil.rmtree(self.test_dir)
+
+    def test_miss_then_hit(self):
+        """ Test the second load is served from the cache """
+        first = excel2json(self.library, cache=self.cache)
+        self.assertEqual(self.cache.stats.misses, 1)
+        self.assertGreater(self.cache.stats.bytes_written, 0)
+        with mock.patch('excel2json.open_workbook',
+                        wraps=xlrd.open_workbook) as opener:
+            second = excel2json(self.library, cache=self.cache)
+        opener.assert_not_called()
+        self.assertEqual(self.cache.stats.hits, 1)
+        self.assertGreater(self.cache.stats.bytes_read, 0)
+        self.assertEqual(first.worksheets, second.worksheets)
+        self.assertEqual(first.hash, second.hash)
+
+    def test_stale_entry(self):
+        """ Test a modified library invalidates the cache entry """
+        excel2json(self.library, cache=self.cache)
+        with open(self.library, 'ab') as fid:
+            fid.write(b'\0')
+        self.assertIsNone(self.cache.load(self.library))
+        self.assertEqual(self.cache.stats.misses, 2)
+
+    def test_changed_during_conversion(self):
+        """ Test the file is hashed once, before the conversion, so a file
+        changed meanwhile is not cached as converted """
+        def open_then_change(*args, **kwargs):
+            workbook = xlrd.open_workbook(*args, **kwargs)
+            with open(self.library, 'ab') as fid:
+                fid.write(b'\0')
+            return workbook
+
+        with mock.patch('excel2json.open_workbook', side_effect=open_then_change), \
+                mock.patch.object(LibraryCache, 'fingerprint',
+                                  wraps=LibraryCache.fingerprint) as fingerprint:
+            excel2json(self.library, cache=self.cache)
+        fingerprint.assert_called_once()
+        self.assertIsNone(self.cache.load(self.library))
+
+    def test_missing_file(self):
+        """ Test a missing library is a miss, not an error """
+        self.assertIsNone(self.cache.load(os.path.join(self.test_dir, 'none.xls')))
+        self.assertEqual(self.cache.stats.misses, 1)
+
+    def test_clear(self):
+        """ Test clear() removes all entries """
+        excel2json(self.library, cache=self.cache)
+        self.cache.clear()
+        self.assertEqual(os.listdir(self.cache.cache_dir), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""Collection of tests around the library index."""
+
+import unittest
+
+from excel2json import excel2json
+from library_index import LibraryIndex
+from library_model import parse_worksheet, NAME_ATTRIBUTE
+
+
+class testLibraryIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.library = excel2json("library/Library.xls").toDict(copy=True)
+        self.index = LibraryIndex(self.library)
+
+    def test_lookup(self):
+        """ Test exact name lookup """
+        entry = self.index['Nylon 18mm']
+        self.assertEqual(entry.sheet, 'Ropes')
+        self.assertEqual(entry.attributes['mass'], -0.0189)
+        self.assertIsNone(self.index.get('dummy'))
+        self.assertEqual(len(self.index), 39)
+
+    def test_category(self):
+        """ Test lookup by category and worksheet """
+        self.assertEqual(self.index.categories, ['LPO'])
+        self.assertEqual(len(self.index.by_category('LPO')), 39)
+        self.assertEqual(self.index.by_sheet('Releases'), ['2 Releases', '1 Release'])
+
+    def test_prefix(self):
+        """ Test case insensitive prefix search """
+        self.assertEqual(self.index.prefix('chain 1'), ['Chain 10mm', 'Chain 13mm', 'Chain 18mm'])
+        self.assertEqual(self.index.prefix('Shackle', limit=2), ['Shackle 1/2', 'Shackle 5/8'])
+        self.assertEqual(self.index.prefix('zzz'), [])
+
+    def test_search(self):
+        """ Test substring and fuzzy search """
+        self.assertIn('Benthos 3+chaine 3m', self.index.search('3+chaine'))
+        self.assertIn('Microcat', self.index.search('microcta'))
+
+    def test_range(self):
+        """ Test numeric range search """
+        self.assertIn('Nylon 18mm', self.index.range('mass', high=0))
+        self.assertNotIn('Nylon 18mm', self.index.range('mass', low=0))
+        self.assertEqual(self.index.range('mass', -0.0189, -0.0189), {'Nylon 18mm'})
+        self.assertEqual(self.index.range('mass', -0.0189, -0.0189, include_low=False), set())
+        self.assertEqual(self.index.range('buoyancy'), self.index.range('mass'))
+        self.assertEqual(self.index.range('dummy'), set())
+
+    def test_query(self):
+        """ Test the search box queries """
+        self.assertEqual(len(self.index.query('')), 39)
+        self.assertEqual(self.index.query('nylon mass < 0 kg'), ['Nylon 18mm'])
+        self.assertEqual(self.index.query('chain 13'), ['Chain 13mm'])
+        self.assertEqual(self.index.query('lpo buoyancy>20'), self.index.query('mass > 20'))
+        self.assertEqual(self.index.query('mass >= 1e9'), [])
+
+    def test_incremental_update(self):
+        """ Test only the changed worksheet is reindexed """
+        self.library['Ropes']['4']['Name'] = 'Nylon 20mm'
+        del self.library['Anchors']
+        changed = self.index.update(self.library)
+        self.assertEqual(changed, {'Ropes', 'Anchors'})
+        self.assertNotIn('Nylon 18mm', self.index)
+        self.assertEqual(self.index['Nylon 20mm'].row, '4')
+        self.assertNotIn('1 Rain train', self.index)
+        self.assertEqual(self.index.prefix('nylon'), ['Nylon 20mm'])
+        self.assertEqual(self.index.query('nylon mass < 0'), ['Nylon 20mm'])
+        self.assertEqual(self.index.update(self.library), set())
+
+    def test_duplicates(self):
+        """ Test a component hidden by a duplicate is indexed once the
+        duplicate is removed, and an unparsed worksheet drops its rows """
+        sheets = list(self.library)
+        rope = self.index['Nylon 18mm']
+        other = next(sheet for sheet in sheets if sheet != rope.sheet and
+                     self.index.by_sheet(sheet))
+        row = next(iter(self.library[other]))
+        attributes, _, data = parse_worksheet(self.library[other])
+        key = next(key for key, attribute in attributes.items() if attribute == NAME_ATTRIBUTE)
+        self.library[other]['9999'] = dict(data[0][1], **{key: 'Nylon 18mm'})
+        self.index = LibraryIndex(self.library)
+        first = self.index['Nylon 18mm'].sheet
+        second = other if first == rope.sheet else rope.sheet
+        del self.library[first]
+        self.assertIn(first, self.index.update(self.library))
+        self.assertEqual(self.index['Nylon 18mm'].sheet, second)
+        self.assertEqual(self.index.prefix('nylon 18'), ['Nylon 18mm'])
+        self.library[second] = {row: {'dummy': 'no attribute row'}}
+        self.assertEqual(self.index.update(self.library), {second})
+        self.assertNotIn('Nylon 18mm', self.index)
+        self.assertEqual(self.index.by_sheet(second), [])
+        self.assertEqual(self.index.prefix('nylon 18'), [])
+
+    def test_duplicate_order(self):
+        """ Test the first row of a duplicated name stays indexed when it is
+        edited, whatever the order of the updates """
+        rope = self.index['Nylon 18mm']
+        sheets = list(self.library)
+        other = next(sheet for sheet in sheets[sheets.index(rope.sheet) + 1:]
+                     if self.index.by_sheet(sheet))
+        attributes, _, data = parse_worksheet(self.library[other])
+        keys = {attribute: key for key, attribute in attributes.items()}
+        self.library[other]['9999'] = dict(data[0][1], **{keys[NAME_ATTRIBUTE]: 'Nylon 18mm'})
+        self.index.update(self.library)
+        self.assertEqual(self.index.locations('Nylon 18mm'),
+                         [(rope.sheet, rope.row), (other, '9999')])
+        # editing the indexed row does not promote its duplicate
+        attributes, _, _ = parse_worksheet(self.library[rope.sheet])
+        mass = next(key for key, attribute in attributes.items() if attribute == 'mass')
+        self.library[rope.sheet][rope.row][mass] = -1.5
+        self.assertEqual(self.index.update(self.library), {rope.sheet})
+        self.assertEqual(self.index['Nylon 18mm'].sheet, rope.sheet)
+        self.assertEqual(self.index.query('nylon 18 mass < -1'), ['Nylon 18mm'])
+        # a duplicate added before the indexed row hides it
+        self.library[other]['9999'][keys[NAME_ATTRIBUTE]] = 'Other rope'
+        self.index.update(self.library)
+        library = {other: self.library[other], rope.sheet: self.library[rope.sheet]}
+        self.library[other]['9999'][keys[NAME_ATTRIBUTE]] = 'Nylon 18mm'
+        self.index.update(library)
+        self.assertEqual(self.index.locations('Nylon 18mm'),
+                         [(other, '9999'), (rope.sheet, rope.row)])
+        self.assertEqual(self.index.locations('Nylon 18mm'),
+                         LibraryIndex(library).locations('Nylon 18mm'))
+
+
+if __name__ == '__main__':
+    unittest.main()
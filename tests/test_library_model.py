@@ -0,0 +1,78 @@
+"""Collection of tests around the typed component library model."""
+
+import unittest
+import numpy as np
+
+from excel2json import excel2json
+from library_model import ComponentLibrary, SHEETS
+
+
+class testLibraryModel(unittest.TestCase):
+
+    def setUp(self):
+        self.example = ComponentLibrary.from_file("library/example.xls")
+        self.library = ComponentLibrary.from_file("library/Library.xls")
+
+    def test_sheets(self):
+        """ Test all the component worksheets are converted """
+        for lib in (self.example, self.library):
+            self.assertEqual(sorted(lib.worksheets), sorted(SHEETS))
+
+    def test_header_layouts(self):
+        """ Test both attribute-first and title-first workbooks give the same columns """
+        for sheet in SHEETS:
+            self.assertEqual(
+                set(self.example[sheet].attributes) - {'poly_1', 'poly_2'},
+                set(self.library[sheet].attributes) - {'poly_1', 'poly_2'})
+        self.assertEqual(self.example['Floats'].descriptions['mass'], 'Buoyancy (kg)')
+        self.assertEqual(self.library['Floats'].descriptions['mass'], 'Buoyancy (kg)')
+
+    def test_numeric_columns(self):
+        """ Test numeric attributes are float64 arrays """
+        floats = self.example['Floats']
+        self.assertEqual(floats['mass'].dtype, np.float64)
+        self.assertEqual(len(floats['mass']), len(floats))
+        # text cell '0.225' is converted
+        self.assertAlmostEqual(floats.get('Benthos_1', 'projected_area'), 0.225)
+        np.testing.assert_array_equal(floats['buoyancy'], floats['mass'])
+
+    def test_categories(self):
+        """ Test text attributes are interned categories """
+        category = self.example['Instruments']['category']
+        self.assertEqual(category.categories, ('LPO',))
+        self.assertEqual(category.tolist(), ['LPO'] * len(self.example['Instruments']))
+
+    def test_lookup(self):
+        """ Test components lookup by name """
+        self.assertIn('Nylon 18mm', self.example)
+        self.assertEqual(self.example.sheet_of('FSAB 1200'), 'Floats')
+        component = self.example.component('Microcat')
+        self.assertEqual(component['sheet'], 'Instruments')
+        self.assertEqual(component['mass'], -3.0)
+        self.assertEqual(self.example.get('Chain 13mm', 'mass'), -2.54)
+        table, row = self.example.find('Shackle 5/8')
+        self.assertEqual(table['breaking_strength'][row], 18000.0)
+        with self.assertRaises(KeyError):
+            self.example.component('dummy')
+
+    def test_missing_attribute(self):
+        """ Test anchors have no mass column """
+        self.assertNotIn('mass', self.example['Anchors'].attributes)
+
+    def test_update(self):
+        """ Test only the changed worksheets are rebuilt """
+        library = excel2json("library/example.xls").toDict(copy=True)
+        ropes = self.example['Ropes']
+        floats = self.example['Floats']
+        library['Ropes']['4']['name'] = 'Nylon 20mm'
+        del library['Anchors']
+        self.example.update(library, ['Ropes', 'Anchors'])
+        self.assertIs(self.example['Floats'], floats)
+        self.assertIsNot(self.example['Ropes'], ropes)
+        self.assertIn('Nylon 20mm', self.example)
+        self.assertNotIn('Nylon 18mm', self.example)
+        self.assertNotIn('Anchors', self.example.worksheets)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""Collection of tests around the library table model."""
+
+import sys
+import unittest
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from excel2json import excel2json
+from library_table_model import LibraryTableModel
+from constants import SPREADSHEET_THEME
+from theme import apply_theme, spreadsheet_stylesheet
+
+# All tests use the same single global instance of QApplication.
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+class testLibraryTableModel(unittest.TestCase):
+
+    def setUp(self):
+        self.library = excel2json("library/example.xls")
+        self.model = LibraryTableModel(self.library.toDict()['Floats'])
+
+    def test_shape(self):
+        """ Test rows and columns count """
+        self.assertEqual(self.model.rowCount(), 8)
+        self.assertEqual(self.model.columnCount(), 10)
+        self.assertEqual(self.model.headerData(2, Qt.Horizontal), 'name')
+        self.assertEqual(self.model.headerData(0, Qt.Vertical), '1')
+
+    def test_display(self):
+        """ Test cell values """
+        self.assertEqual(self.model.data(self.model.index(1, 2)), 'WH75- FLA2')
+        self.assertEqual(self.model.data(self.model.index(1, 3)), '340.0')
+        self.assertEqual(self.model.row_values(1)['name'], 'WH75- FLA2')
+
+    def test_colors(self):
+        """ Test the spreadsheet colour scheme role data """
+        def color(row, col, role=Qt.ForegroundRole):
+            return self.model.data(self.model.index(row, col), role).color().name()
+        self.assertEqual(color(0, 3), '#008000')
+        self.assertEqual(color(2, 0), '#ff0000')
+        self.assertEqual(color(2, 3), '#000000')
+        self.assertEqual(color(2, 3, Qt.BackgroundRole), '#ffffff')
+
+    def test_set_rows(self):
+        """ Test replacing the rows resets the model """
+        self.model.set_rows(self.library.toDict()['Anchors'])
+        self.assertEqual(self.model.rowCount(), 2)
+        self.model.set_rows(None)
+        self.assertEqual(self.model.rowCount(), 0)
+        self.assertEqual(self.model.columnCount(), 0)
+
+    def test_theme(self):
+        """ Test that a theme restyles every model and the stylesheet """
+        try:
+            apply_theme(app, {'text': 'blue'})
+            cell = self.model.data(self.model.index(2, 3), Qt.ForegroundRole)
+            self.assertEqual(cell.color().name(), '#0000ff')
+            self.assertIn('QTableView#spreadsheetTable', app.styleSheet())
+            self.assertIn('color : blue', app.styleSheet())
+        finally:
+            apply_theme(app)
+        self.assertEqual(app.styleSheet(), spreadsheet_stylesheet(SPREADSHEET_THEME))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,218 @@
+"""Collection of tests around the library widget lazy tabs."""
+
+import sys
+import time
+import unittest
+from unittest import mock
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from excel2json import excel2json
+from library_widget import LibraryWidget
+
+# All tests use the same single global instance of QApplication.
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def process_events(count=10):
+    """Let Qt deliver the queued activations and builds"""
+    for _ in range(count):
+        app.processEvents()
+
+
+def wait_until(condition, timeout=30):
+    """Process the Qt events until condition() is true"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timeout waiting for the library")
+        app.processEvents()
+        time.sleep(0.001)
+
+
+class testLibraryWidget(unittest.TestCase):
+
+    def setUp(self):
+        self.widget = LibraryWidget("library/example.xls")
+        self.widget.show()
+        process_events()
+
+    def tearDown(self):
+        self.widget.close()
+        self.widget.deleteLater()
+        process_events()
+
+    def test_first_sheet_only(self):
+        """ Test that only the active worksheet table is built """
+        first = self.widget.library.worksheets[0]
+        self.assertEqual(list(self.widget.models), [first])
+        self.assertEqual(len(self.widget.subwindows), len(self.widget.library.worksheets))
+
+    def test_build_on_activation(self):
+        """ Test that a worksheet table is built when its tab is activated """
+        worksheet = self.widget.library.worksheets[-1]
+        self.widget.library_area.setActiveSubWindow(self.widget.subwindows[worksheet])
+        process_events()
+        self.assertIn(worksheet, self.widget.models)
+
+    def test_release_hidden(self):
+        """ Test that hidden worksheet tables are released and built again """
+        first, last = self.widget.library.worksheets[0], self.widget.library.worksheets[-1]
+        self.widget.library_area.setActiveSubWindow(self.widget.subwindows[last])
+        process_events()
+        self.widget.release_after = 0.001
+        time.sleep(0.01)
+        self.assertEqual(self.widget.release_hidden_sheets(), [first])
+        process_events()
+        self.assertEqual(list(self.widget.models), [last])
+        self.widget.library_area.setActiveSubWindow(self.widget.subwindows[first])
+        process_events()
+        self.assertIn(first, self.widget.models)
+
+    def test_search(self):
+        """ Test that the search box filters the built tables """
+        first = self.widget.library.worksheets[0]
+        proxy = self.widget.filters[first]
+        rows = proxy.rowCount()
+        self.widget.search.setText('mass > 100000')
+        self.assertEqual(proxy.rowCount(), 1)
+        self.assertEqual(self.widget.models[first].rowCount(), rows)
+        self.widget.search.setText('')
+        self.assertEqual(proxy.rowCount(), rows)
+
+    def test_search_unbuilt_sheet(self):
+        """ Test that a table built after a search is filtered """
+        names = self.widget.filter('WH75')
+        self.assertEqual(names, ['WH75- FLA2'])
+        worksheet = self.widget.index['WH75- FLA2'].sheet
+        self.widget.library_area.setActiveSubWindow(self.widget.subwindows[worksheet])
+        process_events()
+        self.assertEqual(self.widget.filters[worksheet].rowCount(), 2)
+        self.assertEqual(self.widget.subwindows[worksheet].windowTitle(), f"{worksheet} (1)")
+
+    def test_refresh(self):
+        """ Test that a refresh rebuilds only the changed worksheets """
+        for worksheet in ('Floats', 'Anchors'):
+            self.widget.library_area.setActiveSubWindow(self.widget.subwindows[worksheet])
+            process_events()
+        terminals, floats = self.widget.models['Terminals'], self.widget.models['Floats']
+        windows = dict(self.widget.subwindows)
+        # a float is heavier, the anchors are removed and a new sheet is added
+        library = excel2json("library/example.xls")
+        data = library.toDict(copy=True)
+        data['Floats']['2']['mass'] = 350.0
+        del data['Anchors']
+        data['Spares'] = {'1': data['Releases']['1'],
+                          '2': dict(data['Releases']['2'], name='Spare release')}
+        library._hash, library._worksheets = data, list(data)
+        with mock.patch.object(self.widget, 'read', return_value=library), \
+                mock.patch.object(self.widget, 'display_sheet') as display_sheet:
+            diffs = self.widget.refresh()
+            process_events()
+        self.assertEqual(set(diffs), {'Floats', 'Anchors', 'Spares'})
+        display_sheet.assert_not_called()
+        # the changed table is updated in place, the unchanged one is kept
+        self.assertIs(self.widget.models['Floats'], floats)
+        self.assertIs(self.widget.models['Terminals'], terminals)
+        row = floats.row_values(1)
+        self.assertEqual((row['name'], row['mass']), ('WH75- FLA2', 350.0))
+        self.assertNotIn('Anchors', self.widget.models)
+        self.assertNotIn(windows['Anchors'], self.widget.library_area.subWindowList())
+        for worksheet in ('Terminals', 'Floats', 'Ropes', 'Instruments', 'Releases'):
+            self.assertIs(self.widget.subwindows[worksheet], windows[worksheet])
+        # the new worksheet tab is built when it is activated
+        self.assertNotIn('Spares', self.widget.models)
+        self.widget.library_area.setActiveSubWindow(self.widget.subwindows['Spares'])
+        process_events()
+        self.assertEqual(self.widget.models['Spares'].rowCount(), 2)
+        self.assertEqual(self.widget.index['Spare release'].sheet, 'Spares')
+        self.assertEqual(self.widget.components.get('WH75- FLA2', 'mass'), 350.0)
+
+    def test_search_duplicates(self):
+        """ Test that a search shows the duplicates of a component found """
+        library = excel2json("library/example.xls")
+        data = library.toDict(copy=True)
+        data['Releases']['9'] = dict(data['Releases']['2'], name='WH75- FLA2')
+        library._hash = data
+        with mock.patch.object(self.widget, 'read', return_value=library):
+            self.widget.refresh()
+        self.assertEqual(self.widget.index['WH75- FLA2'].sheet, 'Floats')
+        self.assertEqual(self.widget.filter('WH75'), ['WH75- FLA2'])
+        self.assertEqual(self.widget.subwindows['Floats'].windowTitle(), "Floats (1)")
+        self.assertEqual(self.widget.subwindows['Releases'].windowTitle(), "Releases (1)")
+        self.widget.library_area.setActiveSubWindow(self.widget.subwindows['Releases'])
+        process_events()
+        proxy = self.widget.filters['Releases']
+        # the header row and the duplicate
+        self.assertEqual(proxy.rowCount(), 2)
+        self.assertEqual(proxy.headerData(1, Qt.Vertical), '9')
+
+
+class testBackgroundLoad(unittest.TestCase):
+
+    def setUp(self):
+        self.widget = LibraryWidget("library/example.xls", background=True)
+        self.progress = []
+        self.done = []
+        # number of tabs when each worksheet is received
+        self.tabs = []
+        self.widget.progress.connect(self.on_progress)
+        self.widget.loaded.connect(lambda: self.done.append('loaded'))
+        self.widget.failed.connect(self.done.append)
+        self.widget.show()
+
+    def tearDown(self):
+        wait_until(lambda: not self.widget.is_loading())
+        self.widget.close()
+        self.widget.deleteLater()
+        process_events()
+
+    def on_progress(self, loaded, total):
+        self.progress.append((loaded, total))
+        self.tabs.append(len(self.widget.subwindows))
+
+    def test_loaded(self):
+        """ Test the progress of a background load and its placeholder tabs """
+        wait_until(lambda: self.done)
+        process_events()
+        self.assertEqual(self.done, ['loaded'])
+        self.assertTrue(self.widget.is_loaded())
+        self.assertFalse(self.widget.is_loading())
+        worksheets = self.widget.library.worksheets
+        total = len(worksheets)
+        self.assertEqual(self.progress, [(n, total) for n in range(1, total + 1)])
+        # every tab is added with the first worksheet received
+        self.assertEqual(self.tabs, [total] * total)
+        self.assertEqual(list(self.widget.subwindows), worksheets)
+        # only the active worksheet table is built, the others are placeholders
+        self.assertEqual(list(self.widget.models), [worksheets[0]])
+        for worksheet in worksheets[1:]:
+            label = self.widget.subwindows[worksheet].widget().layout().itemAt(0).widget()
+            self.assertEqual(label.text(), worksheet)
+
+    def test_error_reload(self):
+        """ Test that a failed background load can be started again """
+        wait_until(lambda: self.done)
+        process_events()
+        with mock.patch('library_loader.excel2json', side_effect=OSError('unreadable')):
+            self.widget.load()
+            wait_until(lambda: len(self.done) == 2)
+        process_events()
+        self.assertEqual(self.done[-1], 'unreadable')
+        self.assertFalse(self.widget.is_loading())
+        self.assertEqual(self.widget.subwindows, {})
+        self.assertEqual(self.widget.models, {})
+        self.assertFalse(self.widget.is_loaded())
+        self.widget.load()
+        wait_until(lambda: len(self.done) == 3)
+        process_events()
+        self.assertEqual(self.done[-1], 'loaded')
+        self.assertTrue(self.widget.is_loaded())
+        self.assertEqual(list(self.widget.subwindows), self.widget.library.worksheets)
+        # the error tab is removed with the placeholders
+        self.assertEqual(len(self.widget.library_area.subWindowList()),
+                         len(self.widget.library.worksheets))
+
+
+if __name__ == '__main__':
+    unittest.main()
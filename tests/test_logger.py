@@ -0,0 +1,52 @@
+"""Collection of tests around the hot path instrumentation."""
+
+import logging
+import unittest
+
+from excel2json import excel2json
+from logger import enable_trace, disable_trace, get_trace, NULL_TRACE
+from version import NAME
+
+
+class testTrace(unittest.TestCase):
+
+    def tearDown(self):
+        disable_trace()
+
+    def test_disabled(self):
+        """ Test that a disabled subsystem returns the no-op trace """
+        trace = get_trace('excel2json')
+        self.assertIs(trace, NULL_TRACE)
+        self.assertFalse(trace)
+        with trace.span('Floats') as span:
+            span.add('cells', 10)
+
+    def test_unknown_subsystem(self):
+        """ Test that only known subsystems can be enabled """
+        with self.assertRaises(ValueError):
+            enable_trace('unknown')
+
+    def test_span(self):
+        """ Test that a span is logged once with its aggregate counters """
+        enable_trace('excel2json')
+        trace = get_trace('excel2json')
+        self.assertTrue(trace)
+        with self.assertLogs(NAME, level=logging.INFO) as logs:
+            with trace.span('Floats') as span:
+                span.add('cells', 3)
+                span.add('cells', 4)
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('trace excel2json Floats: cells=7', logs.output[0])
+
+    def test_excel2json(self):
+        """ Test one trace per worksheet when converting a library """
+        enable_trace('excel2json')
+        with self.assertLogs(NAME, level=logging.INFO) as logs:
+            library = excel2json("library/example.xls")
+        traces = [line for line in logs.output if 'trace excel2json' in line]
+        self.assertEqual(len(traces), len(library.worksheets))
+        self.assertIn('rows=', traces[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Collection of tests around the array backed component chain."""
+
+import unittest
+import numpy as np
+
+from library_model import ComponentLibrary
+from mooring_design import load_design, MooringDesign
+from mooring_line import ComponentChain
+from solver import Line
+
+
+class testComponentChain(unittest.TestCase):
+
+    def test_linked_operations(self):
+        """ Test the Sentinel_DLL operations on element ids """
+        chain = ComponentChain(capacity=2)
+        maine = chain.append("Maine")
+        idaho = chain.append("Idaho", length=2.0)
+        utah = chain.append("Utah")
+        self.assertEqual(str(chain), "['Maine', 'Idaho', 'Utah']")
+        self.assertEqual(chain.find("Idaho"), idaho)
+        ohio = chain.insert_after(idaho, "Ohio")
+        chain.delete(idaho)
+        self.assertIsNone(chain.find("Idaho"))
+        self.assertNotIn(idaho, chain)
+        chain.insert_after(ohio, "Paris")
+        nantes = chain.prepend("Nantes")
+        brest = chain.insert_before(ohio, "Brest")
+        self.assertEqual(chain.names, ['Nantes', 'Maine', 'Brest', 'Ohio', 'Paris', 'Utah'])
+        self.assertEqual(list(chain), [nantes, maine, brest, ohio, chain.find("Paris"), utah])
+        self.assertEqual([chain.position(item) for item in (nantes, ohio, utah)], [0, 3, 5])
+        chain.delete(utah)
+        self.assertEqual(chain.names[-1], 'Paris')
+        self.assertEqual(len(chain), 5)
+        with self.assertRaises(KeyError):
+            chain.delete(utah)
+        with self.assertRaises(KeyError):
+            chain.append("Lyon", weight=1.0)
+
+    def test_property_arrays(self):
+        """ Test the properties move with their elements """
+        chain = ComponentChain()
+        ids = chain.extend(['float', 'rope', 'anchor'], length=[1.0, 100.0, 0.5],
+                           buoyancy=[300.0, -10.0, -600.0], linear=[False, True, False])
+        shackle = chain.insert_after(ids[0], 'shackle', length=0.1, buoyancy=-1.0)
+        np.testing.assert_allclose(chain['length'], [1.0, 0.1, 100.0, 0.5])
+        np.testing.assert_array_equal(chain['linear'], [False, False, True, False])
+        self.assertEqual(chain.properties(shackle)['buoyancy'], -1.0)
+        self.assertEqual(chain.properties(ids[2]), dict(
+            component='anchor', length=0.5, count=1, buoyancy=-600.0, area=0.0,
+            normal_cf=0.0, tangential_cf=0.0, breaking_strength=np.inf, linear=False))
+        chain.delete(ids[1])
+        np.testing.assert_allclose(chain['buoyancy'], [300.0, -1.0, -600.0])
+        self.assertEqual(chain.component(ids[2]), 'anchor')
+
+    def test_solver_line(self):
+        """ Test the solver segments are cut from the chain arrays """
+        library = ComponentLibrary.from_file("library/Library.xls")
+        design = load_design("designs/example.toml", library)
+        chain = ComponentChain.from_design(design)
+        self.assertEqual(chain.names, [element.name for element in design])
+        np.testing.assert_allclose(chain['buoyancy'], [element.buoyancy for element in design])
+        line = Line.from_chain(chain, 10.0)
+        self.assertAlmostEqual(line.length.sum(), design.length)
+        np.testing.assert_array_equal(np.unique(line.element), np.arange(len(design)))
+
+    def test_count(self):
+        """ Test the drag area of an element scales with its count, as its
+        buoyancy """
+        library = ComponentLibrary.from_file("library/Library.xls")
+        chains = [ComponentChain.from_design(MooringDesign.from_dict({
+            'mooring': {'bottom_depth': 100.0},
+            'element': [{'component': 'Benthos_1', 'count': count},
+                        {'component': 'Nylon 18mm', 'length': 90.0}]}, library))
+            for count in (1, 8)]
+        for key in ('area', 'buoyancy'):
+            self.assertAlmostEqual(chains[1][key][0], 8 * chains[0][key][0])
+            self.assertAlmostEqual(chains[1][key][1], chains[0][key][1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+"""Collection of tests around the mooring design and batch simulation."""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from batch import run_batch
+from library_cache import LibraryCache
+from library_model import ComponentLibrary
+from mooring_design import MooringDesign, load_design, DesignError
+from simulation import simulate, SimulationResult, RESULT_COLUMNS
+
+DESIGN = {
+    'mooring': {'name': 'test', 'bottom_depth': 100.0},
+    'element': [
+        {'component': 'FSAB 1200'},
+        {'component': 'Nylon 18mm', 'length': 90.0},
+        {'component': '1 Release'},
+        {'component': '1 Rain train', 'mass': -600.0},
+    ],
+}
+
+
+class testSimulation(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.library = ComponentLibrary.from_file("library/Library.xls")
+
+    def setUp(self):
+        self.design = MooringDesign.from_dict(DESIGN, self.library)
+
+    def test_design(self):
+        """ Test design elements and overrides """
+        self.assertEqual(len(self.design), 4)
+        self.assertAlmostEqual(self.design.length, 1.25 + 90.0 + 1.2 + 1.0)
+        rope = self.design.elements[1]
+        self.assertTrue(rope.is_linear)
+        self.assertAlmostEqual(rope.buoyancy, -0.0189 * 90.0)
+        self.assertEqual(self.design.elements[-1].buoyancy, -600.0)
+        self.assertEqual(MooringDesign.from_dict(self.design.to_dict(), self.library).length,
+                         self.design.length)
+
+    def test_design_errors(self):
+        """ Test invalid designs """
+        with self.assertRaises(DesignError):
+            MooringDesign.from_dict({'mooring': {}}, self.library)
+        with self.assertRaises(DesignError):
+            MooringDesign.from_dict(
+                {'mooring': {'bottom_depth': 10}, 'element': [{'component': 'dummy'}]},
+                self.library)
+        with self.assertRaises(DesignError):
+            MooringDesign.from_dict(
+                {'mooring': {'bottom_depth': 10}, 'element': [{'component': 'Nylon 18mm'}]},
+                self.library)
+        for element in ({'component': 'Nylon 18mm', 'length': 'long'},
+                        {'component': 'Microcat', 'count': [2]}):
+            with self.assertRaisesRegex(DesignError, 'Element 1'):
+                MooringDesign.from_dict(
+                    {'mooring': {'bottom_depth': 10}, 'element': [element]}, self.library)
+
+    def test_simulate(self):
+        """ Test the vertical static equilibrium """
+        result = simulate(self.design)
+        self.assertAlmostEqual(result['depth_bottom'][-1], 100.0)
+        self.assertAlmostEqual(result['depth_top'][0], 100.0 - self.design.length)
+        self.assertEqual(result['tension_top'][0], 0.0)
+        self.assertAlmostEqual(result['tension_bottom'][0], 486.0)
+        self.assertAlmostEqual(result['tension_bottom'][2], 486.0 - 0.0189 * 90.0 - 25.0)
+        self.assertAlmostEqual(result.holding, 600.0 - result['tension_top'][-1])
+        self.assertAlmostEqual(result['safety_factor'][1], 3700.0 / 486.0)
+        self.assertEqual(result.slack, [])
+        self.assertTrue(result.ok)
+
+    def test_not_converged(self):
+        """ Test a solve that did not converge fails the checks """
+        result = simulate(self.design)
+        self.assertTrue(result.converged)
+        self.assertNotIn('NOT CONVERGED', result.summary())
+        failed = SimulationResult(self.design, {column: result[column]
+                                                for column in RESULT_COLUMNS}, converged=False)
+        self.assertFalse(failed.converged)
+        self.assertFalse(failed.ok)
+        self.assertIn('NOT CONVERGED', failed.summary())
+
+    def test_anchor_lifted(self):
+        """ Test a too light anchor fails the checks """
+        design = MooringDesign.from_dict(
+            dict(DESIGN, element=DESIGN['element'][:-1] + [
+                {'component': '1 Rain train', 'mass': -100.0}]), self.library)
+        result = simulate(design)
+        self.assertLess(result.holding, 0)
+        self.assertFalse(result.ok)
+
+    def test_batch(self):
+        """ Test the batch run writes one csv file per design """
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = LibraryCache(os.path.join(tmp, 'cache'))
+            status = run_batch("library/Library.xls", ["designs/example.toml"],
+                               os.path.join(tmp, 'out'), cache=cache)
+            self.assertEqual(status, 0)
+            with open(os.path.join(tmp, 'out', 'example.csv'), encoding='utf-8') as fid:
+                lines = fid.read().splitlines()
+            self.assertEqual(len(lines), len(load_design("designs/example.toml", self.library)) + 1)
+            self.assertTrue(lines[0].startswith('name,sheet,length'))
+            self.assertTrue(lines[0].endswith(',converged'))
+            self.assertTrue(lines[1].endswith(',True'))
+            self.assertEqual(run_batch("library/Library.xls", ["dummy.toml"], tmp, cache=cache), 1)
+            # an invalid design fails alone, the next one is still simulated
+            invalid = os.path.join(tmp, 'invalid.toml')
+            with open(invalid, 'w', encoding='utf-8') as fid:
+                fid.write('[mooring]\nbottom_depth = 100.0\n'
+                          '[[element]]\ncomponent = "Nylon 18mm"\nlength = "long"\n')
+            self.assertEqual(run_batch("library/Library.xls", [invalid, "designs/example.toml"],
+                                       os.path.join(tmp, 'out2'), cache=cache), 1)
+            self.assertTrue(os.path.exists(os.path.join(tmp, 'out2', 'example.csv')))
+            self.assertEqual(run_batch("dummy.xls", ["designs/example.toml"], tmp, cache=cache), 2)
+            # solver and output errors fail the designs, not the run
+            self.assertEqual(run_batch("library/Library.xls", ["designs/example.toml"], tmp,
+                                       cache=cache, accuracy=0), 1)
+            self.assertEqual(run_batch("library/Library.xls", ["designs/example.toml"],
+                                       os.path.join(tmp, 'out', 'example.csv'), cache=cache), 2)
+            os.makedirs(os.path.join(tmp, 'out3', 'example.csv'))
+            self.assertEqual(run_batch("library/Library.xls", ["designs/example.toml"],
+                                       os.path.join(tmp, 'out3'), cache=cache, workers=2), 1)
+
+    def test_batch_without_qt(self):
+        """ Test the --batch command line never imports PySide6 """
+        with tempfile.TemporaryDirectory() as tmp:
+            code = ("import sys, runpy\n"
+                    "sys.argv = ['mooring_simulator.py', '--batch', '--lib', 'library/Library.xls',"
+                    f" '--file', 'designs/example.toml', '-o', {tmp!r}]\n"
+                    "try:\n"
+                    "    runpy.run_path('mooring_simulator.py', run_name='__main__')\n"
+                    "except SystemExit as ex:\n"
+                    "    print(ex.code, 'PySide6' in sys.modules)\n")
+            output = subprocess.run([sys.executable, '-c', code], capture_output=True,
+                                    text=True, check=True).stdout
+            self.assertEqual(output.splitlines()[-1], '0 False')
+        for option in (['-a', '0'], ['-w', '0']):
+            process = subprocess.run(
+                [sys.executable, 'mooring_simulator.py', '--batch', '--lib', 'library/Library.xls',
+                 '--file', 'designs/example.toml'] + option, capture_output=True, text=True)
+            self.assertEqual(process.returncode, 2)
+            self.assertIn('must be', process.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,251 @@
+"""Collection of tests around the mooring line equilibrium solver."""
+
+import unittest
+import numpy as np
+
+from library_model import ComponentLibrary
+from mooring_design import MooringDesign
+from simulation import simulate
+from solver import (CurrentProfile, Line, IncrementalSolver, solve, solve_adaptive,
+                    shape_error, SolverError, GRAVITY, SEAWATER_DENSITY, COARSE_LENGTH)
+
+
+class testSolver(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.library = ComponentLibrary.from_file("library/Library.xls")
+
+    def design(self, rope_length=90.0, **rope):
+        """A float on a rope held by an anchor"""
+        return MooringDesign.from_dict({
+            'mooring': {'bottom_depth': 100.0},
+            'element': [
+                {'component': 'FSAB 1200'},
+                dict({'component': 'Nylon 18mm', 'length': rope_length}, **rope),
+                {'component': '1 Rain train', 'mass': -600.0},
+            ]}, self.library)
+
+    def test_current_profile(self):
+        """ Test interpolation and validation of a current profile """
+        current = CurrentProfile([0.0, 100.0], [1.0, 0.0])
+        np.testing.assert_allclose(current([-10.0, 50.0, 200.0]), [1.0, 0.5, 0.0])
+        self.assertEqual(CurrentProfile.from_dict(current.to_dict()).to_dict(), current.to_dict())
+        with self.assertRaises(SolverError):
+            CurrentProfile([100.0, 0.0], [1.0, 0.0])
+        with self.assertRaises(SolverError):
+            CurrentProfile([0.0], [1.0, 0.0])
+
+    def test_segments(self):
+        """ Test ropes are cut in segments sharing their properties """
+        line = Line.from_design(self.design(95.0), segment_length=10.0)
+        self.assertEqual(len(line), 1 + 10 + 1)
+        np.testing.assert_allclose(line.length[1:11], 9.5)
+        self.assertAlmostEqual(line.buoyancy[1:11].sum(), -0.0189 * 95.0 * GRAVITY)
+        with self.assertRaises(SolverError):
+            Line.from_design(self.design(), segment_length=0)
+
+    def test_no_current(self):
+        """ Test the line stands vertical without current """
+        equilibrium = solve(Line.from_design(self.design()), 100.0)
+        self.assertTrue(equilibrium.converged)
+        np.testing.assert_allclose(equilibrium['angle'], 0.0)
+        np.testing.assert_allclose(equilibrium['x_top'], 0.0)
+        self.assertAlmostEqual(equilibrium['depth_bottom'][-1], 100.0)
+
+    def test_uniform_current(self):
+        """ Test a float on a weightless rope without drag leans at the
+        angle of its drag and buoyancy """
+        design = self.design(mass=0.0, nl_drag_cf=0.0, tl_drag_cf=0.0)
+        result = simulate(design, CurrentProfile.uniform(1.0))
+        float_ = design.elements[0]
+        drag = 0.5 * SEAWATER_DENSITY * float_.get('nl_drag_cf') * float_.get('projected_area')
+        angle = np.arctan2(drag, float_.buoyancy * GRAVITY)
+        self.assertTrue(result.equilibrium.converged)
+        self.assertAlmostEqual(result['angle'][1], np.degrees(angle), places=6)
+        self.assertAlmostEqual(result['x_top'][1], 90.0 * np.sin(angle), places=6)
+        self.assertAlmostEqual(result['tension_bottom'][1],
+                               np.hypot(drag, float_.buoyancy * GRAVITY) / GRAVITY, places=6)
+
+    def test_knock_down(self):
+        """ Test the knock-down grows with the current """
+        knock_down = [simulate(self.design(), CurrentProfile.uniform(speed))['knock_down'][0]
+                      for speed in (0.0, 0.5, 1.0)]
+        self.assertEqual(knock_down[0], 0.0)
+        self.assertLess(knock_down[0], knock_down[1])
+        self.assertLess(knock_down[1], knock_down[2])
+
+    def test_design_current(self):
+        """ Test the design current is used by default """
+        design = self.design()
+        design.current = CurrentProfile.uniform(1.0)
+        self.assertGreater(simulate(design)['knock_down'][0], 0.0)
+        self.assertEqual(simulate(design, CurrentProfile.uniform(0.0))['knock_down'][0], 0.0)
+
+    def test_strong_current(self):
+        """ Test an oscillating iteration is damped until it converges """
+        design = MooringDesign.from_dict({
+            'mooring': {'bottom_depth': 500.0},
+            'element': [
+                {'component': 'Benthos_1', 'count': 2},
+                {'component': 'Shackle 5/8'},
+                {'component': 'Microcat'},
+                {'component': 'Nylon 18mm', 'length': 450.0},
+                {'component': '1 Release'},
+                {'component': '1 Rain train', 'mass': -600.0},
+            ]}, self.library)
+        current = CurrentProfile([0.0, 100.0, 500.0], [2.0, 1.0, 0.1])
+        line = Line.from_design(design)
+        damped = solve(line, design.bottom_depth, current, relaxation=0.5)
+        self.assertTrue(damped.converged)
+        for max_iterations in (200, 2000):
+            equilibrium = solve(line, design.bottom_depth, current, max_iterations=max_iterations)
+            self.assertTrue(equilibrium.converged)
+            self.assertLess(equilibrium.iterations, 200)
+            np.testing.assert_allclose(equilibrium['depth_top'], damped['depth_top'], atol=1e-3)
+        self.assertGreater(damped['depth_top'][0], 200.0)
+        self.assertTrue(solve_adaptive(design, current).converged)
+        # the convergence of each profile of a batch
+        batch = CurrentProfile(current.depths, [[0.0, 0.0, 0.0], current.speeds])
+        equilibrium = solve(line, design.bottom_depth, batch, max_iterations=3)
+        self.assertFalse(equilibrium.converged)
+        np.testing.assert_equal(equilibrium.profiles_converged, [True, False])
+        result = simulate(design, batch, accuracy=None)
+        self.assertTrue(result.converged)
+
+    def test_split(self):
+        """ Test splitting segments keeps the line totals """
+        line = Line.from_design(self.design())
+        refined = line.split(np.arange(len(line)) % 2 == 1)
+        self.assertEqual(len(refined), len(line) + len(line) // 2)
+        self.assertAlmostEqual(refined.length.sum(), line.length.sum())
+        self.assertAlmostEqual(refined.buoyancy.sum(), line.buoyancy.sum())
+        self.assertAlmostEqual(refined.area.sum(), line.area.sum())
+
+    def test_adaptive(self):
+        """ Test adaptive segments converge to a fine uniform line """
+        design = self.design(rope_length=2000.0)
+        design.bottom_depth = 2100.0
+        current = CurrentProfile([0.0, 100.0, 200.0, 2100.0], [1.0, 0.8, 0.1, 0.0])
+        vertical = solve_adaptive(design)
+        self.assertEqual(len(vertical), 1 + 2000.0 / COARSE_LENGTH + 1)
+        reference = solve(Line.from_design(design, 1.0), design.bottom_depth, current)
+        errors, sizes = [], []
+        for accuracy in (1.0, 0.01):
+            equilibrium = solve_adaptive(design, current, accuracy)
+            errors.append(abs(equilibrium['x_top'][0] - reference['x_top'][0]))
+            sizes.append(len(equilibrium))
+        self.assertLess(errors[1], errors[0])
+        self.assertLess(sizes[0], sizes[1])
+        self.assertLess(sizes[1], len(reference) / 5)
+        with self.assertRaises(SolverError):
+            solve_adaptive(design, current, accuracy=0)
+
+    def test_incremental(self):
+        """ Test an edited design solved from the previous solution matches
+        a full solve and only cuts the edited elements again """
+        elements = [{'component': 'FSAB 1200'}]
+        for _ in range(20):
+            elements += [{'component': 'Microcat'}, {'component': 'Nylon 18mm', 'length': 80.0}]
+        elements.append({'component': '1 Rain train', 'mass': -900.0})
+        current = {'depth': [0.0, 200.0, 1000.0, 2000.0], 'speed': [0.6, 0.4, 0.15, 0.05]}
+
+        def design(elements):
+            return MooringDesign.from_dict({'mooring': {'bottom_depth': 1700.0},
+                                            'element': elements, 'current': current},
+                                           self.library)
+
+        solver = IncrementalSolver(accuracy=0.05)
+        first = solver.solve(design(elements))
+        self.assertEqual(solver.changed, (0, len(elements)))
+        self.assertIs(solver.solve(design(elements)), first)
+        self.assertEqual(solver.changed, (len(elements), len(elements)))
+        edits = [
+            elements[:11] + [{'component': 'Microcat', 'mass': -40.0}] + elements[12:],
+            elements[:11] + [{'component': 'Microcat'}, {'component': 'Microcat'}] + elements[11:],
+            elements[:3] + elements[4:],
+        ]
+        for edited, changed in zip(edits, [(11, 12), (11, 14), (3, 10)]):
+            edited = design(edited)
+            equilibrium = solver.solve(edited)
+            self.assertEqual(solver.changed, changed)
+            np.testing.assert_allclose(equilibrium.line.cumulative_buoyancy,
+                                       np.cumsum(equilibrium.line.buoyancy))
+            reference = solve_adaptive(edited, edited.current, 0.05)
+            first = np.searchsorted(equilibrium.line.element, np.arange(len(edited)))
+            top = np.searchsorted(reference.line.element, np.arange(len(edited)))
+            np.testing.assert_allclose(equilibrium['depth_top'][first],
+                                       reference['depth_top'][top], atol=0.05)
+            np.testing.assert_allclose(equilibrium['x_top'][first],
+                                       reference['x_top'][top], atol=0.05)
+        result = simulate(edited, solver=solver)
+        self.assertEqual(solver.changed, (len(edited), len(edited)))
+        np.testing.assert_allclose(result['depth_top'], equilibrium['depth_top'][first])
+        solver.reset()
+        solver.solve(edited)
+        self.assertEqual(solver.changed, (0, len(edited)))
+
+    def test_adaptive_short_rope(self):
+        """ Test a rope shorter than COARSE_LENGTH is refined in a uniform
+        current, its curvature is within its single first segment """
+        design = self.design(rope_length=240.0)
+        design.bottom_depth = 300.0
+        current = CurrentProfile.uniform(1.0)
+        reference = solve(Line.from_design(design, 0.5), design.bottom_depth, current)
+        errors = []
+        for accuracy in (0.1, 0.001):
+            equilibrium = solve_adaptive(design, current, accuracy)
+            self.assertGreater(np.count_nonzero(equilibrium.line.element == 1), 1)
+            errors.append(abs(equilibrium['depth_top'][0] - reference['depth_top'][0]))
+        self.assertLess(errors[0], 0.1)
+        self.assertLess(errors[1], errors[0] / 10)
+
+    def test_batch(self):
+        """ Test a batch of current profiles matches the profiles solved one by one """
+        depths = [0.0, 50.0, 100.0]
+        speeds = [[0.0, 0.0, 0.0], [1.0, 0.5, 0.1], [0.5, 0.5, 0.5], [1.5, 1.0, 0.2]]
+        batch = CurrentProfile(depths, speeds)
+        self.assertEqual((len(batch), batch.shape), (4, (4,)))
+        np.testing.assert_allclose(batch([25.0, 200.0]), [[0.0, 0.0], [0.75, 0.1],
+                                                          [0.5, 0.5], [1.25, 0.2]])
+        design = self.design()
+        line = Line.from_design(design)
+        equilibrium = solve(line, design.bottom_depth, batch)
+        self.assertEqual(equilibrium['tension_top'].shape, (4, len(line)))
+        for accuracy in (None, 0.05):
+            result = simulate(design, batch, accuracy=accuracy)
+            self.assertEqual(result.batch, 4)
+            self.assertEqual(result['knock_down'].shape, (4, len(design)))
+            for index, speed in enumerate(speeds):
+                single = simulate(design, CurrentProfile(depths, speed), accuracy=accuracy)
+                profile = result.profile(index)
+                self.assertIsNone(profile.batch)
+                self.assertEqual(profile.ok, single.ok)
+                for column in ('depth_top', 'x_top', 'angle', 'tension_top', 'tension_bottom'):
+                    np.testing.assert_allclose(profile[column], single[column], atol=0.05)
+        with self.assertRaises(IndexError):
+            simulate(design).profile(0)
+
+    def test_batch_segments(self):
+        """ Test the profiles of a batch share segments accurate for each
+        of them """
+        depths = [0.0, 50.0, 100.0]
+        speeds = [[1.5, 1.0, 0.2], [0.5, 0.5, 0.5]]
+        design = self.design()
+        batch = solve_adaptive(design, CurrentProfile(depths, speeds), 0.05)
+        self.assertLessEqual(shape_error(batch, CurrentProfile(depths, speeds)).max(), 0.05)
+        for index, speed in enumerate(speeds):
+            current = CurrentProfile(depths, speed)
+            shared = solve(batch.line, design.bottom_depth, current)
+            np.testing.assert_allclose(batch['angle'][index], shared['angle'], atol=1e-3)
+            alone = solve_adaptive(design, current, 0.05)
+            self.assertLessEqual(len(alone.line), len(batch.line))
+            self.assertGreater(np.count_nonzero(alone.line.element == 1), 1)
+            first = np.searchsorted(alone.line.element, np.arange(len(design)))
+            top = np.searchsorted(batch.line.element, np.arange(len(design)))
+            for column in ('depth_top', 'x_top'):
+                np.testing.assert_allclose(batch[column][index][top], alone[column][first],
+                                           atol=0.05)
+
+if __name__ == '__main__':
+    unittest.main()
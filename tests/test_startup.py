@@ -0,0 +1,51 @@
+"""Collection of tests guarding the start up imports."""
+
+import os
+import subprocess
+import sys
+import unittest
+
+# a headless entry point must not import these modules
+FORBIDDEN = ('PySide6', 'qrc_resources', 'resources_rc')
+
+
+def imported_modules(code):
+    """Return the top level modules imported by code in a fresh interpreter"""
+    code += "\nimport sys\nprint(' '.join(sorted({m.split('.')[0] for m in sys.modules})))"
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True,
+                            text=True, check=True).stdout
+    return set(output.splitlines()[-1].split())
+
+
+class testStartup(unittest.TestCase):
+
+    def test_excel2json(self):
+        """ Test excel2json used as a library stays light """
+        modules = imported_modules('import excel2json')
+        self.assertFalse(modules.intersection(FORBIDDEN))
+        self.assertNotIn('concurrent', modules)
+
+    def test_help(self):
+        """ Test the command line help does not start Qt """
+        code = ("import runpy, sys\n"
+                "sys.argv = ['mooring_simulator.py', '--help']\n"
+                "try:\n"
+                "    runpy.run_path('mooring_simulator.py', run_name='__main__')\n"
+                "except SystemExit:\n"
+                "    pass")
+        self.assertFalse(imported_modules(code).intersection(FORBIDDEN))
+
+    def test_resources(self):
+        """ Test the binary resources are registered at run time """
+        env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+        code = ("from PySide6.QtCore import QFile\n"
+                "from app_resources import register_resources\n"
+                "print(QFile.exists(':play.png'), register_resources(), "
+                "QFile.exists(':play.png'), register_resources())")
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True,
+                                text=True, check=True, env=env).stdout
+        self.assertEqual(output.split(), ['False', 'True', 'True', 'True'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""Collection of tests around the parameter sweep of mooring designs."""
+
+import os
+import csv
+import tempfile
+import unittest
+import numpy as np
+import toml
+
+from library_cache import LibraryCache
+from library_model import ComponentLibrary
+from mooring_design import DesignError
+from sweep import expand_grid, set_parameter, simulate_chunk, run_sweep, SWEEP_COLUMNS
+
+
+class testSweep(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.library = ComponentLibrary.from_file("library/Library.xls")
+        cls.sweep = toml.load("designs/sweep.toml")
+
+    def test_expand_grid(self):
+        """ Test every combination of the [sweep] table becomes a design """
+        parameters, designs = expand_grid(self.sweep)
+        self.assertEqual(parameters, ['bottom_depth', 'element.1.count', 'element.4.component'])
+        self.assertEqual(len(designs), 3 * 4 * 2)
+        values, design = designs[-1]
+        self.assertEqual(values, (520.0, 8, 'Dyneema 6mm'))
+        self.assertNotIn('sweep', design)
+        self.assertEqual(design['mooring']['bottom_depth'], 520.0)
+        self.assertEqual(design['element'][0]['count'], 8)
+        self.assertEqual(design['element'][3]['component'], 'Dyneema 6mm')
+        # the base design is left untouched
+        self.assertEqual(self.sweep['element'][0], {'component': 'Benthos_1'})
+        for parameter in ('element.x.count', 'element.99.count', 'element.1', 'element.0.count',
+                          'element.-1.count', 'mooring.bottom_depth.x',
+                          'mooring.bottom_depth.x.y'):
+            with self.assertRaises(DesignError):
+                set_parameter(designs[0][1], parameter, 1)
+        self.assertNotIn('count', designs[0][1]['element'][-1])
+
+    def test_shared_library(self):
+        """ Test a library attached to shared memory matches the original """
+        shm, layout = self.library.share()
+        try:
+            library, block = ComponentLibrary.attach(layout)
+            self.assertEqual(library.worksheets, self.library.worksheets)
+            for sheet in library:
+                for name in library[sheet].names:
+                    np.testing.assert_equal(list(library.component(name).values()),
+                                            list(self.library.component(name).values()))
+            self.assertFalse(library['Floats']['mass'].flags.writeable)
+            del library
+            block.close()
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def test_simulate_chunk(self):
+        """ Test a chunk reports the design errors instead of raising """
+        _, designs = expand_grid(self.sweep)
+        bad = dict(designs[0][1], element=[{'component': 'dummy'}])
+        broken = dict(designs[0][1], element=[1])
+        rows = dict(simulate_chunk([(0, designs[0][1]), (1, bad), (2, broken)],
+                                   library=self.library))
+        self.assertTrue(rows[0]['ok'])
+        self.assertTrue(rows[0]['converged'])
+        self.assertGreater(rows[0]['knock_down'], 0.0)
+        self.assertFalse(rows[1]['ok'])
+        self.assertIn('dummy', rows[1]['error'])
+        self.assertFalse(rows[2]['ok'])
+        self.assertIn('AttributeError', rows[2]['error'])
+
+    def test_run_sweep(self):
+        """ Test a process pool sweep writes the results of the sequential one """
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = LibraryCache(os.path.join(tmp, 'cache'))
+            results = []
+            for workers in (1, 2):
+                output = os.path.join(tmp, f"sweep_{workers}.csv")
+                status = run_sweep("library/Library.xls", "designs/sweep.toml", output,
+                                   workers=workers, chunk_size=5, cache=cache)
+                self.assertEqual(status, 0)
+                with open(output, newline='', encoding='utf-8') as fid:
+                    rows = list(csv.reader(fid))
+                self.assertEqual(rows[0][-len(SWEEP_COLUMNS):], list(SWEEP_COLUMNS))
+                results.append(sorted(rows[1:], key=lambda row: int(row[0])))
+            self.assertEqual(len(results[0]), 24)
+            self.assertEqual(results[0], results[1])
+            self.assertEqual(run_sweep("library/Library.xls", "dummy.toml", tmp, cache=cache), 2)
+            self.assertEqual(run_sweep("dummy.xls", "designs/sweep.toml", tmp, cache=cache), 2)
+            # an invalid swept value fails its designs, the others are written
+            invalid = os.path.join(tmp, 'invalid.toml')
+            with open(invalid, 'w', encoding='utf-8') as fid:
+                toml.dump(dict(self.sweep, sweep={'bottom_depth': [500.0, 510.0],
+                                                  'element.4.length': ['long']}), fid)
+            self.assertEqual(run_sweep("library/Library.xls", invalid, tmp, workers=2,
+                                       chunk_size=1, cache=cache), 1)
+            with open(os.path.join(tmp, 'invalid_sweep.csv'), newline='', encoding='utf-8') as fid:
+                rows = sorted(list(csv.DictReader(fid)), key=lambda row: int(row['index']))
+            self.assertEqual([row['ok'] for row in rows], ['False', 'False'])
+            self.assertIn('length', rows[0]['error'])
+
+
+if __name__ == '__main__':
+    unittest.main()
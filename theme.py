@@ -0,0 +1,38 @@
+"""Application stylesheet of the library spreadsheets."""
+
+from constants import (
+    SPREADSHEET_THEME,
+    STYLE_SPREADSHEET_TEXT,
+    STYLE_SPREADSHEET_TABLE,
+    STYLE_SPREADSHEET_HEADER,
+)
+from library_table_model import LibraryTableModel
+
+
+def spreadsheet_stylesheet(theme=None):
+    """Build the spreadsheet part of the application stylesheet
+
+    Args:
+        theme (dict, optional): colour name of each spreadsheet element,
+        missing ones are taken from SPREADSHEET_THEME. Defaults to None.
+
+    Returns:
+        str: the stylesheet, keyed by object name and dynamic property
+    """
+    colors = dict(SPREADSHEET_THEME, **(theme or {}))
+    return '\n'.join(style.format(**colors) for style in (
+        STYLE_SPREADSHEET_TEXT, STYLE_SPREADSHEET_TABLE, STYLE_SPREADSHEET_HEADER))
+
+
+def apply_theme(app, theme=None):
+    """Style every library spreadsheet of the application in one pass,
+    Qt repolishes and repaints the existing widgets.
+
+    Args:
+        app (QApplication): the application
+        theme (dict, optional): colour name of each spreadsheet element.
+        Defaults to None.
+    """
+    colors = dict(SPREADSHEET_THEME, **(theme or {}))
+    LibraryTableModel.set_colors(colors)
+    app.setStyleSheet(spreadsheet_stylesheet(colors))